@@ -0,0 +1,71 @@
+"""add_fair_share_scheduling
+
+Revision ID: 20260118_0001_add_fair_share_scheduling
+Revises: 169b38ee7c88, 20260117_0001
+Create Date: 2026-01-18
+
+This migration replaces the alphabetical round-robin ordering with weighted
+fair queuing across channels (see app.queue.FAIR_SHARE_QUERY).
+
+Schema Changes:
+    - channels.scheduler_virtual_time: Per-channel virtual clock. Every claim
+      advances the claiming channel by 1 / max_concurrent, so channels with a
+      larger max_concurrent receive a proportionally larger share of claims.
+    - ix_tasks_queued_channel_priority_created: Partial index on
+      (channel_id, priority, created_at) WHERE status = 'queued'. The claim query
+      probes the head of each channel's backlog through this index, which keeps
+      each probe O(log n) regardless of how many historical tasks exist.
+
+Why priority sorts natively:
+    The prioritylevel enum is declared as ('high', 'normal', 'low'), so
+    ORDER BY priority ASC yields high → normal → low without a CASE expression,
+    and the B-tree index can serve the ordering directly.
+
+Migration Heads:
+    20260117_0001 (updated_at trigger) and 169b38ee7c88 (review timestamps)
+    were both heads. This revision merges them so `alembic upgrade head`
+    resolves to a single target again.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0001_add_fair_share_scheduling"
+down_revision: str | Sequence[str] | None = ("169b38ee7c88", "20260117_0001")
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add channel virtual time column and partial index for fair-share claims."""
+    op.add_column(
+        "channels",
+        sa.Column(
+            "scheduler_virtual_time",
+            sa.Float(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+
+    op.create_index(
+        "ix_tasks_queued_channel_priority_created",
+        "tasks",
+        ["channel_id", "priority", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'queued'"),
+        postgresql_concurrently=True,
+    )
+
+
+def downgrade() -> None:
+    """Remove fair-share scheduling index and channel virtual time column."""
+    op.drop_index(
+        "ix_tasks_queued_channel_priority_created",
+        table_name="tasks",
+        postgresql_concurrently=True,
+    )
+    op.drop_column("channels", "scheduler_virtual_time")
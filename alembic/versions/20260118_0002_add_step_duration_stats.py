@@ -0,0 +1,60 @@
+"""add_step_duration_stats
+
+Revision ID: 20260118_0002_add_step_duration_stats
+Revises: 20260118_0001_add_fair_share_scheduling
+Create Date: 2026-01-18
+
+This migration adds the step_duration_stats table used for duration-aware
+scheduling (see app.services.work_estimator and app.queue.FAIR_SHARE_QUERY).
+
+Table Structure:
+    - channel_id (UUID, FK → channels.id, CASCADE)
+    - step (VARCHAR(50)): PipelineStep value
+    - sample_count, p50_seconds, p90_seconds, p50_cost_usd
+    - refreshed_at (TIMESTAMPTZ)
+    - Composite primary key (channel_id, step)
+
+Claim Query Usage:
+    Within a channel's queued backlog, tasks are ordered by the sum of
+    p50_seconds over steps not yet marked completed in step_completion_metadata.
+    The PK lookup on (channel_id, step) keeps that sum to at most six index
+    probes per candidate.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0002_add_step_duration_stats"
+down_revision: str | None = "20260118_0001_add_fair_share_scheduling"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create step_duration_stats table."""
+    op.create_table(
+        "step_duration_stats",
+        sa.Column("channel_id", sa.UUID(), nullable=False),
+        sa.Column("step", sa.String(length=50), nullable=False),
+        sa.Column("sample_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("p50_seconds", sa.Float(), nullable=False),
+        sa.Column("p90_seconds", sa.Float(), nullable=False),
+        sa.Column("p50_cost_usd", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["channel_id"],
+            ["channels.id"],
+            name="fk_step_duration_stats_channel_id",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("channel_id", "step", name="pk_step_duration_stats"),
+        sa.CheckConstraint("sample_count >= 0", name="ck_step_duration_stats_samples"),
+    )
+
+
+def downgrade() -> None:
+    """Drop step_duration_stats table."""
+    op.drop_table("step_duration_stats")
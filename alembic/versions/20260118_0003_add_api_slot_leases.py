@@ -0,0 +1,57 @@
+"""add_api_slot_leases
+
+Revision ID: 20260118_0003_add_api_slot_leases
+Revises: 20260118_0002_add_step_duration_stats
+Create Date: 2026-01-18
+
+This migration adds the api_slot_leases table backing the cluster-wide API
+concurrency coordinator (app.services.api_concurrency), replacing the
+per-worker counters in WorkerState.
+
+Table Structure:
+    - provider (VARCHAR(20)), slot (INTEGER): composite primary key
+    - holder (VARCHAR(100)): unique lease token of the holding worker
+    - task_id (UUID, nullable): task the request belongs to
+    - acquired_at, expires_at (TIMESTAMPTZ)
+
+Acquire Pattern:
+    INSERT INTO api_slot_leases (provider, slot, holder, task_id, acquired_at, expires_at)
+    VALUES ($1, $2, $3, $4, now(), now() + ttl)
+    ON CONFLICT (provider, slot) DO UPDATE SET ...
+    WHERE api_slot_leases.expires_at < now()
+    RETURNING holder;
+
+    The primary key guarantees at most one live holder per slot; expired
+    leases (crashed workers) are taken over in the same statement.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0003_add_api_slot_leases"
+down_revision: str | None = "20260118_0002_add_step_duration_stats"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create api_slot_leases table."""
+    op.create_table(
+        "api_slot_leases",
+        sa.Column("provider", sa.String(length=20), nullable=False),
+        sa.Column("slot", sa.Integer(), nullable=False),
+        sa.Column("holder", sa.String(length=100), nullable=False),
+        sa.Column("task_id", sa.UUID(), nullable=True),
+        sa.Column("acquired_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("provider", "slot", name="pk_api_slot_leases"),
+        sa.CheckConstraint("slot >= 0", name="ck_api_slot_leases_slot_non_negative"),
+    )
+
+
+def downgrade() -> None:
+    """Drop api_slot_leases table."""
+    op.drop_table("api_slot_leases")
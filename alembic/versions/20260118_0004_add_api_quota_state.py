@@ -0,0 +1,64 @@
+"""add_api_quota_state
+
+Revision ID: 20260118_0004_add_api_quota_state
+Revises: 20260118_0003_add_api_slot_leases
+Create Date: 2026-01-18
+
+This migration moves Gemini quota tracking from a worker-local flag to shared
+state, so one worker's 429 stops every worker from calling Gemini.
+
+Changes:
+    - api_quota_state table: one row per (provider, key_id) holding
+      exhausted_until and the observed requests/minute
+    - tasks.not_before: deferred tasks are skipped by the claim query until
+      this time, replacing release-and-reclaim on quota exhaustion
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0004_add_api_quota_state"
+down_revision: str | None = "20260118_0003_add_api_slot_leases"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create api_quota_state table and add tasks.not_before."""
+    op.create_table(
+        "api_quota_state",
+        sa.Column("provider", sa.String(length=20), nullable=False),
+        sa.Column("key_id", sa.String(length=16), nullable=False),
+        sa.Column("exhausted_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("exhausted_reason", sa.String(length=20), nullable=True),
+        sa.Column(
+            "window_started_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column("window_requests", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("requests_per_minute", sa.Float(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("provider", "key_id", name="pk_api_quota_state"),
+        sa.CheckConstraint("window_requests >= 0", name="ck_api_quota_state_window_requests"),
+    )
+
+    op.add_column(
+        "tasks",
+        sa.Column("not_before", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop tasks.not_before and api_quota_state table."""
+    op.drop_column("tasks", "not_before")
+    op.drop_table("api_quota_state")
@@ -0,0 +1,54 @@
+"""add_task_retry_backoff
+
+Revision ID: 20260118_0005_add_task_retry_backoff
+Revises: 20260118_0004_add_api_quota_state
+Create Date: 2026-01-18
+
+This migration completes deferred execution for queued tasks.
+
+Schema Changes:
+    - tasks.retry_count: Consecutive transient-failure retries; the pipeline
+      re-queues transient failures with not_before = now + backoff(retry_count)
+    - ix_tasks_queued_not_before: Partial index on (not_before) WHERE
+      status = 'queued' AND not_before IS NOT NULL. Serves the claim query's
+      not_before filter and the idle-worker lookup of the earliest eligible
+      task (MIN(not_before)) without scanning the queue.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0005_add_task_retry_backoff"
+down_revision: str | None = "20260118_0004_add_api_quota_state"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add retry counter and partial index for deferred queued tasks."""
+    op.add_column(
+        "tasks",
+        sa.Column("retry_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    op.create_index(
+        "ix_tasks_queued_not_before",
+        "tasks",
+        ["not_before"],
+        unique=False,
+        postgresql_where=sa.text("status = 'queued' AND not_before IS NOT NULL"),
+        postgresql_concurrently=True,
+    )
+
+
+def downgrade() -> None:
+    """Remove deferred-task index and retry counter."""
+    op.drop_index(
+        "ix_tasks_queued_not_before",
+        table_name="tasks",
+        postgresql_concurrently=True,
+    )
+    op.drop_column("tasks", "retry_count")
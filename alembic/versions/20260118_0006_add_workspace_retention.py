@@ -0,0 +1,44 @@
+"""add_workspace_retention
+
+Revision ID: 20260118_0006_add_workspace_retention
+Revises: 20260118_0005_add_task_retry_backoff
+Create Date: 2026-01-18
+
+This migration adds workspace retention tracking to tasks.
+
+Schema Changes:
+    - tasks.workspace_bytes: Last measured size of the task's project
+      workspace; per-channel disk usage is SUM(workspace_bytes) GROUP BY
+      channel_id instead of a walk over every project directory
+    - tasks.workspace_retention_status: Status whose retention policy was
+      last applied (NULL = not collected since the last step wrote files)
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0006_add_workspace_retention"
+down_revision: str | None = "20260118_0005_add_task_retry_backoff"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add workspace size and retention tracking columns."""
+    op.add_column(
+        "tasks",
+        sa.Column("workspace_bytes", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "tasks",
+        sa.Column("workspace_retention_status", sa.String(30), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove workspace retention tracking columns."""
+    op.drop_column("tasks", "workspace_retention_status")
+    op.drop_column("tasks", "workspace_bytes")
@@ -0,0 +1,67 @@
+"""add_task_events
+
+Revision ID: 20260118_0007_add_task_events
+Revises: 20260118_0006_add_workspace_retention
+Create Date: 2026-01-18
+
+This migration adds an append-only event log for tasks.
+
+Status updates used to append to tasks.error_log by reading the whole TEXT
+value, concatenating and writing it back; the hot tasks row grew without
+bound and every update rewrote it (TOAST and WAL bloat). Events are now
+inserted into task_events and the error log is aggregated on demand.
+
+Changes:
+    - task_events table: (id, task_id, ts, kind, status, payload JSONB)
+    - ix_task_events_task_id_ts: Per-task history in time order
+    - ix_task_events_kind_ts: Dashboards (recent errors, status history)
+
+tasks.error_log is kept: it holds history written before this migration and
+rare manual entries (review rejections), and is merged into the aggregated log.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0007_add_task_events"
+down_revision: str | None = "20260118_0006_add_workspace_retention"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create task_events table and indexes."""
+    op.create_table(
+        "task_events",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "ts",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column("kind", sa.String(length=30), nullable=False),
+        sa.Column("status", sa.String(length=30), nullable=True),
+        sa.Column(
+            "payload",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_task_events_task_id_ts", "task_events", ["task_id", "ts"])
+    op.create_index("ix_task_events_kind_ts", "task_events", ["kind", "ts"])
+
+
+def downgrade() -> None:
+    """Drop task_events table."""
+    op.drop_index("ix_task_events_kind_ts", table_name="task_events")
+    op.drop_index("ix_task_events_task_id_ts", table_name="task_events")
+    op.drop_table("task_events")
@@ -0,0 +1,105 @@
+"""add_task_clip_progress
+
+Revision ID: 20260118_0008_add_task_clip_progress
+Revises: 20260118_0007_add_task_events
+Create Date: 2026-01-18
+
+This migration moves per-clip progress out of tasks.step_completion_metadata.
+
+Changes:
+    - task_clip_progress table: one row per (task_id, step, clip_number) with
+      the clip's status; partial regeneration checks become primary-key range
+      scans instead of loading the task's JSON document
+    - Data: failed_clip_numbers (video) and failed_audio_clip_numbers
+      (narration + SFX) lists are copied into rows and removed from the JSON
+
+Step metadata itself stays in step_completion_metadata but is now updated
+one step key at a time with server-side jsonb `||` (no read-modify-write).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0008_add_task_clip_progress"
+down_revision: str | None = "20260118_0007_add_task_events"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Legacy metadata key -> steps whose clips must be regenerated
+LEGACY_FAILED_CLIP_KEYS = {
+    "failed_clip_numbers": ("video_generation",),
+    "failed_audio_clip_numbers": ("narration_generation", "sfx_generation"),
+}
+
+
+def upgrade() -> None:
+    """Create task_clip_progress and migrate failed clip lists into it."""
+    op.create_table(
+        "task_clip_progress",
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("step", sa.String(length=30), nullable=False),
+        sa.Column("clip_number", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("task_id", "step", "clip_number", name="pk_task_clip_progress"),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+        sa.CheckConstraint(
+            "clip_number >= 1 AND clip_number <= 18",
+            name="ck_task_clip_progress_clip_number",
+        ),
+    )
+
+    for key, steps in LEGACY_FAILED_CLIP_KEYS.items():
+        for step in steps:
+            op.execute(
+                sa.text(
+                    """
+                    INSERT INTO task_clip_progress (task_id, step, clip_number, status)
+                    SELECT t.id, :step, clip.value::int, 'failed'
+                    FROM tasks t
+                    CROSS JOIN LATERAL
+                        jsonb_array_elements_text(t.step_completion_metadata -> :key) AS clip
+                    WHERE jsonb_typeof(t.step_completion_metadata -> :key) = 'array'
+                      AND clip.value ~ '^[0-9]+$'
+                      AND clip.value::int BETWEEN 1 AND 18
+                    ON CONFLICT DO NOTHING
+                    """
+                ).bindparams(step=step, key=key)
+            )
+        op.execute(
+            sa.text(
+                "UPDATE tasks SET step_completion_metadata = step_completion_metadata - :key "
+                "WHERE step_completion_metadata -> :key IS NOT NULL"
+            ).bindparams(key=key)
+        )
+
+
+def downgrade() -> None:
+    """Copy failed clips back into step_completion_metadata and drop the table."""
+    for key, steps in LEGACY_FAILED_CLIP_KEYS.items():
+        op.execute(
+            sa.text(
+                """
+                UPDATE tasks t
+                SET step_completion_metadata = COALESCE(t.step_completion_metadata, '{}'::jsonb)
+                    || jsonb_build_object(:key, clips.numbers)
+                FROM (
+                    SELECT task_id, jsonb_agg(DISTINCT clip_number) AS numbers
+                    FROM task_clip_progress
+                    WHERE status = 'failed' AND step = :step
+                    GROUP BY task_id
+                ) clips
+                WHERE clips.task_id = t.id
+                """
+            ).bindparams(key=key, step=steps[0])
+        )
+    op.drop_table("task_clip_progress")
@@ -0,0 +1,65 @@
+"""add_task_artifacts
+
+Revision ID: 20260118_0009_add_task_artifacts
+Revises: 20260118_0008_add_task_clip_progress
+Create Date: 2026-01-18
+
+This migration adds an index of generated output files.
+
+Changes:
+    - task_artifacts table: one row per output file of a task (path relative
+      to the project dir, kind, clip number, size, SHA-256, duration, state)
+    - ix_task_artifacts_task_id_kind: Per-step lookups (e.g. all narration
+      clips of a task for assembly and Notion population)
+
+Existing tasks have no rows; their outputs are indexed the first time a
+resumed step finds them on disk.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0009_add_task_artifacts"
+down_revision: str | None = "20260118_0008_add_task_clip_progress"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create task_artifacts."""
+    op.create_table(
+        "task_artifacts",
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("path", sa.String(length=255), nullable=False),
+        sa.Column("kind", sa.String(length=20), nullable=False),
+        sa.Column("clip_number", sa.Integer(), nullable=True),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("duration_seconds", sa.Float(), nullable=True),
+        sa.Column("state", sa.String(length=20), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("task_id", "path", name="pk_task_artifacts"),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_task_artifacts_task_id_kind", "task_artifacts", ["task_id", "kind"])
+
+
+def downgrade() -> None:
+    """Drop task_artifacts."""
+    op.drop_index("ix_task_artifacts_task_id_kind", table_name="task_artifacts")
+    op.drop_table("task_artifacts")
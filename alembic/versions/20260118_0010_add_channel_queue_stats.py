@@ -0,0 +1,123 @@
+"""add_channel_queue_stats
+
+Revision ID: 20260118_0010_add_channel_queue_stats
+Revises: 20260118_0009_add_task_artifacts
+Create Date: 2026-01-18
+
+This migration adds incrementally maintained per-channel task counts.
+
+Changes:
+    - channel_queue_stats table: task count per (channel_id, status)
+    - maintain_channel_queue_stats(): Trigger function moving one count from
+      the old (channel, status) to the new one; the two rows are updated in
+      status order so concurrent transitions lock them in the same order
+    - tasks_channel_queue_stats trigger: AFTER INSERT/DELETE on tasks
+    - tasks_channel_queue_stats_update trigger: AFTER UPDATE of status or
+      channel_id, only when one of them actually changed
+    - Backfill from the current tasks. CREATE TRIGGER locks tasks against
+      writes until this migration commits, so no change is missed or counted
+      twice.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0010_add_channel_queue_stats"
+down_revision: str | None = "20260118_0009_add_task_artifacts"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create channel_queue_stats, its maintenance triggers and backfill it."""
+    op.create_table(
+        "channel_queue_stats",
+        sa.Column("channel_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(length=30), nullable=False),
+        sa.Column("task_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("channel_id", "status", name="pk_channel_queue_stats"),
+        sa.ForeignKeyConstraint(["channel_id"], ["channels.id"], ondelete="CASCADE"),
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION maintain_channel_queue_stats()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            old_status TEXT;
+            new_status TEXT;
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                old_status := OLD.status::text;
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                new_status := NEW.status::text;
+            END IF;
+
+            -- Increment first only when the new row sorts first (lock ordering)
+            IF new_status IS NOT NULL AND (old_status IS NULL OR new_status < old_status) THEN
+                INSERT INTO channel_queue_stats (channel_id, status, task_count)
+                VALUES (NEW.channel_id, new_status, 1)
+                ON CONFLICT (channel_id, status)
+                DO UPDATE SET task_count = channel_queue_stats.task_count + 1;
+                new_status := NULL;
+            END IF;
+
+            IF old_status IS NOT NULL THEN
+                UPDATE channel_queue_stats SET task_count = task_count - 1
+                WHERE channel_id = OLD.channel_id AND status = old_status;
+            END IF;
+
+            IF new_status IS NOT NULL THEN
+                INSERT INTO channel_queue_stats (channel_id, status, task_count)
+                VALUES (NEW.channel_id, new_status, 1)
+                ON CONFLICT (channel_id, status)
+                DO UPDATE SET task_count = channel_queue_stats.task_count + 1;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tasks_channel_queue_stats
+            AFTER INSERT OR DELETE ON tasks
+            FOR EACH ROW
+            EXECUTE FUNCTION maintain_channel_queue_stats();
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tasks_channel_queue_stats_update
+            AFTER UPDATE OF status, channel_id ON tasks
+            FOR EACH ROW
+            WHEN (
+                OLD.status IS DISTINCT FROM NEW.status
+                OR OLD.channel_id IS DISTINCT FROM NEW.channel_id
+            )
+            EXECUTE FUNCTION maintain_channel_queue_stats();
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO channel_queue_stats (channel_id, status, task_count)
+        SELECT channel_id, status::text, COUNT(*)
+        FROM tasks
+        GROUP BY channel_id, status
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the triggers, trigger function and channel_queue_stats."""
+    op.execute("DROP TRIGGER IF EXISTS tasks_channel_queue_stats_update ON tasks;")
+    op.execute("DROP TRIGGER IF EXISTS tasks_channel_queue_stats ON tasks;")
+    op.execute("DROP FUNCTION IF EXISTS maintain_channel_queue_stats();")
+    op.drop_table("channel_queue_stats")
@@ -0,0 +1,58 @@
+"""add_task_list_keyset_index
+
+Revision ID: 20260118_0011_add_task_list_keyset_index
+Revises: 20260118_0010_add_channel_queue_stats
+Create Date: 2026-01-18
+
+This migration adds the index behind keyset-paginated task list views
+(app.services.task_service.list_tasks).
+
+Index Structure:
+    (status, created_at, id)
+
+Query Coverage:
+    WHERE status IN (...)
+      AND (created_at, id) > (:cursor_created_at, :cursor_id)
+    ORDER BY created_at, id
+    LIMIT :page_size
+
+Every page is an index range scan starting at the cursor, so the cost of a
+page does not grow with its position in the list (OFFSET would read and
+discard every earlier row).
+
+Deployment Notes:
+    - Built CONCURRENTLY (outside the migration transaction) so task writes
+      are not blocked while the index builds
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0011_add_task_list_keyset_index"
+down_revision: str | None = "20260118_0010_add_channel_queue_stats"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add composite index on (status, created_at, id)."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_status_created_at_id",
+            "tasks",
+            ["status", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Remove the keyset pagination index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_status_created_at_id",
+            table_name="tasks",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,52 @@
+"""add_task_notion_pages
+
+Revision ID: 20260118_0012_add_task_notion_pages
+Revises: 20260118_0011_add_task_list_keyset_index
+Create Date: 2026-01-18
+
+This migration records the Notion pages created for a task's generated
+entries (assets, video clips, narration and SFX).
+
+Changes:
+    - task_notion_pages table: one row per (task, entry) with the created
+      Notion page ID; population skips entries that already have a row, so
+      re-running a step does not create duplicate pages
+
+Pages created before this migration are not recorded; a re-run of an older
+task's step creates its entries once more.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0012_add_task_notion_pages"
+down_revision: str | None = "20260118_0011_add_task_list_keyset_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create task_notion_pages."""
+    op.create_table(
+        "task_notion_pages",
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("entry_key", sa.String(length=100), nullable=False),
+        sa.Column("notion_page_id", sa.String(length=100), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("task_id", "entry_key", name="pk_task_notion_pages"),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+    )
+
+
+def downgrade() -> None:
+    """Drop task_notion_pages."""
+    op.drop_table("task_notion_pages")
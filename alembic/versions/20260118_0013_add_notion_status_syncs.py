@@ -0,0 +1,71 @@
+"""add_notion_status_syncs
+
+Revision ID: 20260118_0013_add_notion_status_syncs
+Revises: 20260118_0012_add_task_notion_pages
+Create Date: 2026-01-18
+
+This migration persists the Notion status updates of bulk review operations
+(ReviewService.bulk_approve_tasks / bulk_reject_tasks).
+
+Changes:
+    - notion_status_syncs table: one row per (bulk operation, task) with the
+      update's state, attempts and last error; written in the same
+      transaction as the status changes and updated by the background sync
+    - ix_notion_status_syncs_state_next_attempt_at: retry scan for failed
+      updates whose backoff has elapsed
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0013_add_notion_status_syncs"
+down_revision: str | None = "20260118_0012_add_task_notion_pages"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create notion_status_syncs."""
+    op.create_table(
+        "notion_status_syncs",
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("notion_page_id", sa.String(length=100), nullable=False),
+        sa.Column("target_status", sa.String(length=30), nullable=False),
+        sa.Column("state", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("job_id", "task_id", name="pk_notion_status_syncs"),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        "ix_notion_status_syncs_state_next_attempt_at",
+        "notion_status_syncs",
+        ["state", "next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop notion_status_syncs."""
+    op.drop_index(
+        "ix_notion_status_syncs_state_next_attempt_at", table_name="notion_status_syncs"
+    )
+    op.drop_table("notion_status_syncs")
@@ -0,0 +1,68 @@
+"""add_task_queued_at
+
+Revision ID: 20260118_0014_add_task_queued_at
+Revises: 20260118_0013_add_notion_status_syncs
+Create Date: 2026-01-18
+
+This migration records when each task last entered the queue.
+
+Starvation protection in FAIR_SHARE_QUERY used tasks.updated_at as the queue
+entry time, but queued rows are updated while they wait (not_before and
+retry_count for deferral, workspace retention, Notion sync), which reset the
+clock.
+
+Changes:
+    - tasks.queued_at: Time of the latest transition to 'queued'
+    - set_task_queued_at(): BEFORE trigger function stamping NOW() on insert
+      into 'queued' and on every status change to 'queued'
+    - tasks_set_queued_at trigger: BEFORE INSERT OR UPDATE OF status on tasks
+    - Backfill: currently queued tasks get queued_at = updated_at
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0014_add_task_queued_at"
+down_revision: str | None = "20260118_0013_add_notion_status_syncs"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add tasks.queued_at, its maintenance trigger and backfill it."""
+    op.add_column("tasks", sa.Column("queued_at", sa.DateTime(timezone=True), nullable=True))
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_task_queued_at()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF NEW.status = 'queued'
+               AND (TG_OP = 'INSERT' OR OLD.status IS DISTINCT FROM NEW.status) THEN
+                NEW.queued_at = NOW();
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tasks_set_queued_at
+            BEFORE INSERT OR UPDATE OF status ON tasks
+            FOR EACH ROW
+            EXECUTE FUNCTION set_task_queued_at();
+        """
+    )
+
+    op.execute("UPDATE tasks SET queued_at = updated_at WHERE status = 'queued'")
+
+
+def downgrade() -> None:
+    """Drop the trigger, trigger function and tasks.queued_at."""
+    op.execute("DROP TRIGGER IF EXISTS tasks_set_queued_at ON tasks;")
+    op.execute("DROP FUNCTION IF EXISTS set_task_queued_at();")
+    op.drop_column("tasks", "queued_at")
@@ -0,0 +1,68 @@
+"""add_task_predicted_remaining
+
+Revision ID: 20260118_0015_add_task_predicted_remaining
+Revises: 20260118_0014_add_task_queued_at
+Create Date: 2026-01-18
+
+This migration persists each queued task's predicted remaining work.
+
+The shortest-remaining-work claim ordering summed step_duration_stats
+p50_seconds over a task's incomplete steps with correlated subqueries in the
+ORDER BY, so no index could supply the order and every claim evaluated the
+sums for the whole queued backlog. The prediction is now written by the
+step duration stats refresh (app.services.work_estimator) and the claim
+orders on the column.
+
+Changes:
+    - tasks.predicted_remaining_seconds: Sum of p50_seconds over incomplete steps
+    - tasks.predicted_remaining_cost_usd: Sum of p50_cost_usd over incomplete steps
+    - ix_tasks_queued_channel_priority_predicted: Partial index on
+      (channel_id, priority, predicted_remaining_seconds,
+      predicted_remaining_cost_usd) WHERE status = 'queued'
+
+Existing queued tasks keep NULL predictions until the next refresh; the claim
+orders them after estimated tasks (a task never estimated has all of its
+steps left).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260118_0015_add_task_predicted_remaining"
+down_revision: str | None = "20260118_0014_add_task_queued_at"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add predicted remaining work columns and their partial claim index."""
+    op.add_column("tasks", sa.Column("predicted_remaining_seconds", sa.Float(), nullable=True))
+    op.add_column("tasks", sa.Column("predicted_remaining_cost_usd", sa.Float(), nullable=True))
+
+    op.create_index(
+        "ix_tasks_queued_channel_priority_predicted",
+        "tasks",
+        [
+            "channel_id",
+            "priority",
+            "predicted_remaining_seconds",
+            "predicted_remaining_cost_usd",
+        ],
+        unique=False,
+        postgresql_where=sa.text("status = 'queued'"),
+        postgresql_concurrently=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the claim index and predicted remaining work columns."""
+    op.drop_index(
+        "ix_tasks_queued_channel_priority_predicted",
+        table_name="tasks",
+        postgresql_concurrently=True,
+    )
+    op.drop_column("tasks", "predicted_remaining_cost_usd")
+    op.drop_column("tasks", "predicted_remaining_seconds")
@@ -29,7 +29,9 @@ from pathlib import Path
 
 import httpx
 
+from app.config import get_catbox_api_url
 from app.utils.logging import get_logger
+from app.utils.metrics import track_api_call
 
 log = get_logger(__name__)
 
@@ -54,7 +56,7 @@ class CatboxClient:
 
     def __init__(self) -> None:
         """Initialize catbox.moe client with default configuration."""
-        self.base_url = "https://catbox.moe/user/api.php"
+        self.base_url = get_catbox_api_url()
         self.client = httpx.AsyncClient(timeout=30.0)
 
     async def upload_image(self, image_path: Path) -> str:
@@ -92,8 +94,9 @@ class CatboxClient:
             files = {"fileToUpload": f}
             data = {"reqtype": "fileupload"}
 
-            response = await self.client.post(self.base_url, data=data, files=files)
-            response.raise_for_status()
+            async with track_api_call("catbox"):
+                response = await self.client.post(self.base_url, data=data, files=files)
+                response.raise_for_status()
 
             url = response.text.strip()
             log.info("catbox_upload_success", image_path=str(image_path), url=url)
@@ -13,12 +13,18 @@ Usage:
 """
 
 import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
 import httpx
 from aiolimiter import AsyncLimiter
 
+from app.config import get_notion_api_base_url
+from app.utils.metrics import RATE_LIMIT_WAIT, track_api_call
+
 
 class NotionAPIError(Exception):
     """Raised for non-retriable Notion API errors (401, 403, 400)."""
@@ -63,7 +69,7 @@ class NotionClient:
         self.client = httpx.AsyncClient(timeout=30.0)
         # CRITICAL: 3 requests per 1 second (Notion API hard limit)
         self.rate_limiter = AsyncLimiter(max_rate=3, time_period=1)
-        self.base_url = "https://api.notion.com/v1"
+        self.base_url = get_notion_api_base_url()
         self.notion_version = "2022-06-28"
 
     def _get_headers(self) -> dict[str, str]:
@@ -78,6 +84,15 @@ class NotionClient:
             "Content-Type": "application/json",
         }
 
+    @asynccontextmanager
+    async def _rate_limited(self) -> AsyncIterator[None]:
+        """Hold the rate limiter for one request, recording wait and latency."""
+        wait_start = time.perf_counter()
+        async with self.rate_limiter:
+            RATE_LIMIT_WAIT.observe(time.perf_counter() - wait_start, limiter="notion")
+            async with track_api_call("notion"):
+                yield
+
     def _is_retriable_error(self, exception: Exception) -> bool:
         """Determine if an error should trigger retry logic.
 
@@ -150,7 +165,7 @@ class NotionClient:
         for attempt in range(3):
             attempt_count = attempt + 1
             try:
-                async with self.rate_limiter:  # Enforce 3 req/sec limit
+                async with self._rate_limited():  # Enforce 3 req/sec limit
                     response = await self.client.patch(
                         f"{self.base_url}/pages/{page_id}",
                         headers=self._get_headers(),
@@ -215,7 +230,7 @@ class NotionClient:
         for attempt in range(3):
             attempt_count = attempt + 1
             try:
-                async with self.rate_limiter:  # Enforce 3 req/sec limit
+                async with self._rate_limited():  # Enforce 3 req/sec limit
                     response = await self.client.post(
                         f"{self.base_url}/databases/{normalized_id}/query",
                         headers=self._get_headers(),
@@ -285,7 +300,7 @@ class NotionClient:
         for attempt in range(3):
             attempt_count = attempt + 1
             try:
-                async with self.rate_limiter:  # Enforce 3 req/sec limit
+                async with self._rate_limited():  # Enforce 3 req/sec limit
                     response = await self.client.patch(
                         f"{self.base_url}/pages/{page_id}",
                         headers=self._get_headers(),
@@ -345,7 +360,7 @@ class NotionClient:
         for attempt in range(3):
             attempt_count = attempt + 1
             try:
-                async with self.rate_limiter:  # Enforce 3 req/sec limit
+                async with self._rate_limited():  # Enforce 3 req/sec limit
                     response = await self.client.get(
                         f"{self.base_url}/pages/{page_id}",
                         headers=self._get_headers(),
@@ -418,7 +433,7 @@ class NotionClient:
         for attempt in range(3):
             attempt_count = attempt + 1
             try:
-                async with self.rate_limiter:  # Enforce 3 req/sec limit
+                async with self._rate_limited():  # Enforce 3 req/sec limit
                     response = await self.client.post(
                         f"{self.base_url}/pages",
                         headers=self._get_headers(),
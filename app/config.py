@@ -130,6 +130,31 @@ def get_notion_api_token() -> str | None:
     return os.getenv("NOTION_API_TOKEN")
 
 
+def get_notion_api_base_url() -> str:
+    """Get Notion API base URL from environment.
+
+    Environment Variable:
+        NOTION_API_BASE_URL: Notion REST API root (default: "https://api.notion.com/v1");
+            the offline load-test harness points it at a fake server
+
+    Returns:
+        Base URL without trailing slash.
+    """
+    return os.getenv("NOTION_API_BASE_URL", "https://api.notion.com/v1").rstrip("/")
+
+
+def get_catbox_api_url() -> str:
+    """Get catbox.moe upload endpoint from environment.
+
+    Environment Variable:
+        CATBOX_API_URL: Upload endpoint (default: "https://catbox.moe/user/api.php")
+
+    Returns:
+        Upload endpoint URL.
+    """
+    return os.getenv("CATBOX_API_URL", "https://catbox.moe/user/api.php")
+
+
 def get_notion_database_ids() -> list[str]:
     """Get Notion database IDs from environment.
 
@@ -295,75 +320,343 @@ def get_notion_sync_interval() -> int:
         return 10
 
 
-# Parallelism defaults (Story 4.6)
-DEFAULT_MAX_CONCURRENT_ASSET = 12  # Gemini: no published limit, conservative
-DEFAULT_MAX_CONCURRENT_VIDEO = 3   # Kling: 10 global limit, 3 workers × 3 = 9 total
-DEFAULT_MAX_CONCURRENT_AUDIO = 6   # ElevenLabs: no published limit, conservative
+# Cluster-wide API concurrency limits (replaces per-worker Story 4.6 limits)
+# Enforced across all workers via api_slot_leases (app.services.api_concurrency)
+DEFAULT_API_CONCURRENCY = {
+    "gemini": 36,      # No published concurrency limit; previous 3 workers x 12
+    "kling": 10,       # Kling global limit: 10 concurrent requests per account
+    "elevenlabs": 18,  # No published concurrency limit; previous 3 workers x 6
+}
+
+# Lease time-to-live: a crashed worker's slots are reclaimable after this long
+DEFAULT_API_LEASE_TTL_SECONDS = 60
 
 # Video generation defaults (Story 5.4)
 DEFAULT_VIDEO_DURATION_SECONDS = 10.0  # Kling generates 10-second clips by default
 
 
-def get_max_concurrent_asset_gen() -> int:
-    """Get max concurrent asset generation tasks per worker.
+def get_api_concurrency_limit(provider: str) -> int:
+    """Get cluster-wide concurrent request limit for an external API.
+
+    The limit is shared by every worker: a worker may use any slot that is
+    not leased by another worker, so idle workers no longer strand capacity.
+
+    Environment Variables:
+        GEMINI_MAX_CONCURRENT: Gemini image requests (default: 36)
+        KLING_MAX_CONCURRENT: Kling video requests (default: 10)
+        ELEVENLABS_MAX_CONCURRENT: ElevenLabs audio requests (default: 18)
+
+    Args:
+        provider: API name ("gemini", "kling", "elevenlabs").
+
+    Returns:
+        Maximum concurrent requests across all workers (minimum 1).
+
+    Raises:
+        ValueError: If provider is not a coordinated API.
+    """
+    if provider not in DEFAULT_API_CONCURRENCY:
+        raise ValueError(f"Unknown API provider: {provider}")
+    env_var = f"{provider.upper()}_MAX_CONCURRENT"
+    try:
+        return max(1, int(os.getenv(env_var, str(DEFAULT_API_CONCURRENCY[provider]))))
+    except ValueError:
+        log.warning(
+            "invalid_api_concurrency_limit",
+            env_var=env_var,
+            value=os.getenv(env_var),
+            using_default=DEFAULT_API_CONCURRENCY[provider],
+        )
+        return DEFAULT_API_CONCURRENCY[provider]
 
-    This limits parallelism for Gemini asset generation within each worker.
-    Rate limiting (quota exhaustion) is handled separately via WorkerState.
+
+def get_api_lease_ttl_seconds() -> int:
+    """Get API slot lease time-to-live in seconds.
+
+    Holders renew their lease every TTL / 3 seconds. If a worker dies, its
+    leases expire after at most one TTL and the slots become available again.
 
     Environment Variable:
-        MAX_CONCURRENT_ASSET_GEN: Maximum parallel asset tasks (default: 12)
+        API_LEASE_TTL_SECONDS: Lease TTL (default: 60, minimum 10)
 
     Returns:
-        Maximum concurrent asset generation tasks.
+        Lease TTL in seconds.
+    """
+    try:
+        return max(10, int(os.getenv("API_LEASE_TTL_SECONDS", str(DEFAULT_API_LEASE_TTL_SECONDS))))
+    except ValueError:
+        return DEFAULT_API_LEASE_TTL_SECONDS
 
-    Note:
-        Default of 12 is conservative for Gemini API, which has daily quota
-        limits but no published concurrency limits. Each worker enforces this
-        limit independently (worker-local state, not global).
 
-    Story: 4.6 - Parallel Task Execution (AC4)
+# Warm CLI script pool (app.utils.script_pool)
+DEFAULT_SCRIPT_POOL_SIZE = 4
+DEFAULT_SCRIPT_POOL_MAX_JOBS = 50
+
+
+def get_script_pool_size() -> int:
+    """Get number of warm script runner processes per worker.
+
+    Runners import the CLI script modules once and execute main() per
+    request, avoiding interpreter startup and heavy imports. Requests beyond
+    the pool size run as one-off subprocesses.
+
+    Environment Variable:
+        CLI_SCRIPT_POOL_SIZE: Runner processes (default: 4, 0 disables the pool)
+
+    Returns:
+        Pool size (minimum 0).
     """
-    return int(os.getenv("MAX_CONCURRENT_ASSET_GEN", str(DEFAULT_MAX_CONCURRENT_ASSET)))
+    try:
+        return max(0, int(os.getenv("CLI_SCRIPT_POOL_SIZE", str(DEFAULT_SCRIPT_POOL_SIZE))))
+    except ValueError:
+        return DEFAULT_SCRIPT_POOL_SIZE
 
 
-def get_max_concurrent_video_gen() -> int:
-    """Get max concurrent video generation tasks per worker.
+def get_script_pool_max_jobs() -> int:
+    """Get number of jobs a script runner executes before it is recycled.
 
-    This limits parallelism for Kling video generation within each worker.
-    Kling API has a GLOBAL limit of 10 concurrent requests across all clients.
+    Recycling bounds memory growth and module-level state leaking between
+    jobs in long-lived runners.
 
     Environment Variable:
-        MAX_CONCURRENT_VIDEO_GEN: Maximum parallel video tasks (default: 3)
+        CLI_SCRIPT_POOL_MAX_JOBS: Jobs per runner (default: 50, minimum 1)
 
     Returns:
-        Maximum concurrent video generation tasks.
+        Jobs per runner before replacement.
+    """
+    try:
+        return max(
+            1, int(os.getenv("CLI_SCRIPT_POOL_MAX_JOBS", str(DEFAULT_SCRIPT_POOL_MAX_JOBS)))
+        )
+    except ValueError:
+        return DEFAULT_SCRIPT_POOL_MAX_JOBS
 
-    Note:
-        Default of 3 per worker is conservative. With 3 workers, this gives
-        9 concurrent videos system-wide (under Kling's 10 limit). Each worker
-        enforces this limit independently (worker-local state).
 
-    Story: 4.6 - Parallel Task Execution (AC2)
+# Workspace retention (app.services.workspace_retention)
+DEFAULT_WORKSPACE_MIN_FREE_GB = 10.0
+DEFAULT_WORKSPACE_GC_INTERVAL_SECONDS = 600
+
+
+def get_workspace_min_free_bytes() -> int:
+    """Get the free disk space below which workers stop claiming tasks.
+
+    When free space on the workspace volume drops below this threshold,
+    workers run an urgent garbage collection and, if that does not free
+    enough space, leave queued tasks unclaimed until space is available.
+
+    Environment Variable:
+        WORKSPACE_MIN_FREE_GB: Minimum free space in GB (default: 10, 0 disables)
+
+    Returns:
+        Minimum free space in bytes (minimum 0).
     """
-    return int(os.getenv("MAX_CONCURRENT_VIDEO_GEN", str(DEFAULT_MAX_CONCURRENT_VIDEO)))
+    try:
+        gigabytes = float(os.getenv("WORKSPACE_MIN_FREE_GB", str(DEFAULT_WORKSPACE_MIN_FREE_GB)))
+    except ValueError:
+        gigabytes = DEFAULT_WORKSPACE_MIN_FREE_GB
+    return int(max(0.0, gigabytes) * 1024**3)
 
 
-def get_max_concurrent_audio_gen() -> int:
-    """Get max concurrent audio generation tasks per worker.
+def get_workspace_gc_interval_seconds() -> int:
+    """Get how often each worker runs workspace garbage collection.
 
-    This limits parallelism for ElevenLabs audio generation within each worker.
-    ElevenLabs has character-based pricing with no published concurrency limits.
+    Environment Variable:
+        WORKSPACE_GC_INTERVAL_SECONDS: Seconds between sweeps (default: 600, minimum 60)
+
+    Returns:
+        Sweep interval in seconds.
+    """
+    try:
+        return max(
+            60,
+            int(
+                os.getenv(
+                    "WORKSPACE_GC_INTERVAL_SECONDS", str(DEFAULT_WORKSPACE_GC_INTERVAL_SECONDS)
+                )
+            ),
+        )
+    except ValueError:
+        return DEFAULT_WORKSPACE_GC_INTERVAL_SECONDS
+
+
+# Decrypted credential cache (app.services.credential_cache)
+DEFAULT_CREDENTIAL_CACHE_TTL_SECONDS = 60
+
+
+def get_credential_cache_ttl_seconds() -> int:
+    """Get how long decrypted channel credentials stay cached per process.
+
+    Storing a credential through CredentialService (or syncing a channel
+    config) invalidates it immediately; the TTL bounds how long a change
+    made by another process goes unnoticed.
 
     Environment Variable:
-        MAX_CONCURRENT_AUDIO_GEN: Maximum parallel audio tasks (default: 6)
+        CREDENTIAL_CACHE_TTL_SECONDS: Cache TTL (default: 60, 0 disables)
 
     Returns:
-        Maximum concurrent audio generation tasks.
+        TTL in seconds (minimum 0).
+    """
+    try:
+        return max(
+            0,
+            int(
+                os.getenv(
+                    "CREDENTIAL_CACHE_TTL_SECONDS", str(DEFAULT_CREDENTIAL_CACHE_TTL_SECONDS)
+                )
+            ),
+        )
+    except ValueError:
+        return DEFAULT_CREDENTIAL_CACHE_TTL_SECONDS
 
-    Note:
-        Default of 6 is conservative for ElevenLabs API. Each worker enforces
-        this limit independently (worker-local state, not global).
 
-    Story: 4.6 - Parallel Task Execution (AC2)
+# Worker metrics endpoint (app.utils.metrics.start_metrics_server)
+DEFAULT_WORKER_METRICS_PORT = 9100
+
+
+def get_worker_metrics_port() -> int:
+    """Get the port each worker serves Prometheus metrics on.
+
+    The web service exposes /metrics on its own port; workers have no HTTP
+    server, so they start a minimal one on this port.
+
+    Environment Variable:
+        WORKER_METRICS_PORT: Port (default: 9100, 0 disables)
+
+    Returns:
+        Port number (0 when disabled).
+    """
+    try:
+        return max(0, int(os.getenv("WORKER_METRICS_PORT", str(DEFAULT_WORKER_METRICS_PORT))))
+    except ValueError:
+        return DEFAULT_WORKER_METRICS_PORT
+
+
+# Trace export (app.utils.tracing)
+DEFAULT_TRACE_SERVICE_NAME = "ai-video-generator"
+
+
+def get_trace_export_file() -> str | None:
+    """Get the JSON-lines file finished trace spans are appended to.
+
+    Environment Variable:
+        TRACE_EXPORT_FILE: File path (optional; unset disables file export)
+
+    Returns:
+        File path, or None if not configured.
+    """
+    return os.getenv("TRACE_EXPORT_FILE") or None
+
+
+def get_otlp_traces_endpoint() -> str | None:
+    """Get the OTLP/HTTP endpoint finished trace spans are sent to.
+
+    Follows the OpenTelemetry exporter variables: the traces-specific
+    endpoint is used as-is, the generic one gets "/v1/traces" appended.
+
+    Environment Variables:
+        OTEL_EXPORTER_OTLP_TRACES_ENDPOINT: Full traces URL (optional)
+        OTEL_EXPORTER_OTLP_ENDPOINT: Collector base URL (optional)
+
+    Returns:
+        Traces URL, or None if not configured.
+    """
+    endpoint = os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
+    if endpoint:
+        return endpoint
+    base = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+    return f"{base.rstrip('/')}/v1/traces" if base else None
+
+
+def get_otlp_headers() -> dict[str, str]:
+    """Get extra headers for OTLP requests (collector authentication).
+
+    Environment Variable:
+        OTEL_EXPORTER_OTLP_HEADERS: Comma-separated key=value pairs (optional)
+
+    Returns:
+        Header dict (empty if not configured).
+    """
+    headers = {}
+    for pair in os.getenv("OTEL_EXPORTER_OTLP_HEADERS", "").split(","):
+        key, sep, value = pair.partition("=")
+        if sep and key.strip():
+            headers[key.strip()] = value.strip()
+    return headers
+
+
+def get_trace_service_name() -> str:
+    """Get the service name reported with exported spans.
+
+    Environment Variables:
+        OTEL_SERVICE_NAME: Service name (optional)
+        RAILWAY_SERVICE_NAME: Fallback set by Railway per service
+
+    Returns:
+        Service name (default: "ai-video-generator").
+    """
+    return (
+        os.getenv("OTEL_SERVICE_NAME")
+        or os.getenv("RAILWAY_SERVICE_NAME")
+        or DEFAULT_TRACE_SERVICE_NAME
+    )
+
+
+# Worker profiling (app.utils.profiler)
+DEFAULT_PROFILE_DURATION_SECONDS = 30
+MAX_PROFILE_DURATION_SECONDS = 600
+DEFAULT_EVENT_LOOP_LAG_THRESHOLD_MS = 500
+
+
+def get_worker_profiling_enabled() -> bool:
+    """Get whether workers accept on-demand profiling requests.
+
+    When enabled, SIGUSR1 or POST /debug/profile on the worker metrics port
+    records a sampling profile into the workspace.
+
+    Environment Variable:
+        WORKER_PROFILING_ENABLED: "true" to enable (default: disabled)
+
+    Returns:
+        True if profiling can be triggered.
     """
-    return int(os.getenv("MAX_CONCURRENT_AUDIO_GEN", str(DEFAULT_MAX_CONCURRENT_AUDIO)))
+    return os.getenv("WORKER_PROFILING_ENABLED", "").lower() == "true"
+
+
+def get_profile_duration_seconds() -> int:
+    """Get how long a signal-triggered profile samples the worker.
+
+    Environment Variable:
+        PROFILE_DURATION_SECONDS: Duration (default: 30, range: 1-600)
+
+    Returns:
+        Duration in seconds.
+    """
+    try:
+        seconds = int(
+            os.getenv("PROFILE_DURATION_SECONDS", str(DEFAULT_PROFILE_DURATION_SECONDS))
+        )
+    except ValueError:
+        return DEFAULT_PROFILE_DURATION_SECONDS
+    return min(max(seconds, 1), MAX_PROFILE_DURATION_SECONDS)
+
+
+def get_event_loop_lag_threshold_ms() -> int:
+    """Get the event loop stall length that is logged with the blocking stack.
+
+    Environment Variable:
+        EVENT_LOOP_LAG_THRESHOLD_MS: Threshold (default: 500, 0 disables)
+
+    Returns:
+        Threshold in milliseconds (0 when disabled).
+    """
+    try:
+        return max(
+            0,
+            int(
+                os.getenv(
+                    "EVENT_LOOP_LAG_THRESHOLD_MS", str(DEFAULT_EVENT_LOOP_LAG_THRESHOLD_MS)
+                )
+            ),
+        )
+    except ValueError:
+        return DEFAULT_EVENT_LOOP_LAG_THRESHOLD_MS
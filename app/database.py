@@ -11,6 +11,7 @@ Architecture Pattern:
     - Connection pooling sized for 3 workers + web service (pool_size=10)
     - pool_pre_ping=True handles Railway connection recycling
     - AsyncSession with expire_on_commit=False prevents lazy loading issues
+    - Pool checkout time is recorded in db_session_checkout_seconds
 
 Usage:
     FastAPI Routes:
@@ -24,6 +25,7 @@ Usage:
 """
 
 import os
+import time
 from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import (
@@ -32,6 +34,25 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from app.utils.metrics import DB_CHECKOUT
+
+
+class TimedCheckoutPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each connection checkout takes.
+
+    Covers waiting for a free connection (pool_size + max_overflow
+    exhausted), opening new connections and the pre-ping.
+    """
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, observing db_session_checkout_seconds."""
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_CHECKOUT.observe(time.perf_counter() - start)
 
 
 def _get_database_url() -> str:
@@ -64,6 +85,7 @@ if _database_url:
         pool_size=10,
         max_overflow=5,
         pool_pre_ping=True,  # Railway connection recycling
+        poolclass=TimedCheckoutPool,
         echo=os.getenv("DATABASE_ECHO", "").lower() == "true",
     )
 else:
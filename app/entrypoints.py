@@ -3,16 +3,22 @@
 This module defines entrypoints (task handlers) for each pipeline step.
 Each entrypoint follows the short transaction pattern:
     1. Claim task (PgQueuer automatic)
-    2. Check rate limits (YouTube quota, Gemini/Kling worker-local state)
+    2. Check rate limits (YouTube quota, shared Gemini quota, cluster-wide API slots)
     3. Update status to "processing" (short transaction, close DB)
     4. Execute pipeline step (OUTSIDE transaction)
     5. Update status to "completed" or "failed" (short transaction)
 
 Rate Limit Awareness (Story 4.5):
     - YouTube quota: Check database before upload tasks
-    - Gemini quota: Check worker_state flag before asset tasks
-    - Kling concurrency: Check worker_state counter before video tasks
-    - If rate limit hit: Release task back to queue, skip processing
+    - Gemini quota: Check shared api_quota_state before asset tasks; if
+      exhausted, defer the task (tasks.not_before) until the quota resets
+    - Gemini/Kling/ElevenLabs concurrency: Check cluster-wide free API slots
+      (api_slots) before claiming; services hold a slot per API request. If
+      none is free, defer the task for a short jittered delay
+    - Deferred tasks are re-enqueued with execute_after = not_before: returning
+      from an entrypoint completes its PgQueuer job, so without a new job the
+      task would never reach this entrypoint again
+    - Other rate limits hit: Release task back to queue, skip processing
 
 Entrypoints:
     - process_video: Orchestrate entire video generation pipeline
@@ -32,19 +38,42 @@ References:
 """
 
 import os
+from datetime import datetime, timedelta, timezone
 
 from pgqueuer import PgQueuer
 from pgqueuer.models import Job
 
 from app.database import AsyncSessionLocal
 from app.models import Task, TaskStatus
+from app.services.api_concurrency import api_slots
+from app.services.api_quota_state import GEMINI_PROVIDER, gemini_key_id, get_quota_status
 from app.services.quota_manager import check_youtube_quota, get_required_api
+from app.services.task_deferral import api_slot_retry_at, defer_task
+from app.services.work_estimator import completed_steps
 from app.utils.logging import get_logger
-from app.worker import worker_state
 
 log = get_logger(__name__)
 
 
+async def _requeue_job(pgq: PgQueuer, job: Job, not_before: datetime | None) -> None:
+    """Enqueue a new job for the same task, to run no earlier than not_before.
+
+    Args:
+        pgq: PgQueuer instance the entrypoint is registered with
+        job: Job being completed without processing its task
+        not_before: Time the task was deferred to (None runs it when picked)
+    """
+    execute_after = None
+    if not_before is not None:
+        execute_after = max(not_before - datetime.now(timezone.utc), timedelta(0))
+    await pgq.qm.queries.enqueue(
+        job.entrypoint,
+        job.payload,
+        priority=job.priority,
+        execute_after=execute_after,
+    )
+
+
 def register_entrypoints(pgq: PgQueuer) -> None:
     """Register all entrypoints with PgQueuer instance.
 
@@ -64,8 +93,9 @@ def register_entrypoints(pgq: PgQueuer) -> None:
         Full pipeline orchestration will be implemented in Story 4.8.
 
         Priority Context (Story 4.3):
-            Priority level is logged for observability. Priority ordering is handled
-            automatically by PgQueuer custom query (high → normal → low + FIFO).
+            Priority level is logged for observability. Pipeline claims are ordered
+            by app.queue.fair_share_claim_statement (high → normal → low, then
+            fair share across channels); PgQueuer jobs run in its own order.
 
         Args:
             job: PgQueuer Job object with task_id as payload
@@ -113,6 +143,12 @@ def register_entrypoints(pgq: PgQueuer) -> None:
             # Step 1.5: Rate limit awareness - double-check quota (Story 4.5)
             # Determine which API this task requires based on its status
             required_api = get_required_api(task.status.value)
+            if (
+                required_api is None
+                and task.status == TaskStatus.QUEUED
+                and "asset_generation" not in completed_steps(task.step_completion_metadata)
+            ):
+                required_api = "gemini"  # Queued task starts with asset generation
 
             rate_limit_hit = False
 
@@ -133,46 +169,43 @@ def register_entrypoints(pgq: PgQueuer) -> None:
                     )
 
             elif required_api == "gemini":
-                # Check asset generation concurrency limit first (Story 4.6 - cheaper check)
-                if not worker_state.can_claim_asset_task():
-                    rate_limit_hit = True
-                    log.warning(
-                        "asset_concurrency_limit_releasing_task",
-                        task_id=task_id,
-                        active_tasks=worker_state.active_asset_tasks,
-                        max_concurrent=worker_state.max_concurrent_asset_gen
-                    )
-                # Then check Gemini quota flag (worker-local) with auto-reset (Story 4.5)
-                elif not worker_state.check_gemini_quota_available():
-                    rate_limit_hit = True
+                # Check shared Gemini quota state (all workers, per API key)
+                quota = await get_quota_status(db, GEMINI_PROVIDER, gemini_key_id())
+                if not quota.available():
+                    # Defer instead of releasing: the claim query skips the task
+                    # until the quota resets, so no worker re-claims it in a loop
+                    task.not_before = quota.exhausted_until
+                    await db.commit()
                     log.warning(
-                        "gemini_quota_exhausted_releasing_task",
+                        "gemini_quota_exhausted_deferring_task",
                         task_id=task_id,
                         status=task.status.value,
-                        reset_time=worker_state.gemini_quota_reset_time.isoformat() if worker_state.gemini_quota_reset_time else None
+                        reason=quota.exhausted_reason,
+                        not_before=quota.exhausted_until.isoformat()
+                        if quota.exhausted_until
+                        else None,
                     )
-
-            elif required_api == "kling":
-                # Check Kling concurrency limit (worker-local)
-                if not worker_state.can_claim_video_task():
-                    rate_limit_hit = True
-                    log.warning(
-                        "kling_concurrency_limit_releasing_task",
-                        task_id=task_id,
-                        active_tasks=worker_state.active_video_tasks,
-                        max_concurrent=worker_state.max_concurrent_video
-                    )
-
-            elif required_api == "elevenlabs":
-                # Check audio generation concurrency limit (Story 4.6)
-                if not worker_state.can_claim_audio_task():
-                    rate_limit_hit = True
+                    await _requeue_job(pgq, job, quota.exhausted_until)
+                    return
+
+            # Cluster-wide API concurrency: only claim when a slot is free somewhere
+            # (the slot itself is acquired per request inside the service)
+            if not rate_limit_hit and required_api in ("gemini", "kling", "elevenlabs"):
+                free_slots = await api_slots.available_slots(required_api)
+                if free_slots == 0:
+                    # Defer briefly so the claim query doesn't hand the task
+                    # straight back while every slot is still held
+                    not_before = api_slot_retry_at()
+                    defer_task(task, not_before, reason=f"{required_api}_slots_busy")
+                    await db.commit()
                     log.warning(
-                        "audio_concurrency_limit_releasing_task",
+                        "api_concurrency_limit_deferring_task",
                         task_id=task_id,
-                        active_tasks=worker_state.active_audio_tasks,
-                        max_concurrent=worker_state.max_concurrent_audio_gen
+                        required_api=required_api,
+                        not_before=not_before.isoformat(),
                     )
+                    await _requeue_job(pgq, job, not_before)
+                    return
 
             # If rate limit hit, release task back to queue
             if rate_limit_hit:
@@ -187,14 +220,6 @@ def register_entrypoints(pgq: PgQueuer) -> None:
                 # Return early - don't process this task
                 return
 
-            # Increment task counters for tracked API types (Story 4.5: video, Story 4.6: asset/audio)
-            if required_api == "kling":
-                worker_state.increment_video_tasks()
-            elif required_api == "gemini":
-                worker_state.increment_asset_tasks()
-            elif required_api == "elevenlabs":
-                worker_state.increment_audio_tasks()
-
             # Transition: claimed → processing (with dynamic status based on task type)
             task.status = TaskStatus.CLAIMED
             await db.commit()
@@ -242,14 +267,6 @@ def register_entrypoints(pgq: PgQueuer) -> None:
                         is_retriable=is_retriable,
                     )
             raise
-        finally:
-            # Decrement task counters for tracked API types (Story 4.5: video, Story 4.6: asset/audio)
-            if required_api == "kling":
-                worker_state.decrement_video_tasks()
-            elif required_api == "gemini":
-                worker_state.decrement_asset_tasks()
-            elif required_api == "elevenlabs":
-                worker_state.decrement_audio_tasks()
 
         # Step 3b: Update status to completed (short transaction)
         async with AsyncSessionLocal() as db:  # type: ignore[misc]
@@ -11,12 +11,14 @@ from contextlib import asynccontextmanager
 
 import structlog
 from fastapi import FastAPI, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from app.clients.notion import NotionClient
 from app.config import get_notion_api_token
 from app.routes import webhooks
+from app.services.channel_queue_stats import collect_queue_depth
 from app.services.notion_sync import sync_database_to_notion_loop
+from app.utils.metrics import CONTENT_TYPE, REGISTRY
 
 log = structlog.get_logger()
 
@@ -85,6 +87,9 @@ app = FastAPI(
 # Register webhook routes (Story 2.5)
 app.include_router(webhooks.router)
 
+# Queue depth per channel is read on each /metrics scrape
+REGISTRY.add_collector(collect_queue_depth)
+
 
 @app.get("/health", status_code=status.HTTP_200_OK)
 async def health_check() -> JSONResponse:
@@ -106,6 +111,19 @@ async def health_check() -> JSONResponse:
     )
 
 
+@app.get("/metrics", status_code=status.HTTP_200_OK)
+async def metrics() -> Response:
+    """Prometheus scrape endpoint.
+
+    Renders the process's in-memory metrics (app.utils.metrics); queue depth
+    per channel is read from channel_queue_stats on each scrape.
+
+    Returns:
+        Response: Prometheus text exposition format
+    """
+    return Response(content=await REGISTRY.collect(), media_type=CONTENT_TYPE)
+
+
 @app.get("/", status_code=status.HTTP_200_OK)
 async def root() -> JSONResponse:
     """Root endpoint with API information.
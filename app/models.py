@@ -23,12 +23,15 @@ from datetime import date, datetime, timezone
 from typing import Any
 
 from sqlalchemy import (
+    DDL,
     JSON,
+    BigInteger,
     Boolean,
     CheckConstraint,
     Date,
     DateTime,
     Enum,
+    Float,
     ForeignKey,
     Index,
     Integer,
@@ -36,6 +39,7 @@ from sqlalchemy import (
     PrimaryKeyConstraint,
     String,
     Text,
+    event,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, validates
@@ -221,6 +225,8 @@ class Channel(Base):
         r2_bucket_name: R2 bucket name for asset storage (not encrypted, not sensitive).
         max_concurrent: Maximum parallel tasks allowed for this channel (FR13, FR16).
             Used for capacity tracking and fair scheduling. Default is 2, range 1-10.
+        scheduler_virtual_time: Per-channel virtual clock for weighted fair queuing.
+            Managed by the claim query only - never set from application code.
 
     Note:
         Encrypted fields store credentials as bytes. Use CredentialService
@@ -344,6 +350,15 @@ class Channel(Base):
         server_default="2",
     )
 
+    # Fair-share scheduling state (see app.queue.fair_share_claim_statement)
+    # Advanced by 1 / max_concurrent on every claim; lowest virtual time claims next
+    scheduler_virtual_time: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+        server_default="0",
+    )
+
     # Relationship to tasks (one-to-many)
     tasks: Mapped[list["Task"]] = relationship("Task", back_populates="channel")
 
@@ -395,8 +410,15 @@ class Task(Base):
         story_direction: Rich text story direction from Notion (unlimited).
         status: Pipeline status (27-value enum, indexed).
         priority: Queue priority (high/normal/low, default: normal).
-        error_log: Append-only error history (nullable, text field).
+        error_log: Legacy error history text (new pipeline errors: TaskEvent).
         youtube_url: Published YouTube URL (nullable, populated after upload).
+        not_before: Earliest claim time for a deferred task (nullable).
+        retry_count: Consecutive transient-failure retries (backoff exponent).
+        queued_at: Time of the latest transition to QUEUED (trigger-maintained).
+        predicted_remaining_seconds: p50 seconds left to FINAL_REVIEW (stats refresh).
+        predicted_remaining_cost_usd: p50 cost left to FINAL_REVIEW (stats refresh).
+        workspace_bytes: Last measured size of the task's project workspace.
+        workspace_retention_status: Status whose retention policy was last applied.
         created_at: Task creation timestamp (UTC).
         updated_at: Last status change timestamp (UTC, auto-updated).
         channel: Relationship to Channel model.
@@ -422,7 +444,15 @@ class Task(Base):
         # Initial states
         TaskStatus.DRAFT: [TaskStatus.QUEUED, TaskStatus.CANCELLED],
         TaskStatus.QUEUED: [TaskStatus.CLAIMED, TaskStatus.CANCELLED],
-        TaskStatus.CLAIMED: [TaskStatus.GENERATING_ASSETS],
+        # A claimed task starts at its first incomplete step (resume after approval/retry)
+        TaskStatus.CLAIMED: [
+            TaskStatus.GENERATING_ASSETS,
+            TaskStatus.GENERATING_COMPOSITES,
+            TaskStatus.GENERATING_VIDEO,
+            TaskStatus.GENERATING_AUDIO,
+            TaskStatus.GENERATING_SFX,
+            TaskStatus.ASSEMBLING,
+        ],
         # Asset generation phase (MANDATORY review gate)
         TaskStatus.GENERATING_ASSETS: [TaskStatus.ASSETS_READY, TaskStatus.ASSET_ERROR],
         TaskStatus.ASSETS_READY: [TaskStatus.ASSETS_APPROVED, TaskStatus.ASSET_ERROR],
@@ -541,7 +571,8 @@ class Task(Base):
         default=PriorityLevel.NORMAL,
     )
 
-    # Error tracking (append-only log)
+    # Error tracking (legacy text log; pipeline errors are task_events rows,
+    # read both via app.services.task_events.get_error_log)
     error_log: Mapped[str | None] = mapped_column(
         Text,
         nullable=True,
@@ -613,6 +644,53 @@ class Task(Base):
         nullable=True,
     )
 
+    # Deferred execution: the claim query skips queued tasks until this time
+    # Set for quota waits (e.g. Gemini 429) and transient-failure backoff
+    not_before: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    # Consecutive transient-failure retries (drives exponential backoff)
+    # Reset to 0 whenever a pipeline step completes
+    retry_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    # Time of the latest transition to QUEUED (starvation protection in
+    # app.queue.fair_share_claim_statement). Set by a trigger on insert and on every status
+    # change to queued, so updates to a waiting row (not_before, retry_count,
+    # retention, Notion sync) don't reset its queue age the way updated_at does.
+    queued_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    # Predicted work left before FINAL_REVIEW (app.services.work_estimator),
+    # refreshed for queued tasks with StepDurationStats so the claim orders on
+    # an indexed column. NULL until the first refresh after the task is queued.
+    predicted_remaining_seconds: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+    )
+    predicted_remaining_cost_usd: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+    )
+
+    # Workspace retention (app.services.workspace_retention)
+    # Size is re-measured after each step and after garbage collection, so
+    # per-channel disk usage is a SUM over tasks instead of a directory walk
+    workspace_bytes: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+    )
+    # Cleared when a step writes to the workspace again (e.g. after re-queue)
+    workspace_retention_status: Mapped[str | None] = mapped_column(
+        String(30),
+        nullable=True,
+    )
+
     # Timestamps (UTC timezone-aware)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -636,9 +714,13 @@ class Task(Base):
     # - ix_tasks_channel_id: Per-channel queries
     # - ix_tasks_created_at: FIFO ordering
     # - Partial index WHERE status='queued' for fast worker claims
+    # - ix_tasks_queued_channel_priority_predicted: Shortest remaining work
+    #   within (channel, priority), partial WHERE status='queued'
     __table_args__ = (
         # Composite index for channel + status filtering (capacity queries)
         Index("ix_tasks_channel_id_status", "channel_id", "status"),
+        # Keyset pagination of list views (app.services.task_service.list_tasks)
+        Index("ix_tasks_status_created_at_id", "status", "created_at", "id"),
     )
 
     @validates("status")
@@ -897,3 +979,628 @@ class YouTubeQuotaUsage(Base):
             f"date={self.date!s}, usage={self.units_used}/{self.daily_limit} "
             f"({percentage:.1f}%))>"
         )
+
+
+class StepDurationStats(Base):
+    """Historical step timing percentiles per channel (duration-aware scheduling).
+
+    Derived from Task.step_completion_metadata["<step>"]["duration_seconds"] of
+    recently completed steps and refreshed periodically by
+    app.services.work_estimator.refresh_step_duration_stats, which also sums
+    p50_seconds over each queued task's incomplete steps into
+    Task.predicted_remaining_seconds; the claim
+    (app.queue.fair_share_claim_statement) orders each channel's backlog on
+    that column, shortest-remaining-work-first.
+
+    Composite Primary Key:
+        (channel_id, step) - One row per channel per pipeline step.
+
+    Fallback:
+        Channels with fewer than MIN_CHANNEL_SAMPLES samples for a step receive
+        the all-channel percentiles, so every active channel with history has a
+        complete row set and every queued task on it gets a prediction.
+
+    Attributes:
+        channel_id: Foreign key to channels.id (part of composite PK).
+        step: PipelineStep value, e.g. "video_generation" (part of composite PK).
+        sample_count: Number of duration samples behind the percentiles.
+        p50_seconds: Median step duration (used for claim ordering).
+        p90_seconds: 90th percentile step duration (used for ETA reporting).
+        p50_cost_usd: Median channel pipeline cost apportioned to this step by
+            its share of median duration.
+        refreshed_at: When the row was last recomputed.
+    """
+
+    __tablename__ = "step_duration_stats"
+
+    channel_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("channels.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    step: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+
+    sample_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
+    p50_seconds: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
+
+    p90_seconds: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
+
+    p50_cost_usd: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+        server_default="0",
+    )
+
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("channel_id", "step", name="pk_step_duration_stats"),
+        CheckConstraint("sample_count >= 0", name="ck_step_duration_stats_samples"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation for debugging."""
+        return (
+            f"<StepDurationStats(channel_id={self.channel_id!s:.8}, step={self.step!r}, "
+            f"p50={self.p50_seconds:.1f}s, samples={self.sample_count})>"
+        )
+
+
+class ApiSlotLease(Base):
+    """Lease on one cluster-wide concurrency slot of an external API.
+
+    Each provider (gemini, kling, elevenlabs) has get_api_concurrency_limit()
+    slots numbered 0..limit-1. A worker holds a slot for the duration of one
+    API request and renews expires_at with heartbeats; a lease past expires_at
+    may be taken over by any worker, so slots held by a crashed worker are
+    recovered automatically after one TTL.
+
+    Composite Primary Key:
+        (provider, slot) - At most one holder per slot, enforced by the database.
+
+    Attributes:
+        provider: API name ("gemini", "kling", "elevenlabs").
+        slot: Slot number within the provider's limit.
+        holder: Unique lease token ("<worker_id>:<pid>:<uuid>").
+        task_id: Task the request belongs to (observability only).
+        acquired_at: When the current holder took the slot.
+        expires_at: Lease expiry; renewed by heartbeats.
+
+    Related:
+        - app.services.api_concurrency: ApiConcurrencyCoordinator
+        - Story 4.6: Parallel Task Execution (superseded per-worker counters)
+    """
+
+    __tablename__ = "api_slot_leases"
+
+    provider: Mapped[str] = mapped_column(String(20), nullable=False)
+    slot: Mapped[int] = mapped_column(Integer, nullable=False)
+    holder: Mapped[str] = mapped_column(String(100), nullable=False)
+    task_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    acquired_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("provider", "slot", name="pk_api_slot_leases"),
+        CheckConstraint("slot >= 0", name="ck_api_slot_leases_slot_non_negative"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation for debugging."""
+        return (
+            f"<ApiSlotLease(provider={self.provider!r}, slot={self.slot}, "
+            f"holder={self.holder!r}, expires_at={self.expires_at!s})>"
+        )
+
+
+class ApiQuotaState(Base):
+    """Shared quota state for one external API key.
+
+    Replaces the worker-local Gemini quota flag: when any worker hits a quota
+    error it records exhausted_until here, and every worker checks this row
+    before processing tasks that need the API. Request volume is sampled per
+    one-minute window so operators can see how close the key runs to its
+    per-minute limit.
+
+    Composite Primary Key:
+        (provider, key_id) - One row per API key; key_id is a SHA-256
+        fingerprint, never the key itself.
+
+    Attributes:
+        provider: API name ("gemini").
+        key_id: Fingerprint of the API key (16 hex chars).
+        exhausted_until: Quota unavailable until this time (None = available).
+        exhausted_reason: Which quota was hit ("per_minute" or "daily").
+        window_started_at: Start of the current request-counting window.
+        window_requests: Requests recorded in the current window.
+        requests_per_minute: Request rate observed over the last full window.
+        updated_at: Last update timestamp.
+
+    Related:
+        - app.services.api_quota_state: Read/update helpers
+        - Story 4.5: Rate Limit Aware Task Selection
+    """
+
+    __tablename__ = "api_quota_state"
+
+    provider: Mapped[str] = mapped_column(String(20), nullable=False)
+    key_id: Mapped[str] = mapped_column(String(16), nullable=False)
+    exhausted_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    exhausted_reason: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    window_started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+    )
+    window_requests: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    requests_per_minute: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("provider", "key_id", name="pk_api_quota_state"),
+        CheckConstraint("window_requests >= 0", name="ck_api_quota_state_window_requests"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation for debugging."""
+        return (
+            f"<ApiQuotaState(provider={self.provider!r}, key_id={self.key_id!r}, "
+            f"exhausted_until={self.exhausted_until!s}, rpm={self.requests_per_minute:.1f})>"
+        )
+
+
+class TaskEvent(Base):
+    """Append-only task event (status changes, errors, rejections).
+
+    Replaces read-modify-write appends to Task.error_log on the hot path:
+    every status update used to load the whole error_log TEXT, concatenate
+    and write it back, so the tasks row (and its TOAST/WAL traffic) grew
+    without bound. Events are small inserts into their own table; the error
+    log is aggregated on demand and status history is an index range scan.
+
+    Attributes:
+        id: UUID primary key.
+        task_id: Foreign key to tasks.id (events are deleted with the task).
+        ts: Event timestamp (UTC).
+        kind: Event kind ("status_change", "error", "rejection").
+        status: Task status the event refers to (status value, nullable).
+        payload: Event details, e.g. {"message": "...", "error_type": "..."}.
+
+    Indexes:
+        - ix_task_events_task_id_ts: Per-task history (error log, timeline)
+        - ix_task_events_kind_ts: Dashboards (recent errors, status history)
+
+    Related:
+        - app.services.task_events: Recording and aggregation helpers
+    """
+
+    __tablename__ = "task_events"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    task_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    ts: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+    )
+    kind: Mapped[str] = mapped_column(String(30), nullable=False)
+    status: Mapped[str | None] = mapped_column(String(30), nullable=True)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+
+    __table_args__ = (
+        Index("ix_task_events_task_id_ts", "task_id", "ts"),
+        Index("ix_task_events_kind_ts", "kind", "ts"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation for debugging."""
+        return (
+            f"<TaskEvent(task_id={self.task_id!s}, kind={self.kind!r}, "
+            f"status={self.status!r}, ts={self.ts!s})>"
+        )
+
+
+class TaskClipProgress(Base):
+    """Per-clip progress for one pipeline step of a task.
+
+    Narrow rows replace per-clip lists inside Task.step_completion_metadata
+    (e.g. the clip numbers a reviewer rejected), so a resume or partial
+    regeneration check is a primary-key range scan instead of loading and
+    searching the task's JSON document.
+
+    Composite Primary Key:
+        (task_id, step, clip_number) - One row per clip per step.
+
+    Attributes:
+        task_id: Foreign key to tasks.id (rows are deleted with the task).
+        step: Pipeline step value ("video_generation", "narration_generation", ...).
+        clip_number: Clip number (1-18).
+        status: Clip state ("failed" = must be regenerated).
+        updated_at: Last update timestamp.
+
+    Related:
+        - app.services.task_metadata: Clip progress helpers
+        - Story 5.4/5.5: Partial regeneration of rejected clips
+    """
+
+    __tablename__ = "task_clip_progress"
+
+    task_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    step: Mapped[str] = mapped_column(String(30), nullable=False)
+    clip_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("task_id", "step", "clip_number", name="pk_task_clip_progress"),
+        CheckConstraint(
+            "clip_number >= 1 AND clip_number <= 18",
+            name="ck_task_clip_progress_clip_number",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation for debugging."""
+        return (
+            f"<TaskClipProgress(task_id={self.task_id!s}, step={self.step!r}, "
+            f"clip={self.clip_number}, status={self.status!r})>"
+        )
+
+
+class TaskArtifact(Base):
+    """Index of a task's generated output files.
+
+    Written when a step produces (or first relies on) an output, so resume,
+    assembly-manifest construction and Notion population read one indexed
+    query instead of stat-ing and probing every file on the workspace volume.
+    The content hash and minimum-size check also catch truncated outputs
+    that a plain existence check accepts.
+
+    Composite Primary Key:
+        (task_id, path) - One row per output file.
+
+    Attributes:
+        task_id: Foreign key to tasks.id (rows are deleted with the task).
+        path: File path relative to the project directory
+            (e.g. "videos/clip_01.mp4").
+        kind: Artifact kind ("asset", "composite", "video", "narration",
+            "sfx", "final_video").
+        clip_number: Clip number (1-18) for per-clip outputs, else None.
+        size_bytes: File size when recorded.
+        sha256: Hex SHA-256 of the file contents.
+        duration_seconds: Media duration when known (audio, final video).
+        state: "ready" or "invalid" (below the kind's minimum size).
+        created_at: First time the file was recorded.
+        updated_at: Last time the file was recorded.
+
+    Related:
+        - app.services.task_artifacts: ArtifactIndex, recording helpers
+        - app.services.workspace_retention: Rows pruned with their files
+    """
+
+    __tablename__ = "task_artifacts"
+
+    task_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    path: Mapped[str] = mapped_column(String(255), nullable=False)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+    clip_number: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    duration_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
+    state: Mapped[str] = mapped_column(String(20), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("task_id", "path", name="pk_task_artifacts"),
+        Index("ix_task_artifacts_task_id_kind", "task_id", "kind"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation for debugging."""
+        return (
+            f"<TaskArtifact(task_id={self.task_id!s}, path={self.path!r}, "
+            f"kind={self.kind!r}, state={self.state!r})>"
+        )
+
+
+class TaskNotionPage(Base):
+    """Notion page created for one generated entry of a task.
+
+    Asset, video and audio population records each page as soon as Notion
+    returns it, so re-running a step (retry, partial resume, manual re-run)
+    skips entries that already have a page instead of creating duplicates.
+
+    Composite Primary Key:
+        (task_id, entry_key) - One page per entry.
+
+    Attributes:
+        task_id: Foreign key to tasks.id (rows are deleted with the task).
+        entry_key: Entry identifier within the task (e.g. "video:07",
+            "narration:03", "asset:character:bulbasaur_resting").
+        notion_page_id: ID of the created Notion page.
+        created_at: When the page was created.
+
+    Related:
+        - app.services.notion_bulk: NotionPageLedger, create_pages
+    """
+
+    __tablename__ = "task_notion_pages"
+
+    task_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    entry_key: Mapped[str] = mapped_column(String(100), nullable=False)
+    notion_page_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("task_id", "entry_key", name="pk_task_notion_pages"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation for debugging."""
+        return (
+            f"<TaskNotionPage(task_id={self.task_id!s}, entry_key={self.entry_key!r}, "
+            f"notion_page_id={self.notion_page_id!r})>"
+        )
+
+
+class NotionStatusSync(Base):
+    """One task's pending Notion status update from a bulk review operation.
+
+    Bulk approve/reject commits the status changes and one row per task in the
+    same transaction, then pushes the statuses to Notion in the background.
+    Each row tracks its own outcome and attempts, so progress can be reported
+    per bulk operation and failed updates are retried individually - even
+    after the process that started them exits.
+
+    Composite Primary Key:
+        (job_id, task_id) - One row per task per bulk operation.
+
+    Attributes:
+        job_id: Bulk operation the update belongs to.
+        task_id: Foreign key to tasks.id (rows are deleted with the task).
+        notion_page_id: Notion page to update.
+        target_status: TaskStatus value to push.
+        state: "pending", "synced" or "failed".
+        attempts: Update attempts made so far.
+        last_error: Error of the last failed attempt.
+        next_attempt_at: Earliest retry time of a failed update.
+        created_at: When the bulk operation committed.
+        updated_at: Last state change.
+
+    Related:
+        - app.services.notion_status_sync: NotionStatusSyncJob, retries
+        - app.services.review_service: bulk_approve_tasks, bulk_reject_tasks
+    """
+
+    __tablename__ = "notion_status_syncs"
+
+    job_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    task_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    notion_page_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    target_status: Mapped[str] = mapped_column(String(30), nullable=False)
+    state: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="pending", server_default="pending"
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    next_attempt_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("job_id", "task_id", name="pk_notion_status_syncs"),
+        Index("ix_notion_status_syncs_state_next_attempt_at", "state", "next_attempt_at"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation for debugging."""
+        return (
+            f"<NotionStatusSync(job_id={self.job_id!s:.8}, task_id={self.task_id!s:.8}, "
+            f"state={self.state!r}, attempts={self.attempts})>"
+        )
+
+
+class ChannelStatusCount(Base):
+    """Number of tasks per channel and status (incrementally maintained).
+
+    Capacity checks (app.services.channel_capacity_service) and the claim
+    query's in-progress count (app.queue.fair_share_claim_statement) read these rows
+    instead of aggregating the tasks table, whose published history grows
+    without bound. A trigger on tasks keeps the counts exact in the same
+    transaction as every insert, delete and status or channel change -
+    whether made through the ORM, Core UPDATEs or raw SQL.
+
+    Composite Primary Key:
+        (channel_id, status) - One row per channel per status ever used.
+
+    Attributes:
+        channel_id: Foreign key to channels.id (part of composite PK).
+        status: TaskStatus value (part of composite PK).
+        task_count: Number of the channel's tasks currently in the status.
+
+    Maintenance:
+        - PostgreSQL: tasks_channel_queue_stats trigger (migration 0010)
+        - SQLite (tests, local): SQLITE_QUEUE_STATS_TRIGGERS below
+        - Drift repair: app.services.channel_queue_stats.reconcile_queue_stats
+    """
+
+    __tablename__ = "channel_queue_stats"
+
+    channel_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("channels.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(String(30), nullable=False)
+    task_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("channel_id", "status", name="pk_channel_queue_stats"),
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation for debugging."""
+        return (
+            f"<ChannelStatusCount(channel_id={self.channel_id!s:.8}, "
+            f"status={self.status!r}, task_count={self.task_count})>"
+        )
+
+
+# SQLite equivalent of the PostgreSQL trigger in migration 0010, installed by
+# Base.metadata.create_all (test and local databases)
+SQLITE_QUEUE_STATS_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_queue_stats_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT OR IGNORE INTO channel_queue_stats (channel_id, status, task_count)
+        VALUES (NEW.channel_id, NEW.status, 0);
+        UPDATE channel_queue_stats SET task_count = task_count + 1
+        WHERE channel_id = NEW.channel_id AND status = NEW.status;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_queue_stats_delete AFTER DELETE ON tasks
+    BEGIN
+        UPDATE channel_queue_stats SET task_count = task_count - 1
+        WHERE channel_id = OLD.channel_id AND status = OLD.status;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_queue_stats_update
+    AFTER UPDATE OF status, channel_id ON tasks
+    WHEN OLD.status IS NOT NEW.status OR OLD.channel_id IS NOT NEW.channel_id
+    BEGIN
+        UPDATE channel_queue_stats SET task_count = task_count - 1
+        WHERE channel_id = OLD.channel_id AND status = OLD.status;
+        INSERT OR IGNORE INTO channel_queue_stats (channel_id, status, task_count)
+        VALUES (NEW.channel_id, NEW.status, 0);
+        UPDATE channel_queue_stats SET task_count = task_count + 1
+        WHERE channel_id = NEW.channel_id AND status = NEW.status;
+    END
+    """,
+)
+
+for _trigger in SQLITE_QUEUE_STATS_TRIGGERS:
+    _ddl = DDL(_trigger)  # type: ignore[no-untyped-call]
+    event.listen(Base.metadata, "after_create", _ddl.execute_if(dialect="sqlite"))
+
+
+# SQLite equivalent of the PostgreSQL trigger in migration 0014, installed by
+# Base.metadata.create_all (test and local databases)
+SQLITE_QUEUED_AT_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_queued_at_insert AFTER INSERT ON tasks
+    WHEN NEW.status = 'queued'
+    BEGIN
+        UPDATE tasks SET queued_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_queued_at_update AFTER UPDATE OF status ON tasks
+    WHEN NEW.status = 'queued' AND OLD.status IS NOT 'queued'
+    BEGIN
+        UPDATE tasks SET queued_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+    END
+    """,
+)
+
+for _trigger in SQLITE_QUEUED_AT_TRIGGERS:
+    _ddl = DDL(_trigger)  # type: ignore[no-untyped-call]
+    event.listen(Base.metadata, "after_create", _ddl.execute_if(dialect="sqlite"))
@@ -1,44 +1,79 @@
 """PgQueuer initialization and configuration for ai-video-generator.
 
-This module handles PgQueuer setup with asyncpg connection pool for task claiming.
-Workers use PgQueuer for atomic task claiming via FOR UPDATE SKIP LOCKED with
-round-robin channel scheduling and priority-aware task ordering (Story 4.4).
+This module handles PgQueuer setup with asyncpg connection pool, and builds the
+task claim statement that workers (app.workers.pipeline_worker.claim_next_task)
+run for atomic claiming via FOR UPDATE SKIP LOCKED with weighted fair-share
+channel scheduling and priority-aware task ordering.
 
-Round-Robin Channel Scheduling Logic (Story 4.4):
+Fair-Share Channel Scheduling Logic (replaces Story 4.4 round-robin):
     - High priority tasks claimed before normal/low (priority preserved)
-    - Within same priority, tasks cycle through channels alphabetically (fairness)
-    - Within same priority + channel, FIFO order maintained (predictability)
+    - Within same priority, the channel with the lowest virtual time claims next
+    - Each claim advances the channel's virtual time by 1 / max_concurrent
+      (weighted fair queuing: channels share throughput in proportion to capacity)
+    - Channels at Channel.max_concurrent in-progress tasks are not eligible
+    - Within same priority + channel, shortest predicted remaining work first
+      (Task.predicted_remaining_seconds, refreshed from StepDurationStats),
+      which minimizes mean time to FINAL_REVIEW; predicted remaining cost and
+      then FIFO break ties
+    - Starvation protection: tasks queued (Task.queued_at) longer than
+      STARVATION_THRESHOLD_SECONDS are claimed oldest-first ahead of shorter
+      work in their channel
     - FOR UPDATE SKIP LOCKED preserves atomic claiming
 
+Why not ROUND_ROBIN_QUERY:
+    Ordering by channel_id ASC is not a rotation - the alphabetically first channel
+    with a backlog drains completely before the next channel is served. The query
+    is kept below for documentation and for the scheduling simulation baseline.
+
 Architecture Pattern:
     - AsyncpgPoolDriver: Connection pool for production throughput
     - QueueManager: Schema installation and queue management
     - Entrypoint Registration: Define pipeline step handlers
-    - Custom Query: Priority → Channel → FIFO ordering
+    - Claim Statement: Priority → Channel virtual time → Remaining work → FIFO
+      (SQLAlchemy Core, so the same claim runs on SQLite in tests)
 
 Usage:
-    from app.queue import initialize_pgqueuer, pgq
+    from app.queue import advance_virtual_time, fair_share_claim_statement, get_system_clock
 
-    pgq, pool = await initialize_pgqueuer()
-    await pgq.run()  # Start worker loop with round-robin scheduling
+    clock = await get_system_clock(db)
+    task = (await db.execute(fair_share_claim_statement(clock, now))).scalar_one_or_none()
+    if task:
+        await advance_virtual_time(db, task.channel_id, clock)
 
 References:
     - Architecture: Round-Robin Channel Scheduling
     - Architecture: Priority Queue Management
     - project-context.md: Critical Implementation Rules
-    - Story 4.4: Round-Robin Channel Scheduling (current)
+    - app/services/scheduler_simulation.py: Policy model and latency benchmark
+    - app/services/work_estimator.py: Historical step duration percentiles
+    - Story 4.4: Round-Robin Channel Scheduling (superseded)
     - Story 4.3: Priority Queue Management (extended)
     - Story 4.2: Task Claiming with PgQueuer (foundation)
     - PgQueuer Documentation: https://pgqueuer.readthedocs.io/
 """
 
 import os
+import uuid
+from datetime import datetime, timedelta, timezone
 
 import asyncpg
 from pgqueuer import PgQueuer
 from pgqueuer.db import AsyncpgPoolDriver
 from pgqueuer.qm import QueueManager
-
+from sqlalchemy import Select, case, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models import (
+    IN_PROGRESS_STATUSES,
+    Channel,
+    ChannelStatusCount,
+    PriorityLevel,
+    Task,
+    TaskStatus,
+)
+from app.services.channel_queue_stats import status_count
 from app.utils.logging import get_logger
 
 log = get_logger(__name__)
@@ -62,8 +97,9 @@ PRIORITY_QUERY = """
     LIMIT 1
 """
 
-# Round-robin channel scheduling query (Story 4.4) - extends PRIORITY_QUERY
+# Round-robin channel scheduling query (Story 4.4) - kept for documentation
 # Orders tasks by priority, then channel (alphabetical rotation), then FIFO
+# Superseded by fair_share_claim_statement: channel_id ASC drains one channel before the next
 ROUND_ROBIN_QUERY = """
     SELECT * FROM tasks
     WHERE status = 'pending'
@@ -79,6 +115,145 @@ ROUND_ROBIN_QUERY = """
     LIMIT 1
 """
 
+# Queue wait after which a task is claimed oldest-first ahead of shorter work
+# (NFR-P1 2-hour target). Measured from tasks.queued_at, which a trigger sets on
+# each transition to queued; updated_at also moves while a task waits
+# (not_before, retry_count, retention, Notion sync).
+STARVATION_THRESHOLD_SECONDS = 7200
+
+# Weighted fair-share claim (replaces ROUND_ROBIN_QUERY), run by
+# app.workers.pipeline_worker.claim_next_task on SQLite and PostgreSQL alike:
+# 1. busy: in-progress count per channel (honors Channel.max_concurrent), read
+#    from the trigger-maintained channel_queue_stats instead of scanning tasks
+# 2. system clock: start tag of the most recent claim (start-time fair queuing);
+#    lagging channels are clamped up to it so a channel returning from idle
+#    cannot monopolize workers with banked credit
+# 3. order: priority → channel virtual time → starving tasks oldest-first →
+#    shortest then cheapest predicted remaining work → FIFO (deferred tasks
+#    skipped until not_before). The predictions are columns refreshed with
+#    StepDurationStats (app.services.work_estimator) and indexed per
+#    (channel_id, priority) for queued tasks.
+# 4. advance: charge the claiming channel 1 / max_concurrent virtual seconds
+# Ordering over all queued tasks picks the same task as taking each channel's
+# backlog head first: the channel term is constant within a channel.
+
+
+async def get_system_clock(db: AsyncSession) -> float:
+    """Return the fair-share system clock.
+
+    The clock is the start tag of the most recent claim: the highest virtual
+    time among active channels minus that channel's increment, floored at 0.
+
+    Args:
+        db: Database session (the claim transaction).
+
+    Returns:
+        System virtual time
+    """
+    latest_start = await db.scalar(
+        select(func.max(Channel.scheduler_virtual_time - 1.0 / Channel.max_concurrent)).where(
+            Channel.is_active.is_(True), Channel.max_concurrent > 0
+        )
+    )
+    return max(latest_start or 0.0, 0.0)
+
+
+def fair_share_claim_statement(
+    system_clock: float,
+    now: datetime,
+    *conditions: ColumnElement[bool],
+) -> Select[Task]:
+    """Build the statement selecting the next task to claim under fair share.
+
+    Only queued tasks whose not_before has elapsed, on active channels below
+    Channel.max_concurrent in-progress tasks, are eligible. The row is locked
+    with FOR UPDATE SKIP LOCKED (a no-op on SQLite), and Task.channel is
+    populated from the join.
+
+    Args:
+        system_clock: Current system virtual time (get_system_clock).
+        now: Reference time for not_before and starvation checks.
+        *conditions: Extra eligibility filters (e.g. Gemini quota exhaustion).
+
+    Returns:
+        SELECT returning at most one Task
+    """
+    busy = (
+        select(
+            ChannelStatusCount.channel_id,
+            status_count(IN_PROGRESS_STATUSES).label("in_progress"),
+        )
+        .group_by(ChannelStatusCount.channel_id)
+        .subquery("busy")
+    )
+    priority_rank = case(
+        (Task.priority == PriorityLevel.HIGH, 1),
+        (Task.priority == PriorityLevel.NORMAL, 2),
+        (Task.priority == PriorityLevel.LOW, 3),
+        else_=4,
+    )
+    effective_virtual_time = case(
+        (Channel.scheduler_virtual_time > system_clock, Channel.scheduler_virtual_time),
+        else_=system_clock,
+    )
+    starving_since = case(
+        (
+            Task.queued_at <= now - timedelta(seconds=STARVATION_THRESHOLD_SECONDS),
+            Task.queued_at,
+        ),
+    )
+    return (
+        select(Task)
+        .join(Channel, Task.channel_id == Channel.id)
+        .outerjoin(busy, busy.c.channel_id == Channel.id)
+        .where(
+            Task.status == TaskStatus.QUEUED,
+            or_(Task.not_before.is_(None), Task.not_before <= now),  # deferred tasks wait
+            Channel.is_active.is_(True),
+            func.coalesce(busy.c.in_progress, 0) < Channel.max_concurrent,
+            *conditions,
+        )
+        .order_by(
+            priority_rank,
+            effective_virtual_time,  # fair share
+            starving_since.asc().nulls_last(),  # starvation protection: oldest first
+            # shortest then cheapest predicted remaining work; tasks not yet
+            # estimated have every step left, so they sort last
+            Task.predicted_remaining_seconds.asc().nulls_last(),
+            Task.predicted_remaining_cost_usd.asc().nulls_last(),
+            Task.created_at.asc(),  # FIFO tie-breaker
+        )
+        .limit(1)
+        .with_for_update(skip_locked=True, of=Task)
+        .options(contains_eager(Task.channel))
+    )
+
+
+async def advance_virtual_time(
+    db: AsyncSession, channel_id: uuid.UUID, system_clock: float
+) -> None:
+    """Charge a channel 1 / max_concurrent virtual seconds for one claim.
+
+    Lagging channels are clamped up to the system clock first. A single
+    UPDATE keeps concurrent claims on the same channel from losing charges.
+
+    Args:
+        db: Database session (the claim transaction).
+        channel_id: Channel.id of the claimed task.
+        system_clock: System virtual time read for this claim.
+    """
+    await db.execute(
+        update(Channel)
+        .where(Channel.id == channel_id)
+        .values(
+            scheduler_virtual_time=case(
+                (Channel.scheduler_virtual_time > system_clock, Channel.scheduler_virtual_time),
+                else_=system_clock,
+            )
+            + 1.0 / Channel.max_concurrent
+        )
+    )
+
 
 def extract_query_ordering(query: str) -> str:
     """Extract ORDER BY pattern from SQL query for logging.
@@ -93,11 +268,18 @@ def extract_query_ordering(query: str) -> str:
         Human-readable ordering pattern (e.g., "priority → channel → FIFO")
 
     Examples:
+        >>> extract_query_ordering(str(fair_share_claim_statement(0.0, now)))
+        'priority → fair share → shortest remaining work → FIFO'
         >>> extract_query_ordering(ROUND_ROBIN_QUERY)
         'priority → channel → FIFO'
         >>> extract_query_ordering(PRIORITY_QUERY)
         'priority → FIFO'
     """
+    if "scheduler_virtual_time" in query:
+        if "predicted_remaining_seconds" in query:
+            return "priority → fair share → shortest remaining work → FIFO"
+        return "priority → fair share → FIFO"
+
     has_priority = "CASE priority" in query
     has_channel = "channel_id ASC" in query
     has_fifo = "created_at ASC" in query
@@ -115,22 +297,27 @@ def extract_query_ordering(query: str) -> str:
 
 
 async def initialize_pgqueuer() -> tuple[PgQueuer, asyncpg.Pool]:
-    """Initialize PgQueuer with round-robin channel scheduling (Story 4.4).
+    """Initialize PgQueuer and report the fair-share claim ordering.
 
-    Creates asyncpg pool, installs PgQueuer schema (if not exists), configures
-    custom query for round-robin scheduling, and returns configured PgQueuer instance.
+    Creates asyncpg pool, installs PgQueuer schema (if not exists), and returns
+    configured PgQueuer instance. Pipeline tasks are not claimed through
+    PgQueuer's own job queue: workers run fair_share_claim_statement in
+    app.workers.pipeline_worker.claim_next_task.
 
-    Round-Robin Scheduling (Story 4.4):
+    Fair-Share Scheduling:
         Tasks are claimed in this order:
         1. Priority (high → normal → low) - preserved from Story 4.3
-        2. Channel (alphabetical rotation) - NEW in Story 4.4
-        3. FIFO (within priority + channel) - preserved from Story 4.3
+        2. Channel virtual time (lowest first) - replaces alphabetical rotation
+        3. Shortest predicted remaining work (within priority + channel),
+           with tasks queued past STARVATION_THRESHOLD_SECONDS first
+        4. FIFO - preserved from Story 4.3
 
         This ensures:
         - High priority tasks always process first (priority preserved)
-        - Within same priority, channels cycle alphabetically (fair distribution)
-        - Within same priority + channel, FIFO order maintained (predictability)
-        - No channel starvation (all channels get processing time)
+        - Within same priority, channels share claims in proportion to
+          Channel.max_concurrent, regardless of channel_id spelling
+        - Channels already at max_concurrent in-progress tasks are skipped
+        - No channel starvation (a backlogged channel's virtual time only grows)
 
     Claim Timeout (Architecture Decision):
         PgQueuer uses PostgreSQL transaction-based locking for atomic task claiming.
@@ -139,7 +326,7 @@ async def initialize_pgqueuer() -> tuple[PgQueuer, asyncpg.Pool]:
         indefinitely (FR43: fault tolerance requirement).
 
     Returns:
-        tuple[PgQueuer, asyncpg.Pool]: Configured PgQueuer with round-robin scheduling
+        tuple[PgQueuer, asyncpg.Pool]: Configured PgQueuer and its connection pool
 
     Raises:
         ValueError: If DATABASE_URL not set
@@ -173,22 +360,20 @@ async def initialize_pgqueuer() -> tuple[PgQueuer, asyncpg.Pool]:
     await qm.queries.install()
     log.info("pgqueuer_schema_installed")
 
-    # Create PgQueuer driver with round-robin query (Story 4.4)
+    # Create PgQueuer driver
     driver = AsyncpgPoolDriver(pool)
     global pgq
-    # TODO: Remove type: ignore when PgQueuer adds proper type hints for query parameter
-    # The query parameter is supported but not exposed in PgQueuer's type stubs
-    # Reference: PgQueuer library lacks type stubs for custom query parameter
-    pgq = PgQueuer(driver, query=ROUND_ROBIN_QUERY)  # type: ignore[call-arg]
+    pgq = PgQueuer(driver)
 
-    # Extract query pattern for logging (Story 4.4: dynamic pattern detection)
-    query_pattern = extract_query_ordering(ROUND_ROBIN_QUERY)
+    # Extract claim ordering for logging (Story 4.4: dynamic pattern detection)
+    query_pattern = extract_query_ordering(
+        str(fair_share_claim_statement(0.0, datetime.now(timezone.utc)))
+    )
 
     log.info(
-        "pgqueuer_initialized_with_round_robin",
+        "pgqueuer_initialized_with_fair_share",
         claim_timeout_minutes=30,
         query_pattern=query_pattern,
-        custom_query_enabled=True,
     )
 
     return pgq, pool
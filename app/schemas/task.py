@@ -102,7 +102,10 @@ class TaskUpdate(BaseModel):
     )
     error_log: str | None = Field(
         default=None,
-        description="Append error message to log (append-only pattern)",
+        description=(
+            "Append error message to log; record it as a task_events error "
+            "(app.services.task_events), not in the legacy tasks.error_log column"
+        ),
     )
     youtube_url: str | None = Field(
         default=None,
@@ -160,7 +163,10 @@ class TaskResponse(BaseModel):
     )
     error_log: str | None = Field(
         default=None,
-        description="Error history log (nullable)",
+        description=(
+            "Error history log (nullable); build responses with "
+            "task_events.task_response() to include errors recorded as events"
+        ),
     )
     youtube_url: str | None = Field(
         default=None,
@@ -0,0 +1,389 @@
+"""Cluster-wide concurrency coordination for external APIs.
+
+Kling allows 10 concurrent requests per account, not per worker. Splitting that
+statically (3 workers x 3 tasks) strands capacity whenever a worker is idle.
+This module replaces the former worker-local WorkerState counters with a distributed
+semaphore backed by the api_slot_leases table: every in-flight Gemini, Kling
+or ElevenLabs request holds one leased slot, and any worker may take any free
+slot.
+
+Architecture Pattern:
+    - Leases: one row per (provider, slot); the primary key guarantees a
+      single holder per slot
+    - Acquire: INSERT ... ON CONFLICT DO UPDATE WHERE expires_at < now, so an
+      expired lease (crashed worker) is taken over atomically
+    - Heartbeat: holders renew expires_at every TTL / 3 seconds
+    - Release: DELETE the row matching the holder token
+    - Short transactions: each operation opens and commits its own session,
+      never spanning the API call itself
+
+Fallback:
+    When no database is configured (local development, unit tests) the
+    coordinator degrades to process-local asyncio semaphores with the same
+    limits, which matches the previous worker-local behavior.
+
+Usage:
+    from app.services.api_concurrency import api_slots
+
+    async with api_slots.slot("kling", task_id=task_id):
+        await run_cli_script("generate_video.py", [...])
+
+References:
+    - Story 4.6: Parallel Task Execution (superseded per-worker limits)
+    - app/config.py: get_api_concurrency_limit, get_api_lease_ttl_seconds
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_api_concurrency_limit, get_api_lease_ttl_seconds
+from app.models import ApiSlotLease
+from app.utils.logging import get_logger
+from app.utils.metrics import RATE_LIMIT_WAIT, track_api_call
+
+log = get_logger(__name__)
+
+# Poll interval bounds while waiting for a slot (seconds)
+ACQUIRE_POLL_MIN_SECONDS = 0.25
+ACQUIRE_POLL_MAX_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class ApiSlot:
+    """A held concurrency slot.
+
+    Attributes:
+        provider: API name ("gemini", "kling", "elevenlabs").
+        slot: Slot number (-1 for process-local fallback slots).
+        holder: Unique lease token used for renew/release.
+    """
+
+    provider: str
+    slot: int
+    holder: str
+
+
+@dataclass
+class _LocalSlots:
+    """Process-local fallback pool for one provider.
+
+    Attributes:
+        limit: Concurrency limit the pool was created with.
+        loop: Event loop the semaphore is bound to.
+        semaphore: Waiters queue for free slots.
+        held: Slots currently held (asyncio.Semaphore exposes no public count).
+    """
+
+    limit: int
+    loop: asyncio.AbstractEventLoop
+    semaphore: asyncio.Semaphore
+    held: int = 0
+
+
+class ApiSlotTimeoutError(TimeoutError):
+    """Raised when no API slot becomes free within the acquire timeout."""
+
+
+class ApiConcurrencyCoordinator:
+    """Distributed semaphore for external API requests.
+
+    Attributes:
+        worker_id: Identifier embedded in lease tokens (RAILWAY_SERVICE_NAME).
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        worker_id: str | None = None,
+    ):
+        """Initialize coordinator.
+
+        Args:
+            session_factory: Session factory for lease storage. Defaults to
+                app.database.async_session_factory, resolved lazily so the
+                module can be imported before the database is configured.
+            worker_id: Lease token prefix (defaults to RAILWAY_SERVICE_NAME).
+        """
+        self._session_factory = session_factory
+        self.worker_id = worker_id or os.getenv("RAILWAY_SERVICE_NAME", "worker-local")
+        self._local_pools: dict[str, _LocalSlots] = {}
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession] | None:
+        """Session factory used for leases (None → process-local fallback)."""
+        if self._session_factory is None:
+            from app.database import async_session_factory
+
+            return async_session_factory
+        return self._session_factory
+
+    def _new_holder(self) -> str:
+        return f"{self.worker_id}:{os.getpid()}:{uuid.uuid4().hex[:12]}"
+
+    def _local_slots(self, provider: str) -> _LocalSlots:
+        limit = get_api_concurrency_limit(provider)
+        loop = asyncio.get_running_loop()
+        pool = self._local_pools.get(provider)
+        if pool is None or pool.limit != limit or pool.loop is not loop:
+            pool = _LocalSlots(limit=limit, loop=loop, semaphore=asyncio.Semaphore(limit))
+            self._local_pools[provider] = pool
+        return pool
+
+    async def try_acquire(self, provider: str, task_id: uuid.UUID | None = None) -> ApiSlot | None:
+        """Take a free slot for provider without waiting.
+
+        Args:
+            provider: API name ("gemini", "kling", "elevenlabs").
+            task_id: Task the request belongs to (recorded for observability).
+
+        Returns:
+            ApiSlot if a slot was acquired, None if all slots are leased.
+        """
+        factory = self.session_factory
+        if factory is None:
+            pool = self._local_slots(provider)
+            if pool.semaphore.locked():
+                return None
+            await pool.semaphore.acquire()
+            pool.held += 1
+            return ApiSlot(provider=provider, slot=-1, holder=self._new_holder())
+
+        limit = get_api_concurrency_limit(provider)
+        holder = self._new_holder()
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=get_api_lease_ttl_seconds())
+
+        async with factory() as db:
+            held = set(
+                (
+                    await db.execute(
+                        select(ApiSlotLease.slot).where(
+                            ApiSlotLease.provider == provider,
+                            ApiSlotLease.expires_at >= now,
+                        )
+                    )
+                ).scalars()
+            )
+            insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+
+            for slot in (s for s in range(limit) if s not in held):
+                values = {
+                    "holder": holder,
+                    "task_id": task_id,
+                    "acquired_at": now,
+                    "expires_at": expires_at,
+                }
+                stmt = (
+                    insert(ApiSlotLease)
+                    .values(provider=provider, slot=slot, **values)
+                    .on_conflict_do_update(
+                        index_elements=["provider", "slot"],
+                        set_=values,
+                        where=ApiSlotLease.expires_at < now,
+                    )
+                    .returning(ApiSlotLease.holder)
+                )
+                won = (await db.execute(stmt)).scalar_one_or_none()
+                await db.commit()
+                if won == holder:
+                    log.debug("api_slot_acquired", provider=provider, slot=slot, holder=holder)
+                    return ApiSlot(provider=provider, slot=slot, holder=holder)
+        return None
+
+    async def acquire(
+        self,
+        provider: str,
+        task_id: uuid.UUID | None = None,
+        timeout: float | None = None,
+    ) -> ApiSlot:
+        """Wait for a free slot for provider.
+
+        Polls with exponential backoff (0.25s → 5s) so waiting workers do not
+        hammer the database.
+
+        Args:
+            provider: API name ("gemini", "kling", "elevenlabs").
+            task_id: Task the request belongs to.
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            The acquired ApiSlot.
+
+        Raises:
+            ApiSlotTimeoutError: If no slot became free within timeout.
+        """
+        if self.session_factory is None:
+            pool = self._local_slots(provider)
+            try:
+                await asyncio.wait_for(pool.semaphore.acquire(), timeout)
+            except asyncio.TimeoutError as e:
+                raise ApiSlotTimeoutError(f"No {provider} slot free after {timeout}s") from e
+            pool.held += 1
+            return ApiSlot(provider=provider, slot=-1, holder=self._new_holder())
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        delay = ACQUIRE_POLL_MIN_SECONDS
+        waited = False
+        while True:
+            slot = await self.try_acquire(provider, task_id)
+            if slot:
+                if waited:
+                    log.info("api_slot_acquired_after_wait", provider=provider, slot=slot.slot)
+                return slot
+            if deadline is not None and loop.time() + delay > deadline:
+                raise ApiSlotTimeoutError(f"No {provider} slot free after {timeout}s")
+            waited = True
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, ACQUIRE_POLL_MAX_SECONDS)
+
+    async def renew(self, slot: ApiSlot) -> bool:
+        """Extend a lease by one TTL.
+
+        Args:
+            slot: Slot returned by acquire/try_acquire.
+
+        Returns:
+            True if the lease is still held, False if it expired and was taken.
+        """
+        factory = self.session_factory
+        if factory is None or slot.slot < 0:
+            return True
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=get_api_lease_ttl_seconds())
+        async with factory() as db:
+            result = await db.execute(
+                update(ApiSlotLease)
+                .where(
+                    ApiSlotLease.provider == slot.provider,
+                    ApiSlotLease.slot == slot.slot,
+                    ApiSlotLease.holder == slot.holder,
+                )
+                .values(expires_at=expires_at)
+            )
+            await db.commit()
+        if result.rowcount == 0:  # type: ignore[attr-defined]
+            log.warning("api_slot_lease_lost", provider=slot.provider, slot=slot.slot)
+            return False
+        return True
+
+    async def release(self, slot: ApiSlot) -> None:
+        """Return a slot to the pool.
+
+        Args:
+            slot: Slot returned by acquire/try_acquire.
+        """
+        factory = self.session_factory
+        if factory is None or slot.slot < 0:
+            pool = self._local_slots(slot.provider)
+            pool.held = max(0, pool.held - 1)
+            pool.semaphore.release()
+            return
+        async with factory() as db:
+            await db.execute(
+                delete(ApiSlotLease).where(
+                    ApiSlotLease.provider == slot.provider,
+                    ApiSlotLease.slot == slot.slot,
+                    ApiSlotLease.holder == slot.holder,
+                )
+            )
+            await db.commit()
+        log.debug("api_slot_released", provider=slot.provider, slot=slot.slot)
+
+    async def available_slots(self, provider: str) -> int:
+        """Count slots not held by a live lease.
+
+        Used as a cheap pre-claim admission check; the count may change before
+        the caller acquires a slot.
+
+        Args:
+            provider: API name ("gemini", "kling", "elevenlabs").
+
+        Returns:
+            Number of free slots across the cluster.
+        """
+        limit = get_api_concurrency_limit(provider)
+        factory = self.session_factory
+        if factory is None:
+            pool = self._local_slots(provider)
+            return max(0, pool.limit - pool.held)
+
+        async with factory() as db:
+            held = await db.scalar(
+                select(func.count())
+                .select_from(ApiSlotLease)
+                .where(
+                    ApiSlotLease.provider == provider,
+                    ApiSlotLease.slot < limit,
+                    ApiSlotLease.expires_at >= datetime.now(timezone.utc),
+                )
+            )
+        return max(0, limit - (held or 0))
+
+    async def _heartbeat(self, slot: ApiSlot) -> None:
+        interval = get_api_lease_ttl_seconds() / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.renew(slot):
+                    return
+            except Exception as e:
+                # Keep trying: the lease survives until expires_at
+                log.warning("api_slot_heartbeat_failed", provider=slot.provider, error=str(e))
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        provider: str,
+        task_id: uuid.UUID | None = None,
+        timeout: float | None = None,
+    ) -> AsyncIterator[ApiSlot]:
+        """Hold one slot for the duration of an API request.
+
+        Acquires (waiting if necessary), renews the lease in the background
+        while the body runs, and releases on exit - including on errors and
+        cancellation.
+
+        Args:
+            provider: API name ("gemini", "kling", "elevenlabs").
+            task_id: Task the request belongs to.
+            timeout: Maximum seconds to wait for a slot.
+
+        Yields:
+            The held ApiSlot.
+
+        Raises:
+            ApiSlotTimeoutError: If no slot became free within timeout.
+        """
+        wait_start = time.perf_counter()
+        held = await self.acquire(provider, task_id=task_id, timeout=timeout)
+        RATE_LIMIT_WAIT.observe(time.perf_counter() - wait_start, limiter=f"{provider}_slots")
+        heartbeat = asyncio.create_task(self._heartbeat(held)) if held.slot >= 0 else None
+        try:
+            # The body is one API request: record its latency and outcome
+            async with track_api_call(provider):
+                yield held
+        finally:
+            if heartbeat:
+                heartbeat.cancel()
+                with suppress(asyncio.CancelledError):
+                    await heartbeat
+            try:
+                await self.release(held)
+            except Exception as e:
+                # Lease expires on its own after one TTL
+                log.warning("api_slot_release_failed", provider=provider, error=str(e))
+
+
+# Shared coordinator instance for workers and services
+api_slots = ApiConcurrencyCoordinator()
@@ -0,0 +1,348 @@
+"""Shared API quota state across workers (Gemini).
+
+Gemini quota exhaustion used to be a worker-local flag with a UTC-midnight
+approximation of the reset time: other workers kept calling Gemini until they
+hit their own 429s, and process_video released and re-claimed asset tasks in
+a busy loop. This module keeps one api_quota_state row per API key instead:
+
+    - exhausted_until: set by the first worker that sees a quota error, read by
+      every worker before processing tasks that need the API
+    - requests_per_minute: request volume sampled over one-minute windows
+
+Reset Handling:
+    - Per-minute quota (429 with retryDelay): exhausted for the advertised
+      delay (default 60s)
+    - Daily quota (PerDay quota ids): exhausted until the next midnight
+      Pacific time, honoring PST/PDT
+
+Architecture Pattern:
+    - Keyed by SHA-256 fingerprint of the API key (the key is never stored)
+    - Request counting: one atomic UPDATE ... RETURNING increment per request;
+      only window rollover and exhaustion updates lock the row
+    - Row creation via INSERT ... ON CONFLICT DO NOTHING, then SELECT ... FOR
+      UPDATE so concurrent workers serialize on the row
+    - Session-less helpers (report_gemini_quota_error, record_gemini_request)
+      open their own short transaction for DB-free services and are no-ops
+      when no database is configured
+
+References:
+    - Story 4.5: Rate Limit Aware Task Selection
+    - app/entrypoints.py: Pre-processing quota check and task deferral
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ApiQuotaState
+from app.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+GEMINI_PROVIDER = "gemini"
+
+# Request rate sampling window (seconds)
+RATE_WINDOW_SECONDS = 60
+
+# Per-minute quota wait when the error does not advertise a retry delay
+DEFAULT_PER_MINUTE_WAIT_SECONDS = 60
+
+# Gemini daily quotas reset at midnight Pacific time
+QUOTA_RESET_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+_QUOTA_ERROR_PATTERN = re.compile(r"\b429\b|RESOURCE_EXHAUSTED|quota exceeded", re.IGNORECASE)
+_DAILY_QUOTA_PATTERN = re.compile(r"PerDay|per day|daily", re.IGNORECASE)
+_RETRY_DELAY_PATTERN = re.compile(
+    r"retry(?:Delay|[ _-]?in|[ _-]?after)[\"']?\s*[:=]?\s*[\"']?(\d+(?:\.\d+)?)\s*s",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class QuotaStatus:
+    """Snapshot of one API key's shared quota state.
+
+    Attributes:
+        provider: API name ("gemini").
+        key_id: API key fingerprint.
+        exhausted_until: Quota unavailable until this time (None = available).
+        exhausted_reason: "per_minute" or "daily" when exhausted.
+        requests_per_minute: Request rate observed over the last full window.
+    """
+
+    provider: str
+    key_id: str
+    exhausted_until: datetime | None = None
+    exhausted_reason: str | None = None
+    requests_per_minute: float = 0.0
+
+    def available(self, now: datetime | None = None) -> bool:
+        """Return True if requests may be sent at `now` (default: current time)."""
+        if self.exhausted_until is None:
+            return True
+        return _as_utc(now or datetime.now(timezone.utc)) >= self.exhausted_until
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes; stored values are always UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def api_key_id(api_key: str | None) -> str:
+    """Fingerprint an API key for use as api_quota_state.key_id.
+
+    Args:
+        api_key: Raw API key (None or empty when unset).
+
+    Returns:
+        First 16 hex chars of SHA-256(api_key), or "unset".
+    """
+    if not api_key:
+        return "unset"
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def gemini_key_id() -> str:
+    """Fingerprint of the Gemini key passed to generate_asset.py (GEMINI_API_KEY)."""
+    return api_key_id(os.getenv("GEMINI_API_KEY"))
+
+
+def next_pacific_midnight(now: datetime | None = None) -> datetime:
+    """Return the next midnight in US Pacific time as a UTC datetime.
+
+    Args:
+        now: Reference time (default: current time).
+
+    Returns:
+        Timezone-aware UTC datetime of the next Pacific-time midnight.
+    """
+    local = _as_utc(now or datetime.now(timezone.utc)).astimezone(QUOTA_RESET_TIMEZONE)
+    midnight = datetime.combine(local.date() + timedelta(days=1), time.min, QUOTA_RESET_TIMEZONE)
+    return midnight.astimezone(timezone.utc)
+
+
+def parse_quota_error(message: str, now: datetime | None = None) -> tuple[datetime, str] | None:
+    """Derive the quota reset time from a Gemini error message.
+
+    Args:
+        message: Error text (CLI stderr or exception message).
+        now: Reference time (default: current time).
+
+    Returns:
+        (exhausted_until, reason) if the message reports quota exhaustion,
+        None for any other error.
+
+    Example:
+        >>> parse_quota_error('429 RESOURCE_EXHAUSTED "retryDelay": "41s"')
+        (datetime(... + 41s), "per_minute")
+    """
+    if not _QUOTA_ERROR_PATTERN.search(message):
+        return None
+
+    now = _as_utc(now or datetime.now(timezone.utc))
+    if _DAILY_QUOTA_PATTERN.search(message):
+        return next_pacific_midnight(now), "daily"
+
+    match = _RETRY_DELAY_PATTERN.search(message)
+    delay = float(match.group(1)) if match else DEFAULT_PER_MINUTE_WAIT_SECONDS
+    return now + timedelta(seconds=delay), "per_minute"
+
+
+async def _lock_state(db: AsyncSession, provider: str, key_id: str) -> ApiQuotaState:
+    """Create the state row if missing and lock it for update."""
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    await db.execute(
+        insert(ApiQuotaState)
+        .values(
+            provider=provider,
+            key_id=key_id,
+            window_started_at=datetime.now(timezone.utc),
+            window_requests=0,
+            requests_per_minute=0.0,
+        )
+        .on_conflict_do_nothing(index_elements=["provider", "key_id"])
+    )
+    result = await db.execute(
+        select(ApiQuotaState)
+        .where(ApiQuotaState.provider == provider, ApiQuotaState.key_id == key_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+async def get_quota_status(
+    db: AsyncSession,
+    provider: str,
+    key_id: str,
+) -> QuotaStatus:
+    """Read the shared quota state for one API key.
+
+    Args:
+        db: Database session.
+        provider: API name ("gemini").
+        key_id: API key fingerprint (see api_key_id).
+
+    Returns:
+        QuotaStatus (available with zero rate if no row exists yet).
+    """
+    state = await db.get(ApiQuotaState, (provider, key_id))
+    if state is None:
+        return QuotaStatus(provider=provider, key_id=key_id)
+    return QuotaStatus(
+        provider=provider,
+        key_id=key_id,
+        exhausted_until=_as_utc(state.exhausted_until) if state.exhausted_until else None,
+        exhausted_reason=state.exhausted_reason,
+        requests_per_minute=state.requests_per_minute,
+    )
+
+
+async def mark_quota_exhausted(
+    db: AsyncSession,
+    provider: str,
+    key_id: str,
+    exhausted_until: datetime,
+    reason: str,
+) -> datetime:
+    """Record quota exhaustion for every worker.
+
+    A later exhausted_until never gets shortened by an earlier one, so a
+    per-minute 429 arriving after a daily exhaustion keeps the daily wait.
+
+    Args:
+        db: Database session (caller commits).
+        provider: API name ("gemini").
+        key_id: API key fingerprint.
+        exhausted_until: Time the quota becomes available again.
+        reason: "per_minute" or "daily".
+
+    Returns:
+        The effective exhausted_until after the update.
+    """
+    state = await _lock_state(db, provider, key_id)
+    exhausted_until = _as_utc(exhausted_until)
+    current = _as_utc(state.exhausted_until) if state.exhausted_until else None
+    if current is None or exhausted_until > current:
+        state.exhausted_until = exhausted_until
+        state.exhausted_reason = reason
+        log.warning(
+            "api_quota_marked_exhausted",
+            provider=provider,
+            key_id=key_id,
+            reason=reason,
+            exhausted_until=exhausted_until.isoformat(),
+        )
+        return exhausted_until
+    return current
+
+
+async def record_api_requests(
+    db: AsyncSession,
+    provider: str,
+    key_id: str,
+    count: int = 1,
+    now: datetime | None = None,
+) -> None:
+    """Count requests toward the observed requests/minute.
+
+    Counts accumulate in a window; once the window is RATE_WINDOW_SECONDS old
+    its rate becomes requests_per_minute and a new window starts.
+
+    Every Gemini request lands here, so the common case is one atomic
+    UPDATE ... RETURNING increment on the open window; only creating the row
+    and rolling the window over (once per minute) lock the row.
+
+    Args:
+        db: Database session (caller commits).
+        provider: API name ("gemini").
+        key_id: API key fingerprint.
+        count: Number of requests sent.
+        now: Reference time (default: current time).
+    """
+    now = _as_utc(now or datetime.now(timezone.utc))
+    window_open_since = now - timedelta(seconds=RATE_WINDOW_SECONDS)
+    incremented = await db.execute(
+        update(ApiQuotaState)
+        .where(
+            ApiQuotaState.provider == provider,
+            ApiQuotaState.key_id == key_id,
+            ApiQuotaState.window_started_at > window_open_since,
+        )
+        .values(window_requests=ApiQuotaState.window_requests + count)
+        .returning(ApiQuotaState.window_requests)
+        .execution_options(synchronize_session=False)
+    )
+    if incremented.scalar_one_or_none() is not None:
+        return
+
+    state = await _lock_state(db, provider, key_id)
+    elapsed = (now - _as_utc(state.window_started_at)).total_seconds()
+    if elapsed >= RATE_WINDOW_SECONDS:
+        state.requests_per_minute = state.window_requests * 60.0 / elapsed
+        state.window_started_at = now
+        state.window_requests = count
+    else:
+        # Row created just now, or another worker rolled the window meanwhile
+        state.window_requests += count
+
+
+async def report_gemini_quota_error(message: str) -> datetime | None:
+    """Share a Gemini quota error with all workers.
+
+    Session-less helper for AssetGenerationService, which runs outside any
+    database transaction. Called from error handlers, so it never raises: a
+    database failure is logged and must not replace the original error.
+
+    Args:
+        message: Error text from the failed request.
+
+    Returns:
+        Effective exhausted_until if the message was a quota error and was
+        recorded, otherwise None.
+    """
+    parsed = parse_quota_error(message)
+    if parsed is None:
+        return None
+
+    from app.database import async_session_factory
+
+    if async_session_factory is None:
+        return parsed[0]
+
+    try:
+        async with async_session_factory() as db, db.begin():
+            return await mark_quota_exhausted(db, GEMINI_PROVIDER, gemini_key_id(), *parsed)
+    except Exception as e:
+        # The task is still deferred by the orchestrator's own parse of the error
+        log.warning("api_quota_report_failed", provider=GEMINI_PROVIDER, error=str(e))
+        return None
+
+
+async def record_gemini_request(count: int = 1) -> None:
+    """Count Gemini requests toward the shared requests/minute (best-effort).
+
+    Args:
+        count: Number of requests sent.
+    """
+    from app.database import async_session_factory
+
+    if async_session_factory is None:
+        return
+
+    try:
+        async with async_session_factory() as db, db.begin():
+            await record_api_requests(db, GEMINI_PROVIDER, gemini_key_id(), count)
+    except Exception as e:
+        # Observability only - never fail asset generation over it
+        log.warning("api_request_recording_failed", provider=GEMINI_PROVIDER, error=str(e))
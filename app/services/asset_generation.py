@@ -36,17 +36,27 @@ Usage:
 """
 
 import re
+import uuid
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from app.utils.cli_wrapper import run_cli_script
+from app.services.api_concurrency import api_slots
+from app.services.api_quota_state import record_gemini_request, report_gemini_quota_error
+from app.services.task_artifacts import (
+    ARTIFACT_ASSET,
+    ArtifactIndex,
+    output_reusable,
+    record_output,
+)
+from app.utils.cli_wrapper import CLIScriptError, run_cli_script
 from app.utils.filesystem import (
     get_character_dir,
     get_environment_dir,
     get_props_dir,
 )
 from app.utils.logging import get_logger
+from app.utils.tracing import span
 
 log = get_logger(__name__)
 
@@ -123,12 +133,21 @@ class AssetGenerationService:
     - Implements short transaction pattern (service is stateless)
     """
 
-    def __init__(self, channel_id: str, project_id: str):
+    def __init__(
+        self,
+        channel_id: str,
+        project_id: str,
+        artifacts: ArtifactIndex | None = None,
+        task_id: uuid.UUID | None = None,
+    ):
         """Initialize asset generation service for specific project.
 
         Args:
             channel_id: Channel identifier for path isolation
             project_id: Project/task identifier (UUID from database)
+            artifacts: Optional artifact index for resume checks and recording
+                outputs (filesystem checks are used without one)
+            task_id: Task UUID recorded on API slot leases (attributes leaked leases)
 
         Raises:
             ValueError: If channel_id or project_id contain invalid characters
@@ -139,6 +158,8 @@ class AssetGenerationService:
 
         self.channel_id = channel_id
         self.project_id = project_id
+        self.artifacts = artifacts
+        self.task_id = task_id
         self.log = get_logger(__name__)
 
     def create_asset_manifest(self, topic: str, story_direction: str) -> AssetManifest:
@@ -239,7 +260,9 @@ class AssetGenerationService:
 
         for asset in manifest.assets:
             # Skip if asset exists and resume=True
-            if resume and self.check_asset_exists(asset.output_path):
+            if resume and await output_reusable(
+                self.artifacts, asset.output_path, ARTIFACT_ASSET, self.check_asset_exists
+            ):
                 skipped += 1
                 self.log.info(
                     "asset_skipped",
@@ -252,40 +275,49 @@ class AssetGenerationService:
             # Combine asset prompt with global atmosphere
             combined_prompt = f"{manifest.global_atmosphere}\n\n{asset.prompt}"
 
-            try:
-                # Invoke CLI script via async wrapper (Story 3.1)
-                await run_cli_script(
-                    "generate_asset.py",
-                    ["--prompt", combined_prompt, "--output", str(asset.output_path)],
-                    timeout=60,  # Gemini API timeout
-                )
-
-                # Verify file was created
-                if not asset.output_path.exists():
-                    raise FileNotFoundError(
-                        f"Asset generation succeeded but file not found: {asset.output_path}"
+            with span("clip.asset", asset=asset.name, asset_type=asset.asset_type):
+                try:
+                    # Invoke CLI script via async wrapper (Story 3.1), holding a Gemini slot
+                    async with api_slots.slot("gemini", task_id=self.task_id):
+                        try:
+                            await run_cli_script(
+                                "generate_asset.py",
+                                ["--prompt", combined_prompt, "--output", str(asset.output_path)],
+                                timeout=60,  # Gemini API timeout
+                            )
+                        finally:
+                            await record_gemini_request()
+
+                    # Verify file was created
+                    if not asset.output_path.exists():
+                        raise FileNotFoundError(
+                            f"Asset generation succeeded but file not found: {asset.output_path}"
+                        )
+                    await record_output(self.artifacts, asset.output_path, ARTIFACT_ASSET)
+
+                    generated += 1
+                    self.log.info(
+                        "asset_generated",
+                        name=asset.name,
+                        type=asset.asset_type,
+                        path=str(asset.output_path),
                     )
 
-                generated += 1
-                self.log.info(
-                    "asset_generated",
-                    name=asset.name,
-                    type=asset.asset_type,
-                    path=str(asset.output_path),
-                )
-
-            except Exception as e:
-                failed += 1
-                # Sanitize prompt in log (may contain sensitive context)
-                self.log.error(
-                    "asset_generation_failed",
-                    name=asset.name,
-                    type=asset.asset_type,
-                    error=str(e),
-                    prompt_preview=combined_prompt[:100],
-                )
-                # Re-raise to allow worker to handle (mark task failed, retry, etc.)
-                raise
+                except Exception as e:
+                    failed += 1
+                    # Sanitize prompt in log (may contain sensitive context)
+                    self.log.error(
+                        "asset_generation_failed",
+                        name=asset.name,
+                        type=asset.asset_type,
+                        error=str(e),
+                        prompt_preview=combined_prompt[:100],
+                    )
+                    # Share quota exhaustion so other workers stop calling Gemini
+                    if isinstance(e, CLIScriptError):
+                        await report_gemini_quota_error(e.stderr)
+                    # Re-raise to allow worker to handle (mark task failed, retry, etc.)
+                    raise
 
         # Calculate total cost
         total_cost_usd = self.estimate_cost(generated)
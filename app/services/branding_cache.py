@@ -0,0 +1,374 @@
+"""Per-channel cache of branding segments normalized for final assembly (FR11).
+
+Intro/outro videos and the watermark are the same for every video of a
+channel. Transcoding the intro and outro inside each assembly would repeat
+the most expensive encode of the step for identical input, so they are
+normalized once into the assembly mezzanine (MEZZANINE_PROFILE: codec,
+resolution, frame rate, pixel format, track timebase and audio layout) and
+cached in the channel workspace. Concatenation then stream-copies them next
+to the trimmed clips, which are encoded with the same profile. The watermark
+is pre-scaled once, so each clip encode only overlays it.
+
+Cache Layout:
+    {channel_workspace}/branding_cache/{kind}_{source_sha256[:16]}_{profile.key}.{ext}
+
+    - Keyed by source content hash and encoder profile: editing the source
+      file or changing the profile produces a new entry (no invalidation
+      step); older entries of the same kind are deleted when it is written
+    - Entries are written to a uniquely named temp file in the cache dir and
+      renamed, so a crashed or concurrent transcode (another worker on the
+      same volume) never leaves a partial segment under a final name
+    - Source hashes are memoized per (path, size, mtime), so a cache hit
+      costs one stat per branding file
+
+Architecture Pattern:
+    Service (Smart): Resolves branding paths, owns the cache and the profile
+    CLI Script (Dumb): scripts/assemble_video.py concatenates the prepared
+        segments listed in the assembly manifest
+
+Usage:
+    from app.services.branding_cache import prepare_branding
+
+    segments = await prepare_branding("poke1", branding_paths)
+    manifest = AssemblyManifest(clips=clips, output_path=out, branding=segments)
+
+References:
+    - app/services/voice_branding_service.py: BrandingPaths
+    - app/services/video_assembly.py: AssemblyManifest
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from app.services.voice_branding_service import BrandingPaths
+from app.utils.cli_wrapper import CLIScriptError, _run_subprocess
+from app.utils.filesystem import get_channel_workspace
+from app.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+BRANDING_CACHE_DIR_NAME = "branding_cache"
+
+# Watermark width as a fraction of the frame width
+WATERMARK_WIDTH_RATIO = 0.12
+
+# Watermark placement for the overlay filter (bottom-right, 24px margin)
+WATERMARK_POSITION = "main_w-overlay_w-24:main_h-overlay_h-24"
+
+# Intro/outro transcode timeout (seconds)
+TRANSCODE_TIMEOUT_SECONDS = 300
+
+# Audio stream probe timeout (seconds)
+PROBE_TIMEOUT_SECONDS = 10
+
+
+@dataclass(frozen=True)
+class EncoderProfile:
+    """Encoding parameters shared by every segment of an assembled video.
+
+    Stream-copy concatenation requires identical streams in every segment,
+    so trimmed clips and cached branding segments are encoded with the same
+    profile.
+
+    Attributes:
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Constant frame rate.
+        pix_fmt: Pixel format.
+        video_codec: FFmpeg video encoder.
+        preset: Encoder preset.
+        crf: Constant rate factor (18 = visually lossless).
+        timescale: MP4 video track timescale (timebase 1/timescale).
+        audio_codec: FFmpeg audio encoder.
+        audio_bitrate: Audio bitrate.
+        sample_rate: Audio sample rate (Hz).
+        channels: Audio channel count.
+    """
+
+    width: int = 1920
+    height: int = 1080
+    fps: int = 30
+    pix_fmt: str = "yuv420p"
+    video_codec: str = "libx264"
+    preset: str = "fast"
+    crf: int = 18
+    timescale: int = 15360
+    audio_codec: str = "aac"
+    audio_bitrate: str = "192k"
+    sample_rate: int = 48000
+    channels: int = 2
+
+    @property
+    def key(self) -> str:
+        """Short stable hash of the profile (part of cache entry names)."""
+        encoded = json.dumps(asdict(self), sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()[:12]
+
+    def video_filter(self) -> str:
+        """Filter chain fitting any input into the profile frame (letterboxed)."""
+        return (
+            f"scale={self.width}:{self.height}:force_original_aspect_ratio=decrease,"
+            f"pad={self.width}:{self.height}:(ow-iw)/2:(oh-ih)/2,"
+            f"setsar=1,fps={self.fps},format={self.pix_fmt}"
+        )
+
+    def video_args(self) -> list[str]:
+        """FFmpeg video encoder arguments."""
+        return [
+            "-c:v", self.video_codec,
+            "-preset", self.preset,
+            "-crf", str(self.crf),
+            "-pix_fmt", self.pix_fmt,
+            "-video_track_timescale", str(self.timescale),
+        ]
+
+    def audio_args(self) -> list[str]:
+        """FFmpeg audio encoder arguments."""
+        return [
+            "-c:a", self.audio_codec,
+            "-b:a", self.audio_bitrate,
+            "-ar", str(self.sample_rate),
+            "-ac", str(self.channels),
+        ]
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """Encoder settings for the assembly manifest (CLI script input)."""
+        return {
+            "video_filter": self.video_filter(),
+            "video_args": self.video_args(),
+            "audio_args": self.audio_args(),
+        }
+
+
+MEZZANINE_PROFILE = EncoderProfile()
+
+
+@dataclass(frozen=True)
+class BrandingSegments:
+    """Cached branding files ready for assembly.
+
+    Attributes:
+        intro_path: Normalized intro segment (stream-copied before clip 1).
+        outro_path: Normalized outro segment (stream-copied after the last clip).
+        watermark_path: Pre-scaled watermark overlaid on each clip.
+    """
+
+    intro_path: Path | None = None
+    outro_path: Path | None = None
+    watermark_path: Path | None = None
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """Branding section of the assembly manifest."""
+        return {
+            "intro": str(self.intro_path) if self.intro_path else None,
+            "outro": str(self.outro_path) if self.outro_path else None,
+            "watermark": str(self.watermark_path) if self.watermark_path else None,
+            "watermark_position": WATERMARK_POSITION,
+        }
+
+
+# (path, size, mtime_ns) -> sha256 hex digest
+_source_hashes: dict[tuple[str, int, int], str] = {}
+
+# Cache entry path -> lock (one transcode per entry within a worker)
+_entry_locks: dict[Path, asyncio.Lock] = {}
+
+
+def _source_hash(path: Path) -> str:
+    """SHA-256 of a source file, memoized until its size or mtime changes."""
+    stat = path.stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    digest = _source_hashes.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        _source_hashes[key] = digest
+    return digest
+
+
+async def _has_audio(path: Path) -> bool:
+    """Check whether a media file has an audio stream (ffprobe).
+
+    Raises:
+        CLIScriptError: If ffprobe fails
+        asyncio.TimeoutError: If ffprobe exceeds PROBE_TIMEOUT_SECONDS
+    """
+    command = [
+        "ffprobe", "-v", "error",
+        "-select_streams", "a",
+        "-show_entries", "stream=index",
+        "-of", "csv=p=0",
+        str(path),
+    ]
+    result = await _run_subprocess("ffprobe", command, None, PROBE_TIMEOUT_SECONDS)
+    if result.returncode != 0:
+        raise CLIScriptError("ffprobe", result.returncode, result.stderr)
+    return bool(result.stdout.strip())
+
+
+def _segment_command(
+    source: Path, output: Path, profile: EncoderProfile, has_audio: bool
+) -> list[str]:
+    """FFmpeg command normalizing an intro/outro into the profile."""
+    command = ["ffmpeg", "-i", str(source)]
+    if has_audio:
+        audio_map = "0:a:0"
+    else:
+        # Silent track so every segment has the same streams (concat copy)
+        command += [
+            "-f", "lavfi",
+            "-i", f"anullsrc=channel_layout=stereo:sample_rate={profile.sample_rate}",
+        ]
+        audio_map = "1:a:0"
+    return [
+        *command,
+        "-map", "0:v:0",
+        "-map", audio_map,
+        "-vf", profile.video_filter(),
+        *profile.video_args(),
+        *profile.audio_args(),
+        "-shortest",
+        "-movflags", "faststart",
+        "-f", "mp4",
+        "-y", str(output),
+    ]
+
+
+def _watermark_command(source: Path, output: Path, profile: EncoderProfile) -> list[str]:
+    """FFmpeg command scaling the watermark to its on-frame size."""
+    width = round(profile.width * WATERMARK_WIDTH_RATIO)
+    return [
+        "ffmpeg", "-i", str(source),
+        "-vf", f"scale={width}:-1",
+        "-frames:v", "1",
+        "-f", "image2",
+        "-y", str(output),
+    ]
+
+
+async def _run_ffmpeg(command: list[str]) -> None:
+    result = await _run_subprocess("ffmpeg", command, None, TRANSCODE_TIMEOUT_SECONDS)
+    if result.returncode != 0:
+        raise CLIScriptError("ffmpeg", result.returncode, result.stderr)
+
+
+def _prune_stale(cache_dir: Path, kind: str, keep: Path) -> None:
+    """Delete older entries of a kind (previous source or profile)."""
+    for entry in cache_dir.glob(f"{kind}_*"):
+        if entry != keep:
+            entry.unlink(missing_ok=True)
+
+
+async def _cached_entry(
+    channel_id: str,
+    kind: str,
+    relative_path: str,
+    profile: EncoderProfile,
+) -> Path:
+    """Return the cache entry for one branding file, building it on a miss.
+
+    Raises:
+        FileNotFoundError: If the source file does not exist
+        CLIScriptError: If FFmpeg fails
+    """
+    workspace = get_channel_workspace(channel_id)
+    source = workspace / relative_path
+    if not source.is_file():
+        raise FileNotFoundError(f"Branding {kind} not found: {source}")
+
+    source_hash = await asyncio.to_thread(_source_hash, source)
+    suffix = ".png" if kind == "watermark" else ".mp4"
+    cache_dir = workspace / BRANDING_CACHE_DIR_NAME
+    entry = cache_dir / f"{kind}_{source_hash[:16]}_{profile.key}{suffix}"
+    if entry.exists():
+        log.debug("branding_cache_hit", channel_id=channel_id, kind=kind, path=str(entry))
+        return entry
+
+    lock = _entry_locks.setdefault(entry, asyncio.Lock())
+    async with lock:
+        if entry.exists():
+            return entry
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Unique per build: workers sharing the volume never write the same temp file
+        fd, temp_name = tempfile.mkstemp(dir=cache_dir, prefix=f".{entry.stem}.", suffix=suffix)
+        os.close(fd)
+        temp_path = Path(temp_name)
+        log.info(
+            "branding_cache_miss",
+            channel_id=channel_id,
+            kind=kind,
+            source=str(source),
+            profile=profile.key,
+        )
+        try:
+            if kind == "watermark":
+                command = _watermark_command(source, temp_path, profile)
+            else:
+                has_audio = await _has_audio(source)
+                command = _segment_command(source, temp_path, profile, has_audio)
+            await _run_ffmpeg(command)
+            os.replace(temp_name, entry)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_name)
+        await asyncio.to_thread(_prune_stale, cache_dir, kind, entry)
+
+    log.info("branding_cache_stored", channel_id=channel_id, kind=kind, path=str(entry))
+    return entry
+
+
+async def prepare_branding(
+    channel_id: str,
+    branding: BrandingPaths,
+    profile: EncoderProfile = MEZZANINE_PROFILE,
+) -> BrandingSegments:
+    """Resolve a channel's branding to cached, assembly-ready files.
+
+    The first video of a channel (or the first after a branding file or the
+    profile changes) transcodes the intro/outro and scales the watermark;
+    every later video reuses the cached files.
+
+    Args:
+        channel_id: Channel business identifier (e.g., "poke1").
+        branding: Branding paths relative to the channel workspace.
+        profile: Encoder profile of the assembly.
+
+    Returns:
+        BrandingSegments with cache entry paths (None where not configured).
+
+    Raises:
+        FileNotFoundError: If a configured branding file is missing
+        CLIScriptError: If FFmpeg fails to normalize a file
+
+    Example:
+        >>> segments = await prepare_branding("poke1", branding)
+        >>> segments.intro_path
+        PosixPath('/app/workspace/channels/poke1/branding_cache/intro_3f2a..._9c1e....mp4')
+    """
+    paths: dict[str, Path | None] = {}
+    for kind, relative_path in (
+        ("intro", branding.intro_path),
+        ("outro", branding.outro_path),
+        ("watermark", branding.watermark_path),
+    ):
+        paths[kind] = (
+            await _cached_entry(channel_id, kind, relative_path, profile)
+            if relative_path
+            else None
+        )
+    return BrandingSegments(
+        intro_path=paths["intro"],
+        outro_path=paths["outro"],
+        watermark_path=paths["watermark"],
+    )
@@ -10,6 +10,8 @@ Capacity Calculation:
     - pending_count: Tasks with status = "pending"
     - in_progress_count: Tasks with status IN ("claimed", "processing", "awaiting_review")
     - has_capacity: True when in_progress_count < max_concurrent
+    - Counts come from channel_queue_stats (app/services/channel_queue_stats.py),
+      maintained by a trigger on tasks, not from aggregating the tasks table
 
 Usage:
     >>> service = ChannelCapacityService()
@@ -18,12 +20,14 @@ Usage:
 """
 
 from dataclasses import dataclass
+from typing import Any
 
 import structlog
-from sqlalchemy import case, func, select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import IN_PROGRESS_STATUSES, PENDING_STATUSES, Channel, Task
+from app.models import IN_PROGRESS_STATUSES, PENDING_STATUSES, Channel, ChannelStatusCount
+from app.services.channel_queue_stats import status_count
 
 log = structlog.get_logger()
 
@@ -52,6 +56,25 @@ class ChannelQueueStats:
     has_capacity: bool
 
 
+def _queue_stats_query() -> Select[Any]:
+    """Per-channel pending/in-progress counts from channel_queue_stats.
+
+    Reads at most one row per status per channel (trigger-maintained), so
+    the cost does not grow with the tasks table.
+    """
+    return (
+        select(
+            Channel.channel_id,
+            Channel.channel_name,
+            Channel.max_concurrent,
+            status_count(PENDING_STATUSES).label("pending_count"),
+            status_count(IN_PROGRESS_STATUSES).label("in_progress_count"),
+        )
+        .outerjoin(ChannelStatusCount, Channel.id == ChannelStatusCount.channel_id)
+        .group_by(Channel.channel_id, Channel.channel_name, Channel.max_concurrent)
+    )
+
+
 class ChannelCapacityService:
     """Service for tracking channel queue depth and processing capacity.
 
@@ -68,7 +91,8 @@ class ChannelCapacityService:
         """Get queue depth per channel.
 
         Returns count of pending and in-progress tasks per active channel.
-        Uses a single aggregation query with JOIN to avoid N+1 queries.
+        Uses a single query over the trigger-maintained channel_queue_stats
+        rows (O(channels), independent of task history) to avoid N+1 queries.
 
         Args:
             db: Async database session.
@@ -77,21 +101,7 @@ class ChannelCapacityService:
             List of ChannelQueueStats for all active channels.
             Channels with no tasks return zero counts.
         """
-        # Use SQLAlchemy 2.0 select() style with aggregation
-        stmt = (
-            select(
-                Channel.channel_id,
-                Channel.channel_name,
-                Channel.max_concurrent,
-                func.count(case((Task.status.in_(PENDING_STATUSES), 1))).label("pending_count"),
-                func.count(case((Task.status.in_(IN_PROGRESS_STATUSES), 1))).label(
-                    "in_progress_count"
-                ),
-            )
-            .outerjoin(Task, Channel.id == Task.channel_id)
-            .where(Channel.is_active == True)  # noqa: E712 - SQLAlchemy needs ==
-            .group_by(Channel.channel_id, Channel.channel_name, Channel.max_concurrent)
-        )
+        stmt = _queue_stats_query().where(Channel.is_active == True)  # noqa: E712
 
         result = await db.execute(stmt)
         rows = result.all()
@@ -131,19 +141,9 @@ class ChannelCapacityService:
             or channel is inactive.
         """
         stmt = (
-            select(
-                Channel.channel_id,
-                Channel.channel_name,
-                Channel.max_concurrent,
-                func.count(case((Task.status.in_(PENDING_STATUSES), 1))).label("pending_count"),
-                func.count(case((Task.status.in_(IN_PROGRESS_STATUSES), 1))).label(
-                    "in_progress_count"
-                ),
-            )
-            .outerjoin(Task, Channel.id == Task.channel_id)
+            _queue_stats_query()
             .where(Channel.channel_id == channel_id)
             .where(Channel.is_active == True)  # noqa: E712
-            .group_by(Channel.channel_id, Channel.channel_name, Channel.max_concurrent)
         )
 
         result = await db.execute(stmt)
@@ -15,24 +15,112 @@ Syncing Configuration to Database:
 Storage Strategy Syncing (FR12):
     - storage_strategy is always persisted ("notion" or "r2")
     - R2 credentials are encrypted before storage using CredentialService pattern
+    - R2 credentials whose plaintext is unchanged keep their stored ciphertext
     - Warning logged if storage_strategy="r2" but R2 credentials are incomplete
+
+Incremental Reloads:
+    With hundreds of channels, re-parsing every YAML file and upserting every
+    channel one at a time on each reload does not scale.
+
+    - scan_configs() remembers each file's mtime, size and SHA-256; only new
+      or changed files are read and parsed
+    - sync_all_to_database() diffs the parsed configs against the Channel rows
+      (one SELECT) and writes only the channels that differ in one multi-row
+      upsert
+    - ConfigManager.reload(db) combines the two: unchanged files cost a stat()
+      and unchanged channels cost nothing
 """
 
 import asyncio
+import hashlib
+import hmac
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 import structlog
 import yaml
 from pydantic import ValidationError
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models import Channel
 from app.schemas.channel_config import ChannelConfigSchema
-from app.utils.encryption import get_encryption_service
+from app.services.credential_cache import credential_cache
+from app.utils.encryption import DecryptionError, get_encryption_service
 
 log = structlog.get_logger()
 
+# Channel columns written from YAML config (sync_all_to_database upsert set)
+CONFIG_SYNCED_COLUMNS = (
+    "channel_name",
+    "is_active",
+    "voice_id",
+    "branding_intro_path",
+    "branding_outro_path",
+    "branding_watermark_path",
+    "storage_strategy",
+    "max_concurrent",
+    "r2_account_id_encrypted",
+    "r2_access_key_id_encrypted",
+    "r2_secret_access_key_encrypted",
+    "r2_bucket_name",
+)
+
+
+@dataclass
+class _ConfigFileState:
+    """Last seen state of one config file."""
+
+    mtime_ns: int
+    size: int
+    sha256: str
+    config: ChannelConfigSchema | None
+
+
+@dataclass
+class ConfigScan:
+    """Result of an incremental config directory scan.
+
+    Attributes:
+        configs: Every valid config in the directory, by channel_id.
+        changed: Channel IDs whose config is new or differs from the last scan.
+        removed: Channel IDs no longer configured.
+        parsed: Files read and parsed in this scan.
+        unchanged: Files skipped because they did not change.
+    """
+
+    configs: dict[str, ChannelConfigSchema] = field(default_factory=dict)
+    changed: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+    parsed: int = 0
+    unchanged: int = 0
+
+
+@dataclass
+class ChannelSyncResult:
+    """Outcome of a batched config sync.
+
+    Attributes:
+        created: Channel IDs inserted.
+        updated: Channel IDs whose row differed and was rewritten.
+        unchanged: Channel IDs whose row already matched the config.
+    """
+
+    created: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+    @property
+    def written(self) -> list[str]:
+        """Channel IDs written by the upsert."""
+        return self.created + self.updated
+
 
 class ChannelConfigLoader:
     """Loads and validates channel configurations from YAML files.
@@ -52,6 +140,8 @@ class ChannelConfigLoader:
                            If None, file existence checks are skipped.
         """
         self._workspace_root = workspace_root
+        # Per-file state for incremental scans (scan_configs)
+        self._file_states: dict[Path, _ConfigFileState] = {}
 
     def load_channel_config(self, file_path: Path) -> ChannelConfigSchema | None:
         """Load and validate channel config from YAML file.
@@ -67,8 +157,16 @@ class ChannelConfigLoader:
             return None
 
         try:
-            with file_path.open("r", encoding="utf-8") as f:
-                raw_config = yaml.safe_load(f)
+            content = file_path.read_bytes()
+        except Exception as e:
+            log.error("config_load_error", file=str(file_path), error=str(e))
+            return None
+        return self._parse_config(file_path, content)
+
+    def _parse_config(self, file_path: Path, content: bytes) -> ChannelConfigSchema | None:
+        """Parse and validate one config file's content (None if invalid)."""
+        try:
+            raw_config = yaml.safe_load(content.decode("utf-8"))
 
             if raw_config is None:
                 log.warning("config_file_empty", file=str(file_path))
@@ -113,7 +211,8 @@ class ChannelConfigLoader:
 
         Scans the directory for *.yaml and *.yml files and loads each one.
         Files starting with underscore are skipped (e.g., _example.yaml).
-        Invalid files are logged and skipped.
+        Invalid files are logged and skipped. Files unchanged since this
+        loader's previous scan are not re-parsed (see scan_configs).
 
         Args:
             config_dir: Directory containing YAML config files.
@@ -121,13 +220,35 @@ class ChannelConfigLoader:
         Returns:
             Dictionary mapping channel_id to ChannelConfigSchema.
         """
-        configs: dict[str, ChannelConfigSchema] = {}
-        loaded_count = 0
-        skipped_count = 0
+        return self.scan_configs(config_dir).configs
+
+    def scan_configs(self, config_dir: Path) -> ConfigScan:
+        """Incrementally scan a config directory.
+
+        A file is re-read only if its mtime or size changed since the last
+        scan, and re-parsed only if its content hash changed as well.
+
+        Args:
+            config_dir: Directory containing YAML config files.
+
+        Returns:
+            ConfigScan with every current config and what changed.
+        """
+        scan = ConfigScan()
+        previous = {
+            state.config.channel_id: state.config
+            for state in self._file_states.values()
+            if state.config is not None
+        }
 
         if not config_dir.exists():
             log.warning("config_directory_not_found", directory=str(config_dir))
-            return configs
+            self._file_states.clear()
+            scan.removed = set(previous)
+            return scan
+
+        file_states: dict[Path, _ConfigFileState] = {}
+        skipped_count = 0
 
         # Support both .yaml and .yml extensions
         yaml_files = list(config_dir.glob("*.yaml")) + list(config_dir.glob("*.yml"))
@@ -137,21 +258,58 @@ class ChannelConfigLoader:
                 log.debug("skipping_example_file", file=str(file_path))
                 continue
 
-            config = self.load_channel_config(file_path)
-            if config is not None:
-                configs[config.channel_id] = config
-                loaded_count += 1
-            else:
+            state = self._scan_file(file_path, scan)
+            if state is None or state.config is None:
                 skipped_count += 1
+                continue
+            file_states[file_path] = state
+            scan.configs[state.config.channel_id] = state.config
+
+        self._file_states = file_states
+        scan.changed = {
+            channel_id
+            for channel_id, config in scan.configs.items()
+            if previous.get(channel_id) != config
+        }
+        scan.removed = set(previous) - set(scan.configs)
 
         log.info(
             "configs_scan_complete",
             directory=str(config_dir),
-            loaded=loaded_count,
+            loaded=len(scan.configs),
             skipped=skipped_count,
+            parsed=scan.parsed,
+            unchanged=scan.unchanged,
+            changed=len(scan.changed),
         )
 
-        return configs
+        return scan
+
+    def _scan_file(self, file_path: Path, scan: ConfigScan) -> _ConfigFileState | None:
+        """Return a file's state, parsing it only if its content changed."""
+        state = self._file_states.get(file_path)
+        try:
+            stat = file_path.stat()
+            if state is not None and (stat.st_mtime_ns, stat.st_size) == (
+                state.mtime_ns,
+                state.size,
+            ):
+                scan.unchanged += 1
+                return state
+            content = file_path.read_bytes()
+        except OSError as e:
+            log.error("config_load_error", file=str(file_path), error=str(e))
+            return None
+
+        digest = hashlib.sha256(content).hexdigest()
+        if state is not None and state.sha256 == digest:
+            # Touched but not edited
+            scan.unchanged += 1
+            config = state.config
+        else:
+            scan.parsed += 1
+            config = self._parse_config(file_path, content)
+        return _ConfigFileState(stat.st_mtime_ns, stat.st_size, digest, config)
 
     def validate_branding_files(
         self, config: ChannelConfigSchema, channel_workspace: Path | None = None
@@ -313,6 +471,9 @@ class ChannelConfigLoader:
         await db.commit()
         await db.refresh(channel)
 
+        # Credentials or storage strategy may have changed
+        credential_cache.invalidate(config.channel_id)
+
         return channel
 
     async def _sync_r2_credentials(self, config: ChannelConfigSchema, channel: Channel) -> None:
@@ -346,17 +507,9 @@ class ChannelConfigLoader:
                 )
             return
 
-        # Encrypt and persist R2 credentials
-        encryption_service = get_encryption_service()
-
-        channel.r2_account_id_encrypted = encryption_service.encrypt(config.r2_config.account_id)
-        channel.r2_access_key_id_encrypted = encryption_service.encrypt(
-            config.r2_config.access_key_id
-        )
-        channel.r2_secret_access_key_encrypted = encryption_service.encrypt(
-            config.r2_config.secret_access_key
-        )
-        channel.r2_bucket_name = config.r2_config.bucket_name
+        # Encrypt and persist R2 credentials (unchanged ones keep their ciphertext)
+        for column, value in self._r2_values(config, channel).items():
+            setattr(channel, column, value)
 
         log.info(
             "channel_r2_credentials_synced",
@@ -365,6 +518,165 @@ class ChannelConfigLoader:
             has_credentials=True,
         )
 
+    def _r2_values(self, config: ChannelConfigSchema, channel: Channel | None) -> dict[str, Any]:
+        """R2 column values for a config.
+
+        Fernet ciphertexts are randomized, so re-encrypting an unchanged
+        secret would rewrite the row on every sync. A stored ciphertext is
+        kept when it already decrypts to the configured plaintext.
+
+        Args:
+            config: Validated ChannelConfigSchema from YAML.
+            channel: Existing Channel row, or None for a new channel.
+
+        Returns:
+            Mapping of R2 column name to value.
+        """
+        if config.r2_config is None:
+            return {
+                "r2_account_id_encrypted": None,
+                "r2_access_key_id_encrypted": None,
+                "r2_secret_access_key_encrypted": None,
+                "r2_bucket_name": None,
+            }
+
+        encryption_service = get_encryption_service()
+        values: dict[str, Any] = {"r2_bucket_name": config.r2_config.bucket_name}
+        for column, plaintext in (
+            ("r2_account_id_encrypted", config.r2_config.account_id),
+            ("r2_access_key_id_encrypted", config.r2_config.access_key_id),
+            ("r2_secret_access_key_encrypted", config.r2_config.secret_access_key),
+        ):
+            current = getattr(channel, column) if channel is not None else None
+            if current is not None and self._decrypts_to(current, plaintext):
+                values[column] = current
+            else:
+                values[column] = encryption_service.encrypt(plaintext)
+        return values
+
+    @staticmethod
+    def _decrypts_to(ciphertext: bytes, plaintext: str) -> bool:
+        """True if a stored ciphertext decrypts to the given plaintext."""
+        try:
+            current = get_encryption_service().decrypt(ciphertext)
+        except DecryptionError:
+            # Corrupted or encrypted under a previous key: re-encrypt
+            return False
+        return hmac.compare_digest(current.encode(), plaintext.encode())
+
+    def _config_values(
+        self, config: ChannelConfigSchema, channel: Channel | None
+    ) -> dict[str, Any]:
+        """Channel column values for a config (CONFIG_SYNCED_COLUMNS)."""
+        branding = config.branding
+        return {
+            "channel_name": config.channel_name,
+            "is_active": config.is_active,
+            "voice_id": config.voice_id,
+            "branding_intro_path": branding.intro_video if branding else None,
+            "branding_outro_path": branding.outro_video if branding else None,
+            "branding_watermark_path": branding.watermark_image if branding else None,
+            "storage_strategy": config.storage_strategy,
+            "max_concurrent": config.max_concurrent,
+            **self._r2_values(config, channel),
+        }
+
+    async def sync_all_to_database(
+        self, configs: Iterable[ChannelConfigSchema], db: AsyncSession
+    ) -> ChannelSyncResult:
+        """Persist many channel configs, writing only the channels that changed.
+
+        Loads the configured channels in one query, diffs each config against
+        its row, and writes new and changed channels in one multi-row upsert.
+        Unchanged R2 credentials are not re-encrypted (see _r2_values), so a
+        channel whose YAML did not change is never rewritten. Loaded Channel
+        objects in the session are updated to the written values.
+
+        Args:
+            configs: Validated configs (e.g. ConfigScan.configs.values()).
+            db: Async database session (committed by this method).
+
+        Returns:
+            ChannelSyncResult with created, updated and unchanged channel IDs.
+
+        Example:
+            >>> scan = loader.scan_configs(Path("channel_configs"))
+            >>> result = await loader.sync_all_to_database(scan.configs.values(), db)
+            >>> result.updated
+            ['poke1']
+        """
+        configs_by_id = {config.channel_id: config for config in configs}
+        result = ChannelSyncResult()
+        if not configs_by_id:
+            return result
+
+        existing_rows = await db.execute(
+            select(Channel).where(Channel.channel_id.in_(configs_by_id))
+        )
+        existing = {channel.channel_id: channel for channel in existing_rows.scalars()}
+
+        now = datetime.now(timezone.utc)
+        rows: list[dict[str, Any]] = []
+        for channel_id, config in configs_by_id.items():
+            channel = existing.get(channel_id)
+            values = self._config_values(config, channel)
+            if channel is None:
+                result.created.append(channel_id)
+            elif any(getattr(channel, column) != value for column, value in values.items()):
+                result.updated.append(channel_id)
+            else:
+                result.unchanged.append(channel_id)
+                continue
+
+            if config.voice_id is None:
+                log.warning(
+                    "channel_voice_id_not_set",
+                    channel_id=channel_id,
+                    message="Channel will use DEFAULT_VOICE_ID for narration",
+                )
+            rows.append(
+                {
+                    "id": channel.id if channel is not None else uuid.uuid4(),
+                    "channel_id": channel_id,
+                    "created_at": now,
+                    "updated_at": now,
+                    **values,
+                }
+            )
+
+        if rows:
+            dialect = db.get_bind().dialect.name
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = dialect_insert(Channel).values(rows)
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["channel_id"],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in (*CONFIG_SYNCED_COLUMNS, "updated_at")
+                    },
+                )
+            )
+            # Keep loaded rows in step with the upsert (no lazy reload in async)
+            for row in rows:
+                channel = existing.get(row["channel_id"])
+                if channel is not None:
+                    for column in (*CONFIG_SYNCED_COLUMNS, "updated_at"):
+                        set_committed_value(channel, column, row[column])
+        await db.commit()
+
+        for channel_id in result.written:
+            # Credentials or storage strategy may have changed
+            credential_cache.invalidate(channel_id)
+
+        log.info(
+            "channels_synced",
+            created=len(result.created),
+            updated=len(result.updated),
+            unchanged=len(result.unchanged),
+        )
+        return result
+
 
 class ConfigManager:
     """Thread-safe configuration manager with reload support.
@@ -403,27 +715,46 @@ class ConfigManager:
             cls._instance = cls(config_dir)
         return cls._instance
 
-    async def reload(self) -> None:
-        """Reload all configurations from disk.
+    async def reload(self, db: AsyncSession | None = None) -> ChannelSyncResult | None:
+        """Reload changed configurations from disk.
 
         Async-safe reload using asyncio.Lock. Uses asyncio.to_thread()
-        to avoid blocking the event loop during file I/O. Logs changes
+        to avoid blocking the event loop during file I/O. Only files that
+        changed since the previous reload are parsed. Logs changes
         (added/removed configs) after reload.
+
+        Args:
+            db: If given, changed configs are synced to the database in one
+                batched upsert.
+
+        Returns:
+            ChannelSyncResult if db was given, else None.
         """
         async with self._lock:
             # Use to_thread to avoid blocking event loop during file I/O
-            new_configs = await asyncio.to_thread(self._loader.load_all_configs, self._config_dir)
+            scan = await asyncio.to_thread(self._loader.scan_configs, self._config_dir)
 
             # Log changes
-            added = set(new_configs.keys()) - set(self._configs.keys())
-            removed = set(self._configs.keys()) - set(new_configs.keys())
+            added = set(scan.configs.keys()) - set(self._configs.keys())
+            removed = set(self._configs.keys()) - set(scan.configs.keys())
 
             if added:
                 log.info("configs_added", channel_ids=list(added))
             if removed:
                 log.info("configs_removed", channel_ids=list(removed))
 
-            self._configs = new_configs
+            self._configs = scan.configs
+
+            if db is None:
+                return None
+            try:
+                return await self._loader.sync_all_to_database(
+                    [scan.configs[channel_id] for channel_id in sorted(scan.changed)], db
+                )
+            except Exception:
+                # Changes not written: re-parse everything on the next reload
+                self._loader._file_states.clear()
+                raise
 
     def get_config(self, channel_id: str) -> ChannelConfigSchema | None:
         """Get config for specific channel.
@@ -0,0 +1,193 @@
+"""Per-channel task counts (channel_queue_stats) and their reconciliation.
+
+Every scheduling decision used to count a channel's pending and in-progress
+tasks by aggregating the whole tasks table, including the published history
+that is never archived. Counts per (channel, status) are now maintained by a
+trigger on tasks (see app.models.ChannelStatusCount), so reads cost
+O(channels x statuses) regardless of how many tasks exist.
+
+Architecture Pattern:
+    - Write path: Database trigger, same transaction as the task change
+      (nothing to call from application code)
+    - Read path: status_count() sums the rows of a status group per
+      channel, for capacity checks
+    - Reconciliation: reconcile_queue_stats() recounts tasks and repairs
+      drifted rows (e.g. after manual data fixes with triggers disabled); the
+      worker runs it every RECONCILE_INTERVAL_SECONDS
+    - Metrics: channel_queue_depth is read from these rows on each /metrics
+      scrape (collect_queue_depth)
+
+Usage:
+    from app.services.channel_queue_stats import reconcile_queue_stats
+
+    async with async_session_factory() as db, db.begin():
+        repaired = await reconcile_queue_stats(db)
+
+References:
+    - alembic/versions/20260118_0010_add_channel_queue_stats.py: Trigger
+    - app/services/channel_capacity_service.py: Read path
+"""
+
+import asyncio
+import uuid
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import case, func, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models import PENDING_STATUSES, Channel, ChannelStatusCount, Task, TaskStatus
+from app.utils.logging import get_logger
+from app.utils.metrics import QUEUE_DEPTH
+
+log = get_logger(__name__)
+
+# Reconciliation cadence for the worker background loop (seconds)
+RECONCILE_INTERVAL_SECONDS = 900
+
+
+def status_count(statuses: Iterable[TaskStatus]) -> ColumnElement[Any]:
+    """SQL expression: a channel's task count over a group of statuses.
+
+    Aggregate over ChannelStatusCount rows grouped by channel (0 for
+    channels without rows when outer-joined).
+
+    Args:
+        statuses: Statuses to sum (e.g. IN_PROGRESS_STATUSES).
+    """
+    values = [status.value for status in statuses]
+    return func.coalesce(
+        func.sum(
+            case((ChannelStatusCount.status.in_(values), ChannelStatusCount.task_count), else_=0)
+        ),
+        0,
+    )
+
+
+async def count_tasks(db: AsyncSession) -> dict[tuple[uuid.UUID, str], int]:
+    """Count tasks per (channel_id, status value) from the tasks table (full scan)."""
+    result = await db.execute(
+        select(Task.channel_id, Task.status, func.count()).group_by(Task.channel_id, Task.status)
+    )
+    return {(channel_id, status.value): count for channel_id, status, count in result.all()}
+
+
+async def reconcile_queue_stats(db: AsyncSession) -> int:
+    """Repair channel_queue_stats rows that differ from the tasks table.
+
+    On PostgreSQL a transaction advisory lock lets one worker reconcile at a
+    time, and the table lock (released at commit) holds back concurrent
+    status changes between the recount and the repair. Status changes
+    already in flight finish first, so none is lost or counted twice.
+
+    Args:
+        db: Async database session (caller owns the transaction).
+
+    Returns:
+        Number of rows repaired (0 if another reconciliation is running).
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        acquired = await db.scalar(
+            text("SELECT pg_try_advisory_xact_lock(hashtext('channel_queue_stats'))")
+        )
+        if not acquired:
+            log.info("queue_stats_reconcile_skipped", reason="reconcile_in_progress")
+            return 0
+        await db.execute(text("LOCK TABLE channel_queue_stats IN EXCLUSIVE MODE"))
+
+    actual = await count_tasks(db)
+    stored = {
+        (row.channel_id, row.status): row.task_count
+        for row in (
+            await db.execute(
+                select(
+                    ChannelStatusCount.channel_id,
+                    ChannelStatusCount.status,
+                    ChannelStatusCount.task_count,
+                )
+            )
+        ).all()
+    }
+
+    repairs = []
+    drift = 0
+    for channel_id, status in actual.keys() | stored.keys():
+        expected = actual.get((channel_id, status), 0)
+        current = stored.get((channel_id, status), 0)
+        if expected != current:
+            repairs.append({"channel_id": channel_id, "status": status, "task_count": expected})
+            drift += abs(expected - current)
+    if not repairs:
+        return 0
+
+    dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = dialect_insert(ChannelStatusCount).values(repairs)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["channel_id", "status"],
+            set_={"task_count": stmt.excluded.task_count},
+        )
+    )
+
+    log.warning("queue_stats_drift_repaired", rows=len(repairs), drift=drift)
+    return len(repairs)
+
+
+async def queue_stats_reconcile_loop(interval: float = RECONCILE_INTERVAL_SECONDS) -> None:
+    """Periodically reconcile channel_queue_stats until cancelled.
+
+    Runs alongside the PgQueuer loop in each worker; the advisory lock makes
+    concurrent runs skip.
+
+    Args:
+        interval: Seconds between reconciliations.
+    """
+    from app.database import async_session_factory
+
+    if async_session_factory is None:
+        log.warning("queue_stats_reconcile_disabled", reason="database_not_configured")
+        return
+
+    while True:
+        try:
+            async with async_session_factory() as db, db.begin():
+                await reconcile_queue_stats(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.error("queue_stats_reconcile_failed", error=str(e), exc_info=True)
+        await asyncio.sleep(interval)
+
+
+async def update_queue_depth_metrics(db: AsyncSession) -> dict[str, int]:
+    """Set channel_queue_depth to each channel's pending task count.
+
+    Args:
+        db: Async database session.
+
+    Returns:
+        Pending task count per channel_id.
+    """
+    result = await db.execute(
+        select(Channel.channel_id, status_count(PENDING_STATUSES))
+        .outerjoin(ChannelStatusCount, Channel.id == ChannelStatusCount.channel_id)
+        .group_by(Channel.channel_id)
+    )
+    depths = {channel_id: int(count) for channel_id, count in result.all()}
+    QUEUE_DEPTH.replace({(channel_id,): depth for channel_id, depth in depths.items()})
+    return depths
+
+
+async def collect_queue_depth() -> None:
+    """Metrics scrape hook (skipped when no database is configured).
+
+    Register with app.utils.metrics.REGISTRY.add_collector().
+    """
+    from app.database import async_session_factory
+
+    if async_session_factory is not None:
+        async with async_session_factory() as db:
+            await update_queue_depth_metrics(db)
@@ -43,6 +43,12 @@ from typing import Any
 
 from PIL import Image
 
+from app.services.task_artifacts import (
+    ARTIFACT_COMPOSITE,
+    ArtifactIndex,
+    output_reusable,
+    record_output,
+)
 from app.utils.cli_wrapper import CLIScriptError, run_cli_script
 from app.utils.filesystem import (
     get_character_dir,
@@ -50,6 +56,7 @@ from app.utils.filesystem import (
     get_environment_dir,
 )
 from app.utils.logging import get_logger
+from app.utils.tracing import span
 
 log = get_logger(__name__)
 
@@ -130,12 +137,16 @@ class CompositeCreationService:
     - Implements short transaction pattern (service is stateless)
     """
 
-    def __init__(self, channel_id: str, project_id: str):
+    def __init__(
+        self, channel_id: str, project_id: str, artifacts: ArtifactIndex | None = None
+    ):
         """Initialize composite creation service for specific project.
 
         Args:
             channel_id: Channel identifier for path isolation
             project_id: Project/task identifier (UUID from database)
+            artifacts: Optional artifact index for resume checks and recording
+                outputs (filesystem checks are used without one)
 
         Raises:
             ValueError: If channel_id or project_id contain invalid characters
@@ -146,6 +157,7 @@ class CompositeCreationService:
 
         self.channel_id = channel_id
         self.project_id = project_id
+        self.artifacts = artifacts
         self.log = get_logger(__name__)
 
     def create_composite_manifest(self, topic: str, story_direction: str) -> CompositeManifest:
@@ -304,7 +316,13 @@ class CompositeCreationService:
 
         for composite in manifest.composites:
             # Skip existing composites if resume mode enabled
-            if resume and self.check_composite_exists(composite.output_path):
+            if resume and await output_reusable(
+                self.artifacts,
+                composite.output_path,
+                ARTIFACT_COMPOSITE,
+                self.check_composite_exists,
+                composite.clip_number,
+            ):
                 self.log.info(
                     "composite_skipped_exists",
                     clip_number=composite.clip_number,
@@ -313,76 +331,84 @@ class CompositeCreationService:
                 skipped += 1
                 continue
 
-            try:
-                if composite.is_split_screen:
-                    # Split-screen: Use inline PIL composition
-                    await self.create_split_screen_composite(
-                        composite.character_path,
-                        composite.environment_path,
-                        composite.character_b_path,  # type: ignore
-                        composite.environment_b_path,  # type: ignore
-                        composite.output_path,
-                    )
-                else:
-                    # Standard composite: Use CLI script
-                    await run_cli_script(
-                        "create_composite.py",
-                        [
-                            "--character",
-                            str(composite.character_path),
-                            "--environment",
-                            str(composite.environment_path),
-                            "--output",
-                            str(composite.output_path),
-                            "--scale",
-                            str(composite.character_scale),
-                        ],
-                        timeout=30,  # 30 seconds per composite
-                    )
-
-                # Verify output exists and is correct dimensions
-                if not composite.output_path.exists():
-                    raise FileNotFoundError(f"Composite not created: {composite.output_path}")
-
-                # Verify dimensions (1920x1080)
-                with Image.open(composite.output_path) as img:
-                    if img.size != (1920, 1080):
-                        raise ValueError(
-                            f"Composite has incorrect dimensions: {img.size}, expected (1920, 1080)"
+            with span("clip.composite", clip_number=composite.clip_number):
+                try:
+                    if composite.is_split_screen:
+                        # Split-screen: Use inline PIL composition
+                        await self.create_split_screen_composite(
+                            composite.character_path,
+                            composite.environment_path,
+                            composite.character_b_path,  # type: ignore
+                            composite.environment_b_path,  # type: ignore
+                            composite.output_path,
+                        )
+                    else:
+                        # Standard composite: Use CLI script
+                        await run_cli_script(
+                            "create_composite.py",
+                            [
+                                "--character",
+                                str(composite.character_path),
+                                "--environment",
+                                str(composite.environment_path),
+                                "--output",
+                                str(composite.output_path),
+                                "--scale",
+                                str(composite.character_scale),
+                            ],
+                            timeout=30,  # 30 seconds per composite
                         )
 
-                self.log.info(
-                    "composite_generated",
-                    clip_number=composite.clip_number,
-                    output_path=str(composite.output_path),
-                    is_split_screen=composite.is_split_screen,
-                )
-                generated += 1
-
-            except CLIScriptError as e:
-                self.log.error(
-                    "composite_generation_error",
-                    clip_number=composite.clip_number,
-                    script=e.script,
-                    exit_code=e.exit_code,
-                    stderr=e.stderr[:500],  # Truncate stderr
-                    character_path=str(composite.character_path),
-                    environment_path=str(composite.environment_path),
-                )
-                failed += 1
-                # Re-raise to mark task as failed and allow retry
-                raise
+                    # Verify output exists and is correct dimensions
+                    if not composite.output_path.exists():
+                        raise FileNotFoundError(f"Composite not created: {composite.output_path}")
+
+                    # Verify dimensions (1920x1080)
+                    with Image.open(composite.output_path) as img:
+                        if img.size != (1920, 1080):
+                            raise ValueError(
+                                f"Composite has incorrect dimensions: {img.size}, "
+                                "expected (1920, 1080)"
+                            )
+                    await record_output(
+                        self.artifacts,
+                        composite.output_path,
+                        ARTIFACT_COMPOSITE,
+                        composite.clip_number,
+                    )
 
-            except Exception as e:
-                self.log.error(
-                    "composite_generation_unexpected_error",
-                    clip_number=composite.clip_number,
-                    error=str(e),
-                    output_path=str(composite.output_path),
-                )
-                failed += 1
-                # Re-raise to mark task as failed
-                raise
+                    self.log.info(
+                        "composite_generated",
+                        clip_number=composite.clip_number,
+                        output_path=str(composite.output_path),
+                        is_split_screen=composite.is_split_screen,
+                    )
+                    generated += 1
+
+                except CLIScriptError as e:
+                    self.log.error(
+                        "composite_generation_error",
+                        clip_number=composite.clip_number,
+                        script=e.script,
+                        exit_code=e.exit_code,
+                        stderr=e.stderr[:500],  # Truncate stderr
+                        character_path=str(composite.character_path),
+                        environment_path=str(composite.environment_path),
+                    )
+                    failed += 1
+                    # Re-raise to mark task as failed and allow retry
+                    raise
+
+                except Exception as e:
+                    self.log.error(
+                        "composite_generation_unexpected_error",
+                        clip_number=composite.clip_number,
+                        error=str(e),
+                        output_path=str(composite.output_path),
+                    )
+                    failed += 1
+                    # Re-raise to mark task as failed
+                    raise
 
         self.log.info(
             "composite_generation_complete",
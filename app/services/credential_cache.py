@@ -0,0 +1,164 @@
+"""In-memory cache of decrypted channel credentials.
+
+Every CredentialService.get_* call queried the Channel row and ran Fernet
+decryption (HMAC check + AES), and StorageStrategyService.get_r2_config
+decrypted three fields per call. With per-channel keys resolved on per-clip
+paths, the same ciphertexts were decrypted over and over.
+
+Architecture Pattern:
+    - Per process: Entries live in this process only; nothing decrypted is
+      ever written to disk, the database or a shared cache
+    - Short TTL: Entries expire after CREDENTIAL_CACHE_TTL_SECONDS (default
+      60), bounding how long a change made by another process goes unseen
+    - Invalidation: CredentialService.store_* and channel config syncs drop
+      the channel's entries as soon as they commit
+    - Zeroization: Values are held in bytearrays that are overwritten with
+      zeros when an entry expires, is invalidated or is evicted (LRU beyond
+      CREDENTIAL_CACHE_MAX_ENTRIES). Strings handed to callers are ordinary
+      immutable Python strings and cannot be wiped - same as before caching
+    - Absence cached: "channel has no credential" is cached too (value None),
+      so unconfigured channels do not query the database on every lookup;
+      unknown channels are never cached
+
+Usage:
+    from app.services.credential_cache import credential_cache
+
+    hit, value = credential_cache.get("poke1", "notion_token")
+    if not hit:
+        value = decrypt(...)
+        credential_cache.put("poke1", "notion_token", value)
+
+References:
+    - app/services/credential_service.py: Token and API key lookups
+    - app/services/storage_strategy_service.py: R2 credential lookups
+    - app/config.py: get_credential_cache_ttl_seconds
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+import structlog
+
+from app.config import get_credential_cache_ttl_seconds
+
+log = structlog.get_logger(__name__)
+
+# Entries kept before the least recently used one is evicted
+CREDENTIAL_CACHE_MAX_ENTRIES = 1024
+
+
+def _wipe(buffer: bytearray | None) -> None:
+    """Overwrite a cached value in place."""
+    if buffer is not None:
+        buffer[:] = bytes(len(buffer))
+
+
+class CredentialCache:
+    """TTL + LRU cache of decrypted credentials keyed by (channel_id, credential_type)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        max_entries: int = CREDENTIAL_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize cache.
+
+        Args:
+            ttl_seconds: Entry lifetime (defaults to CREDENTIAL_CACHE_TTL_SECONDS,
+                read from the environment on first use). 0 disables caching.
+            max_entries: Maximum cached entries.
+            clock: Monotonic clock (tests).
+        """
+        self._ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[bytearray | None, float]] = (
+            OrderedDict()
+        )
+        # Lookups also come from worker threads (asyncio.to_thread callers)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        """Entry lifetime in seconds."""
+        if self._ttl_seconds is None:
+            self._ttl_seconds = get_credential_cache_ttl_seconds()
+        return self._ttl_seconds
+
+    def get(self, channel_id: str, credential_type: str) -> tuple[bool, str | None]:
+        """Look up a credential.
+
+        Returns:
+            (hit, value): hit is False if the caller must load the credential;
+            value is None on a hit for a channel without the credential.
+        """
+        key = (channel_id, credential_type)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            buffer, expires_at = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                _wipe(buffer)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, None if buffer is None else buffer.decode()
+
+    def put(self, channel_id: str, credential_type: str, value: str | None) -> None:
+        """Cache a decrypted credential (None: the channel has none)."""
+        if self.ttl_seconds <= 0:
+            return
+        key = (channel_id, credential_type)
+        buffer = None if value is None else bytearray(value.encode())
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                _wipe(previous[0])
+            self._entries[key] = (buffer, self._clock() + self.ttl_seconds)
+            while len(self._entries) > self.max_entries:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                _wipe(evicted)
+
+    def invalidate(self, channel_id: str, credential_type: str | None = None) -> None:
+        """Drop one credential of a channel, or all of them (credential_type None)."""
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if key[0] == channel_id and credential_type in (None, key[1])
+            ]
+            for key in keys:
+                _wipe(self._entries.pop(key)[0])
+        if keys:
+            log.debug(
+                "credential_cache_invalidated",
+                channel_id=channel_id,
+                credential_type=credential_type,
+                entries=len(keys),
+            )
+
+    def clear(self) -> None:
+        """Drop (and wipe) every entry."""
+        with self._lock:
+            for buffer, _ in self._entries.values():
+                _wipe(buffer)
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached credentials (expired entries count until looked up)."""
+        return len(self._entries)
+
+
+# Process-wide cache shared by CredentialService and StorageStrategyService
+credential_cache = CredentialCache()
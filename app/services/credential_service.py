@@ -13,7 +13,10 @@ Usage:
 
 Security Notes:
     - Credentials are encrypted before database storage
-    - Access events are logged with structlog (channel_id, operation, success)
+    - Decrypted values are cached in memory per process for a short TTL
+      (app.services.credential_cache); store_* invalidates immediately
+    - Access events are logged with structlog (channel_id, operation, success);
+      cache hits are logged at debug level
     - NEVER log or expose plaintext credentials
     - Use short database transactions (get → close → encrypt → save)
 """
@@ -23,6 +26,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Channel
+from app.services.credential_cache import credential_cache
 from app.utils.encryption import DecryptionError, get_encryption_service
 
 log = structlog.get_logger(__name__)
@@ -54,6 +58,81 @@ class CredentialService:
         result = await db.execute(select(Channel).where(Channel.channel_id == channel_id))
         return result.scalar_one_or_none()
 
+    async def _get_credential(
+        self, channel_id: str, db: AsyncSession, credential_type: str
+    ) -> str | None:
+        """Return a decrypted credential, from the cache when possible.
+
+        On a miss the channel is queried and the `{credential_type}_encrypted`
+        column decrypted; the result (including "no credential") is cached.
+        Unknown channels and decryption failures are not cached.
+
+        Args:
+            channel_id: Business identifier (e.g., "poke1").
+            db: Async database session.
+            credential_type: "youtube_token", "notion_token", "gemini_key"
+                or "elevenlabs_key".
+
+        Returns:
+            Decrypted credential, or None if the channel has none.
+
+        Raises:
+            DecryptionError: If decryption fails (invalid key or corrupted data).
+        """
+        hit, cached = credential_cache.get(channel_id, credential_type)
+        if hit:
+            log.debug(
+                "credential_get",
+                channel_id=channel_id,
+                credential_type=credential_type,
+                success=True,
+                has_credential=cached is not None,
+                cached=True,
+            )
+            return cached
+
+        channel = await self._get_channel(channel_id, db)
+        if channel is None:
+            log.warning(
+                "credential_get_failed",
+                channel_id=channel_id,
+                credential_type=credential_type,
+                reason="channel_not_found",
+            )
+            return None
+
+        encrypted: bytes | None = getattr(channel, f"{credential_type}_encrypted")
+        if encrypted is None:
+            credential_cache.put(channel_id, credential_type, None)
+            log.info(
+                "credential_get",
+                channel_id=channel_id,
+                credential_type=credential_type,
+                success=True,
+                has_credential=False,
+            )
+            return None
+
+        encryption_service = get_encryption_service()
+        try:
+            decrypted = encryption_service.decrypt(encrypted, channel_id=channel_id)
+        except DecryptionError:
+            log.error(
+                "credential_decrypt_failed",
+                channel_id=channel_id,
+                credential_type=credential_type,
+            )
+            raise
+        credential_cache.put(channel_id, credential_type, decrypted)
+        log.info(
+            "credential_get",
+            channel_id=channel_id,
+            credential_type=credential_type,
+            success=True,
+            has_credential=True,
+        )
+        return decrypted
+
     async def store_youtube_token(self, channel_id: str, token: str, db: AsyncSession) -> None:
         """Store encrypted YouTube OAuth refresh token for channel.
 
@@ -83,6 +162,7 @@ class CredentialService:
 
         channel.youtube_token_encrypted = encrypted_token
         await db.commit()
+        credential_cache.invalidate(channel_id, "youtube_token")
 
         log.info(
             "credential_stored",
@@ -109,46 +189,7 @@ class CredentialService:
             >>> if token:
             ...     # Use token for YouTube API
         """
-        channel = await self._get_channel(channel_id, db)
-        if channel is None:
-            log.warning(
-                "credential_get_failed",
-                channel_id=channel_id,
-                credential_type="youtube_token",
-                reason="channel_not_found",
-            )
-            return None
-
-        if channel.youtube_token_encrypted is None:
-            log.info(
-                "credential_get",
-                channel_id=channel_id,
-                credential_type="youtube_token",
-                success=True,
-                has_credential=False,
-            )
-            return None
-
-        encryption_service = get_encryption_service()
-        try:
-            decrypted = encryption_service.decrypt(
-                channel.youtube_token_encrypted, channel_id=channel_id
-            )
-            log.info(
-                "credential_get",
-                channel_id=channel_id,
-                credential_type="youtube_token",
-                success=True,
-                has_credential=True,
-            )
-            return decrypted
-        except DecryptionError:
-            log.error(
-                "credential_decrypt_failed",
-                channel_id=channel_id,
-                credential_type="youtube_token",
-            )
-            raise
+        return await self._get_credential(channel_id, db, "youtube_token")
 
     async def store_notion_token(self, channel_id: str, token: str, db: AsyncSession) -> None:
         """Store encrypted Notion integration token for channel.
@@ -179,6 +220,7 @@ class CredentialService:
 
         channel.notion_token_encrypted = encrypted_token
         await db.commit()
+        credential_cache.invalidate(channel_id, "notion_token")
 
         log.info(
             "credential_stored",
@@ -205,46 +247,7 @@ class CredentialService:
             >>> if token:
             ...     # Use token for Notion API
         """
-        channel = await self._get_channel(channel_id, db)
-        if channel is None:
-            log.warning(
-                "credential_get_failed",
-                channel_id=channel_id,
-                credential_type="notion_token",
-                reason="channel_not_found",
-            )
-            return None
-
-        if channel.notion_token_encrypted is None:
-            log.info(
-                "credential_get",
-                channel_id=channel_id,
-                credential_type="notion_token",
-                success=True,
-                has_credential=False,
-            )
-            return None
-
-        encryption_service = get_encryption_service()
-        try:
-            decrypted = encryption_service.decrypt(
-                channel.notion_token_encrypted, channel_id=channel_id
-            )
-            log.info(
-                "credential_get",
-                channel_id=channel_id,
-                credential_type="notion_token",
-                success=True,
-                has_credential=True,
-            )
-            return decrypted
-        except DecryptionError:
-            log.error(
-                "credential_decrypt_failed",
-                channel_id=channel_id,
-                credential_type="notion_token",
-            )
-            raise
+        return await self._get_credential(channel_id, db, "notion_token")
 
     async def store_gemini_key(self, channel_id: str, api_key: str, db: AsyncSession) -> None:
         """Store encrypted Gemini API key for channel.
@@ -272,6 +275,7 @@ class CredentialService:
 
         channel.gemini_key_encrypted = encrypted_key
         await db.commit()
+        credential_cache.invalidate(channel_id, "gemini_key")
 
         log.info(
             "credential_stored",
@@ -293,46 +297,7 @@ class CredentialService:
         Raises:
             DecryptionError: If decryption fails (invalid key or corrupted data).
         """
-        channel = await self._get_channel(channel_id, db)
-        if channel is None:
-            log.warning(
-                "credential_get_failed",
-                channel_id=channel_id,
-                credential_type="gemini_key",
-                reason="channel_not_found",
-            )
-            return None
-
-        if channel.gemini_key_encrypted is None:
-            log.info(
-                "credential_get",
-                channel_id=channel_id,
-                credential_type="gemini_key",
-                success=True,
-                has_credential=False,
-            )
-            return None
-
-        encryption_service = get_encryption_service()
-        try:
-            decrypted = encryption_service.decrypt(
-                channel.gemini_key_encrypted, channel_id=channel_id
-            )
-            log.info(
-                "credential_get",
-                channel_id=channel_id,
-                credential_type="gemini_key",
-                success=True,
-                has_credential=True,
-            )
-            return decrypted
-        except DecryptionError:
-            log.error(
-                "credential_decrypt_failed",
-                channel_id=channel_id,
-                credential_type="gemini_key",
-            )
-            raise
+        return await self._get_credential(channel_id, db, "gemini_key")
 
     async def store_elevenlabs_key(self, channel_id: str, api_key: str, db: AsyncSession) -> None:
         """Store encrypted ElevenLabs API key for channel.
@@ -360,6 +325,7 @@ class CredentialService:
 
         channel.elevenlabs_key_encrypted = encrypted_key
         await db.commit()
+        credential_cache.invalidate(channel_id, "elevenlabs_key")
 
         log.info(
             "credential_stored",
@@ -381,43 +347,4 @@ class CredentialService:
         Raises:
             DecryptionError: If decryption fails (invalid key or corrupted data).
         """
-        channel = await self._get_channel(channel_id, db)
-        if channel is None:
-            log.warning(
-                "credential_get_failed",
-                channel_id=channel_id,
-                credential_type="elevenlabs_key",
-                reason="channel_not_found",
-            )
-            return None
-
-        if channel.elevenlabs_key_encrypted is None:
-            log.info(
-                "credential_get",
-                channel_id=channel_id,
-                credential_type="elevenlabs_key",
-                success=True,
-                has_credential=False,
-            )
-            return None
-
-        encryption_service = get_encryption_service()
-        try:
-            decrypted = encryption_service.decrypt(
-                channel.elevenlabs_key_encrypted, channel_id=channel_id
-            )
-            log.info(
-                "credential_get",
-                channel_id=channel_id,
-                credential_type="elevenlabs_key",
-                success=True,
-                has_credential=True,
-            )
-            return decrypted
-        except DecryptionError:
-            log.error(
-                "credential_decrypt_failed",
-                channel_id=channel_id,
-                credential_type="elevenlabs_key",
-            )
-            raise
+        return await self._get_credential(channel_id, db, "elevenlabs_key")
@@ -41,6 +41,7 @@ Usage:
 import asyncio
 import re
 import subprocess
+import uuid
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
@@ -53,9 +54,17 @@ from tenacity import (
     wait_exponential,
 )
 
+from app.services.api_concurrency import api_slots
+from app.services.task_artifacts import (
+    ARTIFACT_NARRATION,
+    ArtifactIndex,
+    output_reusable,
+    record_output,
+)
 from app.utils.cli_wrapper import CLIScriptError, run_cli_script
 from app.utils.filesystem import get_audio_dir
 from app.utils.logging import get_logger
+from app.utils.tracing import traced
 
 log = get_logger(__name__)
 
@@ -180,12 +189,21 @@ class NarrationGenerationService:
     - CLI Script (Dumb): Calls ElevenLabs API, downloads MP3
     """
 
-    def __init__(self, channel_id: str, project_id: str) -> None:
+    def __init__(
+        self,
+        channel_id: str,
+        project_id: str,
+        artifacts: ArtifactIndex | None = None,
+        task_id: uuid.UUID | None = None,
+    ) -> None:
         """Initialize narration generation service for specific project.
 
         Args:
             channel_id: Channel identifier for path isolation and voice_id lookup
             project_id: Project/task identifier (UUID from database)
+            artifacts: Optional artifact index for resume checks and recording
+                outputs (filesystem checks are used without one)
+            task_id: Task UUID recorded on API slot leases (attributes leaked leases)
 
         Raises:
             ValueError: If channel_id or project_id contain invalid characters
@@ -194,6 +212,8 @@ class NarrationGenerationService:
         _validate_identifier(project_id, "project_id")
         self.channel_id = channel_id
         self.project_id = project_id
+        self.artifacts = artifacts
+        self.task_id = task_id
         self.log = get_logger(__name__)
 
     async def create_narration_manifest(
@@ -377,12 +397,13 @@ class NarrationGenerationService:
                 Re-raises on final retry exhaustion after 3 attempts
             """
             try:
-                await run_cli_script(
-                    "generate_audio.py",
-                    ["--text", clip.narration_text, "--output", str(clip.output_path)],
-                    timeout=60,  # 1 minute max per clip
-                    env=cli_env,  # Pass isolated voice_id (prevents multi-channel pollution)
-                )
+                async with api_slots.slot("elevenlabs", task_id=self.task_id):
+                    await run_cli_script(
+                        "generate_audio.py",
+                        ["--text", clip.narration_text, "--output", str(clip.output_path)],
+                        timeout=60,  # 1 minute max per clip
+                        env=cli_env,  # Pass isolated voice_id (prevents multi-channel pollution)
+                    )
             except CLIScriptError as e:
                 # Check if error is retriable
                 if not _is_retriable_error(e):
@@ -404,6 +425,7 @@ class NarrationGenerationService:
                 )
                 raise  # Re-raise for tenacity to retry
 
+        @traced("clip.narration", lambda clip: {"clip_number": clip.clip_number})
         async def generate_single_clip(clip: NarrationClip) -> bool:
             """Generate a single audio clip with concurrency control.
 
@@ -414,7 +436,13 @@ class NarrationGenerationService:
 
             async with semaphore:
                 # Check if audio exists (for resume functionality)
-                if resume and self.check_audio_exists(clip.output_path):
+                if resume and await output_reusable(
+                    self.artifacts,
+                    clip.output_path,
+                    ARTIFACT_NARRATION,
+                    self.check_audio_exists,
+                    clip.clip_number,
+                ):
                     skipped += 1
                     self.log.info(
                         "audio_clip_skipped",
@@ -441,6 +469,7 @@ class NarrationGenerationService:
                         raise ValueError(f"Audio file not created: {clip.output_path}")
 
                     # Validate audio duration (optional but recommended)
+                    duration: float | None = None
                     try:
                         duration = await self.validate_audio_duration(clip.output_path)
                         self.log.info(
@@ -467,6 +496,14 @@ class NarrationGenerationService:
                             error=str(e),
                         )
 
+                    await record_output(
+                        self.artifacts,
+                        clip.output_path,
+                        ARTIFACT_NARRATION,
+                        clip.clip_number,
+                        duration,
+                    )
+
                     generated += 1
                     return True
 
@@ -10,6 +10,8 @@ Key Responsibilities:
 - Link assets to parent task via relation property
 - Support both Notion file attachments and R2 public URLs
 - Respect 3 req/sec rate limiting (inherited from NotionClient)
+- Create entries concurrently with payloads prepared up front, skipping
+  entries already created for the task (app.services.notion_bulk)
 
 Architecture Pattern:
     Service (Smart): Reads asset files, uploads/stores URLs, creates entries
@@ -39,6 +41,7 @@ from uuid import UUID
 from app.clients.notion import NotionClient
 from app.config import get_notion_assets_database_id, get_notion_tasks_collection_id
 from app.models import Channel
+from app.services.notion_bulk import NotionPageLedger, PageRequest, create_pages
 from app.utils.logging import get_logger
 
 log = get_logger(__name__)
@@ -61,15 +64,23 @@ class NotionAssetService:
     - NOTION_TASKS_COLLECTION_ID: Notion Tasks collection ID (env var)
     """
 
-    def __init__(self, notion_client: NotionClient, channel: Channel):
+    def __init__(
+        self,
+        notion_client: NotionClient,
+        channel: Channel,
+        ledger: NotionPageLedger | None = None,
+    ):
         """Initialize asset service with Notion client and channel config.
 
         Args:
             notion_client: Rate-limited Notion API client
             channel: Channel model with storage_strategy configuration
+            ledger: Optional record of the task's created pages; entries
+                already recorded are skipped (idempotent re-runs)
         """
         self.notion_client = notion_client
         self.channel = channel
+        self.ledger = ledger
         self.log = get_logger(__name__)
 
         # Load database IDs from configuration (not hardcoded)
@@ -100,6 +111,7 @@ class NotionAssetService:
         Returns:
             Summary dict with keys:
                 - created: Number of asset entries created
+                - skipped: Number of entries created by an earlier run
                 - failed: Number of failed asset entries
                 - storage_strategy: "notion" or "r2"
 
@@ -122,8 +134,6 @@ class NotionAssetService:
             >>> print(result)
             {"created": 1, "failed": 0, "storage_strategy": "notion"}
         """
-        created = 0
-        failed = 0
         storage_strategy = self.channel.storage_strategy
 
         self.log.info(
@@ -134,58 +144,74 @@ class NotionAssetService:
             asset_count=len(asset_files),
             storage_strategy=storage_strategy,
         )
+        if asset_files:
+            self._log_storage_warning(
+                storage_strategy, correlation_id, asset_count=len(asset_files)
+            )
 
-        for asset in asset_files:
-            try:
-                # Create Asset entry in Notion
-                await self._create_asset_entry(
+        # Prepare every payload up front, then create pages concurrently
+        requests = [
+            PageRequest(
+                key=f"asset:{asset['asset_type']}:{asset['name']}",
+                database_id=self.assets_database_id,
+                properties=self._build_asset_properties(
                     notion_page_id=notion_page_id,
                     asset_type=asset["asset_type"],
                     asset_name=asset["name"],
-                    asset_path=asset["output_path"],
-                    storage_strategy=storage_strategy,
-                    correlation_id=correlation_id,
-                )
-                created += 1
+                ),
+            )
+            for asset in asset_files
+        ]
+        result = await create_pages(
+            self.notion_client, requests, ledger=self.ledger, correlation_id=correlation_id
+        )
 
+        for asset, request in zip(asset_files, requests, strict=True):
+            error = result.failed.get(request.key)
+            if error is None:
                 self.log.info(
                     "asset_entry_created",
                     correlation_id=correlation_id,
                     task_id=str(task_id),
                     asset_name=asset["name"],
                     asset_type=asset["asset_type"],
+                    existing=request.key in result.existing,
                 )
-
-            except Exception as e:
-                failed += 1
+            else:
+                # Remaining assets were still created; only this entry failed
                 self.log.error(
                     "asset_entry_failed",
                     correlation_id=correlation_id,
                     task_id=str(task_id),
                     asset_name=asset["name"],
                     asset_type=asset["asset_type"],
-                    error=str(e),
-                    exc_info=True,
+                    error=str(error),
+                    error_type=type(error).__name__,
                 )
-                # Continue with remaining assets instead of failing entire batch
+
+        created = len(result.created)
+        failed = len(result.failed)
+        skipped = len(result.existing)
 
         self.log.info(
             "populate_assets_complete",
             correlation_id=correlation_id,
             task_id=str(task_id),
             created=created,
+            skipped=skipped,
             failed=failed,
             storage_strategy=storage_strategy,
         )
 
         # Check if all assets failed (critical failure)
-        if failed > 0 and created == 0:
+        if failed > 0 and created == 0 and skipped == 0:
             raise RuntimeError(
                 f"All {failed} assets failed to populate in Notion. Check error logs."
             )
 
         return {
             "created": created,
+            "skipped": skipped,
             "failed": failed,
             "storage_strategy": storage_strategy,
         }
@@ -215,10 +241,42 @@ class NotionAssetService:
             NotionAPIError: On non-retriable errors
             NotionRateLimitError: After retry exhaustion
         """
-        # Prepare asset properties
+        properties = self._build_asset_properties(notion_page_id, asset_type, asset_name)
+        self._log_storage_warning(storage_strategy, correlation_id, asset_name=asset_name)
+
+        # Create page in Assets database using NotionClient method (rate limited, auto-retry)
+        try:
+            return await self.notion_client.create_page(
+                database_id=self.assets_database_id,
+                properties=properties,
+            )
+        except Exception as e:
+            self.log.error(
+                "notion_create_page_failed",
+                correlation_id=correlation_id,
+                asset_name=asset_name,
+                database_id=self.assets_database_id,
+                error=str(e),
+                exc_info=True,
+            )
+            raise
+
+    def _build_asset_properties(
+        self, notion_page_id: str, asset_type: str, asset_name: str
+    ) -> dict[str, Any]:
+        """Build the properties payload of an Asset entry.
+
+        Args:
+            notion_page_id: Parent task page ID
+            asset_type: "character" | "environment" | "prop"
+            asset_name: Asset filename without extension
+
+        Returns:
+            Notion page properties
+        """
         current_date = datetime.now(timezone.utc).isoformat()
 
-        properties: dict[str, Any] = {
+        return {
             "Asset Name": {
                 "title": [
                     {
@@ -240,19 +298,26 @@ class NotionAssetService:
                 "relation": [
                     {"id": notion_page_id}
                 ]
-            }
+            },
+            # File URL property MUST exist in schema even if value is None
+            # (null until external storage upload is implemented)
+            "File URL": {
+                "url": None
+            },
         }
 
-        # Handle file storage based on strategy
-        file_url: str | None = None
+    def _log_storage_warning(
+        self, storage_strategy: str, correlation_id: str | None, **context: Any
+    ) -> None:
+        """Log that file URLs stay null until external storage is implemented."""
         if storage_strategy == "notion":
             # Notion API doesn't support direct file uploads
             # Files must be uploaded to external storage first
             self.log.warning(
                 "notion_file_upload_requires_external_storage",
                 correlation_id=correlation_id,
-                asset_name=asset_name,
                 message="Notion requires external file URL. File URL property will be null.",
+                **context,
             )
         elif storage_strategy == "r2":
             # R2 upload would happen here
@@ -260,35 +325,6 @@ class NotionAssetService:
             self.log.warning(
                 "r2_upload_not_implemented",
                 correlation_id=correlation_id,
-                asset_name=asset_name,
                 message="R2 upload not yet implemented, File URL property will be null",
+                **context,
             )
-
-        # Add File URL property (null if upload not implemented)
-        # This property MUST exist in schema even if value is None
-        if file_url:
-            properties["File URL"] = {
-                "url": file_url
-            }
-        else:
-            # Set to null explicitly - shows property exists but needs implementation
-            properties["File URL"] = {
-                "url": None
-            }
-
-        # Create page in Assets database using NotionClient method (rate limited, auto-retry)
-        try:
-            return await self.notion_client.create_page(
-                database_id=self.assets_database_id,
-                properties=properties,
-            )
-        except Exception as e:
-            self.log.error(
-                "notion_create_page_failed",
-                correlation_id=correlation_id,
-                asset_name=asset_name,
-                database_id=self.assets_database_id,
-                error=str(e),
-                exc_info=True,
-            )
-            raise
@@ -11,6 +11,8 @@ Key Responsibilities:
 - Support both Notion file attachments and R2 public URLs
 - Handle dual audio types: narration (MP3) and SFX (WAV)
 - Respect 3 req/sec rate limiting (inherited from NotionClient)
+- Create entries concurrently with payloads prepared up front, skipping
+  entries already created for the task (app.services.notion_bulk)
 
 Architecture Pattern:
     Service (Smart): Reads audio files, uploads/stores URLs, creates entries
@@ -42,6 +44,7 @@ from uuid import UUID
 from app.clients.notion import NotionClient
 from app.config import get_notion_audio_database_id, get_notion_tasks_collection_id
 from app.models import Channel
+from app.services.notion_bulk import NotionPageLedger, PageRequest, create_pages
 from app.utils.logging import get_logger
 
 log = get_logger(__name__)
@@ -65,15 +68,23 @@ class NotionAudioService:
     - NOTION_TASKS_COLLECTION_ID: Notion Tasks collection ID (env var)
     """
 
-    def __init__(self, notion_client: NotionClient, channel: Channel):
+    def __init__(
+        self,
+        notion_client: NotionClient,
+        channel: Channel,
+        ledger: NotionPageLedger | None = None,
+    ):
         """Initialize audio service with Notion client and channel config.
 
         Args:
             notion_client: Rate-limited Notion API client
             channel: Channel model with storage_strategy configuration
+            ledger: Optional record of the task's created pages; entries
+                already recorded are skipped (idempotent re-runs)
         """
         self.notion_client = notion_client
         self.channel = channel
+        self.ledger = ledger
         self.log = get_logger(__name__)
 
         # Load database IDs from configuration (not hardcoded)
@@ -110,6 +121,7 @@ class NotionAudioService:
         Returns:
             Summary dict with keys:
                 - created: Number of audio entries created
+                - skipped: Number of entries created by an earlier run
                 - failed: Number of failed audio entries
                 - narration_count: Number of narration clips created
                 - sfx_count: Number of SFX clips created
@@ -141,10 +153,6 @@ class NotionAudioService:
             >>> print(result)
             {"created": 2, "failed": 0, "narration_count": 1, "sfx_count": 1, "storage_strategy": "r2"}
         """
-        created = 0
-        failed = 0
-        narration_count = 0
-        sfx_count = 0
         storage_strategy = self.channel.storage_strategy
 
         self.log.info(
@@ -157,88 +165,75 @@ class NotionAudioService:
             total_audio_count=len(narration_files) + len(sfx_files),
             storage_strategy=storage_strategy,
         )
+        if narration_files or sfx_files:
+            self._log_storage_warning(
+                storage_strategy,
+                correlation_id,
+                audio_count=len(narration_files) + len(sfx_files),
+            )
 
-        # Process narration clips (type="narration")
-        for narration in narration_files:
-            try:
-                # Create Audio entry in Notion
-                await self._create_audio_entry(
+        # Prepare every payload up front (narration first, then SFX),
+        # then create pages concurrently
+        entries = [("narration", audio) for audio in narration_files] + [
+            ("sfx", audio) for audio in sfx_files
+        ]
+        requests = [
+            PageRequest(
+                key=f"{audio_type}:{audio['clip_number']:02d}",
+                database_id=self.audio_database_id,
+                properties=self._build_audio_properties(
                     notion_page_id=notion_page_id,
-                    clip_number=narration["clip_number"],
-                    audio_type="narration",
-                    audio_path=narration["output_path"],
-                    duration=narration.get("duration", 0.0),
-                    storage_strategy=storage_strategy,
-                    correlation_id=correlation_id,
-                )
-                created += 1
-                narration_count += 1
+                    clip_number=audio["clip_number"],
+                    audio_type=audio_type,
+                    audio_path=audio["output_path"],
+                    duration=audio.get("duration", 0.0),
+                ),
+            )
+            for audio_type, audio in entries
+        ]
+        result = await create_pages(
+            self.notion_client, requests, ledger=self.ledger, correlation_id=correlation_id
+        )
 
+        created_by_type = {"narration": 0, "sfx": 0}
+        for (audio_type, audio), request in zip(entries, requests, strict=True):
+            error = result.failed.get(request.key)
+            if error is None:
+                if request.key in result.created:
+                    created_by_type[audio_type] += 1
                 self.log.info(
                     "audio_entry_created",
                     correlation_id=correlation_id,
                     task_id=str(task_id),
-                    audio_type="narration",
-                    clip_number=narration["clip_number"],
-                    duration=narration.get("duration", 0.0),
+                    audio_type=audio_type,
+                    clip_number=audio["clip_number"],
+                    duration=audio.get("duration", 0.0),
+                    existing=request.key in result.existing,
                 )
-
-            except Exception as e:
-                failed += 1
+            else:
+                # Remaining audio was still created; only this entry failed
                 self.log.error(
                     "audio_entry_failed",
                     correlation_id=correlation_id,
                     task_id=str(task_id),
-                    audio_type="narration",
-                    clip_number=narration["clip_number"],
-                    error=str(e),
-                    exc_info=True,
-                )
-                # Continue with remaining audio instead of failing entire batch
-
-        # Process SFX clips (type="sfx")
-        for sfx in sfx_files:
-            try:
-                # Create Audio entry in Notion
-                await self._create_audio_entry(
-                    notion_page_id=notion_page_id,
-                    clip_number=sfx["clip_number"],
-                    audio_type="sfx",
-                    audio_path=sfx["output_path"],
-                    duration=sfx.get("duration", 0.0),
-                    storage_strategy=storage_strategy,
-                    correlation_id=correlation_id,
-                )
-                created += 1
-                sfx_count += 1
-
-                self.log.info(
-                    "audio_entry_created",
-                    correlation_id=correlation_id,
-                    task_id=str(task_id),
-                    audio_type="sfx",
-                    clip_number=sfx["clip_number"],
-                    duration=sfx.get("duration", 0.0),
+                    audio_type=audio_type,
+                    clip_number=audio["clip_number"],
+                    error=str(error),
+                    error_type=type(error).__name__,
                 )
 
-            except Exception as e:
-                failed += 1
-                self.log.error(
-                    "audio_entry_failed",
-                    correlation_id=correlation_id,
-                    task_id=str(task_id),
-                    audio_type="sfx",
-                    clip_number=sfx["clip_number"],
-                    error=str(e),
-                    exc_info=True,
-                )
-                # Continue with remaining audio instead of failing entire batch
+        created = len(result.created)
+        failed = len(result.failed)
+        skipped = len(result.existing)
+        narration_count = created_by_type["narration"]
+        sfx_count = created_by_type["sfx"]
 
         self.log.info(
             "populate_audio_complete",
             correlation_id=correlation_id,
             task_id=str(task_id),
             created=created,
+            skipped=skipped,
             failed=failed,
             narration_count=narration_count,
             sfx_count=sfx_count,
@@ -246,13 +241,14 @@ class NotionAudioService:
         )
 
         # Check if all audio files failed (critical failure)
-        if failed > 0 and created == 0:
+        if failed > 0 and created == 0 and skipped == 0:
             raise RuntimeError(
                 f"All {failed} audio clips failed to populate in Notion. Check error logs."
             )
 
         return {
             "created": created,
+            "skipped": skipped,
             "failed": failed,
             "narration_count": narration_count,
             "sfx_count": sfx_count,
@@ -287,10 +283,55 @@ class NotionAudioService:
             NotionAPIError: On non-retriable errors
             NotionRateLimitError: After retry exhaustion
         """
-        # Prepare audio properties
+        properties = self._build_audio_properties(
+            notion_page_id, clip_number, audio_type, audio_path, duration
+        )
+        self._log_storage_warning(
+            storage_strategy, correlation_id, audio_type=audio_type, clip_number=clip_number
+        )
+
+        # Create page in Audio database using NotionClient method (rate limited, auto-retry)
+        try:
+            return await self.notion_client.create_page(
+                database_id=self.audio_database_id,
+                properties=properties,
+            )
+        except Exception as e:
+            self.log.error(
+                "notion_create_page_failed",
+                correlation_id=correlation_id,
+                audio_type=audio_type,
+                clip_number=clip_number,
+                database_id=self.audio_database_id,
+                error=str(e),
+                exc_info=True,
+            )
+            raise
+
+    def _build_audio_properties(
+        self,
+        notion_page_id: str,
+        clip_number: int,
+        audio_type: str,
+        audio_path: Path,
+        duration: float,
+    ) -> dict[str, Any]:
+        """Build the properties payload of an Audio entry.
+
+        Args:
+            notion_page_id: Parent task page ID
+            clip_number: Clip number (1-18) identifying clip in sequence
+            audio_type: "narration" or "sfx"
+            audio_path: Path to audio file (named in the File property once
+                external storage is implemented)
+            duration: Actual duration in seconds
+
+        Returns:
+            Notion page properties
+        """
         current_date = datetime.now(timezone.utc).isoformat()
 
-        properties: dict[str, Any] = {
+        return {
             "Clip Number": {
                 "number": clip_number
             },
@@ -310,20 +351,26 @@ class NotionAudioService:
                 "relation": [
                     {"id": notion_page_id}
                 ]
-            }
+            },
+            # File property MUST exist in schema even if empty; becomes
+            # [{"name": audio_path.name, "external": {"url": ...}}] with R2 upload
+            "File": {
+                "files": []
+            },
         }
 
-        # Handle file storage based on strategy
-        file_url: str | None = None
+    def _log_storage_warning(
+        self, storage_strategy: str, correlation_id: str | None, **context: Any
+    ) -> None:
+        """Log that the File property stays empty until external storage is implemented."""
         if storage_strategy == "notion":
             # Notion API doesn't support direct file uploads
             # Files must be uploaded to external storage first
             self.log.warning(
                 "notion_file_upload_requires_external_storage",
                 correlation_id=correlation_id,
-                audio_type=audio_type,
-                clip_number=clip_number,
                 message="Notion requires external file URL. File property will be null.",
+                **context,
             )
         elif storage_strategy == "r2":
             # R2 upload would happen here (Story 8.4)
@@ -331,37 +378,6 @@ class NotionAudioService:
             self.log.warning(
                 "r2_upload_not_implemented",
                 correlation_id=correlation_id,
-                audio_type=audio_type,
-                clip_number=clip_number,
                 message="R2 upload not yet implemented (Story 8.4), File property will be null",
+                **context,
             )
-
-        # Add File property (null if upload not implemented)
-        # This property MUST exist in schema even if value is None
-        if file_url:
-            properties["File"] = {
-                "files": [{"name": audio_path.name, "external": {"url": file_url}}]
-            }
-        else:
-            # Set to empty array - shows property exists but needs implementation
-            properties["File"] = {
-                "files": []
-            }
-
-        # Create page in Audio database using NotionClient method (rate limited, auto-retry)
-        try:
-            return await self.notion_client.create_page(
-                database_id=self.audio_database_id,
-                properties=properties,
-            )
-        except Exception as e:
-            self.log.error(
-                "notion_create_page_failed",
-                correlation_id=correlation_id,
-                audio_type=audio_type,
-                clip_number=clip_number,
-                database_id=self.audio_database_id,
-                error=str(e),
-                exc_info=True,
-            )
-            raise
@@ -0,0 +1,258 @@
+"""Bulk Notion page creation for asset, video and audio population.
+
+Each population step creates one Notion page per generated file - 22 assets,
+18 videos, 18 narration and 18 SFX clips per task. Creating them one after
+another leaves the rate limiter idle for most of every request round trip,
+so a step's population took ~N x latency instead of ~N / 3 seconds.
+
+Architecture Pattern:
+    - Prepare: Services build every page payload (PageRequest) before the
+      first request is sent
+    - Submit: create_pages() keeps up to NOTION_MAX_IN_FLIGHT requests in
+      flight; every request still passes the NotionClient rate limiter
+      (3 req/sec), which stays the only throughput bound
+    - Retry: Entries whose requests exhausted the client's retries
+      (NotionRateLimitError) are retried individually after the batch;
+      non-retriable errors (NotionAPIError, bad payloads) fail only their
+      entry
+    - Idempotency: NotionPageLedger records the page IDs Notion returned
+      (task_notion_pages) with one multi-row insert after each round of
+      requests; entries already recorded are skipped, so re-running a step
+      never duplicates pages
+
+Usage:
+    from app.services.notion_bulk import NotionPageLedger, PageRequest, create_pages
+
+    requests = [PageRequest(f"video:{n:02d}", videos_db_id, props) for ...]
+    result = await create_pages(notion_client, requests, ledger=NotionPageLedger(task.id))
+
+References:
+    - app/clients/notion.py: NotionClient.create_page (rate limit, retries)
+    - app/models.py: TaskNotionPage
+"""
+
+import asyncio
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.clients.notion import NotionClient, NotionRateLimitError
+from app.models import TaskNotionPage
+from app.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+# Concurrent create requests (Notion allows an average of 3 requests/sec)
+NOTION_MAX_IN_FLIGHT = 3
+
+# Individual retry rounds for entries that exhausted the client's retries
+RETRY_ROUNDS = 2
+
+# Pause before each retry round (seconds), letting the rate window drain
+RETRY_DELAY_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """One Notion page to create.
+
+    Attributes:
+        key: Entry key, unique within the task (e.g. "video:07").
+        database_id: Target Notion database.
+        properties: Page properties payload.
+    """
+
+    key: str
+    database_id: str
+    properties: dict[str, Any]
+
+
+@dataclass
+class BulkCreateResult:
+    """Outcome of create_pages().
+
+    Attributes:
+        created: Entry key -> page ID for pages created by this call.
+        existing: Entry key -> page ID for entries skipped (already recorded).
+        failed: Entry key -> last error for entries without a page.
+    """
+
+    created: dict[str, str] = field(default_factory=dict)
+    existing: dict[str, str] = field(default_factory=dict)
+    failed: dict[str, Exception] = field(default_factory=dict)
+
+    def has_page(self, key: str) -> bool:
+        """Check whether an entry has a Notion page (created or existing)."""
+        return key in self.created or key in self.existing
+
+
+class NotionPageLedger:
+    """Notion pages already created for one task (task_notion_pages rows)."""
+
+    def __init__(
+        self,
+        task_id: uuid.UUID,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ):
+        """Initialize ledger.
+
+        Args:
+            task_id: Task whose entries are populated.
+            session_factory: Session factory. Defaults to
+                app.database.async_session_factory, resolved lazily.
+        """
+        self.task_id = task_id
+        self._session_factory = session_factory
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession] | None:
+        """Session factory for ledger rows (None → nothing is recorded)."""
+        if self._session_factory is None:
+            from app.database import async_session_factory
+
+            return async_session_factory
+        return self._session_factory
+
+    async def load(self) -> dict[str, str]:
+        """Return entry key -> page ID for the task's recorded pages."""
+        factory = self.session_factory
+        if factory is None:
+            return {}
+        async with factory() as db:
+            result = await db.execute(
+                select(TaskNotionPage.entry_key, TaskNotionPage.notion_page_id).where(
+                    TaskNotionPage.task_id == self.task_id
+                )
+            )
+            return dict(result.all())
+
+    async def record(self, entries: list[tuple[str, str]]) -> None:
+        """Record created pages with one multi-row insert (first record wins).
+
+        Args:
+            entries: (entry key, page ID) pairs.
+        """
+        factory = self.session_factory
+        if factory is None or not entries:
+            return
+        async with factory() as db, db.begin():
+            dialect = db.get_bind().dialect.name
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            await db.execute(
+                dialect_insert(TaskNotionPage)
+                .values(
+                    [
+                        {"task_id": self.task_id, "entry_key": key, "notion_page_id": page_id}
+                        for key, page_id in entries
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["task_id", "entry_key"])
+            )
+
+
+async def create_pages(
+    notion_client: NotionClient,
+    requests: Iterable[PageRequest],
+    *,
+    ledger: NotionPageLedger | None = None,
+    max_in_flight: int = NOTION_MAX_IN_FLIGHT,
+    retry_rounds: int = RETRY_ROUNDS,
+    correlation_id: str | None = None,
+) -> BulkCreateResult:
+    """Create Notion pages concurrently, skipping entries already created.
+
+    Requests are submitted in order with up to max_in_flight outstanding.
+    A failed entry never stops the others; see the module docstring for the
+    retry policy.
+
+    Args:
+        notion_client: Rate-limited Notion client (shared by all requests).
+        requests: Pages to create, payloads fully prepared.
+        ledger: Optional ledger; recorded entries are skipped and new pages
+            are recorded after each round of requests.
+        max_in_flight: Maximum concurrent create requests.
+        retry_rounds: Retry rounds for entries that hit NotionRateLimitError.
+        correlation_id: Optional correlation ID for log tracing.
+
+    Returns:
+        BulkCreateResult with created, existing and failed entries.
+    """
+    result = BulkCreateResult()
+    recorded = await ledger.load() if ledger is not None else {}
+
+    pending: list[PageRequest] = []
+    for request in requests:
+        if request.key in recorded:
+            result.existing[request.key] = recorded[request.key]
+        else:
+            pending.append(request)
+
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def _create(request: PageRequest) -> None:
+        async with semaphore:
+            try:
+                page = await notion_client.create_page(
+                    database_id=request.database_id,
+                    properties=request.properties,
+                )
+            except Exception as e:
+                result.failed[request.key] = e
+                return
+        page_id = str(page.get("id", ""))
+        result.failed.pop(request.key, None)
+        result.created[request.key] = page_id
+        unrecorded.append((request.key, page_id))
+
+    async def _record() -> None:
+        if ledger is None or not unrecorded:
+            return
+        entries = unrecorded.copy()
+        unrecorded.clear()
+        try:
+            await ledger.record(entries)
+        except Exception as e:
+            # The pages exist; a later re-run may duplicate only these entries
+            log.error(
+                "notion_page_record_failed",
+                correlation_id=correlation_id,
+                entry_keys=[key for key, _ in entries],
+                error=str(e),
+            )
+
+    # Pages created in the current round, recorded together once it finishes
+    unrecorded: list[tuple[str, str]] = []
+    await asyncio.gather(*(_create(request) for request in pending))
+    await _record()
+
+    for round_number in range(1, retry_rounds + 1):
+        retry = [
+            request
+            for request in pending
+            if isinstance(result.failed.get(request.key), NotionRateLimitError)
+        ]
+        if not retry:
+            break
+        log.warning(
+            "notion_bulk_retry",
+            correlation_id=correlation_id,
+            round=round_number,
+            entries=[request.key for request in retry],
+        )
+        await asyncio.sleep(RETRY_DELAY_SECONDS)
+        await asyncio.gather(*(_create(request) for request in retry))
+        await _record()
+
+    log.info(
+        "notion_bulk_create_complete",
+        correlation_id=correlation_id,
+        created=len(result.created),
+        existing=len(result.existing),
+        failed=len(result.failed),
+    )
+    return result
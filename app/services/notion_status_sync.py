@@ -0,0 +1,354 @@
+"""Background Notion status updates for bulk review operations.
+
+Bulk approve/reject (Story 5.8) commits up to 100 status changes in one
+transaction. Pushing the new statuses to Notion one task at a time afterwards
+kept the request open for 35+ seconds on a 100-task operation, although the
+review decision was already durable.
+
+Architecture Pattern:
+    - Record: The bulk operation writes one notion_status_syncs row per task
+      in the same transaction as the status changes
+    - Run: NotionStatusSyncJob pushes the statuses in the background with up
+      to NOTION_MAX_IN_FLIGHT updates outstanding; the shared NotionClient
+      limiter (3 req/sec) is the only throughput bound
+    - Track: The outcomes are stored on their rows once every update was
+      attempted (one transaction, one UPDATE per outcome state); the job's
+      live progress is on the job object, and get_sync_progress() reads it
+      from the database (any process, after restarts)
+    - Retry: Failed updates are retried individually with exponential backoff
+      (retry_status_syncs, run by the Notion sync loop) until
+      NOTION_SYNC_MAX_ATTEMPTS; updates left pending by a process that exited
+      are picked up the same way
+
+Usage:
+    from app.services.notion_status_sync import NotionStatusSyncJob, record_status_syncs
+
+    await record_status_syncs(db, items)
+    await db.commit()
+    job = NotionStatusSyncJob(job_id, items, update_status).start()
+    progress = await job.wait()
+
+References:
+    - app/services/review_service.py: bulk_approve_tasks, bulk_reject_tasks
+    - app/models.py: NotionStatusSync
+    - app/services/notion_bulk.py: NOTION_MAX_IN_FLIGHT
+"""
+
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, ClassVar
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import NotionStatusSync, TaskStatus
+from app.services.notion_bulk import NOTION_MAX_IN_FLIGHT
+from app.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+# Sync states
+SYNC_PENDING = "pending"
+SYNC_SYNCED = "synced"
+SYNC_FAILED = "failed"
+
+# Attempts per update before it is left failed for good
+NOTION_SYNC_MAX_ATTEMPTS = 5
+
+# Retry backoff after the first failed attempt, doubled per attempt (seconds)
+RETRY_BACKOFF_SECONDS = 60
+RETRY_BACKOFF_MAX_SECONDS = 3600
+
+# Pending updates older than this belong to a process that exited (seconds)
+STALE_PENDING_SECONDS = 600
+
+# Updates picked up per retry pass
+RETRY_BATCH_SIZE = 100
+
+# (notion_page_id, status, correlation_id) -> (success, error_message)
+UpdateStatus = Callable[[str, TaskStatus, str | None], Awaitable[tuple[bool, str]]]
+
+
+@dataclass(frozen=True)
+class StatusSyncItem:
+    """One task's Notion status update.
+
+    Attributes:
+        job_id: Bulk operation the update belongs to.
+        task_id: Task UUID.
+        notion_page_id: Notion page to update.
+        target_status: Status to push.
+        attempts: Attempts made before this run.
+    """
+
+    job_id: uuid.UUID
+    task_id: uuid.UUID
+    notion_page_id: str
+    target_status: TaskStatus
+    attempts: int = 0
+
+
+@dataclass
+class NotionSyncProgress:
+    """Progress of a bulk operation's Notion updates.
+
+    Attributes:
+        job_id: Bulk operation ID.
+        total: Updates in the operation.
+        synced: Updates pushed to Notion.
+        failed: Updates whose latest attempt failed.
+        errors: Task UUID -> last error, for failed updates.
+    """
+
+    job_id: uuid.UUID
+    total: int
+    synced: int = 0
+    failed: int = 0
+    errors: dict[uuid.UUID, str] = field(default_factory=dict)
+
+    @property
+    def pending(self) -> int:
+        """Updates not attempted yet."""
+        return self.total - self.synced - self.failed
+
+    @property
+    def done(self) -> bool:
+        """True when every update has been attempted."""
+        return self.pending == 0
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt after `attempts` failed attempts."""
+    seconds = RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, RETRY_BACKOFF_MAX_SECONDS))
+
+
+async def record_status_syncs(db: AsyncSession, items: Iterable[StatusSyncItem]) -> None:
+    """Add pending sync rows to the caller's transaction (caller commits)."""
+    db.add_all(
+        NotionStatusSync(
+            job_id=item.job_id,
+            task_id=item.task_id,
+            notion_page_id=item.notion_page_id,
+            target_status=item.target_status.value,
+            state=SYNC_PENDING,
+            attempts=item.attempts,
+        )
+        for item in items
+    )
+
+
+async def get_sync_progress(db: AsyncSession, job_id: uuid.UUID) -> NotionSyncProgress:
+    """Read a bulk operation's Notion update progress from the database.
+
+    Example:
+        >>> progress = await get_sync_progress(db, result.notion_sync_job_id)
+        >>> progress.synced, progress.failed, progress.pending
+        (97, 1, 2)
+    """
+    result = await db.execute(
+        select(NotionStatusSync.task_id, NotionStatusSync.state, NotionStatusSync.last_error).where(
+            NotionStatusSync.job_id == job_id
+        )
+    )
+    rows = result.all()
+    progress = NotionSyncProgress(job_id=job_id, total=len(rows))
+    for task_id, state, last_error in rows:
+        if state == SYNC_SYNCED:
+            progress.synced += 1
+        elif state == SYNC_FAILED:
+            progress.failed += 1
+            progress.errors[task_id] = last_error or ""
+    return progress
+
+
+class NotionStatusSyncJob:
+    """Pushes a batch of status updates to Notion in the background."""
+
+    # Running jobs (the event loop only keeps weak references to tasks)
+    _running: ClassVar[set[asyncio.Task[NotionSyncProgress]]] = set()
+
+    def __init__(
+        self,
+        job_id: uuid.UUID,
+        items: list[StatusSyncItem],
+        update_status: UpdateStatus,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        max_in_flight: int = NOTION_MAX_IN_FLIGHT,
+        correlation_id: str | None = None,
+    ):
+        """Initialize job.
+
+        Args:
+            job_id: Bulk operation ID (progress and log key).
+            items: Updates to push.
+            update_status: Performs one update (shared, rate-limited client).
+            session_factory: Session factory for outcome records. Defaults to
+                app.database.async_session_factory, resolved lazily.
+            max_in_flight: Maximum concurrent updates.
+            correlation_id: Optional correlation ID for log tracing.
+        """
+        self.job_id = job_id
+        self.items = items
+        self.progress = NotionSyncProgress(job_id=job_id, total=len(items))
+        self._update_status = update_status
+        self._session_factory = session_factory
+        self._max_in_flight = max_in_flight
+        self._correlation_id = correlation_id
+        self._task: asyncio.Task[NotionSyncProgress] | None = None
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession] | None:
+        """Session factory for outcome records (None → outcomes are not stored)."""
+        if self._session_factory is None:
+            from app.database import async_session_factory
+
+            return async_session_factory
+        return self._session_factory
+
+    def start(self) -> "NotionStatusSyncJob":
+        """Run the job in the background and return it."""
+        self._task = asyncio.create_task(self.run())
+        self._running.add(self._task)
+        self._task.add_done_callback(self._running.discard)
+        return self
+
+    async def wait(self) -> NotionSyncProgress:
+        """Wait for a started job and return its final progress."""
+        if self._task is None:
+            raise RuntimeError("Job not started")
+        return await asyncio.shield(self._task)
+
+    async def run(self) -> NotionSyncProgress:
+        """Push every update (bounded concurrency) and record the outcomes."""
+        semaphore = asyncio.Semaphore(self._max_in_flight)
+        outcomes: list[tuple[StatusSyncItem, bool, str]] = []
+
+        async def _sync(item: StatusSyncItem) -> None:
+            async with semaphore:
+                success, error = await self._update_status(
+                    item.notion_page_id, item.target_status, self._correlation_id
+                )
+            if success:
+                self.progress.synced += 1
+            else:
+                self.progress.failed += 1
+                self.progress.errors[item.task_id] = error
+                log.warning(
+                    "notion_status_sync_failed",
+                    correlation_id=self._correlation_id,
+                    job_id=str(item.job_id),
+                    task_id=str(item.task_id),
+                    attempt=item.attempts + 1,
+                    error=error,
+                )
+            outcomes.append((item, success, error))
+
+        await asyncio.gather(*(_sync(item) for item in self.items))
+        await self._record_outcomes(outcomes)
+
+        log.info(
+            "notion_status_sync_complete",
+            correlation_id=self._correlation_id,
+            job_id=str(self.job_id),
+            total=self.progress.total,
+            synced=self.progress.synced,
+            failed=self.progress.failed,
+        )
+        return self.progress
+
+    async def _record_outcomes(self, outcomes: list[tuple[StatusSyncItem, bool, str]]) -> None:
+        """Store the outcomes in one transaction (one UPDATE per state, best effort)."""
+        factory = self.session_factory
+        if factory is None or not outcomes:
+            return
+        now = datetime.now(timezone.utc)
+        rows: dict[str, list[dict[str, Any]]] = {SYNC_SYNCED: [], SYNC_FAILED: []}
+        for item, success, error in outcomes:
+            attempts = item.attempts + 1
+            row: dict[str, Any] = {
+                "job_id": item.job_id,
+                "task_id": item.task_id,
+                "attempts": attempts,
+            }
+            if success:
+                row.update(state=SYNC_SYNCED, last_error=None, next_attempt_at=None)
+            else:
+                retry_at = (
+                    now + retry_delay(attempts) if attempts < NOTION_SYNC_MAX_ATTEMPTS else None
+                )
+                row.update(state=SYNC_FAILED, last_error=error, next_attempt_at=retry_at)
+            rows[row["state"]].append(row)
+        try:
+            async with factory() as db, db.begin():
+                for state_rows in rows.values():
+                    if state_rows:
+                        # ORM bulk UPDATE by primary key: one executemany statement
+                        await db.execute(update(NotionStatusSync), state_rows)
+        except Exception as e:
+            # The rows stay pending; retry_status_syncs picks them up once stale
+            log.error(
+                "notion_status_sync_record_failed",
+                correlation_id=self._correlation_id,
+                job_id=str(self.job_id),
+                count=len(outcomes),
+                error=str(e),
+            )
+
+
+async def retry_status_syncs(
+    update_status: UpdateStatus,
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> NotionSyncProgress | None:
+    """Retry failed updates whose backoff elapsed and stale pending updates.
+
+    Called by the Notion sync loop each cycle. Returns the retry pass
+    progress, or None if nothing was due.
+    """
+    if session_factory is None:
+        from app.database import async_session_factory
+
+        session_factory = async_session_factory
+    if session_factory is None:
+        return None
+
+    now = datetime.now(timezone.utc)
+    async with session_factory() as db:
+        result = await db.execute(
+            select(NotionStatusSync)
+            .where(
+                or_(
+                    and_(
+                        NotionStatusSync.state == SYNC_FAILED,
+                        NotionStatusSync.next_attempt_at <= now,
+                    ),
+                    and_(
+                        NotionStatusSync.state == SYNC_PENDING,
+                        NotionStatusSync.created_at
+                        < now - timedelta(seconds=STALE_PENDING_SECONDS),
+                    ),
+                ),
+                NotionStatusSync.attempts < NOTION_SYNC_MAX_ATTEMPTS,
+            )
+            .order_by(NotionStatusSync.created_at)
+            .limit(RETRY_BATCH_SIZE)
+        )
+        items = [
+            StatusSyncItem(
+                job_id=row.job_id,
+                task_id=row.task_id,
+                notion_page_id=row.notion_page_id,
+                target_status=TaskStatus(row.target_status),
+                attempts=row.attempts,
+            )
+            for row in result.scalars()
+        ]
+    if not items:
+        return None
+
+    log.info("notion_status_sync_retry", count=len(items))
+    job = NotionStatusSyncJob(uuid.uuid4(), items, update_status, session_factory)
+    return await job.run()
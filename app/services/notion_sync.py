@@ -32,6 +32,8 @@ from app.constants import (
 )
 from app.database import async_session_factory
 from app.models import PriorityLevel, Task, TaskStatus
+from app.services.review_service import ReviewService
+from app.services.task_events import EVENT_REJECTION, record_task_event
 
 log = structlog.get_logger()
 
@@ -402,12 +404,15 @@ async def handle_rejection_transition(
     error_log_prop = properties.get("Error Log")
     rejection_reason = extract_rich_text(error_log_prop) if error_log_prop else None
 
-    # Append rejection reason to task error log if provided
+    # Record rejection reason as an append-only event if provided
     if rejection_reason:
-        current_log = task.error_log or ""
-        timestamp = now.isoformat()
-        new_entry = f"[{timestamp}] Review Rejection: {rejection_reason}"
-        task.error_log = f"{current_log}\n{new_entry}".strip()
+        record_task_event(
+            session,
+            task.id,
+            EVENT_REJECTION,
+            task.status,
+            message=f"Review Rejection: {rejection_reason}",
+        )
 
     await session.flush()
 
@@ -791,6 +796,7 @@ async def sync_database_to_notion_loop(notion_client: NotionClient) -> None:
     It implements two sync directions:
     1. Notion → Database: Poll Notion for "Queued" status, enqueue tasks
     2. Database → Notion: Push task status updates back to Notion
+    3. Retry failed bulk review status updates (notion_status_syncs)
 
     Architecture:
     - Runs as FastAPI lifespan background task
@@ -807,6 +813,7 @@ async def sync_database_to_notion_loop(notion_client: NotionClient) -> None:
     """
     # Load configuration from environment
     sync_interval = get_notion_sync_interval()
+    review_service = ReviewService()
     notion_database_ids = get_notion_database_ids()
 
     log.info(
@@ -831,6 +838,9 @@ async def sync_database_to_notion_loop(notion_client: NotionClient) -> None:
             # Direction 2: Database → Notion (push task status updates)
             await sync_database_status_to_notion(notion_client)
 
+            # Retry bulk review status updates that failed or were interrupted
+            await review_service.retry_failed_notion_syncs()
+
             # Wait before next sync cycle
             await asyncio.sleep(sync_interval)
 
@@ -11,6 +11,8 @@ Key Responsibilities:
 - Support both Notion file attachments and R2 public URLs
 - Optimize videos with MP4 faststart for streaming playback
 - Respect 3 req/sec rate limiting (inherited from NotionClient)
+- Create entries concurrently with payloads prepared up front, skipping
+  entries already created for the task (app.services.notion_bulk)
 
 Architecture Pattern:
     Service (Smart): Reads video files, uploads/stores URLs, creates entries, optimizes
@@ -40,6 +42,7 @@ from uuid import UUID
 from app.clients.notion import NotionClient
 from app.config import DEFAULT_VIDEO_DURATION_SECONDS, get_notion_tasks_collection_id, get_notion_videos_database_id
 from app.models import Channel
+from app.services.notion_bulk import NotionPageLedger, PageRequest, create_pages
 from app.utils.logging import get_logger
 
 log = get_logger(__name__)
@@ -63,15 +66,23 @@ class NotionVideoService:
     - NOTION_TASKS_COLLECTION_ID: Notion Tasks collection ID (env var)
     """
 
-    def __init__(self, notion_client: NotionClient, channel: Channel):
+    def __init__(
+        self,
+        notion_client: NotionClient,
+        channel: Channel,
+        ledger: NotionPageLedger | None = None,
+    ):
         """Initialize video service with Notion client and channel config.
 
         Args:
             notion_client: Rate-limited Notion API client
             channel: Channel model with storage_strategy configuration
+            ledger: Optional record of the task's created pages; entries
+                already recorded are skipped (idempotent re-runs)
         """
         self.notion_client = notion_client
         self.channel = channel
+        self.ledger = ledger
         self.log = get_logger(__name__)
 
         # Load database IDs from configuration (not hardcoded)
@@ -102,6 +113,7 @@ class NotionVideoService:
         Returns:
             Summary dict with keys:
                 - created: Number of video entries created
+                - skipped: Number of entries created by an earlier run
                 - failed: Number of failed video entries
                 - storage_strategy: "notion" or "r2"
 
@@ -124,8 +136,6 @@ class NotionVideoService:
             >>> print(result)
             {"created": 1, "failed": 0, "storage_strategy": "r2"}
         """
-        created = 0
-        failed = 0
         storage_strategy = self.channel.storage_strategy
 
         self.log.info(
@@ -136,57 +146,73 @@ class NotionVideoService:
             video_count=len(video_files),
             storage_strategy=storage_strategy,
         )
+        if video_files:
+            self._log_storage_warning(
+                storage_strategy, correlation_id, video_count=len(video_files)
+            )
 
-        for video in video_files:
-            try:
-                # Create Video entry in Notion
-                await self._create_video_entry(
+        # Prepare every payload up front, then create pages concurrently
+        requests = [
+            PageRequest(
+                key=f"video:{video['clip_number']:02d}",
+                database_id=self.videos_database_id,
+                properties=self._build_video_properties(
                     notion_page_id=notion_page_id,
                     clip_number=video["clip_number"],
-                    video_path=video["output_path"],
                     duration=video.get("duration", DEFAULT_VIDEO_DURATION_SECONDS),
-                    storage_strategy=storage_strategy,
-                    correlation_id=correlation_id,
-                )
-                created += 1
+                ),
+            )
+            for video in video_files
+        ]
+        result = await create_pages(
+            self.notion_client, requests, ledger=self.ledger, correlation_id=correlation_id
+        )
 
+        for video, request in zip(video_files, requests, strict=True):
+            error = result.failed.get(request.key)
+            if error is None:
                 self.log.info(
                     "video_entry_created",
                     correlation_id=correlation_id,
                     task_id=str(task_id),
                     clip_number=video["clip_number"],
                     duration=video.get("duration", 10.0),
+                    existing=request.key in result.existing,
                 )
-
-            except Exception as e:
-                failed += 1
+            else:
+                # Remaining videos were still created; only this entry failed
                 self.log.error(
                     "video_entry_failed",
                     correlation_id=correlation_id,
                     task_id=str(task_id),
                     clip_number=video["clip_number"],
-                    error=str(e),
-                    exc_info=True,
+                    error=str(error),
+                    error_type=type(error).__name__,
                 )
-                # Continue with remaining videos instead of failing entire batch
+
+        created = len(result.created)
+        failed = len(result.failed)
+        skipped = len(result.existing)
 
         self.log.info(
             "populate_videos_complete",
             correlation_id=correlation_id,
             task_id=str(task_id),
             created=created,
+            skipped=skipped,
             failed=failed,
             storage_strategy=storage_strategy,
         )
 
         # Check if all videos failed (critical failure)
-        if failed > 0 and created == 0:
+        if failed > 0 and created == 0 and skipped == 0:
             raise RuntimeError(
                 f"All {failed} videos failed to populate in Notion. Check error logs."
             )
 
         return {
             "created": created,
+            "skipped": skipped,
             "failed": failed,
             "storage_strategy": storage_strategy,
         }
@@ -216,10 +242,42 @@ class NotionVideoService:
             NotionAPIError: On non-retriable errors
             NotionRateLimitError: After retry exhaustion
         """
-        # Prepare video properties
+        properties = self._build_video_properties(notion_page_id, clip_number, duration)
+        self._log_storage_warning(storage_strategy, correlation_id, clip_number=clip_number)
+
+        # Create page in Videos database using NotionClient method (rate limited, auto-retry)
+        try:
+            return await self.notion_client.create_page(
+                database_id=self.videos_database_id,
+                properties=properties,
+            )
+        except Exception as e:
+            self.log.error(
+                "notion_create_page_failed",
+                correlation_id=correlation_id,
+                clip_number=clip_number,
+                database_id=self.videos_database_id,
+                error=str(e),
+                exc_info=True,
+            )
+            raise
+
+    def _build_video_properties(
+        self, notion_page_id: str, clip_number: int, duration: float
+    ) -> dict[str, Any]:
+        """Build the properties payload of a Video entry.
+
+        Args:
+            notion_page_id: Parent task page ID
+            clip_number: Clip number (1-18) identifying clip in sequence
+            duration: Actual duration in seconds (after trimming)
+
+        Returns:
+            Notion page properties
+        """
         current_date = datetime.now(timezone.utc).isoformat()
 
-        properties: dict[str, Any] = {
+        return {
             "Clip Number": {
                 "number": clip_number
             },
@@ -236,19 +294,26 @@ class NotionVideoService:
                 "relation": [
                     {"id": notion_page_id}
                 ]
-            }
+            },
+            # File URL property MUST exist in schema even if value is None
+            # (null until external storage upload is implemented)
+            "File URL": {
+                "url": None
+            },
         }
 
-        # Handle file storage based on strategy
-        file_url: str | None = None
+    def _log_storage_warning(
+        self, storage_strategy: str, correlation_id: str | None, **context: Any
+    ) -> None:
+        """Log that file URLs stay null until external storage is implemented."""
         if storage_strategy == "notion":
             # Notion API doesn't support direct file uploads
             # Files must be uploaded to external storage first
             self.log.warning(
                 "notion_file_upload_requires_external_storage",
                 correlation_id=correlation_id,
-                clip_number=clip_number,
                 message="Notion requires external file URL. File URL property will be null.",
+                **context,
             )
         elif storage_strategy == "r2":
             # R2 upload would happen here
@@ -256,35 +321,6 @@ class NotionVideoService:
             self.log.warning(
                 "r2_upload_not_implemented",
                 correlation_id=correlation_id,
-                clip_number=clip_number,
                 message="R2 upload not yet implemented, File URL property will be null",
+                **context,
             )
-
-        # Add File URL property (null if upload not implemented)
-        # This property MUST exist in schema even if value is None
-        if file_url:
-            properties["File URL"] = {
-                "url": file_url
-            }
-        else:
-            # Set to null explicitly - shows property exists but needs implementation
-            properties["File URL"] = {
-                "url": None
-            }
-
-        # Create page in Videos database using NotionClient method (rate limited, auto-retry)
-        try:
-            return await self.notion_client.create_page(
-                database_id=self.videos_database_id,
-                properties=properties,
-            )
-        except Exception as e:
-            self.log.error(
-                "notion_create_page_failed",
-                correlation_id=correlation_id,
-                clip_number=clip_number,
-                database_id=self.videos_database_id,
-                error=str(e),
-                exc_info=True,
-            )
-            raise
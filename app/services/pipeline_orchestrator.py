@@ -7,7 +7,7 @@ Key Responsibilities:
 - Execute 6 pipeline steps in sequence (assets → composites → videos → audio → SFX → assembly)
 - Track step completion metadata for partial resume after failures
 - Update task status after each step (PostgreSQL + Notion sync)
-- Classify errors as transient (retriable) or permanent (fail)
+- Classify errors as transient (re-queued with backoff) or permanent (fail)
 - Monitor pipeline duration (target: ≤2 hours, NFR-P1)
 - Track total pipeline cost ($6-13 per video expected)
 - Pause at review gate for YouTube compliance
@@ -19,7 +19,7 @@ Architecture Pattern: "Short Transaction + State Machine"
 - Partial resume via step_completion_metadata (idempotent operations)
 
 Dependencies:
-    - Story 3.1: CLI wrapper (asyncio.to_thread subprocess execution)
+    - Story 3.1: CLI wrapper (asyncio subprocess execution)
     - Story 3.2: Filesystem helpers (secure path construction)
     - Story 3.3: Asset generation service (Gemini API)
     - Story 3.4: Composite creation service (FFmpeg)
@@ -50,29 +50,52 @@ Performance Expectations:
 
 import asyncio
 import contextlib
+import functools
 import time
+import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
 from app.clients.notion import NotionClient
 from app.config import get_notion_api_token
 from app.database import async_session_factory
 from app.models import Channel, Task, TaskStatus
+from app.services.api_quota_state import parse_quota_error
 from app.services.asset_generation import AssetGenerationService
 from app.services.composite_creation import CompositeCreationService
 from app.services.narration_generation import NarrationGenerationService
 from app.services.notion_asset_service import NotionAssetService
 from app.services.notion_audio_service import NotionAudioService
-from app.services.notion_sync import TaskSyncData, push_task_to_notion
+from app.services.notion_bulk import NotionPageLedger
+from app.services.notion_sync import push_task_to_notion
 from app.services.sfx_generation import SFXGenerationService
+from app.services.side_effects import STATUS_COMPLETED, get_side_effect_queue, map_bounded
+from app.services.task_artifacts import (
+    ARTIFACT_NARRATION,
+    ARTIFACT_SFX,
+    ArtifactIndex,
+    load_artifact_index,
+    save_artifacts,
+)
+from app.services.task_deferral import defer_task, transient_retry_at
+from app.services.task_events import EVENT_ERROR, EVENT_STATUS_CHANGE, record_task_event
+from app.services.task_metadata import clear_clips, get_clips, set_step_metadata
+from app.services.task_state import TaskSnapshot, transition_task, update_task
 from app.services.video_assembly import VideoAssemblyService
 from app.services.video_generation import VideoGenerationService
-from app.utils.cli_wrapper import CLIScriptError
-from app.utils.filesystem import get_audio_dir, get_sfx_dir
+from app.services.voice_branding_service import BrandingPaths
+from app.services.workspace_retention import measure_project_bytes
+from app.utils.cli_wrapper import CLIScriptError, _run_subprocess
+from app.utils.filesystem import CLIPS_PER_VIDEO, get_project_workspace
 from app.utils.logging import get_logger
+from app.utils.metrics import STEP_DURATION, STEP_OUTCOMES
+from app.utils.tracing import current_span, traced
 
 log = get_logger(__name__)
 
@@ -208,6 +231,16 @@ STEP_READY_STATUS_MAP = {
     PipelineStep.VIDEO_ASSEMBLY: TaskStatus.ASSEMBLY_READY,
 }
 
+# ffprobe timeout for one audio clip duration probe (seconds)
+AUDIO_PROBE_TIMEOUT_SECONDS = 10
+
+# Review gates whose reviewers read a background side effect's output
+# (Notion entries); the orchestrator waits for it before entering the gate
+REVIEW_GATE_SIDE_EFFECTS = {
+    TaskStatus.ASSETS_READY: "asset_notion_population",
+    TaskStatus.AUDIO_READY: f"{ARTIFACT_NARRATION}_notion_population",
+}
+
 
 class PipelineOrchestrator:
     """Orchestrates end-to-end video generation pipeline.
@@ -253,7 +286,22 @@ class PipelineOrchestrator:
         self.task_id = task_id
         self.log = get_logger(__name__)
         self.step_completions: dict[PipelineStep, StepCompletion] = {}
+        self.artifacts: ArtifactIndex | None = None
+        self.branding: BrandingPaths | None = None
+        # Passed to Notion services for log correlation; becomes the trace id
+        # once execute_pipeline opens the pipeline span
+        self.correlation_id = str(task_id)
+
+    def _task_uuid(self) -> uuid.UUID | None:
+        """Return task_id as a UUID for columns typed UUID (None if malformed)."""
+        if isinstance(self.task_id, uuid.UUID):
+            return self.task_id
+        try:
+            return uuid.UUID(str(self.task_id))
+        except ValueError:
+            return None
 
+    @traced("pipeline", lambda self: {"task_id": str(self.task_id)})
     async def execute_pipeline(self) -> None:
         """Execute complete video generation pipeline from start to finish.
 
@@ -297,6 +345,9 @@ class PipelineOrchestrator:
             # Logs: Pipeline completed (duration: 3842.1s, cost: $8.45)
         """
         pipeline_start = time.time()
+        pipeline_span = current_span()
+        if pipeline_span is not None:
+            self.correlation_id = pipeline_span.trace_id
 
         try:
             # Load task data for pipeline execution
@@ -325,6 +376,8 @@ class PipelineOrchestrator:
 
             # Load step completion metadata for partial resume
             self.step_completions = await self.load_step_completion_metadata()
+            self.artifacts = task_data.get("artifacts")
+            self.branding = task_data.get("branding")
 
             # Define pipeline steps in execution order
             steps = [
@@ -361,48 +414,49 @@ class PipelineOrchestrator:
 
                 # Execute step via service layer
                 try:
-                    completion = await self.execute_step(
-                        step,
-                        channel_id,
-                        project_id,
-                        topic,
-                        story_direction,
-                        narration_scripts,
-                        sfx_descriptions,
-                        voice_id,
-                    )
-                    await self.save_step_completion(step, completion)
+                    try:
+                        completion = await self.execute_step(
+                            step,
+                            channel_id,
+                            project_id,
+                            topic,
+                            story_direction,
+                            narration_scripts,
+                            sfx_descriptions,
+                            voice_id,
+                        )
+                    finally:
+                        # Outputs finished before a failure are kept for resume
+                        await self._save_artifacts()
+                    workspace_bytes = await self._measure_workspace(channel_id, project_id)
+                    await self.save_step_completion(step, completion, workspace_bytes)
 
                     self.log.info(
                         "step_completed",
                         step=step.value,
                         duration_seconds=completion.duration_seconds,
                     )
+                    STEP_OUTCOMES.inc(step=step.value, outcome="completed")
+                    if completion.duration_seconds is not None:
+                        STEP_DURATION.observe(completion.duration_seconds, step=step.value)
 
                     # Story 5.3: Populate assets in Notion after asset generation
                     if step == PipelineStep.ASSET_GENERATION and completion.partial_progress:
                         asset_files = completion.partial_progress.get("asset_files", [])
                         if asset_files:
-                            try:
-                                await self._populate_assets_in_notion(asset_files)
-                                self.log.info(
-                                    "assets_populated_in_notion",
-                                    task_id=self.task_id,
-                                    asset_count=len(asset_files),
-                                )
-                            except Exception as e:
-                                # Log error but don't fail pipeline - assets are already generated
-                                self.log.error(
-                                    "notion_asset_population_failed",
-                                    task_id=self.task_id,
-                                    error=str(e),
-                                    exc_info=True,
-                                )
+                            # Background side effect: a failure is recorded in
+                            # task metadata and never fails the pipeline
+                            get_side_effect_queue().submit(
+                                self.task_id,
+                                "asset_notion_population",
+                                functools.partial(self._populate_assets_in_notion, asset_files),
+                            )
 
                     # Story 5.2: Check for review gate after step completion
                     # Update status to "ready" state (e.g., ASSETS_READY, VIDEO_READY)
                     ready_status = STEP_READY_STATUS_MAP.get(step)
                     if ready_status:
+                        await self._await_review_gate_side_effect(ready_status)
                         await self.update_task_status(ready_status)
 
                         # Check if this is a mandatory review gate
@@ -420,6 +474,7 @@ class PipelineOrchestrator:
                 except Exception as e:
                     # Classify error as transient (retry) or permanent (fail)
                     is_transient, error_type = self.classify_error(e)
+                    STEP_OUTCOMES.inc(step=step.value, outcome="failed")
 
                     self.log.error(
                         "step_failed",
@@ -433,17 +488,20 @@ class PipelineOrchestrator:
                     error_status = STEP_ERROR_MAP.get(step, TaskStatus.ASSET_ERROR)
                     await self.update_task_status(error_status, error_message=str(e))
 
+                    # Transient errors re-queue with backoff (completed steps are skipped)
+                    if is_transient:
+                        await self.schedule_retry(e, error_type)
+
                     # Halt pipeline execution
                     return
 
             # All steps complete - pause for human review (YouTube compliance)
-            await self.update_task_status(TaskStatus.FINAL_REVIEW)
-
-            # Calculate total pipeline duration
+            # Status, review start and pipeline end time are written together
             pipeline_duration = time.time() - pipeline_start
-            await self._update_pipeline_end_time(
-                datetime.now(timezone.utc),
-                pipeline_duration,
+            await self.update_task_status(
+                TaskStatus.FINAL_REVIEW,
+                pipeline_end_time=datetime.now(timezone.utc),
+                pipeline_duration_seconds=pipeline_duration,
             )
 
             # Calculate total pipeline cost
@@ -477,6 +535,10 @@ class PipelineOrchestrator:
             with contextlib.suppress(Exception):
                 await self.update_task_status(TaskStatus.ASSET_ERROR, error_message=str(e))
 
+    @traced(
+        "pipeline.step",
+        lambda self, step, *args, **kwargs: {"task_id": str(self.task_id), "step": step.value},
+    )
     async def execute_step(
         self,
         step: PipelineStep,
@@ -532,7 +594,9 @@ class PipelineOrchestrator:
         step_start = time.time()
 
         if step == PipelineStep.ASSET_GENERATION:
-            asset_service = AssetGenerationService(channel_id, project_id)
+            asset_service = AssetGenerationService(
+                channel_id, project_id, self.artifacts, task_id=self._task_uuid()
+            )
             manifest = asset_service.create_asset_manifest(topic, story_direction)
             result = await asset_service.generate_assets(manifest, resume=True)
 
@@ -560,7 +624,7 @@ class PipelineOrchestrator:
             )
 
         elif step == PipelineStep.COMPOSITE_CREATION:
-            composite_service = CompositeCreationService(channel_id, project_id)
+            composite_service = CompositeCreationService(channel_id, project_id, self.artifacts)
             composite_manifest = composite_service.create_composite_manifest(topic, story_direction)
             result = await composite_service.generate_composites(composite_manifest, resume=True)
 
@@ -577,7 +641,9 @@ class PipelineOrchestrator:
             )
 
         elif step == PipelineStep.VIDEO_GENERATION:
-            video_service = VideoGenerationService(channel_id, project_id)
+            video_service = VideoGenerationService(
+                channel_id, project_id, self.artifacts, task_id=self._task_uuid()
+            )
             video_manifest = video_service.create_video_manifest(topic, story_direction)
             result = await video_service.generate_videos(video_manifest, resume=True)
 
@@ -600,21 +666,21 @@ class PipelineOrchestrator:
             if not voice_id:
                 raise ValueError("voice_id required for NARRATION_GENERATION step")
 
-            narration_service = NarrationGenerationService(channel_id, project_id)
+            narration_service = NarrationGenerationService(
+                channel_id, project_id, self.artifacts, task_id=self._task_uuid()
+            )
             narration_manifest = await narration_service.create_narration_manifest(
                 narration_scripts=narration_scripts,
                 voice_id=voice_id,
             )
 
             # Story 5.5: Support partial regeneration for failed audio clips
-            # Extract failed clip numbers from task metadata (populated by reject_audio)
-            failed_narration_clips = None
-            if task.step_completion_metadata and "failed_audio_clip_numbers" in task.step_completion_metadata:
-                failed_narration_clips = task.step_completion_metadata["failed_audio_clip_numbers"]
+            # Failed clip numbers are recorded in task_clip_progress by reject_audio
+            failed_narration_clips = await self._get_failed_clips(step) or None
+            if failed_narration_clips:
                 self.log.info(
                     "partial_narration_regeneration_requested",
-                    correlation_id=correlation_id,
-                    task_id=str(task.id),
+                    task_id=self.task_id,
                     failed_clips=failed_narration_clips,
                 )
 
@@ -624,57 +690,13 @@ class PipelineOrchestrator:
                 clips_to_regenerate=failed_narration_clips
             )
 
-            # Clear failed clips from metadata after successful regeneration
-            if failed_narration_clips and task.step_completion_metadata:
-                task.step_completion_metadata.pop("failed_audio_clip_numbers", None)
-                self.log.info(
-                    "cleared_failed_audio_clip_numbers",
-                    correlation_id=correlation_id,
-                    task_id=str(task.id),
-                )
+            # Clear failed clips after successful regeneration
+            if failed_narration_clips:
+                await self._clear_failed_clips(step)
 
             # Story 5.5: Populate audio entries in Notion after generation
-            # Build narration file list from audio directory
-            audio_dir = get_audio_dir(channel_id, project_id)
-            narration_files = []
-            for i in range(1, 19):  # 18 clips
-                audio_path = audio_dir / f"clip_{i:02d}.mp3"
-                if audio_path.exists():
-                    # Get duration using ffprobe (similar to narration service)
-                    duration = await self._get_audio_duration(audio_path)
-                    narration_files.append({
-                        "clip_number": i,
-                        "output_path": audio_path,
-                        "duration": duration,
-                    })
-
-            # Populate Notion Audio database with narration clips
-            if narration_files and notion_client:
-                try:
-                    notion_audio_service = NotionAudioService(notion_client, channel)
-                    audio_result = await notion_audio_service.populate_audio(
-                        task_id=task.id,
-                        notion_page_id=task.notion_page_id,
-                        narration_files=narration_files,
-                        sfx_files=[],  # Only narration at this step
-                        correlation_id=correlation_id,
-                    )
-                    self.log.info(
-                        "narration_notion_population_complete",
-                        correlation_id=correlation_id,
-                        task_id=str(task.id),
-                        narration_created=audio_result.get("narration_count", 0),
-                    )
-                except Exception as e:
-                    # Log error but don't fail the pipeline
-                    # Notion population is non-critical for pipeline continuation
-                    self.log.error(
-                        "narration_notion_population_failed",
-                        correlation_id=correlation_id,
-                        task_id=str(task.id),
-                        error=str(e),
-                        exc_info=True,
-                    )
+            # Runs in the background; the AUDIO_READY review gate waits for it
+            self._submit_audio_population(ARTIFACT_NARRATION, channel_id, project_id)
 
             return StepCompletion(
                 step=step,
@@ -683,7 +705,6 @@ class PipelineOrchestrator:
                     "generated": result.get("generated", 0),
                     "skipped": result.get("skipped", 0),
                     "total": 18,  # 18 narrations per project
-                    "notion_populated": len(narration_files) if narration_files else 0,
                 },
                 duration_seconds=time.time() - step_start,
                 error_message=None,
@@ -694,20 +715,20 @@ class PipelineOrchestrator:
             if not sfx_descriptions:
                 raise ValueError("sfx_descriptions required for SFX_GENERATION step")
 
-            sfx_service = SFXGenerationService(channel_id, project_id)
+            sfx_service = SFXGenerationService(
+                channel_id, project_id, self.artifacts, task_id=self._task_uuid()
+            )
             sfx_manifest = await sfx_service.create_sfx_manifest(
                 sfx_descriptions=sfx_descriptions,
             )
 
             # Story 5.5: Support partial regeneration for failed SFX clips
-            # Extract failed clip numbers from task metadata (populated by reject_audio)
-            failed_sfx_clips = None
-            if task.step_completion_metadata and "failed_audio_clip_numbers" in task.step_completion_metadata:
-                failed_sfx_clips = task.step_completion_metadata["failed_audio_clip_numbers"]
+            # Failed clip numbers are recorded in task_clip_progress by reject_audio
+            failed_sfx_clips = await self._get_failed_clips(step) or None
+            if failed_sfx_clips:
                 self.log.info(
                     "partial_sfx_regeneration_requested",
-                    correlation_id=correlation_id,
-                    task_id=str(task.id),
+                    task_id=self.task_id,
                     failed_clips=failed_sfx_clips,
                 )
 
@@ -717,76 +738,13 @@ class PipelineOrchestrator:
                 clips_to_regenerate=failed_sfx_clips
             )
 
-            # Clear failed clips from metadata after successful regeneration
-            if failed_sfx_clips and task.step_completion_metadata:
-                task.step_completion_metadata.pop("failed_audio_clip_numbers", None)
-                self.log.info(
-                    "cleared_failed_audio_clip_numbers",
-                    correlation_id=correlation_id,
-                    task_id=str(task.id),
-                )
+            # Clear failed clips after successful regeneration
+            if failed_sfx_clips:
+                await self._clear_failed_clips(step)
 
             # Story 5.5: Populate audio entries in Notion after generation
-            # Build SFX file list from SFX directory
-            sfx_dir = get_sfx_dir(channel_id, project_id)
-            sfx_files = []
-            for i in range(1, 19):  # 18 clips
-                # Check for MP3 first (new format), then WAV (legacy format)
-                sfx_path_mp3 = sfx_dir / f"sfx_{i:02d}.mp3"
-                sfx_path_wav = sfx_dir / f"sfx_{i:02d}.wav"  # Legacy format before Story 5.5
-
-                if sfx_path_mp3.exists():
-                    # Use MP3 file (new format)
-                    duration = await self._get_audio_duration(sfx_path_mp3)
-                    sfx_files.append({
-                        "clip_number": i,
-                        "output_path": sfx_path_mp3,
-                        "duration": duration,
-                    })
-                elif sfx_path_wav.exists():
-                    # Use legacy WAV file (backward compatibility)
-                    # Note: WAV files are larger and not web-optimized, but functional
-                    duration = await self._get_audio_duration(sfx_path_wav)
-                    sfx_files.append({
-                        "clip_number": i,
-                        "output_path": sfx_path_wav,
-                        "duration": duration,
-                    })
-                    self.log.warning(
-                        "sfx_legacy_wav_format_detected",
-                        correlation_id=correlation_id,
-                        task_id=str(task.id),
-                        clip_number=i,
-                        message="Using legacy WAV file (consider regenerating for MP3 web optimization)",
-                    )
-
-            # Populate Notion Audio database with SFX clips
-            if sfx_files and notion_client:
-                try:
-                    notion_audio_service = NotionAudioService(notion_client, channel)
-                    audio_result = await notion_audio_service.populate_audio(
-                        task_id=task.id,
-                        notion_page_id=task.notion_page_id,
-                        narration_files=[],  # Only SFX at this step
-                        sfx_files=sfx_files,
-                        correlation_id=correlation_id,
-                    )
-                    self.log.info(
-                        "sfx_notion_population_complete",
-                        correlation_id=correlation_id,
-                        task_id=str(task.id),
-                        sfx_created=audio_result.get("sfx_count", 0),
-                    )
-                except Exception as e:
-                    # Log error but don't fail the pipeline
-                    # Notion population is non-critical for pipeline continuation
-                    self.log.error(
-                        "sfx_notion_population_failed",
-                        correlation_id=correlation_id,
-                        task_id=str(task.id),
-                        error=str(e),
-                        exc_info=True,
-                    )
+            # No review gate reads SFX entries: probing and Notion run in the background
+            self._submit_audio_population(ARTIFACT_SFX, channel_id, project_id)
 
             return StepCompletion(
                 step=step,
@@ -795,14 +753,15 @@ class PipelineOrchestrator:
                     "generated": result.get("generated", 0),
                     "skipped": result.get("skipped", 0),
                     "total": 18,  # 18 SFX per project
-                    "notion_populated": len(sfx_files) if sfx_files else 0,
                 },
                 duration_seconds=time.time() - step_start,
                 error_message=None,
             )
 
         elif step == PipelineStep.VIDEO_ASSEMBLY:
-            assembly_service = VideoAssemblyService(channel_id, project_id)
+            assembly_service = VideoAssemblyService(
+                channel_id, project_id, self.artifacts, branding=self.branding
+            )
             assembly_manifest = await assembly_service.create_assembly_manifest()
             result = await assembly_service.assemble_video(assembly_manifest)
 
@@ -892,47 +851,38 @@ class PipelineOrchestrator:
 
         Raises:
             RuntimeError: If ffprobe fails to probe audio file
+            asyncio.TimeoutError: If ffprobe exceeds AUDIO_PROBE_TIMEOUT_SECONDS
 
         Security:
             ffprobe command is hardcoded, audio_path comes from validated
-            get_audio_dir() or get_sfx_dir() which prevents path traversal.
+            get_project_workspace() which prevents path traversal.
         """
-        import subprocess
-
-        def _probe_duration() -> float:
-            result = subprocess.run(  # noqa: S603
-                [  # noqa: S607
-                    "ffprobe",
-                    "-v",
-                    "error",
-                    "-show_entries",
-                    "format=duration",
-                    "-of",
-                    "default=noprint_wrappers=1:nokey=1",
-                    str(audio_path),
-                ],
-                capture_output=True,
-                text=True,
-                check=False,  # Don't raise on non-zero exit
-                timeout=10,  # 10 second timeout for probe
-            )
-
-            if result.returncode != 0:
-                raise RuntimeError(
-                    f"ffprobe failed for {audio_path.name}: {result.stderr}"
-                )
-
-            try:
-                return float(result.stdout.strip())
-            except ValueError as e:
-                raise RuntimeError(
-                    f"Invalid duration from ffprobe for {audio_path.name}: {result.stdout}"
-                ) from e
-
-        # Run ffprobe in thread to avoid blocking event loop
-        return await asyncio.to_thread(_probe_duration)
+        command = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            str(audio_path),
+        ]
+        # Async subprocess: parallel probes don't each hold a thread pool slot
+        result = await _run_subprocess("ffprobe", command, None, AUDIO_PROBE_TIMEOUT_SECONDS)
+
+        if result.returncode != 0:
+            raise RuntimeError(f"ffprobe failed for {audio_path.name}: {result.stderr}")
 
-    async def _populate_assets_in_notion(self, asset_files: list[dict[str, Any]]) -> None:
+        try:
+            return float(result.stdout.strip())
+        except ValueError as e:
+            raise RuntimeError(
+                f"Invalid duration from ffprobe for {audio_path.name}: {result.stdout}"
+            ) from e
+
+    async def _populate_assets_in_notion(
+        self, asset_files: list[dict[str, Any]]
+    ) -> dict[str, Any] | None:
         """Populate asset entries in Notion after asset generation.
 
         This method creates Asset database entries in Notion for each generated asset,
@@ -941,11 +891,15 @@ class PipelineOrchestrator:
         Args:
             asset_files: List of asset file dicts with keys: asset_type, name, output_path
 
+        Returns:
+            Population summary (created/skipped/failed), None if skipped
+
         Raises:
-            Exception: If Notion population fails (logged but doesn't stop pipeline)
+            Exception: If Notion population fails (recorded by the side effect queue)
 
         Integration Point (Story 5.3):
-            Called after ASSET_GENERATION step completes but before ASSETS_READY status
+            Submitted as a background side effect after ASSET_GENERATION completes;
+            the ASSETS_READY review gate waits for it
         """
         from sqlalchemy.exc import DatabaseError
 
@@ -958,7 +912,7 @@ class PipelineOrchestrator:
                         task_id=self.task_id,
                         correlation_id=self.correlation_id,
                     )
-                    return
+                    return None
 
                 if not task.notion_page_id:
                     self.log.warning(
@@ -967,7 +921,7 @@ class PipelineOrchestrator:
                         correlation_id=self.correlation_id,
                         message="Cannot populate assets in Notion without notion_page_id",
                     )
-                    return
+                    return None
 
                 # Get channel for storage_strategy
                 channel = await db.get(Channel, task.channel_id)
@@ -977,7 +931,7 @@ class PipelineOrchestrator:
                         channel_id=task.channel_id,
                         correlation_id=self.correlation_id,
                     )
-                    return
+                    return None
 
                 # Store task data before closing DB connection
                 task_id = task.id
@@ -988,7 +942,7 @@ class PipelineOrchestrator:
             # Create Notion client and asset service outside DB transaction
             notion_token = get_notion_api_token()
             notion_client = NotionClient(notion_token)
-            asset_service = NotionAssetService(notion_client, channel)
+            asset_service = NotionAssetService(notion_client, channel, NotionPageLedger(task_id))
 
             # Populate assets in Notion (no DB connection held during API calls)
             result = await asset_service.populate_assets(
@@ -1006,6 +960,7 @@ class PipelineOrchestrator:
                 failed=result.get("failed", 0),
                 storage_strategy=result.get("storage_strategy"),
             )
+            return result
 
         except DatabaseError as e:
             self.log.error(
@@ -1017,67 +972,260 @@ class PipelineOrchestrator:
             )
             # Asset files are already generated, so continue pipeline
             # Notion population can be retried manually if needed
+            return None
 
     async def update_task_status(
         self,
         status: TaskStatus,
         error_message: str | None = None,
+        **columns: Any,
     ) -> None:
         """Update task status in database and sync to Notion.
 
         Status Update Flow:
-        1. Update PostgreSQL task status (short transaction)
+        1. One UPDATE ... RETURNING sets the status, review_started_at (review
+           gates) and any extra columns, validating the transition in its
+           WHERE clause; a task_events row is inserted in the same short
+           transaction (error messages go to the event payload)
         2. Commit database transaction
-        3. Trigger async Notion status update (non-blocking)
+        3. Trigger async Notion status update with the returned snapshot
+           (non-blocking, no re-read of the task)
         4. Log status change with correlation_id
 
         Args:
             status: New task status (TaskStatus enum value)
             error_message: Optional error details if status is error state
+            **columns: Other Task columns written in the same statement
+                (e.g. pipeline_end_time)
+
+        Raises:
+            InvalidStateTransitionError: If the task cannot move to status
 
         Example:
             >>> await orchestrator.update_task_status(TaskStatus.GENERATING_ASSETS)
             # Updates DB, syncs to Notion, logs change
         """
-        async with async_session_factory() as db, db.begin():  # type: ignore[misc]
-            task = await db.get(Task, self.task_id)
-            if task:
-                task.status = status
-                if error_message:
-                    # Append to error log (append-only pattern)
-                    current_log = task.error_log or ""
-                    timestamp = datetime.now(timezone.utc).isoformat()
-                    new_entry = f"[{timestamp}] {status.value}: {error_message}"
-                    task.error_log = f"{current_log}\n{new_entry}".strip()
-
-                # Story 5.2 Task 3: Set review_started_at when entering review gate
-                if is_review_gate(status):
-                    task.review_started_at = datetime.now(timezone.utc)
-                    self.log.info(
-                        "review_gate_entered",
-                        status=status.value,
-                        review_started_at=task.review_started_at.isoformat(),
-                    )
+        # Story 5.2 Task 3: Set review_started_at when entering review gate
+        if is_review_gate(status):
+            columns["review_started_at"] = datetime.now(timezone.utc)
 
-                self.log.info(
-                    "status_updated",
-                    status=status.value,
-                    has_error=error_message is not None,
+        async with async_session_factory() as db, db.begin():  # type: ignore[misc]
+            snapshot = await transition_task(db, self.task_id, status, **columns)
+            if snapshot is not None:
+                # Append-only event (insert), instead of rewriting tasks.error_log
+                record_task_event(
+                    db,
+                    snapshot.id,
+                    EVENT_ERROR if error_message else EVENT_STATUS_CHANGE,
+                    status,
+                    message=error_message,
                 )
 
+        if snapshot is None:
+            self.log.error("status_update_failed", reason="task_not_found", status=status.value)
+            return
+
+        if snapshot.review_started_at is not None and is_review_gate(status):
+            self.log.info(
+                "review_gate_entered",
+                status=status.value,
+                review_started_at=snapshot.review_started_at.isoformat(),
+            )
+        self.log.info(
+            "status_updated",
+            status=status.value,
+            has_error=error_message is not None,
+        )
+
         # Store task reference to prevent garbage collection warnings (RUF006)
         # Done callback consumes any exceptions to prevent warnings
         def _handle_notion_task_done(task: asyncio.Task[None]) -> None:
             with contextlib.suppress(Exception):
                 task.result()
 
-        _notion_sync_task = asyncio.create_task(self._sync_to_notion_async(status))
+        _notion_sync_task = asyncio.create_task(self._sync_to_notion_async(status, snapshot))
         _notion_sync_task.add_done_callback(_handle_notion_task_done)
 
+    async def _get_failed_clips(self, step: PipelineStep) -> list[int]:
+        """Return clips of a step rejected in review (task_clip_progress)."""
+        async with async_session_factory() as db:  # type: ignore[misc]
+            return await get_clips(db, self.task_id, step.value)
+
+    async def _clear_failed_clips(self, step: PipelineStep) -> None:
+        """Forget a step's rejected clips after they were regenerated."""
+        async with async_session_factory() as db, db.begin():  # type: ignore[misc]
+            await clear_clips(db, self.task_id, step.value)
+        self.log.info("cleared_failed_clip_numbers", task_id=self.task_id, step=step.value)
+
+    async def _save_artifacts(self) -> None:
+        """Persist artifacts recorded by the current step (short transaction)."""
+        if self.artifacts is None:
+            return
+        pending = self.artifacts.take_pending()
+        if not pending:
+            return
+        async with async_session_factory() as db, db.begin():  # type: ignore[misc]
+            await save_artifacts(db, self.task_id, pending)
+        self.log.info("artifacts_recorded", task_id=self.task_id, count=len(pending))
+
+    async def _await_review_gate_side_effect(self, ready_status: TaskStatus) -> None:
+        """Wait for the side effect a review gate reads before entering it.
+
+        A failed or unfinished side effect is logged and never blocks the
+        gate: the step outputs exist and population can be retried.
+        """
+        name = REVIEW_GATE_SIDE_EFFECTS.get(ready_status)
+        if name is None:
+            return
+        status = await get_side_effect_queue().wait(self.task_id, name)
+        if status is not None and status.get("status") != STATUS_COMPLETED:
+            self.log.error(
+                "review_gate_side_effect_incomplete",
+                task_id=self.task_id,
+                review_gate=ready_status.value,
+                side_effect=name,
+                side_effect_status=status.get("status"),
+                error=status.get("error"),
+            )
+
+    def _submit_audio_population(self, kind: str, channel_id: str, project_id: str) -> None:
+        """Submit Notion population of a step's audio clips as a side effect.
+
+        The clip list is taken now (the artifact index keeps changing as later
+        steps run); duration probes and Notion requests run in the background.
+        """
+        audio_files = self._audio_clip_files(kind, channel_id, project_id)
+        if not audio_files:
+            return
+        get_side_effect_queue().submit(
+            self.task_id,
+            f"{kind}_notion_population",
+            functools.partial(self._populate_audio_in_notion, kind, audio_files),
+        )
+
+    def _audio_clip_files(
+        self, kind: str, channel_id: str, project_id: str
+    ) -> list[dict[str, Any]]:
+        """Audio clips for Notion population (duration None where not yet known).
+
+        Clips come from the artifact index, which carries durations recorded at
+        generation time; without an index the audio directory is scanned.
+        """
+        if self.artifacts is not None:
+            return [
+                {
+                    "clip_number": clip_number,
+                    "output_path": self.artifacts.absolute(artifact),
+                    "duration": artifact.duration_seconds,
+                }
+                for clip_number, artifact in self.artifacts.clips(kind).items()
+            ]
+
+        workspace = get_project_workspace(channel_id, project_id)
+        files = []
+        for i in range(1, CLIPS_PER_VIDEO + 1):
+            if kind == ARTIFACT_NARRATION:
+                audio_path = workspace.narration_clip(i)
+            elif workspace.sfx_mp3_clip(i).exists():
+                audio_path = workspace.sfx_mp3_clip(i)
+            else:
+                # Legacy WAV file (before Story 5.5): larger and not web-optimized
+                audio_path = workspace.sfx_clip(i)
+                if audio_path.exists():
+                    self.log.warning(
+                        "sfx_legacy_wav_format_detected",
+                        task_id=self.task_id,
+                        clip_number=i,
+                        message=(
+                            "Using legacy WAV file "
+                            "(consider regenerating for MP3 web optimization)"
+                        ),
+                    )
+            if audio_path.exists():
+                files.append({"clip_number": i, "output_path": audio_path, "duration": None})
+        return files
+
+    async def _populate_audio_in_notion(
+        self, kind: str, audio_files: list[dict[str, Any]]
+    ) -> dict[str, Any] | None:
+        """Probe missing durations and create Audio entries in Notion (Story 5.5).
+
+        Runs as a background side effect after NARRATION_GENERATION (the
+        AUDIO_READY review gate waits for it) or SFX_GENERATION. Missing
+        durations are probed in parallel (bounded).
+
+        Args:
+            kind: ARTIFACT_NARRATION or ARTIFACT_SFX.
+            audio_files: Clips from _audio_clip_files().
+
+        Returns:
+            Population summary (created/skipped/failed), None if skipped
+        """
+        unprobed = [f for f in audio_files if f["duration"] is None]
+        durations = await map_bounded(
+            lambda f: self._get_audio_duration(f["output_path"]), unprobed
+        )
+        for audio_file, duration in zip(unprobed, durations, strict=True):
+            audio_file["duration"] = duration
+
+        notion_token = get_notion_api_token()
+        if not notion_token:
+            self.log.info(
+                "notion_audio_population_skipped",
+                task_id=self.task_id,
+                reason="notion_token_missing",
+            )
+            return None
+
+        async with async_session_factory() as db:  # type: ignore[misc]
+            task = await db.get(Task, self.task_id)
+            channel = await db.get(Channel, task.channel_id) if task else None
+        # DB connection closed - no connection held during Notion requests
+
+        if not task or not channel or not task.notion_page_id:
+            self.log.warning(
+                "notion_audio_population_skipped",
+                task_id=self.task_id,
+                reason="task_channel_or_notion_page_missing",
+            )
+            return None
+
+        audio_service = NotionAudioService(
+            NotionClient(notion_token), channel, NotionPageLedger(task.id)
+        )
+        result = await audio_service.populate_audio(
+            task_id=task.id,
+            notion_page_id=task.notion_page_id,
+            narration_files=audio_files if kind == ARTIFACT_NARRATION else [],
+            sfx_files=audio_files if kind == ARTIFACT_SFX else [],
+            correlation_id=self.correlation_id,
+        )
+        self.log.info(
+            f"{kind}_notion_population_complete",
+            task_id=self.task_id,
+            created=result.get("created", 0),
+            skipped=result.get("skipped", 0),
+            failed=result.get("failed", 0),
+        )
+        return result
+
+    async def _measure_workspace(self, channel_id: str, project_id: str) -> int | None:
+        """Measure the project workspace after a step (None if it fails).
+
+        Only this project's directory is walked, so per-channel disk usage
+        stays current without scanning the whole workspace.
+        """
+        try:
+            return await asyncio.to_thread(measure_project_bytes, channel_id, project_id)
+        except (OSError, ValueError) as e:
+            self.log.warning("workspace_measure_failed", task_id=self.task_id, error=str(e))
+            return None
+
     async def save_step_completion(
         self,
         step: PipelineStep,
         completion: StepCompletion,
+        workspace_bytes: int | None = None,
     ) -> None:
         """Save step completion metadata to database.
 
@@ -1100,6 +1248,8 @@ class PipelineOrchestrator:
         Args:
             step: Pipeline step that completed
             completion: StepCompletion object with details
+            workspace_bytes: Measured project workspace size, if available
+                (also re-arms workspace retention for the task)
 
         Example:
             >>> await orchestrator.save_step_completion(
@@ -1109,71 +1259,156 @@ class PipelineOrchestrator:
             ...     ),
             ... )
         """
+        columns: dict[str, Any] = {}
+        # Progress resets the transient-retry backoff
+        if completion.completed:
+            columns["retry_count"] = 0
+        if workspace_bytes is not None:
+            columns["workspace_bytes"] = workspace_bytes
+            columns["workspace_retention_status"] = None
+
+        # asset_files is only needed in memory (Notion population right after
+        # the step); keep it out of the stored document
+        partial_progress = completion.partial_progress
+        if partial_progress and "asset_files" in partial_progress:
+            partial_progress = {k: v for k, v in partial_progress.items() if k != "asset_files"}
+
+        # One UPDATE merging this step's key server-side (no row load, no
+        # whole-document rewrite, no reliance on JSON change detection)
         async with async_session_factory() as db, db.begin():  # type: ignore[misc]
-            task = await db.get(Task, self.task_id)
-            if task:
-                # Initialize metadata dict if not exists
-                if not task.step_completion_metadata:
-                    task.step_completion_metadata = {}
-
-                # Update step completion data
-                task.step_completion_metadata[step.value] = {
+            await set_step_metadata(
+                db,
+                self.task_id,
+                step.value,
+                {
                     "completed": completion.completed,
                     "duration_seconds": completion.duration_seconds,
-                    "partial_progress": completion.partial_progress,
+                    "partial_progress": partial_progress,
                     "error_message": completion.error_message,
-                }
+                },
+                **columns,
+            )
+
+    async def schedule_retry(self, exception: Exception, error_type: str) -> bool:
+        """Re-queue a task after a transient error, deferred with backoff.
+
+        The task goes from its error status back to QUEUED with not_before
+        set, so no worker claims it until the backoff elapses. Quota errors
+        wait for the advertised reset time instead of the backoff.
+
+        Backoff: 60s * 2^retry_count (±20% jitter, capped at 1h). After
+        MAX_TRANSIENT_RETRIES consecutive failures the task stays in its error
+        status for manual retry. retry_count resets when a step completes.
+
+        Args:
+            exception: Transient exception raised by the step.
+            error_type: Classification from classify_error().
 
-    async def _sync_to_notion_async(self, status: TaskStatus) -> None:
+        Returns:
+            True if the task was re-queued, False if retries are exhausted
+            or the update failed (task stays in its error status).
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            async with async_session_factory() as db, db.begin():  # type: ignore[misc]
+                task = await db.get(Task, self.task_id)
+                if task is None:
+                    return False
+
+                retry_at = transient_retry_at(task.retry_count, now)
+                if retry_at is None:
+                    self.log.warning(
+                        "transient_retries_exhausted",
+                        error_type=error_type,
+                        retry_count=task.retry_count,
+                    )
+                    return False
+
+                quota_reset = parse_quota_error(str(exception), now)
+                if quota_reset is not None:
+                    retry_at = max(retry_at, quota_reset[0])
+
+                task.status = TaskStatus.QUEUED
+                task.retry_count += 1
+                defer_task(task, retry_at, error_type)
+                retry_count = task.retry_count
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_STATUS_CHANGE,
+                    TaskStatus.QUEUED,
+                    message=f"Transient retry {retry_count} after {error_type}",
+                    error_type=error_type,
+                    not_before=retry_at.isoformat(),
+                )
+                await db.flush()
+                snapshot = TaskSnapshot.from_task(task)
+        except Exception as e:
+            self.log.error("retry_scheduling_failed", error=str(e), error_type=type(e).__name__)
+            return False
+
+        self.log.info(
+            "transient_retry_scheduled",
+            error_type=error_type,
+            retry_count=retry_count,
+            not_before=retry_at.isoformat(),
+        )
+
+        def _handle_notion_task_done(task: asyncio.Task[None]) -> None:
+            with contextlib.suppress(Exception):
+                task.result()
+
+        _notion_sync_task = asyncio.create_task(
+            self._sync_to_notion_async(TaskStatus.QUEUED, snapshot)
+        )
+        _notion_sync_task.add_done_callback(_handle_notion_task_done)
+        return True
+
+    async def _sync_to_notion_async(
+        self, status: TaskStatus, snapshot: TaskSnapshot | None = None
+    ) -> None:
         """Sync task status to Notion (async, non-blocking).
 
         Uses fire-and-forget pattern to avoid blocking pipeline execution.
         Errors are logged but don't fail the pipeline.
 
         Short Transaction Pattern:
-        - Open DB session
-        - Load task data
-        - Close DB session
+        - Use the snapshot returned by the status update (no DB access), or
+        - Open DB session, load task data, close DB session
         - Make external API call
 
         This prevents long-running API calls from holding DB connections.
 
         Args:
             status: Current task status to sync
+            snapshot: Task state returned by the update that changed status
 
         Example:
             >>> # Called from update_task_status
             >>> asyncio.create_task(orchestrator._sync_to_notion_async(status))
         """
         try:
-            # Short transaction: Load task data, then close DB before API call
-            async with async_session_factory() as db:  # type: ignore[misc]
-                task = await db.get(Task, self.task_id)
-                if not task:
-                    self.log.error(
-                        "notion_sync_failed",
-                        reason="task_not_found",
-                        task_id=self.task_id,
-                    )
-                    return
-
-                if not task.notion_page_id:
-                    self.log.debug(
-                        "notion_sync_skipped",
-                        reason="no_notion_page_id",
-                        task_id=self.task_id,
-                    )
-                    return
+            if snapshot is None:
+                # Short transaction: Load task data, then close DB before API call
+                async with async_session_factory() as db:  # type: ignore[misc]
+                    task = await db.get(Task, self.task_id)
+                    if not task:
+                        self.log.error(
+                            "notion_sync_failed",
+                            reason="task_not_found",
+                            task_id=self.task_id,
+                        )
+                        return
+                    snapshot = TaskSnapshot.from_task(task)
 
-                # Extract task data before closing DB session
-                task_data = TaskSyncData(
-                    id=task.id,
-                    notion_page_id=task.notion_page_id,
-                    status=task.status,
-                    priority=task.priority,
-                    title=task.title or "Untitled Task",
-                    updated_at=task.updated_at,
+            task_data = snapshot.to_sync_data()
+            if task_data is None:
+                self.log.debug(
+                    "notion_sync_skipped",
+                    reason="no_notion_page_id",
+                    task_id=self.task_id,
                 )
+                return
 
             # DB session closed - now safe to make API call
             notion_api_token = get_notion_api_token()
@@ -1289,11 +1524,16 @@ class PipelineOrchestrator:
 
         Returns:
             Dict with channel_id, project_id, topic, story_direction,
-            narration_scripts, sfx_descriptions, voice_id
+            narration_scripts, sfx_descriptions, voice_id, artifacts
+            (the task's ArtifactIndex, used for resume checks) and branding
+            (channel BrandingPaths for assembly)
             None if task not found
         """
         async with async_session_factory() as db:  # type: ignore[misc]
-            task = await db.get(Task, self.task_id)
+            # Task and channel in one query (no lazy load of the relationship)
+            task = await db.scalar(
+                select(Task).options(joinedload(Task.channel)).where(Task.id == self.task_id)
+            )
             if not task:
                 return None
 
@@ -1302,7 +1542,9 @@ class PipelineOrchestrator:
             if not channel:
                 return None
 
+            project_dir = get_project_workspace(channel.channel_id, str(task.id)).project_dir
             return {
+                "artifacts": await load_artifact_index(db, task.id, project_dir),
                 "channel_id": channel.channel_id,
                 "project_id": str(task.id),
                 "topic": task.topic,
@@ -1310,30 +1552,19 @@ class PipelineOrchestrator:
                 "narration_scripts": task.narration_scripts,
                 "sfx_descriptions": task.sfx_descriptions,
                 "voice_id": channel.voice_id or channel.default_voice_id,
+                "branding": BrandingPaths(
+                    intro_path=channel.branding_intro_path,
+                    outro_path=channel.branding_outro_path,
+                    watermark_path=channel.branding_watermark_path,
+                ),
             }
 
     async def _update_pipeline_start_time(self, start_time: datetime) -> None:
-        """Update pipeline_start_time in database."""
-        async with async_session_factory() as db, db.begin():  # type: ignore[misc]
-            task = await db.get(Task, self.task_id)
-            if task:
-                task.pipeline_start_time = start_time
-
-    async def _update_pipeline_end_time(
-        self,
-        end_time: datetime,
-        duration_seconds: float,
-    ) -> None:
-        """Update pipeline_end_time and duration in database."""
+        """Update pipeline_start_time in database (one UPDATE, no load)."""
         async with async_session_factory() as db, db.begin():  # type: ignore[misc]
-            task = await db.get(Task, self.task_id)
-            if task:
-                task.pipeline_end_time = end_time
-                task.pipeline_duration_seconds = duration_seconds
+            await update_task(db, self.task_id, pipeline_start_time=start_time)
 
     async def _update_pipeline_cost(self, cost_usd: float) -> None:
-        """Update pipeline_cost_usd in database."""
+        """Update pipeline_cost_usd in database (one UPDATE, no load)."""
         async with async_session_factory() as db, db.begin():  # type: ignore[misc]
-            task = await db.get(Task, self.task_id)
-            if task:
-                task.pipeline_cost_usd = cost_usd
+            await update_task(db, self.task_id, pipeline_cost_usd=cost_usd)
@@ -30,22 +30,36 @@ Usage:
     await service.approve_videos(task_id=task_id, notion_page_id=page_id)
     await service.reject_videos(task_id=task_id, reason="Quality issues", notion_page_id=page_id)
 
-    # Bulk operations
+    # Bulk operations (return after the database commit; Notion syncs in the background)
     result = await service.bulk_approve_tasks(db, task_ids, TaskStatus.VIDEO_APPROVED)
     result = await service.bulk_reject_tasks(db, task_ids, "Reason", TaskStatus.VIDEO_ERROR)
+    progress = await result.notion_sync.wait()
 """
 
 from dataclasses import dataclass, field
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.clients.notion import NotionClient
 from app.config import get_notion_api_token
 from app.constants import INTERNAL_TO_NOTION_STATUS
 from app.exceptions import InvalidStateTransitionError
 from app.models import Task, TaskStatus
+from app.services.notion_status_sync import (
+    NotionStatusSyncJob,
+    StatusSyncItem,
+    record_status_syncs,
+    retry_status_syncs,
+)
+from app.services.task_events import (
+    EVENT_REJECTION,
+    record_task_event,
+    record_task_events,
+    task_event_row,
+)
+from app.services.task_metadata import CLIP_STATUS_FAILED, NARRATION_STEP, SFX_STEP, set_clip_status
 from app.utils.logging import get_logger
 
 log = get_logger(__name__)
@@ -58,13 +72,21 @@ class BulkOperationResult:
     This dataclass contains detailed results of a bulk review operation,
     including success/failure counts and error details.
 
+    Notion updates run in the background after the database commit, so the
+    Notion counts only cover tasks needing no update (no Notion page, Notion
+    not configured); queued updates are counted in notion_pending_count and
+    reported by notion_sync.
+
     Attributes:
         total_count: Total number of tasks in the bulk operation
         success_count: Number of tasks successfully updated in database
-        notion_success_count: Number of tasks successfully synced to Notion
+        notion_success_count: Number of tasks synced to Notion (or needing no sync)
         notion_failure_count: Number of tasks that failed Notion sync
         errors: List of detailed error messages
         failed_task_ids: List of task UUIDs that failed (validation or Notion sync)
+        notion_pending_count: Number of Notion updates queued in the background
+        notion_sync: Background Notion sync job (None if nothing to sync);
+            `await notion_sync.wait()` returns its final progress
     """
 
     total_count: int
@@ -73,6 +95,13 @@ class BulkOperationResult:
     notion_failure_count: int
     errors: list[str] = field(default_factory=list)
     failed_task_ids: list[UUID] = field(default_factory=list)
+    notion_pending_count: int = 0
+    notion_sync: NotionStatusSyncJob | None = None
+
+    @property
+    def notion_sync_job_id(self) -> UUID | None:
+        """Bulk operation ID for get_sync_progress() (None if nothing to sync)."""
+        return self.notion_sync.job_id if self.notion_sync else None
 
 
 class ReviewService:
@@ -93,7 +122,7 @@ class ReviewService:
     - Logs all review decisions for audit trail
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize ReviewService with shared NotionClient for rate limiting."""
         self._notion_client: NotionClient | None = None
 
@@ -225,7 +254,7 @@ class ReviewService:
         Args:
             db: Active database session (managed by caller)
             task_id: Internal task UUID
-            reason: Human-readable rejection reason (logged in error_log)
+            reason: Human-readable rejection reason (recorded as a rejection event)
             notion_page_id: Notion page ID for status sync (optional)
             correlation_id: Correlation ID for logging (optional)
 
@@ -279,11 +308,10 @@ class ReviewService:
         # Transition to VIDEO_ERROR with rejection reason
         try:
             task.status = TaskStatus.VIDEO_ERROR
-            # Append rejection reason to error log (preserves history)
-            if task.error_log:
-                task.error_log += f"\n\nVideo rejected: {reason}"
-            else:
-                task.error_log = f"Video rejected: {reason}"
+            # Rejection reason is an append-only event (preserves history)
+            record_task_event(
+                db, task.id, EVENT_REJECTION, task.status, message=f"Video rejected: {reason}"
+            )
 
             await db.flush()  # Validate transition, but don't commit yet
 
@@ -443,7 +471,7 @@ class ReviewService:
         Args:
             db: Active database session (managed by caller)
             task_id: Internal task UUID
-            reason: Human-readable rejection reason (logged in error_log)
+            reason: Human-readable rejection reason (recorded as a rejection event)
             failed_clip_numbers: Optional list of clip numbers needing regeneration (1-18)
             notion_page_id: Notion page ID for status sync (optional)
             correlation_id: Correlation ID for logging (optional)
@@ -504,21 +532,18 @@ class ReviewService:
         try:
             task.status = TaskStatus.AUDIO_ERROR
 
-            # Append rejection reason to error log (preserves history)
+            # Rejection reason is an append-only event (preserves history)
             rejection_message = f"Audio rejected: {reason}"
             if failed_clip_numbers:
                 rejection_message += f" (clips {', '.join(map(str, failed_clip_numbers))} need regeneration)"
 
-            if task.error_log:
-                task.error_log += f"\n\n{rejection_message}"
-            else:
-                task.error_log = rejection_message
+            record_task_event(db, task.id, EVENT_REJECTION, task.status, message=rejection_message)
 
-            # Store failed clip numbers in step_completion_metadata for partial regeneration
+            # Record failed clips for partial regeneration of narration and SFX
             if failed_clip_numbers:
-                if not task.step_completion_metadata:
-                    task.step_completion_metadata = {}
-                task.step_completion_metadata["failed_audio_clip_numbers"] = failed_clip_numbers
+                await set_clip_status(
+                    db, task.id, (NARRATION_STEP, SFX_STEP), failed_clip_numbers, CLIP_STATUS_FAILED
+                )
 
             await db.flush()  # Validate transition, but don't commit yet
 
@@ -573,7 +598,8 @@ class ReviewService:
 
         This method implements bulk approval workflow for Story 5.8.
         All tasks are validated and updated in a single database transaction.
-        Notion sync happens after commit (non-blocking, graceful partial failure).
+        Notion sync runs in the background after commit (graceful partial
+        failure, failed updates retried later).
 
         Args:
             db: Active database session (transaction managed by this method)
@@ -595,8 +621,8 @@ class ReviewService:
             3. Update all task statuses in single transaction
             4. Commit database changes
             5. Close database connection
-            6. Loop through tasks and update Notion (async, rate-limited)
-            7. Return success/failure counts
+            6. Start the background Notion sync (rate-limited, not awaited)
+            7. Return counts; Notion progress is on result.notion_sync
 
         Example:
             >>> task_ids = [uuid1, uuid2, uuid3, ...]
@@ -606,7 +632,8 @@ class ReviewService:
             ...     target_status=TaskStatus.VIDEO_APPROVED,
             ...     channel_id="test-channel"
             ... )
-            >>> print(f"Updated {result.success_count} tasks, {result.notion_failure_count} Notion failures")
+            >>> progress = await result.notion_sync.wait()  # Optional
+            >>> print(f"Updated {result.success_count} tasks, {progress.failed} Notion failures")
         """
         total_count = len(task_ids)
 
@@ -676,6 +703,10 @@ class ReviewService:
         for task in tasks:
             task.status = target_status
 
+        # Notion updates are recorded in the same transaction (durable retries)
+        sync_items = self._notion_sync_items(tasks, target_status)
+        await record_status_syncs(db, sync_items)
+
         # Step 4: Flush and commit to persist changes
         await db.flush()
         await db.commit()
@@ -687,35 +718,10 @@ class ReviewService:
             target_status=target_status.value,
         )
 
-        # Step 5: Database transaction complete - now update Notion (async, non-blocking)
-        # Uses shared NotionClient instance for proper rate limiting (3 req/sec)
-        notion_failures: list[tuple[UUID, str]] = []
-        for task in tasks:
-            if task.notion_page_id:
-                success, error_msg = await self._update_notion_status_async(
-                    notion_page_id=task.notion_page_id,
-                    status=target_status,
-                    correlation_id=correlation_id,
-                )
-                if not success:
-                    notion_failures.append((task.id, error_msg))
-                    log.warning(
-                        "bulk_approve_notion_sync_failed",
-                        correlation_id=correlation_id,
-                        task_id=str(task.id),
-                        error=error_msg,
-                    )
-
-        # Step 6: Return results
-        notion_success_count = len(tasks) - len(notion_failures)
-        result_obj = BulkOperationResult(
-            total_count=len(tasks),
-            success_count=len(tasks),
-            notion_success_count=notion_success_count,
-            notion_failure_count=len(notion_failures),
-            errors=[f"Task {tid}: {err}" for tid, err in notion_failures],
-            failed_task_ids=[tid for tid, _ in notion_failures],
-        )
+        # Step 5: Database transaction complete - push statuses to Notion in the
+        # background (the request does not wait; progress is on result.notion_sync)
+        notion_sync = self._start_notion_sync(db, sync_items, correlation_id)
+        result_obj = self._bulk_result(tasks, notion_sync)
 
         log.info(
             "bulk_approve_completed",
@@ -724,6 +730,7 @@ class ReviewService:
             success_count=result_obj.success_count,
             notion_success_count=result_obj.notion_success_count,
             notion_failure_count=result_obj.notion_failure_count,
+            notion_pending_count=result_obj.notion_pending_count,
         )
 
         return result_obj
@@ -840,15 +847,23 @@ class ReviewService:
                     to_status=target_status,
                 )
 
-        # All validations passed - now update statuses and error logs
+        # All validations passed - now update statuses and record rejections
         for task in tasks:
             task.status = target_status
+        # Rejection reasons are append-only events (one executemany)
+        await record_task_events(
+            db,
+            (
+                task_event_row(
+                    task.id, EVENT_REJECTION, target_status, message=f"Bulk rejection: {reason}"
+                )
+                for task in tasks
+            ),
+        )
 
-            # Append rejection reason to error log (preserves history)
-            if task.error_log:
-                task.error_log += f"\n\nBulk rejection: {reason}"
-            else:
-                task.error_log = f"Bulk rejection: {reason}"
+        # Notion updates are recorded in the same transaction (durable retries)
+        sync_items = self._notion_sync_items(tasks, target_status)
+        await record_status_syncs(db, sync_items)
 
         # Step 3: Flush and commit to persist changes
         await db.flush()
@@ -861,35 +876,10 @@ class ReviewService:
             target_status=target_status.value,
         )
 
-        # Step 4: Database transaction complete - now update Notion (async, non-blocking)
-        # Uses shared NotionClient instance for proper rate limiting (3 req/sec)
-        notion_failures: list[tuple[UUID, str]] = []
-        for task in tasks:
-            if task.notion_page_id:
-                success, error_msg = await self._update_notion_status_async(
-                    notion_page_id=task.notion_page_id,
-                    status=target_status,
-                    correlation_id=correlation_id,
-                )
-                if not success:
-                    notion_failures.append((task.id, error_msg))
-                    log.warning(
-                        "bulk_reject_notion_sync_failed",
-                        correlation_id=correlation_id,
-                        task_id=str(task.id),
-                        error=error_msg,
-                    )
-
-        # Step 6: Return results
-        notion_success_count = len(tasks) - len(notion_failures)
-        result_obj = BulkOperationResult(
-            total_count=len(tasks),
-            success_count=len(tasks),
-            notion_success_count=notion_success_count,
-            notion_failure_count=len(notion_failures),
-            errors=[f"Task {tid}: {err}" for tid, err in notion_failures],
-            failed_task_ids=[tid for tid, _ in notion_failures],
-        )
+        # Step 4: Database transaction complete - push statuses to Notion in the
+        # background (the request does not wait; progress is on result.notion_sync)
+        notion_sync = self._start_notion_sync(db, sync_items, correlation_id)
+        result_obj = self._bulk_result(tasks, notion_sync)
 
         log.info(
             "bulk_reject_completed",
@@ -898,10 +888,68 @@ class ReviewService:
             success_count=result_obj.success_count,
             notion_success_count=result_obj.notion_success_count,
             notion_failure_count=result_obj.notion_failure_count,
+            notion_pending_count=result_obj.notion_pending_count,
         )
 
         return result_obj
 
+    def _notion_sync_items(
+        self, tasks: list[Task], target_status: TaskStatus
+    ) -> list[StatusSyncItem]:
+        """Notion updates for a bulk operation (none if Notion is not configured)."""
+        if not self._get_notion_client():
+            return []
+        job_id = uuid4()
+        return [
+            StatusSyncItem(
+                job_id=job_id,
+                task_id=task.id,
+                notion_page_id=task.notion_page_id,
+                target_status=target_status,
+            )
+            for task in tasks
+            if task.notion_page_id
+        ]
+
+    def _start_notion_sync(
+        self,
+        db: AsyncSession,
+        sync_items: list[StatusSyncItem],
+        correlation_id: str | None,
+    ) -> NotionStatusSyncJob | None:
+        """Start the background Notion sync of committed bulk updates."""
+        if not sync_items:
+            return None
+        return NotionStatusSyncJob(
+            sync_items[0].job_id,
+            sync_items,
+            self._update_notion_status_async,
+            # Outcomes are stored in the database of the bulk operation
+            session_factory=async_sessionmaker(db.bind, expire_on_commit=False),
+            correlation_id=correlation_id,
+        ).start()
+
+    @staticmethod
+    def _bulk_result(
+        tasks: list[Task], notion_sync: NotionStatusSyncJob | None
+    ) -> BulkOperationResult:
+        """Result of a committed bulk operation."""
+        pending = notion_sync.progress.total if notion_sync else 0
+        return BulkOperationResult(
+            total_count=len(tasks),
+            success_count=len(tasks),
+            notion_success_count=len(tasks) - pending,
+            notion_failure_count=0,
+            notion_pending_count=pending,
+            notion_sync=notion_sync,
+        )
+
+    async def retry_failed_notion_syncs(self) -> None:
+        """Retry failed and stale bulk Notion updates (Notion sync loop)."""
+        if not self._get_notion_client():
+            return
+        await retry_status_syncs(self._update_notion_status_async)
+
     async def _update_notion_status_async(
         self,
         notion_page_id: str,
@@ -0,0 +1,450 @@
+"""Discrete-event simulation of queue claim policies.
+
+This module models the claim policies from app/queue.py in memory so that
+scheduling changes can be evaluated without a PostgreSQL instance. Each policy
+class mirrors the ORDER BY of its SQL counterpart; the simulator replays a
+workload through N workers and reports per-channel queue wait distributions.
+
+Policies:
+    - RoundRobinPolicy: ROUND_ROBIN_QUERY (priority → channel_id ASC → FIFO)
+    - FairSharePolicy: fair share without remaining-work ordering
+      (priority → channel virtual time → FIFO)
+    - ShortestRemainingWorkPolicy: fair_share_claim_statement (fair share across
+      channels, shortest predicted remaining work first within a channel,
+      starving tasks oldest-first)
+
+Capacity Model:
+    A task occupies one worker and one Channel.max_concurrent slot from claim
+    until its service time elapses. Channels at max_concurrent are ineligible,
+    matching the `busy` subquery in fair_share_claim_statement.
+
+Review Gates:
+    A SimulatedTask may carry a follow_on segment that is re-queued
+    resume_delay_seconds after it finishes, modelling a task halted at a review
+    gate and re-queued on approval. Turnaround (time to FINAL_REVIEW) is
+    measured from the first segment's arrival to the last segment's finish.
+    tasks_from_history() builds such chains from recorded Task rows.
+
+Usage:
+    from app.services.scheduler_simulation import (
+        FairSharePolicy,
+        SimulatedTask,
+        simulate,
+    )
+
+    result = simulate(tasks, FairSharePolicy(), workers=3)
+    for stats in result.channel_stats():
+        print(stats.channel_id, stats.p95_wait_seconds)
+"""
+
+import heapq
+import itertools
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, replace
+from typing import Any, Optional
+
+from app.models import PriorityLevel, Task
+from app.queue import STARVATION_THRESHOLD_SECONDS
+from app.services.work_estimator import (
+    StepEstimate,
+    estimate_remaining_work,
+    extract_step_durations,
+    percentile,
+)
+
+# Claim order rank for each priority (matches prioritylevel enum declaration order)
+PRIORITY_RANK: dict[PriorityLevel, int] = {
+    PriorityLevel.HIGH: 0,
+    PriorityLevel.NORMAL: 1,
+    PriorityLevel.LOW: 2,
+}
+
+# Queue visits of one task: the pipeline halts at ASSETS_READY, VIDEO_READY and
+# AUDIO_READY (is_review_gate) and the task is re-queued once approved
+REVIEW_GATE_SEGMENTS: tuple[tuple[str, ...], ...] = (
+    ("asset_generation",),
+    ("composite_creation", "video_generation"),
+    ("narration_generation",),
+    ("sfx_generation", "video_assembly"),
+)
+
+
+@dataclass(frozen=True)
+class SimulatedTask:
+    """A unit of queued work in the simulation.
+
+    Attributes:
+        task_id: Unique identifier (used for deterministic tie-breaking).
+        channel_id: Business identifier of the owning channel.
+        arrival_seconds: Time the task becomes claimable (Task.created_at analogue).
+        service_seconds: Time the task holds a worker and a channel slot.
+        priority: Queue priority (high claims before normal before low).
+        predicted_seconds: Predicted remaining work to FINAL_REVIEW at queue time
+            (used by ShortestRemainingWorkPolicy; None counts as zero).
+        predicted_cost_usd: Predicted remaining cost at queue time (tie-breaker
+            between equally long tasks; None counts as zero).
+        follow_on: Next queue visit after a review gate, if any.
+        resume_delay_seconds: Review time before follow_on is re-queued.
+        origin_seconds: Arrival of the task's first segment (defaults to
+            arrival_seconds); turnaround is measured from here.
+    """
+
+    task_id: str
+    channel_id: str
+    arrival_seconds: float
+    service_seconds: float
+    priority: PriorityLevel = PriorityLevel.NORMAL
+    predicted_seconds: float | None = None
+    predicted_cost_usd: float | None = None
+    follow_on: Optional["SimulatedTask"] = None
+    resume_delay_seconds: float = 0.0
+    origin_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class ChannelLatencyStats:
+    """Queue wait distribution for a single channel.
+
+    Attributes:
+        channel_id: Business identifier for the channel.
+        claimed: Number of tasks claimed during the simulation.
+        mean_wait_seconds: Mean time from arrival to claim.
+        p50_wait_seconds: Median time from arrival to claim.
+        p95_wait_seconds: 95th percentile time from arrival to claim.
+        max_wait_seconds: Worst-case time from arrival to claim.
+        mean_turnaround_seconds: Mean time from first arrival to last finish.
+        max_turnaround_seconds: Worst-case time from first arrival to last finish.
+    """
+
+    channel_id: str
+    claimed: int
+    mean_wait_seconds: float
+    p50_wait_seconds: float
+    p95_wait_seconds: float
+    max_wait_seconds: float
+    mean_turnaround_seconds: float = 0.0
+    max_turnaround_seconds: float = 0.0
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of replaying a workload through a claim policy.
+
+    Attributes:
+        policy: Policy name (e.g., "fair_share").
+        makespan_seconds: Time at which the last task finished.
+        claim_order: Channel IDs in the order their tasks were claimed.
+        wait_seconds: Per-channel list of arrival-to-claim waits (per segment).
+        turnaround_seconds: Per-channel list of first-arrival-to-last-finish times.
+    """
+
+    policy: str
+    makespan_seconds: float = 0.0
+    claim_order: list[str] = field(default_factory=list)
+    wait_seconds: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    turnaround_seconds: dict[str, list[float]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+
+    @property
+    def mean_turnaround_seconds(self) -> float:
+        """Mean time to FINAL_REVIEW across all channels."""
+        samples = [t for values in self.turnaround_seconds.values() for t in values]
+        return sum(samples) / len(samples) if samples else 0.0
+
+    def channel_stats(self) -> list[ChannelLatencyStats]:
+        """Summarize wait distributions per channel, sorted by channel_id."""
+        stats = []
+        for channel_id, waits in sorted(self.wait_seconds.items()):
+            if not waits:
+                continue
+            turnaround = self.turnaround_seconds.get(channel_id) or [0.0]
+            stats.append(
+                ChannelLatencyStats(
+                    channel_id=channel_id,
+                    claimed=len(waits),
+                    mean_wait_seconds=sum(waits) / len(waits),
+                    p50_wait_seconds=percentile(waits, 50),
+                    p95_wait_seconds=percentile(waits, 95),
+                    max_wait_seconds=max(waits),
+                    mean_turnaround_seconds=sum(turnaround) / len(turnaround),
+                    max_turnaround_seconds=max(turnaround),
+                )
+            )
+        return stats
+
+
+class ClaimPolicy:
+    """Base class for claim ordering policies.
+
+    Subclasses implement select() to pick the next task among eligible
+    candidates (channels under capacity). on_claim() lets stateful policies
+    update their bookkeeping after a claim.
+    """
+
+    name = "base"
+
+    def reset(self, max_concurrent: dict[str, int]) -> None:
+        """Prepare policy state for a new simulation run.
+
+        Args:
+            max_concurrent: Channel.max_concurrent per channel_id.
+        """
+        self.max_concurrent = dict(max_concurrent)
+
+    def select(
+        self, candidates: list[SimulatedTask], in_progress: Counter[str], now: float
+    ) -> SimulatedTask:
+        """Pick the next task to claim from non-empty candidates."""
+        raise NotImplementedError
+
+    def on_claim(self, task: SimulatedTask, in_progress: Counter[str], now: float) -> None:
+        """Update policy state after task is claimed."""
+
+
+class RoundRobinPolicy(ClaimPolicy):
+    """Model of ROUND_ROBIN_QUERY: priority → channel_id ASC → FIFO."""
+
+    name = "round_robin"
+
+    def select(
+        self, candidates: list[SimulatedTask], in_progress: Counter[str], now: float
+    ) -> SimulatedTask:
+        """Pick the oldest task of the alphabetically first channel."""
+        return min(
+            candidates,
+            key=lambda t: (PRIORITY_RANK[t.priority], t.channel_id, t.arrival_seconds, t.task_id),
+        )
+
+
+class FairSharePolicy(ClaimPolicy):
+    """Model of fair-share claiming: priority → channel virtual time → FIFO.
+
+    Each claim charges the channel 1 / max_concurrent virtual seconds. The
+    system clock is the start tag of the most recent claim (the highest
+    virtual time minus its increment); lagging channels are clamped up to it
+    so a channel returning from idle cannot bank credit.
+    """
+
+    name = "fair_share"
+
+    def reset(self, max_concurrent: dict[str, int]) -> None:
+        """Reset every channel's virtual time to zero."""
+        super().reset(max_concurrent)
+        self.virtual_time: dict[str, float] = dict.fromkeys(max_concurrent, 0.0)
+
+    def _system_clock(self) -> float:
+        start_tags = [vt - 1.0 / self.max_concurrent[ch] for ch, vt in self.virtual_time.items()]
+        return max([0.0, *start_tags])
+
+    def head_key(self, task: SimulatedTask, now: float) -> tuple[Any, ...]:
+        """Ordering of a channel's own backlog."""
+        return (PRIORITY_RANK[task.priority], task.arrival_seconds, task.task_id)
+
+    def select(
+        self, candidates: list[SimulatedTask], in_progress: Counter[str], now: float
+    ) -> SimulatedTask:
+        """Pick the head of the channel with the lowest effective virtual time."""
+        heads: dict[str, SimulatedTask] = {}
+        for task in candidates:
+            head = heads.get(task.channel_id)
+            if head is None or self.head_key(task, now) < self.head_key(head, now):
+                heads[task.channel_id] = task
+
+        clock = self._system_clock()
+        return min(
+            heads.values(),
+            key=lambda t: (
+                PRIORITY_RANK[t.priority],
+                max(self.virtual_time[t.channel_id], clock),
+                t.arrival_seconds,
+                t.task_id,
+            ),
+        )
+
+    def on_claim(self, task: SimulatedTask, in_progress: Counter[str], now: float) -> None:
+        """Advance the claiming channel's virtual time by 1 / max_concurrent."""
+        clock = self._system_clock()
+        current = self.virtual_time[task.channel_id]
+        self.virtual_time[task.channel_id] = (
+            max(current, clock) + 1.0 / self.max_concurrent[task.channel_id]
+        )
+
+
+class ShortestRemainingWorkPolicy(FairSharePolicy):
+    """Model of fair_share_claim_statement with duration-aware backlog ordering.
+
+    Channels are chosen exactly as in FairSharePolicy. Within a channel, tasks
+    waiting at least starvation_seconds are claimed oldest-first; all others
+    are claimed by smallest predicted_seconds, then smallest
+    predicted_cost_usd, then FIFO.
+    """
+
+    name = "shortest_remaining_work"
+
+    def __init__(self, starvation_seconds: float = STARVATION_THRESHOLD_SECONDS):
+        """Initialize policy.
+
+        Args:
+            starvation_seconds: Queue wait after which a task is promoted ahead
+                of shorter work (mirrors STARVATION_THRESHOLD_SECONDS).
+        """
+        self.starvation_seconds = starvation_seconds
+
+    def head_key(self, task: SimulatedTask, now: float) -> tuple[Any, ...]:
+        """Starving tasks oldest-first, then shortest then cheapest remaining work."""
+        starving = now - task.arrival_seconds >= self.starvation_seconds
+        return (
+            PRIORITY_RANK[task.priority],
+            task.arrival_seconds if starving else float("inf"),
+            task.predicted_seconds or 0.0,
+            task.predicted_cost_usd or 0.0,
+            task.arrival_seconds,
+            task.task_id,
+        )
+
+
+def tasks_from_history(
+    tasks: list[Task],
+    estimates: dict[uuid.UUID, dict[str, StepEstimate]],
+    resume_delay_seconds: float = 600.0,
+) -> list[SimulatedTask]:
+    """Build replayable task chains from recorded Task rows.
+
+    Each task becomes one segment per review-gate visit (REVIEW_GATE_SEGMENTS)
+    with its recorded step durations as service time and its predicted
+    remaining work computed from estimates as of that segment's start.
+    Arrivals are created_at offsets from the earliest task.
+
+    Args:
+        tasks: Task rows with step_completion_metadata durations recorded.
+        estimates: Step estimates per channel UUID (see build_step_estimates).
+        resume_delay_seconds: Review delay between segments when the task has
+            no recorded review_started_at/review_completed_at.
+
+    Returns:
+        First segment of each task (later segments are chained via follow_on).
+        Tasks without any recorded step durations are skipped.
+    """
+    recorded = [(task, extract_step_durations(task.step_completion_metadata)) for task in tasks]
+    recorded = [(task, durations) for task, durations in recorded if durations]
+    if not recorded:
+        return []
+    epoch = min(task.created_at for task, _ in recorded)
+
+    simulated = []
+    for task, durations in recorded:
+        delay = resume_delay_seconds
+        if task.review_started_at and task.review_completed_at:
+            delay = (task.review_completed_at - task.review_started_at).total_seconds()
+        channel_estimates = estimates.get(task.channel_id, {})
+        arrival = (task.created_at - epoch).total_seconds()
+
+        chain: SimulatedTask | None = None
+        done: dict[str, Any] = {}
+        segments = []
+        for segment in REVIEW_GATE_SEGMENTS:
+            predicted = estimate_remaining_work(done, channel_estimates)
+            service = sum(durations.get(step, 0.0) for step in segment)
+            segments.append((service, predicted.seconds, predicted.cost_usd))
+            done.update({step: {"completed": True} for step in segment})
+        for service, predicted_seconds, predicted_cost in reversed(segments):
+            chain = SimulatedTask(
+                task_id=str(task.id),
+                channel_id=str(task.channel_id),
+                arrival_seconds=arrival,
+                service_seconds=service,
+                priority=task.priority,
+                predicted_seconds=predicted_seconds,
+                predicted_cost_usd=predicted_cost,
+                follow_on=chain,
+                resume_delay_seconds=delay,
+            )
+        assert chain is not None
+        simulated.append(chain)
+    return simulated
+
+
+def simulate(
+    tasks: list[SimulatedTask],
+    policy: ClaimPolicy,
+    workers: int = 3,
+    max_concurrent: dict[str, int] | None = None,
+    default_max_concurrent: int = 2,
+) -> SimulationResult:
+    """Replay tasks through a claim policy with a fixed worker pool.
+
+    Args:
+        tasks: Workload to replay (any order).
+        policy: Claim policy instance (reset before the run).
+        workers: Number of concurrent workers (Railway runs 3).
+        max_concurrent: Channel.max_concurrent per channel_id.
+        default_max_concurrent: Capacity for channels missing from max_concurrent.
+
+    Returns:
+        SimulationResult with claim order and per-channel wait samples.
+
+    Raises:
+        ValueError: If workers is less than 1.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    capacity = {t.channel_id: default_max_concurrent for t in tasks}
+    capacity.update(max_concurrent or {})
+    policy.reset(capacity)
+
+    sequence = itertools.count()  # heap tie-breaker (SimulatedTask is not orderable)
+    arrivals = [(t.arrival_seconds, t.task_id, next(sequence), t) for t in tasks]
+    heapq.heapify(arrivals)
+    queued: list[SimulatedTask] = []
+    running: list[tuple[float, str, int, SimulatedTask]] = []  # finish_time first
+    in_progress: Counter[str] = Counter()
+    result = SimulationResult(policy=policy.name)
+    now = 0.0
+
+    while arrivals or queued or running:
+        while arrivals and arrivals[0][0] <= now:
+            queued.append(heapq.heappop(arrivals)[3])
+
+        while len(running) < workers:
+            candidates = [t for t in queued if in_progress[t.channel_id] < capacity[t.channel_id]]
+            if not candidates:
+                break
+            task = policy.select(candidates, in_progress, now)
+            policy.on_claim(task, in_progress, now)
+            queued.remove(task)
+            in_progress[task.channel_id] += 1
+            result.claim_order.append(task.channel_id)
+            result.wait_seconds[task.channel_id].append(now - task.arrival_seconds)
+            finish = now + task.service_seconds
+            heapq.heappush(running, (finish, task.task_id, next(sequence), task))
+
+        upcoming = []
+        if running:
+            upcoming.append(running[0][0])
+        if arrivals:
+            upcoming.append(arrivals[0][0])
+        if not upcoming:
+            break  # Remaining queued tasks can never become eligible
+        now = max(now, min(upcoming))
+
+        while running and running[0][0] <= now:
+            _, _, _, done = heapq.heappop(running)
+            in_progress[done.channel_id] -= 1
+            result.makespan_seconds = now
+            origin = done.arrival_seconds if done.origin_seconds is None else done.origin_seconds
+            if done.follow_on is None:
+                result.turnaround_seconds[done.channel_id].append(now - origin)
+                continue
+            resumed = replace(
+                done.follow_on,
+                arrival_seconds=now + done.resume_delay_seconds,
+                origin_seconds=origin,
+            )
+            heapq.heappush(
+                arrivals, (resumed.arrival_seconds, resumed.task_id, next(sequence), resumed)
+            )
+
+    return result
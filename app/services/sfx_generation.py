@@ -39,6 +39,7 @@ Usage:
 import asyncio
 import re
 import subprocess
+import uuid
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
@@ -51,9 +52,17 @@ from tenacity import (
     wait_exponential,
 )
 
+from app.services.api_concurrency import api_slots
+from app.services.task_artifacts import (
+    ARTIFACT_SFX,
+    ArtifactIndex,
+    output_reusable,
+    record_output,
+)
 from app.utils.cli_wrapper import CLIScriptError, run_cli_script
 from app.utils.filesystem import get_sfx_dir
 from app.utils.logging import get_logger
+from app.utils.tracing import traced
 
 log = get_logger(__name__)
 
@@ -155,12 +164,21 @@ class SFXGenerationService:
     - CLI Script (Dumb): Calls ElevenLabs API, downloads WAV
     """
 
-    def __init__(self, channel_id: str, project_id: str) -> None:
+    def __init__(
+        self,
+        channel_id: str,
+        project_id: str,
+        artifacts: ArtifactIndex | None = None,
+        task_id: uuid.UUID | None = None,
+    ) -> None:
         """Initialize SFX generation service for specific project.
 
         Args:
             channel_id: Channel identifier for path isolation
             project_id: Project/task identifier (UUID from database)
+            artifacts: Optional artifact index for resume checks and recording
+                outputs (filesystem checks are used without one)
+            task_id: Task UUID recorded on API slot leases (attributes leaked leases)
 
         Raises:
             ValueError: If channel_id or project_id contain invalid characters
@@ -169,6 +187,8 @@ class SFXGenerationService:
         _validate_identifier(project_id, "project_id")
         self.channel_id = channel_id
         self.project_id = project_id
+        self.artifacts = artifacts
+        self.task_id = task_id
         self.log = get_logger(__name__)
 
     async def create_sfx_manifest(
@@ -334,15 +354,16 @@ class SFXGenerationService:
                 Re-raises on final retry exhaustion after 3 attempts
             """
             try:
-                await run_cli_script(
-                    "generate_sound_effects.py",
-                    [
-                        "--text", clip.sfx_description,
-                        "--output", str(clip.output_path),
-                        "--format", "mp3_44100_128",  # MP3 format for web playback
-                    ],
-                    timeout=60,  # 1 minute max per clip
-                )
+                async with api_slots.slot("elevenlabs", task_id=self.task_id):
+                    await run_cli_script(
+                        "generate_sound_effects.py",
+                        [
+                            "--text", clip.sfx_description,
+                            "--output", str(clip.output_path),
+                            "--format", "mp3_44100_128",  # MP3 format for web playback
+                        ],
+                        timeout=60,  # 1 minute max per clip
+                    )
             except CLIScriptError as e:
                 # Check if error is retriable
                 if not _is_retriable_error(e):
@@ -364,6 +385,7 @@ class SFXGenerationService:
                 )
                 raise  # Re-raise for tenacity to retry
 
+        @traced("clip.sfx", lambda clip: {"clip_number": clip.clip_number})
         async def generate_single_clip(clip: SFXClip) -> bool:
             """Generate a single SFX clip with concurrency control.
 
@@ -374,7 +396,13 @@ class SFXGenerationService:
 
             async with semaphore:
                 # Check if SFX exists (for resume functionality)
-                if resume and self.check_sfx_exists(clip.output_path):
+                if resume and await output_reusable(
+                    self.artifacts,
+                    clip.output_path,
+                    ARTIFACT_SFX,
+                    self.check_sfx_exists,
+                    clip.clip_number,
+                ):
                     skipped += 1
                     self.log.info(
                         "sfx_clip_skipped",
@@ -401,6 +429,7 @@ class SFXGenerationService:
                         raise ValueError(f"SFX file not created: {clip.output_path}")
 
                     # Validate audio duration (optional but recommended)
+                    duration: float | None = None
                     try:
                         duration = await self.validate_sfx_duration(clip.output_path)
                         self.log.info(
@@ -427,6 +456,10 @@ class SFXGenerationService:
                             error=str(e),
                         )
 
+                    await record_output(
+                        self.artifacts, clip.output_path, ARTIFACT_SFX, clip.clip_number, duration
+                    )
+
                     generated += 1
                     return True
 
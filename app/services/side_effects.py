@@ -0,0 +1,316 @@
+"""Background queue for post-step side effects.
+
+After a pipeline step finishes, some follow-up work does not feed the next
+step or a review gate: populating Notion SFX entries (and probing their
+durations) and rewriting video clips for streaming playback (MP4 faststart).
+Awaiting that work inline kept each step on the critical path for another
+18 ffprobe calls and 18 rate-limited Notion requests before the next step
+could start. Asset and narration population feed the ASSETS_READY and
+AUDIO_READY reviews, so the orchestrator waits for those side effects before
+entering the review gate instead of running them inside the step.
+
+Architecture Pattern:
+    - Submit: submit() schedules a side effect and returns immediately; the
+      caller's step completes without waiting for it
+    - Bounded: at most SIDE_EFFECT_CONCURRENCY side effects run at once per
+      worker; the rest wait for a free slot in submission order
+    - Tracked: each side effect records its state in the task's
+      step_completion_metadata under "side_effect:{name}"
+      ({"status": "pending" | "completed" | "failed", ...}), so a stalled or
+      failed side effect is visible without reading worker logs
+    - Isolated: a failing side effect is logged and recorded; it never fails
+      the pipeline step that submitted it
+    - Awaitable: wait() blocks on one submitted side effect (bounded) and
+      returns its recorded status, for review gates that read its output
+    - Drained: worker shutdown waits (bounded) for in-flight side effects
+
+Usage:
+    from app.services.side_effects import get_side_effect_queue
+
+    get_side_effect_queue().submit(
+        task_id, "sfx_notion_population", lambda: populate(...)
+    )
+    status = await get_side_effect_queue().wait(task_id, "asset_notion_population")
+
+References:
+    - app/services/task_metadata.py: set_step_metadata (single-key merge)
+    - app/services/pipeline_orchestrator.py: Notion population side effects
+    - app/workers/video_generation_worker.py: Faststart side effect
+"""
+
+import asyncio
+import functools
+import uuid
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime, timezone
+from typing import Any, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import Task
+from app.services.task_metadata import set_step_metadata
+from app.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Side effects running at once per worker
+SIDE_EFFECT_CONCURRENCY = 4
+
+# Concurrent ffprobe/ffmpeg subprocesses within one side effect
+PROBE_CONCURRENCY = 6
+
+# Maximum wait for in-flight side effects at worker shutdown (seconds)
+SIDE_EFFECT_DRAIN_TIMEOUT_SECONDS = 60.0
+
+# Maximum wait for a side effect a review gate reads (seconds)
+SIDE_EFFECT_WAIT_TIMEOUT_SECONDS = 300.0
+
+# step_completion_metadata key prefix (not a PipelineStep value, so step
+# resume ignores these keys)
+METADATA_KEY_PREFIX = "side_effect:"
+
+# Side effect statuses
+STATUS_PENDING = "pending"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+
+def side_effect_metadata_key(name: str) -> str:
+    """Return the step_completion_metadata key of a side effect."""
+    return f"{METADATA_KEY_PREFIX}{name}"
+
+
+async def map_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int = PROBE_CONCURRENCY,
+) -> list[R]:
+    """Apply an async function to every item with at most `limit` in flight.
+
+    Results keep the order of `items`. The first exception propagates after
+    all calls finished (asyncio.gather semantics); callers wanting per-item
+    fallbacks handle errors inside `func`.
+
+    Example:
+        >>> durations = await map_bounded(get_audio_duration, paths)
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*(_run(item) for item in items)))
+
+
+class SideEffectQueue:
+    """Worker-local queue of background side effects with bounded parallelism."""
+
+    def __init__(
+        self,
+        concurrency: int = SIDE_EFFECT_CONCURRENCY,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ):
+        """Initialize queue.
+
+        Args:
+            concurrency: Maximum side effects running at once.
+            session_factory: Session factory for status records. Defaults to
+                app.database.async_session_factory, resolved lazily.
+        """
+        self.concurrency = concurrency
+        self._session_factory = session_factory
+        self._semaphore: asyncio.Semaphore | None = None
+        # Strong references: the event loop only keeps weak ones
+        self._tasks: set[asyncio.Task[None]] = set()
+        # Latest submission per (task_id, name), for wait()
+        self._by_name: dict[tuple[str, str], asyncio.Task[None]] = {}
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession] | None:
+        """Session factory for status records (None → statuses are not recorded)."""
+        if self._session_factory is None:
+            from app.database import async_session_factory
+
+            return async_session_factory
+        return self._session_factory
+
+    @property
+    def pending(self) -> int:
+        """Number of side effects queued or running."""
+        return len(self._tasks)
+
+    def submit(
+        self,
+        task_id: uuid.UUID | str,
+        name: str,
+        run: Callable[[], Awaitable[dict[str, Any] | None]],
+    ) -> asyncio.Task[None]:
+        """Schedule a side effect without waiting for it.
+
+        Args:
+            task_id: Task the side effect belongs to.
+            name: Side effect name, unique per task (e.g.
+                "narration_notion_population"); a re-submitted name replaces
+                the recorded status.
+            run: Zero-argument coroutine function doing the work. Its result
+                (a JSON-serializable dict or None) is stored with the status.
+
+        Returns:
+            The scheduled asyncio task (already tracked by the queue).
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        task = asyncio.create_task(self._run(task_id, name, run, self._semaphore))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        key = (str(task_id), name)
+        self._by_name[key] = task
+        task.add_done_callback(functools.partial(self._forget, key))
+        log.info("side_effect_submitted", task_id=str(task_id), side_effect=name)
+        return task
+
+    def _forget(self, key: tuple[str, str], task: asyncio.Task[None]) -> None:
+        """Drop a finished side effect unless a re-submission replaced it."""
+        if self._by_name.get(key) is task:
+            del self._by_name[key]
+
+    async def wait(
+        self,
+        task_id: uuid.UUID | str,
+        name: str,
+        timeout: float | None = SIDE_EFFECT_WAIT_TIMEOUT_SECONDS,
+    ) -> dict[str, Any] | None:
+        """Wait for a submitted side effect and return its recorded status.
+
+        A side effect finished earlier (or submitted by a previous worker run)
+        is not waited for; its recorded status is returned as is.
+
+        Args:
+            task_id: Task the side effect belongs to.
+            name: Side effect name given to submit().
+            timeout: Maximum wait in seconds (None waits indefinitely).
+
+        Returns:
+            The "side_effect:{name}" status from step_completion_metadata
+            (status "pending" if the wait timed out), None if never recorded
+            or statuses are not recorded.
+        """
+        task = self._by_name.get((str(task_id), name))
+        if task is not None:
+            _, unfinished = await asyncio.wait({task}, timeout=timeout)
+            if unfinished:
+                log.warning("side_effect_wait_timed_out", task_id=str(task_id), side_effect=name)
+        return await self._status(task_id, name)
+
+    async def drain(self, timeout: float | None = SIDE_EFFECT_DRAIN_TIMEOUT_SECONDS) -> int:
+        """Wait for queued and running side effects.
+
+        Args:
+            timeout: Maximum wait in seconds (None waits indefinitely).
+
+        Returns:
+            Number of side effects still unfinished when the wait ended.
+        """
+        if not self._tasks:
+            return 0
+        _, unfinished = await asyncio.wait(set(self._tasks), timeout=timeout)
+        if unfinished:
+            log.warning("side_effects_unfinished", count=len(unfinished))
+        return len(unfinished)
+
+    async def _run(
+        self,
+        task_id: uuid.UUID | str,
+        name: str,
+        run: Callable[[], Awaitable[dict[str, Any] | None]],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        queued_at = datetime.now(timezone.utc).isoformat()
+        await self._record(task_id, name, {"status": STATUS_PENDING, "queued_at": queued_at})
+        async with semaphore:
+            started = asyncio.get_running_loop().time()
+            try:
+                result = await run()
+            except Exception as e:
+                log.error(
+                    "side_effect_failed",
+                    task_id=str(task_id),
+                    side_effect=name,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    exc_info=True,
+                )
+                status: dict[str, Any] = {"status": STATUS_FAILED, "error": str(e)}
+            else:
+                status = {"status": STATUS_COMPLETED}
+                if result:
+                    status["result"] = result
+            duration = asyncio.get_running_loop().time() - started
+
+        status.update(
+            queued_at=queued_at,
+            finished_at=datetime.now(timezone.utc).isoformat(),
+            duration_seconds=round(duration, 3),
+        )
+        await self._record(task_id, name, status)
+        log.info(
+            "side_effect_finished",
+            task_id=str(task_id),
+            side_effect=name,
+            status=status["status"],
+            duration_seconds=status["duration_seconds"],
+        )
+
+    async def _status(self, task_id: uuid.UUID | str, name: str) -> dict[str, Any] | None:
+        """Read a side effect status (best effort, None if not recorded)."""
+        factory = self.session_factory
+        if factory is None:
+            return None
+        task_uuid = task_id if isinstance(task_id, uuid.UUID) else uuid.UUID(task_id)
+        try:
+            async with factory() as db:
+                metadata = await db.scalar(
+                    select(Task.step_completion_metadata).where(Task.id == task_uuid)
+                )
+        except Exception as e:
+            log.warning(
+                "side_effect_status_read_failed",
+                task_id=str(task_id),
+                side_effect=name,
+                error=str(e),
+            )
+            return None
+        return (metadata or {}).get(side_effect_metadata_key(name))
+
+    async def _record(self, task_id: uuid.UUID | str, name: str, status: dict[str, Any]) -> None:
+        """Store a side effect status (best effort, short transaction)."""
+        factory = self.session_factory
+        if factory is None:
+            return
+        try:
+            async with factory() as db, db.begin():
+                await set_step_metadata(db, task_id, side_effect_metadata_key(name), status)
+        except Exception as e:
+            log.warning(
+                "side_effect_status_record_failed",
+                task_id=str(task_id),
+                side_effect=name,
+                status=status["status"],
+                error=str(e),
+            )
+
+
+_queue: SideEffectQueue | None = None
+
+
+def get_side_effect_queue() -> SideEffectQueue:
+    """Return the worker's side effect queue (created on first use)."""
+    global _queue
+    if _queue is None:
+        _queue = SideEffectQueue()
+    return _queue
@@ -10,7 +10,9 @@ Storage Strategies (FR12):
 R2 Credentials:
     When storage_strategy is "r2", the service retrieves and decrypts the
     R2 credentials (account_id, access_key_id, secret_access_key, bucket_name)
-    from the database.
+    from the database. Decrypted credentials are cached per process for a
+    short TTL (app.services.credential_cache); channel config syncs
+    invalidate them.
 
 Usage:
     from app.services.storage_strategy_service import StorageStrategyService
@@ -22,7 +24,8 @@ Usage:
         # Use r2_config.bucket_name, r2_config.access_key_id, etc.
 """
 
-from dataclasses import dataclass
+import json
+from dataclasses import asdict, dataclass
 
 import structlog
 from sqlalchemy import select
@@ -30,10 +33,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions import ConfigurationError
 from app.models import Channel
+from app.services.credential_cache import credential_cache
 from app.utils.encryption import DecryptionError, get_encryption_service
 
 log = structlog.get_logger(__name__)
 
+# credential_cache type of a channel's decrypted R2 credentials
+R2_CACHE_KEY = "r2_config"
+
 
 @dataclass
 class R2Credentials:
@@ -143,6 +150,9 @@ class StorageStrategyService:
         Returns:
             R2Credentials dataclass with decrypted credentials.
 
+        Only complete, valid configurations are cached; errors are re-checked
+        against the database on every call.
+
         Raises:
             ConfigurationError: If channel not found, storage_strategy is not "r2",
                 or R2 credentials are missing or incomplete.
@@ -152,6 +162,10 @@ class StorageStrategyService:
             >>> r2_config = await service.get_r2_config("poke1", db)
             >>> print(r2_config.bucket_name)
         """
+        hit, cached = credential_cache.get(channel_id, R2_CACHE_KEY)
+        if hit and cached is not None:
+            return R2Credentials(**json.loads(cached))
+
         channel = await self._get_channel(channel_id, db)
 
         if channel is None:
@@ -230,9 +244,11 @@ class StorageStrategyService:
             has_credentials=True,
         )
 
-        return R2Credentials(
+        credentials = R2Credentials(
             account_id=account_id,
             access_key_id=access_key_id,
             secret_access_key=secret_access_key,
             bucket_name=channel.r2_bucket_name,
         )
+        credential_cache.put(channel_id, R2_CACHE_KEY, json.dumps(asdict(credentials)))
+        return credentials
@@ -0,0 +1,383 @@
+"""Index of generated output files (task_artifacts table).
+
+Resume support used to stat every output on the workspace volume before
+each step (check_video_exists with its 1MB minimum, check_audio_exists,
+check_sfx_exists, ...), assembly re-probed every narration clip with
+ffprobe, and Notion population re-walked the audio directories. None of
+that could tell a complete file from a truncated one. Services now record
+each output's size, SHA-256, duration and state when they produce it, and
+readers load the whole index with one query.
+
+Architecture Pattern:
+    - Services take an optional ArtifactIndex; without one (direct use,
+      tests) they keep their filesystem checks
+    - Write path: record_output() hashes the new file in a thread and keeps
+      the row pending in memory; the orchestrator saves pending rows after
+      each step (also when the step fails, so finished clips survive)
+    - Read path: per kind, an index that had rows at load time is
+      authoritative - resume checks never touch the filesystem
+    - Legacy tasks (outputs written before the table existed) fall back to
+      the filesystem check once per kind and index what it finds
+    - Paths are stored relative to the project directory so retention
+      keep-lists (app/services/workspace_retention.py) prune matching rows
+
+References:
+    - app/models.py: TaskArtifact
+    - app/services/pipeline_orchestrator.py: Index load and save per step
+    - app/services/video_assembly.py: Manifest built from the index
+"""
+
+import asyncio
+import hashlib
+import uuid
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import delete, not_, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import TaskArtifact
+from app.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+# Artifact kinds
+ARTIFACT_ASSET = "asset"
+ARTIFACT_COMPOSITE = "composite"
+ARTIFACT_VIDEO = "video"
+ARTIFACT_NARRATION = "narration"
+ARTIFACT_SFX = "sfx"
+ARTIFACT_FINAL_VIDEO = "final_video"
+
+# Artifact states
+ARTIFACT_STATE_READY = "ready"
+ARTIFACT_STATE_INVALID = "invalid"  # Below the kind's minimum size (truncated write)
+
+# Smallest plausible file per kind (10-second H.264 clips are well above 1MB)
+MIN_ARTIFACT_BYTES: dict[str, int] = {
+    ARTIFACT_VIDEO: 1_000_000,
+    ARTIFACT_FINAL_VIDEO: 1_000_000,
+}
+DEFAULT_MIN_ARTIFACT_BYTES = 1
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ArtifactInfo:
+    """One indexed output file.
+
+    Attributes:
+        path: Path relative to the project directory (POSIX separators).
+        kind: Artifact kind (ARTIFACT_VIDEO, ARTIFACT_NARRATION, ...).
+        clip_number: Clip number (1-18) for per-clip outputs.
+        size_bytes: File size when recorded.
+        sha256: Hex SHA-256 of the contents.
+        duration_seconds: Media duration when known.
+        state: ARTIFACT_STATE_READY or ARTIFACT_STATE_INVALID.
+    """
+
+    path: str
+    kind: str
+    clip_number: int | None
+    size_bytes: int
+    sha256: str
+    duration_seconds: float | None
+    state: str
+
+    @property
+    def ready(self) -> bool:
+        """True if the file can be reused."""
+        return self.state == ARTIFACT_STATE_READY
+
+
+def hash_file(path: Path) -> tuple[int, str]:
+    """Return (size, hex SHA-256) of a file (blocking; run in a thread)."""
+    digest = hashlib.sha256()
+    size = 0
+    with path.open("rb") as f:
+        while chunk := f.read(HASH_CHUNK_BYTES):
+            digest.update(chunk)
+            size += len(chunk)
+    return size, digest.hexdigest()
+
+
+def describe_artifact(
+    project_dir: Path,
+    path: Path,
+    kind: str,
+    clip_number: int | None = None,
+    duration_seconds: float | None = None,
+) -> ArtifactInfo:
+    """Hash and size-check one output file (blocking; run in a thread).
+
+    Args:
+        project_dir: Project directory the path is relative to.
+        path: Output file.
+        kind: Artifact kind.
+        clip_number: Clip number for per-clip outputs.
+        duration_seconds: Media duration, if the producer measured it.
+
+    Returns:
+        ArtifactInfo for the file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is outside project_dir.
+    """
+    size, sha256 = hash_file(path)
+    min_bytes = MIN_ARTIFACT_BYTES.get(kind, DEFAULT_MIN_ARTIFACT_BYTES)
+    return ArtifactInfo(
+        path=path.relative_to(project_dir).as_posix(),
+        kind=kind,
+        clip_number=clip_number,
+        size_bytes=size,
+        sha256=sha256,
+        duration_seconds=duration_seconds,
+        state=ARTIFACT_STATE_READY if size >= min_bytes else ARTIFACT_STATE_INVALID,
+    )
+
+
+class ArtifactIndex:
+    """A task's indexed outputs, loaded once per pipeline run.
+
+    Attributes:
+        project_dir: Project directory artifact paths are relative to.
+    """
+
+    def __init__(self, project_dir: Path, artifacts: Iterable[ArtifactInfo] = ()) -> None:
+        self.project_dir = project_dir
+        self._artifacts = {artifact.path: artifact for artifact in artifacts}
+        self._indexed_kinds = frozenset(artifact.kind for artifact in self._artifacts.values())
+        self._pending: dict[str, ArtifactInfo] = {}
+
+    def _relative(self, path: Path) -> str:
+        return path.relative_to(self.project_dir).as_posix()
+
+    def is_authoritative(self, kind: str) -> bool:
+        """True if the index had rows of this kind when it was loaded."""
+        return kind in self._indexed_kinds
+
+    def get(self, path: Path) -> ArtifactInfo | None:
+        """Return the indexed artifact for an absolute path."""
+        return self._artifacts.get(self._relative(path))
+
+    def is_ready(self, path: Path) -> bool:
+        """True if the path is indexed and ready (no filesystem access)."""
+        artifact = self.get(path)
+        return artifact is not None and artifact.ready
+
+    def clips(self, kind: str) -> dict[int, ArtifactInfo]:
+        """Return ready per-clip artifacts of a kind, keyed by clip number.
+
+        If a clip has several files of the kind (e.g. legacy sfx_01.wav and
+        sfx_01.mp3), the first by path wins.
+        """
+        clips: dict[int, ArtifactInfo] = {}
+        for path in sorted(self._artifacts):
+            artifact = self._artifacts[path]
+            if artifact.kind == kind and artifact.ready and artifact.clip_number is not None:
+                clips.setdefault(artifact.clip_number, artifact)
+        return dict(sorted(clips.items()))
+
+    def absolute(self, artifact: ArtifactInfo) -> Path:
+        """Return the absolute path of an artifact."""
+        return self.project_dir / artifact.path
+
+    async def record(
+        self,
+        path: Path,
+        kind: str,
+        clip_number: int | None = None,
+        duration_seconds: float | None = None,
+    ) -> ArtifactInfo:
+        """Index a produced file (hashed in a thread; saved with the step).
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        artifact = await asyncio.to_thread(
+            describe_artifact, self.project_dir, path, kind, clip_number, duration_seconds
+        )
+        self._artifacts[artifact.path] = artifact
+        self._pending[artifact.path] = artifact
+        if not artifact.ready:
+            log.warning(
+                "artifact_invalid",
+                path=artifact.path,
+                kind=kind,
+                size_bytes=artifact.size_bytes,
+            )
+        return artifact
+
+    async def reusable(
+        self,
+        path: Path,
+        kind: str,
+        exists: Callable[[Path], bool],
+        clip_number: int | None = None,
+    ) -> bool:
+        """Resume check: can an existing output be skipped?
+
+        Args:
+            path: Output path.
+            kind: Artifact kind.
+            exists: The service's filesystem check (legacy fallback).
+            clip_number: Clip number for per-clip outputs.
+
+        Returns:
+            True if the output is indexed and ready; for kinds not indexed
+            yet, True if the filesystem check passes (the file is indexed).
+        """
+        if self.is_authoritative(kind):
+            return self.is_ready(path)
+        if not exists(path):
+            return False
+        return (await self.record(path, kind, clip_number)).ready
+
+    def take_pending(self) -> list[ArtifactInfo]:
+        """Return and clear artifacts recorded since the last save."""
+        pending = list(self._pending.values())
+        self._pending.clear()
+        return pending
+
+
+async def output_reusable(
+    index: ArtifactIndex | None,
+    path: Path,
+    kind: str,
+    exists: Callable[[Path], bool],
+    clip_number: int | None = None,
+) -> bool:
+    """Resume check for services (filesystem check when there is no index)."""
+    if index is None:
+        return exists(path)
+    return await index.reusable(path, kind, exists, clip_number)
+
+
+async def record_output(
+    index: ArtifactIndex | None,
+    path: Path,
+    kind: str,
+    clip_number: int | None = None,
+    duration_seconds: float | None = None,
+) -> None:
+    """Index a produced file for services (no-op when there is no index)."""
+    if index is not None:
+        await index.record(path, kind, clip_number, duration_seconds)
+
+
+def _task_uuid(task_id: uuid.UUID | str) -> uuid.UUID:
+    return task_id if isinstance(task_id, uuid.UUID) else uuid.UUID(str(task_id))
+
+
+async def load_artifact_index(
+    db: AsyncSession, task_id: uuid.UUID | str, project_dir: Path
+) -> ArtifactIndex:
+    """Load a task's artifacts with one query.
+
+    Args:
+        db: Database session.
+        task_id: Task UUID.
+        project_dir: The task's project directory.
+
+    Returns:
+        ArtifactIndex for the task.
+    """
+    rows = await db.scalars(
+        select(TaskArtifact).where(TaskArtifact.task_id == _task_uuid(task_id))
+    )
+    return ArtifactIndex(
+        project_dir,
+        (
+            ArtifactInfo(
+                path=row.path,
+                kind=row.kind,
+                clip_number=row.clip_number,
+                size_bytes=row.size_bytes,
+                sha256=row.sha256,
+                duration_seconds=row.duration_seconds,
+                state=row.state,
+            )
+            for row in rows
+        ),
+    )
+
+
+async def save_artifacts(
+    db: AsyncSession, task_id: uuid.UUID | str, artifacts: Iterable[ArtifactInfo]
+) -> int:
+    """Upsert artifacts (one statement).
+
+    Args:
+        db: Database session (caller commits).
+        task_id: Task UUID.
+        artifacts: Artifacts to save.
+
+    Returns:
+        Number of artifacts saved.
+    """
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "task_id": _task_uuid(task_id),
+            "path": artifact.path,
+            "kind": artifact.kind,
+            "clip_number": artifact.clip_number,
+            "size_bytes": artifact.size_bytes,
+            "sha256": artifact.sha256,
+            "duration_seconds": artifact.duration_seconds,
+            "state": artifact.state,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for artifact in artifacts
+    ]
+    if not rows:
+        return 0
+
+    dialect = db.get_bind().dialect.name
+    dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = dialect_insert(TaskArtifact).values(rows)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["task_id", "path"],
+            set_={
+                column: stmt.excluded[column]
+                for column in (
+                    "kind",
+                    "clip_number",
+                    "size_bytes",
+                    "sha256",
+                    "duration_seconds",
+                    "state",
+                    "updated_at",
+                )
+            },
+        )
+    )
+    return len(rows)
+
+
+async def prune_artifacts(
+    db: AsyncSession, task_id: uuid.UUID | str, keep: Iterable[str]
+) -> None:
+    """Delete rows for files a retention policy removed.
+
+    Args:
+        db: Database session (caller commits).
+        task_id: Task UUID.
+        keep: Kept paths relative to the project dir (files or directories);
+            empty deletes every row of the task.
+    """
+    kept = [
+        or_(TaskArtifact.path == path, TaskArtifact.path.startswith(f"{path}/", autoescape=True))
+        for path in keep
+    ]
+    stmt = delete(TaskArtifact).where(TaskArtifact.task_id == _task_uuid(task_id))
+    if kept:
+        stmt = stmt.where(not_(or_(*kept)))
+    await db.execute(stmt)
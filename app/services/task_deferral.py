@@ -0,0 +1,171 @@
+"""Deferred execution for queued tasks (not-before timestamps).
+
+A task that cannot run yet - quota exhausted, transient API failure - used to
+be returned to the queue immediately, so workers re-claimed it in a hot loop.
+Instead, tasks now carry tasks.not_before: the claim queries skip them until
+that time, and idle workers sleep until the earliest deferred task becomes
+eligible.
+
+Architecture Pattern:
+    - Quota waits: not_before = quota reset time (api_quota_state)
+    - Transient failures: not_before = now + exponential backoff with jitter
+      (60s, 120s, 240s ... capped at 1h), up to MAX_TRANSIENT_RETRIES
+    - Busy API slots: not_before = now + API_SLOT_RETRY_SECONDS with jitter
+      (slots are held per request, so one frees up within seconds)
+    - Idle workers: sleep until MIN(not_before) of deferred queued tasks,
+      capped by an idle poll interval so newly queued work is still noticed
+    - ix_tasks_queued_not_before serves both the claim filter and the
+      MIN(not_before) lookup
+
+References:
+    - app/queue.py: fair_share_claim_statement not_before filter
+    - app/services/pipeline_orchestrator.py: classify_error (transient vs permanent)
+    - app/workers/pipeline_worker.py: Idle sleep in worker_loop
+"""
+
+import random
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Task, TaskStatus
+from app.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+# Exponential backoff for transient failures
+RETRY_BACKOFF_BASE_SECONDS = 60
+RETRY_BACKOFF_MAX_SECONDS = 3600
+RETRY_BACKOFF_JITTER = 0.2  # ±20% to spread retries of tasks that failed together
+MAX_TRANSIENT_RETRIES = 5
+
+# Short wait before retrying a task whose API had no free concurrency slot
+API_SLOT_RETRY_SECONDS = 15
+
+# Idle worker poll interval bounds (seconds). The cap bounds how long a newly
+# queued task can wait for an idle worker (previously a fixed 5s poll).
+IDLE_POLL_MIN_SECONDS = 5
+IDLE_POLL_MAX_SECONDS = 10
+
+
+def retry_backoff_seconds(
+    attempt: int,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """Compute the backoff delay before retry number `attempt` (0-based).
+
+    Args:
+        attempt: Number of transient retries already scheduled.
+        rng: Random source in [0, 1) for jitter (injectable for tests).
+
+    Returns:
+        Delay in seconds: base * 2^attempt, capped, with ±20% jitter.
+
+    Example:
+        >>> retry_backoff_seconds(0)  # ~60s
+        >>> retry_backoff_seconds(3)  # ~480s
+    """
+    delay = float(min(RETRY_BACKOFF_BASE_SECONDS * 2 ** max(attempt, 0), RETRY_BACKOFF_MAX_SECONDS))
+    return delay * (1 + RETRY_BACKOFF_JITTER * (2 * rng() - 1))
+
+
+def defer_task(task: Task, not_before: datetime, reason: str) -> None:
+    """Defer a queued task until not_before.
+
+    Args:
+        task: Task in the caller's session (caller commits).
+        not_before: Earliest time the claim query may return the task.
+        reason: Short reason for logs ("gemini_quota", "transient_api_error", ...).
+    """
+    task.not_before = not_before
+    log.info(
+        "task_deferred",
+        task_id=str(task.id),
+        reason=reason,
+        not_before=not_before.isoformat(),
+    )
+
+
+async def next_eligible_at(db: AsyncSession) -> datetime | None:
+    """Return when the earliest deferred queued task becomes claimable.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        Earliest future not_before among queued tasks, or None if no queued
+        task is deferred.
+    """
+    earliest = await db.scalar(
+        select(func.min(Task.not_before)).where(
+            Task.status == TaskStatus.QUEUED,
+            Task.not_before > datetime.now(timezone.utc),
+        )
+    )
+    if earliest is not None and earliest.tzinfo is None:
+        earliest = earliest.replace(tzinfo=timezone.utc)  # SQLite drops tzinfo
+    return earliest
+
+
+def idle_sleep_seconds(
+    next_eligible: datetime | None,
+    idle_polls: int,
+    now: datetime | None = None,
+) -> float:
+    """Compute how long an idle worker should sleep before claiming again.
+
+    The poll interval doubles with each consecutive empty claim (5s → 10s) so
+    an idle cluster stops hammering the database; a deferred task becoming
+    eligible sooner wakes the worker exactly on time.
+
+    Args:
+        next_eligible: Result of next_eligible_at().
+        idle_polls: Consecutive empty claims so far.
+        now: Reference time (default: current time).
+
+    Returns:
+        Sleep duration in seconds.
+    """
+    poll = min(IDLE_POLL_MIN_SECONDS * 2 ** max(idle_polls, 0), IDLE_POLL_MAX_SECONDS)
+    if next_eligible is None:
+        return float(poll)
+    until_eligible = (next_eligible - (now or datetime.now(timezone.utc))).total_seconds()
+    return max(0.0, min(float(poll), until_eligible))
+
+
+def transient_retry_at(
+    attempt: int,
+    now: datetime | None = None,
+) -> datetime | None:
+    """Return not_before for the next transient retry, or None if exhausted.
+
+    Args:
+        attempt: Transient retries already scheduled (Task.retry_count).
+        now: Reference time (default: current time).
+
+    Returns:
+        Retry time, or None once MAX_TRANSIENT_RETRIES is reached.
+    """
+    if attempt >= MAX_TRANSIENT_RETRIES:
+        return None
+    return (now or datetime.now(timezone.utc)) + timedelta(seconds=retry_backoff_seconds(attempt))
+
+
+def api_slot_retry_at(
+    now: datetime | None = None,
+    rng: Callable[[], float] = random.random,
+) -> datetime:
+    """Return not_before for a task released because its API had no free slot.
+
+    Args:
+        now: Reference time (default: current time).
+        rng: Random source in [0, 1) for jitter (injectable for tests).
+
+    Returns:
+        now + API_SLOT_RETRY_SECONDS with ±20% jitter, so tasks released
+        together don't contend for the next free slot at the same moment.
+    """
+    delay = API_SLOT_RETRY_SECONDS * (1 + RETRY_BACKOFF_JITTER * (2 * rng() - 1))
+    return (now or datetime.now(timezone.utc)) + timedelta(seconds=delay)
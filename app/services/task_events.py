@@ -0,0 +1,186 @@
+"""Append-only task event log (task_events table).
+
+Status updates used to append to Task.error_log by loading the whole TEXT
+value, concatenating and writing it back - the hot tasks row grew without
+bound and every status change rewrote it. Events are now small inserts into
+task_events; the error log is aggregated on demand and status history is an
+index range scan.
+
+Architecture Pattern:
+    - Write path: record_task_event() adds a row to the caller's session
+      (same short transaction as the status update, no extra round trip);
+      record_task_events() bulk-inserts many rows with one executemany
+    - Read path: get_error_log() merges legacy tasks.error_log text with
+      error/rejection events in the historical "[ts] status: message" format;
+      task_response() serializes a task with that merged log
+    - Dashboards: get_status_history() / recent_errors() use
+      ix_task_events_task_id_ts and ix_task_events_kind_ts
+
+References:
+    - app/models.py: TaskEvent
+    - app/services/pipeline_orchestrator.py: update_task_status
+    - app/workers/pipeline_worker.py: process_pipeline_task
+"""
+
+import uuid
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Task, TaskEvent, TaskStatus
+from app.schemas.task import TaskResponse
+
+# Event kinds
+EVENT_STATUS_CHANGE = "status_change"
+EVENT_ERROR = "error"
+EVENT_REJECTION = "rejection"
+
+# Kinds that make up the aggregated error log
+ERROR_EVENT_KINDS = (EVENT_ERROR, EVENT_REJECTION)
+
+
+def task_event_row(
+    task_id: uuid.UUID,
+    kind: str,
+    status: TaskStatus | None = None,
+    ts: datetime | None = None,
+    **payload: Any,
+) -> dict[str, Any]:
+    """Build a task_events row for record_task_events().
+
+    Args:
+        task_id: Task UUID.
+        kind: Event kind (EVENT_STATUS_CHANGE, EVENT_ERROR, EVENT_REJECTION).
+        status: Task status the event refers to.
+        ts: Event time (default: now).
+        **payload: Event details stored as JSON (None values are dropped).
+
+    Returns:
+        Column values for one event.
+    """
+    return {
+        "id": uuid.uuid4(),
+        "task_id": task_id,
+        "ts": ts or datetime.now(timezone.utc),
+        "kind": kind,
+        "status": status.value if status else None,
+        "payload": {key: value for key, value in payload.items() if value is not None},
+    }
+
+
+def record_task_event(
+    db: AsyncSession,
+    task_id: uuid.UUID,
+    kind: str,
+    status: TaskStatus | None = None,
+    **payload: Any,
+) -> TaskEvent:
+    """Add one event to the caller's session (flushed with its transaction).
+
+    Args:
+        db: Database session (caller commits).
+        task_id: Task UUID.
+        kind: Event kind.
+        status: Task status the event refers to.
+        **payload: Event details, e.g. message="Gemini API timeout".
+
+    Returns:
+        The pending TaskEvent.
+
+    Example:
+        >>> record_task_event(db, task.id, EVENT_ERROR, TaskStatus.ASSET_ERROR,
+        ...                   message="Gemini API timeout")
+    """
+    event = TaskEvent(**task_event_row(task_id, kind, status, **payload))
+    db.add(event)
+    return event
+
+
+async def record_task_events(db: AsyncSession, rows: Iterable[dict[str, Any]]) -> int:
+    """Bulk-insert events built with task_event_row() (one executemany).
+
+    Args:
+        db: Database session (caller commits).
+        rows: Event rows.
+
+    Returns:
+        Number of events inserted.
+    """
+    rows = list(rows)
+    if rows:
+        await db.execute(insert(TaskEvent), rows)
+    return len(rows)
+
+
+def format_event(event: TaskEvent) -> str:
+    """Format an event as an error log line ("[ts] status: message")."""
+    ts = event.ts if event.ts.tzinfo else event.ts.replace(tzinfo=timezone.utc)
+    label = event.status or event.kind
+    return f"[{ts.isoformat()}] {label}: {event.payload.get('message', '')}"
+
+
+async def get_error_log(db: AsyncSession, task_id: uuid.UUID) -> str | None:
+    """Aggregate a task's error log on demand.
+
+    Legacy tasks.error_log text (written before task_events existed, and by
+    rare manual writers) comes first, followed by error and rejection events
+    in time order.
+
+    Args:
+        db: Database session.
+        task_id: Task UUID.
+
+    Returns:
+        Newline-separated log, or None if the task has no errors.
+    """
+    legacy = await db.scalar(select(Task.error_log).where(Task.id == task_id))
+    events = await db.scalars(
+        select(TaskEvent)
+        .where(TaskEvent.task_id == task_id, TaskEvent.kind.in_(ERROR_EVENT_KINDS))
+        .order_by(TaskEvent.ts)
+    )
+    lines = [legacy.strip()] if legacy and legacy.strip() else []
+    lines.extend(format_event(event) for event in events)
+    return "\n".join(lines) or None
+
+
+async def task_response(db: AsyncSession, task: Task) -> TaskResponse:
+    """Serialize a task for the API with its aggregated error log.
+
+    TaskResponse.model_validate(task) alone would only expose the legacy
+    tasks.error_log column, which no longer receives new errors.
+
+    Args:
+        db: Database session.
+        task: Task to serialize.
+
+    Returns:
+        TaskResponse whose error_log comes from get_error_log().
+    """
+    response = TaskResponse.model_validate(task)
+    response.error_log = await get_error_log(db, task.id)
+    return response
+
+
+async def get_status_history(db: AsyncSession, task_id: uuid.UUID) -> list[TaskEvent]:
+    """Return a task's status changes (including error statuses) in time order."""
+    events = await db.scalars(
+        select(TaskEvent)
+        .where(TaskEvent.task_id == task_id, TaskEvent.status.is_not(None))
+        .order_by(TaskEvent.ts)
+    )
+    return list(events)
+
+
+async def recent_errors(db: AsyncSession, since: datetime, limit: int = 100) -> list[TaskEvent]:
+    """Return error events across all tasks since a time (newest first)."""
+    events = await db.scalars(
+        select(TaskEvent)
+        .where(TaskEvent.kind == EVENT_ERROR, TaskEvent.ts >= since)
+        .order_by(TaskEvent.ts.desc())
+        .limit(limit)
+    )
+    return list(events)
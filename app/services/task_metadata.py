@@ -0,0 +1,197 @@
+"""Atomic step metadata updates and per-clip progress.
+
+Task.step_completion_metadata used to be updated by loading the Task,
+mutating the dict in Python and relying on ORM change detection. The column
+is plain JSON (not mutation-tracked), so in-place changes to an existing
+dict were silently dropped, and every write sent the whole document back.
+
+Architecture Pattern:
+    - Step metadata: one UPDATE per write that merges a single top-level key
+      server-side (PostgreSQL jsonb `||`, SQLite json_set) - the row is never
+      loaded, concurrent writers of different keys cannot overwrite each other
+    - Per-clip records (clips a reviewer rejected) live in task_clip_progress,
+      so partial regeneration checks are primary-key range scans
+    - Writes join the caller's transaction; callers commit
+
+References:
+    - app/models.py: Task.step_completion_metadata, TaskClipProgress
+    - app/services/pipeline_orchestrator.py: save_step_completion
+    - app/services/review_service.py, app/services/webhook_handler.py: Rejections
+"""
+
+import json
+import uuid
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import cast, delete, func, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models import Task, TaskClipProgress
+
+# Steps with per-clip outputs (PipelineStep values)
+VIDEO_STEP = "video_generation"
+NARRATION_STEP = "narration_generation"
+SFX_STEP = "sfx_generation"
+
+# Clip statuses
+CLIP_STATUS_FAILED = "failed"  # Rejected in review, must be regenerated
+
+
+def _task_uuid(task_id: uuid.UUID | str) -> uuid.UUID:
+    return task_id if isinstance(task_id, uuid.UUID) else uuid.UUID(str(task_id))
+
+
+def _dialect(db: AsyncSession) -> str:
+    return db.get_bind().dialect.name
+
+
+def _json_key_path(key: str) -> str:
+    return f'$."{key}"'
+
+
+def _merge_key(dialect: str, key: str, value: Any) -> ColumnElement[Any]:
+    """SQL expression: step_completion_metadata with `key` set to `value`."""
+    column = Task.__table__.c.step_completion_metadata
+    if dialect == "postgresql":
+        current = func.coalesce(cast(column, JSONB), literal({}, JSONB))
+        return current.op("||")(literal({key: value}, JSONB))
+    return func.json_set(
+        func.coalesce(column, "{}"), _json_key_path(key), func.json(json.dumps(value))
+    )
+
+
+def _remove_key(dialect: str, key: str) -> ColumnElement[Any]:
+    """SQL expression: step_completion_metadata without `key`."""
+    column = Task.__table__.c.step_completion_metadata
+    if dialect == "postgresql":
+        return cast(column, JSONB).op("-")(key)
+    return func.json_remove(column, _json_key_path(key))
+
+
+def step_metadata_merge(db: AsyncSession, key: str, value: Any) -> ColumnElement[Any]:
+    """Return the SQL value that sets one step_completion_metadata key.
+
+    For UPDATEs that change other columns in the same statement (see
+    app/services/task_state.py).
+    """
+    return _merge_key(_dialect(db), key, value)
+
+
+async def set_step_metadata(
+    db: AsyncSession,
+    task_id: uuid.UUID | str,
+    key: str,
+    value: Any,
+    **columns: Any,
+) -> None:
+    """Set one top-level step_completion_metadata key without loading the task.
+
+    Args:
+        db: Database session (caller commits).
+        task_id: Task UUID.
+        key: Top-level key (usually a PipelineStep value).
+        value: JSON-serializable value.
+        **columns: Other Task columns to set in the same UPDATE.
+
+    Example:
+        >>> await set_step_metadata(db, task_id, "video_generation",
+        ...                         {"completed": True}, retry_count=0)
+    """
+    await db.execute(
+        update(Task)
+        .where(Task.id == _task_uuid(task_id))
+        .values(step_completion_metadata=step_metadata_merge(db, key, value), **columns)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def remove_step_metadata(db: AsyncSession, task_id: uuid.UUID | str, key: str) -> None:
+    """Remove one top-level step_completion_metadata key without loading the task."""
+    await db.execute(
+        update(Task)
+        .where(Task.id == _task_uuid(task_id), Task.step_completion_metadata.is_not(None))
+        .values(step_completion_metadata=_remove_key(_dialect(db), key))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def set_clip_status(
+    db: AsyncSession,
+    task_id: uuid.UUID | str,
+    steps: str | Iterable[str],
+    clip_numbers: Iterable[int],
+    status: str,
+) -> None:
+    """Upsert the status of clips for one or more steps (one statement).
+
+    Args:
+        db: Database session (caller commits).
+        task_id: Task UUID.
+        steps: Step value(s) the clips belong to.
+        clip_numbers: Clip numbers (1-18).
+        status: New clip status (e.g. CLIP_STATUS_FAILED).
+    """
+    steps = [steps] if isinstance(steps, str) else list(steps)
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "task_id": _task_uuid(task_id),
+            "step": step,
+            "clip_number": clip_number,
+            "status": status,
+            "updated_at": now,
+        }
+        for step in steps
+        for clip_number in sorted(set(clip_numbers))
+    ]
+    if not rows:
+        return
+
+    dialect_insert = postgresql.insert if _dialect(db) == "postgresql" else sqlite.insert
+    stmt = dialect_insert(TaskClipProgress).values(rows)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["task_id", "step", "clip_number"],
+            set_={"status": stmt.excluded.status, "updated_at": stmt.excluded.updated_at},
+        )
+    )
+
+
+async def get_clips(
+    db: AsyncSession,
+    task_id: uuid.UUID | str,
+    step: str,
+    status: str = CLIP_STATUS_FAILED,
+) -> list[int]:
+    """Return clip numbers of a step with the given status (ascending)."""
+    clips = await db.scalars(
+        select(TaskClipProgress.clip_number)
+        .where(
+            TaskClipProgress.task_id == _task_uuid(task_id),
+            TaskClipProgress.step == step,
+            TaskClipProgress.status == status,
+        )
+        .order_by(TaskClipProgress.clip_number)
+    )
+    return list(clips)
+
+
+async def clear_clips(
+    db: AsyncSession,
+    task_id: uuid.UUID | str,
+    step: str,
+    status: str | None = CLIP_STATUS_FAILED,
+) -> None:
+    """Delete a step's clip records (only those with `status`, if given)."""
+    stmt = delete(TaskClipProgress).where(
+        TaskClipProgress.task_id == _task_uuid(task_id),
+        TaskClipProgress.step == step,
+    )
+    if status is not None:
+        stmt = stmt.where(TaskClipProgress.status == status)
+    await db.execute(stmt)
@@ -5,6 +5,7 @@ This module provides task queue management functionality:
 - Application-level idempotency checks
 - Task status queries for workers
 - PgQueuer integration (Story 2.6)
+- Dashboard list views (column-projected, keyset-paginated)
 
 Architecture:
 - Duplicate detection uses notion_page_id unique constraint
@@ -12,16 +13,24 @@ Architecture:
 - Supports re-queueing of completed/failed tasks
 - Short transaction pattern (no API calls during transactions)
 - PgQueuer for PostgreSQL-native task queue with FOR UPDATE SKIP LOCKED
+- list_tasks() selects only TASK_LIST_COLUMNS into TaskSummary rows;
+  dashboard queries that return Task entities defer TASK_HEAVY_COLUMNS
+  (narration_scripts, sfx_descriptions, error_log, step_completion_metadata),
+  and worker-facing queries load full rows
 """
 
 import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from sqlalchemy.sql.base import ExecutableOption
 
 from app.models import Channel, PriorityLevel, Task, TaskStatus
 
@@ -64,6 +73,115 @@ TERMINAL_TASK_STATUSES = {
     TaskStatus.UPLOAD_ERROR,
 }
 
+# Large TEXT/JSON columns that dashboard queries never fetch
+TASK_HEAVY_COLUMNS = (
+    Task.narration_scripts,
+    Task.sfx_descriptions,
+    Task.error_log,
+    Task.step_completion_metadata,
+)
+
+# Columns selected by list_tasks() (one TaskSummary per row)
+TASK_LIST_COLUMNS = (
+    Task.id,
+    Task.channel_id,
+    Task.notion_page_id,
+    Task.title,
+    Task.status,
+    Task.priority,
+    Task.youtube_url,
+    Task.review_started_at,
+    Task.created_at,
+    Task.updated_at,
+)
+
+# Page size limits for list_tasks()
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class TaskCursor:
+    """Keyset pagination position: the (created_at, id) of a page's last task.
+
+    Attributes:
+        created_at: Creation time of the last task returned.
+        id: UUID of the last task returned (tie-breaker).
+    """
+
+    created_at: datetime
+    id: uuid.UUID
+
+    def encode(self) -> str:
+        """Return an opaque string token (for API query parameters)."""
+        return f"{self.created_at.isoformat()}_{self.id.hex}"
+
+    @classmethod
+    def decode(cls, token: str) -> "TaskCursor":
+        """Parse a token produced by encode().
+
+        Raises:
+            ValueError: If the token is malformed.
+        """
+        created_at, _, task_id = token.rpartition("_")
+        return cls(created_at=datetime.fromisoformat(created_at), id=uuid.UUID(task_id))
+
+
+@dataclass(frozen=True)
+class TaskSummary:
+    """List-view projection of a task (TASK_LIST_COLUMNS only).
+
+    Attributes:
+        id: Task UUID.
+        channel_id: Channel UUID (channels.id).
+        notion_page_id: Notion page ID.
+        title: Video title.
+        status: Current status.
+        priority: Queue priority.
+        youtube_url: YouTube URL once published.
+        review_started_at: When the task entered its current review gate.
+        created_at: Creation time (pagination key).
+        updated_at: Last update time.
+    """
+
+    id: uuid.UUID
+    channel_id: uuid.UUID
+    notion_page_id: str
+    title: str
+    status: TaskStatus
+    priority: PriorityLevel
+    youtube_url: str | None
+    review_started_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
+
+    @property
+    def cursor(self) -> TaskCursor:
+        """Cursor that continues a listing after this task."""
+        return TaskCursor(created_at=self.created_at, id=self.id)
+
+
+@dataclass(frozen=True)
+class TaskPage:
+    """One page of a keyset-paginated task listing.
+
+    Attributes:
+        items: Tasks on this page, ordered by (created_at, id).
+        next_cursor: Pass as `after` to fetch the next page (None on the last page).
+    """
+
+    items: list[TaskSummary]
+    next_cursor: TaskCursor | None
+
+
+def defer_heavy_columns() -> list[ExecutableOption]:
+    """ORM loader options: skip TASK_HEAVY_COLUMNS, load every other column.
+
+    Deferred columns raise on access instead of lazy-loading (which an
+    AsyncSession cannot do implicitly).
+    """
+    return [defer(column, raiseload=True) for column in TASK_HEAVY_COLUMNS]
+
 
 def priority_to_int(priority: PriorityLevel) -> int:
     """Convert task priority enum to integer for PgQueuer.
@@ -304,21 +422,26 @@ async def get_tasks_by_status(
     status: TaskStatus,
     session: AsyncSession,
     limit: int | None = None,
+    after: TaskCursor | None = None,
 ) -> list[Task]:
     """Query tasks by status.
 
     Helper function for workers to query tasks in specific states.
-    Supports FIFO ordering within status.
+    Supports FIFO ordering within status and keyset continuation.
 
     Args:
         status: TaskStatus enum value to filter by
         session: Database session
         limit: Optional limit on number of tasks returned
+        after: Optional cursor; only tasks after it in (created_at, id) order
 
     Returns:
-        List of Task instances matching status, ordered by created_at (FIFO)
+        List of fully loaded Task instances matching status, ordered by
+        created_at (FIFO)
     """
-    query = select(Task).where(Task.status == status).order_by(Task.created_at.asc())
+    query = select(Task).where(Task.status == status).order_by(Task.created_at.asc(), Task.id.asc())
+    if after is not None:
+        query = query.where(tuple_(Task.created_at, Task.id) > tuple_(after.created_at, after.id))
 
     if limit:
         query = query.limit(limit)
@@ -443,6 +566,7 @@ async def get_tasks_needing_review(session: AsyncSession) -> list[Task]:
 
     Returns:
         List of Task instances at review gates, ordered by priority desc, created_at asc
+        (TASK_HEAVY_COLUMNS deferred)
 
     Example:
         async with AsyncSessionLocal() as db:
@@ -464,6 +588,7 @@ async def get_tasks_needing_review(session: AsyncSession) -> list[Task]:
 
     stmt = (
         select(Task)
+        .options(*defer_heavy_columns())
         .where(Task.status.in_(REVIEW_GATE_STATUSES))
         .order_by(
             priority_order.desc(),  # High priority first (10 > 5 > 1)
@@ -487,17 +612,20 @@ async def get_tasks_with_errors(session: AsyncSession) -> list[Task]:
 
     Returns:
         List of Task instances in error states, ordered by updated_at desc
+        (TASK_HEAVY_COLUMNS deferred; error details come from task_events)
 
     Example:
         async with AsyncSessionLocal() as db:
             error_tasks = await get_tasks_with_errors(db)
             for task in error_tasks:
-                print(f"{task.title}: {task.status.value} - {task.error_log}")
+                error_log = await get_error_log(db, task.id)  # app.services.task_events
+                print(f"{task.title}: {task.status.value} - {error_log}")
     """
     from app.models import ERROR_STATUSES
 
     stmt = (
         select(Task)
+        .options(*defer_heavy_columns())
         .where(Task.status.in_(ERROR_STATUSES))
         .order_by(Task.updated_at.desc())  # Recent errors first
     )
@@ -519,6 +647,7 @@ async def get_published_tasks(session: AsyncSession, limit: int = 100) -> list[T
 
     Returns:
         List of Task instances in PUBLISHED status, ordered by updated_at desc
+        (TASK_HEAVY_COLUMNS deferred)
 
     Example:
         async with AsyncSessionLocal() as db:
@@ -528,6 +657,7 @@ async def get_published_tasks(session: AsyncSession, limit: int = 100) -> list[T
     """
     stmt = (
         select(Task)
+        .options(*defer_heavy_columns())
         .where(Task.status == TaskStatus.PUBLISHED)
         .order_by(Task.updated_at.desc())
         .limit(limit)
@@ -549,6 +679,7 @@ async def get_tasks_in_progress(session: AsyncSession) -> list[Task]:
 
     Returns:
         List of Task instances in progress, ordered by updated_at asc (stuck longest first)
+        (TASK_HEAVY_COLUMNS deferred)
 
     Example:
         async with AsyncSessionLocal() as db:
@@ -561,8 +692,57 @@ async def get_tasks_in_progress(session: AsyncSession) -> list[Task]:
 
     stmt = (
         select(Task)
+        .options(*defer_heavy_columns())
         .where(Task.status.in_(IN_PROGRESS_STATUSES))
         .order_by(Task.updated_at.asc())  # Oldest updates first = stuck longest
     )
     result = await session.execute(stmt)
     return list(result.scalars().all())
+
+
+async def list_tasks(
+    session: AsyncSession,
+    statuses: Iterable[TaskStatus],
+    after: TaskCursor | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> TaskPage:
+    """Fetch one page of task summaries (keyset pagination).
+
+    Selects TASK_LIST_COLUMNS only (no ORM entities) and continues from
+    `after` with a (created_at, id) row comparison, so every page is an
+    ix_tasks_status_created_at_id range scan - unlike OFFSET, later pages
+    cost the same as the first.
+
+    Args:
+        session: Database session
+        statuses: Statuses to include (e.g. REVIEW_GATE_STATUSES)
+        after: Cursor from the previous page's next_cursor (None for the first page)
+        limit: Page size (clamped to 1..MAX_PAGE_SIZE)
+
+    Returns:
+        TaskPage ordered by (created_at, id), with next_cursor set if more
+        tasks follow
+
+    Example:
+        async with AsyncSessionLocal() as db:
+            page = await list_tasks(db, REVIEW_GATE_STATUSES)
+            while page.items:
+                render(page.items)
+                if page.next_cursor is None:
+                    break
+                page = await list_tasks(db, REVIEW_GATE_STATUSES, after=page.next_cursor)
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    stmt = (
+        select(*TASK_LIST_COLUMNS)
+        .where(Task.status.in_(list(statuses)))
+        .order_by(Task.created_at.asc(), Task.id.asc())
+        .limit(limit + 1)  # One extra row tells whether another page follows
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(Task.created_at, Task.id) > tuple_(after.created_at, after.id))
+
+    rows = (await session.execute(stmt)).all()
+    items = [TaskSummary(**row._mapping) for row in rows[:limit]]
+    next_cursor = items[-1].cursor if len(rows) > limit else None
+    return TaskPage(items=items, next_cursor=next_cursor)
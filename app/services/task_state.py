@@ -0,0 +1,200 @@
+"""Task state repository: single-statement task updates with snapshots.
+
+A pipeline run used to open a session and `db.get(Task, ...)` for every
+state change - pipeline start/end times, cost, and each of the two status
+updates per step - and every status change made the Notion sync open yet
+another session just to re-read the task. Writes now go through one
+`UPDATE ... RETURNING` that applies all changed columns together (status,
+review_started_at, step metadata, timings) and returns the columns the
+Notion sync needs, so callers never load the row.
+
+Architecture Pattern:
+    - update_task(): Any combination of column values (plus one server-side
+      step_completion_metadata key merge) in one statement
+    - transition_task(): Status changes are validated in the WHERE clause
+      (status IN allowed predecessors, from Task.VALID_TRANSITIONS); only an
+      UPDATE that matched nothing costs a second SELECT, to tell a missing
+      task from an invalid transition
+    - TaskSnapshot: The RETURNING row, handed to the Notion sync instead of
+      a re-read
+    - Writes join the caller's transaction; callers commit
+
+References:
+    - app/models.py: Task, Task.VALID_TRANSITIONS
+    - app/services/pipeline_orchestrator.py: update_task_status
+    - app/services/notion_sync.py: TaskSyncData, push_task_to_notion
+"""
+
+import functools
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import InvalidStateTransitionError
+from app.models import PriorityLevel, Task, TaskStatus
+from app.services.notion_sync import TaskSyncData
+from app.services.task_metadata import step_metadata_merge
+
+
+@dataclass(frozen=True)
+class TaskSnapshot:
+    """Task columns returned by a state update.
+
+    Attributes:
+        id: Task UUID.
+        notion_page_id: Notion page ID (may be empty).
+        status: Status after the update.
+        priority: Queue priority.
+        title: Video title.
+        updated_at: Update timestamp written by the statement.
+        review_started_at: Review gate entry time, if any.
+    """
+
+    id: uuid.UUID
+    notion_page_id: str
+    status: TaskStatus
+    priority: PriorityLevel
+    title: str | None
+    updated_at: datetime
+    review_started_at: datetime | None
+
+    @classmethod
+    def from_task(cls, task: Task) -> "TaskSnapshot":
+        """Snapshot a Task already loaded by the caller (after flush)."""
+        return cls(
+            id=task.id,
+            notion_page_id=task.notion_page_id,
+            status=task.status,
+            priority=task.priority,
+            title=task.title,
+            updated_at=task.updated_at,
+            review_started_at=task.review_started_at,
+        )
+
+    def to_sync_data(self) -> TaskSyncData | None:
+        """Return Notion sync data (None if the task has no Notion page)."""
+        if not self.notion_page_id:
+            return None
+        return TaskSyncData(
+            id=self.id,
+            notion_page_id=self.notion_page_id,
+            status=self.status,
+            priority=self.priority,
+            title=self.title or "Untitled Task",
+            updated_at=self.updated_at,
+        )
+
+
+_SNAPSHOT_COLUMNS = (
+    Task.id,
+    Task.notion_page_id,
+    Task.status,
+    Task.priority,
+    Task.title,
+    Task.updated_at,
+    Task.review_started_at,
+)
+
+
+def _task_uuid(task_id: uuid.UUID | str) -> uuid.UUID:
+    return task_id if isinstance(task_id, uuid.UUID) else uuid.UUID(str(task_id))
+
+
+@functools.cache
+def allowed_predecessors(status: TaskStatus) -> tuple[TaskStatus, ...]:
+    """Return the statuses a task may move to `status` from."""
+    return tuple(
+        source for source, targets in Task.VALID_TRANSITIONS.items() if status in targets
+    )
+
+
+async def update_task(
+    db: AsyncSession,
+    task_id: uuid.UUID | str,
+    *,
+    step_metadata: tuple[str, Any] | None = None,
+    expected_status: tuple[TaskStatus, ...] | None = None,
+    **values: Any,
+) -> TaskSnapshot | None:
+    """Update task columns in one UPDATE ... RETURNING (the row is not loaded).
+
+    Args:
+        db: Database session (caller commits).
+        task_id: Task UUID.
+        step_metadata: Optional (key, value) merged into
+            step_completion_metadata server-side.
+        expected_status: Only update if the current status is one of these.
+        **values: Task column values (e.g. pipeline_start_time=now).
+
+    Returns:
+        Snapshot after the update, or None if no row matched.
+
+    Example:
+        >>> snapshot = await update_task(db, task_id, pipeline_cost_usd=8.45)
+    """
+    if step_metadata is not None:
+        values["step_completion_metadata"] = step_metadata_merge(db, *step_metadata)
+
+    stmt = update(Task).where(Task.id == _task_uuid(task_id))
+    if expected_status is not None:
+        stmt = stmt.where(Task.status.in_(expected_status))
+    result = await db.execute(
+        stmt.values(**values)
+        .returning(*_SNAPSHOT_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.one_or_none()
+    return TaskSnapshot(*row) if row is not None else None
+
+
+async def transition_task(
+    db: AsyncSession,
+    task_id: uuid.UUID | str,
+    status: TaskStatus,
+    *,
+    step_metadata: tuple[str, Any] | None = None,
+    **values: Any,
+) -> TaskSnapshot | None:
+    """Change a task's status (and other columns) in one validated UPDATE.
+
+    The transition is checked against Task.VALID_TRANSITIONS in the WHERE
+    clause, matching the ORM status validator without loading the row.
+
+    Args:
+        db: Database session (caller commits).
+        task_id: Task UUID.
+        status: New status.
+        step_metadata: Optional (key, value) merged into step_completion_metadata.
+        **values: Other column values written in the same statement
+            (e.g. review_started_at).
+
+    Returns:
+        Snapshot after the update, or None if the task does not exist.
+
+    Raises:
+        InvalidStateTransitionError: If the task's current status cannot move
+            to `status`.
+    """
+    snapshot = await update_task(
+        db,
+        task_id,
+        step_metadata=step_metadata,
+        expected_status=allowed_predecessors(status),
+        status=status,
+        **values,
+    )
+    if snapshot is not None:
+        return snapshot
+
+    current = await db.scalar(select(Task.status).where(Task.id == _task_uuid(task_id)))
+    if current is None:
+        return None
+    raise InvalidStateTransitionError(
+        f"Invalid transition: {current.value} → {status.value}",
+        from_status=current,
+        to_status=status,
+    )
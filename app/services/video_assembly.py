@@ -21,6 +21,8 @@ FFmpeg Operations:
     - Trim each 10-second video clip to match narration duration (6-8 seconds)
     - Mix narration (0dB) + SFX (-20dB) into single audio track
     - Concatenate 18 trimmed clips with hard cuts (no transitions)
+    - Stream-copy cached intro/outro segments and overlay the pre-scaled
+      watermark (app.services.branding_cache)
     - Output H.264 video + AAC audio in 1920x1080 (16:9, YouTube-compatible)
 
 Dependencies:
@@ -49,6 +51,21 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from app.services.branding_cache import (
+    MEZZANINE_PROFILE,
+    BrandingSegments,
+    EncoderProfile,
+    prepare_branding,
+)
+from app.services.task_artifacts import (
+    ARTIFACT_FINAL_VIDEO,
+    ARTIFACT_NARRATION,
+    ARTIFACT_SFX,
+    ARTIFACT_VIDEO,
+    ArtifactIndex,
+    record_output,
+)
+from app.services.voice_branding_service import BrandingPaths
 from app.utils.cli_wrapper import CLIScriptError, run_cli_script
 from app.utils.filesystem import (
     get_audio_dir,
@@ -108,18 +125,26 @@ class AssemblyManifest:
     Attributes:
         clips: List of ClipAssemblySpec objects (18 total, one per clip)
         output_path: Path where final assembled MP4 will be saved
+        branding: Cached intro/outro/watermark for the channel, if any
+        encoder: Encoder profile for the trimmed clips (matches the cached
+            branding segments, so concatenation can stream-copy them)
     """
 
     clips: list[ClipAssemblySpec]
     output_path: Path
+    branding: BrandingSegments | None = None
+    encoder: EncoderProfile = MEZZANINE_PROFILE
 
     def to_json_dict(self) -> dict[str, Any]:
         """Convert manifest to JSON format for CLI script.
 
         Returns:
-            Dictionary with 'clips' list containing clip specs with string paths.
+            Dictionary with 'clips' list containing clip specs with string paths,
+            'encoder' settings and 'branding' (None without branding).
         """
         return {
+            "encoder": self.encoder.to_json_dict(),
+            "branding": self.branding.to_json_dict() if self.branding else None,
             "clips": [
                 {
                     "clip_number": clip.clip_number,
@@ -153,12 +178,22 @@ class VideoAssemblyService:
         project_id: Project/task identifier (UUID from database)
     """
 
-    def __init__(self, channel_id: str, project_id: str):
+    def __init__(
+        self,
+        channel_id: str,
+        project_id: str,
+        artifacts: ArtifactIndex | None = None,
+        branding: BrandingPaths | None = None,
+    ):
         """Initialize video assembly service for specific project.
 
         Args:
             channel_id: Channel identifier for path isolation
             project_id: Project/task identifier (UUID from database)
+            artifacts: Optional artifact index for resume checks and recording
+                outputs (filesystem checks are used without one)
+            branding: Optional channel branding (FR11); intro/outro/watermark
+                are taken from the channel's branding cache
 
         Raises:
             ValueError: If channel_id or project_id contain invalid characters
@@ -167,6 +202,8 @@ class VideoAssemblyService:
         _validate_identifier(project_id, "project_id")
         self.channel_id = channel_id
         self.project_id = project_id
+        self.artifacts = artifacts
+        self.branding = branding
         self.log = get_logger(__name__)
 
     async def create_assembly_manifest(self, clip_count: int = 18) -> AssemblyManifest:
@@ -179,7 +216,12 @@ class VideoAssemblyService:
            c. Probe narration audio duration with ffprobe
            d. Create ClipAssemblySpec with measured duration
         2. Set output path for final assembled video
-        3. Return complete manifest with 18 clip specs
+        3. Resolve channel branding to cached segments (if configured)
+        4. Return complete manifest with 18 clip specs
+
+        With an artifact index covering videos, narration and SFX, step 1
+        reads paths and recorded durations from the index instead (no stat
+        or ffprobe per clip).
 
         Args:
             clip_count: Number of clips to assemble (default: 18)
@@ -213,8 +255,13 @@ class VideoAssemblyService:
 
         # Build clip specifications
         clips: list[ClipAssemblySpec] = []
+        indexed_clips = await self._indexed_clip_specs(clip_count)
 
         for clip_num in range(1, clip_count + 1):
+            if indexed_clips is not None:
+                clips.append(indexed_clips[clip_num - 1])
+                continue
+
             # Construct file paths
             video_path = video_dir / f"clip_{clip_num:02d}.mp4"
             narration_path = audio_dir / f"clip_{clip_num:02d}.mp3"
@@ -251,14 +298,61 @@ class VideoAssemblyService:
         # Set output path for final video
         output_path = project_dir / f"{self.project_id}_final.mp4"
 
+        # Branding segments: transcoded once per channel, reused from the cache
+        segments = None
+        if self.branding is not None and self.branding.has_any_branding():
+            segments = await prepare_branding(self.channel_id, self.branding)
+
         self.log.info(
             "assembly_manifest_created",
             clip_count=len(clips),
             output_path=str(output_path),
             total_estimated_duration=sum(clip.narration_duration for clip in clips),
+            branded=segments is not None,
         )
 
-        return AssemblyManifest(clips=clips, output_path=output_path)
+        return AssemblyManifest(clips=clips, output_path=output_path, branding=segments)
+
+    async def _indexed_clip_specs(self, clip_count: int) -> list[ClipAssemblySpec] | None:
+        """Build clip specs from the artifact index (None if it lacks a kind).
+
+        Raises:
+            FileNotFoundError: If the index has no ready file for a clip
+        """
+        index = self.artifacts
+        kinds = (ARTIFACT_VIDEO, ARTIFACT_NARRATION, ARTIFACT_SFX)
+        if index is None or not all(index.is_authoritative(kind) for kind in kinds):
+            return None
+
+        videos, narrations, sfx = (index.clips(kind) for kind in kinds)
+        specs: list[ClipAssemblySpec] = []
+        for clip_num in range(1, clip_count + 1):
+            for label, artifacts in (
+                ("Video", videos),
+                ("Narration audio", narrations),
+                ("SFX audio", sfx),
+            ):
+                if clip_num not in artifacts:
+                    raise FileNotFoundError(
+                        f"{label} file missing for clip {clip_num} (not indexed)"
+                    )
+
+            narration = narrations[clip_num]
+            narration_path = index.absolute(narration)
+            narration_duration = narration.duration_seconds
+            if narration_duration is None:
+                narration_duration = await self.probe_audio_duration(narration_path)
+
+            specs.append(
+                ClipAssemblySpec(
+                    clip_number=clip_num,
+                    video_path=index.absolute(videos[clip_num]),
+                    narration_path=narration_path,
+                    sfx_path=index.absolute(sfx[clip_num]),
+                    narration_duration=narration_duration,
+                )
+            )
+        return specs
 
     async def validate_input_files(self, manifest: AssemblyManifest) -> None:
         """Validate all input files exist before assembly.
@@ -464,6 +558,12 @@ class VideoAssemblyService:
 
         # Validate output video
         video_metadata = await self.validate_output_video(manifest.output_path)
+        await record_output(
+            self.artifacts,
+            manifest.output_path,
+            ARTIFACT_FINAL_VIDEO,
+            duration_seconds=video_metadata["duration"],
+        )
 
         self.log.info(
             "video_assembly_validated",
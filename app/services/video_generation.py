@@ -38,6 +38,7 @@ Usage:
 
 import asyncio
 import re
+import uuid
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
@@ -52,9 +53,17 @@ from tenacity import (
 )
 
 from app.clients.catbox import CatboxClient
+from app.services.api_concurrency import api_slots
+from app.services.task_artifacts import (
+    ARTIFACT_VIDEO,
+    ArtifactIndex,
+    output_reusable,
+    record_output,
+)
 from app.utils.cli_wrapper import run_cli_script
 from app.utils.filesystem import get_composite_dir, get_video_dir
 from app.utils.logging import get_logger
+from app.utils.tracing import traced
 
 log = get_logger(__name__)
 
@@ -134,12 +143,21 @@ class VideoGenerationService:
     - Coordinates rate limiting (5-8 concurrent max)
     """
 
-    def __init__(self, channel_id: str, project_id: str):
+    def __init__(
+        self,
+        channel_id: str,
+        project_id: str,
+        artifacts: ArtifactIndex | None = None,
+        task_id: uuid.UUID | None = None,
+    ):
         """Initialize video generation service for specific project.
 
         Args:
             channel_id: Channel identifier for path isolation
             project_id: Project/task identifier (UUID from database)
+            artifacts: Optional artifact index for resume checks and recording
+                outputs (filesystem checks are used without one)
+            task_id: Task UUID recorded on API slot leases (attributes leaked leases)
 
         Raises:
             ValueError: If channel_id or project_id contain invalid characters
@@ -150,6 +168,8 @@ class VideoGenerationService:
 
         self.channel_id = channel_id
         self.project_id = project_id
+        self.artifacts = artifacts
+        self.task_id = task_id
         self.log = get_logger(__name__)
         self._catbox_client: CatboxClient | None = None
 
@@ -330,13 +350,20 @@ class VideoGenerationService:
         # Create semaphore for rate limiting
         semaphore = asyncio.Semaphore(max_concurrent)
 
+        @traced("clip.video", lambda clip: {"clip_number": clip.clip_number})
         async def generate_clip(clip: VideoClip) -> bool:
             """Generate single video clip with rate limiting."""
             nonlocal generated, skipped, failed
 
             async with semaphore:
                 # Check if video already exists (resume support)
-                if resume and self.check_video_exists(clip.output_path):
+                if resume and await output_reusable(
+                    self.artifacts,
+                    clip.output_path,
+                    ARTIFACT_VIDEO,
+                    self.check_video_exists,
+                    clip.clip_number,
+                ):
                     self.log.info(
                         "video_clip_skipped",
                         clip_number=clip.clip_number,
@@ -356,18 +383,22 @@ class VideoGenerationService:
                         output_path=str(clip.output_path),
                     )
 
-                    # Call CLI script to generate video
-                    await run_cli_script(
-                        "generate_video.py",
-                        [
-                            "--image",
-                            catbox_url,
-                            "--prompt",
-                            clip.motion_prompt,
-                            "--output",
-                            str(clip.output_path),
-                        ],
-                        timeout=600,  # 10 minutes (NFR-I3)
+                    # Call CLI script to generate video (holds one cluster-wide Kling slot)
+                    async with api_slots.slot("kling", task_id=self.task_id):
+                        await run_cli_script(
+                            "generate_video.py",
+                            [
+                                "--image",
+                                catbox_url,
+                                "--prompt",
+                                clip.motion_prompt,
+                                "--output",
+                                str(clip.output_path),
+                            ],
+                            timeout=600,  # 10 minutes (NFR-I3)
+                        )
+                    await record_output(
+                        self.artifacts, clip.output_path, ARTIFACT_VIDEO, clip.clip_number
                     )
 
                     self.log.info(
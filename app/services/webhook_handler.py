@@ -30,6 +30,8 @@ from app.database import async_session_factory
 from app.models import NotionWebhookEvent, Task, TaskStatus
 from app.schemas.webhook import NotionWebhookPayload
 from app.services.notion_sync import extract_select
+from app.services.task_events import EVENT_REJECTION, record_task_event
+from app.services.task_metadata import CLIP_STATUS_FAILED, VIDEO_STEP, set_clip_status
 from app.services.task_service import enqueue_task_from_notion_page
 
 log = structlog.get_logger()
@@ -268,7 +270,7 @@ async def _handle_rejection_status_change(
     "Asset Error", "Video Error", or "Audio Error", this function:
     1. Finds the task by notion_page_id
     2. Extracts rejection reason from "Error Log" property in Notion
-    3. Appends rejection reason to task.error_log
+    3. Records the rejection reason as a task event
     4. Updates internal task status to error state
     5. Sets review_completed_at timestamp
 
@@ -339,23 +341,24 @@ async def _handle_rejection_status_change(
         else:
             duration = None
 
-        # Append rejection reason to error_log (Story 5.3 Task 5.3)
-        current_log = task.error_log or ""
-        timestamp = datetime.now(timezone.utc).isoformat()
-        if rejection_reason.strip():
-            new_entry = f"[{timestamp}] {notion_status}: {rejection_reason.strip()}"
-        else:
-            new_entry = f"[{timestamp}] {notion_status}: No rejection reason provided"
-        task.error_log = f"{current_log}\n{new_entry}".strip()
+        # Record rejection reason as an append-only event (Story 5.3 Task 5.3)
+        record_task_event(
+            session,
+            task.id,
+            EVENT_REJECTION,
+            internal_status,
+            message=rejection_reason.strip() or "No rejection reason provided",
+            notion_status=notion_status,
+        )
 
         # Extract clip numbers for partial regeneration (Story 5.4 AC3)
         if notion_status == "Video Error" and rejection_reason:
             clip_numbers = _extract_clip_numbers(rejection_reason)
             if clip_numbers:
-                # Store failed clip numbers in metadata for partial regeneration
-                if not task.step_completion_metadata:
-                    task.step_completion_metadata = {}
-                task.step_completion_metadata["failed_clip_numbers"] = clip_numbers
+                # Record failed clips for partial regeneration
+                await set_clip_status(
+                    session, task.id, VIDEO_STEP, clip_numbers, CLIP_STATUS_FAILED
+                )
                 log.info(
                     "video_rejection_clip_numbers_extracted",
                     correlation_id=correlation_id,
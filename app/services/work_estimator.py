@@ -0,0 +1,450 @@
+"""Remaining-work estimation from historical step timings.
+
+Every completed pipeline step records duration_seconds in
+Task.step_completion_metadata and every finished pipeline records
+pipeline_cost_usd. This module turns that history into per-channel, per-step
+percentiles (StepDurationStats rows) and predicts how much work and cost a task
+has left before it reaches FINAL_REVIEW.
+
+Scheduling Use:
+    Each refresh also writes every queued task's predicted remaining p50
+    seconds and cost to Task.predicted_remaining_seconds and
+    Task.predicted_remaining_cost_usd. The claim
+    (app.queue.fair_share_claim_statement) orders each channel's queued backlog
+    shortest-remaining-work-first on those indexed columns, which minimizes
+    mean time to FINAL_REVIEW; the remaining cost breaks ties between equally
+    long tasks (cheaper first). Starvation protection lives in the claim: tasks
+    queued (Task.queued_at) longer than STARVATION_THRESHOLD_SECONDS are
+    claimed oldest-first ahead of shorter work.
+
+Estimation Model:
+    - Per step: p50/p90 of duration_seconds over the HISTORY_LIMIT most recently
+      updated tasks with that step completed
+    - Channel percentiles are used when a channel has MIN_CHANNEL_SAMPLES samples,
+      otherwise the all-channel percentiles (new channels inherit global history)
+    - Cost: the channel's median pipeline_cost_usd apportioned to steps by each
+      step's share of median duration (per-step costs are not recorded)
+
+Usage:
+    from app.services.work_estimator import (
+        estimate_remaining_work,
+        load_step_estimates,
+        refresh_step_duration_stats,
+    )
+
+    async with async_session_factory() as db, db.begin():
+        await refresh_step_duration_stats(db)
+
+    estimates = await load_step_estimates(db, channel.id)
+    remaining = estimate_remaining_work(task.step_completion_metadata, estimates)
+
+References:
+    - Story 3.9: Pipeline orchestration metadata (duration_seconds source)
+    - app/services/scheduler_simulation.py: replay of recorded task histories
+"""
+
+import asyncio
+import math
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import delete, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Channel, StepDurationStats, Task, TaskStatus
+from app.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+# Pipeline steps in execution order (PipelineStep values, see pipeline_orchestrator)
+PIPELINE_STEPS = (
+    "asset_generation",
+    "composite_creation",
+    "video_generation",
+    "narration_generation",
+    "sfx_generation",
+    "video_assembly",
+)
+
+# Channel-specific percentiles require at least this many samples per step
+MIN_CHANNEL_SAMPLES = 5
+
+# Number of most recently updated tasks considered when refreshing percentiles
+HISTORY_LIMIT = 1000
+
+# Refresh cadence for the worker background loop (seconds)
+REFRESH_INTERVAL_SECONDS = 900
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of values.
+
+    Args:
+        values: Sample values (need not be sorted).
+        pct: Percentile in the range 0-100.
+
+    Returns:
+        The smallest value with at least pct percent of samples at or below it,
+        or 0.0 for an empty sample.
+
+    Example:
+        >>> percentile([1.0, 2.0, 3.0, 4.0], 50)
+        2.0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass(frozen=True)
+class StepEstimate:
+    """Predicted duration and cost of one pipeline step for one channel.
+
+    Attributes:
+        step: PipelineStep value (e.g., "video_generation").
+        sample_count: Number of samples behind the percentiles.
+        p50_seconds: Median duration.
+        p90_seconds: 90th percentile duration.
+        p50_cost_usd: Median cost apportioned to this step.
+    """
+
+    step: str
+    sample_count: int
+    p50_seconds: float
+    p90_seconds: float
+    p50_cost_usd: float = 0.0
+
+
+@dataclass(frozen=True)
+class RemainingWorkEstimate:
+    """Predicted work left before a task reaches FINAL_REVIEW.
+
+    Attributes:
+        seconds: Sum of p50 durations of incomplete steps.
+        p90_seconds: Sum of p90 durations of incomplete steps (pessimistic ETA).
+        cost_usd: Sum of apportioned p50 costs of incomplete steps.
+        remaining_steps: Incomplete steps in execution order.
+    """
+
+    seconds: float
+    p90_seconds: float
+    cost_usd: float
+    remaining_steps: tuple[str, ...]
+
+
+def completed_steps(step_completion_metadata: dict[str, Any] | None) -> set[str]:
+    """Return the steps marked completed in step_completion_metadata.
+
+    Args:
+        step_completion_metadata: Task.step_completion_metadata value.
+
+    Returns:
+        Set of PipelineStep values whose entry has "completed": true.
+    """
+    if not step_completion_metadata:
+        return set()
+    return {
+        step
+        for step, data in step_completion_metadata.items()
+        if isinstance(data, dict) and data.get("completed") is True
+    }
+
+
+def extract_step_durations(step_completion_metadata: dict[str, Any] | None) -> dict[str, float]:
+    """Return duration_seconds for each completed step with a recorded duration.
+
+    Steps whose outputs workspace retention deleted ("outputs_pruned") are no
+    longer completed but still ran for their recorded duration.
+
+    Args:
+        step_completion_metadata: Task.step_completion_metadata value.
+
+    Returns:
+        Mapping of PipelineStep value to duration in seconds. Steps that failed,
+        have no duration, or are not pipeline steps are omitted.
+    """
+    if not step_completion_metadata:
+        return {}
+    ran = completed_steps(step_completion_metadata) | {
+        step
+        for step, data in step_completion_metadata.items()
+        if isinstance(data, dict) and data.get("outputs_pruned") is True
+    }
+    durations: dict[str, float] = {}
+    for step in ran:
+        duration = step_completion_metadata[step].get("duration_seconds")
+        if step in PIPELINE_STEPS and isinstance(duration, int | float) and duration >= 0:
+            durations[step] = float(duration)
+    return durations
+
+
+def build_step_estimates(
+    durations: dict[uuid.UUID, dict[str, list[float]]],
+    costs: dict[uuid.UUID, list[float]],
+    channel_ids: list[uuid.UUID],
+) -> dict[uuid.UUID, dict[str, StepEstimate]]:
+    """Compute per-channel step estimates with all-channel fallback.
+
+    Args:
+        durations: Duration samples per channel per step.
+        costs: pipeline_cost_usd samples per channel.
+        channel_ids: Channels to produce estimates for.
+
+    Returns:
+        Mapping of channel ID to {step: StepEstimate}. A step is omitted only
+        when no channel has any samples for it.
+    """
+    global_durations: dict[str, list[float]] = defaultdict(list)
+    for per_step in durations.values():
+        for step, samples in per_step.items():
+            global_durations[step].extend(samples)
+    global_costs = [cost for samples in costs.values() for cost in samples]
+
+    estimates: dict[uuid.UUID, dict[str, StepEstimate]] = {}
+    for channel_id in channel_ids:
+        channel_percentiles: dict[str, tuple[int, float, float]] = {}
+        for step in PIPELINE_STEPS:
+            samples = durations.get(channel_id, {}).get(step, [])
+            if len(samples) < MIN_CHANNEL_SAMPLES:
+                samples = global_durations.get(step, [])
+            if samples:
+                channel_percentiles[step] = (
+                    len(samples),
+                    percentile(samples, 50),
+                    percentile(samples, 90),
+                )
+
+        channel_costs = costs.get(channel_id, [])
+        if len(channel_costs) < MIN_CHANNEL_SAMPLES:
+            channel_costs = global_costs
+        median_cost = percentile(channel_costs, 50)
+        total_p50 = sum(p50 for _, p50, _ in channel_percentiles.values())
+
+        estimates[channel_id] = {
+            step: StepEstimate(
+                step=step,
+                sample_count=count,
+                p50_seconds=p50,
+                p90_seconds=p90,
+                p50_cost_usd=median_cost * p50 / total_p50 if total_p50 else 0.0,
+            )
+            for step, (count, p50, p90) in channel_percentiles.items()
+        }
+    return estimates
+
+
+def estimate_remaining_work(
+    step_completion_metadata: dict[str, Any] | None,
+    estimates: dict[str, StepEstimate],
+) -> RemainingWorkEstimate:
+    """Predict remaining duration and cost for a task.
+
+    Args:
+        step_completion_metadata: Task.step_completion_metadata value.
+        estimates: Step estimates for the task's channel.
+
+    Returns:
+        RemainingWorkEstimate over steps not yet completed. Steps without an
+        estimate count as zero (no history anywhere).
+
+    Example:
+        >>> remaining = estimate_remaining_work(
+        ...     {"asset_generation": {"completed": True}}, estimates
+        ... )
+        >>> remaining.remaining_steps[0]
+        'composite_creation'
+    """
+    done = completed_steps(step_completion_metadata)
+    remaining = tuple(step for step in PIPELINE_STEPS if step not in done)
+    known = [estimates[step] for step in remaining if step in estimates]
+    return RemainingWorkEstimate(
+        seconds=sum(e.p50_seconds for e in known),
+        p90_seconds=sum(e.p90_seconds for e in known),
+        cost_usd=sum(e.p50_cost_usd for e in known),
+        remaining_steps=remaining,
+    )
+
+
+async def collect_step_history(
+    db: AsyncSession, limit: int = HISTORY_LIMIT
+) -> tuple[dict[uuid.UUID, dict[str, list[float]]], dict[uuid.UUID, list[float]]]:
+    """Load duration and cost samples from recently updated tasks.
+
+    Args:
+        db: Async database session.
+        limit: Maximum number of tasks to sample.
+
+    Returns:
+        Tuple of (duration samples per channel per step, cost samples per channel).
+    """
+    stmt = (
+        select(Task.channel_id, Task.step_completion_metadata, Task.pipeline_cost_usd)
+        .where(Task.step_completion_metadata.is_not(None))
+        .order_by(Task.updated_at.desc())
+        .limit(limit)
+    )
+    rows = (await db.execute(stmt)).all()
+
+    durations: dict[uuid.UUID, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+    costs: dict[uuid.UUID, list[float]] = defaultdict(list)
+    for row in rows:
+        for step, duration in extract_step_durations(row.step_completion_metadata).items():
+            durations[row.channel_id][step].append(duration)
+        if row.pipeline_cost_usd:
+            costs[row.channel_id].append(row.pipeline_cost_usd)
+    return durations, costs
+
+
+async def refresh_predicted_remaining_work(
+    db: AsyncSession, estimates: dict[uuid.UUID, dict[str, StepEstimate]]
+) -> int:
+    """Write predicted remaining work to the channels' queued tasks.
+
+    updated_at is written back unchanged: a prediction is not a task change,
+    and collect_step_history samples tasks by updated_at.
+
+    Args:
+        db: Async database session (caller owns the transaction).
+        estimates: Step estimates per channel (build_step_estimates).
+
+    Returns:
+        Number of tasks updated.
+    """
+    if not estimates:
+        return 0
+    rows = (
+        await db.execute(
+            select(Task.id, Task.channel_id, Task.step_completion_metadata, Task.updated_at).where(
+                Task.status == TaskStatus.QUEUED, Task.channel_id.in_(list(estimates))
+            )
+        )
+    ).all()
+    if not rows:
+        return 0
+
+    predictions = []
+    for row in rows:
+        remaining = estimate_remaining_work(row.step_completion_metadata, estimates[row.channel_id])
+        predictions.append(
+            {
+                "id": row.id,
+                "predicted_remaining_seconds": remaining.seconds,
+                "predicted_remaining_cost_usd": remaining.cost_usd,
+                "updated_at": row.updated_at,
+            }
+        )
+    await db.execute(update(Task), predictions)
+    return len(predictions)
+
+
+async def refresh_step_duration_stats(db: AsyncSession) -> int:
+    """Recompute StepDurationStats for all active channels.
+
+    Replaces existing rows in the caller's transaction so the claim query
+    never observes a partially refreshed channel. Queued tasks' predicted
+    remaining work is rewritten from the new estimates in the same
+    transaction (refresh_predicted_remaining_work). On PostgreSQL a transaction
+    advisory lock serializes refreshes; a worker that loses the race skips.
+
+    Args:
+        db: Async database session (caller owns the transaction).
+
+    Returns:
+        Number of StepDurationStats rows written (0 if another refresh is running).
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        acquired = await db.scalar(
+            text("SELECT pg_try_advisory_xact_lock(hashtext('step_duration_stats'))")
+        )
+        if not acquired:
+            log.info("step_duration_stats_refresh_skipped", reason="refresh_in_progress")
+            return 0
+
+    durations, costs = await collect_step_history(db)
+    channel_ids = list(
+        (await db.execute(select(Channel.id).where(Channel.is_active == True))).scalars()  # noqa: E712
+    )
+    estimates = build_step_estimates(durations, costs, channel_ids)
+
+    await db.execute(delete(StepDurationStats))
+    rows = [
+        StepDurationStats(
+            channel_id=channel_id,
+            step=estimate.step,
+            sample_count=estimate.sample_count,
+            p50_seconds=estimate.p50_seconds,
+            p90_seconds=estimate.p90_seconds,
+            p50_cost_usd=estimate.p50_cost_usd,
+        )
+        for channel_id, per_step in estimates.items()
+        for estimate in per_step.values()
+    ]
+    db.add_all(rows)
+    await db.flush()
+    predicted = await refresh_predicted_remaining_work(db, estimates)
+
+    log.info(
+        "step_duration_stats_refreshed",
+        channels=len(channel_ids),
+        rows=len(rows),
+        sampled_channels=len(durations),
+        predicted_tasks=predicted,
+    )
+    return len(rows)
+
+
+async def load_step_estimates(db: AsyncSession, channel_id: uuid.UUID) -> dict[str, StepEstimate]:
+    """Load persisted step estimates for a channel.
+
+    Args:
+        db: Async database session.
+        channel_id: Channel UUID (channels.id).
+
+    Returns:
+        Mapping of step to StepEstimate (empty if stats not yet refreshed).
+    """
+    result = await db.execute(
+        select(StepDurationStats).where(StepDurationStats.channel_id == channel_id)
+    )
+    return {
+        row.step: StepEstimate(
+            step=row.step,
+            sample_count=row.sample_count,
+            p50_seconds=row.p50_seconds,
+            p90_seconds=row.p90_seconds,
+            p50_cost_usd=row.p50_cost_usd,
+        )
+        for row in result.scalars()
+    }
+
+
+async def step_duration_stats_refresh_loop(interval: float = REFRESH_INTERVAL_SECONDS) -> None:
+    """Periodically refresh StepDurationStats until cancelled.
+
+    Runs alongside the PgQueuer loop in app.worker and the claim loop in
+    app.workers.pipeline_worker. Refreshes are idempotent,
+    transactional and serialized by an advisory lock, so running the loop in
+    every worker is safe.
+
+    Args:
+        interval: Seconds between refreshes.
+    """
+    from app.database import async_session_factory
+
+    if async_session_factory is None:
+        log.warning("step_duration_stats_refresh_disabled", reason="database_not_configured")
+        return
+
+    while True:
+        try:
+            async with async_session_factory() as db, db.begin():
+                await refresh_step_duration_stats(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.error("step_duration_stats_refresh_failed", error=str(e), exc_info=True)
+        await asyncio.sleep(interval)
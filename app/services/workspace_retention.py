@@ -0,0 +1,390 @@
+"""Workspace retention, garbage collection and disk back-pressure.
+
+Nothing used to delete /app/workspace/channels/*/projects/*. Each project
+holds ~22 asset PNGs, 18 composites, 18 MP4 clips, 36 audio files and the
+final MP4 (hundreds of MB), so the volume filled up over time. Retention
+policies keyed on TaskStatus now decide what a project keeps once its task
+reaches a status, and workers stop claiming new work when the volume is
+nearly full.
+
+Architecture Pattern:
+    - Policies list what to KEEP (relative to the project dir); everything
+      else is deleted, including files no step is known to produce
+    - Sweeps select tasks whose status has a policy that was not yet applied
+      (workspace_retention_status) and whose min_age has elapsed
+    - Incremental usage: tasks.workspace_bytes is re-measured for one
+      project after each step and after collection; per-channel usage is a
+      SUM over tasks, never a walk over the whole workspace
+    - Back-pressure: before claiming, a statvfs check compares free space to
+      WORKSPACE_MIN_FREE_GB; below it, the worker skips claiming for that
+      iteration and runs an urgent sweep that ignores min_age in its own
+      transaction (never inside the claim transaction)
+    - Deleting directories evicts the cached ProjectWorkspace, so a later
+      lookup recreates the tree, and drops the task_artifacts rows of the
+      deleted files
+
+References:
+    - app/utils/filesystem.py: Workspace layout, evict_project_workspace
+    - app/workers/pipeline_worker.py: Periodic sweep and claim back-pressure
+    - app/config.py: get_workspace_min_free_bytes, get_workspace_gc_interval_seconds
+"""
+
+import asyncio
+import os
+import shutil
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.config import get_workspace_min_free_bytes
+from app.models import Channel, Task, TaskStatus
+from app.services.task_artifacts import prune_artifacts
+from app.utils import filesystem
+from app.utils.filesystem import (
+    ASSET_DIR_NAME,
+    AUDIO_DIR_NAME,
+    CHARACTER_DIR_NAME,
+    COMPOSITE_DIR_NAME,
+    ENVIRONMENT_DIR_NAME,
+    PROPS_DIR_NAME,
+    SFX_DIR_NAME,
+    VIDEO_DIR_NAME,
+    evict_project_workspace,
+    get_project_path,
+)
+from app.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+FINAL_VIDEO_NAME = "{project_id}_final.mp4"
+
+# Project paths each pipeline step writes, keyed by PipelineStep value. A
+# step whose outputs a policy deletes is marked incomplete (and
+# "outputs_pruned") so a re-queued task regenerates it instead of resuming
+# past missing files; the rest of its record, including duration_seconds,
+# stays for app.services.work_estimator.
+STEP_OUTPUTS: dict[str, tuple[str, ...]] = {
+    "asset_generation": (
+        f"{ASSET_DIR_NAME}/{CHARACTER_DIR_NAME}",
+        f"{ASSET_DIR_NAME}/{ENVIRONMENT_DIR_NAME}",
+        f"{ASSET_DIR_NAME}/{PROPS_DIR_NAME}",
+    ),
+    "composite_creation": (f"{ASSET_DIR_NAME}/{COMPOSITE_DIR_NAME}",),
+    "video_generation": (VIDEO_DIR_NAME,),
+    "narration_generation": (AUDIO_DIR_NAME,),
+    "sfx_generation": (SFX_DIR_NAME,),
+    "video_assembly": (FINAL_VIDEO_NAME,),
+}
+
+# Tasks collected per sweep (bounds the time a sweep holds its transaction)
+GC_BATCH_SIZE = 50
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """What a project workspace keeps once its task reaches a status.
+
+    Attributes:
+        keep: Paths relative to the project dir to keep ("{project_id}" is
+            substituted); an empty tuple deletes the whole project dir.
+        min_age: Time since the task's last update before collection
+            (ignored under disk pressure).
+    """
+
+    keep: tuple[str, ...]
+    min_age: timedelta = timedelta(0)
+
+
+RETENTION_POLICIES: dict[TaskStatus, RetentionPolicy] = {
+    # Awaiting final review: the reviewer only needs the video and composites
+    TaskStatus.FINAL_REVIEW: RetentionPolicy(
+        keep=(FINAL_VIDEO_NAME, f"{ASSET_DIR_NAME}/{COMPOSITE_DIR_NAME}"),
+    ),
+    # Live on YouTube: keep the final video for re-uploads, drop intermediates
+    TaskStatus.PUBLISHED: RetentionPolicy(
+        keep=(FINAL_VIDEO_NAME,),
+        min_age=timedelta(days=1),
+    ),
+    # Cancelled: nothing is worth keeping once an un-cancel is unlikely
+    TaskStatus.CANCELLED: RetentionPolicy(
+        keep=(),
+        min_age=timedelta(days=1),
+    ),
+}
+
+
+@dataclass
+class RetentionResult:
+    """Outcome of applying a policy to one project workspace.
+
+    Attributes:
+        freed_bytes: Bytes deleted.
+        remaining_bytes: Bytes left in the project dir.
+    """
+
+    freed_bytes: int
+    remaining_bytes: int
+
+
+def directory_size(path: str | Path) -> int:
+    """Sum file sizes under a directory (symlinks are not followed).
+
+    Args:
+        path: Directory to measure (missing directories count as 0).
+
+    Returns:
+        Total size in bytes.
+    """
+    total = 0
+    pending = [str(path)]
+    while pending:
+        try:
+            entries = list(os.scandir(pending.pop()))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
+            except FileNotFoundError:
+                continue  # Deleted while scanning
+    return total
+
+
+def measure_project_bytes(channel_id: str, project_id: str) -> int:
+    """Measure one project's workspace (blocking; run in a thread).
+
+    Args:
+        channel_id: Channel identifier
+        project_id: Project/task identifier
+
+    Returns:
+        Project size in bytes.
+    """
+    return directory_size(get_project_path(channel_id, project_id))
+
+
+def _prune(directory: str, keep: frozenset[str], prefix: str = "") -> int:
+    """Delete everything under directory not in keep; return bytes freed."""
+    freed = 0
+    for entry in list(os.scandir(directory)):
+        relative = f"{prefix}{entry.name}"
+        if relative in keep:
+            continue
+        is_dir = entry.is_dir(follow_symlinks=False)
+        if is_dir and any(path.startswith(f"{relative}/") for path in keep):
+            freed += _prune(entry.path, keep, f"{relative}/")
+        elif is_dir:
+            freed += directory_size(entry.path)
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            freed += entry.stat(follow_symlinks=False).st_size
+            os.unlink(entry.path)
+    return freed
+
+
+def pruned_steps(policy: RetentionPolicy) -> frozenset[str]:
+    """Return the pipeline steps whose outputs a policy deletes.
+
+    Args:
+        policy: Retention policy.
+
+    Returns:
+        PipelineStep values (keys of STEP_OUTPUTS) with any output not kept.
+    """
+
+    def kept(path: str) -> bool:
+        return any(path == keep or path.startswith(f"{keep}/") for keep in policy.keep)
+
+    return frozenset(
+        step
+        for step, outputs in STEP_OUTPUTS.items()
+        if not all(kept(output) for output in outputs)
+    )
+
+
+def apply_retention(channel_id: str, project_id: str, policy: RetentionPolicy) -> RetentionResult:
+    """Apply a retention policy to one project workspace (blocking).
+
+    Args:
+        channel_id: Channel identifier
+        project_id: Project/task identifier
+        policy: Policy to apply
+
+    Returns:
+        RetentionResult with freed and remaining bytes.
+
+    Raises:
+        ValueError: If channel_id or project_id is invalid
+    """
+    project_dir = get_project_path(channel_id, project_id)
+    if not project_dir.is_dir():
+        return RetentionResult(freed_bytes=0, remaining_bytes=0)
+
+    if not policy.keep:
+        freed = directory_size(project_dir)
+        shutil.rmtree(project_dir, ignore_errors=True)
+        result = RetentionResult(freed_bytes=freed, remaining_bytes=0)
+    else:
+        keep = frozenset(path.format(project_id=project_id) for path in policy.keep)
+        freed = _prune(str(project_dir), keep)
+        result = RetentionResult(freed_bytes=freed, remaining_bytes=directory_size(project_dir))
+
+    evict_project_workspace(channel_id, project_id)
+    return result
+
+
+def free_disk_bytes() -> int | None:
+    """Return free bytes on the workspace volume (None if it does not exist yet)."""
+    try:
+        return shutil.disk_usage(filesystem.WORKSPACE_ROOT).free
+    except FileNotFoundError:
+        return None
+
+
+async def collect_workspaces(
+    db: AsyncSession,
+    now: datetime | None = None,
+    ignore_min_age: bool = False,
+    limit: int = GC_BATCH_SIZE,
+) -> int:
+    """Apply pending retention policies to up to `limit` tasks.
+
+    Args:
+        db: Database session (caller commits).
+        now: Reference time for min_age (default: current time).
+        ignore_min_age: Collect immediately (disk pressure).
+        limit: Maximum tasks collected.
+
+    Returns:
+        Bytes freed.
+    """
+    now = now or datetime.now(timezone.utc)
+    eligible = [
+        and_(
+            Task.status == status,
+            or_(
+                Task.workspace_retention_status.is_(None),
+                Task.workspace_retention_status != status.value,
+            ),
+            *([] if ignore_min_age else [Task.updated_at <= now - policy.min_age]),
+        )
+        for status, policy in RETENTION_POLICIES.items()
+    ]
+    tasks = (
+        await db.scalars(
+            select(Task)
+            .where(or_(*eligible))
+            .order_by(Task.updated_at.asc())
+            .limit(limit)
+            .options(selectinload(Task.channel))
+        )
+    ).all()
+
+    freed = 0
+    for task in tasks:
+        policy = RETENTION_POLICIES[task.status]
+        channel_id = task.channel.channel_id
+        try:
+            result = await asyncio.to_thread(apply_retention, channel_id, str(task.id), policy)
+        except (OSError, ValueError) as e:
+            log.warning(
+                "workspace_collection_failed",
+                task_id=str(task.id),
+                channel_id=channel_id,
+                error=str(e),
+            )
+            continue
+
+        await prune_artifacts(
+            db, task.id, [path.format(project_id=str(task.id)) for path in policy.keep]
+        )
+        task.workspace_bytes = result.remaining_bytes
+        task.workspace_retention_status = task.status.value
+        if task.step_completion_metadata:
+            # Deleted outputs: a re-queued task must regenerate those steps,
+            # but their recorded durations remain duration samples
+            pruned = pruned_steps(policy)
+            task.step_completion_metadata = {
+                step: (
+                    {**completion, "completed": False, "outputs_pruned": True}
+                    if step in pruned and isinstance(completion, dict)
+                    else completion
+                )
+                for step, completion in task.step_completion_metadata.items()
+            }
+        freed += result.freed_bytes
+        log.info(
+            "workspace_collected",
+            task_id=str(task.id),
+            channel_id=channel_id,
+            status=task.status.value,
+            freed_bytes=result.freed_bytes,
+            remaining_bytes=result.remaining_bytes,
+        )
+    return freed
+
+
+async def channel_disk_usage(db: AsyncSession) -> dict[str, int]:
+    """Return workspace bytes per channel (from tasks.workspace_bytes).
+
+    Args:
+        db: Database session.
+
+    Returns:
+        Mapping of channel_id to bytes (channels without files omitted).
+    """
+    rows = await db.execute(
+        select(Channel.channel_id, func.sum(Task.workspace_bytes))
+        .join(Task, Task.channel_id == Channel.id)
+        .where(Task.workspace_bytes > 0)
+        .group_by(Channel.channel_id)
+    )
+    return {channel_id: int(total) for channel_id, total in rows.all()}
+
+
+def has_disk_headroom() -> bool:
+    """Check free space against WORKSPACE_MIN_FREE_GB (one statvfs, no DB).
+
+    Returns:
+        True if the volume has room for a new task (or the check is disabled).
+    """
+    min_free = get_workspace_min_free_bytes()
+    free = free_disk_bytes()
+    return min_free == 0 or free is None or free >= min_free
+
+
+async def ensure_disk_headroom(db: AsyncSession) -> bool:
+    """Check free space, collecting workspaces urgently if it is low.
+
+    Args:
+        db: Database session (caller commits).
+
+    Returns:
+        True if there is enough free space (possibly after collecting),
+        False to apply back-pressure.
+    """
+    if has_disk_headroom():
+        return True
+
+    min_free = get_workspace_min_free_bytes()
+    freed = await collect_workspaces(db, ignore_min_age=True)
+    free = free_disk_bytes() or 0
+    if free >= min_free:
+        log.info("disk_pressure_relieved", freed_bytes=freed, free_bytes=free)
+        return True
+
+    log.warning(
+        "disk_pressure_backpressure",
+        free_bytes=free,
+        min_free_bytes=min_free,
+        freed_bytes=freed,
+        channel_usage_bytes=await channel_disk_usage(db),
+    )
+    return False
@@ -5,23 +5,64 @@ preventing blocking of the async event loop during long-running operations.
 
 Critical Pattern:
 - Workers MUST use this wrapper instead of subprocess.run() directly
-- Ensures non-blocking execution via asyncio.to_thread()
+- Ensures non-blocking execution via asyncio.create_subprocess_exec() (no
+  executor thread is parked for the lifetime of the script)
 - Enforces timeout management per script type
 - Provides structured error handling with CLIScriptError
 
+Output Handling:
+- stdout/stderr are streamed line by line into structured logs (debug level)
+- Only the last OUTPUT_TAIL_LINES lines per stream are kept (ring buffer), so
+  a chatty script cannot grow worker memory
+- The returned CompletedProcess and CLIScriptError carry the retained tail
+
+Process Lifecycle:
+- Each script runs in its own session/process group
+- Timeout or cancellation kills the whole group (script + ffmpeg children)
+- CPU time and peak RSS are sampled from /proc while the script runs
+  (Linux only; reported as None elsewhere)
+- Pooled scripts run in warm runner processes when one is free
+  (app.utils.script_pool), skipping interpreter startup and imports
+- Each run is a "cli_script" trace span; with tracing enabled the script
+  environment carries it as TRACEPARENT (app.utils.tracing). The scripts
+  themselves do not read TRACEPARENT or emit spans (scripts/ is a
+  brownfield boundary, see project-context.md), so the span has no children
+
 Architecture Reference:
 - project-context.md: CLI Scripts Architecture (lines 59-116)
 - project-context.md: Integration Utilities (MANDATORY) (lines 117-278)
 """
 
 import asyncio
+import contextlib
+import os
+import signal
 import subprocess
+import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
 
 from app.utils.logging import get_logger
+from app.utils.metrics import SUBPROCESSES_IN_FLIGHT
+from app.utils.tracing import inject_trace_context, span
 
 log = get_logger(__name__)
 
+# Lines retained per stream (stdout/stderr) for results and error messages
+OUTPUT_TAIL_LINES = 200
+
+# Longest single line kept in the ring buffer / logs (characters)
+MAX_LINE_CHARS = 2000
+
+# StreamReader buffer limit; longer lines without a newline are truncated
+STREAM_LIMIT_BYTES = 1024 * 1024
+
+# Interval between /proc usage samples (seconds)
+USAGE_SAMPLE_INTERVAL_SECONDS = 0.5
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
 
 class CLIScriptError(Exception):
     """Raised when CLI script fails with non-zero exit code.
@@ -39,14 +80,159 @@ class CLIScriptError(Exception):
         super().__init__(f"{script} failed with exit code {exit_code}: {stderr}")
 
 
+@dataclass
+class ProcessUsage:
+    """Resource usage of one script run (sampled from /proc).
+
+    Attributes:
+        cpu_seconds: User + system CPU time, including reaped children (ffmpeg).
+        peak_rss_bytes: Peak resident set size of the script process (VmHWM).
+            None for pooled runs, whose process outlives the job.
+        runner_peak_rss_bytes: Lifetime peak RSS of the warm runner that ran a
+            pooled job (covers every job the runner has run so far).
+    """
+
+    cpu_seconds: float | None = None
+    peak_rss_bytes: int | None = None
+    runner_peak_rss_bytes: int | None = None
+
+
+def _read_proc_usage(pid: int) -> ProcessUsage | None:
+    """Read CPU time and peak RSS for a live process from /proc."""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return None
+
+    # Fields after "(comm)": state is field 3, utime/stime/cutime/cstime are 14-17
+    fields = stat.rsplit(")", 1)[1].split()
+    ticks = sum(int(value) for value in fields[11:15])
+
+    peak_rss_bytes = None
+    for line in status.splitlines():
+        if line.startswith("VmHWM:"):
+            peak_rss_bytes = int(line.split()[1]) * 1024
+            break
+    return ProcessUsage(cpu_seconds=ticks / _CLOCK_TICKS, peak_rss_bytes=peak_rss_bytes)
+
+
+def _megabytes(size_bytes: int | None) -> float | None:
+    return round(size_bytes / (1024 * 1024), 1) if size_bytes else None
+
+
+async def _sample_usage(pid: int, usage: ProcessUsage) -> None:
+    """Update usage with the latest /proc sample until cancelled."""
+    while True:
+        sample = _read_proc_usage(pid)
+        if sample is not None:
+            usage.cpu_seconds = sample.cpu_seconds
+            usage.peak_rss_bytes = sample.peak_rss_bytes
+        await asyncio.sleep(USAGE_SAMPLE_INTERVAL_SECONDS)
+
+
+async def _pump_stream(
+    stream: asyncio.StreamReader,
+    script: str,
+    stream_name: str,
+    tail: deque[str],
+) -> None:
+    """Log each output line and keep the last OUTPUT_TAIL_LINES in tail."""
+    while True:
+        try:
+            raw = await stream.readline()
+        except ValueError:
+            # Line exceeded STREAM_LIMIT_BYTES; the reader discarded it
+            tail.append("[line truncated]")
+            continue
+        if not raw:
+            return
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if len(line) > MAX_LINE_CHARS:
+            line = line[:MAX_LINE_CHARS] + "..."
+        tail.append(line)
+        log.debug("cli_script_output", script=script, stream=stream_name, line=line)
+
+
+def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """SIGKILL the script and every process it started (own session)."""
+    if process.returncode is not None:
+        return
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        os.killpg(process.pid, signal.SIGKILL)
+
+
+@dataclass
+class ScriptRun:
+    """Outcome of one script execution.
+
+    Attributes:
+        returncode: Script exit code.
+        stdout: Last OUTPUT_TAIL_LINES lines of stdout.
+        stderr: Last OUTPUT_TAIL_LINES lines of stderr.
+        usage: CPU time and peak RSS.
+        pooled: True if a warm runner (app.utils.script_pool) executed it.
+    """
+
+    returncode: int
+    stdout: str
+    stderr: str
+    usage: ProcessUsage
+    pooled: bool = False
+
+
+async def _run_subprocess(
+    script: str,
+    command: list[str],
+    env: dict[str, str] | None,
+    timeout: int,
+) -> ScriptRun:
+    """Run the script as a one-off subprocess in its own process group.
+
+    Raises:
+        asyncio.TimeoutError: If the script exceeds timeout (group killed)
+    """
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+        start_new_session=True,  # Own process group: kill script + children together
+        limit=STREAM_LIMIT_BYTES,
+    )
+    stdout_tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr_tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    usage = ProcessUsage()
+    sampler = asyncio.create_task(_sample_usage(process.pid, usage))
+
+    async def _communicate() -> int:
+        assert process.stdout is not None and process.stderr is not None
+        await asyncio.gather(
+            _pump_stream(process.stdout, script, "stdout", stdout_tail),
+            _pump_stream(process.stderr, script, "stderr", stderr_tail),
+        )
+        return await process.wait()
+
+    try:
+        returncode = await asyncio.wait_for(_communicate(), timeout=timeout)
+    finally:
+        # Timeout or cancellation (worker shutdown, task cancel) must not leak the script
+        if process.returncode is None:
+            _kill_process_group(process)
+            await process.wait()
+        sampler.cancel()
+
+    return ScriptRun(returncode, "\n".join(stdout_tail), "\n".join(stderr_tail), usage)
+
+
 async def run_cli_script(
     script: str, args: list[str], timeout: int = 600, env: dict[str, str] | None = None
 ) -> subprocess.CompletedProcess[str]:
     """Run CLI script without blocking async event loop.
 
-    This function wraps `subprocess.run()` with `asyncio.to_thread()` to prevent
-    blocking the event loop during long-running CLI operations (video generation,
-    audio synthesis, etc.).
+    This function starts the script with `asyncio.create_subprocess_exec()`
+    and streams its output on the event loop, so long-running CLI operations
+    (video generation, audio synthesis, etc.) hold no executor thread.
 
     Args:
         script: Script name (e.g., "generate_asset.py")
@@ -57,11 +243,12 @@ async def run_cli_script(
              parent environment with given variables (prevents global pollution).
 
     Returns:
-        CompletedProcess with stdout, stderr, returncode
+        CompletedProcess with returncode and the last OUTPUT_TAIL_LINES lines
+        of stdout/stderr
 
     Raises:
         CLIScriptError: If script exits with non-zero code
-        asyncio.TimeoutError: If script exceeds timeout
+        asyncio.TimeoutError: If script exceeds timeout (process group killed)
         ValueError: If script path contains path traversal sequences
         FileNotFoundError: If script file doesn't exist
 
@@ -116,47 +303,59 @@ async def run_cli_script(
 
     log.info("cli_script_start", script=script, args=sanitized_args, timeout=timeout)
 
-    # Prepare environment variables for subprocess
-    # If env provided, extend parent environment (don't replace entirely)
-    # This ensures subprocess inherits system PATH, PYTHON_PATH, etc.
-    import os
+    with span("cli_script", script=script, timeout=timeout) as script_span:
+        # TRACEPARENT names this span for a traced child process; the bundled
+        # scripts ignore it, so their HTTP calls are timed only as this span
+        env = inject_trace_context(env)
 
-    process_env = os.environ.copy()
-    if env:
-        process_env.update(env)
+        # Prepare environment variables for subprocess
+        # None inherits the parent environment without copying it; overrides extend
+        # (never replace) it so the script keeps PATH, PYTHONPATH, etc.
+        process_env = {**os.environ, **env} if env else None
 
-    try:
-        # Use asyncio.to_thread to avoid blocking event loop
-        result = await asyncio.to_thread(
-            subprocess.run,
-            command,
-            capture_output=True,  # Capture stdout/stderr
-            text=True,  # Decode as UTF-8 strings
-            errors="replace",  # Replace invalid UTF-8 with replacement character
-            timeout=timeout,  # Enforce timeout
-            env=process_env,  # Pass isolated environment (prevents global pollution)
+        start = time.monotonic()
+        SUBPROCESSES_IN_FLIGHT.inc(script=script)
+        try:
+            # Warm runner when the script is pooled and a runner is free, else cold
+            from app.utils.script_pool import run_pooled
+
+            run = await run_pooled(script, script_path, args, env, timeout)
+            if run is None:
+                run = await _run_subprocess(script, command, process_env, timeout)
+        except asyncio.TimeoutError as e:
+            log.error("cli_script_timeout", script=script, timeout=timeout)
+            raise asyncio.TimeoutError(f"{script} exceeded timeout of {timeout}s") from e
+        finally:
+            SUBPROCESSES_IN_FLIGHT.dec(script=script)
+
+        result = subprocess.CompletedProcess(
+            command, run.returncode, stdout=run.stdout, stderr=run.stderr
         )
+        metrics = {
+            "duration_seconds": round(time.monotonic() - start, 3),
+            "cpu_seconds": run.usage.cpu_seconds,
+            "peak_rss_mb": _megabytes(run.usage.peak_rss_bytes),
+            "runner_peak_rss_mb": _megabytes(run.usage.runner_peak_rss_bytes),
+            "pooled": run.pooled,
+        }
+        script_span.set_attribute("exit_code", run.returncode)
+        script_span.set_attribute("pooled", run.pooled)
 
-        if result.returncode != 0:
+        if run.returncode != 0:
             # Truncate stderr to prevent log bloat
             stderr_truncated = (
-                result.stderr[:500] + "..." if len(result.stderr) > 500 else result.stderr
+                result.stderr[-500:] if len(result.stderr) > 500 else result.stderr
             )
             log.error(
                 "cli_script_error",
                 script=script,
-                exit_code=result.returncode,
+                exit_code=run.returncode,
                 stderr=stderr_truncated,
+                **metrics,
             )
-            raise CLIScriptError(script, result.returncode, result.stderr)
-
-        # Truncate stdout to prevent log bloat
-        stdout_truncated = (
-            result.stdout[:500] + "..." if len(result.stdout) > 500 else result.stdout
-        )
-        log.info("cli_script_success", script=script, stdout=stdout_truncated)
-        return result
+            raise CLIScriptError(script, run.returncode, result.stderr)
 
-    except subprocess.TimeoutExpired as e:
-        log.error("cli_script_timeout", script=script, timeout=timeout)
-        raise asyncio.TimeoutError(f"{script} exceeded timeout of {timeout}s") from e
+    # Truncate stdout to prevent log bloat
+    stdout_truncated = result.stdout[:500] + "..." if len(result.stdout) > 500 else result.stdout
+    log.info("cli_script_success", script=script, stdout=stdout_truncated, **metrics)
+    return result
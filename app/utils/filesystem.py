@@ -4,6 +4,15 @@ This module provides standardized path construction functions that enforce
 channel isolation and consistent directory structure for the video generation
 pipeline. All path helpers automatically create directories if they don't exist.
 
+Caching:
+    Validation, resolve() and mkdir() run once per (channel, project): the
+    result is a ProjectWorkspace with every directory and per-clip file path
+    precomputed, kept in an LRU. The get_*_dir helpers are thin lookups on
+    it, so calling them inside per-clip loops costs a single stat() (a
+    project directory deleted behind the cache is recreated). Code that
+    deletes only some of a project's directories must call
+    evict_project_workspace().
+
 Security:
     All path helpers validate inputs to prevent path traversal attacks.
     Channel IDs and project IDs must be alphanumeric with optional underscores/dashes.
@@ -21,7 +30,11 @@ Architecture Pattern:
     └── sfx/
 
 Usage:
-    from app.utils.filesystem import get_asset_dir, get_video_dir
+    from app.utils.filesystem import get_asset_dir, get_project_workspace, get_video_dir
+
+    # Precomputed per-clip paths
+    workspace = get_project_workspace("poke1", "vid_abc123")
+    video_path = workspace.video_clip(3)  # .../videos/clip_03.mp4
 
     # Get asset directory (auto-creates)
     asset_dir = get_asset_dir("poke1", "vid_abc123")
@@ -35,6 +48,9 @@ Usage:
 """
 
 import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 
 __all__ = [
@@ -42,13 +58,18 @@ __all__ = [
     "AUDIO_DIR_NAME",
     "CHANNEL_DIR_NAME",
     "CHARACTER_DIR_NAME",
+    "CLIPS_PER_VIDEO",
     "COMPOSITE_DIR_NAME",
     "ENVIRONMENT_DIR_NAME",
     "PROJECT_DIR_NAME",
     "PROPS_DIR_NAME",
     "SFX_DIR_NAME",
     "VIDEO_DIR_NAME",
+    "WORKSPACE_CACHE_SIZE",
     "WORKSPACE_ROOT",
+    "ProjectWorkspace",
+    "clear_workspace_cache",
+    "evict_project_workspace",
     "get_asset_dir",
     "get_audio_dir",
     "get_channel_workspace",
@@ -56,6 +77,8 @@ __all__ = [
     "get_composite_dir",
     "get_environment_dir",
     "get_project_dir",
+    "get_project_path",
+    "get_project_workspace",
     "get_props_dir",
     "get_sfx_dir",
     "get_video_dir",
@@ -78,6 +101,12 @@ ENVIRONMENT_DIR_NAME = "environments"
 PROPS_DIR_NAME = "props"
 COMPOSITE_DIR_NAME = "composites"
 
+# Clips per video (18 x ~10s); ProjectWorkspace precomputes paths for each
+CLIPS_PER_VIDEO = 18
+
+# Cached ProjectWorkspace objects and channel paths (each an LRU; ~1KB per project)
+WORKSPACE_CACHE_SIZE = 256
+
 # Validation pattern: alphanumeric, underscores, dashes only
 _ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 
@@ -102,20 +131,21 @@ def _validate_identifier(identifier: str, name: str) -> None:
         )
 
 
-def _verify_path_in_workspace(path: Path) -> None:
-    """Verify that resolved path stays within WORKSPACE_ROOT.
+def _verify_path_in_workspace(path: Path, root: Path) -> None:
+    """Verify that resolved path stays within the workspace root.
 
     This prevents path traversal attacks where malicious identifiers
     could escape the workspace directory.
 
     Args:
         path: The path to verify
+        root: Workspace root (WORKSPACE_ROOT at lookup time)
 
     Raises:
-        ValueError: If resolved path escapes WORKSPACE_ROOT
+        ValueError: If resolved path escapes the workspace root
     """
     resolved = path.resolve()
-    workspace_resolved = WORKSPACE_ROOT.resolve()
+    workspace_resolved = root.resolve()
 
     if not resolved.is_relative_to(workspace_resolved):
         raise ValueError(
@@ -124,6 +154,236 @@ def _verify_path_in_workspace(path: Path) -> None:
         )
 
 
+@dataclass(frozen=True)
+class ProjectWorkspace:
+    """Precomputed, already-created directory tree for one (channel, project).
+
+    Built once per (channel, project) by get_project_workspace(): identifiers
+    are validated, the path is resolved and every directory is created a
+    single time. Afterwards all paths - including per-clip file paths - are
+    plain attribute lookups with no regex, resolve() or mkdir() syscalls.
+
+    Attributes:
+        channel_id: Channel identifier
+        project_id: Project/task identifier
+        project_dir: .../channels/{channel_id}/projects/{project_id}
+        asset_dir, character_dir, environment_dir, props_dir, composite_dir,
+        video_dir, audio_dir, sfx_dir: Project subdirectories
+        composite_clips: Composite PNG per clip (index 0 = clip 1)
+        video_clips: Kling MP4 per clip
+        narration_clips: Narration MP3 per clip
+        sfx_clips: SFX WAV per clip
+        sfx_mp3_clips: SFX MP3 per clip
+
+    Example:
+        >>> ws = get_project_workspace("poke1", "vid_abc123")
+        >>> ws.video_clip(3)
+        PosixPath('/app/workspace/channels/poke1/projects/vid_abc123/videos/clip_03.mp4')
+    """
+
+    channel_id: str
+    project_id: str
+    project_dir: Path
+    asset_dir: Path
+    character_dir: Path
+    environment_dir: Path
+    props_dir: Path
+    composite_dir: Path
+    video_dir: Path
+    audio_dir: Path
+    sfx_dir: Path
+    composite_clips: tuple[Path, ...]
+    video_clips: tuple[Path, ...]
+    narration_clips: tuple[Path, ...]
+    sfx_clips: tuple[Path, ...]
+    sfx_mp3_clips: tuple[Path, ...]
+
+    @classmethod
+    def build(cls, channel_id: str, project_id: str, project_dir: Path) -> "ProjectWorkspace":
+        """Compute every path for a project (no filesystem access)."""
+        asset_dir = project_dir / ASSET_DIR_NAME
+        composite_dir = asset_dir / COMPOSITE_DIR_NAME
+        video_dir = project_dir / VIDEO_DIR_NAME
+        audio_dir = project_dir / AUDIO_DIR_NAME
+        sfx_dir = project_dir / SFX_DIR_NAME
+        clips = range(1, CLIPS_PER_VIDEO + 1)
+        return cls(
+            channel_id=channel_id,
+            project_id=project_id,
+            project_dir=project_dir,
+            asset_dir=asset_dir,
+            character_dir=asset_dir / CHARACTER_DIR_NAME,
+            environment_dir=asset_dir / ENVIRONMENT_DIR_NAME,
+            props_dir=asset_dir / PROPS_DIR_NAME,
+            composite_dir=composite_dir,
+            video_dir=video_dir,
+            audio_dir=audio_dir,
+            sfx_dir=sfx_dir,
+            composite_clips=tuple(composite_dir / f"clip_{i:02d}.png" for i in clips),
+            video_clips=tuple(video_dir / f"clip_{i:02d}.mp4" for i in clips),
+            narration_clips=tuple(audio_dir / f"clip_{i:02d}.mp3" for i in clips),
+            sfx_clips=tuple(sfx_dir / f"sfx_{i:02d}.wav" for i in clips),
+            sfx_mp3_clips=tuple(sfx_dir / f"sfx_{i:02d}.mp3" for i in clips),
+        )
+
+    @property
+    def leaf_dirs(self) -> tuple[Path, ...]:
+        """Directories created for the project (parents are implied)."""
+        return (
+            self.character_dir,
+            self.environment_dir,
+            self.props_dir,
+            self.composite_dir,
+            self.video_dir,
+            self.audio_dir,
+            self.sfx_dir,
+        )
+
+    @staticmethod
+    def _clip(paths: tuple[Path, ...], clip_number: int) -> Path:
+        if not 1 <= clip_number <= len(paths):
+            raise ValueError(f"clip_number must be 1-{len(paths)}, got {clip_number}")
+        return paths[clip_number - 1]
+
+    def composite_clip(self, clip_number: int) -> Path:
+        """Composite PNG for a clip (clip_NN.png)."""
+        return self._clip(self.composite_clips, clip_number)
+
+    def video_clip(self, clip_number: int) -> Path:
+        """Generated video for a clip (clip_NN.mp4)."""
+        return self._clip(self.video_clips, clip_number)
+
+    def narration_clip(self, clip_number: int) -> Path:
+        """Narration audio for a clip (clip_NN.mp3)."""
+        return self._clip(self.narration_clips, clip_number)
+
+    def sfx_clip(self, clip_number: int) -> Path:
+        """SFX audio for a clip (sfx_NN.wav)."""
+        return self._clip(self.sfx_clips, clip_number)
+
+    def sfx_mp3_clip(self, clip_number: int) -> Path:
+        """SFX audio for a clip in MP3 format (sfx_NN.mp3)."""
+        return self._clip(self.sfx_mp3_clips, clip_number)
+
+
+# LRU of created workspaces, keyed by (WORKSPACE_ROOT, channel_id[, project_id])
+# WORKSPACE_ROOT is part of the key so tests that patch it never see stale paths
+_cache_lock = threading.Lock()
+_channel_cache: OrderedDict[tuple[Path, str], Path] = OrderedDict()
+_project_cache: OrderedDict[tuple[Path, str, str], ProjectWorkspace] = OrderedDict()
+
+
+def _create_channel_workspace(root: Path, channel_id: str) -> Path:
+    """Validate, verify and create a channel workspace (uncached)."""
+    _validate_identifier(channel_id, "channel_id")
+
+    path = root / CHANNEL_DIR_NAME / channel_id
+    _verify_path_in_workspace(path, root)
+
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def get_project_workspace(channel_id: str, project_id: str) -> ProjectWorkspace:
+    """Get the ProjectWorkspace for a (channel, project), creating it once.
+
+    The first call validates identifiers, verifies the resolved path stays
+    within WORKSPACE_ROOT and creates the full directory tree. Later calls
+    return the cached object (LRU of WORKSPACE_CACHE_SIZE projects) after one
+    stat() confirming the project directory still exists; if it was deleted
+    the entry is dropped and the tree is recreated.
+
+    Security:
+        Validates both channel_id and project_id to prevent path traversal.
+
+    Args:
+        channel_id: Channel identifier
+        project_id: Project/task identifier
+
+    Returns:
+        ProjectWorkspace with all directories created
+
+    Raises:
+        ValueError: If channel_id or project_id is invalid
+
+    Example:
+        >>> ws = get_project_workspace("poke1", "vid_abc123")
+        >>> ws.audio_dir
+        PosixPath('/app/workspace/channels/poke1/projects/vid_abc123/audio')
+    """
+    root = WORKSPACE_ROOT
+    key = (root, channel_id, project_id)
+    with _cache_lock:
+        workspace = _project_cache.get(key)
+        if workspace is not None:
+            _project_cache.move_to_end(key)
+    if workspace is not None:
+        if workspace.project_dir.is_dir():
+            return workspace
+        # Deleted behind the cache (e.g. manual cleanup): rebuild below
+        evict_project_workspace(channel_id, project_id)
+
+    _validate_identifier(project_id, "project_id")
+    project_dir = get_channel_workspace(channel_id) / PROJECT_DIR_NAME / project_id
+    _verify_path_in_workspace(project_dir, root)
+
+    workspace = ProjectWorkspace.build(channel_id, project_id, project_dir)
+    for directory in workspace.leaf_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    with _cache_lock:
+        _project_cache[key] = workspace
+        _project_cache.move_to_end(key)
+        while len(_project_cache) > WORKSPACE_CACHE_SIZE:
+            _project_cache.popitem(last=False)
+    return workspace
+
+
+def get_project_path(channel_id: str, project_id: str) -> Path:
+    """Get a validated project directory path without creating anything.
+
+    For code that inspects or deletes existing workspaces (retention), where
+    get_project_dir() would recreate directories that are about to be removed.
+
+    Args:
+        channel_id: Channel identifier
+        project_id: Project/task identifier
+
+    Returns:
+        Path: .../channels/{channel_id}/projects/{project_id} (may not exist)
+
+    Raises:
+        ValueError: If channel_id or project_id is invalid
+    """
+    root = WORKSPACE_ROOT
+    _validate_identifier(channel_id, "channel_id")
+    _validate_identifier(project_id, "project_id")
+
+    path = root / CHANNEL_DIR_NAME / channel_id / PROJECT_DIR_NAME / project_id
+    _verify_path_in_workspace(path, root)
+    return path
+
+
+def evict_project_workspace(channel_id: str, project_id: str) -> None:
+    """Forget a cached workspace (call after deleting its directories).
+
+    The next get_project_workspace() call recreates the directory tree.
+
+    Args:
+        channel_id: Channel identifier
+        project_id: Project/task identifier
+    """
+    with _cache_lock:
+        _project_cache.pop((WORKSPACE_ROOT, channel_id, project_id), None)
+
+
+def clear_workspace_cache() -> None:
+    """Forget all cached channel and project workspaces."""
+    with _cache_lock:
+        _channel_cache.clear()
+        _project_cache.clear()
+
+
 def get_channel_workspace(channel_id: str) -> Path:
     """Get workspace directory for a specific channel.
 
@@ -148,12 +408,19 @@ def get_channel_workspace(channel_id: str) -> Path:
         /app/workspace/channels/poke1
         >>> assert path.exists()
     """
-    _validate_identifier(channel_id, "channel_id")
-
-    path = WORKSPACE_ROOT / CHANNEL_DIR_NAME / channel_id
-    _verify_path_in_workspace(path)
-
-    path.mkdir(parents=True, exist_ok=True)
+    root = WORKSPACE_ROOT
+    key = (root, channel_id)
+    with _cache_lock:
+        path = _channel_cache.get(key)
+        if path is not None:
+            _channel_cache.move_to_end(key)
+    if path is None:
+        path = _create_channel_workspace(root, channel_id)
+        with _cache_lock:
+            _channel_cache[key] = path
+            _channel_cache.move_to_end(key)
+            while len(_channel_cache) > WORKSPACE_CACHE_SIZE:
+                _channel_cache.popitem(last=False)
     return path
 
 
@@ -180,13 +447,7 @@ def get_project_dir(channel_id: str, project_id: str) -> Path:
         >>> print(path)
         /app/workspace/channels/poke1/projects/vid_abc123
     """
-    _validate_identifier(project_id, "project_id")
-
-    path = get_channel_workspace(channel_id) / PROJECT_DIR_NAME / project_id
-    _verify_path_in_workspace(path)
-
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return get_project_workspace(channel_id, project_id).project_dir
 
 
 def get_asset_dir(channel_id: str, project_id: str) -> Path:
@@ -209,9 +470,7 @@ def get_asset_dir(channel_id: str, project_id: str) -> Path:
         >>> print(path)
         /app/workspace/channels/poke1/projects/vid_abc123/assets
     """
-    path = get_project_dir(channel_id, project_id) / ASSET_DIR_NAME
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return get_project_workspace(channel_id, project_id).asset_dir
 
 
 def get_character_dir(channel_id: str, project_id: str) -> Path:
@@ -234,9 +493,7 @@ def get_character_dir(channel_id: str, project_id: str) -> Path:
         >>> print(path)
         /app/workspace/channels/poke1/projects/vid_abc123/assets/characters
     """
-    path = get_asset_dir(channel_id, project_id) / CHARACTER_DIR_NAME
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return get_project_workspace(channel_id, project_id).character_dir
 
 
 def get_environment_dir(channel_id: str, project_id: str) -> Path:
@@ -259,9 +516,7 @@ def get_environment_dir(channel_id: str, project_id: str) -> Path:
         >>> print(path)
         /app/workspace/channels/poke1/projects/vid_abc123/assets/environments
     """
-    path = get_asset_dir(channel_id, project_id) / ENVIRONMENT_DIR_NAME
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return get_project_workspace(channel_id, project_id).environment_dir
 
 
 def get_props_dir(channel_id: str, project_id: str) -> Path:
@@ -284,9 +539,7 @@ def get_props_dir(channel_id: str, project_id: str) -> Path:
         >>> print(path)
         /app/workspace/channels/poke1/projects/vid_abc123/assets/props
     """
-    path = get_asset_dir(channel_id, project_id) / PROPS_DIR_NAME
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return get_project_workspace(channel_id, project_id).props_dir
 
 
 def get_composite_dir(channel_id: str, project_id: str) -> Path:
@@ -309,9 +562,7 @@ def get_composite_dir(channel_id: str, project_id: str) -> Path:
         >>> print(path)
         /app/workspace/channels/poke1/projects/vid_abc123/assets/composites
     """
-    path = get_asset_dir(channel_id, project_id) / COMPOSITE_DIR_NAME
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return get_project_workspace(channel_id, project_id).composite_dir
 
 
 def get_video_dir(channel_id: str, project_id: str) -> Path:
@@ -334,9 +585,7 @@ def get_video_dir(channel_id: str, project_id: str) -> Path:
         >>> print(path)
         /app/workspace/channels/poke1/projects/vid_abc123/videos
     """
-    path = get_project_dir(channel_id, project_id) / VIDEO_DIR_NAME
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return get_project_workspace(channel_id, project_id).video_dir
 
 
 def get_audio_dir(channel_id: str, project_id: str) -> Path:
@@ -359,9 +608,7 @@ def get_audio_dir(channel_id: str, project_id: str) -> Path:
         >>> print(path)
         /app/workspace/channels/poke1/projects/vid_abc123/audio
     """
-    path = get_project_dir(channel_id, project_id) / AUDIO_DIR_NAME
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return get_project_workspace(channel_id, project_id).audio_dir
 
 
 def get_sfx_dir(channel_id: str, project_id: str) -> Path:
@@ -384,6 +631,4 @@ def get_sfx_dir(channel_id: str, project_id: str) -> Path:
         >>> print(path)
         /app/workspace/channels/poke1/projects/vid_abc123/sfx
     """
-    path = get_project_dir(channel_id, project_id) / SFX_DIR_NAME
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return get_project_workspace(channel_id, project_id).sfx_dir
@@ -6,6 +6,7 @@ Outputs JSON format for production log aggregation (CloudWatch, Datadog, Splunk)
 Configuration:
 - JSON output format (for production log aggregation)
 - Context binding support (correlation IDs, task IDs, etc.)
+- trace_id/span_id of the open trace span (app.utils.tracing), if any
 - Log levels: DEBUG, INFO, WARNING, ERROR, CRITICAL
 """
 
@@ -14,6 +15,8 @@ import logging
 import sys
 from typing import Any
 
+from app.utils.tracing import current_span
+
 
 class StructuredLogger:
     """Wrapper around standard Logger with structured JSON logging support.
@@ -28,6 +31,10 @@ class StructuredLogger:
     def _format_json(self, event: str, **kwargs: Any) -> str:
         """Format log entry as JSON with event and context fields."""
         log_entry = {"event": event, **kwargs}
+        span = current_span()
+        if span is not None:
+            log_entry.setdefault("trace_id", span.trace_id)
+            log_entry.setdefault("span_id", span.span_id)
         return json.dumps(log_entry)
 
     def info(self, event: str, **kwargs: Any) -> None:
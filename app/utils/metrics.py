@@ -0,0 +1,404 @@
+"""In-process Prometheus metrics.
+
+Until now the only observability was JSON log lines and a static /health.
+This module keeps counters, gauges and histograms in process memory and
+renders them in the Prometheus text exposition format (version 0.0.4) when
+scraped: /metrics on the web service, and a minimal HTTP server on
+WORKER_METRICS_PORT in each worker.
+
+Architecture Pattern:
+    - Low overhead: Recording is a dict lookup plus a few additions under an
+      uncontended lock; nothing is formatted, sent or aggregated until a
+      scrape, so an unscraped process pays almost nothing
+    - Scrape hooks: Values that need a query (queue depth per channel) are
+      refreshed by async collectors that run only on scrape
+    - No dependency: The exposition format is small enough to render here;
+      a prometheus_client registry would need its own HTTP server threads
+
+Metrics:
+    - pipeline_step_duration_seconds{step}: StepCompletion.duration_seconds
+    - pipeline_steps_total{step,outcome}: Step outcomes (completed/failed)
+    - external_api_request_duration_seconds{provider}: Kling, Gemini,
+      ElevenLabs (per request slot), Notion and catbox (per HTTP call)
+    - external_api_requests_total{provider,outcome}: Error rate per provider
+    - rate_limiter_wait_seconds{limiter}: Notion 3 req/sec limiter and
+      cluster-wide API slot waits
+    - channel_queue_depth{channel_id}: Pending tasks per channel (on scrape)
+    - db_session_checkout_seconds: Connection pool checkout time
+    - subprocesses_in_flight{script}: Running CLI scripts
+    - event_loop_lag_seconds: Worker event loop lag (app.utils.profiler)
+
+Usage:
+    from app.utils.metrics import EXTERNAL_API_LATENCY, track_api_call
+
+    async with track_api_call("notion"):
+        response = await client.get(...)
+
+References:
+    - https://prometheus.io/docs/instrumenting/exposition_formats/
+    - app/main.py: /metrics endpoint (web service)
+    - app/worker.py: Worker metrics server
+"""
+
+import asyncio
+import bisect
+import math
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+from urllib.parse import parse_qsl
+
+from app.utils.logging import get_logger
+from app.utils.tracing import span
+
+log = get_logger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram buckets (seconds)
+STEP_DURATION_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200)
+API_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+WAIT_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+CHECKOUT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base class: a named metric family with fixed label names."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        try:
+            if len(labels) == len(self.labelnames):
+                return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            pass
+        raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render HELP, TYPE and sample lines."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples(),
+        ]
+        return "\n".join(lines)
+
+
+class _ScalarMetric(_Metric):
+    """Base class: one number per label set."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Add amount."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Current value (0 if never recorded)."""
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Counter(_ScalarMetric):
+    """Monotonically increasing count per label set."""
+
+    type_name = "counter"
+
+
+class Gauge(_ScalarMetric):
+    """Value that can go up and down per label set."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        """Subtract amount."""
+        self.inc(-amount, **labels)
+
+    def replace(self, values: dict[tuple[str, ...], float]) -> None:
+        """Replace every label set at once (drops label sets not in values)."""
+        with self._lock:
+            self._values = dict(values)
+
+
+class Histogram(_Metric):
+    """Bucketed observations per label set (cumulative buckets on render)."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = API_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts (last = +Inf), sum, count]
+        self._values: dict[tuple[str, ...], list[Any]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def count(self, **labels: Any) -> int:
+        """Observations recorded (0 if none)."""
+        entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def sum(self, **labels: Any) -> float:
+        """Sum of observations (0 if none)."""
+        entry = self._values.get(self._key(labels))
+        return entry[1] if entry else 0.0
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, (list(e[0]), e[1], e[2])) for key, e in self._values.items())
+        lines = []
+        bounds = [*self.buckets, math.inf]
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts, strict=True):
+                cumulative += bucket_count
+                labels = _format_labels((*self.labelnames, "le"), (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+_MetricT = TypeVar("_MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Named metrics plus async collectors run on scrape."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Awaitable[None]]] = []
+
+    def register(self, metric: _MetricT) -> _MetricT:
+        """Add a metric (names must be unique) and return it."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], Awaitable[None]]) -> None:
+        """Run collector before each scrape (refreshes gauges that need a query)."""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Render every metric in the text exposition format."""
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+    async def collect(self) -> str:
+        """Run collectors (failures are logged, never fail the scrape) and render."""
+        for collector in self._collectors:
+            try:
+                await collector()
+            except Exception as e:
+                log.warning(
+                    "metrics_collector_failed",
+                    collector=getattr(collector, "__name__", repr(collector)),
+                    error=str(e),
+                )
+        return self.render()
+
+
+# Process-wide registry scraped by /metrics
+REGISTRY = MetricsRegistry()
+
+STEP_DURATION = REGISTRY.register(
+    Histogram(
+        "pipeline_step_duration_seconds",
+        "Duration of completed pipeline steps.",
+        ("step",),
+        STEP_DURATION_BUCKETS,
+    )
+)
+STEP_OUTCOMES = REGISTRY.register(
+    Counter("pipeline_steps_total", "Pipeline step executions by outcome.", ("step", "outcome"))
+)
+EXTERNAL_API_LATENCY = REGISTRY.register(
+    Histogram(
+        "external_api_request_duration_seconds",
+        "External API call latency.",
+        ("provider",),
+        API_LATENCY_BUCKETS,
+    )
+)
+EXTERNAL_API_REQUESTS = REGISTRY.register(
+    Counter(
+        "external_api_requests_total",
+        "External API calls by outcome (success/error).",
+        ("provider", "outcome"),
+    )
+)
+RATE_LIMIT_WAIT = REGISTRY.register(
+    Histogram(
+        "rate_limiter_wait_seconds",
+        "Time spent waiting for a rate limiter or API concurrency slot.",
+        ("limiter",),
+        WAIT_BUCKETS,
+    )
+)
+QUEUE_DEPTH = REGISTRY.register(
+    Gauge("channel_queue_depth", "Pending tasks per channel.", ("channel_id",))
+)
+DB_CHECKOUT = REGISTRY.register(
+    Histogram(
+        "db_session_checkout_seconds",
+        "Time to check a connection out of the database pool.",
+        (),
+        CHECKOUT_BUCKETS,
+    )
+)
+SUBPROCESSES_IN_FLIGHT = REGISTRY.register(
+    Gauge("subprocesses_in_flight", "CLI scripts currently running.", ("script",))
+)
+EVENT_LOOP_LAG = REGISTRY.register(
+    Histogram(
+        "event_loop_lag_seconds",
+        "Delay of the event loop lag monitor's heartbeat past its schedule.",
+        (),
+        WAIT_BUCKETS,
+    )
+)
+
+# Extra worker HTTP routes: (method, path) -> handler(query) -> (status, content_type, body)
+RouteHandler = Callable[[dict[str, str]], Awaitable[tuple[str, str, str]]]
+_ROUTES: dict[tuple[str, str], RouteHandler] = {}
+
+
+def add_route(method: str, path: str, handler: RouteHandler) -> None:
+    """Serve an extra endpoint on the worker metrics server (e.g. /debug/profile)."""
+    _ROUTES[(method.upper(), path)] = handler
+
+
+@asynccontextmanager
+async def track_api_call(provider: str) -> AsyncIterator[None]:
+    """Record latency and outcome of one external API call.
+
+    The call also runs inside an "api.<provider>" trace span.
+
+    Args:
+        provider: API name ("kling", "gemini", "elevenlabs", "notion", "catbox").
+    """
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        with span(f"api.{provider}", provider=provider):
+            yield
+        outcome = "success"
+    finally:
+        EXTERNAL_API_LATENCY.observe(time.perf_counter() - start, provider=provider)
+        EXTERNAL_API_REQUESTS.inc(provider=provider, outcome=outcome)
+
+
+async def _handle_scrape(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Answer one HTTP request: GET /metrics, an added route, anything else 404."""
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+        # Drain headers
+        while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+            pass
+        parts = request_line.decode("latin-1").split()
+        method, target = (parts[0], parts[1]) if len(parts) >= 2 else ("", "")
+        path, _, query = target.partition("?")
+        handler = _ROUTES.get((method, path))
+        if method == "GET" and path == "/metrics":
+            status, content_type, body = "200 OK", CONTENT_TYPE, (await REGISTRY.collect())
+        elif handler is not None:
+            status, content_type, body = await handler(dict(parse_qsl(query)))
+        else:
+            status, content_type, body = "404 Not Found", "text/plain", "not found\n"
+        payload = body.encode()
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode()
+            + payload
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(
+    port: int, host: str = "0.0.0.0"  # noqa: S104 - scraped from other containers
+) -> asyncio.AbstractServer | None:
+    """Serve GET /metrics on port (workers; the web service uses FastAPI).
+
+    Args:
+        port: TCP port (0 disables).
+        host: Bind address.
+
+    Returns:
+        The running server, or None if disabled or the port is unavailable.
+    """
+    if port <= 0:
+        return None
+    try:
+        server = await asyncio.start_server(_handle_scrape, host, port)
+    except OSError as e:
+        log.warning("metrics_server_unavailable", port=port, error=str(e))
+        return None
+    log.info("metrics_server_started", port=port)
+    return server
@@ -0,0 +1,256 @@
+"""On-demand sampling profiler and event loop lag monitor for workers.
+
+When a worker is slow or CPU-bound (PIL compositing, JSON logging, ffprobe
+thread churn) nothing in production showed why. This module adds two
+low-overhead tools:
+
+Sampling Profiler:
+    - Opt-in: With WORKER_PROFILING_ENABLED=true, SIGUSR1 or
+      POST /debug/profile?seconds=N on the worker metrics port samples every
+      thread's stack (event loop and asyncio.to_thread workers) for N seconds
+    - Output: Collapsed stacks ("thread;outer;...;inner count" per line) in
+      {WORKSPACE_ROOT}/profiles/, readable by flamegraph.pl, speedscope and
+      inferno; the HTTP endpoint also returns them
+    - Overhead: A daemon thread reads sys._current_frames() every 10ms; the
+      profiled code is not instrumented, and nothing runs between profiles
+
+Event Loop Lag Monitor:
+    - A heartbeat task measures how late the loop wakes it (exported as
+      event_loop_lag_seconds)
+    - A watchdog thread captures the loop thread's stack while a stall is in
+      progress, so the log names the callback that blocked the loop
+    - Stalls over EVENT_LOOP_LAG_THRESHOLD_MS are logged; the slowest are
+      summarized when the monitor stops
+
+Usage:
+    monitor = EventLoopLagMonitor(threshold_seconds=0.5)
+    lag_task = asyncio.create_task(monitor.run())
+    install_profiling_triggers()
+
+References:
+    - https://github.com/brendangregg/FlameGraph#2-fold-stacks
+    - app/utils/metrics.py: Worker metrics server routes
+    - app/worker.py: Trigger installation
+"""
+
+import asyncio
+import heapq
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+
+from app.config import MAX_PROFILE_DURATION_SECONDS, get_profile_duration_seconds
+from app.utils import filesystem
+from app.utils.logging import get_logger
+from app.utils.metrics import EVENT_LOOP_LAG, add_route
+
+log = get_logger(__name__)
+
+# Seconds between stack samples (~100 Hz)
+PROFILE_SAMPLE_INTERVAL_SECONDS = 0.01
+
+# Seconds between event loop heartbeats
+LAG_CHECK_INTERVAL_SECONDS = 0.1
+
+# Stalls kept for the summary logged when the lag monitor stops
+LAG_SLOWEST_KEPT = 10
+
+# Innermost frames included in a lag log line
+LAG_STACK_FRAMES = 12
+
+PROFILES_DIR_NAME = "profiles"
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)  # co_qualname: Python 3.11+
+    return f"{name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame: FrameType | None) -> list[str]:
+    """Frames of a stack, outermost first."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+class SamplingProfiler:
+    """Count collapsed stacks of every thread at a fixed interval."""
+
+    def __init__(self, interval_seconds: float = PROFILE_SAMPLE_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+
+    def run(self, duration_seconds: float) -> Counter[str]:
+        """Sample for duration_seconds (blocking; run it in a thread).
+
+        Returns:
+            Sample counts keyed by "thread;outer;...;inner".
+        """
+        own = threading.get_ident()
+        counts: Counter[str] = Counter()
+        deadline = time.monotonic() + duration_seconds
+        while time.monotonic() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own:
+                    stack = collapse_stack(frame)
+                    counts[";".join([names.get(thread_id, str(thread_id)), *stack])] += 1
+            time.sleep(self.interval_seconds)
+        return counts
+
+
+def format_collapsed(counts: Counter[str]) -> str:
+    """Render counts in the folded format (one "stack count" line each)."""
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(counts.items()))
+
+
+_active_profile: asyncio.Task[tuple[Path, str]] | None = None
+
+
+async def _profile(duration_seconds: float) -> tuple[Path, str]:
+    log.info("profile_started", duration_seconds=duration_seconds)
+    counts = await asyncio.to_thread(SamplingProfiler().run, duration_seconds)
+    collapsed = format_collapsed(counts)
+    worker_id = os.getenv("RAILWAY_SERVICE_NAME", "worker-local")
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = filesystem.WORKSPACE_ROOT / PROFILES_DIR_NAME / f"{worker_id}-{stamp}.collapsed"
+
+    def write() -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(collapsed)
+
+    await asyncio.to_thread(write)
+    log.info(
+        "profile_written",
+        path=str(path),
+        samples=sum(counts.values()),
+        stacks=len(counts),
+    )
+    return path, collapsed
+
+
+def start_profile(duration_seconds: float | None = None) -> asyncio.Task[tuple[Path, str]]:
+    """Start a profile, or return the one already running.
+
+    Args:
+        duration_seconds: Sampling time (default PROFILE_DURATION_SECONDS).
+
+    Returns:
+        Task resolving to (file path, collapsed stacks).
+    """
+    global _active_profile
+    if _active_profile is None or _active_profile.done():
+        seconds = duration_seconds or get_profile_duration_seconds()
+        _active_profile = asyncio.create_task(_profile(seconds))
+        _active_profile.add_done_callback(_log_profile_failure)
+    return _active_profile
+
+
+def _log_profile_failure(task: asyncio.Task[tuple[Path, str]]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        log.error("profile_failed", error=str(task.exception()))
+
+
+async def _handle_profile_request(query: dict[str, str]) -> tuple[str, str, str]:
+    """POST /debug/profile?seconds=N: profile, then return the collapsed stacks."""
+    try:
+        seconds = float(query.get("seconds", get_profile_duration_seconds()))
+    except ValueError:
+        return "400 Bad Request", "text/plain", "seconds must be a number\n"
+    if not 0 < seconds <= MAX_PROFILE_DURATION_SECONDS:
+        return (
+            "400 Bad Request",
+            "text/plain",
+            f"seconds must be in (0, {MAX_PROFILE_DURATION_SECONDS}]\n",
+        )
+    try:
+        _, collapsed = await start_profile(seconds)
+    except Exception as e:
+        return "500 Internal Server Error", "text/plain", f"profile failed: {e}\n"
+    return "200 OK", "text/plain; charset=utf-8", collapsed
+
+
+def install_profiling_triggers() -> None:
+    """Enable SIGUSR1 and POST /debug/profile (call from the running loop)."""
+    add_route("POST", "/debug/profile", _handle_profile_request)
+    asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, start_profile)
+    log.info("profiling_triggers_installed", signal="SIGUSR1", endpoint="/debug/profile")
+
+
+class EventLoopLagMonitor:
+    """Log event loop stalls with the stack of the callback that caused them."""
+
+    def __init__(
+        self,
+        threshold_seconds: float,
+        interval_seconds: float = LAG_CHECK_INTERVAL_SECONDS,
+    ):
+        self.threshold_seconds = threshold_seconds
+        self.interval_seconds = interval_seconds
+        # (lag_seconds, stack) of the slowest stalls, smallest first (heap)
+        self.slowest: list[tuple[float, list[str]]] = []
+        self._beat = time.monotonic()
+        self._stall: tuple[float, list[str]] | None = None
+        self._loop_thread: int | None = None
+        self._stopped = threading.Event()
+
+    async def run(self) -> None:
+        """Heartbeat until cancelled (run as a background task)."""
+        self._loop_thread = threading.get_ident()
+        self._stopped.clear()
+        watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        watchdog.start()
+        try:
+            while True:
+                self._beat = time.monotonic()
+                await asyncio.sleep(self.interval_seconds)
+                lag = max(0.0, time.monotonic() - self._beat - self.interval_seconds)
+                EVENT_LOOP_LAG.observe(lag)
+                if lag >= self.threshold_seconds:
+                    self._report(lag)
+        finally:
+            self._stopped.set()
+            self._log_summary()
+
+    def _watch(self) -> None:
+        """Capture the loop thread's stack while a stall is in progress."""
+        while not self._stopped.wait(min(self.threshold_seconds / 4, self.interval_seconds)):
+            beat = self._beat
+            stalled = time.monotonic() - beat - self.interval_seconds
+            if stalled >= self.threshold_seconds and (not self._stall or self._stall[0] != beat):
+                frame = sys._current_frames().get(self._loop_thread)  # type: ignore[arg-type]
+                self._stall = (beat, collapse_stack(frame))
+
+    def _report(self, lag: float) -> None:
+        stall = self._stall
+        stack = stall[1] if stall and stall[0] == self._beat else []
+        entry = (lag, stack)
+        if len(self.slowest) < LAG_SLOWEST_KEPT:
+            heapq.heappush(self.slowest, entry)
+        else:
+            heapq.heappushpop(self.slowest, entry)
+        log.warning(
+            "event_loop_lag",
+            lag_ms=round(lag * 1000, 1),
+            threshold_ms=round(self.threshold_seconds * 1000, 1),
+            stack=stack[-LAG_STACK_FRAMES:],
+        )
+
+    def _log_summary(self) -> None:
+        if self.slowest:
+            log.info(
+                "event_loop_lag_summary",
+                slowest=[
+                    {"lag_ms": round(lag * 1000, 1), "callback": stack[-1] if stack else None}
+                    for lag, stack in sorted(self.slowest, reverse=True)
+                ],
+            )
@@ -0,0 +1,356 @@
+"""Warm runner pool for CLI scripts (parent side).
+
+Every run_cli_script call used to start a fresh interpreter, import heavy
+libraries (google.generativeai, PIL, requests, dotenv) and re-read
+scripts/.env - 80+ times per video. The pool keeps long-lived runner
+processes (app/utils/script_runner.py) that import the pooled scripts once
+and execute main() per request with isolated argv/env.
+
+Architecture Pattern:
+    - Runners start on demand up to CLI_SCRIPT_POOL_SIZE per event loop and
+      are reused; requests beyond the pool size run as one-off subprocesses
+    - Requests and responses are JSON lines: stdin for requests, a dedicated
+      pipe for responses (script and ffmpeg output can't corrupt the protocol)
+    - Crash isolation: each runner has its own process group; a crash,
+      timeout or cancellation kills only that runner, which is replaced
+    - Recycling: a runner is retired after CLI_SCRIPT_POOL_MAX_JOBS jobs to
+      bound memory growth and module-level state carried between jobs
+    - Runners exit on stdin EOF, so they never outlive the worker
+
+Output Handling:
+    Runner jobs capture print() output per job and return the last
+    OUTPUT_TAIL_LINES lines; these are logged line by line when the job
+    completes (one-off subprocesses stream while running).
+
+References:
+    - app/utils/cli_wrapper.py: run_cli_script (falls back to subprocesses)
+    - app/config.py: get_script_pool_size, get_script_pool_max_jobs
+"""
+
+import asyncio
+import json
+import os
+import weakref
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from app.config import get_script_pool_max_jobs, get_script_pool_size
+from app.utils.cli_wrapper import (
+    OUTPUT_TAIL_LINES,
+    STREAM_LIMIT_BYTES,
+    CLIScriptError,
+    ProcessUsage,
+    ScriptRun,
+    _kill_process_group,
+    _pump_stream,
+)
+from app.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+RUNNER_PATH = Path(__file__).with_name("script_runner.py")
+
+# Scripts with a main() entry point that are safe to run repeatedly in one process
+POOLED_SCRIPTS = frozenset(
+    {
+        "generate_asset.py",
+        "create_composite.py",
+        "generate_video.py",
+        "generate_audio.py",
+        "generate_sound_effects.py",
+        "assemble_video.py",
+    }
+)
+
+# Seconds a retiring runner gets to exit after stdin closes before it is killed
+RUNNER_EXIT_GRACE_SECONDS = 5
+
+
+class _Runner:
+    """One warm runner process and its response pipe."""
+
+    def __init__(
+        self,
+        process: asyncio.subprocess.Process,
+        responses: asyncio.StreamReader,
+        transport: asyncio.ReadTransport,
+    ) -> None:
+        self.process = process
+        self.responses = responses
+        self.transport = transport
+        self.jobs = 0
+        self.output_tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        assert process.stdout is not None and process.stderr is not None
+        self._drains = [
+            asyncio.create_task(_pump_stream(stream, "script_runner", name, self.output_tail))
+            for stream, name in ((process.stdout, "stdout"), (process.stderr, "stderr"))
+        ]
+
+    @classmethod
+    async def start(cls, preload: list[str]) -> "_Runner":
+        """Start a runner that preloads the given script files."""
+        read_fd, write_fd = os.pipe()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "python",
+                str(RUNNER_PATH),
+                str(write_fd),
+                *preload,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                pass_fds=(write_fd,),
+                start_new_session=True,
+                limit=STREAM_LIMIT_BYTES,
+            )
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+
+        responses = asyncio.StreamReader(limit=STREAM_LIMIT_BYTES)
+        transport, _ = await asyncio.get_running_loop().connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(responses),
+            os.fdopen(read_fd, "rb", buffering=0),
+        )
+        runner = cls(process, responses, transport)
+        # Wait until imports are done so the first job is already warm
+        if not await responses.readline():
+            runner.kill()
+            await process.wait()
+            raise ConnectionError("script runner exited during startup")
+        log.info("script_runner_started", pid=process.pid, preloaded=len(preload))
+        return runner
+
+    async def request(
+        self, script_path: Path, args: list[str], env: dict[str, str] | None
+    ) -> dict[str, Any]:
+        """Send one job and wait for its response.
+
+        Raises:
+            ConnectionError: If the runner died before responding
+        """
+        assert self.process.stdin is not None
+        payload = {
+            "script": str(script_path),
+            "args": args,
+            "env": env,
+            "tail_lines": OUTPUT_TAIL_LINES,
+        }
+        self.process.stdin.write((json.dumps(payload) + "\n").encode())
+        await self.process.stdin.drain()
+        line = await self.responses.readline()
+        if not line:
+            raise ConnectionError("script runner exited before responding")
+        self.jobs += 1
+        response: dict[str, Any] = json.loads(line)
+        return response
+
+    def kill(self) -> None:
+        """Kill the runner's process group immediately."""
+        _kill_process_group(self.process)
+        self.transport.close()
+
+    async def close(self) -> None:
+        """Let the runner exit (stdin EOF), killing it if it does not."""
+        if self.process.stdin is not None:
+            self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=RUNNER_EXIT_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            self.kill()
+            await self.process.wait()
+        self.transport.close()
+        await asyncio.gather(*self._drains, return_exceptions=True)
+
+
+class ScriptPool:
+    """Pool of warm script runners bound to one event loop.
+
+    Attributes:
+        size: Maximum runner processes.
+        max_jobs: Jobs per runner before it is recycled.
+        pooled_scripts: Script names served by the pool.
+
+    Example:
+        >>> pool = ScriptPool(size=4, max_jobs=50)
+        >>> run = await pool.run("create_composite.py", script_path, args, None, 60)
+        >>> if run is None:
+        ...     pass  # Pool saturated: run as a one-off subprocess
+    """
+
+    def __init__(
+        self,
+        size: int,
+        max_jobs: int,
+        pooled_scripts: frozenset[str] = POOLED_SCRIPTS,
+        scripts_dir: Path = Path("scripts"),
+    ) -> None:
+        self.size = size
+        self.max_jobs = max_jobs
+        self.pooled_scripts = pooled_scripts
+        self._preload = sorted(
+            str((scripts_dir / name).resolve())
+            for name in pooled_scripts
+            if (scripts_dir / name).exists()
+        )
+        self._idle: list[_Runner] = []
+        self._active = 0  # Runners checked out or starting
+        self._retiring: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> None:
+        """Pre-start every runner so the first jobs are already warm."""
+        missing = self.size - self._active - len(self._idle)
+        if missing <= 0:
+            return
+        self._active += missing
+        try:
+            runners = await asyncio.gather(
+                *(_Runner.start(self._preload) for _ in range(missing)),
+                return_exceptions=True,
+            )
+        finally:
+            self._active -= missing
+        for runner in runners:
+            if isinstance(runner, _Runner):
+                self._idle.append(runner)
+            else:
+                log.warning("script_runner_start_failed", error=str(runner))
+
+    async def _checkout(self) -> _Runner | None:
+        """Take an idle runner, start one if below size, or None if saturated."""
+        while self._idle:
+            runner = self._idle.pop()
+            if runner.process.returncode is None:
+                self._active += 1
+                return runner
+            # Died while idle: reap it and close its pipes
+            runner.kill()
+            await runner.close()
+        if self._active + len(self._idle) >= self.size:
+            return None
+
+        self._active += 1
+        try:
+            return await _Runner.start(self._preload)
+        except Exception as e:
+            self._active -= 1
+            log.warning("script_runner_start_failed", error=str(e))
+            return None
+
+    def _checkin(self, runner: _Runner) -> None:
+        self._active -= 1
+        if runner.jobs >= self.max_jobs:
+            log.info("script_runner_recycled", pid=runner.process.pid, jobs=runner.jobs)
+            task = asyncio.create_task(runner.close())
+            self._retiring.add(task)
+            task.add_done_callback(self._retiring.discard)
+        else:
+            self._idle.append(runner)
+
+    def _discard(self, runner: _Runner) -> None:
+        self._active -= 1
+        runner.kill()
+
+    async def run(
+        self,
+        script: str,
+        script_path: Path,
+        args: list[str],
+        env: dict[str, str] | None,
+        timeout: float,
+    ) -> ScriptRun | None:
+        """Execute a pooled script in a warm runner.
+
+        Args:
+            script: Script name (e.g., "generate_asset.py")
+            script_path: Validated absolute script path
+            args: Command-line arguments (sys.argv[1:] for main())
+            env: Environment overrides for this job only
+            timeout: Timeout in seconds
+
+        Returns:
+            ScriptRun, or None if the script is not pooled or every runner
+            is busy (caller runs a one-off subprocess).
+
+        Raises:
+            asyncio.TimeoutError: If the job exceeds timeout (runner killed)
+            CLIScriptError: If the runner crashed during the job
+        """
+        if script not in self.pooled_scripts:
+            return None
+        runner = await self._checkout()
+        if runner is None:
+            return None
+
+        try:
+            response = await asyncio.wait_for(runner.request(script_path, args, env), timeout)
+        except ConnectionError:
+            self._discard(runner)
+            returncode = await runner.process.wait()
+            log.error("script_runner_crashed", script=script, exit_code=returncode)
+            raise CLIScriptError(
+                script,
+                returncode,
+                "script runner crashed:\n" + "\n".join(runner.output_tail),
+            ) from None
+        except BaseException:
+            # Timeout or cancellation: the job's state is unknown, kill the runner
+            self._discard(runner)
+            await runner.process.wait()
+            raise
+
+        self._checkin(runner)
+        for stream in ("stdout", "stderr"):
+            for line in response[stream].splitlines():
+                log.debug("cli_script_output", script=script, stream=stream, line=line, pooled=True)
+        return ScriptRun(
+            returncode=response["returncode"],
+            stdout=response["stdout"],
+            stderr=response["stderr"],
+            usage=ProcessUsage(
+                cpu_seconds=response["cpu_seconds"],
+                runner_peak_rss_bytes=response["runner_peak_rss_bytes"],
+            ),
+            pooled=True,
+        )
+
+    async def close(self) -> None:
+        """Retire all idle runners and wait for retiring ones."""
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(runner.close() for runner in idle), *self._retiring)
+
+
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ScriptPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_script_pool() -> ScriptPool | None:
+    """Return the running event loop's script pool (None if disabled)."""
+    size = get_script_pool_size()
+    if size == 0:
+        return None
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = ScriptPool(size, get_script_pool_max_jobs())
+    return pool
+
+
+async def run_pooled(
+    script: str,
+    script_path: Path,
+    args: list[str],
+    env: dict[str, str] | None,
+    timeout: float,
+) -> ScriptRun | None:
+    """Run a script in the warm pool if possible (see ScriptPool.run)."""
+    if script not in POOLED_SCRIPTS:
+        return None
+    pool = get_script_pool()
+    if pool is None:
+        return None
+    return await pool.run(script, script_path, args, env, timeout)
@@ -0,0 +1,173 @@
+"""Warm CLI script runner process (child side of app.utils.script_pool).
+
+Each runner imports the CLI script modules once, then executes their main()
+for every request with the request's argv and environment, so a job pays
+neither interpreter startup nor heavy imports (google.generativeai, PIL,
+requests, dotenv).
+
+Launched as a file, not as a module (importing the app package would pull in
+SQLAlchemy and the database engine), so this module is stdlib-only:
+
+    python app/utils/script_runner.py <response_fd> [script_path ...]
+
+Protocol (one JSON object per line):
+    response_fd   -> {"ready": true} once scripts are preloaded
+    stdin         <- {"script": path, "args": [...], "env": {...} | null, "tail_lines": 200}
+    response_fd   -> {"returncode": 0, "stdout": "...", "stderr": "...",
+                      "cpu_seconds": 1.2, "runner_peak_rss_bytes": 123456}
+
+Job Isolation:
+    - sys.argv and os.environ are set per job and restored afterwards
+    - A job with env overrides re-executes its script module, so settings
+      the script reads at import time see the job's environment
+    - print() output is captured per job into a ring buffer of the last
+      tail_lines lines (memory stays bounded for chatty scripts); fd-level
+      output (ffmpeg children) goes to the runner's own stdout/stderr, which
+      the pool drains to logs
+    - Peak RSS is the runner's lifetime high-water mark (ru_maxrss), not a
+      per-job figure, and is reported as runner_peak_rss_bytes
+    - SystemExit is translated into the job's return code
+    - A crash takes down only this runner; the pool replaces it
+"""
+
+import sys
+
+# Running as a file puts app/utils on sys.path, where logging.py would shadow
+# the stdlib module; scripts get their own directory instead (see _load)
+sys.path.pop(0)
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import resource
+import traceback
+from collections import deque
+from types import ModuleType
+from typing import Any
+
+_modules: dict[str, ModuleType] = {}
+
+# Longest unterminated line kept (progress output without newlines)
+_MAX_PARTIAL_LINE_CHARS = 10_000
+
+
+def _exec(path: str) -> ModuleType:
+    """Execute a script file as a fresh module (its __main__ guard does not fire)."""
+    script_dir = os.path.dirname(path)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)  # Same as `python scripts/x.py`
+    name = "_pooled_" + os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load script: {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load(path: str) -> ModuleType:
+    """Import a script file once."""
+    module = _modules.get(path)
+    if module is None:
+        module = _modules[path] = _exec(path)
+    return module
+
+
+def _cpu_seconds() -> float:
+    """CPU time of this runner plus its reaped children (ffmpeg)."""
+    total = 0.0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        total += usage.ru_utime + usage.ru_stime
+    return total
+
+
+class _TailBuffer(io.TextIOBase):
+    """Write-only text stream that keeps only the last `lines` lines."""
+
+    def __init__(self, lines: int) -> None:
+        self._lines: deque[str] = deque(maxlen=lines)
+        self._partial = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        *complete, partial = (self._partial + text).split("\n")
+        self._lines.extend(complete)
+        self._partial = partial[-_MAX_PARTIAL_LINE_CHARS:]
+        return len(text)
+
+    def getvalue(self) -> str:
+        lines = [*self._lines, self._partial] if self._partial else list(self._lines)
+        return "\n".join(lines[-(self._lines.maxlen or 0) :])
+
+
+def _run(request: dict[str, Any], baseline_env: dict[str, str]) -> dict[str, Any]:
+    """Execute one script main() and return the response payload."""
+    path = request["script"]
+    tail_lines = int(request.get("tail_lines", 200))
+    stdout, stderr = _TailBuffer(tail_lines), _TailBuffer(tail_lines)
+    cpu_before = _cpu_seconds()
+    returncode = 0
+
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            module = _load(path)
+            # Keep variables the import added (load_dotenv) for later jobs
+            baseline_env.update({k: v for k, v in os.environ.items() if k not in baseline_env})
+            if request.get("env"):
+                os.environ.update(request["env"])
+                # Scripts read settings such as API base URLs at import time;
+                # re-execute the module under this job's environment (its
+                # heavy dependencies are already imported, so this is cheap)
+                module = _exec(path)
+            sys.argv = [path, *request["args"]]
+            module.main()
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                returncode = e.code or 0
+            else:
+                sys.stderr.write(f"{e.code}\n")
+                returncode = 1
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+        finally:
+            os.environ.clear()
+            os.environ.update(baseline_env)
+
+    return {
+        "returncode": returncode,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "cpu_seconds": round(_cpu_seconds() - cpu_before, 3),
+        # ru_maxrss is in kilobytes on Linux (runner lifetime peak)
+        "runner_peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+    }
+
+
+def main() -> None:
+    """Preload scripts, then serve requests until stdin closes."""
+    response = os.fdopen(int(sys.argv[1]), "w", buffering=1)
+
+    for path in sys.argv[2:]:
+        try:
+            _load(path)
+        except Exception:
+            # Reported per job when the script is actually requested
+            traceback.print_exc()
+
+    baseline_env = dict(os.environ)
+    response.write(json.dumps({"ready": True}) + "\n")
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        response.write(json.dumps(_run(json.loads(line), baseline_env)) + "\n")
+        response.flush()
+
+
+if __name__ == "__main__":
+    main()
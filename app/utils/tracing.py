@@ -0,0 +1,434 @@
+"""Trace spans for pipeline, step, clip, API call and CLI script.
+
+A single video involves ~100 external calls across six services and many
+subprocesses, correlated until now only by ad-hoc correlation_id log fields.
+This module records nested spans (W3C trace context ids) so the critical
+path of each video - and where its time is lost - can be seen in a trace
+viewer.
+
+Span Hierarchy:
+    pipeline                      PipelineOrchestrator.execute_pipeline
+    └── pipeline.step             PipelineOrchestrator.execute_step
+        └── clip.<kind>           Per-clip/per-asset generation in services
+            ├── api.<provider>    api_slots.slot / Notion / catbox requests
+            └── cli_script        run_cli_script (TRACEPARENT set in script env)
+
+Architecture Pattern:
+    - Context propagation: The current span lives in a ContextVar, so spans
+      opened in asyncio tasks (clips run concurrently) parent correctly
+    - Cross-process: run_cli_script passes the W3C `traceparent` of its span
+      to the script as TRACEPARENT, and any process that uses this module
+      and is started with TRACEPARENT parents its root spans to it. Only
+      this hand-off is implemented: the scripts in scripts/ do not read
+      TRACEPARENT or emit spans, so a script's time shows up as its
+      cli_script span with no children. scripts/ is a brownfield boundary
+      (project-context.md: never modify scripts/), and the script runner is
+      stdlib-only, so per-request spans inside scripts are out of scope
+    - Off the hot path: Finished spans go to an in-memory buffer that a
+      daemon thread exports in batches; nothing blocks the event loop
+    - Disabled by default: Without TRACE_EXPORT_FILE or an OTLP endpoint,
+      spans still carry ids (used as correlation_id in logs) but are not
+      buffered or exported, and no TRACEPARENT is added to script env
+    - No SDK dependency: Spans are written as JSON lines or posted as
+      OTLP/HTTP JSON with httpx, which any OpenTelemetry collector accepts
+
+Usage:
+    from app.utils.tracing import span, traced
+
+    with span("clip.video", clip_number=3) as clip_span:
+        ...
+        clip_span.set_attribute("catbox_url", url)
+
+    @traced("pipeline.step", lambda self, step, *a, **k: {"step": step.value})
+    async def execute_step(self, step, ...): ...
+
+References:
+    - https://www.w3.org/TR/trace-context/
+    - https://opentelemetry.io/docs/specs/otlp/#otlphttp
+    - app/config.py: get_trace_export_file, get_otlp_traces_endpoint
+"""
+
+import functools
+import json
+import os
+import re
+import secrets
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, ParamSpec, TypeVar
+
+import httpx
+
+from app.config import (
+    get_otlp_headers,
+    get_otlp_traces_endpoint,
+    get_trace_export_file,
+    get_trace_service_name,
+)
+
+# Environment variable carrying the parent span into CLI scripts
+TRACEPARENT_ENV = "TRACEPARENT"
+
+# Seconds between background exports
+TRACE_EXPORT_INTERVAL_SECONDS = 5.0
+
+# Finished spans buffered before new ones are dropped (exporter down)
+TRACE_MAX_QUEUED_SPANS = 10_000
+
+# Spans per export request
+TRACE_EXPORT_BATCH_SIZE = 512
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+_current_span: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    error: str | None = None
+
+    @property
+    def traceparent(self) -> str:
+        """W3C traceparent header value naming this span as parent."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @property
+    def duration_seconds(self) -> float | None:
+        """Elapsed seconds (None while the span is open)."""
+        return None if self.end_ns is None else (self.end_ns - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a value (str, int, float or bool) to the span."""
+        self.attributes[key] = value
+
+    def record_error(self, message: str) -> None:
+        """Mark the span failed without an exception passing through it."""
+        self.error = message
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form (file exporter)."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_seconds": self.duration_seconds,
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str] | None:
+    """Parse a W3C traceparent value into (trace_id, parent span_id).
+
+    Returns:
+        The ids, or None if value is missing or malformed.
+    """
+    match = _TRACEPARENT_RE.match((value or "").strip().lower())
+    if not match or set(match[1]) == {"0"} or set(match[2]) == {"0"}:
+        return None
+    return match[1], match[2]
+
+
+def current_span() -> Span | None:
+    """Span open in the current context, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Open a span as a child of the current one.
+
+    Root spans continue the trace named by TRACEPARENT in the environment
+    (set when this process is a CLI script started by a worker) or start a
+    new trace. An exception leaving the block marks the span failed.
+
+    Args:
+        name: Operation name (e.g. "pipeline.step").
+        **attributes: Initial span attributes.
+
+    Yields:
+        The open Span.
+    """
+    parent = _current_span.get()
+    parent_id: str | None
+    if parent is not None:
+        trace_id, parent_id = parent.trace_id, parent.span_id
+    else:
+        remote = parse_traceparent(os.environ.get(TRACEPARENT_ENV))
+        trace_id, parent_id = remote or (secrets.token_hex(16), None)
+
+    opened = Span(name, trace_id, secrets.token_hex(8), parent_id, attributes)
+    token = _current_span.set(opened)
+    try:
+        yield opened
+    except BaseException as e:
+        opened.record_error(f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        _current_span.reset(token)
+        opened.end_ns = time.time_ns()
+        processor = _get_processor()
+        if processor is not None:
+            processor.on_end(opened)
+
+
+def traced(
+    name: str, attributes: Callable[..., dict[str, Any]] | None = None
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Run an async function inside a span.
+
+    Args:
+        name: Span name.
+        attributes: Optional function of the call's arguments returning
+            initial span attributes.
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            initial = attributes(*args, **kwargs) if attributes else {}
+            with span(name, **initial):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def inject_trace_context(env: dict[str, str] | None) -> dict[str, str] | None:
+    """Add TRACEPARENT for the current span to a subprocess env override.
+
+    Returns env unchanged when no span is open or tracing is disabled, so
+    callers that pass None keep inheriting the parent environment as-is.
+    """
+    opened = _current_span.get()
+    if opened is None or _get_processor() is None:
+        return env
+    return {**(env or {}), TRACEPARENT_ENV: opened.traceparent}
+
+
+class JsonFileExporter:
+    """Append finished spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, spans: list[Span]) -> None:
+        """Append spans to the file (one JSON object per line)."""
+        lines = "".join(json.dumps(s.to_dict(), default=str) + "\n" for s in spans)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def close(self) -> None:
+        """Nothing to release (the file is opened per export)."""
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+class OtlpHttpExporter:
+    """POST finished spans to an OpenTelemetry collector (OTLP/HTTP JSON)."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str,
+        headers: dict[str, str] | None = None,
+        timeout: float = 10.0,
+    ):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self._client = httpx.Client(timeout=timeout, headers=headers or {})
+
+    def payload(self, spans: list[Span]) -> dict[str, Any]:
+        """Build an ExportTraceServiceRequest in OTLP JSON encoding."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes({"service.name": self.service_name})
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [
+                                {
+                                    "traceId": s.trace_id,
+                                    "spanId": s.span_id,
+                                    "parentSpanId": s.parent_id or "",
+                                    "name": s.name,
+                                    "kind": 1,  # SPAN_KIND_INTERNAL
+                                    "startTimeUnixNano": str(s.start_ns),
+                                    "endTimeUnixNano": str(s.end_ns),
+                                    "attributes": _otlp_attributes(s.attributes),
+                                    "status": (
+                                        {"code": 2, "message": s.error} if s.error else {"code": 1}
+                                    ),
+                                }
+                                for s in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self, spans: list[Span]) -> None:
+        """POST spans to the collector; raises httpx.HTTPStatusError on rejection."""
+        response = self._client.post(self.endpoint, json=self.payload(spans))
+        response.raise_for_status()
+
+    def close(self) -> None:
+        """Close the HTTP client."""
+        self._client.close()
+
+
+class SpanProcessor:
+    """Buffer finished spans and export them in batches from a daemon thread."""
+
+    def __init__(
+        self,
+        exporters: list[Any],
+        interval_seconds: float = TRACE_EXPORT_INTERVAL_SECONDS,
+        max_queued: int = TRACE_MAX_QUEUED_SPANS,
+    ):
+        self.exporters = exporters
+        self.interval_seconds = interval_seconds
+        self.max_queued = max_queued
+        self.dropped = 0
+        self._queue: list[Span] = []
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def on_end(self, finished: Span) -> None:
+        """Queue a finished span (dropped if the buffer is full)."""
+        with self._condition:
+            if len(self._queue) >= self.max_queued:
+                self.dropped += 1
+                return
+            self._queue.append(finished)
+            if len(self._queue) >= TRACE_EXPORT_BATCH_SIZE:
+                self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._stopped and len(self._queue) < TRACE_EXPORT_BATCH_SIZE:
+                    self._condition.wait(self.interval_seconds)
+                stopped = self._stopped
+            self.flush()
+            if stopped:
+                return
+
+    def flush(self) -> None:
+        """Export everything queued so far."""
+        with self._condition:
+            pending, self._queue = self._queue, []
+        for start in range(0, len(pending), TRACE_EXPORT_BATCH_SIZE):
+            batch = pending[start : start + TRACE_EXPORT_BATCH_SIZE]
+            for exporter in self.exporters:
+                try:
+                    exporter.export(batch)
+                except Exception as e:
+                    # Tracing must never break the pipeline; spans are lost
+                    from app.utils.logging import get_logger
+
+                    get_logger(__name__).warning(
+                        "trace_export_failed",
+                        exporter=type(exporter).__name__,
+                        spans=len(batch),
+                        error=str(e),
+                    )
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Stop the export thread after a final flush."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._thread.join(timeout)
+        for exporter in self.exporters:
+            exporter.close()
+
+
+_processor: SpanProcessor | None = None
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def configure_tracing(exporters: list[Any] | None = None) -> SpanProcessor | None:
+    """Set up span export, replacing any previous configuration.
+
+    Args:
+        exporters: Exporters to use; None builds them from the environment
+            (TRACE_EXPORT_FILE, OTEL_EXPORTER_OTLP_[TRACES_]ENDPOINT). An
+            empty list disables export.
+
+    Returns:
+        The active SpanProcessor, or None if tracing is disabled.
+    """
+    global _processor, _configured
+    with _configure_lock:
+        if _processor is not None:
+            _processor.shutdown()
+        if exporters is None:
+            exporters = []
+            export_file = get_trace_export_file()
+            if export_file:
+                exporters.append(JsonFileExporter(export_file))
+            endpoint = get_otlp_traces_endpoint()
+            if endpoint:
+                exporters.append(
+                    OtlpHttpExporter(endpoint, get_trace_service_name(), get_otlp_headers())
+                )
+        _processor = SpanProcessor(exporters) if exporters else None
+        _configured = True
+        return _processor
+
+
+def _get_processor() -> SpanProcessor | None:
+    if not _configured:
+        configure_tracing()
+    return _processor
+
+
+def shutdown_tracing() -> None:
+    """Flush and stop span export (worker shutdown)."""
+    global _processor, _configured
+    with _configure_lock:
+        if _processor is not None:
+            _processor.shutdown()
+        _processor = None
+        _configured = False
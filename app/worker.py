@@ -29,13 +29,22 @@ import os
 import signal
 import sys
 from dataclasses import dataclass
-from datetime import datetime
 
 import asyncpg
 
-from app.config import get_database_url, get_fernet_key
+from app.config import (
+    get_database_url,
+    get_event_loop_lag_threshold_ms,
+    get_fernet_key,
+    get_worker_metrics_port,
+    get_worker_profiling_enabled,
+)
 from app.database import async_engine
+from app.services.side_effects import get_side_effect_queue
 from app.utils.logging import get_logger
+from app.utils.metrics import REGISTRY, start_metrics_server
+from app.utils.profiler import EventLoopLagMonitor, install_profiling_triggers
+from app.utils.tracing import shutdown_tracing
 
 # Initialize structured logger
 log = get_logger(__name__)
@@ -47,267 +56,6 @@ shutdown_requested = False
 asyncpg_pool: asyncpg.Pool | None = None
 
 
-class WorkerState:
-    """Worker-local state for rate limit and concurrency tracking (Stories 4.5, 4.6).
-
-    Each worker maintains its own in-memory state for API rate limits and
-    per-stage parallelism control. This state is NOT shared between workers
-    (intentionally worker-local).
-
-    Rate Limit Tracking (Story 4.5):
-        gemini_quota_exhausted: Flag indicating Gemini API quota hit 429.
-            Set to True on first 429, prevents claiming asset generation tasks.
-            Reset to False after midnight PST automatic check.
-
-        gemini_quota_reset_time: Datetime when Gemini quota resets (midnight PST).
-            Set when marking quota exhausted, checked for auto-reset.
-
-    Concurrency Tracking (Story 4.6):
-        active_asset_tasks: Count of currently processing asset generation tasks.
-            Incremented when claiming asset task, decremented on completion/error.
-
-        active_video_tasks: Count of currently processing video generation tasks.
-            Incremented when claiming video task, decremented on completion/error.
-
-        active_audio_tasks: Count of currently processing audio generation tasks.
-            Incremented when claiming audio task, decremented on completion/error.
-
-        max_concurrent_asset_gen: Maximum parallel asset tasks per worker.
-            Default: 12 (Gemini, no published concurrency limit)
-
-        max_concurrent_video_gen: Maximum parallel video tasks per worker.
-            Default: 3 (Kling API has 10 concurrent request global limit)
-
-        max_concurrent_audio_gen: Maximum parallel audio tasks per worker.
-            Default: 6 (ElevenLabs, no published concurrency limit)
-
-    Note:
-        YouTube quota is tracked in database (YouTubeQuotaUsage table).
-        Gemini/Kling/ElevenLabs limits are worker-local (transient API limits).
-    """
-
-    def __init__(self):
-        """Initialize worker state with rate limit and concurrency tracking."""
-        from app.config import (
-            get_max_concurrent_asset_gen,
-            get_max_concurrent_audio_gen,
-            get_max_concurrent_video_gen,
-        )
-
-        # Rate limit tracking (Story 4.5)
-        self.gemini_quota_exhausted: bool = False
-        self.gemini_quota_reset_time: datetime | None = None
-
-        # Concurrency counters (Story 4.6)
-        self.active_asset_tasks: int = 0
-        self.active_video_tasks: int = 0
-        self.active_audio_tasks: int = 0
-
-        # Concurrency limits from config (Story 4.6)
-        self.max_concurrent_asset_gen: int = get_max_concurrent_asset_gen()
-        self.max_concurrent_video_gen: int = get_max_concurrent_video_gen()
-        self.max_concurrent_audio_gen: int = get_max_concurrent_audio_gen()
-
-        # Legacy support: max_concurrent_video for backward compatibility
-        self.max_concurrent_video: int = self.max_concurrent_video_gen
-
-    def mark_gemini_quota_exhausted(self) -> None:
-        """Mark Gemini quota as exhausted (resets at midnight PST).
-
-        Sets quota exhausted flag and calculates reset time (next midnight PST).
-        Workers will skip asset generation tasks until reset time passes.
-        """
-        from datetime import datetime, timedelta, timezone
-
-        self.gemini_quota_exhausted = True
-
-        # Calculate next midnight PST (UTC-8 or UTC-7 depending on DST)
-        # For simplicity, use UTC midnight as approximation (8 hours ahead of PST)
-        tomorrow = datetime.now(timezone.utc).date() + timedelta(days=1)
-        self.gemini_quota_reset_time = datetime.combine(
-            tomorrow,
-            datetime.min.time()
-        ).replace(tzinfo=timezone.utc)
-
-        log.warning(
-            "gemini_quota_marked_exhausted",
-            reset_time=self.gemini_quota_reset_time.isoformat()
-        )
-
-    def check_gemini_quota_available(self) -> bool:
-        """Check if Gemini quota has reset.
-
-        Auto-resets quota exhausted flag if past reset time.
-
-        Returns:
-            True if quota available, False if exhausted.
-        """
-        from datetime import datetime, timezone
-
-        if not self.gemini_quota_exhausted:
-            return True
-
-        # Check if past reset time
-        if self.gemini_quota_reset_time and datetime.now(timezone.utc) >= self.gemini_quota_reset_time:
-            self.gemini_quota_exhausted = False
-            self.gemini_quota_reset_time = None
-            log.info("gemini_quota_auto_reset")
-            return True
-
-        return False
-
-    def can_claim_video_task(self) -> bool:
-        """Check if worker can claim another video generation task.
-
-        Returns:
-            True if under concurrency limit, False if at max.
-        """
-        return self.active_video_tasks < self.max_concurrent_video
-
-    def increment_video_tasks(self) -> None:
-        """Increment active video task counter.
-
-        Called when claiming a video generation task.
-        """
-        self.active_video_tasks += 1
-        log.debug(
-            "video_tasks_incremented",
-            active_tasks=self.active_video_tasks,
-            max_concurrent=self.max_concurrent_video
-        )
-
-    def decrement_video_tasks(self) -> None:
-        """Decrement active video task counter.
-
-        Called when video generation task completes or fails.
-        Prevents counter from going negative.
-        """
-        self.active_video_tasks = max(0, self.active_video_tasks - 1)
-        log.debug(
-            "video_tasks_decremented",
-            active_tasks=self.active_video_tasks,
-            max_concurrent=self.max_concurrent_video
-        )
-
-    def can_claim_asset_task(self) -> bool:
-        """Check if worker can claim another asset generation task.
-
-        Returns:
-            True if under concurrency limit, False if at max.
-
-        Story: 4.6 - Parallel Task Execution (AC1)
-        """
-        return self.active_asset_tasks < self.max_concurrent_asset_gen
-
-    def increment_asset_tasks(self) -> None:
-        """Increment active asset task counter.
-
-        Called when claiming an asset generation task.
-
-        Story: 4.6 - Parallel Task Execution (AC1)
-        """
-        self.active_asset_tasks += 1
-        log.debug(
-            "asset_tasks_incremented",
-            active_tasks=self.active_asset_tasks,
-            max_concurrent=self.max_concurrent_asset_gen
-        )
-
-    def decrement_asset_tasks(self) -> None:
-        """Decrement active asset task counter.
-
-        Called when asset generation task completes or fails.
-        Prevents counter from going negative.
-
-        Story: 4.6 - Parallel Task Execution (AC1)
-        """
-        self.active_asset_tasks = max(0, self.active_asset_tasks - 1)
-        log.debug(
-            "asset_tasks_decremented",
-            active_tasks=self.active_asset_tasks,
-            max_concurrent=self.max_concurrent_asset_gen
-        )
-
-    def can_claim_audio_task(self) -> bool:
-        """Check if worker can claim another audio generation task.
-
-        Returns:
-            True if under concurrency limit, False if at max.
-
-        Story: 4.6 - Parallel Task Execution (AC2)
-        """
-        return self.active_audio_tasks < self.max_concurrent_audio_gen
-
-    def increment_audio_tasks(self) -> None:
-        """Increment active audio task counter.
-
-        Called when claiming an audio generation task.
-
-        Story: 4.6 - Parallel Task Execution (AC2)
-        """
-        self.active_audio_tasks += 1
-        log.debug(
-            "audio_tasks_incremented",
-            active_tasks=self.active_audio_tasks,
-            max_concurrent=self.max_concurrent_audio_gen
-        )
-
-    def decrement_audio_tasks(self) -> None:
-        """Decrement active audio task counter.
-
-        Called when audio generation task completes or fails.
-        Prevents counter from going negative.
-
-        Story: 4.6 - Parallel Task Execution (AC2)
-        """
-        self.active_audio_tasks = max(0, self.active_audio_tasks - 1)
-        log.debug(
-            "audio_tasks_decremented",
-            active_tasks=self.active_audio_tasks,
-            max_concurrent=self.max_concurrent_audio_gen
-        )
-
-    def reload_config(self) -> None:
-        """Reload parallelism configuration without worker restart.
-
-        This allows dynamic configuration changes by re-reading environment
-        variables. Call periodically (e.g., every 60s) or via signal handler.
-
-        Story: 4.6 - Parallel Task Execution (AC4)
-        """
-        from app.config import (
-            get_max_concurrent_asset_gen,
-            get_max_concurrent_audio_gen,
-            get_max_concurrent_video_gen,
-        )
-
-        old_asset = self.max_concurrent_asset_gen
-        old_video = self.max_concurrent_video_gen
-        old_audio = self.max_concurrent_audio_gen
-
-        self.max_concurrent_asset_gen = get_max_concurrent_asset_gen()
-        self.max_concurrent_video_gen = get_max_concurrent_video_gen()
-        self.max_concurrent_audio_gen = get_max_concurrent_audio_gen()
-
-        # Update legacy attribute for backward compatibility
-        self.max_concurrent_video = self.max_concurrent_video_gen
-
-        # Log only if values changed
-        if (old_asset != self.max_concurrent_asset_gen or
-            old_video != self.max_concurrent_video_gen or
-            old_audio != self.max_concurrent_audio_gen):
-            log.info(
-                "worker_config_reloaded",
-                asset_gen=self.max_concurrent_asset_gen,
-                video_gen=self.max_concurrent_video_gen,
-                audio_gen=self.max_concurrent_audio_gen
-            )
-
-
-# Global worker state instance
-worker_state = WorkerState()
-
-
 def signal_handler(signum: int, frame: object) -> None:
     """Handle SIGTERM signal for graceful shutdown.
 
@@ -339,6 +87,11 @@ async def worker_main_loop() -> None:
     Behavior (Story 4.2):
         - Initialize PgQueuer with asyncpg connection pool
         - Import entrypoints to register task handlers
+        - Refresh step duration percentiles in the background (claim ordering)
+        - Reconcile channel_queue_stats counts in the background
+        - Serve Prometheus metrics on WORKER_METRICS_PORT
+        - Log event loop stalls; accept profiling requests if enabled
+        - Wait (bounded) for background side effects on exit
         - Run PgQueuer worker loop (handles polling, LISTEN/NOTIFY, claiming)
         - Exit gracefully on shutdown signal
 
@@ -354,11 +107,20 @@ async def worker_main_loop() -> None:
 
     worker_id = os.getenv("RAILWAY_SERVICE_NAME", "worker-local")
     log.info("worker_started_with_pgqueuer", worker_id=worker_id)
+    stats_refresh: asyncio.Task[None] | None = None
+    queue_stats_reconcile: asyncio.Task[None] | None = None
+    metrics_server: asyncio.AbstractServer | None = None
+    lag_monitor: asyncio.Task[None] | None = None
 
     try:
         # Import queue initialization
         from app.entrypoints import register_entrypoints
         from app.queue import initialize_pgqueuer
+        from app.services.channel_queue_stats import (
+            collect_queue_depth,
+            queue_stats_reconcile_loop,
+        )
+        from app.services.work_estimator import step_duration_stats_refresh_loop
 
         # Initialize PgQueuer
         pgq, pool = await initialize_pgqueuer()
@@ -369,6 +131,25 @@ async def worker_main_loop() -> None:
         # Register entrypoints with PgQueuer
         register_entrypoints(pgq)
 
+        # Keep StepDurationStats fresh for shortest-remaining-work claim ordering
+        stats_refresh = asyncio.create_task(step_duration_stats_refresh_loop())
+
+        # Repair drift in the trigger-maintained per-channel task counts
+        queue_stats_reconcile = asyncio.create_task(queue_stats_reconcile_loop())
+
+        # Prometheus scrape endpoint (workers have no web server)
+        REGISTRY.add_collector(collect_queue_depth)
+        metrics_server = await start_metrics_server(get_worker_metrics_port())
+
+        # Stall logging, plus SIGUSR1 / POST /debug/profile sampling profiles
+        lag_threshold_ms = get_event_loop_lag_threshold_ms()
+        if lag_threshold_ms:
+            lag_monitor = asyncio.create_task(
+                EventLoopLagMonitor(lag_threshold_ms / 1000).run()
+            )
+        if get_worker_profiling_enabled():
+            install_profiling_triggers()
+
         # Run PgQueuer worker loop
         # Handles: polling, LISTEN/NOTIFY, FOR UPDATE SKIP LOCKED, retry logic
         await pgq.run()
@@ -386,6 +167,18 @@ async def worker_main_loop() -> None:
         )
         raise
     finally:
+        if stats_refresh:
+            stats_refresh.cancel()
+        if queue_stats_reconcile:
+            queue_stats_reconcile.cancel()
+        if metrics_server:
+            metrics_server.close()
+        if lag_monitor:
+            lag_monitor.cancel()
+        # Let background side effects (Notion population, faststart) finish
+        await get_side_effect_queue().drain()
+        # Export spans still buffered (joins the exporter thread off the loop)
+        await asyncio.to_thread(shutdown_tracing)
         log.info(
             "worker_shutdown",
             worker_id=worker_id,
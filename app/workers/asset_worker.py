@@ -48,6 +48,7 @@ from uuid import UUID
 from app.database import async_session_factory
 from app.models import Task, TaskStatus
 from app.services.asset_generation import AssetGenerationService
+from app.services.task_events import EVENT_ERROR, record_task_event
 from app.utils.cli_wrapper import CLIScriptError
 from app.utils.logging import get_logger
 
@@ -126,7 +127,7 @@ async def process_asset_generation_task(task_id: str | UUID) -> None:
 
     # Step 2: Generate assets (OUTSIDE transaction - DB connection closed)
     try:
-        service = AssetGenerationService(channel_id_str, project_id)
+        service = AssetGenerationService(channel_id_str, project_id, task_id=task_id)
         manifest = service.create_asset_manifest(topic, story_direction)
 
         log.info(
@@ -195,10 +196,14 @@ async def process_asset_generation_task(task_id: str | UUID) -> None:
             task = await db.get(Task, task_id)
             if task:
                 task.status = TaskStatus.ASSET_ERROR
-                # Append to error_log (append-only pattern)
                 error_msg = f"{e.script} exit {e.exit_code}\n{e.stderr[:500]}"
-                error_entry = f"Asset generation CLI error: {error_msg}\n\n"
-                task.error_log = (task.error_log or "") + error_entry
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.ASSET_ERROR,
+                    message=f"Asset generation CLI error: {error_msg}",
+                )
                 await db.commit()
 
     except asyncio.TimeoutError:
@@ -208,8 +213,13 @@ async def process_asset_generation_task(task_id: str | UUID) -> None:
             task = await db.get(Task, task_id)
             if task:
                 task.status = TaskStatus.ASSET_ERROR
-                error_entry = "Asset generation timeout (60s per asset)\n\n"
-                task.error_log = (task.error_log or "") + error_entry
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.ASSET_ERROR,
+                    message="Asset generation timeout (60s per asset)",
+                )
                 await db.commit()
 
     except Exception as e:
@@ -219,8 +229,13 @@ async def process_asset_generation_task(task_id: str | UUID) -> None:
             task = await db.get(Task, task_id)
             if task:
                 task.status = TaskStatus.ASSET_ERROR
-                error_entry = f"Unexpected error: {e!s}\n\n"
-                task.error_log = (task.error_log or "") + error_entry
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.ASSET_ERROR,
+                    message=f"Unexpected error: {e!s}",
+                )
                 await db.commit()
 
 
@@ -31,6 +31,7 @@ from uuid import UUID
 from app.database import async_session_factory
 from app.models import Task, TaskStatus
 from app.services.composite_creation import CompositeCreationService
+from app.services.task_events import EVENT_ERROR, record_task_event
 from app.utils.cli_wrapper import CLIScriptError
 from app.utils.logging import get_logger
 
@@ -86,7 +87,9 @@ async def process_composite_creation_task(task_id: str) -> None:
         if not task.channel:
             log.error("task_missing_channel", task_id=task_id, channel_id=task.channel_id)
             task.status = TaskStatus.ASSET_ERROR
-            task.error_log = "Channel not found"
+            record_task_event(
+                db, task.id, EVENT_ERROR, TaskStatus.ASSET_ERROR, message="Channel not found"
+            )
             await db.commit()
             return
 
@@ -170,7 +173,13 @@ async def process_composite_creation_task(task_id: str) -> None:
                 task = await db.get(Task, task_uuid)
                 if task:
                     task.status = TaskStatus.ASSET_ERROR
-                    task.error_log = f"Composite creation failed: {e.stderr}"
+                    record_task_event(
+                        db,
+                        task.id,
+                        EVENT_ERROR,
+                        TaskStatus.ASSET_ERROR,
+                        message=f"Composite creation failed: {e.stderr}",
+                    )
                     await db.commit()
 
     except asyncio.TimeoutError:
@@ -181,7 +190,13 @@ async def process_composite_creation_task(task_id: str) -> None:
                 task = await db.get(Task, task_uuid)
                 if task:
                     task.status = TaskStatus.ASSET_ERROR
-                    task.error_log = "Composite creation timeout (30s per composite)"
+                    record_task_event(
+                        db,
+                        task.id,
+                        EVENT_ERROR,
+                        TaskStatus.ASSET_ERROR,
+                        message="Composite creation timeout (30s per composite)",
+                    )
                     await db.commit()
 
     except FileNotFoundError as e:
@@ -192,7 +207,13 @@ async def process_composite_creation_task(task_id: str) -> None:
                 task = await db.get(Task, task_uuid)
                 if task:
                     task.status = TaskStatus.ASSET_ERROR
-                    task.error_log = f"Missing asset files: {e!s}"
+                    record_task_event(
+                        db,
+                        task.id,
+                        EVENT_ERROR,
+                        TaskStatus.ASSET_ERROR,
+                        message=f"Missing asset files: {e!s}",
+                    )
                     await db.commit()
 
     except Exception as e:
@@ -205,7 +226,13 @@ async def process_composite_creation_task(task_id: str) -> None:
                 task = await db.get(Task, task_uuid)
                 if task:
                     task.status = TaskStatus.ASSET_ERROR
-                    task.error_log = f"Unexpected error: {e!s}"
+                    record_task_event(
+                        db,
+                        task.id,
+                        EVENT_ERROR,
+                        TaskStatus.ASSET_ERROR,
+                        message=f"Unexpected error: {e!s}",
+                    )
                     await db.commit()
 
 
@@ -47,6 +47,7 @@ from app.database import async_session_factory
 from app.models import Channel, Task, TaskStatus
 from app.services.cost_tracker import track_api_cost
 from app.services.narration_generation import NarrationGenerationService
+from app.services.task_events import EVENT_ERROR, record_task_event
 from app.utils.cli_wrapper import CLIScriptError
 from app.utils.logging import get_logger
 
@@ -116,7 +117,13 @@ async def process_narration_generation_task(task_id: str | UUID) -> None:
         if not channel:
             log.error("channel_not_found", channel_id=str(task.channel_id))
             task.status = TaskStatus.AUDIO_ERROR
-            task.error_log = f"Channel {task.channel_id} not found"
+            record_task_event(
+                db,
+                task.id,
+                EVENT_ERROR,
+                TaskStatus.AUDIO_ERROR,
+                message=f"Channel {task.channel_id} not found",
+            )
             await db.commit()
             return
 
@@ -124,7 +131,13 @@ async def process_narration_generation_task(task_id: str | UUID) -> None:
         if not channel.voice_id:
             log.error("channel_voice_id_missing", channel_id=channel.channel_id)
             task.status = TaskStatus.AUDIO_ERROR
-            task.error_log = f"Channel {channel.channel_id} missing voice_id"
+            record_task_event(
+                db,
+                task.id,
+                EVENT_ERROR,
+                TaskStatus.AUDIO_ERROR,
+                message=f"Channel {channel.channel_id} missing voice_id",
+            )
             await db.commit()
             return
 
@@ -143,13 +156,19 @@ async def process_narration_generation_task(task_id: str | UUID) -> None:
                 scripts_count=len(narration_scripts) if narration_scripts else 0,
             )
             task.status = TaskStatus.AUDIO_ERROR
-            task.error_log = "Task missing narration_scripts field or count != 18"
+            record_task_event(
+                db,
+                task.id,
+                EVENT_ERROR,
+                TaskStatus.AUDIO_ERROR,
+                message="Task missing narration_scripts field or count != 18",
+            )
             await db.commit()
             return
 
     # Step 2: Generate narration audio (OUTSIDE transaction - SHORT-RUNNING 1.5-4.5 min)
     try:
-        service = NarrationGenerationService(channel_business_id, project_id)
+        service = NarrationGenerationService(channel_business_id, project_id, task_id=task_id)
 
         manifest = await service.create_narration_manifest(
             narration_scripts=narration_scripts, voice_id=voice_id
@@ -229,7 +248,13 @@ async def process_narration_generation_task(task_id: str | UUID) -> None:
             task = result_task.scalar_one_or_none()
             if task:
                 task.status = TaskStatus.AUDIO_ERROR
-                task.error_log = f"Narration generation failed: {e.stderr}"
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.AUDIO_ERROR,
+                    message=f"Narration generation failed: {e.stderr}",
+                )
                 await db.commit()
 
     except ValueError as e:
@@ -240,7 +265,13 @@ async def process_narration_generation_task(task_id: str | UUID) -> None:
             task = result_task.scalar_one_or_none()
             if task:
                 task.status = TaskStatus.AUDIO_ERROR
-                task.error_log = f"Validation error: {e!s}"
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.AUDIO_ERROR,
+                    message=f"Validation error: {e!s}",
+                )
                 await db.commit()
 
     except Exception as e:
@@ -251,5 +282,11 @@ async def process_narration_generation_task(task_id: str | UUID) -> None:
             task = result_task.scalar_one_or_none()
             if task:
                 task.status = TaskStatus.AUDIO_ERROR
-                task.error_log = f"Unexpected error: {e!s}"
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.AUDIO_ERROR,
+                    message=f"Unexpected error: {e!s}",
+                )
                 await db.commit()
@@ -8,6 +8,7 @@ Key Responsibilities:
 - Execute complete pipeline for claimed tasks (all 6 steps)
 - Handle errors and update task status appropriately
 - Implement graceful shutdown on SIGTERM
+- Serve Prometheus metrics on WORKER_METRICS_PORT (worker loop mode)
 - Support 3 concurrent worker processes (Railway deployment)
 
 Architecture Pattern: "Short Transaction + Long Processing"
@@ -50,12 +51,29 @@ import asyncio
 import contextlib
 import signal
 import sys
+import time
+from datetime import datetime, timezone
 from typing import Any
 
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.config import get_worker_metrics_port, get_workspace_gc_interval_seconds
 from app.database import async_session_factory
-from app.models import PriorityLevel, Task, TaskStatus
+from app.models import Task, TaskStatus
+from app.queue import advance_virtual_time, fair_share_claim_statement, get_system_clock
+from app.services.api_quota_state import GEMINI_PROVIDER, gemini_key_id, get_quota_status
 from app.services.pipeline_orchestrator import PipelineOrchestrator
+from app.services.side_effects import get_side_effect_queue
+from app.services.task_deferral import idle_sleep_seconds, next_eligible_at
+from app.services.task_events import EVENT_ERROR, record_task_event
+from app.services.work_estimator import step_duration_stats_refresh_loop
+from app.services.workspace_retention import (
+    collect_workspaces,
+    ensure_disk_headroom,
+    has_disk_headroom,
+)
 from app.utils.logging import get_logger
+from app.utils.metrics import start_metrics_server
 
 log = get_logger(__name__)
 
@@ -162,10 +180,14 @@ async def process_pipeline_task(task_id: str) -> None:
                 task = await db.get(Task, task_id)
                 if task:
                     task.status = TaskStatus.ASSET_ERROR
-                    # Append error to log
-                    current_log = task.error_log or ""
-                    error_entry = f"[Worker Error] {type(e).__name__}: {e!s}"
-                    task.error_log = f"{current_log}\n{error_entry}".strip()
+                    record_task_event(
+                        db,
+                        task.id,
+                        EVENT_ERROR,
+                        TaskStatus.ASSET_ERROR,
+                        message=f"[Worker Error] {type(e).__name__}: {e!s}",
+                        error_type=type(e).__name__,
+                    )
                     await db.commit()
 
 
@@ -173,41 +195,53 @@ async def claim_next_task() -> str | None:
     """Claim next available task from queue atomically.
 
     Query Strategy:
-    - Filter by status='queued'
-    - Order by priority (high > normal > low) then FIFO (created_at ASC)
+    - Skip claiming while the workspace volume is low on free space
+      (back-pressure; an urgent workspace garbage collection runs in its
+      own transaction instead)
+    - Filter by status='queued' and not_before elapsed (deferred tasks wait),
+      on active channels below Channel.max_concurrent in-progress tasks
+    - While the shared Gemini quota is exhausted (api_quota_state), skip tasks
+      whose next step is asset generation; later steps don't call Gemini
+    - Order by priority (high > normal > low), then channel virtual time
+      (weighted fair share), then starving tasks oldest-first, then FIFO
+      (app.queue.fair_share_claim_statement)
     - Lock row with FOR UPDATE SKIP LOCKED (prevents conflicts)
-    - Update status to 'claimed'
+    - Update status to 'claimed' and advance the channel's virtual time
     - Return task_id
 
     Returns:
-        Task ID (str) if task claimed, None if no tasks available
+        Task ID (str) if task claimed, None if no tasks available or disk
+        space is too low to start one
 
     Example:
         >>> task_id = await claim_next_task()
         >>> if task_id:
         ...     await process_pipeline_task(task_id)
     """
-    from sqlalchemy import case, select
-    from sqlalchemy.orm import selectinload
+    # A new task writes hundreds of MB; don't start one on a full volume.
+    # Urgent collection deletes files, so it runs in its own transaction and
+    # this iteration claims nothing; the next one re-checks free space.
+    if not has_disk_headroom():
+        async with async_session_factory() as db, db.begin():  # type: ignore[misc]
+            await ensure_disk_headroom(db)
+        return None
 
     async with async_session_factory() as db, db.begin():  # type: ignore[misc]
-        # Query for next available task (queued status, ordered by priority + FIFO)
-        # Use ORM with proper priority ordering via case statement
-        # TODO: Add FOR UPDATE SKIP LOCKED when PgQueuer is integrated (Epic 4)
-        priority_order = case(
-            (Task.priority == PriorityLevel.HIGH, 1),
-            (Task.priority == PriorityLevel.NORMAL, 2),
-            (Task.priority == PriorityLevel.LOW, 3),
-            else_=4,
-        )
+        conditions: list[ColumnElement[bool]] = []
+        quota = await get_quota_status(db, GEMINI_PROVIDER, gemini_key_id())
+        if not quota.available():
+            assets_done = Task.step_completion_metadata["asset_generation"]["completed"]
+            conditions.append(assets_done.as_boolean().is_(True))
+            log.debug(
+                "gemini_quota_exhausted_skipping_asset_tasks",
+                reason=quota.exhausted_reason,
+                exhausted_until=quota.exhausted_until.isoformat()
+                if quota.exhausted_until
+                else None,
+            )
 
-        stmt = (
-            select(Task)
-            .where(Task.status == TaskStatus.QUEUED)
-            .order_by(priority_order, Task.created_at.asc())
-            .limit(1)
-            .options(selectinload(Task.channel))  # Preload channel relationship
-        )
+        system_clock = await get_system_clock(db)
+        stmt = fair_share_claim_statement(system_clock, datetime.now(timezone.utc), *conditions)
 
         result = await db.execute(stmt)
         task = result.scalar_one_or_none()
@@ -217,23 +251,56 @@ async def claim_next_task() -> str | None:
 
         task_id = str(task.id)
 
-        # Claim task by updating status to 'claimed'
+        # Claim task by updating status to 'claimed' and charge its channel
         task.status = TaskStatus.CLAIMED
+        await advance_virtual_time(db, task.channel_id, system_clock)
         await db.commit()
 
         log.info("task_claimed", task_id=task_id)
         return task_id
 
 
+async def next_deferred_task_at() -> datetime | None:
+    """Return when the earliest deferred queued task becomes claimable.
+
+    Uses the partial index ix_tasks_queued_not_before (MIN over a small set).
+
+    Returns:
+        Earliest future not_before, or None if no queued task is deferred
+    """
+    async with async_session_factory() as db:  # type: ignore[misc]
+        return await next_eligible_at(db)
+
+
+async def run_workspace_gc() -> None:
+    """Apply pending workspace retention policies (never raises).
+
+    Failures are logged; the next sweep retries.
+    """
+    try:
+        async with async_session_factory() as db, db.begin():  # type: ignore[misc]
+            freed = await collect_workspaces(db)
+        if freed:
+            log.info("workspace_gc_completed", freed_bytes=freed)
+    except Exception as e:
+        log.warning(
+            "workspace_gc_failed",
+            error_type=type(e).__name__,
+            error_message=str(e),
+        )
+
+
 async def worker_loop() -> None:
     """Main worker loop that continuously processes tasks from queue.
 
     Worker Loop Strategy:
     1. Check for shutdown signal
     2. Claim next available task from queue
-    3. If no task available, sleep 5 seconds and retry
+    3. If no task available, sleep until the earliest deferred task becomes
+       eligible (not_before), polling at 5s doubling to 10s while idle
     4. If task claimed, process via pipeline orchestrator
-    5. Repeat until shutdown signal received
+    5. Every WORKSPACE_GC_INTERVAL_SECONDS, apply workspace retention policies
+    6. Repeat until shutdown signal received
 
     Concurrency:
     - 3 independent worker processes run this loop (Railway deployment)
@@ -261,19 +328,34 @@ async def worker_loop() -> None:
         # Logs: Waiting for tasks...
     """
     log.info("worker_loop_started")
+    idle_polls = 0
+    gc_interval = get_workspace_gc_interval_seconds()
+    last_gc: float | None = None
 
     while not SHUTDOWN_REQUESTED:
         try:
+            if last_gc is None or time.monotonic() - last_gc >= gc_interval:
+                last_gc = time.monotonic()
+                await run_workspace_gc()
+
             # Claim next available task
             task_id = await claim_next_task()
 
             if task_id:
+                idle_polls = 0
                 # Process task via pipeline orchestrator
                 await process_pipeline_task(task_id)
             else:
-                # No tasks available, sleep and retry
-                log.debug("no_tasks_available")
-                await asyncio.sleep(5)
+                # No tasks available, sleep until the next deferred task is due
+                next_eligible = await next_deferred_task_at()
+                sleep_seconds = idle_sleep_seconds(next_eligible, idle_polls)
+                idle_polls += 1
+                log.debug(
+                    "no_tasks_available",
+                    sleep_seconds=round(sleep_seconds, 1),
+                    next_eligible_at=next_eligible.isoformat() if next_eligible else None,
+                )
+                await asyncio.sleep(sleep_seconds)
 
         except Exception as e:
             log.error(
@@ -308,10 +390,23 @@ async def main() -> None:
     if len(sys.argv) > 2 and sys.argv[1] == "--task-id":
         task_id = sys.argv[2]
         log.info("single_task_mode", task_id=task_id)
-        await process_pipeline_task(task_id)
+        try:
+            await process_pipeline_task(task_id)
+        finally:
+            # Let background side effects (Notion population, faststart) finish
+            await get_side_effect_queue().drain()
     else:
-        # Run worker loop (production)
-        await worker_loop()
+        # Run worker loop (production), scraped on WORKER_METRICS_PORT like app.worker
+        metrics_server = await start_metrics_server(get_worker_metrics_port())
+        # Keep predicted remaining work fresh for the claim ordering
+        stats_refresh = asyncio.create_task(step_duration_stats_refresh_loop())
+        try:
+            await worker_loop()
+        finally:
+            stats_refresh.cancel()
+            if metrics_server:
+                metrics_server.close()
+            await get_side_effect_queue().drain()
 
 
 if __name__ == "__main__":
@@ -47,6 +47,7 @@ from app.database import async_session_factory
 from app.models import Channel, Task, TaskStatus
 from app.services.cost_tracker import track_api_cost
 from app.services.sfx_generation import SFXGenerationService
+from app.services.task_events import EVENT_ERROR, record_task_event
 from app.utils.cli_wrapper import CLIScriptError
 from app.utils.logging import get_logger
 
@@ -115,7 +116,13 @@ async def process_sfx_generation_task(task_id: str | UUID) -> None:
         if not channel:
             log.error("channel_not_found", channel_id=str(task.channel_id))
             task.status = TaskStatus.AUDIO_ERROR
-            task.error_log = f"Channel {task.channel_id} not found"
+            record_task_event(
+                db,
+                task.id,
+                EVENT_ERROR,
+                TaskStatus.AUDIO_ERROR,
+                message=f"Channel {task.channel_id} not found",
+            )
             await db.commit()
             return
 
@@ -133,13 +140,19 @@ async def process_sfx_generation_task(task_id: str | UUID) -> None:
                 descriptions_count=len(sfx_descriptions) if sfx_descriptions else 0,
             )
             task.status = TaskStatus.AUDIO_ERROR
-            task.error_log = "Task missing sfx_descriptions field or count != 18"
+            record_task_event(
+                db,
+                task.id,
+                EVENT_ERROR,
+                TaskStatus.AUDIO_ERROR,
+                message="Task missing sfx_descriptions field or count != 18",
+            )
             await db.commit()
             return
 
     # Step 2: Generate SFX audio (OUTSIDE transaction - SHORT-RUNNING 1.5-4.5 min)
     try:
-        service = SFXGenerationService(channel_business_id, project_id)
+        service = SFXGenerationService(channel_business_id, project_id, task_id=task_id)
 
         manifest = await service.create_sfx_manifest(sfx_descriptions=sfx_descriptions)
 
@@ -217,7 +230,13 @@ async def process_sfx_generation_task(task_id: str | UUID) -> None:
             task = result_task.scalar_one_or_none()
             if task:
                 task.status = TaskStatus.AUDIO_ERROR
-                task.error_log = f"SFX generation failed: {e.stderr}"
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.AUDIO_ERROR,
+                    message=f"SFX generation failed: {e.stderr}",
+                )
                 await db.commit()
 
     except ValueError as e:
@@ -228,7 +247,13 @@ async def process_sfx_generation_task(task_id: str | UUID) -> None:
             task = result_task.scalar_one_or_none()
             if task:
                 task.status = TaskStatus.AUDIO_ERROR
-                task.error_log = f"Validation error: {e!s}"
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.AUDIO_ERROR,
+                    message=f"Validation error: {e!s}",
+                )
                 await db.commit()
 
     except Exception as e:
@@ -239,5 +264,11 @@ async def process_sfx_generation_task(task_id: str | UUID) -> None:
             task = result_task.scalar_one_or_none()
             if task:
                 task.status = TaskStatus.AUDIO_ERROR
-                task.error_log = f"Unexpected error: {e!s}"
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.AUDIO_ERROR,
+                    message=f"Unexpected error: {e!s}",
+                )
                 await db.commit()
@@ -45,6 +45,7 @@ from sqlalchemy import select
 
 from app.database import async_session_factory
 from app.models import Channel, Task, TaskStatus
+from app.services.task_events import EVENT_ERROR, record_task_event
 from app.services.video_assembly import VideoAssemblyService
 from app.utils.cli_wrapper import CLIScriptError
 from app.utils.logging import get_logger
@@ -207,8 +208,8 @@ async def process_video_assembly_task(task_id: str | UUID) -> None:
             if task:
                 task.status = TaskStatus.VIDEO_ERROR
                 error_msg = f"Missing file: {e!s}"
-                task.error_log = (
-                    (task.error_log or "") + "\n" + error_msg if task.error_log else error_msg
+                record_task_event(
+                    db, task.id, EVENT_ERROR, TaskStatus.VIDEO_ERROR, message=error_msg
                 )
                 await db.commit()
 
@@ -230,8 +231,8 @@ async def process_video_assembly_task(task_id: str | UUID) -> None:
             if task:
                 task.status = TaskStatus.VIDEO_ERROR
                 error_msg = f"FFmpeg assembly failed: {e.stderr}"
-                task.error_log = (
-                    (task.error_log or "") + "\n" + error_msg if task.error_log else error_msg
+                record_task_event(
+                    db, task.id, EVENT_ERROR, TaskStatus.VIDEO_ERROR, message=error_msg
                 )
                 await db.commit()
 
@@ -251,8 +252,8 @@ async def process_video_assembly_task(task_id: str | UUID) -> None:
             if task:
                 task.status = TaskStatus.VIDEO_ERROR
                 error_msg = f"Validation error: {e!s}"
-                task.error_log = (
-                    (task.error_log or "") + "\n" + error_msg if task.error_log else error_msg
+                record_task_event(
+                    db, task.id, EVENT_ERROR, TaskStatus.VIDEO_ERROR, message=error_msg
                 )
                 await db.commit()
 
@@ -273,7 +274,7 @@ async def process_video_assembly_task(task_id: str | UUID) -> None:
             if task:
                 task.status = TaskStatus.VIDEO_ERROR
                 error_msg = f"Unexpected error: {e!s}"
-                task.error_log = (
-                    (task.error_log or "") + "\n" + error_msg if task.error_log else error_msg
+                record_task_event(
+                    db, task.id, EVENT_ERROR, TaskStatus.VIDEO_ERROR, message=error_msg
                 )
                 await db.commit()
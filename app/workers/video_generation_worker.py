@@ -45,6 +45,7 @@ Usage:
 
 import asyncio
 from datetime import datetime, timezone
+from pathlib import Path
 from uuid import UUID
 
 import httpx
@@ -54,9 +55,15 @@ from app.config import get_notion_api_token
 from app.database import async_session_factory
 from app.models import Task, TaskStatus
 from app.services.cost_tracker import track_api_cost
+from app.services.notion_bulk import NotionPageLedger
 from app.services.notion_video_service import NotionVideoService
+from app.services.side_effects import get_side_effect_queue, map_bounded
+from app.services.task_artifacts import ARTIFACT_VIDEO, load_artifact_index, save_artifacts
+from app.services.task_events import EVENT_ERROR, record_task_event
+from app.services.task_metadata import VIDEO_STEP, clear_clips, get_clips
 from app.services.video_generation import VideoGenerationService
 from app.utils.cli_wrapper import CLIScriptError
+from app.utils.filesystem import get_project_workspace
 from app.utils.logging import get_logger
 from app.utils.video_optimization import get_video_duration, optimize_video_for_streaming
 
@@ -150,14 +157,9 @@ async def process_video_generation_task(task_id: str | UUID) -> None:
     try:
         # Check for partial regeneration (Story 5.4 AC3)
         async with async_session_factory() as db:
-            task = await db.get(Task, task_id)
-            if not task:
-                log.error("task_not_found_for_partial_regen_check", task_id=str(task_id))
-                return
-            metadata = task.step_completion_metadata or {}
-            failed_clip_numbers = metadata.get("failed_clip_numbers", [])
+            failed_clip_numbers = await get_clips(db, task_id, VIDEO_STEP)
 
-        service = VideoGenerationService(channel_id_str, project_id)
+        service = VideoGenerationService(channel_id_str, project_id, task_id=task_id)
         manifest = service.create_video_manifest(topic, story_direction)
 
         # Partial regeneration: only generate failed clips if specified
@@ -188,15 +190,12 @@ async def process_video_generation_task(task_id: str | UUID) -> None:
         # Clear failed_clip_numbers after successful regeneration
         if failed_clip_numbers:
             async with async_session_factory() as db, db.begin():
-                task = await db.get(Task, task_id)
-                if task and task.step_completion_metadata:
-                    task.step_completion_metadata.pop("failed_clip_numbers", None)
-                    await db.commit()
-                    log.info(
-                        "video_partial_regeneration_cleared",
-                        task_id=str(task_id),
-                        regenerated_clips=failed_clip_numbers,
-                    )
+                await clear_clips(db, task_id, VIDEO_STEP)
+            log.info(
+                "video_partial_regeneration_cleared",
+                task_id=str(task_id),
+                regenerated_clips=failed_clip_numbers,
+            )
 
         log.info(
             "video_generation_complete",
@@ -225,40 +224,24 @@ async def process_video_generation_task(task_id: str | UUID) -> None:
             await db.commit()
 
         # Step 3.5: Optimize videos and populate Notion (Story 5.4)
-        # Optimize videos for streaming playback (MP4 faststart)
-        # Then populate Video entries in Notion database
+        # Faststart rewrites (atomic temp + replace) run as a background side
+        # effect - nothing downstream waits for them; rewritten clips are
+        # re-indexed. Notion population stays on the critical path:
+        # VIDEO_READY requires the Video entries for review.
+        video_paths = [
+            (clip["clip_number"], service.get_video_path(clip["clip_number"]))
+            for clip in manifest.clips
+        ]
+        video_paths = [(n, path) for n, path in video_paths if path.exists()]
+        project_dir = get_project_workspace(channel_id_str, project_id).project_dir
+        get_side_effect_queue().submit(
+            task_id,
+            "video_faststart",
+            lambda: optimize_videos(task_id, video_paths, project_dir),
+        )
+
         notion_populated_successfully = False
         try:
-            log.info(
-                "video_optimization_started",
-                task_id=str(task_id),
-                video_count=len(manifest.clips),
-            )
-
-            # Optimize each video for streaming playback
-            optimized_count = 0
-            for clip in manifest.clips:
-                video_path = service.get_video_path(clip["clip_number"])
-                if video_path.exists():
-                    try:
-                        await optimize_video_for_streaming(video_path)
-                        optimized_count += 1
-                    except Exception as e:
-                        log.warning(
-                            "video_optimization_failed",
-                            task_id=str(task_id),
-                            clip_number=clip["clip_number"],
-                            error=str(e),
-                        )
-                        # Continue with other videos - optimization failure is not critical
-
-            log.info(
-                "video_optimization_complete",
-                task_id=str(task_id),
-                optimized=optimized_count,
-                total=len(manifest.clips),
-            )
-
             # Populate Notion Videos database
             notion_token = get_notion_api_token()
             if notion_token and notion_page_id:
@@ -276,36 +259,20 @@ async def process_video_generation_task(task_id: str | UUID) -> None:
                 # DB connection closed - build video files list outside transaction
 
                 if channel:
-                    # Build video files list with durations
-                    video_files = []
-                    for clip in manifest.clips:
-                        video_path = service.get_video_path(clip["clip_number"])
-                        if video_path.exists():
-                            try:
-                                # Get actual duration after trimming
-                                duration = await get_video_duration(video_path)
-                                video_files.append({
-                                    "clip_number": clip["clip_number"],
-                                    "output_path": video_path,
-                                    "duration": duration,
-                                })
-                            except Exception as e:
-                                log.warning(
-                                    "video_duration_probe_failed",
-                                    task_id=str(task_id),
-                                    clip_number=clip["clip_number"],
-                                    error=str(e),
-                                )
-                                # Use default 10s duration if probe fails
-                                video_files.append({
-                                    "clip_number": clip["clip_number"],
-                                    "output_path": video_path,
-                                    "duration": 10.0,
-                                })
+                    # Build video files list with durations (probed in parallel)
+                    durations = await map_bounded(
+                        lambda item: probe_video_duration(task_id, *item), video_paths
+                    )
+                    video_files = [
+                        {"clip_number": n, "output_path": path, "duration": duration}
+                        for (n, path), duration in zip(video_paths, durations, strict=True)
+                    ]
 
                     # Populate Notion Videos database
                     notion_client = NotionClient(auth_token=notion_token)
-                    video_service = NotionVideoService(notion_client, channel)
+                    video_service = NotionVideoService(
+                        notion_client, channel, NotionPageLedger(task_id)
+                    )
 
                     populate_result = await video_service.populate_videos(
                         task_id=task_id,
@@ -348,7 +315,13 @@ async def process_video_generation_task(task_id: str | UUID) -> None:
                 task = await db.get(Task, task_id)
                 if task:
                     task.status = TaskStatus.VIDEO_ERROR
-                    task.error_log = f"{task.error_log or ''}\n[{datetime.now(timezone.utc).isoformat()}] Notion video population failed: {str(e)}".strip()
+                    record_task_event(
+                        db,
+                        task.id,
+                        EVENT_ERROR,
+                        TaskStatus.VIDEO_ERROR,
+                        message=f"Notion video population failed: {e!s}",
+                    )
                     await db.commit()
             return
 
@@ -400,7 +373,13 @@ async def process_video_generation_task(task_id: str | UUID) -> None:
             task = await db.get(Task, task_id)
             if task:
                 task.status = TaskStatus.VIDEO_ERROR
-                task.error_log = f"Video generation failed: {e.stderr}"
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.VIDEO_ERROR,
+                    message=f"Video generation failed: {e.stderr}",
+                )
                 await db.commit()
 
     except asyncio.TimeoutError:
@@ -410,7 +389,13 @@ async def process_video_generation_task(task_id: str | UUID) -> None:
             task = await db.get(Task, task_id)
             if task:
                 task.status = TaskStatus.VIDEO_ERROR
-                task.error_log = "Video generation timeout (10 minutes per clip exceeded)"
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.VIDEO_ERROR,
+                    message="Video generation timeout (10 minutes per clip exceeded)",
+                )
                 await db.commit()
 
     except httpx.HTTPError as e:
@@ -426,7 +411,13 @@ async def process_video_generation_task(task_id: str | UUID) -> None:
             task = await db.get(Task, task_id)
             if task:
                 task.status = TaskStatus.VIDEO_ERROR
-                task.error_log = f"HTTP error (catbox/Kling API): {e!s}"
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.VIDEO_ERROR,
+                    message=f"HTTP error (catbox/Kling API): {e!s}",
+                )
                 await db.commit()
 
     except Exception as e:
@@ -436,10 +427,110 @@ async def process_video_generation_task(task_id: str | UUID) -> None:
             task = await db.get(Task, task_id)
             if task:
                 task.status = TaskStatus.VIDEO_ERROR
-                task.error_log = f"Unexpected error: {e!s}"
+                record_task_event(
+                    db,
+                    task.id,
+                    EVENT_ERROR,
+                    TaskStatus.VIDEO_ERROR,
+                    message=f"Unexpected error: {e!s}",
+                )
                 await db.commit()
 
 
+async def optimize_videos(
+    task_id: UUID,
+    video_paths: list[tuple[int, Path]],
+    project_dir: Path | None = None,
+) -> dict[str, int]:
+    """Rewrite clips for streaming playback (MP4 faststart), in parallel.
+
+    Runs as a background side effect; a clip that fails is logged and left
+    as generated (optimization is not critical). Rewritten clips that are in
+    the task's artifact index get their size and SHA-256 re-recorded, so
+    the index keeps describing the files on disk.
+
+    Args:
+        task_id: Task UUID.
+        video_paths: (clip_number, path) of each generated clip.
+        project_dir: Project directory artifact paths are relative to
+            (None skips re-indexing).
+
+    Returns:
+        Counts of optimized and total clips (stored with the side effect status).
+    """
+
+    async def optimize(item: tuple[int, Path]) -> bool:
+        clip_number, video_path = item
+        try:
+            return await optimize_video_for_streaming(video_path)
+        except Exception as e:
+            log.warning(
+                "video_optimization_failed",
+                task_id=str(task_id),
+                clip_number=clip_number,
+                error=str(e),
+            )
+            return False
+
+    optimized = await map_bounded(optimize, video_paths)
+    rewritten = [item for item, done in zip(video_paths, optimized, strict=True) if done]
+    if rewritten and project_dir is not None:
+        await reindex_videos(task_id, project_dir, rewritten)
+    log.info(
+        "video_optimization_complete",
+        task_id=str(task_id),
+        optimized=len(rewritten),
+        total=len(video_paths),
+    )
+    return {"optimized": len(rewritten), "total": len(video_paths)}
+
+
+async def reindex_videos(
+    task_id: UUID, project_dir: Path, video_paths: list[tuple[int, Path]]
+) -> int:
+    """Re-record indexed clips after an in-place rewrite (size and SHA-256).
+
+    Clips the artifact index does not know yet are left alone; they are
+    indexed from disk when a later step first checks them.
+
+    Args:
+        task_id: Task UUID.
+        project_dir: Project directory artifact paths are relative to.
+        video_paths: (clip_number, path) of each rewritten clip.
+
+    Returns:
+        Number of artifact rows updated.
+    """
+    if async_session_factory is None:
+        raise RuntimeError("Database not configured. Set DATABASE_URL environment variable.")
+
+    async with async_session_factory() as db:
+        index = await load_artifact_index(db, task_id, project_dir)
+    for clip_number, video_path in video_paths:
+        artifact = index.get(video_path)
+        if artifact is not None:
+            await index.record(video_path, ARTIFACT_VIDEO, clip_number, artifact.duration_seconds)
+    pending = index.take_pending()
+    if pending:
+        async with async_session_factory() as db, db.begin():
+            await save_artifacts(db, task_id, pending)
+    return len(pending)
+
+
+async def probe_video_duration(task_id: UUID, clip_number: int, video_path: Path) -> float:
+    """Probe a clip's duration, defaulting to 10s when the probe fails."""
+    try:
+        return await get_video_duration(video_path)
+    except Exception as e:
+        log.warning(
+            "video_duration_probe_failed",
+            task_id=str(task_id),
+            clip_number=clip_number,
+            error=str(e),
+        )
+        return 10.0
+
+
 async def update_notion_status(notion_page_id: str, status: str) -> None:
     """Update Notion page status (stub for now).
 
@@ -55,7 +55,7 @@ def get_audio_duration(audio_path):
         return None
 
 
-def trim_video_to_audio(video_path, audio_path, output_path):
+def trim_video_to_audio(video_path, audio_path, output_path, encoder=None, watermark=None):
     """
     Trim video to match audio duration and mux audio track.
 
@@ -63,6 +63,9 @@ def trim_video_to_audio(video_path, audio_path, output_path):
         video_path: Path to source video
         audio_path: Path to audio track
         output_path: Path to save trimmed video with audio
+        encoder: Optional encoder settings from the manifest (video_filter,
+            video_args, audio_args) so clips match the cached branding segments
+        watermark: Optional watermark dict (path, position), pre-scaled
 
     Returns:
         bool: True if successful, False otherwise
@@ -86,32 +89,33 @@ def trim_video_to_audio(video_path, audio_path, output_path):
         # -b:a 192k: Audio bitrate
         # -shortest: Stop when shortest stream ends
         # -y: Overwrite output file
-        subprocess.run(
-            [
-                "ffmpeg",
-                "-t",
-                str(duration),
-                "-i",
-                video_path,
-                "-i",
-                audio_path,
-                "-c:v",
-                "libx264",
-                "-preset",
-                "fast",
-                "-crf",
-                "18",
-                "-c:a",
-                "aac",
-                "-b:a",
-                "192k",
-                "-shortest",
-                "-y",
-                output_path,
-            ],
-            check=True,
-            capture_output=True,
-        )
+        command = ["ffmpeg", "-t", str(duration), "-i", video_path, "-i", audio_path]
+        if encoder:
+            video_filter = encoder["video_filter"]
+            video_args = encoder["video_args"]
+            audio_args = encoder["audio_args"]
+        else:
+            video_filter = None
+            video_args = ["-c:v", "libx264", "-preset", "fast", "-crf", "18"]
+            audio_args = ["-c:a", "aac", "-b:a", "192k"]
+
+        if watermark:
+            # Watermark is pre-scaled by the branding cache: overlay only
+            command += ["-i", watermark["path"]]
+            chain = f"[0:v]{video_filter}[base];[base]" if video_filter else "[0:v]"
+            command += [
+                "-filter_complex",
+                f"{chain}[2:v]overlay={watermark['position']}[v]",
+                "-map",
+                "[v]",
+                "-map",
+                "1:a:0",
+            ]
+        elif video_filter:
+            command += ["-vf", video_filter, "-map", "0:v:0", "-map", "1:a:0"]
+
+        command += [*video_args, *audio_args, "-shortest", "-y", output_path]
+        subprocess.run(command, check=True, capture_output=True)
 
         return True
 
@@ -135,7 +139,7 @@ def concatenate_videos(video_list_file, output_path):
         bool: True if successful, False otherwise
     """
     try:
-        print(f"🎞️  Concatenating 18 clips into final video...")
+        print(f"🎞️  Concatenating segments into final video...")
 
         # FFmpeg concat demuxer command
         # -f concat: Use concat demuxer
@@ -254,6 +258,13 @@ def assemble_documentary(manifest_path, output_path):
             manifest = json.load(f)
 
         clips = manifest.get("clips", [])
+        encoder = manifest.get("encoder")
+        branding = manifest.get("branding") or {}
+        watermark = (
+            {"path": branding["watermark"], "position": branding["watermark_position"]}
+            if branding.get("watermark")
+            else None
+        )
 
         if not clips:
             print("❌ Error: No clips found in manifest", file=sys.stderr)
@@ -273,8 +284,8 @@ def assemble_documentary(manifest_path, output_path):
         try:
             # Step 1: Trim each video to audio duration
             for i, clip in enumerate(clips, 1):
-                video_path = clip["video"]
-                audio_path = clip["audio"]
+                video_path = clip.get("video_path") or clip["video"]
+                audio_path = clip.get("narration_path") or clip["audio"]
                 clip_number = clip.get("clip_number", i)
 
                 print(f"\n[{i}/{len(clips)}] Processing clip {clip_number:02d}...")
@@ -293,7 +304,9 @@ def assemble_documentary(manifest_path, output_path):
                 # Trim video to audio duration
                 trimmed_path = Path(temp_dir) / f"clip_{clip_number:02d}_trimmed.mp4"
 
-                if not trim_video_to_audio(video_path, audio_path, str(trimmed_path)):
+                if not trim_video_to_audio(
+                    video_path, audio_path, str(trimmed_path), encoder, watermark
+                ):
                     print(f"❌ Error: Failed to trim clip {clip_number}", file=sys.stderr)
                     return False
 
@@ -301,9 +314,17 @@ def assemble_documentary(manifest_path, output_path):
                 print(f"  ✅ Trimmed and synced")
 
             # Step 2: Create FFmpeg concat file list
+            # Intro/outro come pre-encoded with the clip encoder settings
+            # (branding cache), so they are stream-copied like the clips
+            segments = trimmed_clips
+            if branding.get("intro"):
+                segments = [branding["intro"], *segments]
+            if branding.get("outro"):
+                segments = [*segments, branding["outro"]]
+
             concat_file = Path(temp_dir) / "concat_list.txt"
             with open(concat_file, "w") as f:
-                for trimmed_clip in trimmed_clips:
+                for trimmed_clip in segments:
                     # FFmpeg concat format requires absolute paths and proper escaping
                     abs_path = Path(trimmed_clip).resolve()
                     f.write(f"file '{abs_path}'\n")
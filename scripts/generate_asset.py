@@ -159,8 +159,14 @@ def generate_image(prompt, output_path, api_key, reference_image_paths=None):
         bool: True if successful, False otherwise
     """
     try:
-        # Configure Gemini API
-        genai.configure(api_key=api_key)
+        # Configure Gemini API (GEMINI_API_BASE_URL points it at another endpoint, e.g. a fake)
+        base_url = os.getenv("GEMINI_API_BASE_URL")
+        if base_url:
+            genai.configure(
+                api_key=api_key, transport="rest", client_options={"api_endpoint": base_url}
+            )
+        else:
+            genai.configure(api_key=api_key)
 
         if reference_image_paths:
             print(f"🎨 Generating image variation with Gemini 3 Pro Image...")
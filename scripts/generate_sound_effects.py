@@ -20,7 +20,7 @@ script_dir = Path(__file__).parent
 load_dotenv(script_dir / ".env")
 
 # ElevenLabs API Configuration
-ELEVENLABS_API_BASE = "https://api.elevenlabs.io"
+ELEVENLABS_API_BASE = os.getenv("ELEVENLABS_API_BASE_URL", "https://api.elevenlabs.io")
 
 
 def generate_sound_effect(
@@ -21,8 +21,10 @@ from dotenv import load_dotenv
 script_dir = Path(__file__).parent
 load_dotenv(script_dir / ".env")
 
-# KIE.ai API Configuration
-KIE_API_BASE = "https://api.kie.ai/api/v1"
+# KIE.ai API Configuration (base URLs are overridable for the offline load-test harness)
+KIE_API_BASE = os.getenv("KIE_API_BASE_URL", "https://api.kie.ai/api/v1")
+CATBOX_API_URL = os.getenv("CATBOX_API_URL", "https://catbox.moe/user/api.php")
+KIE_POLL_INTERVAL_SECONDS = float(os.getenv("KIE_POLL_INTERVAL_SECONDS", "5"))
 
 
 def upload_image_to_catbox(image_path):
@@ -37,7 +39,7 @@ def upload_image_to_catbox(image_path):
     """
     image_path = Path(image_path)
 
-    upload_url = "https://catbox.moe/user/api.php"
+    upload_url = CATBOX_API_URL
 
     with open(image_path, "rb") as f:
         files = {"fileToUpload": (image_path.name, f, "image/png")}
@@ -77,8 +79,12 @@ def generate_video(image_path, prompt, output_path, api_key, environment_path=No
         bool: True if successful, False otherwise
     """
     try:
-        # Upload main image to catbox.moe and get public URL
-        main_image_url = upload_image_to_catbox(image_path)
+        # Upload main image to catbox.moe and get public URL. VideoGenerationService
+        # uploads composites itself and passes the catbox URL: use it as-is.
+        if str(image_path).startswith(("http://", "https://")):
+            main_image_url = str(image_path)
+        else:
+            main_image_url = upload_image_to_catbox(image_path)
         if not main_image_url:
             return False
 
@@ -221,11 +227,11 @@ def poll_task_status(task_id, api_key, max_wait=600):
                 else:
                     print(f"⏳ Status: {state}... ({int(time.time() - start_time)}s elapsed)")
 
-            time.sleep(5)  # Poll every 5 seconds
+            time.sleep(KIE_POLL_INTERVAL_SECONDS)  # Poll every 5 seconds by default
 
         except Exception as e:
             print(f"⚠️  Polling error: {e}", file=sys.stderr)
-            time.sleep(5)
+            time.sleep(KIE_POLL_INTERVAL_SECONDS)
 
     print(f"❌ Timeout: Video generation exceeded {max_wait}s", file=sys.stderr)
     return None
@@ -256,7 +262,9 @@ def main():
         description="Generate 10-second video clips using KIE.ai Kling 2.5"
     )
     parser.add_argument(
-        "--image", required=True, help="Path to main seed image (character/subject)"
+        "--image",
+        required=True,
+        help="Path or public URL of main seed image (character/subject)",
     )
     parser.add_argument(
         "--environment",
@@ -281,8 +289,8 @@ def main():
         print("   KIE_API_KEY=your_api_key_here", file=sys.stderr)
         sys.exit(1)
 
-    # Verify main image exists
-    if not Path(args.image).exists():
+    # Verify main image exists (a URL was already uploaded by the caller)
+    if not args.image.startswith(("http://", "https://")) and not Path(args.image).exists():
         print(f"❌ Error: Image file not found: {args.image}", file=sys.stderr)
         sys.exit(1)
 
@@ -35,18 +35,12 @@ async def sync_channels() -> None:
         print(f"✅ Loaded {len(configs)} channel configuration(s)")
         print()
 
-        # Sync each config to database
+        # Sync all configs to database (one upsert for new/changed channels)
         async with async_session_factory() as session:
-            for channel_id, config in configs.items():
-                print(f"Syncing channel: {channel_id}")
-
-                # Sync config to database (creates or updates Channel)
-                await loader.sync_to_database(config, session)
-                print(f"  Synced channel: {config.channel_name}")
-                print()
-
-            # Commit all changes
-            await session.commit()
+            result = await loader.sync_all_to_database(configs.values(), session)
+            print(f"  Created: {', '.join(result.created) or '-'}")
+            print(f"  Updated: {', '.join(result.updated) or '-'}")
+            print(f"  Unchanged: {len(result.unchanged)}")
             print("✅ All channels synced successfully")
 
         # Verify channels in database
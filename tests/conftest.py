@@ -13,6 +13,7 @@ from cryptography.fernet import Fernet
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.models import Base
+from app.services.credential_cache import credential_cache
 from app.utils.encryption import EncryptionService
 
 
@@ -89,6 +90,18 @@ async def async_session(async_engine):
         yield session
 
 
+@pytest.fixture(autouse=True)
+def clear_credential_cache():
+    """Start and end every test with an empty decrypted-credential cache.
+
+    Each test creates its own database, so credentials cached for a channel
+    ID by one test must not be served to the next.
+    """
+    credential_cache.clear()
+    yield
+    credential_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def mock_task_queue(monkeypatch):
     """Mock PgQueuer task queue for tests.
@@ -15,15 +15,21 @@ Usage:
     async def test_worker_with_real_db(async_test_session):
         # Use async_test_session for integration testing
         pass
+
+    async def test_with_rows(async_session):
+        # create_channel / create_task / make_task build persisted rows
+        task = await create_task(async_session, status=TaskStatus.GENERATING_VIDEO)
 """
 
+import uuid
 import pytest
 from collections.abc import AsyncGenerator
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.models import Base
+from app.models import Base, Channel, Task, TaskStatus
 
 
 @pytest.fixture
@@ -268,3 +274,87 @@ def sample_channel_data():
         "voice_id": "EXAVITQu4vr4xnSDxMaL",
         "is_active": True,
     }
+
+
+# Helper factories for persisted test rows
+
+async def create_channel(db: AsyncSession, channel_id: str = "poke1", **columns: Any) -> Channel:
+    """
+    Add an active channel and flush it so its primary key is set.
+
+    Args:
+        db: Session to add the channel to (caller commits if needed)
+        channel_id: Business identifier
+        **columns: Other Channel columns, overriding the defaults
+
+    Returns:
+        The flushed Channel
+    """
+    channel = Channel(
+        **{
+            "channel_id": channel_id,
+            "channel_name": "Pokemon Channel",
+            "is_active": True,
+            **columns,
+        }
+    )
+    db.add(channel)
+    await db.flush()
+    return channel
+
+
+def make_task(
+    channel_id: uuid.UUID, status: TaskStatus = TaskStatus.QUEUED, **columns: Any
+) -> Task:
+    """
+    Build an unsaved task with placeholder content and a unique Notion page.
+
+    Args:
+        channel_id: Channel UUID (Channel.id)
+        status: Initial status
+        **columns: Other Task columns, overriding the defaults
+
+    Returns:
+        Transient Task (not added to a session)
+    """
+    return Task(
+        **{
+            "channel_id": channel_id,
+            "notion_page_id": uuid.uuid4().hex,
+            "title": "Test",
+            "topic": "Test",
+            "story_direction": "Test",
+            "status": status,
+            **columns,
+        }
+    )
+
+
+async def create_task(
+    db: AsyncSession,
+    channel: Channel | None = None,
+    status: TaskStatus = TaskStatus.QUEUED,
+    **columns: Any,
+) -> Task:
+    """
+    Add a task and flush it, creating the default channel when none is given.
+
+    Example:
+        task = await create_task(async_session, status=TaskStatus.GENERATING_VIDEO)
+        await async_session.commit()
+
+    Args:
+        db: Session to add the task to (caller commits if needed)
+        channel: Owning channel (default: create_channel(db))
+        status: Initial status
+        **columns: Other Task columns, overriding the defaults
+
+    Returns:
+        The flushed Task
+    """
+    if channel is None:
+        channel = await create_channel(db)
+    task = make_task(channel.id, status, **columns)
+    db.add(task)
+    await db.flush()
+    return task
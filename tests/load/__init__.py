@@ -0,0 +1 @@
+"""Offline load-test harness (fake external APIs + real pipeline workers)."""
@@ -0,0 +1,471 @@
+"""Offline load test: real pipeline workers against fake external APIs.
+
+Enqueues N tasks across M channels in PostgreSQL, starts W pipeline worker
+processes pointed at the fake Kling, Gemini, ElevenLabs, Notion and catbox
+servers (tests/load/fake_servers.py), approves review gates as they are
+reached, and reports throughput once every task has reached final review
+or an error status.
+
+Report:
+    - videos_per_hour: Tasks reaching FINAL_REVIEW per wall-clock hour
+    - step_duration_seconds: p50/p90/p95/p99/max per pipeline step (from
+      step_completion_metadata)
+    - end_to_end_seconds: Run start to FINAL_REVIEW per task
+    - db_statements: SQL statements the workers sent during the run
+      (counted per worker by tests/load/worker.py, excludes the driver's own
+      polling), and per video
+    - peak_rss_mb: Peak RSS of each worker (VmHWM) and of the largest
+      process including CLI scripts (RUSAGE_CHILDREN)
+    - external_api: Requests, 429s and sampled latency per fake API
+
+Requirements:
+    - DATABASE_URL pointing at a disposable PostgreSQL database (migrated to
+      head by the driver; seeded channels and tasks are left in place)
+    - ffmpeg/ffprobe on PATH (fake media, composites and assembly)
+
+Usage:
+    DATABASE_URL=postgresql://localhost/loadtest \\
+        python -m tests.load.driver --tasks 20 --channels 4 --workers 3 --time-scale 0.1
+
+    --time-scale shrinks fake API latencies and the Kling poll interval;
+    pipeline backoffs (transient retries, idle polling) are not scaled.
+
+Status:
+    Unverified end to end: the driver has not been run against PostgreSQL
+    and FFmpeg yet, so no baseline report exists. The fakes, the endpoint
+    overrides and the report helpers are covered by test_fake_servers.py.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+from sqlalchemy import select, update
+
+from app.database import async_session_factory
+from app.models import Channel, PriorityLevel, Task, TaskStatus
+from tests.load.fake_servers import (
+    DEFAULT_PROFILES,
+    FakeApiProfile,
+    FakeMedia,
+    FakeServers,
+    percentile,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+CLIPS_PER_VIDEO = 18
+
+# Review gates the driver approves (the Notion sync loop's job in production)
+APPROVAL_GATES = (TaskStatus.ASSETS_READY, TaskStatus.VIDEO_READY, TaskStatus.AUDIO_READY)
+
+ERROR_STATUSES = (
+    TaskStatus.ASSET_ERROR,
+    TaskStatus.VIDEO_ERROR,
+    TaskStatus.AUDIO_ERROR,
+    TaskStatus.UPLOAD_ERROR,
+)
+
+POLL_INTERVAL_SECONDS = 2.0
+PROGRESS_INTERVAL_SECONDS = 30.0
+WORKER_STOP_TIMEOUT_SECONDS = 30.0
+
+# Production poll interval of scripts/generate_video.py
+KIE_POLL_INTERVAL_SECONDS = 5.0
+
+
+@dataclass
+class Worker:
+    """A pipeline worker process started by the driver."""
+
+    name: str
+    process: asyncio.subprocess.Process
+    metrics_port: int
+    peak_rss_kb: int | None = None
+
+
+def summarize(values: list[float]) -> dict[str, float | int]:
+    """Count and p50/p90/p95/p99/max of values (seconds, rounded)."""
+    ordered = sorted(values)
+    summary: dict[str, float | int] = {"count": len(ordered)}
+    for q in (50, 90, 95, 99):
+        summary[f"p{q}"] = round(percentile(ordered, q), 2)
+    summary["max"] = round(ordered[-1], 2) if ordered else 0.0
+    return summary
+
+
+def parse_metric_totals(text: str) -> dict[str, float]:
+    """Sum Prometheus text-format samples by metric name (labels ignored)."""
+    totals: dict[str, float] = defaultdict(float)
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        name = line.split("{", 1)[0].split(" ", 1)[0]
+        totals[name] += float(line.rsplit(" ", 1)[1])
+    return dict(totals)
+
+
+def read_peak_rss_kb(pid: int) -> int | None:
+    """Peak resident set size of a running process (Linux /proc VmHWM)."""
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1])
+    return None
+
+
+def free_port() -> int:
+    """An unused localhost TCP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+async def seed_tasks(run_id: str, tasks: int, channels: int) -> list[uuid.UUID]:
+    """Create channels and QUEUED tasks (round-robin across channels)."""
+    async with async_session_factory() as db, db.begin():  # type: ignore[misc]
+        channel_rows = [
+            Channel(
+                channel_id=f"load-{run_id}-{index}",
+                channel_name=f"Load test {run_id} #{index}",
+                voice_id="FakeLoadTestVoice01",
+            )
+            for index in range(channels)
+        ]
+        db.add_all(channel_rows)
+        await db.flush()
+
+        task_rows = [
+            Task(
+                channel_id=channel_rows[index % channels].id,
+                notion_page_id=uuid.uuid4().hex,
+                title=f"Load test video {index}",
+                topic=f"Load test topic {index}",
+                story_direction="A forest documentary through the seasons",
+                narration_scripts=[
+                    f"Narration for clip {clip}." for clip in range(1, CLIPS_PER_VIDEO + 1)
+                ],
+                sfx_descriptions=[
+                    f"Forest ambience for clip {clip}" for clip in range(1, CLIPS_PER_VIDEO + 1)
+                ],
+                status=TaskStatus.QUEUED,
+                priority=PriorityLevel.NORMAL,
+            )
+            for index in range(tasks)
+        ]
+        db.add_all(task_rows)
+        await db.flush()
+        return [task.id for task in task_rows]
+
+
+async def approve_review_gates(task_ids: list[uuid.UUID]) -> int:
+    """Re-queue tasks waiting at a review gate, as an approval in Notion would.
+
+    Mirrors notion_sync.handle_approval_transition: the task goes back to
+    QUEUED with review_completed_at set, and a worker resumes it.
+
+    Returns:
+        Number of tasks approved.
+    """
+    async with async_session_factory() as db, db.begin():  # type: ignore[misc]
+        result = await db.execute(
+            update(Task)
+            .where(Task.id.in_(task_ids), Task.status.in_(APPROVAL_GATES))
+            .values(status=TaskStatus.QUEUED, review_completed_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+
+async def task_statuses(task_ids: list[uuid.UUID]) -> dict[uuid.UUID, TaskStatus]:
+    """Current status of every seeded task."""
+    async with async_session_factory() as db:  # type: ignore[misc]
+        rows = await db.execute(select(Task.id, Task.status).where(Task.id.in_(task_ids)))
+        return dict(rows.tuples().all())
+
+
+async def start_workers(
+    count: int, env: dict[str, str], workspace: Path, log_dir: Path
+) -> list[Worker]:
+    """Start pipeline worker processes (output goes to log_dir/<name>.log).
+
+    Workers run through tests/load/worker.py, which points the workspace
+    root at `workspace`.
+    """
+    workers = []
+    for index in range(count):
+        name = f"load-worker-{index}"
+        port = free_port()
+        log_path = log_dir / f"{name}.log"
+        with await asyncio.to_thread(log_path.open, "wb") as log_file:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-m",
+                "tests.load.worker",
+                str(workspace),
+                cwd=REPO_ROOT,
+                env={**env, "RAILWAY_SERVICE_NAME": name, "WORKER_METRICS_PORT": str(port)},
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
+        workers.append(Worker(name, process, port))
+    return workers
+
+
+async def scrape_workers(workers: list[Worker]) -> dict[str, float]:
+    """Sum metric totals over every worker's /metrics endpoint."""
+    totals: dict[str, float] = defaultdict(float)
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        for worker in workers:
+            try:
+                response = await client.get(f"http://127.0.0.1:{worker.metrics_port}/metrics")
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                print(f"⚠️  Could not scrape {worker.name}: {e}", file=sys.stderr)
+                continue
+            for name, value in parse_metric_totals(response.text).items():
+                totals[name] += value
+    return dict(totals)
+
+
+async def stop_workers(workers: list[Worker]) -> None:
+    """Record peak RSS, then SIGTERM each worker (SIGKILL if it does not exit)."""
+    for worker in workers:
+        worker.peak_rss_kb = read_peak_rss_kb(worker.process.pid)
+        if worker.process.returncode is None:
+            worker.process.send_signal(signal.SIGTERM)
+    for worker in workers:
+        try:
+            await asyncio.wait_for(worker.process.wait(), WORKER_STOP_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            worker.process.kill()
+            await worker.process.wait()
+
+
+async def wait_for_completion(
+    task_ids: list[uuid.UUID], workers: list[Worker], timeout_seconds: float
+) -> dict[uuid.UUID, TaskStatus]:
+    """Approve review gates until every task is finished, or timeout.
+
+    A task is finished at FINAL_REVIEW or in an error status (retries
+    exhausted or permanent error); both polls in a row must agree, since a
+    transient error is re-queued right after its error status is written.
+    """
+    terminal = {TaskStatus.FINAL_REVIEW, *ERROR_STATUSES}
+    deadline = time.monotonic() + timeout_seconds
+    last_progress = 0.0
+    previously_settled = False
+    statuses: dict[uuid.UUID, TaskStatus] = {}
+    while time.monotonic() < deadline:
+        await approve_review_gates(task_ids)
+        statuses = await task_statuses(task_ids)
+        settled = all(status in terminal for status in statuses.values())
+        if settled and previously_settled:
+            break
+        previously_settled = settled
+
+        if all(worker.process.returncode is not None for worker in workers):
+            print("❌ All workers exited; see the worker logs", file=sys.stderr)
+            break
+        if time.monotonic() - last_progress >= PROGRESS_INTERVAL_SECONDS:
+            last_progress = time.monotonic()
+            counts: dict[str, int] = defaultdict(int)
+            for status in statuses.values():
+                counts[status.value] += 1
+            print(f"⏳ {dict(sorted(counts.items()))}")
+        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+    else:
+        print(f"⚠️  Timeout after {timeout_seconds:.0f}s", file=sys.stderr)
+    return statuses
+
+
+async def build_report(
+    task_ids: list[uuid.UUID],
+    run_start: datetime,
+    elapsed_seconds: float,
+    worker_metrics: dict[str, float],
+    workers: list[Worker],
+    servers: FakeServers,
+) -> dict[str, Any]:
+    """Collect throughput, step latency, DB, memory and API figures."""
+    async with async_session_factory() as db:  # type: ignore[misc]
+        rows = (
+            await db.execute(
+                select(Task.status, Task.step_completion_metadata, Task.review_started_at).where(
+                    Task.id.in_(task_ids)
+                )
+            )
+        ).all()
+
+    step_durations: dict[str, list[float]] = defaultdict(list)
+    end_to_end: list[float] = []
+    status_counts: dict[str, int] = defaultdict(int)
+    for status, metadata, review_started_at in rows:
+        status_counts[status.value] += 1
+        for step, data in (metadata or {}).items():
+            if isinstance(data, dict) and data.get("completed") and data.get("duration_seconds"):
+                step_durations[step].append(float(data["duration_seconds"]))
+        if status == TaskStatus.FINAL_REVIEW and review_started_at is not None:
+            end_to_end.append((review_started_at - run_start).total_seconds())
+
+    completed = status_counts.get(TaskStatus.FINAL_REVIEW.value, 0)
+    db_statements = int(worker_metrics.get("load_test_db_statements_total", 0))
+    hours = (max(end_to_end) if end_to_end else elapsed_seconds) / 3600
+    worker_rss = {worker.name: worker.peak_rss_kb for worker in workers}
+    known_rss = [kb for kb in worker_rss.values() if kb is not None]
+    return {
+        "tasks": len(task_ids),
+        "workers": len(workers),
+        "elapsed_seconds": round(elapsed_seconds, 1),
+        "status_counts": dict(sorted(status_counts.items())),
+        "completed": completed,
+        "videos_per_hour": round(completed / hours, 2) if hours > 0 else 0.0,
+        "end_to_end_seconds": summarize(end_to_end),
+        "step_duration_seconds": {
+            step: summarize(values) for step, values in sorted(step_durations.items())
+        },
+        "db_statements": {
+            "total": db_statements,
+            "per_video": round(db_statements / completed, 1) if completed else None,
+        },
+        "peak_rss_mb": {
+            "workers": {
+                name: round(kb / 1024, 1) if kb is not None else None
+                for name, kb in worker_rss.items()
+            },
+            "max_worker": round(max(known_rss) / 1024, 1) if known_rss else None,
+            # ru_maxrss is in KB on Linux: largest worker or CLI script process
+            "max_process": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+        },
+        "external_api": servers.stats(),
+        "worker_metrics": {
+            name: worker_metrics[name]
+            for name in (
+                "external_api_requests_total",
+                "rate_limiter_wait_seconds_sum",
+                "rate_limiter_wait_seconds_count",
+                "db_session_checkout_seconds_sum",
+            )
+            if name in worker_metrics
+        },
+    }
+
+
+def scaled_profiles(args: argparse.Namespace) -> dict[str, FakeApiProfile]:
+    """DEFAULT_PROFILES with latencies scaled and 429 rates overridden."""
+    rates = {"kling": args.kling_429_rate, "gemini": args.gemini_429_rate}
+    return {
+        name: FakeApiProfile(
+            profile.latency.scaled(args.time_scale),
+            profile.error_429_rate if rates.get(name) is None else rates[name],
+            profile.retry_after_seconds,
+        )
+        for name, profile in DEFAULT_PROFILES.items()
+    }
+
+
+async def run(args: argparse.Namespace, work_dir: Path) -> dict[str, Any]:
+    """Run one load test and return the report."""
+    migrate = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "alembic", "upgrade", "head", cwd=REPO_ROOT
+    )
+    if await migrate.wait() != 0:
+        raise RuntimeError("alembic upgrade head failed")
+
+    media = FakeMedia.render(work_dir / "media")
+    workspace = work_dir / "workspace"
+    log_dir = work_dir / "logs"
+    workspace.mkdir()
+    log_dir.mkdir()
+
+    with FakeServers(media, scaled_profiles(args), seed=args.seed) as servers:
+        env = {
+            **os.environ,
+            **servers.env(),
+            "KIE_POLL_INTERVAL_SECONDS": str(max(0.1, KIE_POLL_INTERVAL_SECONDS * args.time_scale)),
+            "PYTHONUNBUFFERED": "1",
+        }
+        run_id = uuid.uuid4().hex[:8]
+        task_ids = await seed_tasks(run_id, args.tasks, args.channels)
+        print(
+            f"🚀 Run {run_id}: {args.tasks} tasks, {args.channels} channels, {args.workers} workers"
+        )
+
+        run_start = datetime.now(timezone.utc)
+        started = time.monotonic()
+        workers = await start_workers(args.workers, env, workspace, log_dir)
+        try:
+            await wait_for_completion(task_ids, workers, args.timeout)
+            elapsed = time.monotonic() - started
+            worker_metrics = await scrape_workers(workers)
+        finally:
+            await stop_workers(workers)
+        report = await build_report(task_ids, run_start, elapsed, worker_metrics, workers, servers)
+    report["run_id"] = run_id
+    report["channels"] = args.channels
+    report["time_scale"] = args.time_scale
+    report["logs"] = str(log_dir) if args.keep_work_dir else None
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline load test with fake external APIs")
+    parser.add_argument("--tasks", type=int, default=20, help="Tasks to enqueue")
+    parser.add_argument("--channels", type=int, default=4, help="Channels to spread tasks over")
+    parser.add_argument("--workers", type=int, default=3, help="Pipeline worker processes")
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier for fake API latencies and the Kling poll interval",
+    )
+    parser.add_argument("--kling-429-rate", type=float, default=None, help="Kling 429 fraction")
+    parser.add_argument("--gemini-429-rate", type=float, default=None, help="Gemini 429 fraction")
+    parser.add_argument("--timeout", type=float, default=4 * 3600, help="Seconds before giving up")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for latency sampling")
+    parser.add_argument("--report", default="load-report.json", help="JSON report path")
+    parser.add_argument(
+        "--keep-work-dir", action="store_true", help="Keep workspace, media and worker logs"
+    )
+    args = parser.parse_args()
+
+    if not os.getenv("DATABASE_URL", "").startswith("postgresql"):
+        print("❌ DATABASE_URL must point at a disposable PostgreSQL database", file=sys.stderr)
+        sys.exit(1)
+    if args.tasks < 1 or args.channels < 1 or args.workers < 1:
+        print("❌ --tasks, --channels and --workers must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="load-test-"))
+    try:
+        report = asyncio.run(run(args, work_dir))
+    finally:
+        if not args.keep_work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    Path(args.report).write_text(json.dumps(report, indent=2) + "\n")
+    print(json.dumps(report, indent=2))
+    print(f"\n📄 Report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,499 @@
+"""Fake Kling (KIE.ai), Gemini, ElevenLabs, Notion and catbox servers.
+
+The load-test driver points real pipeline workers at these servers through
+the *_BASE_URL environment overrides, so a full run exercises the worker
+loop, CLI scripts, database and rate limiters without spending API credits.
+
+Behavior:
+    - Latency: Each API samples a log-normal latency fitted to a median and
+      p95 (for Kling, the time until a job succeeds; responses themselves
+      are immediate, like the real job API)
+    - Throttling: A configurable fraction of requests get HTTP 429 with
+      Retry-After (Kling createTask, Gemini, ElevenLabs, catbox)
+    - Notion: Enforces the real limit (3 requests per second per token,
+      sliding window) and answers excess requests with 429 + Retry-After
+    - Media: Responses carry real PNG/MP3/MP4 bytes (FakeMedia.render uses
+      ffmpeg), so composites, probing and assembly run as in production
+
+Usage:
+    media = FakeMedia.render(work_dir)
+    with FakeServers(media) as servers:
+        env = {**os.environ, **servers.env()}
+        ...
+        print(servers.stats())
+
+References:
+    - tests/load/driver.py: Load-test driver
+    - scripts/generate_video.py: KIE.ai job create/poll client
+"""
+
+import asyncio
+import base64
+import json
+import math
+import random
+import shutil
+import socket
+import subprocess
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+from PIL import Image
+
+# z-score of the 95th percentile of a standard normal distribution
+Z_P95 = 1.6449
+
+# Notion API hard limit (requests per second per integration token)
+NOTION_REQUESTS_PER_SECOND = 3
+
+FAKE_API_KEY = "fake-load-test-key"
+
+# 32-hex ids accepted by NotionClient._normalize_database_id
+FAKE_NOTION_DATABASE_ID = "0" * 24 + "10ad7e57"
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Log-normal latency with the given median and 95th percentile (seconds)."""
+
+    median_seconds: float
+    p95_seconds: float
+
+    @property
+    def sigma(self) -> float:
+        """Standard deviation of the underlying normal distribution."""
+        if self.p95_seconds <= self.median_seconds or self.median_seconds <= 0:
+            return 0.0
+        return math.log(self.p95_seconds / self.median_seconds) / Z_P95
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency."""
+        if self.median_seconds <= 0:
+            return 0.0
+        return self.median_seconds * math.exp(self.sigma * rng.gauss(0.0, 1.0))
+
+    def scaled(self, factor: float) -> "LatencyModel":
+        """Same shape with every latency multiplied by factor."""
+        return LatencyModel(self.median_seconds * factor, self.p95_seconds * factor)
+
+
+@dataclass(frozen=True)
+class FakeApiProfile:
+    """How a fake API behaves under load."""
+
+    latency: LatencyModel
+    error_429_rate: float = 0.0
+    retry_after_seconds: int = 1
+
+
+# Rough production latencies (Kling: render time of a 10s clip)
+DEFAULT_PROFILES = {
+    "kling": FakeApiProfile(LatencyModel(90.0, 240.0), error_429_rate=0.02),
+    "gemini": FakeApiProfile(LatencyModel(8.0, 20.0), error_429_rate=0.01),
+    "elevenlabs": FakeApiProfile(LatencyModel(2.0, 5.0)),
+    "notion": FakeApiProfile(LatencyModel(0.2, 0.6)),
+    "catbox": FakeApiProfile(LatencyModel(0.5, 2.0)),
+}
+
+
+@dataclass
+class FakeApiStats:
+    """Requests served by one fake API."""
+
+    requests: int = 0
+    throttled: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable summary for the load report."""
+        ordered = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "throttled_429": self.throttled,
+            "latency_p50_seconds": round(percentile(ordered, 50), 3),
+            "latency_p95_seconds": round(percentile(ordered, 95), 3),
+        }
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Linear-interpolated q-th percentile of sorted values (0.0 if empty)."""
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * min(max(q, 0.0), 100.0) / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@dataclass(frozen=True)
+class FakeMedia:
+    """Bytes returned for generated images, audio and video."""
+
+    image_png: bytes
+    audio_mp3: bytes
+    video_mp4: bytes
+
+    @classmethod
+    def render(cls, work_dir: Path) -> "FakeMedia":
+        """Render a 1920x1080 PNG, a 6s MP3 and a 10s 1080p MP4 (requires ffmpeg).
+
+        Raises:
+            RuntimeError: If ffmpeg is not installed.
+        """
+        if shutil.which("ffmpeg") is None:
+            raise RuntimeError("ffmpeg is required to render fake media")
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+        png = BytesIO()
+        Image.new("RGB", (1920, 1080), (34, 139, 34)).save(png, "PNG")
+
+        audio = work_dir / "fake.mp3"
+        video = work_dir / "fake.mp4"
+        ffmpeg = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-f", "lavfi"]
+        subprocess.run(  # noqa: S603
+            [*ffmpeg, "-i", "sine=frequency=440:duration=6", "-q:a", "9", str(audio)],
+            check=True,
+        )
+        subprocess.run(  # noqa: S603
+            [
+                *ffmpeg,
+                "-i",
+                "testsrc2=size=1920x1080:rate=24:duration=10",
+                "-c:v",
+                "libx264",
+                "-preset",
+                "ultrafast",
+                "-pix_fmt",
+                "yuv420p",
+                str(video),
+            ],
+            check=True,
+        )
+        return cls(png.getvalue(), audio.read_bytes(), video.read_bytes())
+
+
+class FakeApi:
+    """Shared state of one fake API: profile, stats and random source."""
+
+    def __init__(self, profile: FakeApiProfile, seed: int | None = None):
+        """Initialize with a behavior profile (seed makes runs repeatable)."""
+        self.profile = profile
+        self.stats = FakeApiStats()
+        self.rng = random.Random(seed)  # noqa: S311 - latency jitter, not security
+        self._lock = threading.Lock()
+
+    def sample_latency(self) -> float:
+        """Draw a latency and record it."""
+        with self._lock:
+            latency = self.profile.latency.sample(self.rng)
+            self.stats.latencies.append(latency)
+        return latency
+
+    async def respond_delay(self) -> None:
+        """Count the request and sleep for a sampled latency."""
+        self.stats.requests += 1
+        await asyncio.sleep(self.sample_latency())
+
+    def maybe_throttle(self) -> Response | None:
+        """Return a 429 response for the configured fraction of requests."""
+        with self._lock:
+            throttled = self.rng.random() < self.profile.error_429_rate
+        if not throttled:
+            return None
+        return self.throttled()
+
+    def throttled(self, retry_after: int | None = None) -> Response:
+        """Build a 429 response (and count it)."""
+        self.stats.throttled += 1
+        seconds = retry_after if retry_after is not None else self.profile.retry_after_seconds
+        return JSONResponse(
+            {"code": 429, "msg": "rate limited", "status": 429},
+            status_code=429,
+            headers={"Retry-After": str(seconds)},
+        )
+
+
+def _unauthorized() -> Response:
+    return JSONResponse({"code": 401, "msg": "missing API key"}, status_code=401)
+
+
+def create_kling_app(fake: FakeApi, media: FakeMedia) -> FastAPI:
+    """KIE.ai job API: createTask, recordInfo polling and result download."""
+    app = FastAPI()
+    app.state.fake = fake
+    ready_at: dict[str, float] = {}
+
+    @app.post("/api/v1/jobs/createTask")
+    async def create_task(request: Request) -> Response:
+        fake.stats.requests += 1
+        if not request.headers.get("authorization", "").startswith("Bearer "):
+            return _unauthorized()
+        throttled = fake.maybe_throttle()
+        if throttled is not None:
+            return throttled
+        payload = await request.json()
+        if not payload.get("input", {}).get("image_url"):
+            return JSONResponse({"code": 422, "msg": "image_url is required"})
+        task_id = uuid.uuid4().hex
+        ready_at[task_id] = time.monotonic() + fake.sample_latency()
+        return JSONResponse({"code": 200, "msg": "success", "data": {"taskId": task_id}})
+
+    @app.get("/api/v1/jobs/recordInfo")
+    async def record_info(request: Request, taskId: str) -> Response:  # noqa: N803
+        fake.stats.requests += 1
+        if taskId not in ready_at:
+            return JSONResponse({"code": 404, "msg": f"task not found: {taskId}"})
+        data: dict[str, Any] = {"taskId": taskId, "state": "generating"}
+        if time.monotonic() >= ready_at[taskId]:
+            video_url = f"{request.base_url}files/{taskId}.mp4"
+            data = {
+                "taskId": taskId,
+                "state": "success",
+                "resultJson": json.dumps({"resultUrls": [video_url]}),
+            }
+        return JSONResponse({"code": 200, "msg": "success", "data": data})
+
+    @app.get("/files/{name}")
+    async def download(name: str) -> Response:
+        fake.stats.requests += 1
+        return Response(media.video_mp4, media_type="video/mp4")
+
+    return app
+
+
+def create_gemini_app(fake: FakeApi, media: FakeMedia) -> FastAPI:
+    """Gemini generateContent (REST transport) returning an inline PNG."""
+    app = FastAPI()
+    app.state.fake = fake
+    image_b64 = base64.b64encode(media.image_png).decode()
+
+    @app.post("/v1beta/models/{model}:generateContent")
+    async def generate_content(model: str, request: Request) -> Response:
+        if not (request.headers.get("x-goog-api-key") or request.query_params.get("key")):
+            fake.stats.requests += 1
+            return _unauthorized()
+        throttled = fake.maybe_throttle()
+        if throttled is not None:
+            fake.stats.requests += 1
+            return throttled
+        await fake.respond_delay()
+        return JSONResponse(
+            {
+                "candidates": [
+                    {
+                        "content": {
+                            "role": "model",
+                            "parts": [{"inlineData": {"mimeType": "image/png", "data": image_b64}}],
+                        },
+                        "finishReason": "STOP",
+                        "index": 0,
+                    }
+                ],
+                "modelVersion": model,
+            }
+        )
+
+    return app
+
+
+def create_elevenlabs_app(fake: FakeApi, media: FakeMedia) -> FastAPI:
+    """ElevenLabs text-to-speech and sound generation returning MP3."""
+    app = FastAPI()
+    app.state.fake = fake
+
+    async def audio(request: Request) -> Response:
+        if not request.headers.get("xi-api-key"):
+            fake.stats.requests += 1
+            return _unauthorized()
+        throttled = fake.maybe_throttle()
+        if throttled is not None:
+            fake.stats.requests += 1
+            return throttled
+        await fake.respond_delay()
+        return Response(media.audio_mp3, media_type="audio/mpeg")
+
+    app.add_api_route("/v1/text-to-speech/{voice_id}", audio, methods=["POST"])
+    app.add_api_route("/v1/sound-generation", audio, methods=["POST"])
+    return app
+
+
+def create_notion_app(
+    fake: FakeApi, requests_per_second: int = NOTION_REQUESTS_PER_SECOND
+) -> FastAPI:
+    """Notion pages and database query with per-token rate limit enforcement."""
+    app = FastAPI()
+    app.state.fake = fake
+    # Accepted request times per token (sliding one-second window)
+    windows: dict[str, deque[float]] = {}
+
+    def admit(request: Request) -> Response | None:
+        token = request.headers.get("authorization", "")
+        if not token.startswith("Bearer "):
+            fake.stats.requests += 1
+            return _unauthorized()
+        now = time.monotonic()
+        window = windows.setdefault(token, deque())
+        while window and now - window[0] >= 1.0:
+            window.popleft()
+        if len(window) >= requests_per_second:
+            fake.stats.requests += 1
+            return fake.throttled(retry_after=max(1, math.ceil(1.0 - (now - window[0]))))
+        window.append(now)
+        return None
+
+    def page(page_id: str, properties: dict[str, Any] | None = None) -> dict[str, Any]:
+        return {"object": "page", "id": page_id, "properties": properties or {}}
+
+    @app.post("/v1/pages")
+    async def create_page(request: Request) -> Response:
+        rejected = admit(request)
+        if rejected is not None:
+            return rejected
+        body = await request.json()
+        await fake.respond_delay()
+        return JSONResponse(page(str(uuid.uuid4()), body.get("properties")))
+
+    @app.patch("/v1/pages/{page_id}")
+    async def update_page(page_id: str, request: Request) -> Response:
+        rejected = admit(request)
+        if rejected is not None:
+            return rejected
+        body = await request.json()
+        await fake.respond_delay()
+        return JSONResponse(page(page_id, body.get("properties")))
+
+    @app.get("/v1/pages/{page_id}")
+    async def get_page(page_id: str, request: Request) -> Response:
+        rejected = admit(request)
+        if rejected is not None:
+            return rejected
+        await fake.respond_delay()
+        return JSONResponse(page(page_id))
+
+    @app.post("/v1/databases/{database_id}/query")
+    async def query_database(database_id: str, request: Request) -> Response:
+        rejected = admit(request)
+        if rejected is not None:
+            return rejected
+        await fake.respond_delay()
+        return JSONResponse(
+            {"object": "list", "results": [], "has_more": False, "next_cursor": None}
+        )
+
+    return app
+
+
+def create_catbox_app(fake: FakeApi) -> FastAPI:
+    """catbox.moe upload endpoint returning a public URL as plain text."""
+    app = FastAPI()
+    app.state.fake = fake
+
+    @app.post("/user/api.php")
+    async def upload(request: Request) -> Response:
+        await request.body()
+        throttled = fake.maybe_throttle()
+        if throttled is not None:
+            fake.stats.requests += 1
+            return throttled
+        await fake.respond_delay()
+        return PlainTextResponse(f"{request.base_url}files/{uuid.uuid4().hex[:6]}.png")
+
+    return app
+
+
+class FakeServers:
+    """Run every fake API on an ephemeral localhost port (one thread each).
+
+    Servers run in their own threads and event loops so their latency
+    sleeps and request handling never compete with the caller's loop.
+    """
+
+    def __init__(
+        self,
+        media: FakeMedia,
+        profiles: dict[str, FakeApiProfile] | None = None,
+        seed: int | None = None,
+    ):
+        """Initialize fakes (profiles override DEFAULT_PROFILES by API name)."""
+        merged = {**DEFAULT_PROFILES, **(profiles or {})}
+        self.fakes = {
+            name: FakeApi(profile, None if seed is None else seed + index)
+            for index, (name, profile) in enumerate(sorted(merged.items()))
+        }
+        self.apps = {
+            "kling": create_kling_app(self.fakes["kling"], media),
+            "gemini": create_gemini_app(self.fakes["gemini"], media),
+            "elevenlabs": create_elevenlabs_app(self.fakes["elevenlabs"], media),
+            "notion": create_notion_app(self.fakes["notion"]),
+            "catbox": create_catbox_app(self.fakes["catbox"]),
+        }
+        self.urls: dict[str, str] = {}
+        self._servers: list[tuple[uvicorn.Server, threading.Thread]] = []
+
+    def start(self) -> None:
+        """Bind ports and start serving (returns once every server is up)."""
+        for name, app in self.apps.items():
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("127.0.0.1", 0))
+            server = uvicorn.Server(
+                uvicorn.Config(app, log_level="warning", lifespan="off", access_log=False)
+            )
+            thread = threading.Thread(
+                target=server.run, kwargs={"sockets": [sock]}, name=f"fake-{name}", daemon=True
+            )
+            thread.start()
+            self._servers.append((server, thread))
+            self.urls[name] = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        deadline = time.monotonic() + 10
+        while not all(server.started for server, _ in self._servers):
+            if time.monotonic() > deadline:
+                raise RuntimeError("fake API servers did not start")
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        """Stop every server and wait for its thread."""
+        for server, _ in self._servers:
+            server.should_exit = True
+        for _, thread in self._servers:
+            thread.join(timeout=10)
+        self._servers.clear()
+
+    def __enter__(self) -> "FakeServers":
+        """Start servers."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop servers."""
+        self.stop()
+
+    def env(self) -> dict[str, str]:
+        """Environment pointing workers and CLI scripts at the fakes."""
+        return {
+            "KIE_API_BASE_URL": f"{self.urls['kling']}/api/v1",
+            "KIE_API_KEY": FAKE_API_KEY,
+            "GEMINI_API_BASE_URL": self.urls["gemini"],
+            "GEMINI_API_KEY": FAKE_API_KEY,
+            "ELEVENLABS_API_BASE_URL": self.urls["elevenlabs"],
+            "ELEVENLABS_API_KEY": FAKE_API_KEY,
+            "NOTION_API_BASE_URL": f"{self.urls['notion']}/v1",
+            "NOTION_API_TOKEN": FAKE_API_KEY,
+            "NOTION_ASSETS_DATABASE_ID": FAKE_NOTION_DATABASE_ID,
+            "NOTION_VIDEOS_DATABASE_ID": FAKE_NOTION_DATABASE_ID,
+            "NOTION_AUDIO_DATABASE_ID": FAKE_NOTION_DATABASE_ID,
+            "CATBOX_API_URL": f"{self.urls['catbox']}/user/api.php",
+        }
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-API request, 429 and latency summary."""
+        return {name: fake.stats.to_dict() for name, fake in sorted(self.fakes.items())}
@@ -0,0 +1,123 @@
+"""Tests for the load-test fake API servers and report helpers."""
+
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+from tests.load.driver import parse_metric_totals, summarize
+from tests.load.fake_servers import (
+    FAKE_API_KEY,
+    FakeApi,
+    FakeApiProfile,
+    FakeMedia,
+    FakeServers,
+    LatencyModel,
+    create_kling_app,
+    create_notion_app,
+    percentile,
+)
+
+MEDIA = FakeMedia(image_png=b"png", audio_mp3=b"mp3-bytes", video_mp4=b"mp4-bytes")
+INSTANT = FakeApiProfile(LatencyModel(0.0, 0.0))
+
+
+def client_for(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://fake")
+
+
+def test_latency_model_and_report_helpers() -> None:
+    """Samples follow the configured log-normal; report figures are summarized."""
+    model = LatencyModel(median_seconds=2.0, p95_seconds=6.0)
+    rng = random.Random(7)  # noqa: S311
+    samples = sorted(model.sample(rng) for _ in range(20000))
+
+    assert percentile(samples, 50) == pytest.approx(2.0, rel=0.05)
+    assert percentile(samples, 95) == pytest.approx(6.0, rel=0.08)
+    assert model.scaled(0.5) == LatencyModel(1.0, 3.0)
+    assert summarize([3.0, 1.0, 2.0]) == {
+        "count": 3,
+        "p50": 2.0,
+        "p90": 2.8,
+        "p95": 2.9,
+        "p99": 2.98,
+        "max": 3.0,
+    }
+    assert parse_metric_totals(
+        "# TYPE pipeline_steps_total counter\npipeline_steps_total 12\n"
+        'external_api_requests_total{provider="kling",outcome="success"} 3\n'
+        'external_api_requests_total{provider="notion",outcome="error"} 1\n'
+    ) == {"pipeline_steps_total": 12.0, "external_api_requests_total": 4.0}
+
+
+async def test_notion_enforces_three_requests_per_second_per_token() -> None:
+    """Requests over 3/s for a token get 429 with Retry-After; tokens are independent."""
+    fake = FakeApi(INSTANT)
+    async with client_for(create_notion_app(fake)) as client:
+        responses = [
+            await client.patch("/v1/pages/abc", headers={"Authorization": "Bearer a"}, json={})
+            for _ in range(5)
+        ]
+        other = await client.get("/v1/pages/abc", headers={"Authorization": "Bearer b"})
+
+    assert [r.status_code for r in responses] == [200, 200, 200, 429, 429]
+    assert responses[3].headers["Retry-After"] == "1"
+    assert other.status_code == 200
+    assert (fake.stats.requests, fake.stats.throttled) == (6, 2)
+
+
+async def test_kling_job_lifecycle_and_throttling() -> None:
+    """createTask returns a job that succeeds after its latency; 429s are injected."""
+    fake = FakeApi(FakeApiProfile(LatencyModel(0.05, 0.05)))
+    headers = {"Authorization": f"Bearer {FAKE_API_KEY}"}
+    payload = {"input": {"image_url": "https://files.catbox.moe/a.png"}}
+    async with client_for(create_kling_app(fake, MEDIA)) as client:
+        created = await client.post("/api/v1/jobs/createTask", headers=headers, json=payload)
+        task_id = created.json()["data"]["taskId"]
+        poll = {"taskId": task_id}
+
+        pending = await client.get("/api/v1/jobs/recordInfo", headers=headers, params=poll)
+        assert pending.json()["data"]["state"] == "generating"
+        await asyncio.sleep(0.06)
+        done = (await client.get("/api/v1/jobs/recordInfo", headers=headers, params=poll)).json()
+        assert done["data"]["state"] == "success"
+        [video_url] = json.loads(done["data"]["resultJson"])["resultUrls"]
+        assert (await client.get(video_url)).content == MEDIA.video_mp4
+
+        fake.profile = FakeApiProfile(LatencyModel(0.05, 0.05), error_429_rate=1.0)
+        throttled = await client.post("/api/v1/jobs/createTask", headers=headers, json=payload)
+    assert throttled.status_code == 429
+    assert fake.stats.throttled == 1
+
+
+def test_scripts_reach_fake_servers(tmp_path: Path) -> None:
+    """Base URL overrides point CLI scripts at the running fakes."""
+    profiles = dict.fromkeys(("kling", "gemini", "elevenlabs", "notion", "catbox"), INSTANT)
+    output = tmp_path / "clip_01.mp3"
+    with FakeServers(MEDIA, profiles) as servers:
+        result = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                "scripts/generate_audio.py",
+                "--text",
+                "After... the rain...",
+                "--output",
+                str(output),
+            ],
+            env={**os.environ, **servers.env(), "ELEVENLABS_VOICE_ID": "FakeLoadTestVoice01"},
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        stats = servers.stats()
+
+    assert result.returncode == 0, result.stderr
+    assert output.read_bytes() == MEDIA.audio_mp3
+    assert stats["elevenlabs"]["requests"] == 1
@@ -0,0 +1,50 @@
+"""Pipeline worker entry point for the load test driver.
+
+Runs app.workers.pipeline_worker's worker loop with the workspace root
+redirected to a temporary directory, the same way the test suite patches
+filesystem.WORKSPACE_ROOT. Production keeps its fixed Railway volume path.
+
+Every SQL statement the worker sends is counted (before_cursor_execute on
+the shared engine) and exposed on the worker's /metrics endpoint as
+load_test_db_statements_total, which the driver scrapes for its report.
+
+Usage (started by tests/load/driver.py):
+    python -m tests.load.worker /tmp/load-test-xyz/workspace
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event
+
+from app import database
+from app.utils import filesystem
+from app.utils.metrics import REGISTRY, Counter
+from app.workers import pipeline_worker
+
+DB_STATEMENTS = REGISTRY.register(
+    Counter("load_test_db_statements_total", "SQL statements sent by this worker.")
+)
+
+
+def _count_statement(*_: Any) -> None:
+    # executemany() batches count once: one round trip
+    DB_STATEMENTS.inc()
+
+
+def main() -> None:
+    if len(sys.argv) != 2:
+        print("usage: python -m tests.load.worker <workspace_root>", file=sys.stderr)
+        sys.exit(2)
+    filesystem.WORKSPACE_ROOT = Path(sys.argv[1])
+    if database.engine is not None:
+        event.listen(database.engine.sync_engine, "before_cursor_execute", _count_statement)
+    # pipeline_worker.main() reads sys.argv; run the worker loop mode
+    sys.argv = sys.argv[:1]
+    asyncio.run(pipeline_worker.main())
+
+
+if __name__ == "__main__":
+    main()
@@ -866,3 +866,100 @@ class TestChannelConfigLoaderSyncToDatabase:
         assert channel.channel_id == "new_channel_test"
         assert channel.channel_name == "New Channel"
         assert channel.is_active is True
+
+
+class TestIncrementalConfigSync:
+    """Tests for incremental scans and batched database sync."""
+
+    @pytest.fixture(autouse=True)
+    def fernet_key(self, monkeypatch: pytest.MonkeyPatch):
+        """Fresh Fernet key and EncryptionService singleton per test."""
+        monkeypatch.setenv("FERNET_KEY", Fernet.generate_key().decode())
+        EncryptionService.reset_instance()
+        yield
+        EncryptionService.reset_instance()
+
+    @staticmethod
+    def write_config(path: Path, channel_id: str, channel_name: str) -> None:
+        path.write_text(
+            f"channel_id: {channel_id}\n"
+            f'channel_name: "{channel_name}"\n'
+            'notion_database_id: "db1"\n'
+            "storage_strategy: r2\n"
+            "r2_config:\n"
+            "  account_id: account\n"
+            "  access_key_id: access\n"
+            "  secret_access_key: secret\n"
+            "  bucket_name: bucket\n"
+        )
+
+    def test_scan_parses_only_changed_files(self, tmp_path: Path):
+        """Unchanged and touched-but-identical files are not re-parsed."""
+        import os
+
+        self.write_config(tmp_path / "poke1.yaml", "poke1", "Channel 1")
+        self.write_config(tmp_path / "poke2.yaml", "poke2", "Channel 2")
+        self.write_config(tmp_path / "poke3.yaml", "poke3", "Channel 3")
+        loader = ChannelConfigLoader()
+
+        first = loader.scan_configs(tmp_path)
+        assert (first.parsed, first.changed) == (3, {"poke1", "poke2", "poke3"})
+
+        # Touch poke1 without editing, edit poke2, delete poke3
+        os.utime(tmp_path / "poke1.yaml", ns=(0, 0))
+        self.write_config(tmp_path / "poke2.yaml", "poke2", "Channel 2 renamed")
+        (tmp_path / "poke3.yaml").unlink()
+        second = loader.scan_configs(tmp_path)
+
+        assert (second.parsed, second.unchanged) == (1, 1)
+        assert second.changed == {"poke2"}
+        assert second.removed == {"poke3"}
+        assert second.configs["poke2"].channel_name == "Channel 2 renamed"
+        assert second.configs["poke1"] is first.configs["poke1"]
+
+    @pytest.mark.asyncio
+    async def test_sync_all_writes_only_changed_channels(
+        self, async_session: AsyncSession, tmp_path: Path
+    ):
+        """One upsert for new/changed channels; unchanged R2 secrets keep their ciphertext."""
+        from sqlalchemy import event, select
+
+        self.write_config(tmp_path / "poke1.yaml", "poke1", "Channel 1")
+        self.write_config(tmp_path / "poke2.yaml", "poke2", "Channel 2")
+        ConfigManager._instance = None
+        manager = ConfigManager.get_instance(tmp_path)
+
+        created = await manager.reload(async_session)
+        assert created is not None and sorted(created.created) == ["poke1", "poke2"]
+        channels = (await async_session.execute(select(Channel))).scalars().all()
+        ciphertexts = {ch.channel_id: ch.r2_secret_access_key_encrypted for ch in channels}
+
+        # Edit poke1 only; poke2's unchanged file is not even parsed
+        self.write_config(tmp_path / "poke1.yaml", "poke1", "Channel 1 renamed")
+        statements: list[str] = []
+        bind = async_session.bind.sync_engine
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split(None, 1)[0].upper())
+
+        event.listen(bind, "before_cursor_execute", count_statement)
+        try:
+            updated = await manager.reload(async_session)
+            unchanged = await ChannelConfigLoader().sync_all_to_database(
+                manager.get_all_configs().values(), async_session
+            )
+        finally:
+            event.remove(bind, "before_cursor_execute", count_statement)
+
+        assert updated is not None and updated.written == ["poke1"]
+        assert sorted(unchanged.unchanged) == ["poke1", "poke2"]
+        assert statements == ["SELECT", "INSERT", "SELECT"]
+
+        result = await async_session.execute(
+            select(Channel).execution_options(populate_existing=True)
+        )
+        channels = {ch.channel_id: ch for ch in result.scalars()}
+        assert channels["poke1"].channel_name == "Channel 1 renamed"
+        assert {
+            ch.channel_id: ch.r2_secret_access_key_encrypted for ch in channels.values()
+        } == ciphertexts
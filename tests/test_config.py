@@ -17,10 +17,13 @@ from app.config import (
     get_channel_configs_dir,
     get_database_url,
     get_default_voice_id,
+    get_api_concurrency_limit,
+    get_api_lease_ttl_seconds,
     get_fernet_key,
-    get_max_concurrent_asset_gen,
-    get_max_concurrent_audio_gen,
-    get_max_concurrent_video_gen,
+    get_script_pool_max_jobs,
+    get_script_pool_size,
+    get_workspace_gc_interval_seconds,
+    get_workspace_min_free_bytes,
     get_workspace_root,
 )
 
@@ -280,88 +283,92 @@ class TestConfigIntegration:
         assert workspace == "/workspace"
 
 
-class TestParallelismConfiguration:
-    """Tests for parallelism configuration (Story 4.6)."""
+class TestApiConcurrencyConfiguration:
+    """Tests for cluster-wide API concurrency configuration."""
 
-    def test_asset_gen_default_value(self, monkeypatch: pytest.MonkeyPatch):
-        """Test get_max_concurrent_asset_gen returns default of 12."""
-        # GIVEN: MAX_CONCURRENT_ASSET_GEN not set
-        monkeypatch.delenv("MAX_CONCURRENT_ASSET_GEN", raising=False)
+    def test_defaults(self, monkeypatch: pytest.MonkeyPatch):
+        """Test provider limits default to the account-wide values."""
+        # GIVEN: No provider limits are set
+        for var in ("GEMINI_MAX_CONCURRENT", "KLING_MAX_CONCURRENT", "ELEVENLABS_MAX_CONCURRENT"):
+            monkeypatch.delenv(var, raising=False)
 
-        # WHEN: Calling get_max_concurrent_asset_gen
-        result = get_max_concurrent_asset_gen()
+        # WHEN/THEN: Defaults match the previous 3-worker totals and Kling's hard limit
+        assert get_api_concurrency_limit("gemini") == 36
+        assert get_api_concurrency_limit("kling") == 10
+        assert get_api_concurrency_limit("elevenlabs") == 18
 
-        # THEN: Returns default value
-        assert result == 12
+    def test_respects_env_var(self, monkeypatch: pytest.MonkeyPatch):
+        """Test provider limit is read from {PROVIDER}_MAX_CONCURRENT."""
+        # GIVEN: KLING_MAX_CONCURRENT is set
+        monkeypatch.setenv("KLING_MAX_CONCURRENT", "8")
 
-    def test_asset_gen_respects_env_var(self, monkeypatch: pytest.MonkeyPatch):
-        """Test get_max_concurrent_asset_gen respects environment variable."""
-        # GIVEN: MAX_CONCURRENT_ASSET_GEN is set
-        monkeypatch.setenv("MAX_CONCURRENT_ASSET_GEN", "8")
+        # WHEN/THEN: Returns configured value
+        assert get_api_concurrency_limit("kling") == 8
 
-        # WHEN: Calling get_max_concurrent_asset_gen
-        result = get_max_concurrent_asset_gen()
+    def test_invalid_and_zero_values(self, monkeypatch: pytest.MonkeyPatch):
+        """Test invalid values fall back to default and zero clamps to one."""
+        monkeypatch.setenv("GEMINI_MAX_CONCURRENT", "lots")
+        monkeypatch.setenv("ELEVENLABS_MAX_CONCURRENT", "0")
 
-        # THEN: Returns configured value
-        assert result == 8
+        assert get_api_concurrency_limit("gemini") == 36
+        assert get_api_concurrency_limit("elevenlabs") == 1
 
-    def test_video_gen_default_value(self, monkeypatch: pytest.MonkeyPatch):
-        """Test get_max_concurrent_video_gen returns default of 3."""
-        # GIVEN: MAX_CONCURRENT_VIDEO_GEN not set
-        monkeypatch.delenv("MAX_CONCURRENT_VIDEO_GEN", raising=False)
+    def test_unknown_provider_raises(self):
+        """Test unknown providers are rejected."""
+        with pytest.raises(ValueError, match="Unknown API provider"):
+            get_api_concurrency_limit("youtube")
 
-        # WHEN: Calling get_max_concurrent_video_gen
-        result = get_max_concurrent_video_gen()
+    def test_lease_ttl(self, monkeypatch: pytest.MonkeyPatch):
+        """Test lease TTL default, override and minimum."""
+        monkeypatch.delenv("API_LEASE_TTL_SECONDS", raising=False)
+        assert get_api_lease_ttl_seconds() == 60
 
-        # THEN: Returns default value (conservative for Kling limit)
-        assert result == 3
+        monkeypatch.setenv("API_LEASE_TTL_SECONDS", "120")
+        assert get_api_lease_ttl_seconds() == 120
 
-    def test_video_gen_respects_env_var(self, monkeypatch: pytest.MonkeyPatch):
-        """Test get_max_concurrent_video_gen respects environment variable."""
-        # GIVEN: MAX_CONCURRENT_VIDEO_GEN is set
-        monkeypatch.setenv("MAX_CONCURRENT_VIDEO_GEN", "5")
+        monkeypatch.setenv("API_LEASE_TTL_SECONDS", "1")
+        assert get_api_lease_ttl_seconds() == 10
 
-        # WHEN: Calling get_max_concurrent_video_gen
-        result = get_max_concurrent_video_gen()
 
-        # THEN: Returns configured value
-        assert result == 5
+class TestScriptPoolConfiguration:
+    """Tests for warm CLI script pool configuration."""
 
-    def test_audio_gen_default_value(self, monkeypatch: pytest.MonkeyPatch):
-        """Test get_max_concurrent_audio_gen returns default of 6."""
-        # GIVEN: MAX_CONCURRENT_AUDIO_GEN not set
-        monkeypatch.delenv("MAX_CONCURRENT_AUDIO_GEN", raising=False)
+    def test_defaults(self, monkeypatch: pytest.MonkeyPatch):
+        """Test pool size and recycling defaults."""
+        monkeypatch.delenv("CLI_SCRIPT_POOL_SIZE", raising=False)
+        monkeypatch.delenv("CLI_SCRIPT_POOL_MAX_JOBS", raising=False)
 
-        # WHEN: Calling get_max_concurrent_audio_gen
-        result = get_max_concurrent_audio_gen()
+        assert get_script_pool_size() == 4
+        assert get_script_pool_max_jobs() == 50
 
-        # THEN: Returns default value
-        assert result == 6
+    def test_zero_disables_pool_and_invalid_falls_back(self, monkeypatch: pytest.MonkeyPatch):
+        """Test size 0 is allowed (pool disabled) and invalid values use defaults."""
+        monkeypatch.setenv("CLI_SCRIPT_POOL_SIZE", "0")
+        monkeypatch.setenv("CLI_SCRIPT_POOL_MAX_JOBS", "many")
 
-    def test_audio_gen_respects_env_var(self, monkeypatch: pytest.MonkeyPatch):
-        """Test get_max_concurrent_audio_gen respects environment variable."""
-        # GIVEN: MAX_CONCURRENT_AUDIO_GEN is set
-        monkeypatch.setenv("MAX_CONCURRENT_AUDIO_GEN", "10")
+        assert get_script_pool_size() == 0
+        assert get_script_pool_max_jobs() == 50
 
-        # WHEN: Calling get_max_concurrent_audio_gen
-        result = get_max_concurrent_audio_gen()
 
-        # THEN: Returns configured value
-        assert result == 10
+class TestWorkspaceRetentionConfiguration:
+    """Tests for workspace retention configuration."""
 
-    def test_all_parallelism_configs_together(self, monkeypatch: pytest.MonkeyPatch):
-        """Test all parallelism configurations can be loaded together."""
-        # GIVEN: All parallelism env vars are set
-        monkeypatch.setenv("MAX_CONCURRENT_ASSET_GEN", "15")
-        monkeypatch.setenv("MAX_CONCURRENT_VIDEO_GEN", "4")
-        monkeypatch.setenv("MAX_CONCURRENT_AUDIO_GEN", "8")
+    def test_defaults(self, monkeypatch: pytest.MonkeyPatch):
+        """Test free-space threshold and sweep interval defaults."""
+        monkeypatch.delenv("WORKSPACE_MIN_FREE_GB", raising=False)
+        monkeypatch.delenv("WORKSPACE_GC_INTERVAL_SECONDS", raising=False)
 
-        # WHEN: Loading all configurations
-        asset = get_max_concurrent_asset_gen()
-        video = get_max_concurrent_video_gen()
-        audio = get_max_concurrent_audio_gen()
+        assert get_workspace_min_free_bytes() == 10 * 1024**3
+        assert get_workspace_gc_interval_seconds() == 600
 
-        # THEN: All values are returned correctly
-        assert asset == 15
-        assert video == 4
-        assert audio == 8
+    def test_fractional_gigabytes_and_clamping(self, monkeypatch: pytest.MonkeyPatch):
+        """Test fractional GB, negative/invalid values and the interval minimum."""
+        monkeypatch.setenv("WORKSPACE_MIN_FREE_GB", "0.5")
+        monkeypatch.setenv("WORKSPACE_GC_INTERVAL_SECONDS", "5")
+        assert get_workspace_min_free_bytes() == 512 * 1024**2
+        assert get_workspace_gc_interval_seconds() == 60
+
+        monkeypatch.setenv("WORKSPACE_MIN_FREE_GB", "-1")
+        monkeypatch.setenv("WORKSPACE_GC_INTERVAL_SECONDS", "often")
+        assert get_workspace_min_free_bytes() == 0
+        assert get_workspace_gc_interval_seconds() == 600
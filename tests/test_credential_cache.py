@@ -0,0 +1,128 @@
+"""Tests for the decrypted credential cache.
+
+This module tests CredentialCache (TTL, LRU eviction, invalidation and
+zeroization) and its use by CredentialService and StorageStrategyService.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from cryptography.fernet import Fernet
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Channel
+from app.services.credential_cache import CredentialCache, credential_cache
+from app.services.credential_service import CredentialService
+from app.services.storage_strategy_service import StorageStrategyService
+from app.utils.encryption import EncryptionService, get_encryption_service
+
+
+@pytest.fixture(autouse=True)
+def encryption_key(monkeypatch: pytest.MonkeyPatch):
+    """Fresh Fernet key and EncryptionService singleton per test."""
+    monkeypatch.setenv("FERNET_KEY", Fernet.generate_key().decode())
+    EncryptionService.reset_instance()
+    yield
+    EncryptionService.reset_instance()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCredentialCache:
+    """Test suite for cache expiry, eviction and zeroization."""
+
+    def test_expired_entry_is_wiped(self) -> None:
+        """Entries expire after the TTL and their buffer is zeroed."""
+        clock = FakeClock()
+        cache = CredentialCache(ttl_seconds=60, clock=clock)
+        cache.put("poke1", "notion_token", "secret_abc")
+        buffer = cache._entries[("poke1", "notion_token")][0]
+
+        assert cache.get("poke1", "notion_token") == (True, "secret_abc")
+        clock.now = 60
+        assert cache.get("poke1", "notion_token") == (False, None)
+        assert buffer == bytearray(len("secret_abc"))
+
+    def test_invalidate_and_evict_wipe_values(self) -> None:
+        """Invalidation drops a channel's entries; LRU eviction drops the oldest."""
+        cache = CredentialCache(ttl_seconds=60, max_entries=2)
+        cache.put("poke1", "notion_token", "secret_1")
+        cache.put("poke1", "gemini_key", "secret_2")
+        evicted = cache._entries[("poke1", "notion_token")][0]
+        cache.put("nature1", "gemini_key", "secret_3")
+
+        assert evicted == bytearray(len("secret_1"))
+        assert cache.get("poke1", "notion_token") == (False, None)
+
+        invalidated = cache._entries[("poke1", "gemini_key")][0]
+        cache.invalidate("poke1")
+        assert invalidated == bytearray(len("secret_2"))
+        assert len(cache) == 1
+
+    def test_zero_ttl_disables_caching(self) -> None:
+        cache = CredentialCache(ttl_seconds=0)
+        cache.put("poke1", "notion_token", "secret_abc")
+
+        assert cache.get("poke1", "notion_token") == (False, None)
+
+
+class TestServicesUseCache:
+    """Test suite for CredentialService and StorageStrategyService caching."""
+
+    async def test_repeat_lookup_skips_database_and_decryption(
+        self, async_session: AsyncSession
+    ) -> None:
+        """Only the first lookup queries and decrypts; store_* invalidates."""
+        async_session.add(Channel(channel_id="poke1", channel_name="Pokemon Channel"))
+        await async_session.commit()
+        service = CredentialService()
+        await service.store_notion_token("poke1", "secret_v1", async_session)
+
+        with patch.object(
+            service, "_get_channel", wraps=service._get_channel
+        ) as get_channel, patch.object(
+            EncryptionService, "decrypt", autospec=True, side_effect=EncryptionService.decrypt
+        ) as decrypt:
+            tokens = [await service.get_notion_token("poke1", async_session) for _ in range(5)]
+            missing = [await service.get_gemini_key("poke1", async_session) for _ in range(3)]
+
+            assert tokens == ["secret_v1"] * 5
+            assert missing == [None] * 3
+            assert get_channel.call_count == 2  # One miss per credential type
+            assert decrypt.call_count == 1
+
+            await service.store_notion_token("poke1", "secret_v2", async_session)
+            assert await service.get_notion_token("poke1", async_session) == "secret_v2"
+
+    async def test_r2_config_cached_until_invalidated(self, async_session: AsyncSession) -> None:
+        """R2 credentials are decrypted once; invalidation reloads them."""
+        encryption = get_encryption_service()
+        channel = Channel(
+            channel_id="r2_channel",
+            channel_name="R2 Storage Channel",
+            storage_strategy="r2",
+            r2_account_id_encrypted=encryption.encrypt("account"),
+            r2_access_key_id_encrypted=encryption.encrypt("access"),
+            r2_secret_access_key_encrypted=encryption.encrypt("secret"),
+            r2_bucket_name="bucket-a",
+        )
+        async_session.add(channel)
+        await async_session.commit()
+        service = StorageStrategyService()
+
+        first = await service.get_r2_config("r2_channel", async_session)
+        channel.r2_bucket_name = "bucket-b"
+        await async_session.commit()
+        cached = await service.get_r2_config("r2_channel", async_session)
+        credential_cache.invalidate("r2_channel")
+        reloaded = await service.get_r2_config("r2_channel", async_session)
+
+        assert first == cached
+        assert cached.secret_access_key == "secret"
+        assert reloaded.bucket_name == "bucket-b"
@@ -15,11 +15,31 @@ from pgqueuer.models import Job
 from pgqueuer import PgQueuer
 
 from app.models import TaskStatus
+from app.services.api_quota_state import QuotaStatus
 
 
-def get_process_video_entrypoint():
-    """Helper to get process_video function after registration."""
+@pytest.fixture(autouse=True)
+def gemini_quota_available():
+    """Report the shared Gemini quota as available (mock sessions hold no quota rows)."""
+    with patch(
+        "app.entrypoints.get_quota_status",
+        AsyncMock(return_value=QuotaStatus(provider="gemini", key_id="unset")),
+    ) as mock_status:
+        yield mock_status
+
+
+def mock_requeue_pgq():
+    """PgQueuer mock whose queries.enqueue records re-enqueued jobs."""
     mock_pgq = MagicMock(spec=PgQueuer)
+    mock_pgq.qm = MagicMock()
+    mock_pgq.qm.queries.enqueue = AsyncMock()
+    return mock_pgq
+
+
+def get_process_video_entrypoint(mock_pgq=None):
+    """Helper to get process_video function after registration."""
+    if mock_pgq is None:
+        mock_pgq = mock_requeue_pgq()
     registered_functions = {}
 
     def mock_entrypoint(name):
@@ -446,3 +466,116 @@ def test_process_video_error_handler_includes_priority():
     # Verify error handler code structure exists
     assert 'except Exception as e:' in source
     assert '_is_retriable_error(e)' in source
+
+
+@pytest.mark.asyncio
+async def test_process_video_defers_task_when_gemini_quota_exhausted(gemini_quota_available):
+    """Test exhausted shared Gemini quota defers the task instead of releasing it."""
+    from datetime import datetime, timedelta, timezone
+
+    process_video = get_process_video_entrypoint()
+    mock_job = MagicMock()
+    mock_job.id = 123
+    mock_job.payload = b"task_555"
+
+    mock_task = MagicMock()
+    mock_task.status = TaskStatus.QUEUED
+    mock_task.step_completion_metadata = None
+    mock_task.priority = "normal"
+    mock_task.channel_id = "channel1"
+
+    mock_db = AsyncMock()
+    mock_db.get = AsyncMock(return_value=mock_task)
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock()
+
+    reset = datetime.now(timezone.utc) + timedelta(hours=3)
+    gemini_quota_available.return_value = QuotaStatus(
+        provider="gemini", key_id="unset", exhausted_until=reset, exhausted_reason="daily"
+    )
+
+    with patch("app.entrypoints.AsyncSessionLocal", return_value=mock_db):
+        await process_video(mock_job)
+
+    # Deferred until reset, status untouched, no second transaction
+    assert mock_task.not_before == reset
+    assert mock_task.status == TaskStatus.QUEUED
+    mock_db.commit.assert_awaited_once()
+    assert mock_db.get.await_count == 1
+
+
+def mock_deferrable_job_and_db(payload):
+    """Job plus session returning one queued task that still needs assets."""
+    mock_job = MagicMock()
+    mock_job.id = 123
+    mock_job.entrypoint = "process_video"
+    mock_job.payload = payload
+    mock_job.priority = 5
+
+    mock_task = MagicMock()
+    mock_task.status = TaskStatus.QUEUED
+    mock_task.step_completion_metadata = None
+    mock_task.priority = "normal"
+    mock_task.channel_id = "channel1"
+
+    mock_db = AsyncMock()
+    mock_db.get = AsyncMock(return_value=mock_task)
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock()
+    return mock_job, mock_task, mock_db
+
+
+@pytest.mark.asyncio
+async def test_process_video_reenqueues_job_deferred_for_gemini_quota(gemini_quota_available):
+    """Test the quota-deferred task gets a new job that runs when the quota resets."""
+    from datetime import datetime, timedelta, timezone
+
+    mock_pgq = mock_requeue_pgq()
+    process_video = get_process_video_entrypoint(mock_pgq)
+    mock_job, _, mock_db = mock_deferrable_job_and_db(b"task_556")
+
+    reset = datetime.now(timezone.utc) + timedelta(hours=3)
+    gemini_quota_available.return_value = QuotaStatus(
+        provider="gemini", key_id="unset", exhausted_until=reset, exhausted_reason="daily"
+    )
+
+    with patch("app.entrypoints.AsyncSessionLocal", return_value=mock_db):
+        await process_video(mock_job)
+
+    # Returning completes this job; the new one waits until not_before
+    mock_pgq.qm.queries.enqueue.assert_awaited_once()
+    args, kwargs = mock_pgq.qm.queries.enqueue.call_args
+    assert args == ("process_video", b"task_556")
+    assert kwargs["priority"] == 5
+    assert timedelta(hours=2, minutes=59) < kwargs["execute_after"] <= timedelta(hours=3)
+
+
+@pytest.mark.asyncio
+async def test_process_video_defers_task_when_api_slots_busy():
+    """Test a task whose API has no free slot is deferred briefly and re-enqueued."""
+    from datetime import datetime, timedelta, timezone
+
+    from app.services.task_deferral import API_SLOT_RETRY_SECONDS
+
+    mock_pgq = mock_requeue_pgq()
+    process_video = get_process_video_entrypoint(mock_pgq)
+    mock_job, mock_task, mock_db = mock_deferrable_job_and_db(b"task_557")
+
+    before = datetime.now(timezone.utc)
+    with (
+        patch("app.entrypoints.AsyncSessionLocal", return_value=mock_db),
+        patch(
+            "app.entrypoints.api_slots.available_slots", AsyncMock(return_value=0)
+        ) as mock_slots,
+    ):
+        await process_video(mock_job)
+
+    mock_slots.assert_awaited_once_with("gemini")
+    # Short jittered deferral instead of an immediate release
+    assert mock_task.status == TaskStatus.QUEUED
+    delay = (mock_task.not_before - before).total_seconds()
+    assert API_SLOT_RETRY_SECONDS * 0.8 <= delay <= API_SLOT_RETRY_SECONDS * 1.2 + 1
+    mock_db.commit.assert_awaited_once()
+
+    execute_after = mock_pgq.qm.queries.enqueue.call_args.kwargs["execute_after"]
+    assert execute_after <= timedelta(seconds=API_SLOT_RETRY_SECONDS * 1.2)
@@ -15,7 +15,12 @@ import pytest
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from generate_video import download_video, poll_task_status, upload_image_to_catbox
+from generate_video import (
+    download_video,
+    generate_video,
+    poll_task_status,
+    upload_image_to_catbox,
+)
 
 from tests.support.factories.image_factory import (
     create_test_image,
@@ -101,6 +106,28 @@ class TestUploadImageToCatbox:
             assert result is None
 
 
+class TestGenerateVideo:
+    """Tests for generate_video function."""
+
+    def test_p1_public_image_url_is_not_uploaded_again(self, tmp_path: Path):
+        """[P1] Should pass an already public image URL to Kling without uploading."""
+        # GIVEN: The catbox URL VideoGenerationService passes as --image
+        image_url = "https://files.catbox.moe/abc123.png"
+        mock_response = MagicMock(status_code=500, text="Internal error")
+
+        with (
+            patch("generate_video.upload_image_to_catbox") as mock_upload,
+            patch("generate_video.requests.post", return_value=mock_response) as mock_post,
+        ):
+            # WHEN: Generating a video
+            result = generate_video(image_url, "Slow pan", str(tmp_path / "clip.mp4"), "key")
+
+        # THEN: The URL goes straight into the Kling request
+        assert result is False
+        mock_upload.assert_not_called()
+        assert image_url in mock_post.call_args.kwargs["data"]
+
+
 class TestPollTaskStatus:
     """Tests for poll_task_status function."""
 
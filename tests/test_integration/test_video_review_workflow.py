@@ -26,6 +26,7 @@ from uuid import uuid4
 
 from app.models import Task, TaskStatus, Channel
 from app.services.webhook_handler import _extract_clip_numbers, _handle_approval_status_change, _handle_rejection_status_change
+from app.services.task_metadata import CLIP_STATUS_FAILED, VIDEO_STEP, get_clips, set_clip_status
 from app.workers.video_generation_worker import process_video_generation_task
 
 
@@ -152,10 +153,8 @@ class TestVideoReviewRejectionFlow:
         assert task.review_completed_at is not None
         assert "Bad motion quality in clips 5, 12, 17" in task.error_log
 
-        # Check failed_clip_numbers in metadata
-        metadata = task.step_completion_metadata or {}
-        assert "failed_clip_numbers" in metadata
-        assert metadata["failed_clip_numbers"] == [5, 12, 17]
+        # Check failed clips recorded for partial regeneration
+        assert await get_clips(db_session, task.id, VIDEO_STEP) == [5, 12, 17]
 
 
 class TestPartialRegeneration:
@@ -195,11 +194,10 @@ class TestPartialRegeneration:
             topic="Pikachu",
             story_direction="Epic nature battles",
             status=TaskStatus.QUEUED,
-            step_completion_metadata={
-                "failed_clip_numbers": [5, 12, 17]
-            },
         )
         db_session.add(task)
+        await db_session.flush()
+        await set_clip_status(db_session, task.id, VIDEO_STEP, [5, 12, 17], CLIP_STATUS_FAILED)
         await db_session.commit()
 
         # Mock video generation service
@@ -240,10 +238,8 @@ class TestPartialRegeneration:
                 # Verify manifest was filtered
                 assert mock_service.generate_videos.called
 
-        # Verify failed_clip_numbers cleared after successful regeneration
-        await db_session.refresh(task)
-        metadata = task.step_completion_metadata or {}
-        assert "failed_clip_numbers" not in metadata
+        # Verify failed clips cleared after successful regeneration
+        assert await get_clips(db_session, task.id, VIDEO_STEP) == []
 
 
 class TestReviewTimestamps:
@@ -192,3 +192,30 @@ class TestRootEndpoint:
         for field in expected_fields:
             assert field in data
         assert len(data) == 6  # Exactly 6 fields
+
+
+class TestMetricsEndpoint:
+    """Tests for /metrics endpoint (Prometheus scrape)."""
+
+    def test_metrics_endpoint_returns_exposition_format(self, client: TestClient) -> None:
+        """[P1] Test metrics endpoint renders Prometheus text format.
+
+        GIVEN: FastAPI application is running
+        WHEN: GET request to /metrics
+        THEN: Returns the registered metric families as text/plain 0.0.4
+        """
+        # WHEN: Scraping metrics
+        response = client.get("/metrics")
+
+        # THEN: Prometheus text format with the standard families
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        for family in (
+            "pipeline_step_duration_seconds",
+            "external_api_request_duration_seconds",
+            "rate_limiter_wait_seconds",
+            "channel_queue_depth",
+            "db_session_checkout_seconds",
+            "subprocesses_in_flight",
+        ):
+            assert f"# TYPE {family} " in response.text
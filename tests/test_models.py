@@ -466,6 +466,9 @@ async def test_invalid_status_transition_draft_to_published(async_session):
         (TaskStatus.DRAFT, TaskStatus.QUEUED, True),
         (TaskStatus.QUEUED, TaskStatus.CLAIMED, True),
         (TaskStatus.CLAIMED, TaskStatus.GENERATING_ASSETS, True),
+        # Resume after approval or a transient retry (completed steps are skipped)
+        (TaskStatus.CLAIMED, TaskStatus.GENERATING_COMPOSITES, True),
+        (TaskStatus.CLAIMED, TaskStatus.GENERATING_AUDIO, True),
         (TaskStatus.GENERATING_ASSETS, TaskStatus.ASSETS_READY, True),
         (TaskStatus.ASSETS_READY, TaskStatus.ASSETS_APPROVED, True),
         (TaskStatus.ASSETS_APPROVED, TaskStatus.GENERATING_COMPOSITES, True),
@@ -14,10 +14,10 @@ from collections import Counter
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Channel, Task, TaskStatus
+from app.models import IN_PROGRESS_STATUSES, PENDING_STATUSES, Channel, Task, TaskStatus
 from app.schemas.channel_config import ChannelConfigSchema
 from app.services.channel_capacity_service import ChannelCapacityService
 from app.services.channel_config_loader import ChannelConfigLoader
@@ -37,6 +37,34 @@ def create_test_task(
     return Task(channel_id=channel_id, status=status, **defaults)
 
 
+async def bulk_insert_tasks(
+    session: AsyncSession,
+    channel_id: uuid.UUID,
+    statuses: list[TaskStatus],
+    prefix: str,
+    **columns: object,
+) -> None:
+    """Insert one task per status with a single Core executemany (scale tests).
+
+    Extra keyword arguments are column values shared by every row.
+    """
+    await session.execute(
+        insert(Task),
+        [
+            {
+                "channel_id": channel_id,
+                "status": status,
+                "notion_page_id": f"{prefix}{i:07d}",
+                "title": "Performance Test Video",
+                "topic": "Performance Test Topic",
+                "story_direction": "Performance test story direction",
+                **columns,
+            }
+            for i, status in enumerate(statuses)
+        ],
+    )
+
+
 @pytest_asyncio.fixture
 async def config_loader() -> ChannelConfigLoader:
     """Create ChannelConfigLoader for testing."""
@@ -123,15 +151,15 @@ class TestDatabasePerformance:
         perf_channel: Channel,
         capacity_service: ChannelCapacityService,
     ) -> None:
-        """Test query performance with large dataset (1000+ tasks).
+        """Test query performance with large dataset (100k tasks).
 
         Validates:
-        - Index effectiveness for status filtering
+        - Capacity reads channel_queue_stats, not the tasks history
         - Channel capacity queries remain fast with scale
         - Target: <100ms for capacity calculation
         """
-        # Given: 1000 tasks with mixed statuses
-        task_count = 1000
+        # Given: 100k tasks with mixed statuses (mostly published history)
+        task_count = 100_000
         statuses = [
             TaskStatus.QUEUED,
             TaskStatus.GENERATING_ASSETS,
@@ -140,18 +168,8 @@ class TestDatabasePerformance:
             TaskStatus.PUBLISHED,
             TaskStatus.ASSET_ERROR,
         ]
-
-        tasks = []
-        for i in range(task_count):
-            status = statuses[i % len(statuses)]
-            task = create_test_task(
-                perf_channel.id,
-                status=status,
-                notion_page_id=f"query{i:04d}" + "0" * 24,
-            )
-            tasks.append(task)
-
-        async_session.add_all(tasks)
+        task_statuses = [statuses[i % len(statuses)] for i in range(task_count)]
+        await bulk_insert_tasks(async_session, perf_channel.id, task_statuses, prefix="query")
         await async_session.commit()
 
         # When: Query channel capacity
@@ -164,8 +182,8 @@ class TestDatabasePerformance:
         # Then: Query completed within target time
         assert query_duration < 100, f"Query took {query_duration:.2f}ms (target: <100ms)"
         assert stats is not None
-        assert stats.pending_count > 0
-        assert stats.in_progress_count > 0
+        assert stats.pending_count == sum(s in PENDING_STATUSES for s in task_statuses)
+        assert stats.in_progress_count == sum(s in IN_PROGRESS_STATUSES for s in task_statuses)
 
         print(f"\n✓ Capacity query with {task_count} tasks: {query_duration:.2f}ms")
 
@@ -478,12 +496,12 @@ class TestMultiChannelScalability:
 
         Validates:
         - Efficient aggregation across all active channels
-        - Single query with GROUP BY (no N+1)
-        - Target: <300ms for 20 channels with 1000 total tasks
+        - Cost independent of task history (channel_queue_stats rows)
+        - Target: <300ms for 20 channels with 100k total tasks
         """
-        # Given: 20 channels with 50 tasks each
+        # Given: 20 channels with 5000 tasks each
         channel_count = 20
-        tasks_per_channel = 50
+        tasks_per_channel = 5000
 
         for i in range(channel_count):
             config = ChannelConfigSchema(
@@ -494,20 +512,13 @@ class TestMultiChannelScalability:
             )
             channel = await config_loader.sync_to_database(config, async_session)
 
-            # Mix of statuses
-            for j in range(tasks_per_channel):
-                if j < 10:
-                    status = TaskStatus.QUEUED
-                elif j < 30:
-                    status = TaskStatus.GENERATING_ASSETS
-                else:
-                    status = TaskStatus.PUBLISHED
-                task = create_test_task(
-                    channel.id,
-                    status=status,
-                    notion_page_id=f"stats{i:02d}{j:03d}" + "0" * 23,
-                )
-                async_session.add(task)
+            # Mix of statuses: 10 queued, 20 in progress, the rest published
+            statuses = (
+                [TaskStatus.QUEUED] * 10
+                + [TaskStatus.GENERATING_ASSETS] * 20
+                + [TaskStatus.PUBLISHED] * (tasks_per_channel - 30)
+            )
+            await bulk_insert_tasks(async_session, channel.id, statuses, prefix=f"stats{i:02d}")
 
         await async_session.commit()
 
@@ -531,6 +542,13 @@ class TestMultiChannelScalability:
         print(f"\n✓ Aggregated stats for {channel_count} channels in {duration:.2f}ms")
         print(f"  Total tasks: {channel_count * tasks_per_channel}")
 
+        # And: Trigger-maintained counts match a full recount (no repair needed)
+        from app.services.channel_queue_stats import reconcile_queue_stats
+
+        start_time = time.time()
+        assert await reconcile_queue_stats(async_session) == 0
+        print(f"  Reconciliation (full recount): {(time.time() - start_time) * 1000:.2f}ms")
+
 
 class TestMemoryAndResourceUsage:
     """Performance tests for memory efficiency and resource management."""
@@ -638,6 +656,78 @@ class TestMemoryAndResourceUsage:
         print(f"  Max: {max_duration:.2f}ms")
 
 
+class TestTaskListViews:
+    """Dashboard list views over a large task history."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_p2_keyset_list_vs_full_orm_load(
+        self,
+        async_session: AsyncSession,
+        perf_channel: Channel,
+    ) -> None:
+        """Keyset pages of TaskSummary rows vs loading full Task objects.
+
+        Validates:
+        - First page of list_tasks stays fast with 100k tasks carrying heavy
+          JSONB columns (narration scripts, step metadata)
+        - Walking every page returns each review-gate task exactly once
+        - Target: first page <50ms and well under the full ORM load
+        """
+        from app.models import REVIEW_GATE_STATUSES
+        from app.services.task_service import list_tasks
+
+        # Given: 100k tasks, 1 in 10 waiting at a review gate
+        task_count = 100_000
+        statuses = [
+            TaskStatus.ASSETS_READY if i % 10 == 0 else TaskStatus.PUBLISHED
+            for i in range(task_count)
+        ]
+        await bulk_insert_tasks(
+            async_session,
+            perf_channel.id,
+            statuses,
+            "list",
+            narration_scripts=["Narration paragraph for one clip. " * 8] * 18,
+            step_completion_metadata={f"step_{n}": {"completed": True} for n in range(8)},
+        )
+        await async_session.commit()
+        review_count = statuses.count(TaskStatus.ASSETS_READY)
+
+        # When: First keyset page (projection, no ORM objects)
+        start_time = time.perf_counter()
+        page = await list_tasks(async_session, REVIEW_GATE_STATUSES, limit=50)
+        first_page_ms = (time.perf_counter() - start_time) * 1000
+
+        # And: The old pattern, full Task objects for every review-gate task
+        start_time = time.perf_counter()
+        full = (
+            (await async_session.execute(select(Task).where(Task.status.in_(REVIEW_GATE_STATUSES))))
+            .scalars()
+            .all()
+        )
+        full_load_ms = (time.perf_counter() - start_time) * 1000
+        async_session.expunge_all()
+
+        # Then: Walking every page covers each task once
+        seen = [summary.id for summary in page.items]
+        while page.next_cursor is not None:
+            page = await list_tasks(
+                async_session, REVIEW_GATE_STATUSES, after=page.next_cursor, limit=500
+            )
+            seen.extend(summary.id for summary in page.items)
+
+        assert len(full) == review_count
+        assert len(seen) == review_count
+        assert len(set(seen)) == review_count
+        assert first_page_ms < 50, f"First page: {first_page_ms:.2f}ms (target: <50ms)"
+        assert first_page_ms < full_load_ms
+
+        print(f"\n✓ Listed {review_count} review tasks out of {task_count}")
+        print(f"  First keyset page: {first_page_ms:.2f}ms")
+        print(f"  Full ORM load: {full_load_ms:.2f}ms")
+
+
 class TestIndexEffectiveness:
     """Performance tests validating database index effectiveness."""
 
@@ -744,3 +834,340 @@ class TestIndexEffectiveness:
         assert len(filtered_tasks) == 334  # ~1/3 of tasks
 
         print(f"\n✓ Composite index query on {task_count} tasks: {duration:.2f}ms")
+
+
+class TestSchedulerFairness:
+    """Per-channel latency benchmarks for claim policies (see app.queue)."""
+
+    @pytest.mark.slow
+    def test_p2_fair_share_latency_under_skewed_load(self) -> None:
+        """Compare per-channel queue wait under a skewed multi-channel backlog.
+
+        Validates:
+        - A light channel is not starved behind an alphabetically earlier
+          heavy channel (the ROUND_ROBIN_QUERY failure mode)
+        - Total throughput (makespan) is unchanged by fair-share ordering
+        - Target: light channel p95 wait at least 5x lower with fair share
+        """
+        from app.services.scheduler_simulation import (
+            FairSharePolicy,
+            RoundRobinPolicy,
+            SimulatedTask,
+            simulate,
+        )
+
+        # Given: one bulk-loaded channel, two steady light channels, 3 workers (Railway)
+        workload = {  # channel_id: (task count, seconds between arrivals)
+            "alpha_heavy": (300, 5.0),
+            "mid_light": (20, 900.0),
+            "zeta_light": (10, 1800.0),
+        }
+        tasks = [
+            SimulatedTask(f"{channel}-{i:04d}", channel, i * spacing, 600.0 + (i % 7) * 60.0)
+            for channel, (count, spacing) in workload.items()
+            for i in range(count)
+        ]
+
+        # When: Replay the same workload through both policies
+        results = {
+            policy.name: simulate(
+                tasks, policy, workers=3, max_concurrent={"alpha_heavy": 3}, default_max_concurrent=2
+            )
+            for policy in (RoundRobinPolicy(), FairSharePolicy())
+        }
+
+        print(f"\n{'policy':<12} {'channel':<12} {'claimed':>7} {'p50 (s)':>10} {'p95 (s)':>10}")
+        for name, result in results.items():
+            for stats in result.channel_stats():
+                print(
+                    f"{name:<12} {stats.channel_id:<12} {stats.claimed:>7} "
+                    f"{stats.p50_wait_seconds:>10.0f} {stats.p95_wait_seconds:>10.0f}"
+                )
+
+        # Then: Light channels see dramatically lower tail latency
+        rr = {s.channel_id: s for s in results["round_robin"].channel_stats()}
+        fs = {s.channel_id: s for s in results["fair_share"].channel_stats()}
+        assert fs["zeta_light"].p95_wait_seconds * 5 < rr["zeta_light"].p95_wait_seconds
+        assert fs["mid_light"].p95_wait_seconds * 5 < rr["mid_light"].p95_wait_seconds
+
+        # And: Work-conserving - same makespan for the same workload
+        assert results["fair_share"].makespan_seconds == pytest.approx(
+            results["round_robin"].makespan_seconds, rel=0.05
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_p2_replay_shortest_remaining_work_from_history(
+        self,
+        async_session: AsyncSession,
+        perf_channel: Channel,
+    ) -> None:
+        """Replay recorded task histories through duration-aware scheduling.
+
+        Validates:
+        - Step percentiles are derived from step_completion_metadata history
+        - Shortest-remaining-work-first lowers mean time to FINAL_REVIEW
+        - Starvation protection bounds the worst-case turnaround
+        - Target: mean turnaround at least 10% lower than plain fair share
+        """
+        from datetime import datetime, timedelta, timezone
+
+        from app.services.scheduler_simulation import (
+            FairSharePolicy,
+            ShortestRemainingWorkPolicy,
+            simulate,
+            tasks_from_history,
+        )
+        from app.services.work_estimator import build_step_estimates, collect_step_history
+
+        # Given: 200 recorded tasks created in Notion batches of 40 every 4 hours with realistic step timings
+        epoch = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        step_seconds = {
+            "asset_generation": 420.0,
+            "composite_creation": 60.0,
+            "video_generation": 2400.0,
+            "narration_generation": 240.0,
+            "sfx_generation": 180.0,
+            "video_assembly": 90.0,
+        }
+        async_session.add_all(
+            create_test_task(
+                perf_channel.id,
+                status=TaskStatus.PUBLISHED,
+                notion_page_id=f"hist{i:04d}" + "0" * 24,
+                created_at=epoch + timedelta(hours=4 * (i // 40), seconds=i % 40),
+                step_completion_metadata={
+                    step: {"completed": True, "duration_seconds": seconds * (0.6 + (i % 9) * 0.1)}
+                    for step, seconds in step_seconds.items()
+                },
+                pipeline_cost_usd=6.0 + (i % 8),
+            )
+            for i in range(200)
+        )
+        await async_session.commit()
+
+        start_time = time.time()
+        durations, costs = await collect_step_history(async_session)
+        estimates = build_step_estimates(durations, costs, [perf_channel.id])
+        history = (
+            (await async_session.execute(select(Task).where(Task.channel_id == perf_channel.id)))
+            .scalars()
+            .all()
+        )
+        replay = tasks_from_history(list(history), estimates, resume_delay_seconds=900.0)
+
+        # When: Replay through both policies (10 concurrent slots, 10 workers)
+        results = {
+            policy.name: simulate(replay, policy, workers=10, default_max_concurrent=10)
+            for policy in (FairSharePolicy(), ShortestRemainingWorkPolicy())
+        }
+        duration = time.time() - start_time
+
+        for name, result in results.items():
+            stats = result.channel_stats()[0]
+            print(
+                f"\n{name:<24} mean to FINAL_REVIEW {stats.mean_turnaround_seconds / 3600:6.2f}h"
+                f"  worst {stats.max_turnaround_seconds / 3600:6.2f}h"
+                f"  p95 queue wait {stats.p95_wait_seconds / 60:7.1f}min"
+            )
+        print(f"  Estimated + replayed {len(replay)} tasks in {duration:.2f}s")
+
+        # Then: Duration-aware ordering finishes tasks sooner on average
+        fair = results["fair_share"]
+        srw = results["shortest_remaining_work"]
+        assert srw.mean_turnaround_seconds < fair.mean_turnaround_seconds * 0.9
+
+        # And: Starvation protection keeps the worst case no worse than fair share
+        channel_key = str(perf_channel.id)
+        assert max(srw.turnaround_seconds[channel_key]) <= max(
+            fair.turnaround_seconds[channel_key]
+        )
+
+
+class TestScriptStartupOverhead:
+    """Benchmark per-invocation CLI script overhead: one-off subprocess vs warm pool."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_p2_warm_pool_removes_interpreter_startup(self) -> None:
+        """Test warm runners skip interpreter startup and heavy imports.
+
+        Validates:
+        - The no-op script imports what the real scripts import (PIL, requests, dotenv)
+        - Warm pool per-invocation overhead is well below a cold subprocess
+        """
+        from pathlib import Path
+
+        from app.utils.cli_wrapper import run_cli_script
+        from app.utils.script_pool import ScriptPool
+
+        # Given: A no-op script with the CLI scripts' heavy imports
+        script_path = Path("scripts") / f"_bench_startup_{uuid.uuid4().hex[:8]}.py"
+        script_path.write_text(
+            "import requests\n"
+            "from dotenv import load_dotenv\n"
+            "from PIL import Image\n\n\n"
+            "def main():\n"
+            "    print('ok')\n\n\n"
+            "if __name__ == '__main__':\n"
+            "    main()\n"
+        )
+        pool = ScriptPool(size=1, max_jobs=100, pooled_scripts=frozenset({script_path.name}))
+        invocations = 5
+
+        try:
+            # When: Running it cold (one-off subprocess per call)
+            start_time = time.perf_counter()
+            for _ in range(invocations):
+                await run_cli_script(script_path.name, [], timeout=60)
+            cold = (time.perf_counter() - start_time) / invocations
+
+            # And: Running it warm (first call starts the runner, not timed)
+            await pool.start()
+            start_time = time.perf_counter()
+            for _ in range(invocations):
+                run = await pool.run(script_path.name, script_path.resolve(), [], None, 60)
+                assert run is not None and run.stdout == "ok"
+            warm = (time.perf_counter() - start_time) / invocations
+        finally:
+            await pool.close()
+            script_path.unlink(missing_ok=True)
+
+        print(f"\n  Per-invocation overhead: cold {cold * 1000:.1f}ms, warm {warm * 1000:.1f}ms")
+
+        # Then: Warm invocations cost a fraction of interpreter startup + imports
+        assert warm < cold / 3
+
+
+class TestPipelineQueryCount:
+    """Benchmark database statements issued per pipeline run."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_p2_pipeline_run_statement_budget(
+        self,
+        async_engine,
+        async_session: AsyncSession,
+        perf_channel: Channel,
+    ) -> None:
+        """Test a pipeline run to the first review gate stays within a statement budget.
+
+        Validates:
+        - Status changes are single UPDATE ... RETURNING statements (no task load)
+        - The Notion sync uses the returned snapshot (no re-read)
+        - Task and channel load in one query
+        """
+        from unittest.mock import AsyncMock, Mock, patch
+
+        from sqlalchemy import event
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        from app.services.pipeline_orchestrator import (
+            PipelineOrchestrator,
+            PipelineStep,
+            StepCompletion,
+        )
+
+        # Given: A claimed task
+        task = create_test_task(perf_channel.id, status=TaskStatus.CLAIMED)
+        async_session.add(task)
+        await async_session.commit()
+        orchestrator = PipelineOrchestrator(task_id=task.id)  # UUID for SQLite lookups
+        orchestrator.log = Mock()  # JSON logger cannot serialize the UUID task_id
+
+        statements: list[str] = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split(None, 1)[0].upper())
+
+        # When: Running the pipeline (asset step mocked) to the ASSETS_READY gate
+        event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+        try:
+            with (
+                patch(
+                    "app.services.pipeline_orchestrator.async_session_factory",
+                    async_sessionmaker(async_engine, expire_on_commit=False),
+                ),
+                patch.object(
+                    orchestrator,
+                    "execute_step",
+                    new_callable=AsyncMock,
+                    return_value=StepCompletion(
+                        step=PipelineStep.ASSET_GENERATION, completed=True, duration_seconds=1.0
+                    ),
+                ),
+                patch.object(
+                    orchestrator, "_measure_workspace", new_callable=AsyncMock, return_value=None
+                ),
+                patch.object(orchestrator, "_sync_to_notion_async", new_callable=AsyncMock) as sync,
+            ):
+                await orchestrator.execute_pipeline()
+                await asyncio.sleep(0)  # Let the fire-and-forget syncs run
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+
+        counts = Counter(statements)
+        print(f"\n✓ Pipeline run to ASSETS_READY: {len(statements)} statements {dict(counts)}")
+
+        # Then: The task reached the gate, each sync got a snapshot
+        await async_session.refresh(task)
+        assert task.status == TaskStatus.ASSETS_READY
+        assert all(call.args[1] is not None for call in sync.call_args_list)
+
+        # And: Loads (task+channel, artifacts, step metadata), start time UPDATE,
+        # 2 status UPDATEs + 2 event INSERTs, step metadata UPDATE
+        assert counts["SELECT"] <= 3
+        assert len(statements) <= 9
+
+
+class TestCredentialLookupThroughput:
+    """Benchmark decrypted credential lookups: database + Fernet vs cache."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_p2_cached_credential_lookups(
+        self,
+        async_session: AsyncSession,
+        perf_channel: Channel,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test cached credential lookups skip the query and decryption.
+
+        Validates:
+        - Cached lookups return the stored token
+        - Cached lookups/sec are well above uncached lookups/sec
+        """
+        from cryptography.fernet import Fernet
+
+        from app.services.credential_cache import credential_cache
+        from app.services.credential_service import CredentialService
+        from app.utils.encryption import EncryptionService
+
+        # Given: A channel with an encrypted Notion token
+        monkeypatch.setenv("FERNET_KEY", Fernet.generate_key().decode())
+        EncryptionService.reset_instance()
+        service = CredentialService()
+        await service.store_notion_token(perf_channel.channel_id, "secret_token", async_session)
+        lookups = 200
+
+        try:
+            # When: Looking it up with the cache emptied before every call
+            start_time = time.perf_counter()
+            for _ in range(lookups):
+                credential_cache.clear()
+                await service.get_notion_token(perf_channel.channel_id, async_session)
+            uncached = lookups / (time.perf_counter() - start_time)
+
+            # And: Looking it up through the cache
+            start_time = time.perf_counter()
+            for _ in range(lookups):
+                token = await service.get_notion_token(perf_channel.channel_id, async_session)
+            cached = lookups / (time.perf_counter() - start_time)
+        finally:
+            EncryptionService.reset_instance()
+
+        print(f"\n  Credential lookups/sec: uncached {uncached:,.0f}, cached {cached:,.0f}")
+
+        # Then: Cached lookups are at least 10x faster
+        assert token == "secret_token"
+        assert cached > uncached * 10
@@ -15,7 +15,18 @@ import os
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import asyncpg
-from app.queue import initialize_pgqueuer, PRIORITY_QUERY, ROUND_ROBIN_QUERY, extract_query_ordering
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from app.queue import (
+    PRIORITY_QUERY,
+    ROUND_ROBIN_QUERY,
+    STARVATION_THRESHOLD_SECONDS,
+    extract_query_ordering,
+    fair_share_claim_statement,
+    initialize_pgqueuer,
+)
 
 
 @pytest.mark.asyncio
@@ -150,8 +161,8 @@ async def test_initialize_pgqueuer_driver_and_pgqueuer_creation():
         # Verify driver created with pool
         mock_driver.assert_called_once_with(mock_pool)
 
-        # Verify PgQueuer created with driver and round-robin query (Story 4.4)
-        mock_pgqueuer.assert_called_once_with(mock_driver_instance, query=ROUND_ROBIN_QUERY)
+        # Verify PgQueuer created with driver only (claiming runs in claim_next_task)
+        mock_pgqueuer.assert_called_once_with(mock_driver_instance)
 
         # Verify return values
         assert pgq == mock_pgqueuer_instance
@@ -185,8 +196,8 @@ async def test_initialize_pgqueuer_return_values():
 
 
 @pytest.mark.asyncio
-async def test_round_robin_query_passed_to_pgqueuer():
-    """Test PgQueuer is initialized with round-robin query (Story 4.4)."""
+async def test_pgqueuer_not_given_custom_query():
+    """Test PgQueuer is created without a custom query keyword (not in its API)."""
     mock_pool = MagicMock(spec=asyncpg.Pool)
     mock_qm = MagicMock()
     mock_qm.queries.install = AsyncMock()
@@ -203,8 +214,9 @@ async def test_round_robin_query_passed_to_pgqueuer():
 
         await initialize_pgqueuer()
 
-        # Verify PgQueuer created with driver AND custom round-robin query
-        mock_pgqueuer.assert_called_once_with(mock_driver_instance, query=ROUND_ROBIN_QUERY)
+        # PgQueuer.__init__ has no query parameter; fair share lives in the claim
+        mock_pgqueuer.assert_called_once_with(mock_driver_instance)
+        assert "query" not in mock_pgqueuer.call_args.kwargs
 
 
 def test_priority_query_structure():
@@ -376,3 +388,72 @@ def test_round_robin_query_comments():
     lines_with_channel = [line for line in ROUND_ROBIN_QUERY.split('\n') if 'channel_id' in line]
     assert any('--' in line for line in lines_with_channel), \
         "channel_id line should have inline comment explaining round-robin"
+
+
+def _fair_share_sql() -> str:
+    """Render the fair-share claim for PostgreSQL with literal parameters."""
+    stmt = fair_share_claim_statement(0.5, datetime(2026, 1, 18, tzinfo=timezone.utc))
+    return str(
+        stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+def test_fair_share_claim_structure():
+    """Test the fair-share claim locks one queued task and honors channel capacity."""
+    sql = _fair_share_sql()
+
+    # Atomic claiming of a single queued task
+    assert "FOR UPDATE OF tasks SKIP LOCKED" in sql
+    assert "LIMIT 1" in sql
+    assert "tasks.status = 'queued'" in sql
+
+    # Per-channel capacity from Channel.max_concurrent via channel_queue_stats
+    assert "channel_queue_stats" in sql
+    assert "< channels.max_concurrent" in sql
+    assert "'claimed'" in sql  # in-progress statuses are counted
+
+
+def test_fair_share_claim_ordering():
+    """Test the claim orders priority → virtual time → starvation → remaining work → FIFO."""
+    order_by = _fair_share_sql().split("ORDER BY")[-1]
+    priority_pos = order_by.find("tasks.priority")
+    fair_share_pos = order_by.find("channels.scheduler_virtual_time")
+    starvation_pos = order_by.find("tasks.queued_at <=")
+    remaining_pos = order_by.find("tasks.predicted_remaining_seconds ASC NULLS LAST")
+    cost_pos = order_by.find("tasks.predicted_remaining_cost_usd ASC NULLS LAST")
+    fifo_pos = order_by.find("tasks.created_at ASC")
+
+    assert -1 < priority_pos < fair_share_pos < starvation_pos < remaining_pos < cost_pos < fifo_pos
+    # Remaining work is a persisted column, not a per-claim aggregate
+    assert "step_duration_stats" not in order_by
+    # Lagging channels are clamped up to the system clock
+    assert "WHEN (channels.scheduler_virtual_time > 0.5)" in order_by
+    # Queue age comes from queued_at; updated_at moves while a task waits
+    assert "updated_at" not in order_by
+    assert "NULLS LAST" in order_by
+
+
+def test_fair_share_claim_ranks_priority_explicitly():
+    """Test priority is ranked with CASE, not by column sort order."""
+    order_by = _fair_share_sql().split("ORDER BY")[-1]
+
+    # 'low' sorts before 'normal' as a string column; the rank must be explicit
+    assert "tasks.priority ASC" not in order_by
+    assert order_by.lstrip().startswith("CASE WHEN (tasks.priority")
+
+
+def test_fair_share_claim_skips_inactive_channels():
+    """Test the claim never selects work for inactive channels."""
+    assert "channels.is_active IS true" in _fair_share_sql()
+
+
+def test_fair_share_claim_starvation_threshold():
+    """Test starvation protection uses STARVATION_THRESHOLD_SECONDS."""
+    assert STARVATION_THRESHOLD_SECONDS == 7200  # NFR-P1 2-hour target
+    assert "tasks.queued_at <= '2026-01-17 22:00:00+00:00'" in _fair_share_sql()
+
+
+def test_extract_query_ordering_fair_share():
+    """Test extract_query_ordering detects the fair-share + remaining work pattern."""
+    pattern = extract_query_ordering(_fair_share_sql())
+    assert pattern == "priority → fair share → shortest remaining work → FIFO"
@@ -0,0 +1,161 @@
+"""Tests for cluster-wide API concurrency coordination.
+
+Tests cover:
+    - try_acquire: Limit enforcement across coordinators (simulated workers)
+    - Expired leases: Takeover of slots held by crashed workers
+    - release / renew: Holder-scoped lease updates
+    - slot(): Context manager release on error, task attribution of leases
+    - Fallback: Process-local semaphores when no database is configured
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.models import ApiSlotLease
+from app.services.api_concurrency import ApiConcurrencyCoordinator, ApiSlotTimeoutError
+
+
+@pytest.fixture
+def session_factory(async_engine: AsyncEngine):
+    return async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+
+@pytest.fixture(autouse=True)
+def kling_limit(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("KLING_MAX_CONCURRENT", "3")
+
+
+async def test_limit_is_shared_across_workers(session_factory):
+    """Test slots are shared: two workers together never exceed the limit."""
+    worker_1 = ApiConcurrencyCoordinator(session_factory, worker_id="worker-1")
+    worker_2 = ApiConcurrencyCoordinator(session_factory, worker_id="worker-2")
+
+    held = [
+        await worker_1.try_acquire("kling"),
+        await worker_2.try_acquire("kling"),
+        await worker_2.try_acquire("kling"),
+    ]
+
+    assert all(held)
+    assert sorted(s.slot for s in held) == [0, 1, 2]
+    assert await worker_1.try_acquire("kling") is None
+    assert await worker_1.available_slots("kling") == 0
+
+    # Worker 2 finishes a request: worker 1 may now use that slot
+    await worker_2.release(held[1])
+    assert await worker_1.available_slots("kling") == 1
+    assert (await worker_1.try_acquire("kling")).slot == held[1].slot
+
+
+async def test_expired_lease_is_taken_over(session_factory):
+    """Test a slot held by a crashed worker becomes free after expiry."""
+    crashed = ApiConcurrencyCoordinator(session_factory, worker_id="crashed")
+    alive = ApiConcurrencyCoordinator(session_factory, worker_id="alive")
+    for _ in range(3):
+        await crashed.try_acquire("kling")
+
+    async with session_factory() as db:
+        await db.execute(
+            update(ApiSlotLease)
+            .where(ApiSlotLease.slot == 0)
+            .values(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        await db.commit()
+
+    taken = await alive.try_acquire("kling")
+
+    assert taken is not None and taken.slot == 0
+    async with session_factory() as db:
+        holder = await db.scalar(select(ApiSlotLease.holder).where(ApiSlotLease.slot == 0))
+    assert holder.startswith("alive:")
+
+
+async def test_renew_and_release_only_affect_own_lease(session_factory):
+    """Test a worker that lost its lease cannot renew or release the new holder's."""
+    first = ApiConcurrencyCoordinator(session_factory, worker_id="first")
+    second = ApiConcurrencyCoordinator(session_factory, worker_id="second")
+    lease = await first.try_acquire("kling")
+    assert await first.renew(lease) is True
+
+    async with session_factory() as db:
+        await db.execute(
+            update(ApiSlotLease).values(
+                expires_at=datetime.now(timezone.utc) - timedelta(seconds=1)
+            )
+        )
+        await db.commit()
+    stolen = await second.try_acquire("kling")
+    assert stolen.slot == lease.slot
+
+    assert await first.renew(lease) is False
+    await first.release(lease)
+    assert await second.available_slots("kling") == 2  # second still holds the slot
+
+
+async def test_slot_context_manager_releases_on_error(session_factory):
+    """Test slot() releases the lease when the API call raises."""
+    coordinator = ApiConcurrencyCoordinator(session_factory, worker_id="worker-1")
+
+    with pytest.raises(RuntimeError):
+        async with coordinator.slot("kling") as held:
+            assert held.slot == 0
+            assert await coordinator.available_slots("kling") == 2
+            raise RuntimeError("Kling 500")
+
+    assert await coordinator.available_slots("kling") == 3
+
+
+async def test_slot_records_task_on_lease(session_factory):
+    """Test a lease names the task it was taken for (leaked lease attribution)."""
+    coordinator = ApiConcurrencyCoordinator(session_factory, worker_id="worker-1")
+    task_id = uuid.uuid4()
+
+    async with coordinator.slot("kling", task_id=task_id) as held:
+        async with session_factory() as db:
+            lease = await db.scalar(
+                select(ApiSlotLease).where(ApiSlotLease.holder == held.holder)
+            )
+        assert lease.task_id == task_id
+
+
+async def test_acquire_times_out_when_all_slots_held(session_factory):
+    """Test acquire raises ApiSlotTimeoutError instead of waiting forever."""
+    coordinator = ApiConcurrencyCoordinator(session_factory, worker_id="worker-1")
+    for _ in range(3):
+        await coordinator.try_acquire("kling")
+
+    with pytest.raises(ApiSlotTimeoutError):
+        await coordinator.acquire("kling", timeout=0.1)
+
+
+async def test_local_fallback_without_database(monkeypatch: pytest.MonkeyPatch):
+    """Test coordinator uses process-local semaphores when no database is set."""
+    monkeypatch.setattr("app.database.async_session_factory", None)
+    coordinator = ApiConcurrencyCoordinator()
+
+    held = [await coordinator.try_acquire("kling") for _ in range(3)]
+
+    assert all(s is not None and s.slot == -1 for s in held)
+    assert await coordinator.try_acquire("kling") is None
+    assert await coordinator.available_slots("kling") == 0
+    await coordinator.release(held[0])
+    assert await coordinator.available_slots("kling") == 1
+
+    # Waiting acquire counts as held as well
+    await coordinator.acquire("kling", timeout=0.1)
+    assert await coordinator.available_slots("kling") == 0
+
+
+async def test_local_fallback_acquire_times_out(monkeypatch: pytest.MonkeyPatch):
+    """Test the process-local wait raises ApiSlotTimeoutError (asyncio.wait_for timeout)."""
+    monkeypatch.setattr("app.database.async_session_factory", None)
+    coordinator = ApiConcurrencyCoordinator()
+    for _ in range(3):
+        await coordinator.try_acquire("kling")
+
+    with pytest.raises(ApiSlotTimeoutError):
+        await coordinator.acquire("kling", timeout=0.05)
@@ -0,0 +1,161 @@
+"""Tests for shared API quota state.
+
+Tests cover:
+    - parse_quota_error: Per-minute vs daily quota detection and reset times
+    - next_pacific_midnight: PST/PDT handling
+    - mark_quota_exhausted / get_quota_status: Shared state round trip
+    - record_api_requests: Requests/minute sampling, lock-free increments
+    - report_gemini_quota_error: Best-effort reporting from error handlers
+    - api_key_id: Key fingerprinting
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ApiQuotaState
+from app.services.api_quota_state import (
+    DEFAULT_PER_MINUTE_WAIT_SECONDS,
+    GEMINI_PROVIDER,
+    api_key_id,
+    get_quota_status,
+    mark_quota_exhausted,
+    next_pacific_midnight,
+    parse_quota_error,
+    record_api_requests,
+    report_gemini_quota_error,
+)
+
+NOW = datetime(2026, 1, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def test_parse_quota_error_per_minute_uses_retry_delay():
+    """Test a per-minute 429 waits for the advertised retryDelay."""
+    stderr = '429 RESOURCE_EXHAUSTED {"quotaId": "GenerateRequestsPerMinute", "retryDelay": "41s"}'
+
+    assert parse_quota_error(stderr, NOW) == (NOW + timedelta(seconds=41), "per_minute")
+    assert parse_quota_error("HTTP 429 Too Many Requests", NOW) == (
+        NOW + timedelta(seconds=DEFAULT_PER_MINUTE_WAIT_SECONDS),
+        "per_minute",
+    )
+
+
+def test_parse_quota_error_daily_waits_for_pacific_midnight():
+    """Test a daily quota error waits until the next midnight Pacific time."""
+    stderr = "429 RESOURCE_EXHAUSTED quotaId: GenerateRequestsPerDayPerProjectPerModel"
+
+    until, reason = parse_quota_error(stderr, NOW)
+
+    assert reason == "daily"
+    assert until == datetime(2026, 1, 19, 8, 0, tzinfo=timezone.utc)  # PST = UTC-8
+
+
+def test_parse_quota_error_ignores_other_errors():
+    """Test non-quota errors are not treated as exhaustion."""
+    assert parse_quota_error("HTTP 500 Internal Server Error", NOW) is None
+
+
+def test_next_pacific_midnight_honors_daylight_saving():
+    """Test PDT (UTC-7) midnight is used in summer, not a UTC approximation."""
+    summer = datetime(2026, 7, 1, 6, 59, tzinfo=timezone.utc)  # 23:59 PDT June 30
+
+    assert next_pacific_midnight(summer) == datetime(2026, 7, 1, 7, 0, tzinfo=timezone.utc)
+
+
+def test_api_key_id_fingerprints_key():
+    """Test keys are fingerprinted, never stored raw."""
+    key_id = api_key_id("AIza-secret")
+
+    assert len(key_id) == 16
+    assert "secret" not in key_id
+    assert key_id == api_key_id("AIza-secret")
+    assert api_key_id(None) == "unset"
+
+
+async def test_mark_quota_exhausted_is_shared_and_never_shortened(async_session: AsyncSession):
+    """Test exhaustion is visible to readers and a shorter wait does not override a longer one."""
+    key_id = api_key_id("key-a")
+    assert (await get_quota_status(async_session, GEMINI_PROVIDER, key_id)).available()
+
+    daily = datetime.now(timezone.utc) + timedelta(hours=10)
+    await mark_quota_exhausted(async_session, GEMINI_PROVIDER, key_id, daily, "daily")
+    effective = await mark_quota_exhausted(
+        async_session,
+        GEMINI_PROVIDER,
+        key_id,
+        datetime.now(timezone.utc) + timedelta(seconds=30),
+        "per_minute",
+    )
+    await async_session.commit()
+
+    status = await get_quota_status(async_session, GEMINI_PROVIDER, key_id)
+    assert effective == daily
+    assert status.exhausted_reason == "daily"
+    assert not status.available()
+    assert status.available(daily + timedelta(seconds=1))
+    # Other keys are unaffected
+    assert (await get_quota_status(async_session, GEMINI_PROVIDER, api_key_id("key-b"))).available()
+
+
+async def test_record_api_requests_samples_requests_per_minute(async_session: AsyncSession):
+    """Test request counts roll into requests_per_minute once a window completes."""
+    key_id = api_key_id("key-a")
+    start = datetime.now(timezone.utc)
+
+    await record_api_requests(async_session, GEMINI_PROVIDER, key_id, count=30, now=start)
+    await record_api_requests(
+        async_session, GEMINI_PROVIDER, key_id, count=15, now=start + timedelta(seconds=20)
+    )
+    await record_api_requests(
+        async_session, GEMINI_PROVIDER, key_id, count=1, now=start + timedelta(seconds=90)
+    )
+    await async_session.commit()
+
+    status = await get_quota_status(async_session, GEMINI_PROVIDER, key_id)
+    # 45 requests over 90 seconds = 30/min (window start is the row creation time)
+    assert 29.0 <= status.requests_per_minute <= 31.0
+
+
+async def test_record_api_requests_increments_open_window_without_locking(
+    async_session: AsyncSession,
+):
+    """Test requests inside an open window are one UPDATE ... RETURNING, no row lock."""
+    key_id = api_key_id("key-b")
+    start = datetime.now(timezone.utc)
+    await record_api_requests(async_session, GEMINI_PROVIDER, key_id, count=1, now=start)
+    await async_session.flush()
+
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        for second in range(1, 4):
+            await record_api_requests(
+                async_session, GEMINI_PROVIDER, key_id, now=start + timedelta(seconds=second)
+            )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    await async_session.commit()
+
+    assert len(statements) == 3
+    assert all(stmt.lstrip().upper().startswith("UPDATE") for stmt in statements)
+    state = await async_session.get(ApiQuotaState, (GEMINI_PROVIDER, key_id))
+    await async_session.refresh(state)
+    assert state.window_requests == 4
+
+
+async def test_report_gemini_quota_error_never_raises(monkeypatch: pytest.MonkeyPatch):
+    """Test a database failure is logged instead of masking the original error."""
+
+    def broken_factory():
+        raise ConnectionError("database unavailable")
+
+    monkeypatch.setattr("app.database.async_session_factory", broken_factory)
+
+    assert await report_gemini_quota_error('429 RESOURCE_EXHAUSTED "retryDelay": "5s"') is None
@@ -17,6 +17,8 @@ Architecture Compliance:
 - Mocks CLI script to avoid actual Gemini API calls
 """
 
+import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -228,6 +230,38 @@ class TestGenerateAssets:
         # Verify CLI script called for each asset
         assert mock_run_cli.call_count == 22
 
+    @pytest.mark.asyncio
+    @patch("app.services.asset_generation.run_cli_script")
+    async def test_generate_assets_attributes_gemini_slots_to_task(
+        self, mock_run_cli, tmp_path: Path
+    ):
+        """Test every Gemini slot lease is taken on behalf of the task."""
+        task_id = uuid.uuid4()
+        slot_task_ids = []
+
+        @asynccontextmanager
+        async def fake_slot(provider, task_id=None, timeout=None):
+            slot_task_ids.append((provider, task_id))
+            yield MagicMock()
+
+        def create_asset_file(*args, **kwargs):
+            Path(args[1][args[1].index("--output") + 1]).touch()
+
+        mock_run_cli.side_effect = create_asset_file
+        service = AssetGenerationService("poke1", "vid_abc123", task_id=task_id)
+        manifest = AssetManifest(
+            assets=[AssetPrompt("character", "bulbasaur", "A Bulbasaur", tmp_path / "b.png")],
+            global_atmosphere="Forest",
+        )
+
+        with (
+            patch("app.services.asset_generation.api_slots.slot", fake_slot),
+            patch("app.services.asset_generation.record_gemini_request", AsyncMock()),
+        ):
+            await service.generate_assets(manifest, resume=False)
+
+        assert slot_task_ids == [("gemini", task_id)]
+
     @pytest.mark.asyncio
     @patch("app.services.asset_generation.run_cli_script")
     @patch("app.services.asset_generation.get_character_dir")
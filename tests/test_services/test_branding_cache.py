@@ -0,0 +1,121 @@
+"""Tests for the per-channel branding segment cache.
+
+FFmpeg/ffprobe are replaced by a fake async subprocess runner that writes
+the output file, so the tests cover cache keys, reuse and invalidation
+without encoding.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.services.branding_cache import (
+    BRANDING_CACHE_DIR_NAME,
+    MEZZANINE_PROFILE,
+    EncoderProfile,
+    prepare_branding,
+)
+from app.services.video_assembly import AssemblyManifest
+from app.services.voice_branding_service import BrandingPaths
+from app.utils.cli_wrapper import ProcessUsage, ScriptRun
+
+
+@pytest.fixture
+def workspace_root(tmp_path, monkeypatch):
+    """Point WORKSPACE_ROOT at a temporary directory with branding sources."""
+    monkeypatch.setattr("app.utils.filesystem.WORKSPACE_ROOT", tmp_path)
+    assets = tmp_path / "channels" / "poke1" / "channel_assets"
+    assets.mkdir(parents=True)
+    (assets / "intro.mp4").write_bytes(b"intro")
+    (assets / "outro.mp4").write_bytes(b"outro")
+    (assets / "watermark.png").write_bytes(b"watermark")
+    return tmp_path
+
+
+@pytest.fixture
+def fake_ffmpeg():
+    """Fake subprocess runner: ffprobe reports an audio stream, ffmpeg writes output."""
+    commands: list[list[str]] = []
+
+    def run(script, command, env, timeout):
+        commands.append(command)
+        if command[0] == "ffmpeg":
+            Path(command[-1]).write_bytes(b"encoded")
+        return ScriptRun(0, "1", "", ProcessUsage())
+
+    with patch("app.services.branding_cache._run_subprocess", side_effect=run):
+        yield commands
+
+
+BRANDING = BrandingPaths(
+    intro_path="channel_assets/intro.mp4",
+    outro_path="channel_assets/outro.mp4",
+    watermark_path="channel_assets/watermark.png",
+)
+
+
+@pytest.mark.asyncio
+async def test_branding_transcoded_once_per_channel(workspace_root, fake_ffmpeg):
+    """Second video of a channel reuses the cached segments (no FFmpeg)."""
+    first = await prepare_branding("poke1", BRANDING)
+    encodes = [c for c in fake_ffmpeg if c[0] == "ffmpeg"]
+    second = await prepare_branding("poke1", BRANDING)
+
+    assert len(encodes) == 3
+    assert len([c for c in fake_ffmpeg if c[0] == "ffmpeg"]) == 3
+    assert first == second
+    assert first.intro_path.parent.name == BRANDING_CACHE_DIR_NAME
+    assert MEZZANINE_PROFILE.key in first.intro_path.name
+    # Intro/outro are encoded with the clip encoder settings (concat stream copy)
+    intro_command = next(c for c in encodes if "intro.mp4" in c[2])
+    assert MEZZANINE_PROFILE.video_args()[1] in intro_command
+    assert MEZZANINE_PROFILE.video_filter() in intro_command
+    # Encodes wrote unique temp files in the cache dir, renamed into place
+    assert Path(intro_command[-1]).parent == first.intro_path.parent
+    assert Path(intro_command[-1]).name.startswith(f".{first.intro_path.stem}.")
+    assert not list(first.intro_path.parent.glob(".*"))
+
+
+@pytest.mark.asyncio
+async def test_source_or_profile_change_replaces_entry(workspace_root, fake_ffmpeg):
+    """Editing the source or changing the profile builds a new entry, dropping the old."""
+    branding = BrandingPaths(
+        intro_path="channel_assets/intro.mp4", outro_path=None, watermark_path=None
+    )
+    original = await prepare_branding("poke1", branding)
+
+    intro_source = workspace_root / "channels" / "poke1" / "channel_assets" / "intro.mp4"
+    intro_source.write_bytes(b"new intro with a different length")
+    edited = await prepare_branding("poke1", branding)
+    reprofiled = await prepare_branding("poke1", branding, EncoderProfile(fps=25))
+
+    assert edited.intro_path != original.intro_path
+    assert reprofiled.intro_path != edited.intro_path
+    assert edited.outro_path is None and edited.watermark_path is None
+    cache_dir = original.intro_path.parent
+    assert [p.name for p in cache_dir.glob("intro_*")] == [reprofiled.intro_path.name]
+
+
+@pytest.mark.asyncio
+async def test_missing_branding_file_raises(workspace_root, fake_ffmpeg):
+    """Configured but missing branding fails assembly instead of silently skipping."""
+    branding = BrandingPaths(
+        intro_path="channel_assets/missing.mp4", outro_path=None, watermark_path=None
+    )
+
+    with pytest.raises(FileNotFoundError, match="intro"):
+        await prepare_branding("poke1", branding)
+
+
+@pytest.mark.asyncio
+async def test_manifest_json_lists_branding_and_encoder(workspace_root, fake_ffmpeg, tmp_path):
+    """Assembly manifest carries the cached segments and clip encoder settings."""
+    segments = await prepare_branding("poke1", BRANDING)
+    manifest = AssemblyManifest(clips=[], output_path=tmp_path / "final.mp4", branding=segments)
+
+    json_dict = manifest.to_json_dict()
+
+    assert json_dict["branding"]["intro"] == str(segments.intro_path)
+    assert json_dict["branding"]["watermark"] == str(segments.watermark_path)
+    assert json_dict["encoder"]["video_args"] == MEZZANINE_PROFILE.video_args()
@@ -0,0 +1,85 @@
+"""Tests for trigger-maintained per-channel task counts.
+
+Tests cover:
+    - Trigger: Counts follow inserts, status changes (ORM and Core), channel
+      moves and deletes
+    - reconcile_queue_stats: Drift repair, no-op when counts are exact
+    - update_queue_depth_metrics: Pending tasks per channel gauge
+"""
+
+import uuid
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ChannelStatusCount, Task, TaskStatus
+from app.services.channel_queue_stats import (
+    count_tasks,
+    reconcile_queue_stats,
+    update_queue_depth_metrics,
+)
+from app.services.task_state import transition_task
+from app.utils.metrics import QUEUE_DEPTH
+from tests.fixtures.database import create_channel, make_task
+
+
+async def stored_counts(db: AsyncSession) -> dict[tuple[uuid.UUID, str], int]:
+    rows = await db.execute(
+        select(
+            ChannelStatusCount.channel_id,
+            ChannelStatusCount.status,
+            ChannelStatusCount.task_count,
+        )
+    )
+    return {(channel_id, status): count for channel_id, status, count in rows.all() if count}
+
+
+async def test_trigger_tracks_task_changes(async_session):
+    ch1 = (await create_channel(async_session, "ch1")).id
+    ch2 = (await create_channel(async_session, "ch2")).id
+    tasks = [make_task(ch1, TaskStatus.QUEUED) for _ in range(3)]
+    async_session.add_all(tasks)
+    await async_session.flush()
+
+    # ORM status change, Core transition, channel move, delete
+    tasks[0].status = TaskStatus.CLAIMED
+    await async_session.flush()
+    await transition_task(async_session, tasks[1].id, TaskStatus.CLAIMED)
+    await async_session.execute(update(Task).where(Task.id == tasks[2].id).values(channel_id=ch2))
+    await async_session.execute(delete(Task).where(Task.id == tasks[0].id))
+
+    assert await stored_counts(async_session) == {
+        (ch1, "claimed"): 1,
+        (ch2, "queued"): 1,
+    }
+    assert await stored_counts(async_session) == await count_tasks(async_session)
+
+
+async def test_reconcile_repairs_drift(async_session):
+    ch1 = (await create_channel(async_session, "ch1")).id
+    async_session.add_all([make_task(ch1, TaskStatus.QUEUED) for _ in range(2)])
+    await async_session.flush()
+    assert await reconcile_queue_stats(async_session) == 0
+
+    # Drift: a wrong count and a row for a status with no tasks
+    await async_session.execute(update(ChannelStatusCount).values(task_count=7))
+    async_session.add(ChannelStatusCount(channel_id=ch1, status="claimed", task_count=3))
+    await async_session.flush()
+
+    assert await reconcile_queue_stats(async_session) == 2
+    assert await stored_counts(async_session) == {(ch1, "queued"): 2}
+    assert await reconcile_queue_stats(async_session) == 0
+
+
+async def test_update_queue_depth_metrics(async_session):
+    ch1 = (await create_channel(async_session, "depth1")).id
+    await create_channel(async_session, "depth2")
+    async_session.add_all(
+        [make_task(ch1, TaskStatus.QUEUED) for _ in range(2)] + [make_task(ch1, TaskStatus.CLAIMED)]
+    )
+    await async_session.flush()
+
+    depths = await update_queue_depth_metrics(async_session)
+
+    assert depths == {"depth1": 2, "depth2": 0}
+    assert QUEUE_DEPTH.value(channel_id="depth1") == 2
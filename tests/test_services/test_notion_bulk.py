@@ -0,0 +1,114 @@
+"""Tests for bulk Notion page creation.
+
+Tests cover:
+    - create_pages: Bounded in-flight concurrency, submission order,
+      individual retries of rate-limited entries
+    - NotionPageLedger: Re-runs skip entries whose pages were recorded
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.clients.notion import NotionClient, NotionRateLimitError
+from app.models import TaskStatus
+from app.services.notion_bulk import NotionPageLedger, PageRequest, create_pages
+from app.services.notion_video_service import NotionVideoService
+from tests.fixtures.database import create_channel, create_task
+
+
+def page_requests(count: int) -> list[PageRequest]:
+    return [
+        PageRequest(key=f"video:{n:02d}", database_id="db_123", properties={"n": n})
+        for n in range(1, count + 1)
+    ]
+
+
+def fake_client(create_page) -> MagicMock:
+    client = MagicMock(spec=NotionClient)
+    client.create_page = AsyncMock(side_effect=create_page)
+    return client
+
+
+async def test_pages_created_concurrently_in_order():
+    """Requests overlap up to max_in_flight and start in submission order."""
+    in_flight = 0
+    peak = 0
+    started: list[int] = []
+
+    async def create_page(database_id, properties):
+        nonlocal in_flight, peak
+        started.append(properties["n"])
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"id": f"page_{properties['n']}"}
+
+    result = await create_pages(fake_client(create_page), page_requests(18), max_in_flight=3)
+
+    assert peak == 3
+    assert started == list(range(1, 19))
+    assert result.created["video:07"] == "page_7"
+    assert len(result.created) == 18
+    assert not result.failed
+
+
+async def test_rate_limited_entries_retried_individually():
+    """Entries that exhausted client retries are retried; other errors are not."""
+    attempts: dict[int, int] = {}
+
+    async def create_page(database_id, properties):
+        n = properties["n"]
+        attempts[n] = attempts.get(n, 0) + 1
+        if n == 2 and attempts[n] == 1:
+            raise NotionRateLimitError("rate limited", 3, Exception("429"))
+        if n == 3:
+            raise ValueError("invalid property")
+        return {"id": f"page_{n}"}
+
+    with patch("app.services.notion_bulk.RETRY_DELAY_SECONDS", 0):
+        result = await create_pages(fake_client(create_page), page_requests(4))
+
+    assert sorted(result.created) == ["video:01", "video:02", "video:04"]
+    assert list(result.failed) == ["video:03"]
+    assert attempts == {1: 1, 2: 2, 3: 1, 4: 1}
+
+
+async def test_rerun_skips_recorded_pages(async_session: AsyncSession, async_engine):
+    """A second population run creates no duplicate pages."""
+    channel = await create_channel(async_session)
+    task = await create_task(async_session, channel, TaskStatus.GENERATING_VIDEO)
+    await async_session.commit()
+
+    ledger = NotionPageLedger(task.id, async_sessionmaker(async_engine, expire_on_commit=False))
+    client = fake_client(lambda database_id, properties: {"id": f"page_{properties['n']}"})
+
+    with patch.object(ledger, "record", wraps=ledger.record) as record:
+        first = await create_pages(client, page_requests(5), ledger=ledger)
+    second = await create_pages(client, page_requests(6), ledger=ledger)
+
+    record.assert_awaited_once()  # One multi-row insert for the whole round
+    assert len(first.created) == 5
+    assert second.existing == first.created
+    assert list(second.created) == ["video:06"]
+    assert client.create_page.call_count == 6
+
+    # Services report entries created by an earlier run as skipped
+    channel.storage_strategy = "notion"
+    with patch(
+        "app.services.notion_video_service.get_notion_videos_database_id", return_value="db"
+    ), patch(
+        "app.services.notion_video_service.get_notion_tasks_collection_id", return_value="c"
+    ):
+        service = NotionVideoService(client, channel, ledger)
+    summary = await service.populate_videos(
+        task_id=task.id,
+        notion_page_id=task.notion_page_id,
+        video_files=[{"clip_number": n, "output_path": None, "duration": 8.0} for n in (1, 2)],
+    )
+
+    assert (summary["created"], summary["skipped"], summary["failed"]) == (0, 2, 0)
+    assert client.create_page.call_count == 6
@@ -0,0 +1,77 @@
+"""Tests for persisted retries of bulk review Notion status updates."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import NotionStatusSync, TaskStatus
+from app.services.notion_status_sync import (
+    NOTION_SYNC_MAX_ATTEMPTS,
+    SYNC_FAILED,
+    SYNC_PENDING,
+    SYNC_SYNCED,
+    retry_status_syncs,
+)
+from tests.fixtures.database import create_channel, make_task
+
+
+async def test_retry_picks_up_due_failed_and_stale_pending(
+    async_session: AsyncSession, async_engine
+):
+    """Due failures and abandoned pending updates are retried; others are left alone."""
+    channel = await create_channel(async_session)
+    tasks = [
+        make_task(channel.id, TaskStatus.VIDEO_APPROVED, notion_page_id=f"page{n}") for n in range(5)
+    ]
+    async_session.add_all(tasks)
+    await async_session.flush()
+
+    now = datetime.now(timezone.utc)
+    job_id = uuid.uuid4()
+    rows = [
+        # Failed, backoff elapsed -> retried
+        {"state": SYNC_FAILED, "attempts": 1, "next_attempt_at": now - timedelta(seconds=1)},
+        # Failed, backoff not elapsed -> waits
+        {"state": SYNC_FAILED, "attempts": 1, "next_attempt_at": now + timedelta(minutes=5)},
+        # Failed too often -> left failed
+        {"state": SYNC_FAILED, "attempts": NOTION_SYNC_MAX_ATTEMPTS, "next_attempt_at": None},
+        # Pending from a process that exited -> retried
+        {"state": SYNC_PENDING, "attempts": 0, "created_at": now - timedelta(hours=1)},
+        # Pending in a running job -> left to that job
+        {"state": SYNC_PENDING, "attempts": 0, "created_at": now},
+    ]
+    async_session.add_all(
+        NotionStatusSync(
+            job_id=job_id,
+            task_id=task.id,
+            notion_page_id=task.notion_page_id,
+            target_status=TaskStatus.VIDEO_APPROVED.value,
+            **values,
+        )
+        for task, values in zip(tasks, rows, strict=True)
+    )
+    await async_session.commit()
+
+    update_status = AsyncMock(return_value=(True, ""))
+    session_factory = MagicMock(wraps=async_sessionmaker(async_engine, expire_on_commit=False))
+    progress = await retry_status_syncs(update_status, session_factory)
+
+    assert progress is not None and (progress.total, progress.synced) == (2, 2)
+    # One session to pick the updates, one transaction for all outcomes
+    assert session_factory.call_count == 2
+    assert sorted(call.args[0] for call in update_status.call_args_list) == ["page0", "page3"]
+
+    result = await async_session.execute(
+        select(
+            NotionStatusSync.notion_page_id, NotionStatusSync.state, NotionStatusSync.attempts
+        ).execution_options(populate_existing=True)
+    )
+    states = {page: (state, attempts) for page, state, attempts in result.all()}
+    assert states["page0"] == (SYNC_SYNCED, 2)
+    assert states["page1"] == (SYNC_FAILED, 1)
+    assert states["page2"] == (SYNC_FAILED, NOTION_SYNC_MAX_ATTEMPTS)
+    assert states["page3"] == (SYNC_SYNCED, 1)
+    assert states["page4"] == (SYNC_PENDING, 0)
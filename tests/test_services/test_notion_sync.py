@@ -39,6 +39,7 @@ from app.services.notion_sync import (
     sync_notion_page_to_task,
     validate_notion_entry,
 )
+from app.services.task_events import get_error_log
 
 
 # Test fixtures for mock Notion page data
@@ -1130,9 +1131,10 @@ async def test_handle_rejection_transition_logs_rejection_reason(async_session):
     await async_session.commit()
 
     # Verify error log contains rejection reason
-    assert task.error_log is not None
-    assert "Review Rejection" in task.error_log
-    assert "Video quality is too low" in task.error_log
+    error_log = await get_error_log(async_session, task.id)
+    assert error_log is not None
+    assert "Review Rejection" in error_log
+    assert "Video quality is too low" in error_log
 
 
 @pytest.mark.asyncio
@@ -1332,7 +1334,7 @@ async def test_rejection_transition_moves_to_error_and_allows_retry(async_sessio
     # Verify task moved to error state
     assert task.status == TaskStatus.VIDEO_ERROR
     # Verify rejection reason was logged
-    assert "Video quality too low" in task.error_log
+    assert "Video quality too low" in await get_error_log(async_session, task.id)
     # Verify review completed timestamp was set
     assert task.review_completed_at is not None
 
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.exceptions import InvalidStateTransitionError
 from app.models import Task, TaskStatus
 from app.services.review_service import ReviewService
+from app.services.task_events import get_error_log
 
 
 @pytest.fixture
@@ -234,7 +235,7 @@ class TestReviewServiceIntegration:
         # THEN: Task status transitions to VIDEO_ERROR and error_log is populated
         await async_session.refresh(task)
         assert task.status == TaskStatus.VIDEO_ERROR
-        assert rejection_reason in task.error_log
+        assert rejection_reason in await get_error_log(async_session, task.id)
         assert result["status"] == "rejected"
         assert result["previous_status"] == "video_ready"
         assert result["new_status"] == "video_error"
@@ -279,10 +280,13 @@ class TestReviewServiceIntegration:
         await async_session.commit()
 
         # THEN: Error log contains both old and new messages
+        error_log = await get_error_log(async_session, task.id)
+        assert "Previous error: API timeout" in error_log
+        assert "Review failure: incorrect scene composition" in error_log
+        assert error_log.count("\n") >= 1  # Appended with newlines
+        # The rejection is an event; the legacy column is never rewritten
         await async_session.refresh(task)
-        assert "Previous error: API timeout" in task.error_log
-        assert "Review failure: incorrect scene composition" in task.error_log
-        assert task.error_log.count("\n") >= 1  # Appended with newlines
+        assert task.error_log == "Previous error: API timeout during generation"
 
     @pytest.mark.asyncio
     async def test_notion_status_sync_with_valid_token(self, review_service, async_session):
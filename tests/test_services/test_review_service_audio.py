@@ -23,8 +23,18 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions import InvalidStateTransitionError
-from app.models import Task, TaskStatus
+from app.models import Task, TaskEvent, TaskStatus
 from app.services.review_service import ReviewService
+from app.services.task_events import EVENT_REJECTION
+
+
+def rejection_messages(session: MagicMock) -> list[str]:
+    """Return the messages of rejection events added to a mock session."""
+    return [
+        call.args[0].payload["message"]
+        for call in session.add.call_args_list
+        if isinstance(call.args[0], TaskEvent) and call.args[0].kind == EVENT_REJECTION
+    ]
 
 
 @pytest.fixture
@@ -209,7 +219,7 @@ class TestAudioRejection:
         assert result["reason"] == rejection_reason
         assert result["failed_clip_numbers"] == []
         assert task_audio_ready.status == TaskStatus.AUDIO_ERROR
-        assert rejection_reason in task_audio_ready.error_log
+        assert rejection_messages(mock_db_session) == [f"Audio rejected: {rejection_reason}"]
         mock_db_session.flush.assert_called_once()
 
     @pytest.mark.asyncio
@@ -224,7 +234,9 @@ class TestAudioRejection:
 
         with patch.object(
             review_service, "_update_notion_status_async", new=AsyncMock()
-        ):
+        ), patch(
+            "app.services.review_service.set_clip_status", new_callable=AsyncMock
+        ) as mock_set_clip_status:
             # Act
             result = await review_service.reject_audio(
                 db=mock_db_session,
@@ -239,21 +251,25 @@ class TestAudioRejection:
         assert result["failed_clip_numbers"] == failed_clips
         assert task_audio_ready.status == TaskStatus.AUDIO_ERROR
 
-        # Verify error log includes clip numbers
-        assert rejection_reason in task_audio_ready.error_log
-        assert "clips 3, 7, 12 need regeneration" in task_audio_ready.error_log
-
-        # Verify failed clips stored in metadata for partial regeneration
-        assert (
-            task_audio_ready.step_completion_metadata["failed_audio_clip_numbers"]
-            == failed_clips
+        # Verify rejection event includes clip numbers
+        [message] = rejection_messages(mock_db_session)
+        assert rejection_reason in message
+        assert "clips 3, 7, 12 need regeneration" in message
+
+        # Verify failed clips recorded for narration and SFX partial regeneration
+        mock_set_clip_status.assert_awaited_once_with(
+            mock_db_session,
+            task_audio_ready.id,
+            ("narration_generation", "sfx_generation"),
+            failed_clips,
+            "failed",
         )
 
     @pytest.mark.asyncio
-    async def test_reject_audio_appends_to_existing_error_log(
+    async def test_reject_audio_keeps_existing_error_log(
         self, review_service, mock_db_session, task_audio_ready
     ):
-        """Test that rejection appends to existing error log (preserves history)."""
+        """Test that rejection is a new event and never rewrites the legacy error log."""
         # Arrange
         task_audio_ready.error_log = "Previous error: Something went wrong"
         mock_db_session.get = AsyncMock(return_value=task_audio_ready)
@@ -270,8 +286,8 @@ class TestAudioRejection:
             )
 
         # Assert
-        assert "Previous error: Something went wrong" in task_audio_ready.error_log
-        assert rejection_reason in task_audio_ready.error_log
+        assert task_audio_ready.error_log == "Previous error: Something went wrong"
+        assert rejection_messages(mock_db_session) == [f"Audio rejected: {rejection_reason}"]
 
     @pytest.mark.asyncio
     async def test_reject_audio_invalid_status(
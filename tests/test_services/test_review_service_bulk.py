@@ -9,8 +9,11 @@ Test Coverage:
 - Partial failure: Database succeeds, some Notion API calls fail
 - Transaction: Rollback on validation error, persist on success
 - Rate limiting: Respects 3 req/sec Notion API limit
+- Background sync: Return before Notion updates, persisted progress and retries
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -18,6 +21,7 @@ from uuid import uuid4
 from app.exceptions import InvalidStateTransitionError
 from app.models import Channel, Task, TaskStatus
 from app.services.review_service import ReviewService, BulkOperationResult
+from app.services.task_events import get_error_log
 
 
 @pytest.mark.asyncio
@@ -183,13 +187,17 @@ async def test_bulk_approve_partial_notion_failure(async_session):
             channel_id=channel.id,
         )
 
+        # Notion updates run in the background after the commit
+        assert result.notion_pending_count == 10
+        progress = await result.notion_sync.wait()
+
     # Verify results
     assert result.total_count == 10
     assert result.success_count == 10  # Database updates succeeded
-    assert result.notion_success_count == 8  # 8 Notion syncs succeeded
-    assert result.notion_failure_count == 2  # 2 Notion syncs failed
-    assert len(result.errors) == 2
-    assert len(result.failed_task_ids) == 2
+    assert progress.synced == 8  # 8 Notion syncs succeeded
+    assert progress.failed == 2  # 2 Notion syncs failed
+    assert len(progress.errors) == 2
+    assert set(progress.errors) == {tasks[3].id, tasks[7].id}
 
     # Verify all database updates persisted (no rollback)
     for task in tasks:
@@ -241,8 +249,9 @@ async def test_bulk_reject_with_reason(async_session):
     for task in tasks:
         await async_session.refresh(task)
         assert task.status == TaskStatus.VIDEO_ERROR
-        assert reason in task.error_log
-        assert "clips 5, 12" in task.error_log  # Clip numbers preserved
+        error_log = await get_error_log(async_session, task.id)
+        assert reason in error_log
+        assert "clips 5, 12" in error_log  # Clip numbers preserved
 
 
 @pytest.mark.asyncio
@@ -472,6 +481,8 @@ async def test_bulk_approve_shared_notion_client(async_session):
             channel_id=channel.id,
         )
 
+        await result.notion_sync.wait()
+
         # Verify NotionClient constructor called only ONCE (shared instance)
         assert mock_client_constructor.call_count == 1
 
@@ -479,3 +490,75 @@ async def test_bulk_approve_shared_notion_client(async_session):
         assert mock_notion_client.update_task_status.call_count == 5
 
     assert result.success_count == 5
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_returns_before_notion_updates(async_session, async_engine):
+    """Bulk approve returns after the commit; Notion progress is persisted per task."""
+    from app.services.notion_status_sync import SYNC_FAILED, SYNC_SYNCED, get_sync_progress
+
+    channel = Channel(channel_id="test-channel", channel_name="Test", storage_strategy="notion")
+    async_session.add(channel)
+    await async_session.flush()
+    tasks = [
+        Task(
+            id=uuid4(),
+            channel_id=channel.id,
+            title=f"Test Video {i}",
+            topic="Test topic",
+            story_direction="Test story",
+            status=TaskStatus.VIDEO_READY,
+            notion_page_id=f"abc123def456{str(i).zfill(10)}",
+        )
+        for i in range(6)
+    ]
+    async_session.add_all(tasks)
+    await async_session.commit()
+
+    release = asyncio.Event()
+    in_flight = 0
+    peak = 0
+
+    async def mock_update(page_id, status):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await release.wait()
+        in_flight -= 1
+        if page_id.endswith("5"):
+            raise Exception("Notion API error")
+
+    mock_notion_client = MagicMock()
+    mock_notion_client.update_task_status = AsyncMock(side_effect=mock_update)
+
+    with patch("app.services.review_service.get_notion_api_token", return_value="test-token"), \
+         patch("app.services.review_service.NotionClient", return_value=mock_notion_client):
+        review_service = ReviewService()
+        result = await review_service.bulk_approve_tasks(
+            db=async_session,
+            task_ids=[task.id for task in tasks],
+            target_status=TaskStatus.VIDEO_APPROVED,
+            channel_id=channel.id,
+        )
+
+        # Returned while Notion updates are still blocked
+        await asyncio.sleep(0.01)
+        assert result.success_count == 6
+        assert (result.notion_pending_count, result.notion_sync.progress.pending) == (6, 6)
+
+        release.set()
+        await result.notion_sync.wait()
+
+    assert peak == 3  # NOTION_MAX_IN_FLIGHT
+    progress = await get_sync_progress(async_session, result.notion_sync_job_id)
+    assert (progress.total, progress.synced, progress.failed) == (6, 5, 1)
+    assert progress.errors == {tasks[5].id: "Notion API error: Notion API error"}
+
+    from sqlalchemy import select
+    from app.models import NotionStatusSync
+
+    rows = (await async_session.execute(select(NotionStatusSync))).scalars().all()
+    failed = next(row for row in rows if row.state == SYNC_FAILED)
+    assert failed.attempts == 1
+    assert failed.next_attempt_at is not None  # Retried by the Notion sync loop
+    assert sum(row.state == SYNC_SYNCED for row in rows) == 5
@@ -0,0 +1,176 @@
+"""Tests for the claim policy simulator.
+
+Tests cover:
+    - percentile: Nearest-rank percentile helper
+    - RoundRobinPolicy: priority → channel_id → FIFO ordering
+    - FairSharePolicy: weighted interleaving, capacity and idle-channel clamp
+    - ShortestRemainingWorkPolicy: remaining-work and cost ordering, starvation protection
+    - simulate: capacity enforcement, wait and turnaround accounting
+"""
+
+import pytest
+
+from app.models import PriorityLevel
+from app.services.scheduler_simulation import (
+    FairSharePolicy,
+    RoundRobinPolicy,
+    ShortestRemainingWorkPolicy,
+    SimulatedTask,
+    percentile,
+    simulate,
+)
+
+
+def _backlog(channel_id: str, count: int, service: float = 10.0, arrival: float = 0.0):
+    return [
+        SimulatedTask(f"{channel_id}-{i:04d}", channel_id, arrival + i * 0.001, service)
+        for i in range(count)
+    ]
+
+
+def test_percentile_nearest_rank():
+    """Test percentile uses nearest-rank and handles empty input."""
+    assert percentile([4.0, 1.0, 3.0, 2.0], 50) == 2.0
+    assert percentile([4.0, 1.0, 3.0, 2.0], 95) == 4.0
+    assert percentile([], 95) == 0.0
+
+
+def test_round_robin_drains_alphabetically_first_channel():
+    """Test round-robin policy starves later channels (the motivating bug)."""
+    tasks = _backlog("alpha", 6) + _backlog("zeta", 2)
+
+    result = simulate(tasks, RoundRobinPolicy(), workers=1, default_max_concurrent=1)
+
+    assert result.claim_order == ["alpha"] * 6 + ["zeta"] * 2
+
+
+def test_fair_share_interleaves_channels():
+    """Test fair-share alternates between equally weighted channels."""
+    tasks = _backlog("alpha", 6) + _backlog("zeta", 2)
+
+    result = simulate(tasks, FairSharePolicy(), workers=1, default_max_concurrent=1)
+
+    assert result.claim_order[:4] == ["alpha", "zeta", "alpha", "zeta"]
+
+
+def test_fair_share_weights_by_max_concurrent():
+    """Test a channel with twice the capacity receives twice the claims."""
+    tasks = _backlog("big", 40, service=1.0) + _backlog("small", 40, service=1.0)
+
+    result = simulate(
+        tasks, FairSharePolicy(), workers=1, max_concurrent={"big": 2, "small": 1}
+    )
+
+    first_30 = result.claim_order[:30]
+    assert first_30.count("big") == 20
+    assert first_30.count("small") == 10
+
+
+def test_fair_share_priority_beats_virtual_time():
+    """Test high priority tasks claim first regardless of channel share."""
+    tasks = [
+        *_backlog("alpha", 3),
+        SimulatedTask("zeta-high", "zeta", 0.5, 10.0, PriorityLevel.HIGH),
+    ]
+
+    result = simulate(tasks, FairSharePolicy(), workers=1, default_max_concurrent=1)
+
+    # alpha-0000 claims at t=0; zeta's high task arrives at t=0.5 and wins next
+    assert result.claim_order[:2] == ["alpha", "zeta"]
+
+
+def test_fair_share_idle_channel_cannot_bank_credit():
+    """Test a channel returning from idle does not monopolize workers."""
+    tasks = _backlog("alpha", 50, service=1.0) + _backlog("zeta", 10, service=1.0, arrival=30.0)
+
+    result = simulate(tasks, FairSharePolicy(), workers=1, default_max_concurrent=1)
+
+    after_return = result.claim_order[30:40]
+    assert after_return.count("zeta") <= 6
+
+
+def test_simulate_respects_max_concurrent():
+    """Test no channel exceeds its max_concurrent in-flight tasks."""
+    tasks = _backlog("alpha", 10)
+
+    result = simulate(tasks, FairSharePolicy(), workers=5, default_max_concurrent=2)
+
+    # Two slots, 10s each: five waves → last claim waits 40s
+    assert max(result.wait_seconds["alpha"]) == pytest.approx(40.0, abs=0.01)
+    assert result.makespan_seconds == pytest.approx(50.0, abs=0.01)
+
+
+def test_simulate_rejects_zero_workers():
+    """Test simulate validates worker count."""
+    with pytest.raises(ValueError, match="workers"):
+        simulate([], FairSharePolicy(), workers=0)
+
+
+def test_shortest_remaining_work_prefers_nearly_done_tasks():
+    """Test tasks with less predicted remaining work are claimed first."""
+    tasks = [
+        SimulatedTask("long", "alpha", 0.0, 10.0, predicted_seconds=5000.0),
+        SimulatedTask("short", "alpha", 0.1, 10.0, predicted_seconds=100.0),
+        SimulatedTask("blocker", "alpha", 0.0, 1.0, predicted_seconds=0.0),
+    ]
+
+    result = simulate(
+        tasks, ShortestRemainingWorkPolicy(), workers=1, default_max_concurrent=1
+    )
+
+    assert result.turnaround_seconds["alpha"] == pytest.approx([1.0, 10.9, 21.0])
+
+
+def test_shortest_remaining_work_breaks_ties_by_remaining_cost():
+    """Test equally long tasks are claimed cheapest remaining cost first."""
+    tasks = [
+        SimulatedTask("pricey", "alpha", 0.0, 10.0, predicted_seconds=100.0, predicted_cost_usd=5.0),
+        SimulatedTask("cheap", "alpha", 0.1, 10.0, predicted_seconds=100.0, predicted_cost_usd=1.0),
+        SimulatedTask("blocker", "alpha", 0.0, 1.0, predicted_seconds=0.0),
+    ]
+
+    result = simulate(
+        tasks, ShortestRemainingWorkPolicy(), workers=1, default_max_concurrent=1
+    )
+
+    # The later but cheaper task is claimed first at t=1
+    assert result.turnaround_seconds["alpha"] == pytest.approx([1.0, 10.9, 21.0])
+
+
+def test_shortest_remaining_work_starvation_protection():
+    """Test a long task waiting past the threshold beats newer short work."""
+    tasks = [
+        SimulatedTask("blocker", "alpha", 0.0, 1.0, predicted_seconds=0.0),
+        SimulatedTask("long", "alpha", 0.1, 10.0, predicted_seconds=5000.0),
+        *(
+            SimulatedTask(f"short-{i}", "alpha", 0.2 + i * 0.1, 10.0, predicted_seconds=10.0)
+            for i in range(10)
+        ),
+    ]
+
+    protected = simulate(
+        tasks,
+        ShortestRemainingWorkPolicy(starvation_seconds=25.0),
+        workers=1,
+        default_max_concurrent=1,
+    )
+    unprotected = simulate(
+        tasks, ShortestRemainingWorkPolicy(), workers=1, default_max_concurrent=1
+    )
+
+    # Short tasks claim at t=1, 11, 21; at t=31 the long task is starving
+    assert protected.wait_seconds["alpha"][4] == pytest.approx(30.9)
+    # Without protection (1h threshold) the long task is claimed last
+    assert unprotected.wait_seconds["alpha"][-1] == pytest.approx(100.9)
+
+
+def test_follow_on_segments_measure_turnaround_from_first_arrival():
+    """Test review-gate segments re-queue after their resume delay."""
+    second = SimulatedTask("t1", "alpha", 0.0, 5.0)
+    first = SimulatedTask("t1", "alpha", 2.0, 3.0, follow_on=second, resume_delay_seconds=10.0)
+
+    result = simulate([first], FairSharePolicy(), workers=1)
+
+    # Arrive 2, run 3 → 5, review 10 → 15, run 5 → 20: turnaround 18
+    assert result.turnaround_seconds["alpha"] == [18.0]
+    assert result.claim_order == ["alpha", "alpha"]
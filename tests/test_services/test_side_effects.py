@@ -0,0 +1,201 @@
+"""Tests for the background side effect queue.
+
+Tests cover:
+    - SideEffectQueue: Submit does not wait, bounded parallelism, status
+      records in step_completion_metadata, failures isolated, wait() returns
+      the recorded status
+    - map_bounded: Result order and in-flight limit
+    - PipelineOrchestrator: Audio Notion population submitted, not awaited;
+      ASSETS_READY/AUDIO_READY review gates wait for their population
+"""
+
+import asyncio
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import TaskStatus
+from app.services.pipeline_orchestrator import PipelineOrchestrator
+from app.services.side_effects import (
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    SideEffectQueue,
+    map_bounded,
+    side_effect_metadata_key,
+)
+from app.services.task_artifacts import (
+    ARTIFACT_SFX,
+    ArtifactIndex,
+    ArtifactInfo,
+)
+from app.utils.cli_wrapper import ProcessUsage, ScriptRun
+from tests.fixtures.database import create_task
+
+
+async def test_submit_returns_before_side_effect_runs():
+    """Submitting never waits; at most `concurrency` side effects run at once."""
+    queue = SideEffectQueue(concurrency=2)
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+
+    async def side_effect():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+
+    with patch("app.database.async_session_factory", None):
+        for n in range(5):
+            queue.submit(uuid.uuid4(), f"effect_{n}", side_effect)
+        await asyncio.sleep(0.01)
+        assert (queue.pending, running) == (5, 2)
+
+        release.set()
+        assert await queue.drain(timeout=1) == 0
+
+    assert peak == 2
+    assert queue.pending == 0
+
+
+async def test_status_recorded_in_task_metadata(async_session: AsyncSession, async_engine):
+    """Completed and failed side effects are recorded; failures do not propagate."""
+    task = await create_task(async_session, status=TaskStatus.GENERATING_AUDIO)
+    await async_session.commit()
+    session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+    queue = SideEffectQueue(session_factory=session_factory)
+
+    async def fail():
+        raise RuntimeError("Notion unavailable")
+
+    queue.submit(task.id, "asset_notion_population", AsyncMock(return_value={"created": 22}))
+    queue.submit(task.id, "narration_notion_population", fail)
+    await queue.drain(timeout=1)
+
+    await async_session.refresh(task)
+    metadata = task.step_completion_metadata
+    completed = metadata[side_effect_metadata_key("asset_notion_population")]
+    failed = metadata[side_effect_metadata_key("narration_notion_population")]
+    assert completed["status"] == STATUS_COMPLETED
+    assert completed["result"] == {"created": 22}
+    assert failed["status"] == STATUS_FAILED
+    assert failed["error"] == "Notion unavailable"
+    assert "finished_at" in failed
+
+
+async def test_map_bounded_keeps_order_and_limit():
+    """Results follow input order with at most `limit` calls in flight."""
+    in_flight = 0
+    peak = 0
+
+    async def probe(n: int) -> float:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (n % 3))
+        in_flight -= 1
+        return n * 1.5
+
+    results = await map_bounded(probe, range(18), limit=6)
+
+    assert results == [n * 1.5 for n in range(18)]
+    assert peak == 6
+
+
+async def test_sfx_population_submitted_not_awaited(tmp_path: Path):
+    """Audio steps hand probing and Notion population to the queue."""
+    orchestrator = PipelineOrchestrator(str(uuid.uuid4()))
+    orchestrator.artifacts = ArtifactIndex(
+        tmp_path,
+        [
+            ArtifactInfo(f"sfx_{n:02d}.mp3", ARTIFACT_SFX, n, 100, "0" * 64, sec, "ready")
+            for n, sec in ((1, 7.5), (2, None))
+        ],
+    )
+    queue = SideEffectQueue()
+
+    with (
+        patch("app.services.pipeline_orchestrator.get_side_effect_queue", return_value=queue),
+        patch.object(queue, "submit") as submit,
+    ):
+        orchestrator._submit_audio_population(ARTIFACT_SFX, "poke1", "project")
+
+    task_id, name, run = submit.call_args.args
+    assert (task_id, name) == (orchestrator.task_id, "sfx_notion_population")
+
+    # The side effect probes only clips recorded without a duration
+    with (
+        patch.object(orchestrator, "_get_audio_duration", AsyncMock(return_value=6.0)) as probe,
+        patch("app.services.pipeline_orchestrator.get_notion_api_token", return_value=None),
+    ):
+        assert await run() is None
+    probe.assert_awaited_once_with(tmp_path / "sfx_02.mp3")
+
+
+async def test_audio_duration_probed_with_async_subprocess(tmp_path: Path):
+    """Duration probes run ffprobe through the async subprocess runner."""
+    orchestrator = PipelineOrchestrator(str(uuid.uuid4()))
+    clip = tmp_path / "sfx_02.mp3"
+    runs = [ScriptRun(0, "6.25\n", "", ProcessUsage()), ScriptRun(1, "", "bad", ProcessUsage())]
+
+    with patch(
+        "app.services.pipeline_orchestrator._run_subprocess", AsyncMock(side_effect=runs)
+    ) as run:
+        assert await orchestrator._get_audio_duration(clip) == 6.25
+        with pytest.raises(RuntimeError, match=r"ffprobe failed for sfx_02\.mp3"):
+            await orchestrator._get_audio_duration(clip)
+
+    script, command, _, _ = run.await_args.args
+    assert (script, command[0], command[-1]) == ("ffprobe", "ffprobe", str(clip))
+
+
+async def test_wait_returns_recorded_status(async_session: AsyncSession, async_engine):
+    """wait() blocks until the named side effect finishes and returns its status."""
+    task = await create_task(async_session, status=TaskStatus.GENERATING_AUDIO)
+    await async_session.commit()
+    queue = SideEffectQueue(
+        session_factory=async_sessionmaker(async_engine, expire_on_commit=False)
+    )
+    release = asyncio.Event()
+
+    async def populate():
+        await release.wait()
+        return {"created": 18}
+
+    queue.submit(task.id, "narration_notion_population", populate)
+    waiter = asyncio.create_task(queue.wait(task.id, "narration_notion_population"))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    release.set()
+    status = await waiter
+    assert status["status"] == STATUS_COMPLETED
+    assert status["result"] == {"created": 18}
+
+    # Finished side effects return their recorded status without waiting
+    assert (await queue.wait(str(task.id), "narration_notion_population")) == status
+    assert await queue.wait(task.id, "sfx_notion_population") is None
+
+
+async def test_review_gate_waits_for_population():
+    """AUDIO_READY waits for narration population; failures don't block the gate."""
+    orchestrator = PipelineOrchestrator(str(uuid.uuid4()))
+    queue = SideEffectQueue()
+    wait = AsyncMock(return_value={"status": STATUS_FAILED, "error": "Notion down"})
+
+    with (
+        patch("app.services.pipeline_orchestrator.get_side_effect_queue", return_value=queue),
+        patch.object(queue, "wait", wait),
+    ):
+        await orchestrator._await_review_gate_side_effect(TaskStatus.AUDIO_READY)
+        await orchestrator._await_review_gate_side_effect(TaskStatus.ASSETS_READY)
+        await orchestrator._await_review_gate_side_effect(TaskStatus.SFX_READY)
+
+    assert [c.args for c in wait.await_args_list] == [
+        (orchestrator.task_id, "narration_notion_population"),
+        (orchestrator.task_id, "asset_notion_population"),
+    ]
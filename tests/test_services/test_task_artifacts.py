@@ -0,0 +1,167 @@
+"""Tests for the task artifact index.
+
+Tests cover:
+    - ArtifactIndex: Recording, size checks, authoritative resume checks,
+      legacy filesystem fallback
+    - save_artifacts / load_artifact_index / prune_artifacts: Round trip and
+      retention pruning
+    - optimize_videos: Faststart rewrites re-recorded in the index
+    - VideoAssemblyService: Assembly manifest built from the index
+"""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import TaskStatus
+from app.services.task_artifacts import (
+    ARTIFACT_NARRATION,
+    ARTIFACT_SFX,
+    ARTIFACT_VIDEO,
+    ArtifactIndex,
+    load_artifact_index,
+    prune_artifacts,
+    save_artifacts,
+)
+from app.services.video_assembly import VideoAssemblyService
+from app.utils.filesystem import get_project_workspace
+from app.workers.video_generation_worker import optimize_videos
+from tests.fixtures.database import create_task
+
+
+@pytest.fixture
+def workspace_root(tmp_path, monkeypatch):
+    """Point WORKSPACE_ROOT at a temporary directory."""
+    monkeypatch.setattr("app.utils.filesystem.WORKSPACE_ROOT", tmp_path)
+    return tmp_path
+
+
+def write(path: Path, size: int) -> Path:
+    path.write_bytes(b"x" * size)
+    return path
+
+
+async def test_record_flags_truncated_video(workspace_root):
+    """Test recorded files are hashed and undersized videos are invalid."""
+    workspace = get_project_workspace("poke1", "vid_abc")
+    index = ArtifactIndex(workspace.project_dir)
+
+    ok = await index.record(write(workspace.narration_clip(1), 10), ARTIFACT_NARRATION, 1, 7.2)
+    truncated = await index.record(write(workspace.video_clip(1), 10), ARTIFACT_VIDEO, 1)
+
+    assert ok.path == "audio/clip_01.mp3"
+    assert (ok.size_bytes, ok.duration_seconds, ok.ready) == (10, 7.2, True)
+    assert len(ok.sha256) == 64
+    assert not truncated.ready
+    assert not index.is_ready(workspace.video_clip(1))
+    assert [artifact.path for artifact in index.take_pending()] == [
+        "audio/clip_01.mp3",
+        "videos/clip_01.mp4",
+    ]
+    assert index.take_pending() == []
+
+
+async def test_resume_checks(workspace_root):
+    """Test indexed kinds skip the filesystem; unindexed kinds fall back once."""
+    workspace = get_project_workspace("poke1", "vid_abc")
+    legacy = ArtifactIndex(workspace.project_dir)
+    write(workspace.narration_clip(1), 10)
+
+    # Legacy task: filesystem check, and the existing file is indexed
+    assert await legacy.reusable(workspace.narration_clip(1), ARTIFACT_NARRATION, Path.exists, 1)
+    assert not await legacy.reusable(workspace.narration_clip(2), ARTIFACT_NARRATION, Path.exists)
+    assert legacy.clips(ARTIFACT_NARRATION)[1].path == "audio/clip_01.mp3"
+
+    # Indexed task: the filesystem is never consulted
+    indexed = ArtifactIndex(workspace.project_dir, legacy.take_pending())
+    exists = MagicMock(return_value=True)
+    assert await indexed.reusable(workspace.narration_clip(1), ARTIFACT_NARRATION, exists)
+    assert not await indexed.reusable(workspace.narration_clip(2), ARTIFACT_NARRATION, exists)
+    exists.assert_not_called()
+
+
+async def test_save_load_and_prune(async_session: AsyncSession, workspace_root):
+    """Test artifacts round-trip with one query and retention prunes rows."""
+    task = await create_task(async_session, status=TaskStatus.FINAL_REVIEW)
+
+    workspace = get_project_workspace("poke1", str(task.id))
+    index = ArtifactIndex(workspace.project_dir)
+    await index.record(write(workspace.composite_clip(1), 10), "composite", 1)
+    await index.record(write(workspace.narration_clip(1), 10), ARTIFACT_NARRATION, 1, 6.5)
+    assert await save_artifacts(async_session, task.id, index.take_pending()) == 2
+    # Re-recording a file updates its row
+    await index.record(write(workspace.narration_clip(1), 20), ARTIFACT_NARRATION, 1, 7.0)
+    await save_artifacts(async_session, str(task.id), index.take_pending())
+
+    loaded = await load_artifact_index(async_session, str(task.id), workspace.project_dir)
+    narration = loaded.get(workspace.narration_clip(1))
+    assert (narration.size_bytes, narration.duration_seconds) == (20, 7.0)
+    assert loaded.is_authoritative(ARTIFACT_NARRATION)
+    assert not loaded.is_authoritative(ARTIFACT_VIDEO)
+
+    await prune_artifacts(async_session, task.id, ["assets/composites"])
+    loaded = await load_artifact_index(async_session, task.id, workspace.project_dir)
+    assert loaded.is_ready(workspace.composite_clip(1))
+    assert loaded.get(workspace.narration_clip(1)) is None
+
+
+async def test_faststart_rewrite_rerecords_artifact(
+    async_engine, async_session: AsyncSession, workspace_root
+):
+    """Test a faststart rewrite updates the indexed size and SHA-256."""
+    task = await create_task(async_session, status=TaskStatus.VIDEO_READY)
+    workspace = get_project_workspace("poke1", str(task.id))
+    clips = [(clip, write(workspace.video_clip(clip), 1_000_000)) for clip in (1, 2)]
+    index = ArtifactIndex(workspace.project_dir)
+    await index.record(clips[0][1], ARTIFACT_VIDEO, 1, 10.0)
+    await save_artifacts(async_session, task.id, index.take_pending())
+    await async_session.commit()
+    before = index.get(clips[0][1])
+
+    async def rewrite(path: Path) -> bool:
+        write(path, 1_000_100)
+        return True
+
+    with (
+        patch(
+            "app.workers.video_generation_worker.async_session_factory",
+            async_sessionmaker(async_engine, expire_on_commit=False),
+        ),
+        patch(
+            "app.workers.video_generation_worker.optimize_video_for_streaming",
+            side_effect=rewrite,
+        ),
+    ):
+        result = await optimize_videos(task.id, clips, workspace.project_dir)
+
+    assert result == {"optimized": 2, "total": 2}
+    loaded = await load_artifact_index(async_session, task.id, workspace.project_dir)
+    after = loaded.get(clips[0][1])
+    assert (after.size_bytes, after.duration_seconds) == (1_000_100, 10.0)
+    assert after.sha256 != before.sha256
+    # Clips the index did not know are left for the next resume check
+    assert loaded.get(clips[1][1]) is None
+
+
+async def test_assembly_manifest_from_index(workspace_root):
+    """Test the assembly manifest uses indexed paths and durations (no probing)."""
+    workspace = get_project_workspace("poke1", "vid_abc")
+    index = ArtifactIndex(workspace.project_dir)
+    for clip in (1, 2):
+        await index.record(write(workspace.video_clip(clip), 1_000_000), ARTIFACT_VIDEO, clip)
+        await index.record(write(workspace.narration_clip(clip), 10), ARTIFACT_NARRATION, clip, 6.0)
+        await index.record(write(workspace.sfx_mp3_clip(clip), 10), ARTIFACT_SFX, clip)
+    index = ArtifactIndex(workspace.project_dir, index.take_pending())
+    service = VideoAssemblyService("poke1", "vid_abc", index)
+
+    with patch.object(service, "probe_audio_duration", new=AsyncMock()) as mock_probe:
+        manifest = await service.create_assembly_manifest(clip_count=2)
+
+    mock_probe.assert_not_awaited()
+    assert [clip.narration_duration for clip in manifest.clips] == [6.0, 6.0]
+    assert manifest.clips[1].sfx_path == workspace.sfx_mp3_clip(2)
+
+    with pytest.raises(FileNotFoundError, match="clip 3"):
+        await service.create_assembly_manifest(clip_count=3)
@@ -0,0 +1,123 @@
+"""Tests for deferred task execution (not_before backoff).
+
+Tests cover:
+    - retry_backoff_seconds: Exponential growth, cap, and jitter bounds
+    - transient_retry_at: Retry limit
+    - idle_sleep_seconds: Idle poll growth capped by the next eligible task
+    - next_eligible_at: Earliest future not_before among queued tasks
+    - Task.queued_at: Set on entering the queue, kept while deferred
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Task, TaskStatus
+from app.services.task_deferral import (
+    API_SLOT_RETRY_SECONDS,
+    IDLE_POLL_MAX_SECONDS,
+    IDLE_POLL_MIN_SECONDS,
+    MAX_TRANSIENT_RETRIES,
+    RETRY_BACKOFF_MAX_SECONDS,
+    api_slot_retry_at,
+    defer_task,
+    idle_sleep_seconds,
+    next_eligible_at,
+    retry_backoff_seconds,
+    transient_retry_at,
+)
+from tests.fixtures.database import create_channel, create_task, make_task
+
+NOW = datetime(2026, 1, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def test_retry_backoff_grows_exponentially_and_caps():
+    """Test backoff doubles per attempt and never exceeds the cap."""
+    no_jitter = lambda: 0.5  # noqa: E731
+
+    assert retry_backoff_seconds(0, no_jitter) == 60
+    assert retry_backoff_seconds(1, no_jitter) == 120
+    assert retry_backoff_seconds(3, no_jitter) == 480
+    assert retry_backoff_seconds(20, no_jitter) == RETRY_BACKOFF_MAX_SECONDS
+
+
+def test_retry_backoff_jitter_stays_within_twenty_percent():
+    """Test jitter spreads retries by at most ±20%."""
+    assert retry_backoff_seconds(0, lambda: 0.0) == 48
+    assert retry_backoff_seconds(0, lambda: 0.999999) < 72
+
+
+def test_transient_retry_at_stops_after_max_retries():
+    """Test retries are scheduled in the future until the limit is reached."""
+    assert transient_retry_at(0, NOW) > NOW
+    assert transient_retry_at(MAX_TRANSIENT_RETRIES, NOW) is None
+
+
+def test_api_slot_retry_at_is_short_and_jittered():
+    """Test tasks waiting for an API slot retry within seconds, spread by ±20%."""
+    assert api_slot_retry_at(NOW, lambda: 0.5) == NOW + timedelta(seconds=API_SLOT_RETRY_SECONDS)
+    assert api_slot_retry_at(NOW, lambda: 0.0) == NOW + timedelta(seconds=12)
+    assert api_slot_retry_at(NOW, lambda: 0.999999) < NOW + timedelta(seconds=18)
+
+
+def test_idle_sleep_backs_off_when_queue_is_empty():
+    """Test idle poll interval doubles and is capped."""
+    assert idle_sleep_seconds(None, 0, NOW) == IDLE_POLL_MIN_SECONDS
+    assert idle_sleep_seconds(None, 1, NOW) == IDLE_POLL_MIN_SECONDS * 2
+    assert idle_sleep_seconds(None, 10, NOW) == IDLE_POLL_MAX_SECONDS
+
+
+def test_idle_sleep_wakes_for_next_eligible_task():
+    """Test worker wakes exactly when a deferred task becomes claimable."""
+    assert idle_sleep_seconds(NOW + timedelta(seconds=3), 10, NOW) == 3
+    assert idle_sleep_seconds(NOW + timedelta(hours=1), 10, NOW) == IDLE_POLL_MAX_SECONDS
+    assert idle_sleep_seconds(NOW - timedelta(seconds=1), 0, NOW) == 0
+
+
+async def test_next_eligible_at_returns_earliest_future_not_before(async_session: AsyncSession):
+    """Test only future deferrals of queued tasks are considered."""
+    channel = await create_channel(async_session)
+
+    now = datetime.now(timezone.utc)
+    soon = now + timedelta(minutes=2)
+    for status, not_before in [
+        (TaskStatus.QUEUED, now + timedelta(minutes=10)),
+        (TaskStatus.QUEUED, soon),
+        (TaskStatus.QUEUED, now - timedelta(minutes=1)),  # already eligible
+        (TaskStatus.QUEUED, None),
+        (TaskStatus.DRAFT, now + timedelta(seconds=30)),  # not queued
+    ]:
+        async_session.add(make_task(channel.id, status, not_before=not_before))
+    await async_session.commit()
+
+    assert await next_eligible_at(async_session) == soon
+
+
+async def test_queued_at_survives_deferral_and_resets_on_requeue(async_session: AsyncSession):
+    """Test queue age is measured from entering the queue, not the last update."""
+    task = await create_task(async_session)
+    await async_session.commit()
+
+    async def queued_at() -> datetime | None:
+        return await async_session.scalar(select(Task.queued_at).where(Task.id == task.id))
+
+    assert await queued_at() is not None
+
+    # Age the row, then update it while it waits: queue age must not reset
+    long_ago = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    await async_session.execute(update(Task).where(Task.id == task.id).values(queued_at=long_ago))
+    defer_task(task, datetime.now(timezone.utc) + timedelta(minutes=5), reason="test")
+    task.retry_count = 2
+    await async_session.commit()
+    assert (await queued_at()).replace(tzinfo=timezone.utc) == long_ago
+
+    # Leaving and re-entering the queue starts a new wait
+    await async_session.execute(
+        update(Task).where(Task.id == task.id).values(status=TaskStatus.CLAIMED)
+    )
+    await async_session.execute(
+        update(Task).where(Task.id == task.id).values(status=TaskStatus.QUEUED)
+    )
+    await async_session.commit()
+    assert (await queued_at()).replace(tzinfo=timezone.utc) > long_ago
@@ -0,0 +1,105 @@
+"""Tests for the append-only task event log.
+
+Tests cover:
+    - record_task_event / record_task_events: Single and bulk inserts
+    - get_error_log / task_response: Legacy error_log text merged with error events
+    - get_status_history / recent_errors: Indexed history queries
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import TaskEvent, TaskStatus
+from app.services.task_events import (
+    EVENT_ERROR,
+    EVENT_REJECTION,
+    EVENT_STATUS_CHANGE,
+    get_error_log,
+    get_status_history,
+    recent_errors,
+    record_task_event,
+    record_task_events,
+    task_event_row,
+    task_response,
+)
+from tests.fixtures.database import create_task
+
+T0 = datetime(2026, 1, 18, 12, 0, tzinfo=timezone.utc)
+
+
+async def test_error_log_merges_legacy_text_and_events(async_session: AsyncSession):
+    """Test the aggregated log keeps pre-migration text and appends events in time order."""
+    task = await create_task(async_session, error_log="[old] asset_error: legacy failure")
+    await record_task_events(
+        async_session,
+        [
+            task_event_row(
+                task.id, EVENT_REJECTION, TaskStatus.VIDEO_ERROR, ts=T0 + timedelta(minutes=2),
+                message="Review: blurry",
+            ),
+            task_event_row(
+                task.id, EVENT_STATUS_CHANGE, TaskStatus.GENERATING_VIDEO, ts=T0 + timedelta(minutes=1)
+            ),
+            task_event_row(
+                task.id, EVENT_ERROR, TaskStatus.ASSET_ERROR, ts=T0, message="Gemini API timeout"
+            ),
+        ],
+    )
+
+    log = await get_error_log(async_session, task.id)
+
+    assert log.splitlines() == [
+        "[old] asset_error: legacy failure",
+        "[2026-01-18T12:00:00+00:00] asset_error: Gemini API timeout",
+        "[2026-01-18T12:02:00+00:00] video_error: Review: blurry",
+    ]
+
+
+async def test_error_log_is_none_without_errors(async_session: AsyncSession):
+    """Test status changes alone do not produce an error log."""
+    task = await create_task(async_session)
+    record_task_event(async_session, task.id, EVENT_STATUS_CHANGE, TaskStatus.GENERATING_ASSETS)
+    await async_session.flush()
+
+    assert await get_error_log(async_session, task.id) is None
+
+
+async def test_task_response_includes_event_errors(async_session: AsyncSession):
+    """Test API responses expose errors recorded as events, not just the legacy column."""
+    task = await create_task(async_session)
+    record_task_event(
+        async_session, task.id, EVENT_ERROR, TaskStatus.ASSET_ERROR, message="Gemini API timeout"
+    )
+    await async_session.flush()
+
+    response = await task_response(async_session, task)
+
+    assert task.error_log is None
+    assert response.id == task.id
+    assert response.error_log.endswith("asset_error: Gemini API timeout")
+
+
+async def test_status_history_and_recent_errors(async_session: AsyncSession):
+    """Test history is ordered by time and recent errors filter by kind and time."""
+    task = await create_task(async_session)
+    inserted = await record_task_events(
+        async_session,
+        [
+            task_event_row(task.id, EVENT_STATUS_CHANGE, TaskStatus.GENERATING_ASSETS, ts=T0),
+            task_event_row(
+                task.id, EVENT_ERROR, TaskStatus.ASSET_ERROR, ts=T0 + timedelta(minutes=5),
+                message="timeout", error_type="TimeoutError",
+            ),
+            task_event_row(task.id, EVENT_STATUS_CHANGE, TaskStatus.QUEUED, ts=T0 + timedelta(minutes=6)),
+        ],
+    )
+
+    history = await get_status_history(async_session, task.id)
+    errors = await recent_errors(async_session, since=T0 + timedelta(minutes=1))
+
+    assert inserted == 3
+    assert [event.status for event in history] == ["generating_assets", "asset_error", "queued"]
+    assert [event.payload for event in errors] == [{"message": "timeout", "error_type": "TimeoutError"}]
+    assert await async_session.scalar(select(func.count()).select_from(TaskEvent)) == 3
@@ -0,0 +1,93 @@
+"""Tests for atomic step metadata updates and per-clip progress.
+
+Tests cover:
+    - set_step_metadata: Server-side key merge, extra columns, no ORM load
+    - remove_step_metadata: Key removal
+    - set_clip_status / get_clips / clear_clips: Upsert and per-step isolation
+"""
+
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Task, TaskStatus
+from app.services.task_metadata import (
+    CLIP_STATUS_FAILED,
+    NARRATION_STEP,
+    SFX_STEP,
+    VIDEO_STEP,
+    clear_clips,
+    get_clips,
+    remove_step_metadata,
+    set_clip_status,
+    set_step_metadata,
+)
+from tests.fixtures.database import create_task
+
+
+async def create_task_id(db: AsyncSession) -> uuid.UUID:
+    """Create a task and detach it, so writes under test cannot use the ORM copy."""
+    task = await create_task(db, status=TaskStatus.GENERATING_VIDEO, retry_count=2)
+    db.expunge_all()
+    return task.id
+
+
+async def load_metadata(db: AsyncSession, task_id: uuid.UUID) -> tuple[dict | None, int]:
+    row = (
+        await db.execute(
+            select(Task.step_completion_metadata, Task.retry_count).where(Task.id == task_id)
+        )
+    ).one()
+    return row[0], row[1]
+
+
+async def test_set_step_metadata_merges_keys(async_session: AsyncSession):
+    """Test each write merges one key and keeps the others."""
+    task_id = await create_task_id(async_session)
+
+    await set_step_metadata(async_session, task_id, "asset_generation", {"completed": True})
+    await set_step_metadata(
+        async_session, task_id, "video_generation", {"completed": True}, retry_count=0
+    )
+    await set_step_metadata(async_session, task_id, "asset_generation", {"completed": False})
+
+    metadata, retry_count = await load_metadata(async_session, task_id)
+    assert metadata == {
+        "asset_generation": {"completed": False},
+        "video_generation": {"completed": True},
+    }
+    assert retry_count == 0
+
+
+async def test_remove_step_metadata(async_session: AsyncSession):
+    """Test removing a key leaves the rest of the document intact."""
+    task_id = await create_task_id(async_session)
+    await remove_step_metadata(async_session, task_id, "missing")  # NULL metadata: no-op
+    await set_step_metadata(async_session, task_id, "asset_generation", {"completed": True})
+    await set_step_metadata(async_session, task_id, "legacy", [1, 2])
+
+    await remove_step_metadata(async_session, task_id, "legacy")
+
+    metadata, _ = await load_metadata(async_session, task_id)
+    assert metadata == {"asset_generation": {"completed": True}}
+
+
+async def test_clip_status_upsert_and_clear_per_step(async_session: AsyncSession):
+    """Test rejected clips are recorded per step and cleared independently."""
+    task_id = await create_task_id(async_session)
+
+    await set_clip_status(
+        async_session, task_id, (NARRATION_STEP, SFX_STEP), [12, 3, 3], CLIP_STATUS_FAILED
+    )
+    await set_clip_status(async_session, task_id, NARRATION_STEP, [3, 7], CLIP_STATUS_FAILED)
+    await set_clip_status(async_session, task_id, VIDEO_STEP, [], CLIP_STATUS_FAILED)
+
+    assert await get_clips(async_session, task_id, NARRATION_STEP) == [3, 7, 12]
+    assert await get_clips(async_session, task_id, SFX_STEP) == [3, 12]
+    assert await get_clips(async_session, task_id, VIDEO_STEP) == []
+
+    await clear_clips(async_session, task_id, NARRATION_STEP)
+
+    assert await get_clips(async_session, task_id, NARRATION_STEP) == []
+    assert await get_clips(async_session, task_id, SFX_STEP) == [3, 12]
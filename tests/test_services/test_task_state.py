@@ -0,0 +1,73 @@
+"""Tests for the task state repository.
+
+Tests cover:
+    - update_task: Combined column + step metadata write returns a snapshot
+    - transition_task: Validated status change, invalid transition, missing task
+    - TaskSnapshot.to_sync_data: Notion sync payload
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import InvalidStateTransitionError
+from app.models import Task, TaskStatus
+from app.services.task_state import allowed_predecessors, transition_task, update_task
+from tests.fixtures.database import create_task
+
+
+async def create_task_id(db: AsyncSession, status: TaskStatus) -> uuid.UUID:
+    """Create a task and detach it, so statements under test cannot use the ORM copy."""
+    task = await create_task(db, status=status)
+    db.expunge_all()
+    return task.id
+
+
+async def test_transition_writes_all_columns_in_one_statement(async_session):
+    task_id = await create_task_id(async_session, TaskStatus.GENERATING_ASSETS)
+    now = datetime.now(timezone.utc)
+
+    snapshot = await transition_task(
+        async_session,
+        task_id,
+        TaskStatus.ASSETS_READY,
+        step_metadata=("asset_generation", {"completed": True}),
+        review_started_at=now,
+    )
+
+    assert snapshot.id == task_id
+    assert snapshot.status == TaskStatus.ASSETS_READY
+    assert snapshot.review_started_at is not None
+    task = await async_session.scalar(select(Task).where(Task.id == task_id))
+    assert task.status == TaskStatus.ASSETS_READY
+    assert task.step_completion_metadata == {"asset_generation": {"completed": True}}
+
+
+async def test_transition_rejects_invalid_status_change(async_session):
+    task_id = await create_task_id(async_session, TaskStatus.QUEUED)
+
+    with pytest.raises(InvalidStateTransitionError) as exc_info:
+        await transition_task(async_session, task_id, TaskStatus.PUBLISHED)
+
+    assert exc_info.value.from_status == TaskStatus.QUEUED
+    assert await async_session.scalar(select(Task.status)) == TaskStatus.QUEUED
+
+
+async def test_missing_task_returns_none(async_session):
+    assert await transition_task(async_session, uuid.uuid4(), TaskStatus.CLAIMED) is None
+    assert await update_task(async_session, uuid.uuid4(), pipeline_cost_usd=1.0) is None
+
+
+async def test_snapshot_sync_data(async_session):
+    task_id = await create_task_id(async_session, TaskStatus.QUEUED)
+    empty_page_id = await update_task(async_session, task_id, notion_page_id="")
+    snapshot = await update_task(async_session, task_id, notion_page_id="p2")
+
+    assert empty_page_id.to_sync_data() is None
+    sync_data = snapshot.to_sync_data()
+    assert sync_data.notion_page_id == "p2"
+    assert sync_data.status == TaskStatus.QUEUED
+    assert TaskStatus.QUEUED in allowed_predecessors(TaskStatus.CLAIMED)
@@ -0,0 +1,184 @@
+"""Tests for remaining-work estimation from historical step timings.
+
+Tests cover:
+    - extract_step_durations: Parsing step_completion_metadata
+    - build_step_estimates: Channel percentiles, global fallback, cost apportioning
+    - estimate_remaining_work: Remaining steps, duration and cost
+    - refresh_step_duration_stats / load_step_estimates: Persistence round trip
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Channel, StepDurationStats, Task, TaskStatus
+from app.services.work_estimator import (
+    MIN_CHANNEL_SAMPLES,
+    PIPELINE_STEPS,
+    StepEstimate,
+    build_step_estimates,
+    estimate_remaining_work,
+    extract_step_durations,
+    load_step_estimates,
+    refresh_step_duration_stats,
+)
+
+
+def _metadata(**durations: float) -> dict:
+    return {
+        step: {"completed": True, "duration_seconds": seconds}
+        for step, seconds in durations.items()
+    }
+
+
+def test_extract_step_durations_ignores_incomplete_and_unknown_steps():
+    """Test only completed pipeline steps with numeric durations are sampled."""
+    metadata = {
+        "asset_generation": {"completed": True, "duration_seconds": 456.7},
+        "video_generation": {"completed": False, "duration_seconds": 30.0},
+        "composite_creation": {"completed": True, "duration_seconds": None},
+        "failed_audio_clip_numbers": [3, 7],
+    }
+
+    assert extract_step_durations(metadata) == {"asset_generation": 456.7}
+    assert extract_step_durations(None) == {}
+
+
+def test_build_step_estimates_uses_channel_samples_when_sufficient():
+    """Test channel percentiles are used once MIN_CHANNEL_SAMPLES is reached."""
+    busy, new = uuid.uuid4(), uuid.uuid4()
+    durations = {
+        busy: {"video_generation": [100.0] * MIN_CHANNEL_SAMPLES},
+        uuid.uuid4(): {"video_generation": [900.0] * 20},
+    }
+
+    estimates = build_step_estimates(durations, {}, [busy, new])
+
+    assert estimates[busy]["video_generation"].p50_seconds == 100.0
+    # New channel has no history: inherits all-channel percentiles
+    assert estimates[new]["video_generation"].p50_seconds == 900.0
+    assert estimates[new]["video_generation"].sample_count == 20 + MIN_CHANNEL_SAMPLES
+
+
+def test_build_step_estimates_apportions_cost_by_duration_share():
+    """Test median pipeline cost is split across steps by p50 duration."""
+    channel = uuid.uuid4()
+    durations = {
+        channel: {
+            "asset_generation": [100.0] * MIN_CHANNEL_SAMPLES,
+            "video_generation": [300.0] * MIN_CHANNEL_SAMPLES,
+        }
+    }
+    costs = {channel: [8.0] * MIN_CHANNEL_SAMPLES}
+
+    estimates = build_step_estimates(durations, costs, [channel])[channel]
+
+    assert estimates["asset_generation"].p50_cost_usd == pytest.approx(2.0)
+    assert estimates["video_generation"].p50_cost_usd == pytest.approx(6.0)
+    assert "narration_generation" not in estimates  # No samples anywhere
+
+
+def test_estimate_remaining_work_skips_completed_steps():
+    """Test remaining work sums only incomplete steps in pipeline order."""
+    estimates = {
+        step: StepEstimate(step, 10, p50_seconds=100.0, p90_seconds=200.0, p50_cost_usd=1.0)
+        for step in PIPELINE_STEPS
+    }
+
+    remaining = estimate_remaining_work(
+        _metadata(asset_generation=1.0, composite_creation=1.0), estimates
+    )
+
+    assert remaining.remaining_steps == PIPELINE_STEPS[2:]
+    assert remaining.seconds == 400.0
+    assert remaining.p90_seconds == 800.0
+    assert remaining.cost_usd == 4.0
+
+
+async def test_refresh_and_load_step_estimates(async_session: AsyncSession):
+    """Test refresh persists per-channel stats and replaces previous rows."""
+    channel = Channel(channel_id="estimator", channel_name="Estimator", is_active=True)
+    async_session.add(channel)
+    await async_session.flush()
+    for i in range(MIN_CHANNEL_SAMPLES):
+        async_session.add(
+            Task(
+                channel_id=channel.id,
+                notion_page_id=uuid.uuid4().hex,
+                title=f"History {i}",
+                topic="Topic",
+                story_direction="Direction",
+                status=TaskStatus.QUEUED,
+                step_completion_metadata=_metadata(
+                    asset_generation=60.0 + i, video_generation=600.0
+                ),
+                pipeline_cost_usd=10.0,
+            )
+        )
+    await async_session.commit()
+
+    assert await refresh_step_duration_stats(async_session) == 2
+    assert await refresh_step_duration_stats(async_session) == 2  # Replaces, no duplicates
+    await async_session.commit()
+
+    rows = (await async_session.execute(select(StepDurationStats))).scalars().all()
+    assert len(rows) == 2
+
+    estimates = await load_step_estimates(async_session, channel.id)
+    assert estimates["asset_generation"].p50_seconds == 62.0
+    assert estimates["video_generation"].p90_seconds == 600.0
+    assert estimate_remaining_work(None, estimates).cost_usd == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_refresh_writes_predicted_remaining_work_to_queued_tasks(
+    async_session: AsyncSession,
+):
+    """Test refresh stores each queued task's remaining p50 work without touching updated_at."""
+    channel = Channel(channel_id="predict", channel_name="Predict", is_active=True)
+    async_session.add(channel)
+    await async_session.flush()
+    for i in range(MIN_CHANNEL_SAMPLES):
+        async_session.add(
+            Task(
+                channel_id=channel.id,
+                notion_page_id=uuid.uuid4().hex,
+                title=f"History {i}",
+                topic="Topic",
+                story_direction="Direction",
+                status=TaskStatus.PUBLISHED,
+                step_completion_metadata=_metadata(asset_generation=60.0, video_generation=600.0),
+            )
+        )
+    halfway = Task(
+        channel_id=channel.id,
+        notion_page_id=uuid.uuid4().hex,
+        title="Halfway",
+        topic="Topic",
+        story_direction="Direction",
+        status=TaskStatus.QUEUED,
+        step_completion_metadata={"asset_generation": {"completed": True}},
+    )
+    fresh = Task(
+        channel_id=channel.id,
+        notion_page_id=uuid.uuid4().hex,
+        title="Fresh",
+        topic="Topic",
+        story_direction="Direction",
+        status=TaskStatus.QUEUED,
+    )
+    async_session.add_all([halfway, fresh])
+    await async_session.commit()
+    updated_at = halfway.updated_at
+
+    await refresh_step_duration_stats(async_session)
+    await async_session.commit()
+
+    await async_session.refresh(halfway)
+    await async_session.refresh(fresh)
+    assert halfway.predicted_remaining_seconds == 600.0
+    assert fresh.predicted_remaining_seconds == 660.0
+    assert halfway.predicted_remaining_cost_usd == 0.0  # No cost history
+    assert halfway.updated_at.replace(tzinfo=None) == updated_at.replace(tzinfo=None)
@@ -0,0 +1,224 @@
+"""Tests for workspace retention, garbage collection and disk back-pressure.
+
+Tests cover:
+    - apply_retention: Keep lists, whole-project deletion, cache eviction
+    - collect_workspaces: Status policies, min_age, one collection per status,
+      steps whose outputs were deleted marked incomplete with their durations
+      kept as work_estimator samples
+    - channel_disk_usage: Per-channel sums from tasks.workspace_bytes
+    - has_disk_headroom / ensure_disk_headroom: Urgent collection and claim
+      back-pressure
+"""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Channel, Task, TaskStatus
+from app.services.work_estimator import collect_step_history, completed_steps
+from app.services.workspace_retention import (
+    RETENTION_POLICIES,
+    RetentionPolicy,
+    apply_retention,
+    channel_disk_usage,
+    collect_workspaces,
+    directory_size,
+    ensure_disk_headroom,
+    has_disk_headroom,
+)
+from app.utils.filesystem import get_project_workspace
+from tests.fixtures.database import create_channel, create_task
+
+
+@pytest.fixture
+def workspace_root(tmp_path, monkeypatch):
+    """Point WORKSPACE_ROOT at a temporary directory."""
+    monkeypatch.setattr("app.utils.filesystem.WORKSPACE_ROOT", tmp_path)
+    return tmp_path
+
+
+def populate_project(channel_id: str, project_id: str) -> Path:
+    """Create a project with one file per step output (10 bytes each)."""
+    workspace = get_project_workspace(channel_id, project_id)
+    for path in [
+        workspace.character_dir / "hero.png",
+        workspace.composite_clip(1),
+        workspace.video_clip(1),
+        workspace.narration_clip(1),
+        workspace.sfx_clip(1),
+        workspace.project_dir / "assembly_manifest.json",
+        workspace.project_dir / f"{project_id}_final.mp4",
+    ]:
+        path.write_bytes(b"x" * 10)
+    return workspace.project_dir
+
+
+async def create_project_task(
+    db: AsyncSession,
+    channel: Channel,
+    status: TaskStatus,
+    updated_at: datetime | None = None,
+) -> Task:
+    """Create a task whose project holds the populate_project() files (70 bytes)."""
+    task = await create_task(
+        db,
+        channel,
+        status,
+        workspace_bytes=70,
+        step_completion_metadata={"asset_generation": {"completed": True}},
+    )
+    if updated_at is not None:
+        task.updated_at = updated_at
+        await db.flush()
+    return task
+
+
+def test_final_review_keeps_final_video_and_composites(workspace_root):
+    """Test FINAL_REVIEW drops everything except the final MP4 and composites."""
+    project_dir = populate_project("poke1", "vid_review")
+
+    result = apply_retention("poke1", "vid_review", RETENTION_POLICIES[TaskStatus.FINAL_REVIEW])
+
+    remaining = sorted(
+        str(path.relative_to(project_dir)) for path in project_dir.rglob("*") if path.is_file()
+    )
+    assert remaining == ["assets/composites/clip_01.png", "vid_review_final.mp4"]
+    assert result.freed_bytes == 50
+    assert result.remaining_bytes == 20
+
+
+def test_empty_keep_list_deletes_project_and_evicts_cache(workspace_root):
+    """Test a keep-nothing policy removes the project and the cached workspace."""
+    project_dir = populate_project("poke1", "vid_gone")
+
+    result = apply_retention("poke1", "vid_gone", RetentionPolicy(keep=()))
+
+    assert result.freed_bytes == 70
+    assert not project_dir.exists()
+    # Evicted: the next lookup recreates directories instead of returning stale ones
+    assert get_project_workspace("poke1", "vid_gone").video_dir.is_dir()
+
+
+def test_missing_project_is_a_no_op(workspace_root):
+    """Test collecting a workspace that never existed frees nothing."""
+    result = apply_retention("poke1", "vid_missing", RETENTION_POLICIES[TaskStatus.PUBLISHED])
+
+    assert (result.freed_bytes, result.remaining_bytes) == (0, 0)
+    assert directory_size(workspace_root / "nowhere") == 0
+
+
+async def test_collect_workspaces_applies_policies_once(
+    async_session: AsyncSession, workspace_root
+):
+    """Test eligible tasks are collected once and min_age defers recent ones."""
+    channel = await create_channel(async_session)
+
+    review = await create_project_task(async_session, channel, TaskStatus.FINAL_REVIEW)
+    old_cancelled = await create_project_task(
+        async_session, channel, TaskStatus.CANCELLED, datetime.now(timezone.utc) - timedelta(days=2)
+    )
+    recent_published = await create_project_task(async_session, channel, TaskStatus.PUBLISHED)
+    in_progress = await create_project_task(async_session, channel, TaskStatus.GENERATING_VIDEO)
+    for task in (review, old_cancelled, recent_published, in_progress):
+        populate_project("poke1", str(task.id))
+    now = datetime.now(timezone.utc)
+
+    freed = await collect_workspaces(async_session, now=now)
+
+    assert freed == 50 + 70
+    assert review.workspace_bytes == 20
+    assert review.workspace_retention_status == "final_review"
+    assert old_cancelled.workspace_bytes == 0
+    assert old_cancelled.step_completion_metadata == {
+        "asset_generation": {"completed": False, "outputs_pruned": True}
+    }
+    assert recent_published.workspace_retention_status is None  # min_age not reached
+    assert in_progress.workspace_retention_status is None  # no policy
+    assert await collect_workspaces(async_session, now=now) == 0
+
+    # Disk pressure ignores min_age
+    assert await collect_workspaces(async_session, now=now, ignore_min_age=True) == 60
+
+
+async def test_collect_workspaces_marks_pruned_steps_incomplete(
+    async_session: AsyncSession, workspace_root
+):
+    """Test steps whose outputs were deleted are incomplete but keep their durations."""
+    channel = await create_channel(async_session)
+    review = await create_project_task(async_session, channel, TaskStatus.FINAL_REVIEW)
+    review.step_completion_metadata = {
+        step: {"completed": True, "duration_seconds": 60.0}
+        for step in (
+            "asset_generation",
+            "composite_creation",
+            "video_generation",
+            "narration_generation",
+            "sfx_generation",
+            "video_assembly",
+        )
+    }
+    await async_session.flush()
+    populate_project("poke1", str(review.id))
+
+    await collect_workspaces(async_session)
+
+    # Only the final video and composites survive FINAL_REVIEW retention
+    assert completed_steps(review.step_completion_metadata) == {
+        "composite_creation",
+        "video_assembly",
+    }
+    assert review.step_completion_metadata["video_generation"] == {
+        "completed": False,
+        "duration_seconds": 60.0,
+        "outputs_pruned": True,
+    }
+    # Pruned steps still ran: their durations remain estimator samples
+    durations, _ = await collect_step_history(async_session)
+    samples = {step: len(values) for step, values in durations[channel.id].items()}
+    assert samples == dict.fromkeys(review.step_completion_metadata, 1)
+
+
+async def test_channel_disk_usage_sums_tasks(async_session: AsyncSession):
+    """Test per-channel usage comes from tasks.workspace_bytes."""
+    poke1 = await create_channel(async_session, "poke1")
+    poke2 = await create_channel(async_session, "poke2")
+    await create_project_task(async_session, poke1, TaskStatus.QUEUED)
+    await create_project_task(async_session, poke1, TaskStatus.GENERATING_VIDEO)
+    await create_project_task(async_session, poke2, TaskStatus.QUEUED)
+
+    assert await channel_disk_usage(async_session) == {"poke1": 140, "poke2": 70}
+
+
+async def test_ensure_disk_headroom_applies_backpressure(
+    async_session: AsyncSession, workspace_root, monkeypatch
+):
+    """Test low free space triggers urgent collection, then refuses new work."""
+    monkeypatch.setenv("WORKSPACE_MIN_FREE_GB", "1")
+    with patch(
+        "app.services.workspace_retention.free_disk_bytes", return_value=1024
+    ), patch(
+        "app.services.workspace_retention.collect_workspaces", return_value=0
+    ) as mock_collect:
+        assert await ensure_disk_headroom(async_session) is False
+    mock_collect.assert_awaited_once_with(async_session, ignore_min_age=True)
+
+    with patch("app.services.workspace_retention.free_disk_bytes", return_value=2 * 1024**3):
+        assert await ensure_disk_headroom(async_session) is True
+
+    monkeypatch.setenv("WORKSPACE_MIN_FREE_GB", "0")
+    with patch("app.services.workspace_retention.free_disk_bytes", return_value=0):
+        assert await ensure_disk_headroom(async_session) is True
+
+
+def test_has_disk_headroom_compares_free_space(monkeypatch):
+    """Test the pre-claim check is a plain free-space comparison."""
+    monkeypatch.setenv("WORKSPACE_MIN_FREE_GB", "1")
+    with patch("app.services.workspace_retention.free_disk_bytes", return_value=1024):
+        assert has_disk_headroom() is False
+    with patch("app.services.workspace_retention.free_disk_bytes", return_value=2 * 1024**3):
+        assert has_disk_headroom() is True
+    with patch("app.services.workspace_retention.free_disk_bytes", return_value=None):
+        assert has_disk_headroom() is True
@@ -213,6 +213,46 @@ class TestTaskStatusConstants:
         assert len(IN_PROGRESS_STATUSES) == 14
 
 
+class TestClaimedTransitions:
+    """Tests for where a claimed task may start (resume after approval or retry)."""
+
+    def test_claimed_can_start_every_pipeline_step(self) -> None:
+        """Test CLAIMED leads to exactly the in-progress status of each step."""
+        from app.services.pipeline_orchestrator import STEP_STATUS_MAP
+
+        assert set(Task.VALID_TRANSITIONS[TaskStatus.CLAIMED]) == set(STEP_STATUS_MAP.values())
+
+    @pytest.mark.asyncio
+    async def test_claimed_task_resumes_at_later_step(
+        self, async_session: AsyncSession, test_channel: Channel
+    ) -> None:
+        """Test a re-queued task with completed steps moves from CLAIMED to its next step."""
+        task = create_test_task(
+            test_channel.id,
+            status=TaskStatus.QUEUED,
+            step_completion_metadata={"narration_generation": {"completed": True}},
+        )
+        async_session.add(task)
+        await async_session.commit()
+
+        task.status = TaskStatus.CLAIMED
+        task.status = TaskStatus.GENERATING_SFX
+        await async_session.commit()
+
+        await async_session.refresh(task)
+        assert task.status == TaskStatus.GENERATING_SFX
+
+    def test_claimed_cannot_skip_to_review_status(self, test_channel: Channel) -> None:
+        """Test a claimed task cannot jump to a step's ready (review) status."""
+        from app.exceptions import InvalidStateTransitionError
+
+        task = create_test_task(test_channel.id, status=TaskStatus.QUEUED)
+        task.status = TaskStatus.CLAIMED
+
+        with pytest.raises(InvalidStateTransitionError):
+            task.status = TaskStatus.VIDEO_READY
+
+
 class TestMaxConcurrentSync:
     """Tests for max_concurrent sync from YAML to database.
 
@@ -2,16 +2,21 @@
 Unit tests for app/utils/cli_wrapper.py.
 
 Tests CLI script wrapper for async subprocess execution, error handling,
-timeout management, and non-blocking event loop behavior.
+timeout management (process group kill), bounded output capture, and
+non-blocking event loop behavior. Most tests run real throwaway scripts.
 """
 
 import asyncio
-import subprocess
-from unittest.mock import AsyncMock, Mock, patch
+import os
+import textwrap
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from app.utils.cli_wrapper import CLIScriptError, run_cli_script
+from app.utils.cli_wrapper import OUTPUT_TAIL_LINES, CLIScriptError, run_cli_script
+from app.utils.tracing import configure_tracing, shutdown_tracing, span
 
 
 class TestCLIScriptError:
@@ -31,246 +36,312 @@ class TestCLIScriptError:
         assert str(error) == f"{script} failed with exit code {exit_code}: {stderr}"
 
 
+def _is_running(pid: int) -> bool:
+    """Return True if pid is alive (killed orphans may linger as zombies)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    stat = Path(f"/proc/{pid}/stat")
+    return not (stat.exists() and stat.read_text().rsplit(")", 1)[1].split()[0] == "Z")
+
+
+@pytest.fixture
+def make_script():
+    """Write throwaway scripts into scripts/ (run_cli_script only runs scripts there)."""
+    created: list[Path] = []
+
+    def _make(body: str) -> str:
+        path = Path("scripts") / f"_test_cli_{uuid.uuid4().hex[:8]}.py"
+        path.write_text(textwrap.dedent(body))
+        created.append(path)
+        return path.name
+
+    yield _make
+    for path in created:
+        path.unlink(missing_ok=True)
+
+
 class TestRunCLIScript:
     """Test run_cli_script async function."""
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_success(self, mocker):
+    async def test_run_cli_script_success(self, make_script, mocker):
         """Test successful script execution returns CompletedProcess."""
-        # Mock successful subprocess result
-        mock_result = Mock(returncode=0, stdout="✅ Asset generated: /tmp/test.png", stderr="")
-
-        # Mock asyncio.to_thread to return mock result
-        mocker.patch("asyncio.to_thread", return_value=mock_result)
-
-        # Mock logger to avoid actual logging
+        script = make_script(
+            """
+            import sys
+            print("✅ Asset generated:", sys.argv[2])
+            """
+        )
         mocker.patch("app.utils.cli_wrapper.log")
 
-        # Execute
-        result = await run_cli_script(
-            "generate_asset.py",
-            ["--output", "/tmp/test.png"],  # noqa: S108
-            timeout=60,
-        )
+        result = await run_cli_script(script, ["--output", "/tmp/test.png"], timeout=60)  # noqa: S108
 
-        # Verify
         assert result.returncode == 0
         assert result.stdout == "✅ Asset generated: /tmp/test.png"
         assert result.stderr == ""
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_failure(self, mocker):
+    async def test_run_cli_script_failure(self, make_script, mocker):
         """Test script failure raises CLIScriptError with stderr."""
-        # Mock failed subprocess result
-        mock_result = Mock(
-            returncode=1, stdout="", stderr="❌ GEMINI_API_KEY not found in environment"
+        script = make_script(
+            """
+            import sys
+            print("❌ GEMINI_API_KEY not found in environment", file=sys.stderr)
+            sys.exit(1)
+            """
         )
-
-        mocker.patch("asyncio.to_thread", return_value=mock_result)
         mocker.patch("app.utils.cli_wrapper.log")
 
-        # Execute and verify exception
         with pytest.raises(CLIScriptError) as exc_info:
-            await run_cli_script("generate_asset.py", ["--output", "/tmp/test.png"])  # noqa: S108
+            await run_cli_script(script, ["--output", "/tmp/test.png"])  # noqa: S108
 
-        # Verify exception attributes
-        assert exc_info.value.script == "generate_asset.py"
+        assert exc_info.value.script == script
         assert exc_info.value.exit_code == 1
         assert "GEMINI_API_KEY not found" in exc_info.value.stderr
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_timeout(self, mocker):
-        """Test script timeout raises asyncio.TimeoutError."""
-        # Mock subprocess.TimeoutExpired exception
-        mocker.patch(
-            "asyncio.to_thread",
-            side_effect=subprocess.TimeoutExpired(
-                cmd=["python", "scripts/generate_video.py"], timeout=5
-            ),
+    async def test_run_cli_script_timeout_kills_process_group(self, make_script, tmp_path, mocker):
+        """Test timeout raises asyncio.TimeoutError and kills the script's children too."""
+        pid_file = tmp_path / "child.pid"
+        script = make_script(
+            f"""
+            import subprocess, sys, time
+            child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+            open({str(pid_file)!r}, "w").write(str(child.pid))
+            time.sleep(60)
+            """
         )
         mocker.patch("app.utils.cli_wrapper.log")
 
-        # Execute and verify timeout exception
         with pytest.raises(asyncio.TimeoutError) as exc_info:
-            await run_cli_script(
-                "generate_video.py", ["--image", "comp.png", "--prompt", "motion"], timeout=5
-            )
+            await run_cli_script(script, [], timeout=1)
 
-        # Verify timeout message includes script name
-        assert "generate_video.py" in str(exc_info.value)
+        assert script in str(exc_info.value)
+        await asyncio.sleep(0.2)
+        assert not _is_running(int(pid_file.read_text()))
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_event_loop_non_blocking(self, mocker):
-        """Test concurrent script executions don't block each other."""
+    async def test_run_cli_script_cancellation_kills_process(self, make_script, tmp_path, mocker):
+        """Test cancelling the awaiting task does not leak the script process."""
+        pid_file = tmp_path / "script.pid"
+        script = make_script(
+            f"""
+            import os, time
+            open({str(pid_file)!r}, "w").write(str(os.getpid()))
+            time.sleep(60)
+            """
+        )
+        mocker.patch("app.utils.cli_wrapper.log")
 
-        # Create mock results with delays to simulate long-running operations
-        async def mock_to_thread_with_delay(*args, **kwargs):
-            await asyncio.sleep(0.1)  # Simulate 100ms operation
-            return Mock(returncode=0, stdout="Success", stderr="")
+        task = asyncio.create_task(run_cli_script(script, [], timeout=30))
+        for _ in range(200):  # up to 10s for the script to start
+            if pid_file.exists() and pid_file.read_text():
+                break
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
 
-        mocker.patch("asyncio.to_thread", side_effect=mock_to_thread_with_delay)
+        assert not _is_running(int(pid_file.read_text()))
+
+    @pytest.mark.asyncio
+    async def test_run_cli_script_event_loop_non_blocking(self, make_script, mocker):
+        """Test concurrent script executions don't block each other."""
+        script = make_script(
+            """
+            import time
+            time.sleep(0.5)
+            print("Success")
+            """
+        )
         mocker.patch("app.utils.cli_wrapper.log")
 
-        # Execute 3 scripts concurrently
         start_time = asyncio.get_event_loop().time()
+        ticks = 0
 
-        results = await asyncio.gather(
-            run_cli_script("generate_asset.py", ["--output", "asset1.png"]),
-            run_cli_script("generate_asset.py", ["--output", "asset2.png"]),
-            run_cli_script("generate_asset.py", ["--output", "asset3.png"]),
-        )
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
 
-        end_time = asyncio.get_event_loop().time()
-        duration = end_time - start_time
+        ticker_task = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(run_cli_script(script, []) for _ in range(3)))
+        ticker_task.cancel()
+        duration = asyncio.get_event_loop().time() - start_time
 
-        # Verify all succeeded
-        assert len(results) == 3
         assert all(r.returncode == 0 for r in results)
-
-        # Verify concurrent execution (should be ~0.1s, not 0.3s)
-        # Allow some overhead for test execution
-        assert duration < 0.25, f"Expected ~0.1s but took {duration}s (should be concurrent)"
+        # Concurrent (~0.5s + interpreter startup, not 1.5s) and the loop kept running
+        assert duration < 1.4, f"Expected concurrent execution but took {duration}s"
+        assert ticks >= 5
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_constructs_correct_command(self, mocker):
+    async def test_run_cli_script_constructs_correct_command(self, mocker, monkeypatch):
         """Test command construction with script path and arguments."""
-        mock_result = Mock(returncode=0, stdout="Success", stderr="")
-
-        # Capture the command passed to subprocess.run
-        captured_command = None
-
-        def capture_subprocess_run(command, **kwargs):
-            nonlocal captured_command
-            captured_command = command
-            return mock_result
-
-        mocker.patch(
-            "asyncio.to_thread", side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs)
-        )
-        mocker.patch("subprocess.run", side_effect=capture_subprocess_run)
+        monkeypatch.setenv("CLI_SCRIPT_POOL_SIZE", "0")  # One-off subprocess path
+        process = Mock(pid=12345, returncode=0, stdout=asyncio.StreamReader(), stderr=asyncio.StreamReader())
+        process.stdout.feed_eof()
+        process.stderr.feed_eof()
+        process.wait = AsyncMock(return_value=0)
+        mock_exec = mocker.patch("asyncio.create_subprocess_exec", return_value=process)
         mocker.patch("app.utils.cli_wrapper.log")
 
-        # Execute
         await run_cli_script(
             "generate_asset.py",
             ["--prompt", "A forest", "--output", "/tmp/asset.png"],  # noqa: S108
             timeout=60,
         )
 
-        # Verify command construction
+        captured_command = mock_exec.call_args[0]
         assert captured_command[0] == "python"
         assert "scripts/generate_asset.py" in captured_command[1]
-        assert "--prompt" in captured_command
-        assert "A forest" in captured_command
-        assert "--output" in captured_command
-        assert "/tmp/asset.png" in captured_command  # noqa: S108
+        assert captured_command[2:] == ("--prompt", "A forest", "--output", "/tmp/asset.png")  # noqa: S108
+        # Own process group (kill on timeout) and inherited env without a copy
+        assert mock_exec.call_args[1]["start_new_session"] is True
+        assert mock_exec.call_args[1]["env"] is None
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_passes_timeout_to_subprocess(self, mocker):
-        """Test timeout parameter is passed to subprocess.run."""
-        mock_result = Mock(returncode=0, stdout="Success", stderr="")
+    async def test_run_cli_script_env_extends_parent_environment(self, make_script, mocker):
+        """Test env overrides are visible to the script alongside inherited variables."""
+        script = make_script(
+            """
+            import os
+            print(os.environ["ELEVENLABS_VOICE_ID"], "PATH" in os.environ)
+            """
+        )
+        mocker.patch("app.utils.cli_wrapper.log")
 
-        captured_kwargs = {}
+        result = await run_cli_script(script, [], env={"ELEVENLABS_VOICE_ID": "voice123"})
 
-        def capture_subprocess_run(command, **kwargs):
-            nonlocal captured_kwargs
-            captured_kwargs.update(kwargs)
-            return mock_result
+        assert result.stdout == "voice123 True"
+        assert "ELEVENLABS_VOICE_ID" not in os.environ
 
-        mocker.patch(
-            "asyncio.to_thread", side_effect=lambda fn, *args, **kwargs: fn(*args, **kwargs)
+    @pytest.mark.asyncio
+    async def test_run_cli_script_propagates_trace_context(self, make_script, mocker):
+        """Test the script receives its cli_script span as TRACEPARENT when tracing."""
+        script = make_script(
+            """
+            import os
+            print(os.environ["TRACEPARENT"])
+            """
         )
-        mocker.patch("subprocess.run", side_effect=capture_subprocess_run)
         mocker.patch("app.utils.cli_wrapper.log")
+        exporter = Mock()
+        configure_tracing([exporter])
+        try:
+            with span("clip.video") as clip_span:
+                result = await run_cli_script(script, [])
+        finally:
+            shutdown_tracing()
 
-        # Execute with custom timeout
-        await run_cli_script("generate_video.py", ["--image", "comp.png"], timeout=300)
-
-        # Verify timeout passed to subprocess
-        assert captured_kwargs.get("timeout") == 300
-        assert captured_kwargs.get("capture_output") is True
-        assert captured_kwargs.get("text") is True
+        exported = [s for call in exporter.export.call_args_list for s in call.args[0]]
+        script_span = next(s for s in exported if s.name == "cli_script")
+        assert script_span.parent_id == clip_span.span_id
+        assert script_span.attributes["exit_code"] == 0
+        assert result.stdout == script_span.traceparent
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_captures_stdout_stderr(self, mocker):
+    async def test_run_cli_script_captures_stdout_stderr(self, make_script, mocker):
         """Test stdout and stderr are captured from subprocess."""
-        mock_result = Mock(
-            returncode=0,
-            stdout="✅ Video generated successfully",
-            stderr="⚠️ Warning: Low GPU memory",
+        script = make_script(
+            """
+            import sys
+            print("✅ Video generated successfully")
+            print("⚠️ Warning: Low GPU memory", file=sys.stderr)
+            """
         )
-
-        mocker.patch("asyncio.to_thread", return_value=mock_result)
         mocker.patch("app.utils.cli_wrapper.log")
 
-        # Execute
-        result = await run_cli_script("generate_video.py", ["--image", "comp.png"])
+        result = await run_cli_script(script, ["--image", "comp.png"])
 
-        # Verify output captured
         assert "Video generated successfully" in result.stdout
         assert "Warning: Low GPU memory" in result.stderr
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_logging_on_success(self, mocker):
-        """Test logging events are emitted on successful execution."""
-        mock_result = Mock(returncode=0, stdout="Success", stderr="")
-        mocker.patch("asyncio.to_thread", return_value=mock_result)
+    async def test_run_cli_script_keeps_bounded_output_tail(self, make_script, mocker):
+        """Test only the last OUTPUT_TAIL_LINES lines are retained, each line logged."""
+        script = make_script(
+            """
+            for i in range(1000):
+                print(f"line {i}")
+            """
+        )
+        mock_log = mocker.patch("app.utils.cli_wrapper.log")
+
+        result = await run_cli_script(script, [])
 
+        lines = result.stdout.splitlines()
+        assert len(lines) == OUTPUT_TAIL_LINES
+        assert lines[-1] == "line 999"
+        assert mock_log.debug.call_count == 1000
+        assert mock_log.debug.call_args[1]["stream"] == "stdout"
+
+    @pytest.mark.asyncio
+    async def test_run_cli_script_logging_on_success(self, make_script, mocker):
+        """Test logging events are emitted on successful execution."""
+        script = make_script(
+            """
+            print("Success")
+            """
+        )
         mock_log = mocker.patch("app.utils.cli_wrapper.log")
 
-        # Execute
-        await run_cli_script("generate_asset.py", ["--output", "test.png"], timeout=60)
+        await run_cli_script(script, ["--output", "test.png"], timeout=60)
 
         # Verify log.info called for start and success
         assert mock_log.info.call_count == 2
 
-        # Verify first call (cli_script_start)
         start_call = mock_log.info.call_args_list[0]
         assert start_call[0][0] == "cli_script_start"
-        assert start_call[1]["script"] == "generate_asset.py"
+        assert start_call[1]["script"] == script
         assert start_call[1]["timeout"] == 60
 
-        # Verify second call (cli_script_success)
+        # Success event carries duration and resource usage
         success_call = mock_log.info.call_args_list[1]
         assert success_call[0][0] == "cli_script_success"
+        assert success_call[1]["duration_seconds"] > 0
+        assert {"cpu_seconds", "peak_rss_mb"} <= success_call[1].keys()
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_logging_on_failure(self, mocker):
+    async def test_run_cli_script_logging_on_failure(self, make_script, mocker):
         """Test logging events are emitted on script failure."""
-        mock_result = Mock(returncode=1, stdout="", stderr="API key missing")
-        mocker.patch("asyncio.to_thread", return_value=mock_result)
-
+        script = make_script(
+            """
+            import sys
+            sys.exit("API key missing")
+            """
+        )
         mock_log = mocker.patch("app.utils.cli_wrapper.log")
 
-        # Execute
         with pytest.raises(CLIScriptError):
-            await run_cli_script("generate_asset.py", ["--output", "test.png"])
+            await run_cli_script(script, ["--output", "test.png"])
 
-        # Verify log.error called
         assert mock_log.error.call_count == 1
         error_call = mock_log.error.call_args_list[0]
         assert error_call[0][0] == "cli_script_error"
         assert error_call[1]["exit_code"] == 1
+        assert "API key missing" in error_call[1]["stderr"]
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_logging_on_timeout(self, mocker):
+    async def test_run_cli_script_logging_on_timeout(self, make_script, mocker):
         """Test logging events are emitted on timeout."""
-        mocker.patch(
-            "asyncio.to_thread",
-            side_effect=subprocess.TimeoutExpired(cmd=["python", "script.py"], timeout=5),
+        script = make_script(
+            """
+            import time
+            time.sleep(60)
+            """
         )
-
         mock_log = mocker.patch("app.utils.cli_wrapper.log")
 
-        # Execute
         with pytest.raises(asyncio.TimeoutError):
-            await run_cli_script("generate_video.py", ["--image", "comp.png"], timeout=5)
+            await run_cli_script(script, ["--image", "comp.png"], timeout=1)
 
-        # Verify log.error called for timeout
         assert mock_log.error.call_count == 1
         timeout_call = mock_log.error.call_args_list[0]
         assert timeout_call[0][0] == "cli_script_timeout"
-        assert timeout_call[1]["timeout"] == 5
+        assert timeout_call[1]["timeout"] == 1
 
     @pytest.mark.asyncio
     async def test_run_cli_script_path_traversal_blocked(self, mocker):
@@ -295,21 +366,21 @@ class TestRunCLIScript:
         assert "Script not found" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_sanitizes_sensitive_args_in_logs(self, mocker):
+    async def test_run_cli_script_sanitizes_sensitive_args_in_logs(self, make_script, mocker):
         """Test sensitive arguments are redacted in logs."""
-        mock_result = Mock(returncode=0, stdout="Success", stderr="")
-        mocker.patch("asyncio.to_thread", return_value=mock_result)
-
+        script = make_script(
+            """
+            print("Success")
+            """
+        )
         mock_log = mocker.patch("app.utils.cli_wrapper.log")
 
-        # Execute with sensitive args
         await run_cli_script(
-            "generate_asset.py",
+            script,
             ["--api-key", "secret123", "--output", "/tmp/test.png"],  # noqa: S108
             timeout=60,
         )
 
-        # Verify log.info called with sanitized args
         start_call = mock_log.info.call_args_list[0]
         sanitized_args = start_call[1]["args"]
 
@@ -318,45 +389,24 @@ class TestRunCLIScript:
         assert "secret123" not in str(sanitized_args)
 
     @pytest.mark.asyncio
-    async def test_run_cli_script_timeout_exception_chain(self, mocker):
-        """Test timeout exception properly chains subprocess.TimeoutExpired."""
-        timeout_exc = subprocess.TimeoutExpired(
-            cmd=["python", "scripts/generate_video.py"], timeout=5
-        )
-        mocker.patch("asyncio.to_thread", side_effect=timeout_exc)
-        mocker.patch("app.utils.cli_wrapper.log")
-
-        # Execute and verify exception chain
-        with pytest.raises(asyncio.TimeoutError) as exc_info:
-            await run_cli_script("generate_video.py", ["--image", "comp.png"], timeout=5)
-
-        # Verify exception chain preserves original TimeoutExpired
-        assert exc_info.value.__cause__.__class__ == subprocess.TimeoutExpired
-        assert exc_info.value.__cause__ == timeout_exc
-
-    @pytest.mark.asyncio
-    async def test_run_cli_script_handles_unicode_decode_errors(self, mocker):
+    async def test_run_cli_script_handles_unicode_decode_errors(self, make_script, mocker):
         """Test non-UTF-8 output is handled gracefully with replacement chars."""
-        # Mock result with replacement characters (simulating errors='replace')
-        mock_result = Mock(returncode=0, stdout="Output with �� replacement chars", stderr="")
-        mocker.patch("asyncio.to_thread", return_value=mock_result)
+        script = make_script(
+            """
+            import sys
+            sys.stdout.buffer.write(b"Output with \\xff\\xfe replacement chars\\n")
+            """
+        )
         mocker.patch("app.utils.cli_wrapper.log")
 
-        # Execute
-        result = await run_cli_script("generate_asset.py", ["--output", "test.png"])
+        result = await run_cli_script(script, ["--output", "test.png"])
 
-        # Verify replacement characters preserved
-        assert "replacement chars" in result.stdout
+        assert result.stdout == "Output with \ufffd\ufffd replacement chars"
 
     @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_run_actual_cli_script_with_python(self):
         """Integration test: Execute real subprocess with Python -c command."""
-        # Create a temporary test script
-        import tempfile
-        import os
-        from pathlib import Path
-
         # Create test script in scripts/ directory
         scripts_dir = Path("scripts")
         scripts_dir.mkdir(exist_ok=True)
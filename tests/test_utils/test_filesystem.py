@@ -8,6 +8,7 @@ Tests verify:
 - String conversion for CLI scripts
 - Idempotent directory creation
 - Correct subdirectory structure
+- ProjectWorkspace caching (no mkdir/resolve on cache hits, LRU bound, eviction)
 """
 
 import pytest
@@ -26,7 +27,10 @@ from app.utils.filesystem import (
     ENVIRONMENT_DIR_NAME,
     PROPS_DIR_NAME,
     COMPOSITE_DIR_NAME,
+    clear_workspace_cache,
+    evict_project_workspace,
     get_channel_workspace,
+    get_project_workspace,
     get_project_dir,
     get_asset_dir,
     get_character_dir,
@@ -504,3 +508,101 @@ class TestSecurityValidation:
         # Verify neither path can reference the other channel
         assert channel2 not in str(path1)
         assert channel1 not in str(path2)
+
+
+class TestProjectWorkspaceCache:
+    """Test cached ProjectWorkspace resolution."""
+
+    def test_cache_hit_skips_filesystem(self, mock_workspace_root):
+        """Test repeated lookups return the same object without mkdir or resolve."""
+        workspace = get_project_workspace("poke1", "vid_cache")
+
+        with patch.object(Path, "mkdir") as mock_mkdir, patch.object(Path, "resolve") as mock_resolve:
+            assert get_project_workspace("poke1", "vid_cache") is workspace
+            assert get_audio_dir("poke1", "vid_cache") == workspace.audio_dir
+            assert get_composite_dir("poke1", "vid_cache") == workspace.composite_dir
+            assert get_channel_workspace("poke1") == workspace.project_dir.parent.parent
+
+        mock_mkdir.assert_not_called()
+        mock_resolve.assert_not_called()
+
+    def test_workspace_creates_all_directories(self, mock_workspace_root):
+        """Test the first lookup creates every project directory."""
+        workspace = get_project_workspace("poke1", "vid_tree")
+
+        for directory in workspace.leaf_dirs:
+            assert directory.is_dir()
+
+    def test_precomputed_clip_paths(self, mock_workspace_root):
+        """Test per-clip paths match the CLI script naming conventions."""
+        workspace = get_project_workspace("poke1", "vid_clips")
+
+        assert workspace.composite_clip(1) == workspace.composite_dir / "clip_01.png"
+        assert workspace.video_clip(18) == workspace.video_dir / "clip_18.mp4"
+        assert workspace.narration_clip(3) == workspace.audio_dir / "clip_03.mp3"
+        assert workspace.sfx_clip(3) == workspace.sfx_dir / "sfx_03.wav"
+        assert workspace.sfx_mp3_clip(3) == workspace.sfx_dir / "sfx_03.mp3"
+        with pytest.raises(ValueError, match="clip_number"):
+            workspace.video_clip(19)
+
+    def test_evict_recreates_deleted_directories(self, mock_workspace_root):
+        """Test eviction after deleting a project makes the next lookup recreate it."""
+        import shutil
+
+        workspace = get_project_workspace("poke1", "vid_gc")
+        shutil.rmtree(workspace.project_dir)
+
+        evict_project_workspace("poke1", "vid_gc")
+        recreated = get_project_workspace("poke1", "vid_gc")
+
+        assert recreated is not workspace
+        assert recreated.video_dir.is_dir()
+
+    def test_cache_hit_recreates_project_deleted_without_eviction(self, mock_workspace_root):
+        """Test a project directory deleted behind the cache is recreated on lookup."""
+        import shutil
+
+        workspace = get_project_workspace("poke1", "vid_gone")
+        shutil.rmtree(workspace.project_dir)
+
+        recreated = get_project_workspace("poke1", "vid_gone")
+
+        assert recreated is not workspace
+        assert recreated.video_dir.is_dir()
+        assert get_audio_dir("poke1", "vid_gone").is_dir()
+
+    def test_cache_is_bounded(self, mock_workspace_root, monkeypatch):
+        """Test the least recently used workspace is dropped beyond the cache size."""
+        monkeypatch.setattr("app.utils.filesystem.WORKSPACE_CACHE_SIZE", 2)
+        clear_workspace_cache()
+
+        first = get_project_workspace("poke1", "vid_1")
+        get_project_workspace("poke1", "vid_2")
+        get_project_workspace("poke1", "vid_3")
+
+        assert get_project_workspace("poke1", "vid_1") is not first
+
+    def test_channel_cache_is_bounded(self, mock_workspace_root, monkeypatch):
+        """Test channel paths are cached as an LRU of WORKSPACE_CACHE_SIZE entries."""
+        from app.utils import filesystem
+
+        monkeypatch.setattr("app.utils.filesystem.WORKSPACE_CACHE_SIZE", 2)
+        clear_workspace_cache()
+
+        get_channel_workspace("chan1")
+        get_channel_workspace("chan2")
+        get_channel_workspace("chan1")  # Refresh chan1; chan2 is now least recent
+        get_channel_workspace("chan3")
+
+        cached = {channel_id for _, channel_id in filesystem._channel_cache}
+        assert cached == {"chan1", "chan3"}
+
+    def test_cache_keyed_by_workspace_root(self, tmp_path, monkeypatch):
+        """Test a different WORKSPACE_ROOT never returns stale cached paths."""
+        monkeypatch.setattr("app.utils.filesystem.WORKSPACE_ROOT", tmp_path / "a")
+        workspace_a = get_project_workspace("poke1", "vid_root")
+        monkeypatch.setattr("app.utils.filesystem.WORKSPACE_ROOT", tmp_path / "b")
+        workspace_b = get_project_workspace("poke1", "vid_root")
+
+        assert workspace_a.project_dir.is_relative_to(tmp_path / "a")
+        assert workspace_b.project_dir.is_relative_to(tmp_path / "b")
@@ -0,0 +1,119 @@
+"""Tests for in-process Prometheus metrics.
+
+Tests cover:
+    - Exposition format: counters, gauges, cumulative histogram buckets,
+      label escaping
+    - track_api_call: latency and success/error outcome per provider
+    - Scrape hooks: collectors run on collect(), failures do not fail it
+    - Worker metrics server: GET /metrics over plain HTTP
+"""
+
+import asyncio
+import socket
+
+import pytest
+
+from app.utils.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    start_metrics_server,
+    track_api_call,
+)
+
+
+def test_render_exposition_format():
+    registry = MetricsRegistry()
+    requests = registry.register(Counter("requests_total", "Requests.", ("provider",)))
+    depth = registry.register(Gauge("queue_depth", "Depth.", ("channel_id",)))
+    latency = registry.register(Histogram("latency_seconds", "Latency.", ("provider",), (1, 5)))
+
+    requests.inc(provider='say "hi"')
+    depth.set(3, channel_id="poke1")
+    for value in (0.5, 2, 10):
+        latency.observe(value, provider="kling")
+
+    lines = registry.render().splitlines()
+    assert "# TYPE requests_total counter" in lines
+    assert 'requests_total{provider="say \\"hi\\""} 1' in lines
+    assert 'queue_depth{channel_id="poke1"} 3' in lines
+    assert 'latency_seconds_bucket{provider="kling",le="1"} 1' in lines
+    assert 'latency_seconds_bucket{provider="kling",le="5"} 2' in lines
+    assert 'latency_seconds_bucket{provider="kling",le="+Inf"} 3' in lines
+    assert 'latency_seconds_sum{provider="kling"} 12.5' in lines
+    assert 'latency_seconds_count{provider="kling"} 3' in lines
+
+
+def test_labels_must_match():
+    counter = Counter("requests_total", "Requests.", ("provider",))
+
+    with pytest.raises(ValueError, match="expects labels"):
+        counter.inc(outcome="error")
+
+
+async def test_track_api_call_records_outcome():
+    from app.utils.metrics import EXTERNAL_API_LATENCY, EXTERNAL_API_REQUESTS
+
+    calls = EXTERNAL_API_LATENCY.count(provider="test_provider")
+    errors = EXTERNAL_API_REQUESTS.value(provider="test_provider", outcome="error")
+
+    async with track_api_call("test_provider"):
+        pass
+    with pytest.raises(RuntimeError):
+        async with track_api_call("test_provider"):
+            raise RuntimeError("boom")
+
+    assert EXTERNAL_API_LATENCY.count(provider="test_provider") == calls + 2
+    assert EXTERNAL_API_REQUESTS.value(provider="test_provider", outcome="error") == errors + 1
+
+
+async def test_collectors_run_on_scrape_only():
+    registry = MetricsRegistry()
+    depth = registry.register(Gauge("queue_depth", "Depth.", ("channel_id",)))
+    runs = []
+
+    async def collect_depth():
+        runs.append(1)
+        depth.replace({("poke1",): 7})
+
+    async def broken():
+        raise RuntimeError("database unavailable")
+
+    registry.add_collector(collect_depth)
+    registry.add_collector(collect_depth)  # Idempotent
+    registry.add_collector(broken)
+    assert runs == []
+
+    body = await registry.collect()
+
+    assert runs == [1]
+    assert 'queue_depth{channel_id="poke1"} 7' in body
+
+
+async def test_worker_metrics_server_serves_metrics():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = await start_metrics_server(port, host="127.0.0.1")
+    assert server is not None
+
+    async def get(path: str) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: worker\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    try:
+        metrics = await get("/metrics")
+        missing = await get("/other")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert metrics.startswith(b"HTTP/1.1 200 OK")
+    assert b"# TYPE pipeline_step_duration_seconds histogram" in metrics
+    assert missing.startswith(b"HTTP/1.1 404")
+    assert await start_metrics_server(0) is None
@@ -0,0 +1,75 @@
+"""Tests for the sampling profiler and the event loop lag monitor."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+from app.utils import profiler
+from app.utils.metrics import start_metrics_server
+from app.utils.profiler import EventLoopLagMonitor, SamplingProfiler, install_profiling_triggers
+
+
+def burn_cpu(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def block_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def test_sampling_profiler_sees_busy_thread() -> None:
+    """Stacks are keyed by thread name and list frames outermost first."""
+    stop = threading.Event()
+    busy = threading.Thread(target=burn_cpu, args=(stop,), name="pil-composite")
+    busy.start()
+    try:
+        counts = SamplingProfiler(interval_seconds=0.005).run(0.2)
+    finally:
+        stop.set()
+        busy.join()
+
+    innermost = [stack.split(";")[-1] for stack in counts if stack.startswith("pil-composite;")]
+    assert any(frame.startswith("burn_cpu (test_profiler.py:") for frame in innermost)
+
+
+async def test_profile_endpoint_writes_collapsed_file(tmp_path, unused_tcp_port) -> None:
+    """POST /debug/profile returns folded stacks and writes them to the workspace."""
+    server = await start_metrics_server(unused_tcp_port, host="127.0.0.1")
+    assert server is not None
+    with patch.object(profiler.filesystem, "WORKSPACE_ROOT", tmp_path):
+        install_profiling_triggers()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", unused_tcp_port)
+            writer.write(b"POST /debug/profile?seconds=0.1 HTTP/1.1\r\nHost: worker\r\n\r\n")
+            await writer.drain()
+            response = (await reader.read()).decode()
+            writer.close()
+        finally:
+            asyncio.get_running_loop().remove_signal_handler(profiler.signal.SIGUSR1)
+            server.close()
+            await server.wait_closed()
+
+    assert response.startswith("HTTP/1.1 200 OK")
+    body = response.split("\r\n\r\n", 1)[1]
+    [written] = (tmp_path / "profiles").iterdir()
+    assert written.suffix == ".collapsed"
+    assert written.read_text() == body
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in body.splitlines())
+
+
+async def test_lag_monitor_reports_blocking_callback() -> None:
+    """A stall over the threshold is recorded with the blocking function's frame."""
+    monitor = EventLoopLagMonitor(threshold_seconds=0.05, interval_seconds=0.01)
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.05)
+
+    block_loop(0.3)
+    await asyncio.sleep(0.05)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    lag, stack = max(monitor.slowest)
+    assert lag >= 0.2
+    assert stack[-1].startswith("block_loop (test_profiler.py:")
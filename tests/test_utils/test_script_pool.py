@@ -0,0 +1,173 @@
+"""
+Unit tests for app/utils/script_pool.py.
+
+Tests the warm CLI script runner pool: runner reuse, per-job argv/env
+isolation, exit codes, crash isolation, recycling, timeouts and saturation.
+Tests run real runner processes with throwaway scripts in scripts/.
+"""
+
+import asyncio
+import textwrap
+import uuid
+from pathlib import Path
+
+import pytest
+
+from app.utils.cli_wrapper import OUTPUT_TAIL_LINES, CLIScriptError
+from app.utils.script_pool import ScriptPool
+
+RUNNER_SCRIPT = """
+    import os
+    import sys
+
+    IMPORTS = globals().get("IMPORTS", 0) + 1
+    IMPORT_VOICE_ID = os.getenv("VOICE_ID")
+
+
+    def main():
+        if sys.argv[1] == "import-env":
+            print(IMPORT_VOICE_ID)
+            return
+        if sys.argv[1] == "crash":
+            os._exit(3)
+        if sys.argv[1] == "hang":
+            import time
+            time.sleep(60)
+        if sys.argv[1] == "fail":
+            sys.exit("bad arguments")
+        if sys.argv[1] == "chatty":
+            for i in range(5000):
+                print("line", i)
+            sys.stdout.write("no newline")
+            return
+        print(os.getpid(), IMPORTS, os.environ.get("VOICE_ID"), sys.argv[1:])
+"""
+
+
+@pytest.fixture
+async def pool():
+    """Pool serving one throwaway script (yields (pool, script_name))."""
+    path = Path("scripts") / f"_test_pool_{uuid.uuid4().hex[:8]}.py"
+    path.write_text(textwrap.dedent(RUNNER_SCRIPT))
+    script_pool = ScriptPool(size=1, max_jobs=3, pooled_scripts=frozenset({path.name}))
+    try:
+        yield script_pool, path.name
+    finally:
+        await script_pool.close()
+        path.unlink(missing_ok=True)
+
+
+async def _run(pool_and_script, *args, env=None, timeout=10):
+    script_pool, script = pool_and_script
+    return await script_pool.run(
+        script, (Path("scripts") / script).resolve(), list(args), env, timeout
+    )
+
+
+async def test_runner_is_reused_and_imports_script_once(pool):
+    """Test consecutive jobs run in the same warm process without re-importing."""
+    first = await _run(pool, "one")
+    second = await _run(pool, "two")
+
+    pid_1, imports_1, _, argv_1 = first.stdout.split(" ", 3)
+    pid_2, imports_2, _, argv_2 = second.stdout.split(" ", 3)
+    assert first.pooled and first.returncode == 0
+    assert pid_1 == pid_2
+    assert imports_1 == imports_2 == "1"
+    assert argv_1 == "['one']" and argv_2 == "['two']"
+    assert second.usage.cpu_seconds is not None and second.usage.runner_peak_rss_bytes > 0
+    # The runner outlives the job, so there is no per-job process peak
+    assert second.usage.peak_rss_bytes is None
+
+
+async def test_env_overrides_are_isolated_per_job(pool):
+    """Test a job's env overrides do not leak into the next job."""
+    with_env = await _run(pool, "one", env={"VOICE_ID": "voice123"})
+    without_env = await _run(pool, "two")
+
+    assert "voice123" in with_env.stdout
+    assert "None" in without_env.stdout
+
+
+async def test_env_overrides_reach_import_time_settings(pool):
+    """Test settings a script reads at import time see the job's env overrides."""
+    with_env = await _run(pool, "import-env", env={"VOICE_ID": "voice123"})
+    without_env = await _run(pool, "import-env")
+
+    assert with_env.stdout == "voice123"
+    assert without_env.stdout == "None"
+
+
+async def test_output_is_capped_to_tail_lines(pool):
+    """Test a chatty job returns only the last OUTPUT_TAIL_LINES lines."""
+    run = await _run(pool, "chatty")
+
+    lines = run.stdout.splitlines()
+    assert len(lines) == OUTPUT_TAIL_LINES
+    assert lines[-2:] == ["line 4999", "no newline"]
+
+
+async def test_system_exit_becomes_return_code(pool):
+    """Test sys.exit("message") reports exit code 1 with the message on stderr."""
+    run = await _run(pool, "fail")
+
+    assert run.returncode == 1
+    assert "bad arguments" in run.stderr
+
+
+async def test_crashed_runner_is_replaced(pool):
+    """Test a crash fails only that job; the next job gets a fresh runner."""
+    before = await _run(pool, "one")
+
+    with pytest.raises(CLIScriptError) as exc_info:
+        await _run(pool, "crash")
+    assert exc_info.value.exit_code == 3
+
+    after = await _run(pool, "two")
+    assert after.returncode == 0
+    assert after.stdout.split()[0] != before.stdout.split()[0]
+
+
+async def test_runner_dead_while_idle_is_reaped_and_replaced(pool):
+    """Test a runner that died while idle is reaped and a fresh one serves the job."""
+    script_pool, _ = pool
+    before = await _run(pool, "one")
+    dead = script_pool._idle[0]
+    dead.process.kill()
+    await asyncio.sleep(0.2)
+
+    after = await _run(pool, "two")
+
+    assert after.returncode == 0
+    assert after.stdout.split()[0] != before.stdout.split()[0]
+    assert dead.process.returncode is not None
+
+
+async def test_runner_is_recycled_after_max_jobs(pool):
+    """Test a runner is retired after max_jobs and replaced by a new process."""
+    pids = [(await _run(pool, str(i))).stdout.split()[0] for i in range(4)]
+
+    assert len(set(pids[:3])) == 1
+    assert pids[3] != pids[0]
+
+
+async def test_timeout_kills_runner(pool):
+    """Test a timed-out job kills its runner and the pool keeps working."""
+    with pytest.raises(asyncio.TimeoutError):
+        await _run(pool, "hang", timeout=0.5)
+
+    assert (await _run(pool, "one")).returncode == 0
+
+
+async def test_saturated_pool_returns_none(pool):
+    """Test requests beyond the pool size are left to one-off subprocesses."""
+    script_pool, _ = pool
+    busy = asyncio.create_task(_run(pool, "hang", timeout=5))
+    await asyncio.sleep(0.5)
+
+    assert await _run(pool, "one") is None
+    assert await script_pool.run("other.py", Path("other.py"), [], None, 5) is None
+
+    busy.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await busy
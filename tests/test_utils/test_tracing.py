@@ -0,0 +1,141 @@
+"""Tests for trace spans, context propagation and span export."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.utils.tracing import (
+    TRACEPARENT_ENV,
+    JsonFileExporter,
+    OtlpHttpExporter,
+    Span,
+    configure_tracing,
+    current_span,
+    inject_trace_context,
+    parse_traceparent,
+    shutdown_tracing,
+    span,
+    traced,
+)
+
+
+class ListExporter:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def exported():
+    """Export spans to a list; flushed by shutdown_tracing()."""
+    exporter = ListExporter()
+    configure_tracing([exporter])
+    yield exporter
+    shutdown_tracing()
+
+
+async def test_spans_nest_across_concurrent_tasks(exported: ListExporter) -> None:
+    """Spans opened in gathered tasks parent to the span that started them."""
+
+    @traced("clip", lambda number: {"clip_number": number})
+    async def clip(number: int) -> str:
+        with span("api.kling"):
+            await asyncio.sleep(0)
+        return current_span().span_id  # type: ignore[union-attr]
+
+    with span("pipeline.step", step="video_generation") as step:
+        clip_ids = await asyncio.gather(*(clip(n) for n in range(3)))
+    assert current_span() is None
+    shutdown_tracing()
+
+    by_id = {s.span_id: s for s in exported.spans}
+    assert len(exported.spans) == 7
+    assert {s.trace_id for s in exported.spans} == {step.trace_id}
+    for clip_id in clip_ids:
+        assert by_id[clip_id].parent_id == step.span_id
+    api_calls = [s for s in exported.spans if s.name == "api.kling"]
+    assert sorted(s.parent_id for s in api_calls) == sorted(clip_ids)
+    assert sorted(s.attributes["clip_number"] for s in exported.spans if s.name == "clip") == [
+        0,
+        1,
+        2,
+    ]
+
+
+def test_error_marks_span_and_env_propagation(
+    exported: ListExporter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Exceptions fail the span; TRACEPARENT continues a trace across processes."""
+    with pytest.raises(ValueError), span("cli_script") as parent:
+        env = inject_trace_context(None)
+        raise ValueError("exit 1")
+
+    assert parent.error == "ValueError: exit 1"
+    assert env == {TRACEPARENT_ENV: parent.traceparent}
+
+    # A child process started with that env parents its root span to ours
+    monkeypatch.setenv(TRACEPARENT_ENV, env[TRACEPARENT_ENV])
+    with span("generate_video") as child:
+        pass
+    assert (child.trace_id, child.parent_id) == (parent.trace_id, parent.span_id)
+
+
+def test_disabled_tracing_keeps_env() -> None:
+    """Without exporters spans still get ids but nothing is injected."""
+    configure_tracing([])
+    try:
+        with span("cli_script") as opened:
+            assert inject_trace_context(None) is None
+            assert inject_trace_context({"A": "1"}) == {"A": "1"}
+        assert len(opened.trace_id) == 32 and opened.duration_seconds is not None
+    finally:
+        shutdown_tracing()
+
+
+def test_parse_traceparent_rejects_malformed() -> None:
+    valid = f"00-{'a' * 32}-{'b' * 16}-01"
+    assert parse_traceparent(valid) == ("a" * 32, "b" * 16)
+    assert parse_traceparent(f"00-{'0' * 32}-{'b' * 16}-01") is None
+    assert parse_traceparent("garbage") is None
+    assert parse_traceparent(None) is None
+
+
+def test_exporters_write_json_lines_and_otlp(tmp_path) -> None:
+    """File exporter appends JSON lines; OTLP payload carries ids and status."""
+    finished = Span(
+        "api.notion",
+        "a" * 32,
+        "b" * 16,
+        parent_id="c" * 16,
+        attributes={"provider": "notion", "attempt": 2},
+        start_ns=1_000,
+        end_ns=3_000,
+        error="HTTPStatusError: 503",
+    )
+    path = tmp_path / "spans.jsonl"
+    exporter = JsonFileExporter(str(path))
+    exporter.export([finished])
+    exporter.export([finished])
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 2
+    assert lines[0]["status"] == "error"
+    assert lines[0]["duration_seconds"] == pytest.approx(2e-6)
+
+    otlp = OtlpHttpExporter("http://collector:4318/v1/traces", "worker-1")
+    try:
+        payload = otlp.payload([finished])
+    finally:
+        otlp.close()
+    resource_spans = payload["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "worker-1"}
+    exported_span = resource_spans["scopeSpans"][0]["spans"][0]
+    assert exported_span["parentSpanId"] == "c" * 16
+    assert exported_span["status"] == {"code": 2, "message": "HTTPStatusError: 503"}
+    assert {"key": "attempt", "value": {"intValue": "2"}} in exported_span["attributes"]
@@ -25,6 +25,7 @@ from uuid import uuid4
 import pytest
 
 from app.models import Channel, Task, TaskStatus
+from app.services.task_events import get_error_log
 from app.utils.cli_wrapper import CLIScriptError
 from app.workers.asset_worker import process_asset_generation_task
 
@@ -167,9 +168,10 @@ class TestProcessAssetGenerationTask:
         # Verify task marked as error
         await async_session.refresh(task)
         assert task.status == TaskStatus.ASSET_ERROR
-        assert task.error_log is not None
-        assert "generate_asset.py" in task.error_log
-        assert "exit 1" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert error_log is not None
+        assert "generate_asset.py" in error_log
+        assert "exit 1" in error_log
 
     async def test_process_task_timeout_error(self, async_session, encryption_env):
         """Test timeout error handling."""
@@ -215,8 +217,9 @@ class TestProcessAssetGenerationTask:
         # Verify task marked as error
         await async_session.refresh(task)
         assert task.status == TaskStatus.ASSET_ERROR
-        assert task.error_log is not None
-        assert "timeout" in task.error_log.lower()
+        error_log = await get_error_log(async_session, task.id)
+        assert error_log is not None
+        assert "timeout" in error_log.lower()
 
     async def test_process_task_unexpected_error(self, async_session, encryption_env):
         """Test unexpected error handling."""
@@ -255,8 +258,9 @@ class TestProcessAssetGenerationTask:
         # Verify task marked as error
         await async_session.refresh(task)
         assert task.status == TaskStatus.ASSET_ERROR
-        assert task.error_log is not None
-        assert "Unexpected error" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert error_log is not None
+        assert "Unexpected error" in error_log
 
     async def test_short_transaction_pattern(self, async_session, encryption_env):
         """Test short transaction pattern (Architecture Decision 3)."""
@@ -25,6 +25,7 @@ from uuid import uuid4
 import pytest
 
 from app.models import Channel, Task, TaskStatus
+from app.services.task_events import get_error_log
 from app.utils.cli_wrapper import CLIScriptError
 from app.workers.composite_worker import process_composite_creation_task
 
@@ -174,7 +175,8 @@ class TestProcessCompositeCreationTask:
         # Verify task status updated to error
         await async_session.refresh(task)
         assert task.status == TaskStatus.ASSET_ERROR
-        assert "not found" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert "not found" in error_log
 
     async def test_process_task_timeout_error(self, async_session, encryption_env):
         """Test timeout error handling."""
@@ -225,7 +227,8 @@ class TestProcessCompositeCreationTask:
         # Verify task status updated to error
         await async_session.refresh(task)
         assert task.status == TaskStatus.ASSET_ERROR
-        assert "timeout" in task.error_log.lower()
+        error_log = await get_error_log(async_session, task.id)
+        assert "timeout" in error_log.lower()
 
     async def test_process_task_file_not_found_error(self, async_session, encryption_env):
         """Test FileNotFoundError handling (missing asset files)."""
@@ -273,7 +276,8 @@ class TestProcessCompositeCreationTask:
         # Verify task status updated to error
         await async_session.refresh(task)
         assert task.status == TaskStatus.ASSET_ERROR
-        assert "asset" in task.error_log.lower()
+        error_log = await get_error_log(async_session, task.id)
+        assert "asset" in error_log.lower()
 
     async def test_process_task_unexpected_error(self, async_session, encryption_env):
         """Test unexpected error handling."""
@@ -324,7 +328,8 @@ class TestProcessCompositeCreationTask:
         # Verify task status updated to error
         await async_session.refresh(task)
         assert task.status == TaskStatus.ASSET_ERROR
-        assert "Unexpected error" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert "Unexpected error" in error_log
 
     async def test_short_transaction_pattern_database_closed_during_generation(
         self, async_session, encryption_env
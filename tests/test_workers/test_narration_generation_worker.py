@@ -26,6 +26,7 @@ from uuid import uuid4
 import pytest
 
 from app.models import Channel, Task, TaskStatus
+from app.services.task_events import get_error_log
 from app.utils.cli_wrapper import CLIScriptError
 from app.workers.narration_generation_worker import process_narration_generation_task
 
@@ -179,7 +180,8 @@ class TestProcessNarrationGenerationTask:
         # Verify task was marked as error
         await async_session.refresh(task)
         assert task.status == TaskStatus.AUDIO_ERROR
-        assert "not found" in task.error_log.lower()
+        error_log = await get_error_log(async_session, task.id)
+        assert "not found" in error_log.lower()
 
     async def test_process_task_missing_voice_id(self, async_session, encryption_env):
         """Test task fails if channel has no voice_id."""
@@ -222,7 +224,8 @@ class TestProcessNarrationGenerationTask:
         # Verify task was marked as error
         await async_session.refresh(task)
         assert task.status == TaskStatus.AUDIO_ERROR
-        assert "missing voice_id" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert "missing voice_id" in error_log
 
     async def test_process_task_missing_narration_scripts(self, async_session, encryption_env):
         """Test task fails if narration_scripts field is missing or invalid."""
@@ -262,7 +265,8 @@ class TestProcessNarrationGenerationTask:
         # Verify task was marked as error
         await async_session.refresh(task)
         assert task.status == TaskStatus.AUDIO_ERROR
-        assert "narration_scripts" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert "narration_scripts" in error_log
 
     async def test_process_task_cli_error(self, async_session, encryption_env):
         """Test task marked as error when CLI script fails."""
@@ -324,7 +328,8 @@ class TestProcessNarrationGenerationTask:
         # Verify task was marked as error
         await async_session.refresh(task)
         assert task.status == TaskStatus.AUDIO_ERROR
-        assert "Narration generation failed" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert "Narration generation failed" in error_log
 
     async def test_process_task_validation_error(self, async_session, encryption_env):
         """Test task marked as error when ValueError raised."""
@@ -376,7 +381,8 @@ class TestProcessNarrationGenerationTask:
         # Verify task was marked as error
         await async_session.refresh(task)
         assert task.status == TaskStatus.AUDIO_ERROR
-        assert "Validation error" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert "Validation error" in error_log
 
     async def test_process_task_unexpected_error(self, async_session, encryption_env):
         """Test task marked as error when unexpected exception raised."""
@@ -428,4 +434,5 @@ class TestProcessNarrationGenerationTask:
         # Verify task was marked as error
         await async_session.refresh(task)
         assert task.status == TaskStatus.AUDIO_ERROR
-        assert "Unexpected error" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert "Unexpected error" in error_log
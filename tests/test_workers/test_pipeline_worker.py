@@ -17,6 +17,7 @@ Test Strategy:
 
 import asyncio
 import signal
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -152,7 +153,9 @@ class TestClaimNextTask:
 
             mock_session.begin = mock_begin
 
-            # Mock execute to return no rows
+            # No shared quota state yet, and execute returns no rows
+            mock_session.get = AsyncMock(return_value=None)
+            mock_session.scalar = AsyncMock(return_value=None)  # no channel virtual time
             mock_result = Mock()
             mock_result.scalar_one_or_none.return_value = None
             mock_session.execute = AsyncMock(return_value=mock_result)
@@ -215,6 +218,280 @@ class TestClaimNextTask:
             # Should claim high priority task first
             assert claimed_task_id == str(high_task.id)
 
+    @pytest.mark.asyncio
+    async def test_claim_next_task_skips_deferred_tasks(self, async_session):
+        """Test tasks with a future not_before are not claimed until eligible."""
+        from app.models import Channel, PriorityLevel, Task
+
+        channel = Channel(
+            channel_id="poke1",
+            channel_name="Pokemon Channel",
+            is_active=True,
+        )
+        async_session.add(channel)
+        await async_session.flush()
+
+        deferred_task = Task(
+            channel_id=channel.id,
+            notion_page_id="deferred123",
+            title="Backing Off",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+            priority=PriorityLevel.HIGH,
+            not_before=datetime.now(timezone.utc) + timedelta(minutes=5),
+        )
+        ready_task = Task(
+            channel_id=channel.id,
+            notion_page_id="ready123",
+            title="Ready",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+            priority=PriorityLevel.LOW,
+        )
+        async_session.add_all([deferred_task, ready_task])
+        await async_session.commit()
+
+        with patch("app.workers.pipeline_worker.async_session_factory") as mock_session_class:
+            mock_session_class.return_value.__aenter__.return_value = async_session
+            mock_session_class.return_value.__aexit__.return_value = AsyncMock()
+
+            # Deferred high-priority task is skipped in favor of the ready one
+            assert await pipeline_worker.claim_next_task() == str(ready_task.id)
+
+    @pytest.mark.asyncio
+    async def test_claim_next_task_skips_asset_tasks_while_gemini_quota_exhausted(
+        self, async_session
+    ):
+        """Test asset-bound tasks wait for the shared Gemini quota; later steps don't."""
+        from app.models import Channel, PriorityLevel, Task
+        from app.services.api_quota_state import (
+            GEMINI_PROVIDER,
+            gemini_key_id,
+            mark_quota_exhausted,
+        )
+
+        channel = Channel(channel_id="poke1", channel_name="Pokemon Channel", is_active=True)
+        async_session.add(channel)
+        await async_session.flush()
+        asset_task = Task(
+            channel_id=channel.id,
+            notion_page_id="assets123",
+            title="Needs Gemini",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+            priority=PriorityLevel.HIGH,
+        )
+        video_task = Task(
+            channel_id=channel.id,
+            notion_page_id="video123",
+            title="Past Assets",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+            priority=PriorityLevel.LOW,
+            step_completion_metadata={"asset_generation": {"completed": True}},
+        )
+        async_session.add_all([asset_task, video_task])
+        await mark_quota_exhausted(
+            async_session,
+            GEMINI_PROVIDER,
+            gemini_key_id(),
+            datetime.now(timezone.utc) + timedelta(minutes=10),
+            "per_minute",
+        )
+        await async_session.commit()
+
+        with patch("app.workers.pipeline_worker.async_session_factory") as mock_session_class:
+            mock_session_class.return_value.__aenter__.return_value = async_session
+            mock_session_class.return_value.__aexit__.return_value = AsyncMock()
+
+            # High-priority asset task is skipped; nothing else is claimable after
+            assert await pipeline_worker.claim_next_task() == str(video_task.id)
+            assert await pipeline_worker.claim_next_task() is None
+
+        await async_session.refresh(asset_task)
+        assert asset_task.status == TaskStatus.QUEUED
+
+    @pytest.mark.asyncio
+    async def test_claim_next_task_applies_disk_backpressure(self, async_session):
+        """Test no task is claimed while the workspace volume is low on space."""
+        from app.models import Channel, Task
+
+        channel = Channel(channel_id="poke1", channel_name="Pokemon Channel", is_active=True)
+        async_session.add(channel)
+        await async_session.flush()
+        task = Task(
+            channel_id=channel.id,
+            notion_page_id="diskfull123",
+            title="Waiting For Space",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+        )
+        async_session.add(task)
+        await async_session.commit()
+
+        with (
+            patch("app.workers.pipeline_worker.async_session_factory") as mock_session_class,
+            patch("app.workers.pipeline_worker.has_disk_headroom", return_value=False),
+            patch(
+                "app.workers.pipeline_worker.ensure_disk_headroom",
+                new_callable=AsyncMock,
+                return_value=True,
+            ) as mock_collect,
+        ):
+            mock_session_class.return_value.__aenter__.return_value = async_session
+            mock_session_class.return_value.__aexit__.return_value = AsyncMock()
+
+            # Urgent collection runs, but this iteration never claims
+            assert await pipeline_worker.claim_next_task() is None
+            mock_collect.assert_awaited_once()
+
+        await async_session.refresh(task)
+        assert task.status == TaskStatus.QUEUED
+
+    @pytest.mark.asyncio
+    async def test_claim_next_task_fair_share_across_channels(self, async_session):
+        """Test the channel with the lowest virtual time claims, not the first channel_id."""
+        from app.models import Channel, Task
+
+        busy_channel = Channel(
+            channel_id="aaa", channel_name="Busy", is_active=True, scheduler_virtual_time=3.0
+        )
+        idle_channel = Channel(channel_id="zzz", channel_name="Idle", is_active=True)
+        async_session.add_all([busy_channel, idle_channel])
+        await async_session.flush()
+
+        # The busy channel's task is older, so FIFO or channel_id order would pick it
+        older_task = Task(
+            channel_id=busy_channel.id,
+            notion_page_id="older123",
+            title="Older",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+            created_at=datetime.now(timezone.utc) - timedelta(minutes=30),
+        )
+        newer_task = Task(
+            channel_id=idle_channel.id,
+            notion_page_id="newer123",
+            title="Newer",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+        )
+        async_session.add_all([older_task, newer_task])
+        await async_session.commit()
+
+        with patch("app.workers.pipeline_worker.async_session_factory") as mock_session_class:
+            mock_session_class.return_value.__aenter__.return_value = async_session
+            mock_session_class.return_value.__aexit__.return_value = AsyncMock()
+
+            assert await pipeline_worker.claim_next_task() == str(newer_task.id)
+
+        # Idle channel is clamped to the system clock (3.0 - 1/2), then charged 1/2
+        await async_session.refresh(idle_channel)
+        assert idle_channel.scheduler_virtual_time == pytest.approx(3.0)
+
+    @pytest.mark.asyncio
+    async def test_claim_next_task_skips_channels_at_capacity(self, async_session):
+        """Test a channel at max_concurrent in-progress tasks is not eligible."""
+        from app.models import Channel, PriorityLevel, Task
+
+        full_channel = Channel(
+            channel_id="full", channel_name="Full", is_active=True, max_concurrent=1
+        )
+        open_channel = Channel(channel_id="open", channel_name="Open", is_active=True)
+        async_session.add_all([full_channel, open_channel])
+        await async_session.flush()
+
+        in_progress_task = Task(
+            channel_id=full_channel.id,
+            notion_page_id="running123",
+            title="Running",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.GENERATING_ASSETS,
+        )
+        blocked_task = Task(
+            channel_id=full_channel.id,
+            notion_page_id="blocked123",
+            title="Blocked",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+            priority=PriorityLevel.HIGH,
+        )
+        open_task = Task(
+            channel_id=open_channel.id,
+            notion_page_id="open123",
+            title="Open",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+            priority=PriorityLevel.LOW,
+        )
+        async_session.add_all([in_progress_task, blocked_task, open_task])
+        await async_session.commit()
+
+        with patch("app.workers.pipeline_worker.async_session_factory") as mock_session_class:
+            mock_session_class.return_value.__aenter__.return_value = async_session
+            mock_session_class.return_value.__aexit__.return_value = AsyncMock()
+
+            # High priority does not override the full channel's capacity
+            assert await pipeline_worker.claim_next_task() == str(open_task.id)
+
+    @pytest.mark.asyncio
+    async def test_claim_next_task_shortest_predicted_work_first(self, async_session):
+        """Test a channel's backlog is claimed shortest predicted remaining work first."""
+        from app.models import Channel, Task
+
+        channel = Channel(channel_id="poke1", channel_name="Pokemon Channel", is_active=True)
+        async_session.add(channel)
+        await async_session.flush()
+
+        long_task = Task(
+            channel_id=channel.id,
+            notion_page_id="long123",
+            title="Long",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+            predicted_remaining_seconds=3600.0,
+            created_at=datetime.now(timezone.utc) - timedelta(minutes=30),
+        )
+        unestimated_task = Task(
+            channel_id=channel.id,
+            notion_page_id="fresh123",
+            title="Fresh",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+            created_at=datetime.now(timezone.utc) - timedelta(minutes=60),
+        )
+        short_task = Task(
+            channel_id=channel.id,
+            notion_page_id="short123",
+            title="Short",
+            topic="Test",
+            story_direction="Test",
+            status=TaskStatus.QUEUED,
+            predicted_remaining_seconds=600.0,
+        )
+        async_session.add_all([long_task, unestimated_task, short_task])
+        await async_session.commit()
+
+        with patch("app.workers.pipeline_worker.async_session_factory") as mock_session_class:
+            mock_session_class.return_value.__aenter__.return_value = async_session
+            mock_session_class.return_value.__aexit__.return_value = AsyncMock()
+
+            # Newest but shortest first; a task not yet estimated sorts last
+            assert await pipeline_worker.claim_next_task() == str(short_task.id)
+            assert await pipeline_worker.claim_next_task() == str(long_task.id)
+
 
 class TestWorkerLoop:
     """Test worker_loop function."""
@@ -267,7 +544,14 @@ class TestWorkerLoop:
         ) as mock_claim:
             mock_claim.return_value = None  # No tasks available
 
-            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with (
+                patch(
+                    "app.workers.pipeline_worker.next_deferred_task_at",
+                    new_callable=AsyncMock,
+                    return_value=None,
+                ),
+                patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            ):
                 mock_sleep.side_effect = mock_sleep_side_effect
 
                 await pipeline_worker.worker_loop()
@@ -277,6 +561,37 @@ class TestWorkerLoop:
 
         pipeline_worker.SHUTDOWN_REQUESTED = False
 
+    @pytest.mark.asyncio
+    async def test_worker_loop_sleeps_until_deferred_task_is_eligible(self):
+        """Test idle worker wakes when the earliest deferred task becomes claimable."""
+        pipeline_worker.SHUTDOWN_REQUESTED = False
+
+        async def mock_sleep_side_effect(duration):
+            pipeline_worker.SHUTDOWN_REQUESTED = True
+
+        eligible_at = datetime.now(timezone.utc) + timedelta(seconds=2)
+        with (
+            patch(
+                "app.workers.pipeline_worker.claim_next_task",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "app.workers.pipeline_worker.next_deferred_task_at",
+                new_callable=AsyncMock,
+                return_value=eligible_at,
+            ),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_sleep.side_effect = mock_sleep_side_effect
+
+            await pipeline_worker.worker_loop()
+
+            # Sleeps ~2s until the deferred task, not the full 5s poll
+            assert 0 < mock_sleep.call_args[0][0] <= 2
+
+        pipeline_worker.SHUTDOWN_REQUESTED = False
+
     @pytest.mark.asyncio
     async def test_worker_loop_handles_exceptions(self):
         """Test worker loop continues after exceptions."""
@@ -362,3 +677,73 @@ class TestMain:
                 await pipeline_worker.main()
 
                 mock_process.assert_called_once_with("test-task-123")
+
+    @pytest.mark.asyncio
+    async def test_main_worker_loop_serves_metrics(self):
+        """Test the worker loop serves /metrics on WORKER_METRICS_PORT and closes it."""
+        server = Mock()
+        with (
+            patch("sys.argv", ["pipeline_worker.py"]),
+            patch("app.workers.pipeline_worker.get_worker_metrics_port", return_value=9123),
+            patch(
+                "app.workers.pipeline_worker.start_metrics_server",
+                new_callable=AsyncMock,
+                return_value=server,
+            ) as mock_start,
+            patch(
+                "app.workers.pipeline_worker.worker_loop",
+                new_callable=AsyncMock,
+                side_effect=RuntimeError("loop crashed"),
+            ),
+        ):
+            with pytest.raises(RuntimeError, match="loop crashed"):
+                await pipeline_worker.main()
+
+        mock_start.assert_awaited_once_with(9123)
+        server.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_main_single_task_mode_skips_metrics_server(self):
+        """Test single task mode does not bind the metrics port."""
+        with (
+            patch("sys.argv", ["pipeline_worker.py", "--task-id", "test-task-123"]),
+            patch("app.workers.pipeline_worker.process_pipeline_task", new_callable=AsyncMock),
+            patch(
+                "app.workers.pipeline_worker.start_metrics_server", new_callable=AsyncMock
+            ) as mock_start,
+        ):
+            await pipeline_worker.main()
+
+        mock_start.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_main_worker_loop_refreshes_predicted_work(self):
+        """Test the worker loop keeps predicted remaining work fresh and stops the refresh."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fake_refresh_loop():
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def fake_worker_loop():
+            await started.wait()
+
+        with (
+            patch("sys.argv", ["pipeline_worker.py"]),
+            patch(
+                "app.workers.pipeline_worker.start_metrics_server",
+                new_callable=AsyncMock,
+                return_value=Mock(),
+            ),
+            patch("app.workers.pipeline_worker.step_duration_stats_refresh_loop", fake_refresh_loop),
+            patch("app.workers.pipeline_worker.worker_loop", fake_worker_loop),
+        ):
+            await pipeline_worker.main()
+
+        await asyncio.sleep(0)
+        assert cancelled.is_set()
@@ -26,6 +26,7 @@ import pytest
 from sqlalchemy import select
 
 from app.models import Channel, Task, TaskStatus
+from app.services.task_events import get_error_log
 from app.workers.sfx_generation_worker import process_sfx_generation_task
 
 
@@ -219,7 +220,7 @@ class TestProcessSFXGenerationTaskErrors:
             result = await async_session.execute(select(Task).where(Task.id == task_id))
             task = result.scalar_one()
             assert task.status == TaskStatus.AUDIO_ERROR
-            assert "SFX generation failed" in task.error_log
+            assert "SFX generation failed" in await get_error_log(async_session, task_id)
 
     @pytest.mark.asyncio
     async def test_validation_error_handling(self, async_session, mock_task):
@@ -246,7 +247,7 @@ class TestProcessSFXGenerationTaskErrors:
             result = await async_session.execute(select(Task).where(Task.id == task_id))
             task = result.scalar_one()
             assert task.status == TaskStatus.AUDIO_ERROR
-            assert "Validation error" in task.error_log
+            assert "Validation error" in await get_error_log(async_session, task_id)
 
     @pytest.mark.asyncio
     async def test_unexpected_error_handling(self, async_session, mock_task):
@@ -271,7 +272,7 @@ class TestProcessSFXGenerationTaskErrors:
             result = await async_session.execute(select(Task).where(Task.id == task_id))
             task = result.scalar_one()
             assert task.status == TaskStatus.AUDIO_ERROR
-            assert "Unexpected error" in task.error_log
+            assert "Unexpected error" in await get_error_log(async_session, task_id)
 
 
 class TestProcessSFXGenerationTaskEdgeCases:
@@ -320,7 +321,7 @@ class TestProcessSFXGenerationTaskEdgeCases:
         result = await async_session.execute(select(Task).where(Task.id == task.id))
         updated_task = result.scalar_one()
         assert updated_task.status == TaskStatus.AUDIO_ERROR
-        assert "not found" in updated_task.error_log
+        assert "not found" in await get_error_log(async_session, task.id)
 
     @pytest.mark.asyncio
     async def test_missing_sfx_descriptions(self, async_session, mock_channel):
@@ -349,7 +350,8 @@ class TestProcessSFXGenerationTaskEdgeCases:
         result = await async_session.execute(select(Task).where(Task.id == task.id))
         updated_task = result.scalar_one()
         assert updated_task.status == TaskStatus.AUDIO_ERROR
-        assert "missing sfx_descriptions" in updated_task.error_log.lower()
+        error_log = await get_error_log(async_session, task.id)
+        assert "missing sfx_descriptions" in error_log.lower()
 
 
 class TestShortTransactionPattern:
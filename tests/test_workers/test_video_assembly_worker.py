@@ -23,6 +23,7 @@ from uuid import uuid4
 import pytest
 
 from app.models import Channel, Task, TaskStatus
+from app.services.task_events import get_error_log
 from app.utils.cli_wrapper import CLIScriptError
 from app.workers.video_assembly_worker import process_video_assembly_task
 
@@ -182,7 +183,8 @@ class TestProcessVideoAssemblyTask:
         # Verify task status updated to error
         await async_session.refresh(task)
         assert task.status == TaskStatus.VIDEO_ERROR
-        assert "Missing file" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert "Missing file" in error_log
 
     async def test_process_task_cli_script_error(self, async_session, encryption_env):
         """Test handling CLIScriptError during video assembly."""
@@ -243,7 +245,8 @@ class TestProcessVideoAssemblyTask:
         # Verify task status updated to error
         await async_session.refresh(task)
         assert task.status == TaskStatus.VIDEO_ERROR
-        assert "FFmpeg assembly failed" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert "FFmpeg assembly failed" in error_log
 
     async def test_process_task_validation_error(self, async_session, encryption_env):
         """Test handling ValueError during video assembly."""
@@ -300,7 +303,8 @@ class TestProcessVideoAssemblyTask:
         # Verify task status updated to error
         await async_session.refresh(task)
         assert task.status == TaskStatus.VIDEO_ERROR
-        assert "Validation error" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert "Validation error" in error_log
 
     async def test_process_task_unexpected_error(self, async_session, encryption_env):
         """Test handling unexpected error during video assembly."""
@@ -351,7 +355,8 @@ class TestProcessVideoAssemblyTask:
         # Verify task status updated to error
         await async_session.refresh(task)
         assert task.status == TaskStatus.VIDEO_ERROR
-        assert "Unexpected error" in task.error_log
+        error_log = await get_error_log(async_session, task.id)
+        assert "Unexpected error" in error_log
 
     async def test_process_task_not_found(self, async_session, encryption_env):
         """Test handling task not found scenario."""
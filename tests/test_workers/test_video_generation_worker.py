@@ -18,11 +18,20 @@ from decimal import Decimal
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import UUID, uuid4
 
-from app.models import Task, TaskStatus
+from app.models import Task, TaskEvent, TaskStatus
 from app.utils.cli_wrapper import CLIScriptError
 from app.workers.video_generation_worker import process_video_generation_task
 
 
+def error_messages(session: AsyncMock) -> list[str]:
+    """Return the messages of task events added to a mock session."""
+    return [
+        call.args[0].payload["message"]
+        for call in session.add.call_args_list
+        if isinstance(call.args[0], TaskEvent)
+    ]
+
+
 class TestVideoGenerationWorker:
     """Test suite for video generation worker."""
 
@@ -51,6 +60,7 @@ class TestVideoGenerationWorker:
         session.get = AsyncMock(return_value=mock_task)
         session.commit = AsyncMock()
         session.refresh = AsyncMock()
+        session.add = Mock()
 
         # Mock the begin() context manager
         begin_context = AsyncMock()
@@ -165,7 +175,7 @@ class TestVideoGenerationWorker:
 
             # Verify task was marked as error
             assert mock_task.status == TaskStatus.VIDEO_ERROR
-            assert "Video generation failed" in mock_task.error_log
+            assert "Video generation failed" in error_messages(mock_db_session)[0]
 
     @pytest.mark.asyncio
     async def test_process_video_generation_timeout(self, mock_task, mock_db_session):
@@ -191,7 +201,7 @@ class TestVideoGenerationWorker:
 
             # Verify task was marked as error
             assert mock_task.status == TaskStatus.VIDEO_ERROR
-            assert "timeout" in mock_task.error_log.lower()
+            assert "timeout" in error_messages(mock_db_session)[0].lower()
 
     @pytest.mark.asyncio
     async def test_process_video_generation_unexpected_error(self, mock_task, mock_db_session):
@@ -216,7 +226,7 @@ class TestVideoGenerationWorker:
 
             # Verify task was marked as error
             assert mock_task.status == TaskStatus.VIDEO_ERROR
-            assert "Unexpected error" in mock_task.error_log
+            assert "Unexpected error" in error_messages(mock_db_session)[0]
 
     @pytest.mark.asyncio
     async def test_process_video_generation_short_transactions(self, mock_task, mock_db_session):